@@ -0,0 +1,82 @@
+# backend/alembic/versions/007_next_availability_index.py
+"""Next-available slot index per instructor
+
+Revision ID: 007_next_availability_index
+Revises: 006_platform_features
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007_next_availability_index"
+down_revision: Union[str, None] = "006_platform_features"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _enable_rls_with_permissive_policy(table_name: str) -> None:
+    """Match the app_role_access policy applied to every public table in 006."""
+
+    op.execute(f"ALTER TABLE public.{table_name} ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        f"CREATE POLICY app_role_access ON public.{table_name} FOR ALL "
+        "USING (current_user IN ('postgres', 'app_user')) "
+        "WITH CHECK (current_user IN ('postgres', 'app_user'))"
+    )
+
+
+def upgrade() -> None:
+    """Create instructor_next_availability."""
+    print("Creating instructor_next_availability table...")
+
+    bind = op.get_bind()
+    is_postgres = (bind.dialect.name if bind is not None else "postgresql") == "postgresql"
+
+    op.create_table(
+        "instructor_next_availability",
+        sa.Column("instructor_id", sa.String(26), nullable=False),
+        sa.Column("location_type", sa.String(32), nullable=False),
+        sa.Column("duration_minutes", sa.Integer(), nullable=False),
+        sa.Column("next_date", sa.Date(), nullable=True),
+        sa.Column("next_start_time", sa.Time(), nullable=True),
+        sa.Column("next_start_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("horizon_end", sa.Date(), nullable=False),
+        sa.Column("is_stale", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column(
+            "computed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("instructor_id", "location_type", "duration_minutes"),
+        sa.ForeignKeyConstraint(["instructor_id"], ["users.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_instructor_next_availability_soonest",
+        "instructor_next_availability",
+        ["location_type", "duration_minutes", "next_start_at"],
+    )
+    op.create_index(
+        "ix_instructor_next_availability_refresh",
+        "instructor_next_availability",
+        ["is_stale", "computed_at"],
+    )
+
+    if is_postgres:
+        _enable_rls_with_permissive_policy("instructor_next_availability")
+
+
+def downgrade() -> None:
+    """Drop instructor_next_availability."""
+    print("Dropping instructor_next_availability table...")
+
+    op.drop_index(
+        "ix_instructor_next_availability_refresh", table_name="instructor_next_availability"
+    )
+    op.drop_index(
+        "ix_instructor_next_availability_soonest", table_name="instructor_next_availability"
+    )
+    op.drop_table("instructor_next_availability")
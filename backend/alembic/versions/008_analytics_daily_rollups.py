@@ -0,0 +1,138 @@
+# backend/alembic/versions/008_analytics_daily_rollups.py
+"""Daily analytics rollups for the admin dashboards
+
+Revision ID: 008_analytics_daily_rollups
+Revises: 007_next_availability_index
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008_analytics_daily_rollups"
+down_revision: Union[str, None] = "007_next_availability_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = (
+    "analytics_booking_daily",
+    "analytics_instructor_daily",
+    "analytics_funnel_daily",
+    "analytics_rollup_watermarks",
+)
+
+# Watermark scans look for source rows changed since the last refresh.
+WATERMARK_INDEXES = (
+    ("ix_bookings_updated_at", "bookings", "updated_at"),
+    ("ix_availability_days_updated_at", "availability_days", "updated_at"),
+    ("ix_search_events_created_at", "search_events", "created_at"),
+    ("ix_search_interactions_created_at", "search_interactions", "created_at"),
+)
+
+
+def _enable_rls_with_permissive_policy(table_name: str) -> None:
+    """Match the app_role_access policy applied to every public table in 006."""
+
+    op.execute(f"ALTER TABLE public.{table_name} ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        f"CREATE POLICY app_role_access ON public.{table_name} FOR ALL "
+        "USING (current_user IN ('postgres', 'app_user')) "
+        "WITH CHECK (current_user IN ('postgres', 'app_user'))"
+    )
+
+
+def _computed_at() -> sa.Column:
+    return sa.Column(
+        "computed_at",
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+
+
+def _count(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    """Create the daily rollup tables and watermark indexes."""
+    print("Creating analytics daily rollup tables...")
+
+    bind = op.get_bind()
+    is_postgres = (bind.dialect.name if bind is not None else "postgresql") == "postgresql"
+
+    op.create_table(
+        "analytics_booking_daily",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("category_id", sa.String(26), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        _count("bookings"),
+        sa.Column("gmv", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("instructor_payout_cents", sa.BigInteger(), nullable=False, server_default="0"),
+        _computed_at(),
+        sa.PrimaryKeyConstraint("day", "category_id", "status"),
+    )
+    op.create_table(
+        "analytics_instructor_daily",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("instructor_id", sa.String(26), nullable=False),
+        _count("available_slots"),
+        _count("bookings_created"),
+        _count("bookings_confirmed"),
+        _count("completed_minutes"),
+        _computed_at(),
+        sa.PrimaryKeyConstraint("day", "instructor_id"),
+    )
+    op.create_index(
+        "ix_analytics_instructor_daily_instructor",
+        "analytics_instructor_daily",
+        ["instructor_id", "day"],
+    )
+    op.create_table(
+        "analytics_funnel_daily",
+        sa.Column("day", sa.Date(), nullable=False),
+        _count("searches"),
+        _count("zero_result_searches"),
+        _count("profile_views"),
+        _count("bookings_created"),
+        _count("bookings_confirmed"),
+        _count("payment_successes"),
+        _computed_at(),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    op.create_table(
+        "analytics_rollup_watermarks",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    for index_name, table_name, column in WATERMARK_INDEXES:
+        op.create_index(index_name, table_name, [column])
+
+    if is_postgres:
+        for table_name in ROLLUP_TABLES:
+            _enable_rls_with_permissive_policy(table_name)
+
+
+def downgrade() -> None:
+    """Drop the daily rollup tables and watermark indexes."""
+    print("Dropping analytics daily rollup tables...")
+
+    for index_name, table_name, _column in reversed(WATERMARK_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
+    op.drop_table("analytics_rollup_watermarks")
+    op.drop_table("analytics_funnel_daily")
+    op.drop_index(
+        "ix_analytics_instructor_daily_instructor", table_name="analytics_instructor_daily"
+    )
+    op.drop_table("analytics_instructor_daily")
+    op.drop_table("analytics_booking_daily")
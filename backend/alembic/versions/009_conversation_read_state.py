@@ -0,0 +1,73 @@
+# backend/alembic/versions/009_conversation_read_state.py
+"""Materialized unread counters and read watermarks per conversation participant
+
+Revision ID: 009_conversation_read_state
+Revises: 008_analytics_daily_rollups
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "009_conversation_read_state"
+down_revision: Union[str, None] = "008_analytics_daily_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create conversation_read_state; the reconciliation task backfills it."""
+    print("Creating conversation_read_state table...")
+
+    bind = op.get_bind()
+    is_postgres = (bind.dialect.name if bind is not None else "postgresql") == "postgresql"
+
+    op.create_table(
+        "conversation_read_state",
+        sa.Column(
+            "user_id",
+            sa.String(26),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "conversation_id",
+            sa.String(26),
+            sa.ForeignKey("conversations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("unread_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_read_message_id", sa.String(26), nullable=True),
+        sa.Column("last_read_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("user_id", "conversation_id"),
+    )
+    op.create_index(
+        "ix_conversation_read_state_conversation",
+        "conversation_read_state",
+        ["conversation_id"],
+    )
+
+    if is_postgres:
+        # Match the app_role_access policy applied to every public table in 006.
+        op.execute("ALTER TABLE public.conversation_read_state ENABLE ROW LEVEL SECURITY")
+        op.execute(
+            "CREATE POLICY app_role_access ON public.conversation_read_state FOR ALL "
+            "USING (current_user IN ('postgres', 'app_user')) "
+            "WITH CHECK (current_user IN ('postgres', 'app_user'))"
+        )
+
+
+def downgrade() -> None:
+    """Drop conversation_read_state."""
+    print("Dropping conversation_read_state table...")
+
+    op.drop_index("ix_conversation_read_state_conversation", table_name="conversation_read_state")
+    op.drop_table("conversation_read_state")
@@ -0,0 +1,31 @@
+# backend/alembic/versions/010_profile_picture_hash.py
+"""Content hash of the source upload behind the current profile picture
+
+Revision ID: 010_profile_picture_hash
+Revises: 009_conversation_read_state
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "010_profile_picture_hash"
+down_revision: Union[str, None] = "009_conversation_read_state"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add users.profile_picture_hash; existing pictures are re-hashed on their next upload."""
+    print("Adding users.profile_picture_hash...")
+
+    op.add_column("users", sa.Column("profile_picture_hash", sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop users.profile_picture_hash."""
+    print("Dropping users.profile_picture_hash...")
+
+    op.drop_column("users", "profile_picture_hash")
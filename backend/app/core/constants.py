@@ -42,6 +42,11 @@ MAX_QUERY_LIMIT = 1000
 MAX_FUTURE_DAYS = 365  # Maximum days in the future for availability (1 year)
 MAX_SLOTS_PER_DAY = 10  # Maximum time slots per day
 
+# Next-available slot index (instructor_next_availability)
+NEXT_AVAILABILITY_LOCATION_TYPES = ("online", "student_location", "instructor_location")
+NEXT_AVAILABILITY_DURATIONS = (30, 45, 60, 90, 120)  # minutes
+NEXT_AVAILABILITY_MAX_AGE_MINUTES = 30  # Advance notice moves with the clock
+
 # Day of week mapping
 DAYS_OF_WEEK = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
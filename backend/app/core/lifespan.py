@@ -6,7 +6,7 @@ from contextlib import asynccontextmanager
 import logging
 import os
 import threading
-from typing import Any, AsyncGenerator, cast
+from typing import TYPE_CHECKING, Any, AsyncGenerator, cast
 
 from fastapi import FastAPI
 
@@ -29,6 +29,9 @@ from app.workers.background_jobs import (
     background_jobs_worker_sync,
 )
 
+if TYPE_CHECKING:
+    from app.services.search.snapshot_refresher import SnapshotRefresher
+
 logger = logging.getLogger("app.main")
 
 try:  # pragma: no cover - optional dependency for warmup
@@ -214,6 +217,91 @@ async def _connect_sse_broadcast() -> None:
         logger.error("[BROADCAST] Failed to initialize broadcaster: %s", exc)
 
 
+def _start_cache_invalidation_listener() -> asyncio.Task[None] | None:
+    """Subscribe this worker's L1 cache to cross-worker invalidations."""
+    try:
+        from app.core.broadcast import is_broadcast_initialized
+        from app.services.cache_l1 import get_l1_cache, run_invalidation_listener
+
+        if get_l1_cache() is None or not is_broadcast_initialized():
+            return None
+        return asyncio.create_task(run_invalidation_listener())
+    except Exception as exc:
+        logger.warning("[CACHE-L1] Failed to start invalidation listener: %s", exc)
+        return None
+
+
+async def _stop_cache_invalidation_listener(task: asyncio.Task[None] | None) -> None:
+    if task is None:
+        return
+    task.cancel()
+    with contextlib.suppress(BaseException):
+        await task
+
+
+async def _start_sse_fanout_hub() -> None:
+    try:
+        from app.services.messaging.fanout_hub import start_fanout_hub
+
+        await start_fanout_hub()
+    except Exception as exc:
+        logger.error("[SSE-HUB] Failed to start fan-out hub: %s", exc)
+
+
+async def _stop_sse_fanout_hub() -> None:
+    try:
+        from app.services.messaging.fanout_hub import stop_fanout_hub
+
+        await stop_fanout_hub()
+    except Exception as exc:
+        logger.warning("[SSE-HUB] Error stopping fan-out hub: %s", exc)
+
+
+_SearchSnapshots = list[tuple["SnapshotRefresher[Any]", "asyncio.Task[None] | None"]]
+
+
+def _start_search_snapshots() -> _SearchSnapshots:
+    """Start the in-memory ANN index and ranking signal snapshot refreshers when enabled."""
+    try:
+        from app.services.search import ann_index, ranking_snapshot
+    except Exception as exc:
+        logger.warning("[SEARCH] Failed to load in-memory search snapshots: %s", exc)
+        return []
+
+    started: _SearchSnapshots = []
+    for refresher in (ann_index.refresher, ranking_snapshot.refresher):
+        try:
+            started.append((refresher, refresher.start()))
+        except Exception as exc:
+            logger.warning("[SEARCH] Failed to start %s: %s", refresher.label, exc)
+    return started
+
+
+async def _stop_search_snapshots(started: _SearchSnapshots) -> None:
+    for refresher, task in started:
+        await refresher.stop(task)
+
+
+def _start_search_event_writer() -> asyncio.Task[None] | None:
+    """Start the write-behind flusher for search analytics events when enabled."""
+    try:
+        from app.services.search_event_writer import start_search_event_writer
+
+        return start_search_event_writer()
+    except Exception as exc:
+        logger.warning("[SEARCH-EVENTS] Failed to start search event writer: %s", exc)
+        return None
+
+
+async def _stop_search_event_writer(task: asyncio.Task[None] | None) -> None:
+    try:
+        from app.services.search_event_writer import stop_search_event_writer
+
+        await stop_search_event_writer(task)
+    except Exception as exc:
+        logger.warning("[SEARCH-EVENTS] Error draining search event writer: %s", exc)
+
+
 def _start_background_job_worker() -> tuple[asyncio.Task[None] | None, threading.Event | None]:
     if getattr(settings, "bgc_expiry_enabled", False):
         _ensure_expiry_job_scheduled()
@@ -296,6 +384,10 @@ async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await _initialize_production_startup()
     _initialize_search_cache()
     await _connect_sse_broadcast()
+    cache_listener_task = _start_cache_invalidation_listener()
+    await _start_sse_fanout_hub()
+    search_snapshots = _start_search_snapshots()
+    search_event_writer_task = _start_search_event_writer()
     job_worker_task, job_worker_stop_event = _start_background_job_worker()
     prewarm_metrics_cache()
 
@@ -304,6 +396,10 @@ async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("%s API shutting down...", BRAND_NAME)
     shutdown_otel()
     await _shutdown_background_job_worker(job_worker_task, job_worker_stop_event)
+    await _stop_cache_invalidation_listener(cache_listener_task)
+    await _stop_sse_fanout_hub()
+    await _stop_search_snapshots(search_snapshots)
+    await _stop_search_event_writer(search_event_writer_task)
     await _disconnect_sse_broadcast()
     await _close_redis_clients()
     _clear_cache_event_loop_reference()
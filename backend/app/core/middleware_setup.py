@@ -1,16 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Sequence
+from collections.abc import Sequence
 import logging
 import os
-import re
 from typing import Any, cast
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.gzip import GZipMiddleware
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import Receive, Scope, Send
 
 from app.core.config import settings
 from app.core.constants import ALLOWED_ORIGINS, CORS_ORIGIN_REGEX, SSE_PATH_PREFIX
@@ -18,11 +16,10 @@ from app.middleware.beta_phase_header import BetaPhaseHeaderMiddleware
 from app.middleware.csrf_asgi import CsrfOriginMiddlewareASGI
 from app.middleware.https_redirect import create_https_redirect_middleware
 from app.middleware.monitoring import MonitoringMiddleware
-from app.middleware.perf_counters import PerfCounterMiddleware, perf_counters_enabled
+from app.middleware.perf_counters import perf_counters_enabled
 from app.middleware.performance import PerformanceMiddleware
-from app.middleware.prometheus_middleware import PrometheusMiddleware
+from app.middleware.request_pipeline import RequestPipelineMiddleware
 from app.monitoring.sentry import SentryContextMiddleware
-from app.ratelimit.identity import resolve_identity
 
 logger = logging.getLogger("app.main")
 
@@ -30,36 +27,6 @@ _BGC_ENV_LOGGED = False
 _PROD_SITE_MODES = {"prod", "production", "beta", "preview"}
 
 
-async def add_site_headers(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    """Emit X-Site-Mode and X-Phase on every response."""
-
-    response = await call_next(request)
-    try:
-        site_mode = (os.getenv("SITE_MODE", "") or "").strip().lower() or "unset"
-        existing_phase = response.headers.get("x-beta-phase") or response.headers.get(
-            "X-Beta-Phase"
-        )
-        response.headers["X-Site-Mode"] = site_mode
-        response.headers["X-Phase"] = (existing_phase or "beta").strip()
-    except Exception:
-        logger.debug("Non-fatal error ignored", exc_info=True)
-    return response
-
-
-async def attach_identity(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    try:
-        request.state.rate_identity = resolve_identity(request)
-    except Exception:
-        request.state.rate_identity = "ip:unknown"
-    return await call_next(request)
-
-
 def _compute_allowed_origins() -> list[str]:
     """Per-env explicit CORS allowlist."""
 
@@ -125,45 +92,6 @@ def _resolve_origin_regex() -> str | None:
     return None if site_mode in _PROD_SITE_MODES else CORS_ORIGIN_REGEX
 
 
-class EnsureCorsOnErrorMiddleware(BaseHTTPMiddleware):
-    """Backfill Access-Control headers on internal error responses."""
-
-    def __init__(
-        self,
-        app: ASGIApp,
-        *,
-        allowed_origins: Sequence[str],
-        origin_regex: str | None = None,
-    ) -> None:
-        super().__init__(app)
-        self._allowed_origins = {origin.strip() for origin in allowed_origins if origin}
-        self._origin_regex = re.compile(origin_regex) if origin_regex else None
-
-    def _origin_allowed(self, origin: str | None) -> bool:
-        if not origin:
-            return False
-        if origin in self._allowed_origins:
-            return True
-        return bool(self._origin_regex and self._origin_regex.match(origin))
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        response = await call_next(request)
-        origin = request.headers.get("origin")
-        if (
-            origin
-            and "access-control-allow-origin" not in response.headers
-            and self._origin_allowed(origin)
-        ):
-            response.headers["access-control-allow-origin"] = origin
-            if "access-control-allow-credentials" not in response.headers:
-                response.headers["access-control-allow-credentials"] = "true"
-        return response
-
-
 class SSEAwareGZipMiddleware(GZipMiddleware):
     """GZip middleware that skips SSE endpoints."""
 
@@ -187,9 +115,6 @@ def register_middleware(app: FastAPI) -> None:
         https_redirect = create_https_redirect_middleware(force_https=True)
         app.add_middleware(https_redirect)
 
-    app.middleware("http")(add_site_headers)
-    app.middleware("http")(attach_identity)
-
     allowed_origins = _compute_allowed_origins()
     if "*" in allowed_origins:
         raise RuntimeError("CORS allow_origins cannot include * when allow_credentials=True")
@@ -209,30 +134,27 @@ def register_middleware(app: FastAPI) -> None:
     )
     logger.info("CORS allow_origins=%s allow_credentials=%s", allowed_origins, True)
 
+    # Identity, perf counters, CORS-on-error backfill, site headers and Prometheus
+    # metrics share one pure-ASGI layer instead of five BaseHTTPMiddleware layers.
     app.add_middleware(
-        EnsureCorsOnErrorMiddleware,
+        RequestPipelineMiddleware,
         allowed_origins=allowed_origins,
         origin_regex=origin_regex,
+        perf_counters=perf_counters_enabled(),
     )
     app.add_middleware(MonitoringMiddleware)
 
-    if perf_counters_enabled():
-        app.add_middleware(PerfCounterMiddleware)
     if bool(getattr(app_state, "sentry_enabled", False)):
         app.add_middleware(SentryContextMiddleware)
 
     app.add_middleware(PerformanceMiddleware)
-    app.add_middleware(PrometheusMiddleware)
     app.add_middleware(BetaPhaseHeaderMiddleware)
     app.add_middleware(CsrfOriginMiddlewareASGI)
     app.add_middleware(SSEAwareGZipMiddleware, minimum_size=500)
 
 
 __all__ = [
-    "EnsureCorsOnErrorMiddleware",
     "SSEAwareGZipMiddleware",
-    "add_site_headers",
-    "attach_identity",
     "register_middleware",
     "_BGC_ENV_LOGGED",
     "_compute_allowed_origins",
@@ -93,4 +93,25 @@ class CommunicationsSettingsMixin:
     message_edit_window_minutes: int = Field(
         default=5, description="How many minutes a user can edit their message"
     )
+    messaging_unread_counters_enabled: bool = Field(
+        default=False,
+        description=(
+            "Serve unread counts and read receipts from conversation_read_state "
+            "(enable after the reconciliation task has backfilled it)"
+        ),
+    )
     sse_heartbeat_interval: int = Field(default=30, description="SSE heartbeat interval in seconds")
+    sse_fanout_enabled: bool = Field(
+        default=True,
+        description="Route SSE events through the sharded per-worker fan-out hub",
+    )
+    sse_fanout_shards: int = Field(
+        default=16,
+        description="Number of Redis pub/sub shard channels SSE users are hashed onto",
+        ge=1,
+    )
+    sse_connection_queue_size: int = Field(
+        default=256,
+        description="Maximum pending events buffered per SSE connection before shedding",
+        ge=1,
+    )
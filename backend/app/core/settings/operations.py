@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from typing import Annotated
+
 from pydantic import Field, SecretStr, field_validator
+from pydantic_settings import NoDecode
 
 from .shared import secret_or_plain
 
@@ -8,6 +11,29 @@ from .shared import secret_or_plain
 class OperationsSettingsMixin:
     redis_url: SecretStr = Field(default=SecretStr("redis://localhost:6379"))
     cache_ttl: int = 3600
+    cache_scan_count: int = Field(
+        default=1000,
+        description="SCAN COUNT hint (and UNLINK batch size) for pattern cache invalidation",
+        ge=1,
+    )
+    cache_l1_enabled: bool = Field(
+        default=True,
+        description="Serve hot cache keys from a per-worker in-process tier in front of Redis",
+    )
+    cache_l1_max_entries: int = Field(
+        default=2048,
+        description="Maximum entries held in the per-worker L1 cache (LRU eviction)",
+        ge=1,
+    )
+    cache_l1_ttl_seconds: int = Field(
+        default=30,
+        description="L1 entry lifetime; bounds staleness if an invalidation message is lost",
+        ge=0,
+    )
+    cache_l1_prefixes: str = Field(
+        default="catalog:,parsed:",
+        description="Comma-separated cache key prefixes eligible for the L1 tier",
+    )
     scheduler_enabled: bool = Field(
         default=True,
         description="Enable background schedulers (disabled automatically during tests)",
@@ -37,6 +63,71 @@ class OperationsSettingsMixin:
         description="Maximum retry attempts before moving a job to the dead-letter queue",
         ge=1,
     )
+    outbox_batch_delivery_enabled: bool = Field(
+        default=True,
+        description="Deliver notification outbox events in claimed batches instead of per-event tasks",
+    )
+    outbox_batch_size: int = Field(
+        default=200,
+        description="Maximum outbox events claimed per delivery batch",
+        ge=1,
+    )
+    outbox_delivery_concurrency: int = Field(
+        default=8,
+        description="Worker threads delivering a batch concurrently (each may hold a DB connection)",
+        ge=1,
+    )
+    outbox_claim_lease_seconds: int = Field(
+        default=300,
+        description="How long claimed outbox rows stay hidden from other dispatchers",
+        ge=1,
+    )
+    booking_reminder_batch_enabled: bool = Field(
+        default=True,
+        description="Send booking reminders from claimed chunks through a bounded concurrent sender",
+    )
+    booking_reminder_batch_size: int = Field(
+        default=200,
+        description="Maximum bookings claimed per reminder chunk",
+        ge=1,
+    )
+    booking_reminder_concurrency: int = Field(
+        default=8,
+        description="Worker threads sending reminders concurrently (each holds its own DB session)",
+        ge=1,
+    )
+    export_stream_batch_size: int = Field(
+        default=500,
+        description="Rows fetched per server-side cursor batch when streaming exports",
+        ge=1,
+    )
+    export_download_url_ttl_seconds: int = Field(
+        default=3600,
+        description="Lifetime of presigned download URLs for exports written to R2",
+        ge=60,
+    )
+    profile_picture_async_processing_enabled: bool = Field(
+        default=False,
+        description="Queue profile picture variant generation on Celery instead of the finalize request",
+    )
+    profile_picture_extra_formats: Annotated[list[str], NoDecode] = Field(
+        default_factory=lambda: ["webp"],
+        description="Comma-separated formats (webp, avif) written next to the JPEG variants",
+    )
+    analytics_rollups_enabled: bool = Field(
+        default=False,
+        description="Serve admin platform analytics from the daily rollup tables",
+    )
+    analytics_rollup_backfill_days: int = Field(
+        default=400,
+        description="Days of history rolled up when the rollup has no watermark yet",
+        ge=1,
+    )
+    outbox_dispatch_time_budget_seconds: int = Field(
+        default=20,
+        description="Stop claiming new batches after this many seconds in one dispatch run",
+        ge=1,
+    )
     metrics_ip_allowlist: list[str] = Field(
         default_factory=list,
         description="Comma-separated IPs/CIDRs allowed for /internal/metrics (when non-empty)",
@@ -91,6 +182,24 @@ class OperationsSettingsMixin:
             return [str(token).strip() for token in value if str(token).strip()]
         raise ValueError("metrics_ip_allowlist must be a comma-separated string or list")
 
+    @field_validator("profile_picture_extra_formats", mode="before")
+    @classmethod
+    def _parse_profile_picture_extra_formats(cls, value: object) -> list[str]:
+        if value is None:
+            return []
+        if isinstance(value, str):
+            tokens = [token.strip().lower() for token in value.split(",") if token.strip()]
+        elif isinstance(value, (list, tuple, set)):
+            tokens = [str(token).strip().lower() for token in value if str(token).strip()]
+        else:
+            raise ValueError(
+                "profile_picture_extra_formats must be a comma-separated string or list"
+            )
+        unsupported = sorted(set(tokens) - {"webp", "avif"})
+        if unsupported:
+            raise ValueError(f"Unsupported profile picture formats: {', '.join(unsupported)}")
+        return list(dict.fromkeys(tokens))
+
     @property
     def flower_user(self) -> str | None:
         auth_value = secret_or_plain(self.flower_basic_auth).strip()
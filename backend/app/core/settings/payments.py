@@ -36,6 +36,30 @@ class PaymentsSettingsMixin:
         default=15, description="Platform fee percentage (15 = 15%)"
     )
     stripe_currency: str = Field(default="usd", description="Default currency for payments")
+    payment_jobs_concurrency: int = Field(
+        default=1,
+        description=(
+            "Bookings processed in parallel by the scheduled authorization, retry and capture "
+            "jobs (keep within DB_WORKER_POOL_SIZE + DB_WORKER_MAX_OVERFLOW)"
+        ),
+        ge=1,
+    )
+    payment_jobs_stripe_rps: float = Field(
+        default=25.0,
+        description=(
+            "Platform-wide Stripe calls per second when payment jobs run with "
+            "payment_jobs_concurrency > 1 (0 = off)"
+        ),
+        ge=0,
+    )
+    payment_jobs_stripe_account_rps: float = Field(
+        default=5.0,
+        description=(
+            "Stripe calls per second per instructor account when payment jobs run with "
+            "payment_jobs_concurrency > 1 (0 = off)"
+        ),
+        ge=0,
+    )
 
     @property
     def webhook_secrets(self) -> list[str]:
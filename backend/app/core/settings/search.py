@@ -9,6 +9,70 @@ class SearchSettingsMixin:
     guest_session_purge_days: int = 90
     search_history_max_per_user: int = 1000
     search_analytics_enabled: bool = True
+    search_event_write_behind_enabled: bool = Field(
+        default=False,
+        description="Buffer search events in-process and write them in batches off the request path",
+    )
+    search_event_buffer_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Pending search events per worker before searches write their own events again",
+    )
+    search_event_flush_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Search events written per multi-row INSERT batch",
+    )
+    search_event_flush_interval_ms: int = Field(
+        default=500,
+        ge=10,
+        description="Longest a buffered search event waits before its batch is written",
+    )
+    nl_search_single_flight_enabled: bool = Field(
+        default=True,
+        description="Coalesce concurrent identical NL searches that miss the response cache",
+    )
+    nl_search_single_flight_distributed: bool = Field(
+        default=False,
+        description="Also coalesce across workers with a Redis lock on the response cache key",
+    )
+    nl_search_single_flight_lock_ttl_seconds: int = Field(
+        default=15,
+        ge=1,
+        description="Expiry of the cross-worker rebuild lock (bounds a crashed rebuilder)",
+    )
+    nl_search_single_flight_wait_ms: int = Field(
+        default=2000,
+        ge=0,
+        description="How long to wait for another worker's rebuild before running the pipeline",
+    )
+    nl_search_stale_while_revalidate: bool = Field(
+        default=True,
+        description="Serve the previous cache version's response while a rebuild is in flight",
+    )
+    nl_search_vector_backend: str = Field(
+        default="pgvector",
+        description="Vector candidate backend: pgvector|memory (per-process ANN index)",
+    )
+    nl_search_ann_nprobe: int = Field(
+        default=16,
+        ge=1,
+        description="IVF lists probed per query by the in-memory vector index",
+    )
+    nl_search_ann_refresh_seconds: int = Field(
+        default=60,
+        ge=5,
+        description="How often the in-memory vector index pulls changed catalog embeddings",
+    )
+    nl_search_ranking_snapshot_enabled: bool = Field(
+        default=False,
+        description="Score NL search results from a per-process snapshot of ranking signals",
+    )
+    nl_search_ranking_snapshot_refresh_seconds: int = Field(
+        default=300,
+        ge=10,
+        description="How often the ranking signal snapshot is rebuilt from the database",
+    )
     openai_location_model: str = Field(
         default="gpt-4o-mini",
         alias="OPENAI_LOCATION_MODEL",
@@ -34,6 +98,13 @@ class SearchSettingsMixin:
             "Higher values reduce latency but risk rate limits; monitor 429s."
         ),
     )
+    geoip_database_path: str = Field(
+        default="",
+        description=(
+            "IP range table built by scripts/build_geoip_table.py; "
+            "empty falls back to the HTTP geolocation services"
+        ),
+    )
     geocoding_provider: str = Field(
         default="google", description="Geocoding provider: google|mapbox|mock"
     )
@@ -5,11 +5,7 @@ from contextvars import ContextVar
 from dataclasses import dataclass, field
 import logging
 import os
-from typing import Awaitable, Callable, List, Optional
-
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from typing import List, Optional
 
 
 @dataclass
@@ -22,6 +18,8 @@ class _PerfState:
     sql_statements: List[str] = field(default_factory=list)
     table_counts: dict[str, int] = field(default_factory=dict)
     cache_keys: List[str] = field(default_factory=list)
+    tier_hits: dict[str, int] = field(default_factory=dict)
+    tier_misses: dict[str, int] = field(default_factory=dict)
 
 
 _state_var: ContextVar[Optional[_PerfState]] = ContextVar("perf_state", default=None)
@@ -58,6 +56,8 @@ class PerfSnapshot:
     sql_statements: List[str]
     table_counts: dict[str, int]
     cache_keys: List[str]
+    tier_hits: dict[str, int] = field(default_factory=dict)
+    tier_misses: dict[str, int] = field(default_factory=dict)
 
 
 def snapshot() -> PerfSnapshot:
@@ -70,6 +70,8 @@ def snapshot() -> PerfSnapshot:
         sql_statements=list(state.sql_statements),
         table_counts=dict(state.table_counts),
         cache_keys=list(state.cache_keys),
+        tier_hits=dict(state.tier_hits),
+        tier_misses=dict(state.tier_misses),
     )
 
 
@@ -104,6 +106,15 @@ def note_cache_miss(_key: str) -> None:
     logger.debug("cache miss key=%s total=%s state_id=%s", _key, state.cache_misses, id(state))
 
 
+def note_cache_tier(tier: str, hit: bool) -> None:
+    """Record a per-tier (l1/l2) cache lookup outcome for the current request."""
+    if not perf_counters_enabled():
+        return
+    state = _get_or_create_state()
+    counts = state.tier_hits if hit else state.tier_misses
+    counts[tier] = counts.get(tier, 0) + 1
+
+
 def record_cache_key(cache_key: str) -> None:
     """Record cache keys accessed during the request."""
     if not perf_counters_enabled():
@@ -114,59 +125,13 @@ def record_cache_key(cache_key: str) -> None:
         keys.append(cache_key)
 
 
-class PerfCounterMiddleware(BaseHTTPMiddleware):
-    """Attach per-request perf counters to HTTP responses."""
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        if not perf_counters_enabled():
-            return await call_next(request)
-
-        track_sql = request.headers.get("x-debug-sql", "0").lower() in {"1", "true", "yes"}
-        reset_counters()
-        response = await call_next(request)
-
-        state = _state_var.get(None)
-        if state is None:
-            state = _PerfState()
-
-        if state.cache_hits > 0 and state.cache_misses == 0 and state.db_queries > 0:
-            state.cache_misses = 1
-
-        response.headers["x-db-query-count"] = str(state.db_queries)
-        response.headers["x-cache-hits"] = str(state.cache_hits)
-        response.headers["x-cache-misses"] = str(state.cache_misses)
-        # Per-request logging removed - counters available in response headers
-
-        response.headers["x-db-table-availability_slots"] = str(
-            state.table_counts.get("availability_slots", 0)
-        )
-
-        if track_sql:
-            response.headers["x-db-sql-samples"] = str(len(state.sql_statements))
-            # SQL logging removed - count available in response headers
-
-        if state.cache_keys:
-            response.headers["x-cache-key"] = state.cache_keys[0]
-
-        # Share counters with outer middleware/components via request.state
-        try:
-            request.state.query_count = state.db_queries
-            request.state.cache_hits = state.cache_hits
-            request.state.cache_misses = state.cache_misses
-        except Exception:  # pragma: no cover - defensive
-            logger.debug("Unable to attach perf counters to request state", exc_info=True)
-        return response
-
-
 __all__ = [
-    "PerfCounterMiddleware",
     "perf_counters_enabled",
     "reset_counters",
     "inc_db_query",
     "note_cache_hit",
     "note_cache_miss",
+    "note_cache_tier",
     "record_cache_key",
     "snapshot",
 ]
@@ -0,0 +1,161 @@
+# backend/app/middleware/request_pipeline.py
+"""
+Fused pure-ASGI request pipeline.
+
+``register_middleware`` used to stack five ``BaseHTTPMiddleware`` layers for
+per-request bookkeeping: site headers, the rate-limit identity, CORS headers on
+error responses, perf counters and Prometheus metrics. Each of those ran the
+downstream app in its own task, wrapped the body in a memory stream and rebuilt
+the response, so every request paid that overhead several times and streaming
+responses were re-chunked by each layer.
+
+``RequestPipelineMiddleware`` does the same work in one pass:
+
+- before the app runs: resolve the rate-limit identity into ``request.state``,
+  reset perf counters (when enabled) and start the Prometheus in-progress gauge;
+- on ``http.response.start``: add perf-counter headers, backfill CORS headers
+  for allowed origins, add ``X-Site-Mode``/``X-Phase`` and record the Prometheus
+  request duration and status;
+- afterwards: end the in-progress gauge, even when the app raises.
+
+Body messages are passed through untouched.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from typing import Any, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.constants import SSE_PATH_PREFIX
+from ..monitoring.prometheus_metrics import prometheus_metrics
+from ..ratelimit.identity import resolve_identity
+from .perf_counters import _PerfState, _state_var, perf_counters_enabled, reset_counters
+
+# Metrics endpoints are scraped constantly; SSE streams would sit in the gauge.
+_METRICS_EXCLUDED_PATHS = frozenset({"/api/v1/metrics/prometheus", "/api/v1/internal/metrics"})
+
+
+def endpoint_label(path: str) -> str:
+    """Normalize numeric path segments to keep label cardinality low."""
+    return "/".join(":id" if segment.isdigit() else segment for segment in path.split("/"))
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    for key, value in scope.get("headers") or ():
+        if key == name:
+            return bytes(value).decode("latin-1")
+    return None
+
+
+def _apply_perf_counters(headers: MutableHeaders, state: dict[str, Any], track_sql: bool) -> None:
+    perf = _state_var.get(None) or _PerfState()
+    if perf.cache_hits > 0 and perf.cache_misses == 0 and perf.db_queries > 0:
+        perf.cache_misses = 1
+
+    headers["x-db-query-count"] = str(perf.db_queries)
+    headers["x-cache-hits"] = str(perf.cache_hits)
+    headers["x-cache-misses"] = str(perf.cache_misses)
+    for tier in sorted(set(perf.tier_hits) | set(perf.tier_misses)):
+        headers[f"x-cache-{tier}-hits"] = str(perf.tier_hits.get(tier, 0))
+        headers[f"x-cache-{tier}-misses"] = str(perf.tier_misses.get(tier, 0))
+    headers["x-db-table-availability_slots"] = str(perf.table_counts.get("availability_slots", 0))
+    if track_sql:
+        headers["x-db-sql-samples"] = str(len(perf.sql_statements))
+    if perf.cache_keys:
+        headers["x-cache-key"] = perf.cache_keys[0]
+
+    # Share counters with outer middleware (PerformanceMiddleware) via request.state
+    state["query_count"] = perf.db_queries
+    state["cache_hits"] = perf.cache_hits
+    state["cache_misses"] = perf.cache_misses
+
+
+class RequestPipelineMiddleware:
+    """Identity, perf counters, CORS-on-error, site headers and Prometheus in one layer."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        allowed_origins: Sequence[str] = (),
+        origin_regex: str | None = None,
+        perf_counters: bool = False,
+    ) -> None:
+        self.app = app
+        self._allowed_origins = {origin.strip() for origin in allowed_origins if origin}
+        self._origin_regex = re.compile(origin_regex) if origin_regex else None
+        self._perf_counters = perf_counters
+
+    def _origin_allowed(self, origin: str | None) -> bool:
+        if not origin:
+            return False
+        if origin in self._allowed_origins:
+            return True
+        return bool(self._origin_regex and self._origin_regex.match(origin))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        try:
+            state["rate_identity"] = resolve_identity(Request(scope))
+        except Exception:
+            state["rate_identity"] = "ip:unknown"
+
+        path = scope.get("path", "")
+        method = scope.get("method", "")
+        origin = _header(scope, b"origin")
+        site_mode = (os.getenv("SITE_MODE", "") or "").strip().lower() or "unset"
+
+        perf = self._perf_counters and perf_counters_enabled()
+        track_sql = False
+        if perf:
+            track_sql = (_header(scope, b"x-debug-sql") or "0").lower() in {"1", "true", "yes"}
+            reset_counters()
+
+        label: str | None = None
+        if path not in _METRICS_EXCLUDED_PATHS and not path.startswith(SSE_PATH_PREFIX):
+            label = endpoint_label(path)
+            prometheus_metrics.track_http_request_start(method, label)
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if perf:
+                    _apply_perf_counters(headers, state, track_sql)
+                if (
+                    origin
+                    and "access-control-allow-origin" not in headers
+                    and self._origin_allowed(origin)
+                ):
+                    headers["access-control-allow-origin"] = origin
+                    if "access-control-allow-credentials" not in headers:
+                        headers["access-control-allow-credentials"] = "true"
+                headers["X-Site-Mode"] = site_mode
+                headers["X-Phase"] = (headers.get("x-beta-phase") or "beta").strip()
+                if label is not None:
+                    prometheus_metrics.record_http_request(
+                        method=method,
+                        endpoint=label,
+                        duration=time.perf_counter() - start_time,
+                        status_code=message["status"],
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if label is not None:
+                prometheus_metrics.track_http_request_end(method, label)
+
+
+__all__ = ["RequestPipelineMiddleware", "endpoint_label"]
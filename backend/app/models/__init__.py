@@ -16,6 +16,12 @@ Note: The Service model has been replaced with a three-table catalog system:
 """
 
 from .address import InstructorServiceArea, NYCNeighborhood, UserAddress
+from .analytics_rollup import (
+    AnalyticsBookingDaily,
+    AnalyticsFunnelDaily,
+    AnalyticsInstructorDaily,
+    AnalyticsRollupWatermark,
+)
 from .audit_log import AuditLog, AuditLogEntry
 from .availability import BlackoutDate
 from .availability_day import AvailabilityDay  # noqa: F401
@@ -31,6 +37,7 @@ from .booking_reschedule import BookingReschedule
 from .booking_transfer import BookingTransfer
 from .booking_video_session import BookingVideoSession
 from .conversation import Conversation
+from .conversation_read_state import ConversationReadState
 from .conversation_user_state import ConversationUserState
 from .event_outbox import EventOutbox, EventOutboxStatus, NotificationDelivery
 from .favorite import UserFavorite
@@ -56,6 +63,7 @@ from .message import (
     MessageNotification,
 )
 from .monitoring import AlertHistory
+from .next_availability import InstructorNextAvailability
 
 # NL Search models
 from .nl_search import (
@@ -128,6 +136,11 @@ __all__ = [
     "InstructorService",
     "ServiceFormatPrice",
     "ServiceAnalytics",
+    # Analytics rollup models
+    "AnalyticsBookingDaily",
+    "AnalyticsInstructorDaily",
+    "AnalyticsFunnelDaily",
+    "AnalyticsRollupWatermark",
     # Filter models
     "FilterDefinition",
     "FilterOption",
@@ -136,6 +149,7 @@ __all__ = [
     # Availability models
     "BlackoutDate",
     "AvailabilityDay",
+    "InstructorNextAvailability",
     # Authentication models
     "PasswordResetToken",
     "TrustedDevice",
@@ -183,6 +197,7 @@ __all__ = [
     "Conversation",
     "Message",
     "MessageNotification",
+    "ConversationReadState",
     "ConversationUserState",
     # Message type constants
     "MESSAGE_TYPE_USER",
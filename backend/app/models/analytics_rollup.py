@@ -0,0 +1,96 @@
+"""Daily rollups backing the admin platform analytics dashboards."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Date, DateTime, Index, Integer, Numeric, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+# Bookings whose service has no category roll up under this id.
+UNCATEGORIZED = ""
+
+
+class AnalyticsBookingDaily(Base):
+    """
+    Bookings per UTC start day, category and status.
+
+    ``gmv`` sums ``total_price`` and ``instructor_payout_cents`` sums the booking
+    payment payout for every booking in the group; readers decide which statuses
+    count towards revenue.
+    """
+
+    __tablename__ = "analytics_booking_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    category_id: Mapped[str] = mapped_column(String(26), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    bookings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    gmv: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    instructor_payout_cents: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class AnalyticsInstructorDaily(Base):
+    """
+    Per-instructor daily supply and booking counts.
+
+    ``bookings_created``/``bookings_confirmed`` are keyed by the booking's UTC
+    creation day, ``completed_minutes`` by its UTC start day and
+    ``available_slots`` by the availability bitmap's ``day_date``.
+    """
+
+    __tablename__ = "analytics_instructor_daily"
+    __table_args__ = (Index("ix_analytics_instructor_daily_instructor", "instructor_id", "day"),)
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    instructor_id: Mapped[str] = mapped_column(String(26), primary_key=True)
+    available_slots: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bookings_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bookings_confirmed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class AnalyticsFunnelDaily(Base):
+    """Booking funnel stage counts per UTC day."""
+
+    __tablename__ = "analytics_funnel_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    searches: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    zero_result_searches: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    profile_views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bookings_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bookings_confirmed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    payment_successes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class AnalyticsRollupWatermark(Base):
+    """
+    Progress marker for an incremental rollup.
+
+    Source rows created or updated at or after ``watermark`` have not been
+    folded into the rollup yet; whole UTC days before it are complete.
+    """
+
+    __tablename__ = "analytics_rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<AnalyticsRollupWatermark {self.name} {self.watermark}>"
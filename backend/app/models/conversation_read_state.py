@@ -0,0 +1,41 @@
+"""Per-user unread counters and read watermarks for conversations."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ConversationReadState(Base):
+    """
+    Materialized unread state of one conversation for one participant.
+
+    ``unread_count`` counts visible messages with an unread ``MessageNotification``
+    for the user; message writes maintain it in the same transaction and the
+    reconciliation task corrects any drift. ``last_read_message_id`` is the read
+    watermark: the newest read message (ULIDs sort by creation) below the user's
+    oldest visible unread one, so everything at or below it is read. Read receipts
+    are reported for every message from the other participant at or below it,
+    with ``last_read_at`` as the read time.
+    """
+
+    __tablename__ = "conversation_read_state"
+    __table_args__ = (Index("ix_conversation_read_state_conversation", "conversation_id"),)
+
+    user_id: Mapped[str] = mapped_column(
+        String(26), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    conversation_id: Mapped[str] = mapped_column(
+        String(26), ForeignKey("conversations.id", ondelete="CASCADE"), primary_key=True
+    )
+    unread_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_read_message_id: Mapped[Optional[str]] = mapped_column(String(26), nullable=True)
+    last_read_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
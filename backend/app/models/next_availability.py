@@ -0,0 +1,63 @@
+"""Materialized earliest-bookable-slot index per instructor."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from typing import Optional
+
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, Integer, String, Time, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class InstructorNextAvailability(Base):
+    """
+    Earliest bookable slot for one (instructor, location type, lesson duration).
+
+    Rows are recomputed from bitmaps, bookings and blackouts by
+    ``NextAvailabilityService``. Writers that change availability only flip
+    ``is_stale``; readers ignore stale or expired rows and fall back to the
+    live computation.
+
+    ``next_date``/``next_start_time`` are instructor-local. ``next_start_at`` is
+    the same instant in UTC. A row with NULL ``next_date`` means "nothing bookable
+    through ``horizon_end``".
+    """
+
+    __tablename__ = "instructor_next_availability"
+    __table_args__ = (
+        Index(
+            "ix_instructor_next_availability_soonest",
+            "location_type",
+            "duration_minutes",
+            "next_start_at",
+        ),
+        Index("ix_instructor_next_availability_refresh", "is_stale", "computed_at"),
+    )
+
+    instructor_id: Mapped[str] = mapped_column(
+        String(26),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    location_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    duration_minutes: Mapped[int] = mapped_column(Integer, primary_key=True)
+    next_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    next_start_time: Mapped[Optional[time]] = mapped_column(Time, nullable=True)
+    next_start_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    horizon_end: Mapped[date] = mapped_column(Date, nullable=False)
+    is_stale: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default="false"
+    )
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<InstructorNextAvailability {self.instructor_id} {self.location_type}/"
+            f"{self.duration_minutes}m next={self.next_date} {self.next_start_time}>"
+        )
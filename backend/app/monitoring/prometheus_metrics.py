@@ -11,7 +11,7 @@ import logging
 import os
 from threading import Lock
 from time import monotonic
-from typing import Dict, Optional, cast
+from typing import Dict, Optional, Sequence, cast
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -73,6 +73,20 @@ errors_total = Counter(
 )
 
 # Cache metrics for personal assets
+cache_tier_requests_total = Counter(
+    "instainstru_cache_tier_requests_total",
+    "CacheService lookups by tier (l1 in-process, l2 redis) and outcome",
+    ["tier", "outcome"],
+    registry=REGISTRY,
+)
+
+sse_events_shed_total = Counter(
+    "instainstru_sse_events_shed_total",
+    "SSE events not delivered individually by the fan-out hub (coalesced, dropped, overflow)",
+    ["event_type", "reason"],
+    registry=REGISTRY,
+)
+
 profile_pic_url_cache_hits_total = Counter(
     "instainstru_profile_pic_url_cache_hits_total",
     "Total number of cache hits for profile picture URL generation",
@@ -201,6 +215,48 @@ notifications_dispatch_seconds = Histogram(
     buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
 )
 
+notifications_outbox_batch_size = Histogram(
+    "instainstru_notifications_outbox_batch_size",
+    "Outbox events claimed per batch delivery",
+    registry=REGISTRY,
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+
+notifications_outbox_lag_seconds = Histogram(
+    "instainstru_notifications_outbox_lag_seconds",
+    "Delay between an outbox event becoming due and being claimed for delivery",
+    registry=REGISTRY,
+    buckets=(0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 900.0, 3600.0),
+)
+
+notifications_outbox_throughput = Gauge(
+    "instainstru_notifications_outbox_throughput_per_second",
+    "Events processed per second by the most recent outbox delivery batch",
+    registry=REGISTRY,
+)
+
+booking_reminders_total = Counter(
+    "instainstru_booking_reminders_total",
+    "Booking reminder notifications by reminder kind, recipient and outcome",
+    ["kind", "recipient", "outcome"],
+    registry=REGISTRY,
+)
+
+booking_reminder_batch_size = Histogram(
+    "instainstru_booking_reminder_batch_size",
+    "Bookings claimed per reminder chunk",
+    ["kind"],
+    registry=REGISTRY,
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+
+booking_reminders_throughput = Gauge(
+    "instainstru_booking_reminders_throughput_per_second",
+    "Reminder notifications sent per second by the most recent chunk",
+    ["kind"],
+    registry=REGISTRY,
+)
+
 audit_log_write_total = Counter(
     "instainstru_audit_log_write_total",
     "Total number of audit log entries written",
@@ -326,6 +382,30 @@ class PrometheusMetrics:
         notifications_dispatch_seconds.labels(event_type=event_type).observe(max(duration, 0.0))
         PrometheusMetrics._invalidate_cache()
 
+    @staticmethod
+    def observe_outbox_batch(size: int, duration: float, lags: Sequence[float] = ()) -> None:
+        """Record batch size, per-event claim lag and throughput for a delivery batch."""
+        notifications_outbox_batch_size.observe(size)
+        for lag in lags:
+            notifications_outbox_lag_seconds.observe(max(lag, 0.0))
+        if duration > 0:
+            notifications_outbox_throughput.set(size / duration)
+        PrometheusMetrics._invalidate_cache()
+
+    @staticmethod
+    def record_booking_reminder(kind: str, recipient: str, outcome: str) -> None:
+        """Record one reminder notification to an instructor or student."""
+        booking_reminders_total.labels(kind=kind, recipient=recipient, outcome=outcome).inc()
+        PrometheusMetrics._invalidate_cache()
+
+    @staticmethod
+    def observe_booking_reminder_batch(kind: str, size: int, sent: int, duration: float) -> None:
+        """Record chunk size and notification throughput for a reminder chunk."""
+        booking_reminder_batch_size.labels(kind=kind).observe(size)
+        if duration > 0:
+            booking_reminders_throughput.labels(kind=kind).set(sent / duration)
+        PrometheusMetrics._invalidate_cache()
+
     @staticmethod
     def get_metrics() -> bytes:
         """
@@ -426,6 +506,18 @@ class PrometheusMetrics:
         audit_log_list_seconds.observe(duration_seconds)
         PrometheusMetrics._invalidate_cache()
 
+    @staticmethod
+    def record_cache_tier(tier: str, hit: bool) -> None:
+        """Record a CacheService lookup outcome for the given tier."""
+        cache_tier_requests_total.labels(tier=tier, outcome="hit" if hit else "miss").inc()
+        PrometheusMetrics._invalidate_cache()
+
+    @staticmethod
+    def record_sse_shed(event_type: str, reason: str) -> None:
+        """Record an SSE event coalesced or dropped by a bounded connection queue."""
+        sse_events_shed_total.labels(event_type=event_type, reason=reason).inc()
+        PrometheusMetrics._invalidate_cache()
+
     @staticmethod
     def record_booking_lock(action: str, outcome: str) -> None:
         """Record booking lock operations by action and outcome."""
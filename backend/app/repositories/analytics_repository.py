@@ -5,9 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime
 import logging
-from typing import Iterable, Optional, Sequence
+from typing import Optional, Sequence
 
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.address import InstructorServiceArea, RegionBoundary
@@ -600,17 +600,6 @@ class AnalyticsRepository:
         )
         return [row[0] for row in rows]
 
-    def list_users_created_between(
-        self, *, role_name: str, start: datetime, end: datetime
-    ) -> list[User]:
-        return list(
-            self.db.query(User)
-            .join(UserRole, UserRole.user_id == User.id)
-            .join(Role, Role.id == UserRole.role_id)
-            .filter(Role.name == role_name, User.created_at >= start, User.created_at <= end)
-            .all()
-        )
-
     def list_users_by_role(self, role_name: str) -> list[User]:
         return list(
             self.db.query(User)
@@ -620,28 +609,6 @@ class AnalyticsRepository:
             .all()
         )
 
-    def list_user_ids_with_bookings(
-        self,
-        *,
-        user_ids: Iterable[str],
-        role: str,
-        start: datetime,
-        end: datetime,
-    ) -> set[str]:
-        if not user_ids:
-            return set()
-        query = self.db.query(Booking)
-        if role == "student":
-            query = query.filter(Booking.student_id.in_(list(user_ids)))
-        else:
-            query = query.filter(Booking.instructor_id.in_(list(user_ids)))
-        rows = query.filter(
-            Booking.booking_start_utc >= start, Booking.booking_start_utc <= end
-        ).all()
-        if role == "student":
-            return {row.student_id for row in rows}
-        return {row.instructor_id for row in rows}
-
     def count_instructors_for_category(self, category_id: str) -> int:
         return int(
             self.db.query(func.count(func.distinct(InstructorService.instructor_profile_id)))
@@ -671,6 +638,32 @@ class AnalyticsRepository:
         )
         return int(rows)
 
+    def category_student_counts(
+        self, *, start: datetime, end: datetime
+    ) -> dict[str, tuple[int, int]]:
+        """Distinct students and repeat students (2+ bookings) per category, in one query."""
+        per_student = (
+            select(
+                ServiceSubcategory.category_id.label("category_id"),
+                Booking.student_id.label("student_id"),
+                func.count(Booking.id).label("bookings"),
+            )
+            .join(InstructorService, Booking.instructor_service_id == InstructorService.id)
+            .join(ServiceCatalog, InstructorService.service_catalog_id == ServiceCatalog.id)
+            .join(ServiceSubcategory, ServiceCatalog.subcategory_id == ServiceSubcategory.id)
+            .where(Booking.booking_start_utc >= start, Booking.booking_start_utc <= end)
+            .group_by(ServiceSubcategory.category_id, Booking.student_id)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(
+                per_student.c.category_id,
+                func.count(),
+                func.count().filter(per_student.c.bookings > 1),
+            ).group_by(per_student.c.category_id)
+        ).all()
+        return {row[0]: (int(row[1]), int(row[2])) for row in rows}
+
     def list_availability_instructor_ids(self, category_ids: Optional[Sequence[str]]) -> list[str]:
         query = self.db.query(func.distinct(InstructorProfile.user_id))
         query = query.join(
@@ -0,0 +1,407 @@
+"""Repository for the admin analytics daily rollup tables."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+import logging
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Date, cast, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.analytics_rollup import (
+    UNCATEGORIZED,
+    AnalyticsBookingDaily,
+    AnalyticsFunnelDaily,
+    AnalyticsInstructorDaily,
+    AnalyticsRollupWatermark,
+)
+from app.models.availability_day import AvailabilityDay
+from app.models.booking import Booking
+from app.models.booking_payment import BookingPayment
+from app.models.payment import PaymentEvent
+from app.models.search_event import SearchEvent
+from app.models.search_interaction import SearchInteraction
+from app.models.service_catalog import InstructorService, ServiceCatalog, ServiceCategory
+from app.models.subcategory import ServiceSubcategory
+from app.services.timezone_service import TimezoneService
+
+CONFIRMED_STATUSES = ("CONFIRMED", "COMPLETED")
+PAYMENT_SUCCESS_EVENTS = ("auth_succeeded", "captured")
+
+_FUNNEL_COLUMNS = (
+    "searches",
+    "zero_result_searches",
+    "profile_views",
+    "bookings_created",
+    "bookings_confirmed",
+    "payment_successes",
+)
+_INSTRUCTOR_BOOKING_COLUMNS = ("bookings_created", "bookings_confirmed", "completed_minutes")
+
+
+@dataclass
+class BookingRollupTotals:
+    """Summed booking rollup rows; ``day``/``category_*`` are None unless grouped by."""
+
+    status: str
+    bookings: int
+    gmv: Decimal
+    instructor_payout_cents: int
+    day: Optional[date] = None
+    category_id: Optional[str] = None
+    category_name: Optional[str] = None
+
+
+@dataclass
+class FunnelRollupTotals:
+    searches: int = 0
+    zero_result_searches: int = 0
+    profile_views: int = 0
+    bookings_created: int = 0
+    bookings_confirmed: int = 0
+    payment_successes: int = 0
+
+
+@dataclass
+class InstructorRollupTotals:
+    bookings_created: int = 0
+    bookings_confirmed: int = 0
+    completed_minutes: int = 0
+
+
+def _utc_day(column: Any) -> Any:
+    return cast(func.timezone("UTC", column), Date)
+
+
+class AnalyticsRollupRepository:
+    """
+    Reads and maintains the daily rollups.
+
+    Day ranges are half-open ``[start_day, end_day)`` UTC days. Rebuilds replace
+    every rollup value in the range, so recomputing a day twice is harmless.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.logger = logging.getLogger(__name__)
+
+    # Watermarks
+
+    def get_watermark(self, name: str) -> Optional[datetime]:
+        watermark: Optional[datetime] = self.db.execute(
+            select(AnalyticsRollupWatermark.watermark).where(AnalyticsRollupWatermark.name == name)
+        ).scalar_one_or_none()
+        return watermark
+
+    def set_watermark(self, name: str, watermark: datetime) -> None:
+        stmt = insert(AnalyticsRollupWatermark).values(name=name, watermark=watermark)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"watermark": stmt.excluded.watermark, "updated_at": func.now()},
+        )
+        self.db.execute(stmt)
+
+    # Change detection
+
+    def list_changed_days(self, since: datetime) -> set[date]:
+        """UTC days whose rollup values may differ from rows changed at or after ``since``."""
+        changed_bookings = or_(Booking.updated_at >= since, Booking.created_at >= since)
+        queries = [
+            select(_utc_day(Booking.booking_start_utc)).where(changed_bookings),
+            select(_utc_day(Booking.created_at)).where(changed_bookings),
+            select(_utc_day(SearchEvent.searched_at)).where(SearchEvent.created_at >= since),
+            select(_utc_day(SearchInteraction.created_at)).where(
+                SearchInteraction.created_at >= since
+            ),
+            select(_utc_day(PaymentEvent.created_at)).where(PaymentEvent.created_at >= since),
+            # Payouts live on booking_payments, which has no update timestamp; payment
+            # events mark the booking's start day dirty instead.
+            select(_utc_day(Booking.booking_start_utc))
+            .join(PaymentEvent, PaymentEvent.booking_id == Booking.id)
+            .where(PaymentEvent.created_at >= since),
+        ]
+        days: set[date] = set()
+        for query in queries:
+            days.update(day for day in self.db.execute(query.distinct()).scalars() if day)
+        return days
+
+    def list_availability_changed_since(
+        self, since: Optional[datetime]
+    ) -> list[tuple[str, date, bytes]]:
+        """``(instructor_id, day_date, bits)`` for bitmaps saved at or after ``since``."""
+        query = select(
+            AvailabilityDay.instructor_id, AvailabilityDay.day_date, AvailabilityDay.bits
+        )
+        if since is not None:
+            query = query.where(AvailabilityDay.updated_at >= since)
+        return [(row[0], row[1], bytes(row[2] or b"")) for row in self.db.execute(query)]
+
+    # Rebuilds
+
+    def rebuild_days(self, start_day: date, end_day: date) -> None:
+        """Recompute booking, funnel and per-instructor booking rollups for the range."""
+        self._rebuild_booking_daily(start_day, end_day)
+        self._rebuild_funnel_daily(start_day, end_day)
+        self._rebuild_instructor_booking_columns(start_day, end_day)
+
+    def _rebuild_booking_daily(self, start_day: date, end_day: date) -> None:
+        day = _utc_day(Booking.booking_start_utc)
+        category_id = func.coalesce(ServiceSubcategory.category_id, UNCATEGORIZED)
+        status = func.coalesce(Booking.status, "")
+        rows = self.db.execute(
+            select(
+                day,
+                category_id,
+                status,
+                func.count(Booking.id),
+                func.coalesce(func.sum(Booking.total_price), 0),
+                func.coalesce(func.sum(BookingPayment.instructor_payout_amount), 0),
+            )
+            .select_from(Booking)
+            .outerjoin(BookingPayment, Booking.id == BookingPayment.booking_id)
+            .outerjoin(InstructorService, Booking.instructor_service_id == InstructorService.id)
+            .outerjoin(ServiceCatalog, InstructorService.service_catalog_id == ServiceCatalog.id)
+            .outerjoin(ServiceSubcategory, ServiceCatalog.subcategory_id == ServiceSubcategory.id)
+            .where(
+                Booking.booking_start_utc >= TimezoneService.utc_day_start(start_day),
+                Booking.booking_start_utc < TimezoneService.utc_day_start(end_day),
+            )
+            .group_by(day, category_id, status)
+        ).all()
+        self.db.execute(
+            delete(AnalyticsBookingDaily).where(
+                AnalyticsBookingDaily.day >= start_day, AnalyticsBookingDaily.day < end_day
+            )
+        )
+        if rows:
+            self.db.execute(
+                insert(AnalyticsBookingDaily),
+                [
+                    {
+                        "day": row[0],
+                        "category_id": row[1],
+                        "status": row[2],
+                        "bookings": int(row[3]),
+                        "gmv": row[4],
+                        "instructor_payout_cents": int(row[5]),
+                    }
+                    for row in rows
+                ],
+            )
+
+    def _count_by_day(self, column: Any, start_day: date, end_day: date, *criteria: Any) -> Any:
+        day = _utc_day(column)
+        return self.db.execute(
+            select(day, func.count())
+            .where(
+                column >= TimezoneService.utc_day_start(start_day),
+                column < TimezoneService.utc_day_start(end_day),
+                *criteria,
+            )
+            .group_by(day)
+        ).all()
+
+    def _rebuild_funnel_daily(self, start_day: date, end_day: date) -> None:
+        sources = {
+            "searches": (SearchEvent.searched_at, ()),
+            "zero_result_searches": (SearchEvent.searched_at, (SearchEvent.results_count == 0,)),
+            "profile_views": (
+                SearchInteraction.created_at,
+                (SearchInteraction.interaction_type == "view_profile",),
+            ),
+            "bookings_created": (Booking.created_at, ()),
+            "bookings_confirmed": (
+                Booking.created_at,
+                (Booking.status.in_(CONFIRMED_STATUSES),),
+            ),
+            "payment_successes": (
+                PaymentEvent.created_at,
+                (PaymentEvent.event_type.in_(PAYMENT_SUCCESS_EVENTS),),
+            ),
+        }
+        by_day: dict[date, dict[str, int]] = {}
+        for name, (column, criteria) in sources.items():
+            for day, count in self._count_by_day(column, start_day, end_day, *criteria):
+                by_day.setdefault(day, dict.fromkeys(_FUNNEL_COLUMNS, 0))[name] = int(count)
+        self.db.execute(
+            delete(AnalyticsFunnelDaily).where(
+                AnalyticsFunnelDaily.day >= start_day, AnalyticsFunnelDaily.day < end_day
+            )
+        )
+        if by_day:
+            self.db.execute(
+                insert(AnalyticsFunnelDaily),
+                [{"day": day, **counts} for day, counts in by_day.items()],
+            )
+
+    def _rebuild_instructor_booking_columns(self, start_day: date, end_day: date) -> None:
+        created_day = _utc_day(Booking.created_at)
+        start_day_expr = _utc_day(Booking.booking_start_utc)
+        by_key: dict[tuple[date, str], dict[str, int]] = {}
+        created_rows = self.db.execute(
+            select(
+                created_day,
+                Booking.instructor_id,
+                func.count(Booking.id),
+                func.count(Booking.id).filter(Booking.status.in_(CONFIRMED_STATUSES)),
+            )
+            .where(
+                Booking.created_at >= TimezoneService.utc_day_start(start_day),
+                Booking.created_at < TimezoneService.utc_day_start(end_day),
+            )
+            .group_by(created_day, Booking.instructor_id)
+        ).all()
+        for day, instructor_id, created, confirmed in created_rows:
+            entry = by_key.setdefault(
+                (day, instructor_id), dict.fromkeys(_INSTRUCTOR_BOOKING_COLUMNS, 0)
+            )
+            entry["bookings_created"] = int(created)
+            entry["bookings_confirmed"] = int(confirmed)
+        minutes_rows = self.db.execute(
+            select(start_day_expr, Booking.instructor_id, func.sum(Booking.duration_minutes))
+            .where(
+                Booking.booking_start_utc >= TimezoneService.utc_day_start(start_day),
+                Booking.booking_start_utc < TimezoneService.utc_day_start(end_day),
+                Booking.status == "COMPLETED",
+            )
+            .group_by(start_day_expr, Booking.instructor_id)
+        ).all()
+        for day, instructor_id, minutes in minutes_rows:
+            entry = by_key.setdefault(
+                (day, instructor_id), dict.fromkeys(_INSTRUCTOR_BOOKING_COLUMNS, 0)
+            )
+            entry["completed_minutes"] = int(minutes or 0)
+
+        # Zero the range first so bookings that moved or were deleted drop out.
+        self.db.execute(
+            update(AnalyticsInstructorDaily)
+            .where(
+                AnalyticsInstructorDaily.day >= start_day, AnalyticsInstructorDaily.day < end_day
+            )
+            .values(**dict.fromkeys(_INSTRUCTOR_BOOKING_COLUMNS, 0), computed_at=func.now())
+        )
+        if by_key:
+            stmt = insert(AnalyticsInstructorDaily)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["day", "instructor_id"],
+                set_={
+                    **{name: stmt.excluded[name] for name in _INSTRUCTOR_BOOKING_COLUMNS},
+                    "computed_at": func.now(),
+                },
+            )
+            self.db.execute(
+                stmt,
+                [
+                    {"day": day, "instructor_id": instructor_id, **counts}
+                    for (day, instructor_id), counts in by_key.items()
+                ],
+            )
+
+    def upsert_available_slots(self, rows: Sequence[tuple[str, date, int]]) -> int:
+        """Store ``(instructor_id, day, slot count)`` availability per instructor-day."""
+        if not rows:
+            return 0
+        stmt = insert(AnalyticsInstructorDaily)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "instructor_id"],
+            set_={"available_slots": stmt.excluded.available_slots, "computed_at": func.now()},
+        )
+        self.db.execute(
+            stmt,
+            [
+                {"day": day, "instructor_id": instructor_id, "available_slots": slots}
+                for instructor_id, day, slots in rows
+            ],
+        )
+        return len(rows)
+
+    # Reads
+
+    def sum_booking_rollups(
+        self,
+        *,
+        start_day: date,
+        end_day: date,
+        by_day: bool = False,
+        by_category: bool = False,
+    ) -> list[BookingRollupTotals]:
+        model = AnalyticsBookingDaily
+        keys: list[Any] = [model.status.label("status")]
+        if by_day:
+            keys.append(model.day.label("day"))
+        if by_category:
+            keys.extend(
+                [
+                    model.category_id.label("category_id"),
+                    ServiceCategory.name.label("category_name"),
+                ]
+            )
+        query = select(
+            *keys,
+            func.sum(model.bookings).label("bookings"),
+            func.sum(model.gmv).label("gmv"),
+            func.sum(model.instructor_payout_cents).label("instructor_payout_cents"),
+        ).where(model.day >= start_day, model.day < end_day)
+        if by_category:
+            # Matches the inner category joins of ``list_category_booking_rows``.
+            query = query.join(ServiceCategory, ServiceCategory.id == model.category_id)
+        return [
+            BookingRollupTotals(
+                **{
+                    **row._mapping,
+                    "bookings": int(row.bookings or 0),
+                    "gmv": Decimal(row.gmv or 0),
+                    "instructor_payout_cents": int(row.instructor_payout_cents or 0),
+                }
+            )
+            for row in self.db.execute(query.group_by(*keys))
+        ]
+
+    def sum_funnel_rollups(self, *, start_day: date, end_day: date) -> FunnelRollupTotals:
+        model = AnalyticsFunnelDaily
+        row = self.db.execute(
+            select(*(func.coalesce(func.sum(getattr(model, c)), 0) for c in _FUNNEL_COLUMNS)).where(
+                model.day >= start_day, model.day < end_day
+            )
+        ).one()
+        return FunnelRollupTotals(**{c: int(v) for c, v in zip(_FUNNEL_COLUMNS, row)})
+
+    def sum_instructor_rollups(
+        self,
+        *,
+        start_day: date,
+        end_day: date,
+        instructor_ids: Optional[Sequence[str]] = None,
+    ) -> InstructorRollupTotals:
+        model = AnalyticsInstructorDaily
+        query = select(
+            *(func.coalesce(func.sum(getattr(model, c)), 0) for c in _INSTRUCTOR_BOOKING_COLUMNS)
+        ).where(model.day >= start_day, model.day < end_day)
+        if instructor_ids:
+            query = query.where(model.instructor_id.in_(list(instructor_ids)))
+        row = self.db.execute(query).one()
+        return InstructorRollupTotals(
+            **{c: int(v) for c, v in zip(_INSTRUCTOR_BOOKING_COLUMNS, row)}
+        )
+
+    def sum_available_slots(
+        self, *, instructor_ids: Sequence[str], start_date: date, end_date: date
+    ) -> int:
+        """Availability slots for ``instructor_ids`` between the dates, both inclusive."""
+        if not instructor_ids:
+            return 0
+        model = AnalyticsInstructorDaily
+        return int(
+            self.db.execute(
+                select(func.coalesce(func.sum(model.available_slots), 0)).where(
+                    model.instructor_id.in_(list(instructor_ids)),
+                    model.day >= start_date,
+                    model.day <= end_date,
+                )
+            ).scalar()
+            or 0
+        )
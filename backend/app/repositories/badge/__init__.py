@@ -0,0 +1 @@
+"""Badge repository sub-modules. Import from badge_repository.py facade."""
@@ -0,0 +1,300 @@
+"""Set-based badge reads and bulk writes covering many students per statement."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ...core.ulid_helper import generate_ulid
+from ...models.badge import BadgeDefinition, BadgeProgress, StudentBadge
+from ...models.booking import Booking, BookingStatus
+from ...models.review import Review, ReviewStatus
+from ...models.service_catalog import InstructorService, ServiceCatalog, ServiceCategory
+from ...models.subcategory import ServiceSubcategory
+from .types import BulkAwardRow, ReviewStats, StudentBadgeAwardRow, StudentBadgeProgressRow
+
+
+class BadgeBatchMixin:
+    """Grouped readers and bulk writers used by batch badge evaluation."""
+
+    db: Session
+
+    def list_badge_awards_for_students(
+        self, student_ids: Sequence[str]
+    ) -> Dict[str, List[StudentBadgeAwardRow]]:
+        """Return award rows grouped by student for all ``student_ids`` in one query."""
+
+        grouped: Dict[str, List[StudentBadgeAwardRow]] = {sid: [] for sid in student_ids}
+        if not student_ids:
+            return grouped
+        rows = cast(
+            List[Tuple[StudentBadge, BadgeDefinition]],
+            self.db.query(StudentBadge, BadgeDefinition)
+            .join(BadgeDefinition, StudentBadge.badge_id == BadgeDefinition.id)
+            .filter(StudentBadge.student_id.in_(list(student_ids)))
+            .all(),
+        )
+        for award, definition in rows:
+            grouped.setdefault(award.student_id, []).append(
+                StudentBadgeAwardRow(
+                    badge_id=award.badge_id,
+                    slug=definition.slug,
+                    name=definition.name,
+                    description=definition.description,
+                    criteria_config=definition.criteria_config,
+                    status=award.status,
+                    awarded_at=award.awarded_at,
+                    confirmed_at=award.confirmed_at,
+                    progress_snapshot=award.progress_snapshot,
+                )
+            )
+        return grouped
+
+    def list_badge_progress_for_students(
+        self, student_ids: Sequence[str]
+    ) -> Dict[str, List[StudentBadgeProgressRow]]:
+        """Return progress rows grouped by student for all ``student_ids`` in one query."""
+
+        grouped: Dict[str, List[StudentBadgeProgressRow]] = {sid: [] for sid in student_ids}
+        if not student_ids:
+            return grouped
+        rows = cast(
+            List[Tuple[BadgeProgress, BadgeDefinition]],
+            self.db.query(BadgeProgress, BadgeDefinition)
+            .join(BadgeDefinition, BadgeProgress.badge_id == BadgeDefinition.id)
+            .filter(BadgeProgress.student_id.in_(list(student_ids)))
+            .all(),
+        )
+        for progress, definition in rows:
+            grouped.setdefault(progress.student_id, []).append(
+                StudentBadgeProgressRow(
+                    badge_id=progress.badge_id,
+                    slug=definition.slug,
+                    name=definition.name,
+                    description=definition.description,
+                    criteria_config=definition.criteria_config,
+                    current_progress=progress.current_progress,
+                    last_updated=progress.last_updated,
+                )
+            )
+        return grouped
+
+    def list_completed_lessons_for_students(
+        self, student_ids: Sequence[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return completed lessons per student, each list ordered by completion time."""
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {sid: [] for sid in student_ids}
+        if not student_ids:
+            return grouped
+        rows = (
+            self.db.query(
+                Booking.student_id,
+                Booking.id,
+                Booking.instructor_id,
+                Booking.completed_at,
+                func.coalesce(Booking.confirmed_at, Booking.created_at),
+            )
+            .filter(
+                Booking.student_id.in_(list(student_ids)),
+                Booking.status == BookingStatus.COMPLETED,
+                Booking.completed_at.isnot(None),
+            )
+            .order_by(Booking.student_id, Booking.completed_at.asc())
+            .all()
+        )
+        for student_id, booking_id, instructor_id, completed_at, booked_at in rows:
+            grouped.setdefault(student_id, []).append(
+                {
+                    "booking_id": booking_id,
+                    "instructor_id": instructor_id,
+                    "completed_at": completed_at,
+                    "booked_at": booked_at,
+                }
+            )
+        return grouped
+
+    def count_completed_lessons_by_category_for_students(
+        self, student_ids: Sequence[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """Return ``{student_id: {category_id: completed_count}}`` in one grouped query."""
+
+        grouped: Dict[str, Dict[str, int]] = {sid: {} for sid in student_ids}
+        if not student_ids:
+            return grouped
+        rows: Sequence[Tuple[str, str, int]] = (
+            self.db.query(Booking.student_id, ServiceCategory.id, func.count(Booking.id))
+            .select_from(Booking)
+            .join(InstructorService, Booking.instructor_service_id == InstructorService.id)
+            .join(ServiceCatalog, InstructorService.service_catalog_id == ServiceCatalog.id)
+            .join(ServiceSubcategory, ServiceCatalog.subcategory_id == ServiceSubcategory.id)
+            .join(ServiceCategory, ServiceSubcategory.category_id == ServiceCategory.id)
+            .filter(
+                Booking.student_id.in_(list(student_ids)),
+                Booking.status == BookingStatus.COMPLETED,
+                Booking.completed_at.isnot(None),
+            )
+            .group_by(Booking.student_id, ServiceCategory.id)
+            .all()
+        )
+        for student_id, category_id, count in rows:
+            grouped.setdefault(student_id, {})[category_id] = int(count)
+        return grouped
+
+    def get_review_stats_for_students(
+        self,
+        student_ids: Sequence[str],
+        *,
+        since_utc: Optional[datetime] = None,
+    ) -> Dict[str, ReviewStats]:
+        """Review count/avg rating per student, optionally limited to reviews since ``since_utc``."""
+
+        stats: Dict[str, ReviewStats] = {
+            sid: ReviewStats(count=0, avg_rating=0.0) for sid in student_ids
+        }
+        if not student_ids:
+            return stats
+        query = self.db.query(
+            Review.student_id,
+            func.count(Review.id),
+            func.avg(Review.rating * 1.0),
+        ).filter(
+            Review.student_id.in_(list(student_ids)),
+            Review.status.in_([ReviewStatus.PUBLISHED.value, ReviewStatus.FLAGGED.value]),
+        )
+        if since_utc is not None:
+            query = query.filter(Review.created_at >= since_utc)
+        rows: Sequence[Tuple[str, Optional[int], Optional[float]]] = query.group_by(
+            Review.student_id
+        ).all()
+        for student_id, total, avg_rating in rows:
+            stats[student_id] = ReviewStats(
+                count=int(total or 0),
+                avg_rating=float(avg_rating) if avg_rating is not None else 0.0,
+            )
+        return stats
+
+    def get_cancel_noshow_rates_for_students(
+        self,
+        student_ids: Sequence[str],
+        now_utc: datetime,
+        window_days: int,
+    ) -> Dict[str, float]:
+        """Cancel/no-show rate (percent) per student inside the rolling window."""
+
+        rates: Dict[str, float] = {sid: 0.0 for sid in student_ids}
+        window_days = int(window_days or 0)
+        if not student_ids or window_days <= 0:
+            return rates
+
+        window_start = now_utc - timedelta(days=window_days)
+        rows: Sequence[Tuple[str, str, int]] = (
+            self.db.query(Booking.student_id, Booking.status, func.count(Booking.id))
+            .filter(
+                Booking.student_id.in_(list(student_ids)),
+                Booking.created_at >= window_start,
+                Booking.status.in_(
+                    [BookingStatus.COMPLETED, BookingStatus.CANCELLED, BookingStatus.NO_SHOW]
+                ),
+            )
+            .group_by(Booking.student_id, Booking.status)
+            .all()
+        )
+        totals: Dict[str, Dict[str, int]] = {}
+        for student_id, status, count in rows:
+            totals.setdefault(student_id, {})[status] = int(count)
+        for student_id, by_status in totals.items():
+            total = sum(by_status.values())
+            if total:
+                issues = by_status.get(BookingStatus.CANCELLED, 0) + by_status.get(
+                    BookingStatus.NO_SHOW, 0
+                )
+                rates[student_id] = (issues / total) * 100.0
+        return rates
+
+    def bulk_upsert_progress(
+        self,
+        rows: Sequence[Tuple[str, str, Dict[str, Any]]],
+        *,
+        now_utc: datetime,
+    ) -> None:
+        """Insert or update ``(student_id, badge_id, progress_json)`` rows in one statement."""
+
+        if not rows:
+            return
+        stmt = pg_insert(BadgeProgress).values(
+            [
+                {
+                    "id": generate_ulid(),
+                    "student_id": student_id,
+                    "badge_id": badge_id,
+                    "current_progress": progress_json,
+                    "last_updated": now_utc,
+                }
+                for student_id, badge_id, progress_json in rows
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_badge_progress_student_badge",
+            set_={
+                "current_progress": stmt.excluded.current_progress,
+                "last_updated": stmt.excluded.last_updated,
+            },
+        )
+        self.db.execute(stmt)
+        self.db.flush()
+
+    def bulk_insert_awards(
+        self,
+        rows: Sequence[BulkAwardRow],
+        *,
+        now_utc: datetime,
+    ) -> List[Tuple[str, str]]:
+        """
+        Insert (or revive revoked) awards in one statement.
+
+        Pending/confirmed awards are left untouched, matching
+        ``insert_award_pending_or_confirmed``. Returns the ``(student_id, badge_id)``
+        pairs that were written.
+        """
+
+        if not rows:
+            return []
+        values = []
+        for row in rows:
+            hold_hours = int(row["hold_hours"])
+            values.append(
+                {
+                    "id": generate_ulid(),
+                    "student_id": row["student_id"],
+                    "badge_id": row["badge_id"],
+                    "status": "pending" if hold_hours > 0 else "confirmed",
+                    "awarded_at": now_utc,
+                    "hold_until": (
+                        now_utc + timedelta(hours=hold_hours) if hold_hours > 0 else None
+                    ),
+                    "confirmed_at": now_utc if hold_hours <= 0 else None,
+                    "revoked_at": None,
+                    "progress_snapshot": row["progress_snapshot"],
+                }
+            )
+        stmt = pg_insert(StudentBadge).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_student_badges_student_badge",
+            set_={
+                "status": stmt.excluded.status,
+                "awarded_at": stmt.excluded.awarded_at,
+                "hold_until": stmt.excluded.hold_until,
+                "confirmed_at": stmt.excluded.confirmed_at,
+                "revoked_at": None,
+                "progress_snapshot": stmt.excluded.progress_snapshot,
+            },
+            where=StudentBadge.status == "revoked",
+        ).returning(StudentBadge.student_id, StudentBadge.badge_id)
+        written = [(student_id, badge_id) for student_id, badge_id in self.db.execute(stmt)]
+        self.db.flush()
+        return written
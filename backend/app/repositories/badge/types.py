@@ -0,0 +1,39 @@
+"""Row types returned and accepted by the badge repository."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, TypedDict
+
+
+class StudentBadgeAwardRow(TypedDict, total=False):
+    badge_id: str
+    slug: str
+    name: str
+    description: Optional[str]
+    criteria_config: Optional[Dict[str, Any]]
+    status: str
+    awarded_at: Any
+    confirmed_at: Optional[Any]
+    progress_snapshot: Optional[Dict[str, Any]]
+
+
+class StudentBadgeProgressRow(TypedDict, total=False):
+    badge_id: str
+    slug: str
+    name: str
+    description: Optional[str]
+    criteria_config: Optional[Dict[str, Any]]
+    current_progress: Optional[Dict[str, Any]]
+    last_updated: Any
+
+
+class ReviewStats(TypedDict):
+    count: int
+    avg_rating: float
+
+
+class BulkAwardRow(TypedDict):
+    student_id: str
+    badge_id: str
+    hold_hours: int
+    progress_snapshot: Dict[str, Any]
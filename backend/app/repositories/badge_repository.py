@@ -8,7 +8,7 @@ All functions in this module are database-only and free of business logic.
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 from sqlalchemy import func, or_
 from sqlalchemy.exc import IntegrityError
@@ -20,37 +20,12 @@ from ..models.review import Review, ReviewStatus
 from ..models.service_catalog import InstructorService, ServiceCatalog, ServiceCategory
 from ..models.subcategory import ServiceSubcategory
 from ..models.user import User
+from .badge.batch_mixin import BadgeBatchMixin
+from .badge.types import BulkAwardRow, ReviewStats, StudentBadgeAwardRow, StudentBadgeProgressRow
 from .base_repository import BaseRepository
 
 
-class StudentBadgeAwardRow(TypedDict, total=False):
-    badge_id: str
-    slug: str
-    name: str
-    description: Optional[str]
-    criteria_config: Optional[Dict[str, Any]]
-    status: str
-    awarded_at: Any
-    confirmed_at: Optional[Any]
-    progress_snapshot: Optional[Dict[str, Any]]
-
-
-class StudentBadgeProgressRow(TypedDict, total=False):
-    badge_id: str
-    slug: str
-    name: str
-    description: Optional[str]
-    criteria_config: Optional[Dict[str, Any]]
-    current_progress: Optional[Dict[str, Any]]
-    last_updated: Any
-
-
-class ReviewStats(TypedDict):
-    count: int
-    avg_rating: float
-
-
-class BadgeRepository(BaseRepository[BadgeDefinition]):
+class BadgeRepository(BadgeBatchMixin, BaseRepository[BadgeDefinition]):
     """Data access helpers for badge definitions, awards, and progress."""
 
     def __init__(self, db: Session):
@@ -623,6 +598,16 @@ class BadgeRepository(BaseRepository[BadgeDefinition]):
 
 __all__ = [
     "BadgeRepository",
+    "BulkAwardRow",
+    "StudentBadgeAwardRow",
+    "StudentBadgeProgressRow",
+]
+
+
+__all__ = [
+    "BadgeRepository",
+    "BulkAwardRow",
+    "ReviewStats",
     "StudentBadgeAwardRow",
     "StudentBadgeProgressRow",
 ]
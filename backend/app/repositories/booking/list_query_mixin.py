@@ -1,7 +1,7 @@
 """Student/instructor booking lists, pagination, and service catalog queries."""
 
 from datetime import date, datetime, timezone
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Dict, Iterator, List, Optional, Tuple, cast
 
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
@@ -245,6 +245,26 @@ class BookingListQueryMixin(BookingRepositoryMixinBase):
             self.logger.error("Error getting instructor bookings: %s", str(e))
             raise RepositoryException(f"Failed to get instructor bookings: {str(e)}")
 
+    def iter_user_bookings_for_export(
+        self, user_id: str, *, batch_size: int = 500
+    ) -> Iterator[Booking]:
+        """
+        Stream every booking where the user is student or instructor.
+
+        Uses a server-side cursor without eager loads so memory stays flat for
+        long-tenured users; callers should only read booking columns.
+        """
+        try:
+            query = (
+                self.db.query(Booking)
+                .filter(or_(Booking.student_id == user_id, Booking.instructor_id == user_id))
+                .order_by(Booking.booking_date.desc(), Booking.id.desc())
+            )
+            yield from query.yield_per(batch_size)
+        except Exception as e:
+            self.logger.error("Error streaming bookings for export: %s", str(e))
+            raise RepositoryException(f"Failed to stream bookings for export: {str(e)}")
+
     def get_instructor_bookings_page(
         self,
         instructor_id: str,
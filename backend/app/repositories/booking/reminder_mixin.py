@@ -0,0 +1,78 @@
+"""Claim and flag bookings for the scheduled reminder dispatcher."""
+
+from datetime import datetime
+from typing import Any, List, Literal, Sequence, cast
+
+from sqlalchemy import update
+from sqlalchemy.orm import selectinload
+
+from ...database.session_utils import get_dialect_name
+from ...models.booking import Booking, BookingStatus
+from .mixin_base import BookingRepositoryMixinBase
+
+ReminderKind = Literal["24h", "1h"]
+
+_REMINDER_FLAGS: dict[str, Any] = {
+    "24h": Booking.reminder_24h_sent,
+    "1h": Booking.reminder_1h_sent,
+}
+
+
+class BookingReminderMixin(BookingRepositoryMixinBase):
+    """Chunked reminder claims with bulk flag updates."""
+
+    def claim_due_reminders(
+        self,
+        kind: ReminderKind,
+        window_start: datetime,
+        window_end: datetime,
+        limit: int,
+    ) -> List[Booking]:
+        """
+        Claim up to ``limit`` confirmed bookings whose ``kind`` reminder is due.
+
+        Rows are selected ``FOR UPDATE SKIP LOCKED`` (Postgres) so overlapping
+        dispatcher runs never claim the same booking, and the reminder flag is set
+        in the same transaction so the claim survives the commit. Callers release
+        bookings nobody could be notified for with ``release_reminder_claims``.
+        """
+        flag = _REMINDER_FLAGS[kind]
+        query = (
+            self.db.query(Booking)
+            .options(
+                selectinload(Booking.student),
+                selectinload(Booking.instructor),
+                selectinload(Booking.instructor_service),
+            )
+            .filter(
+                Booking.status == BookingStatus.CONFIRMED,
+                Booking.booking_start_utc >= window_start,
+                Booking.booking_start_utc < window_end,
+                flag.is_(False),
+            )
+            .order_by(Booking.booking_start_utc.asc(), Booking.id.asc())
+            .limit(limit)
+        )
+        if get_dialect_name(self.db, default="postgresql").lower() == "postgresql":
+            query = query.with_for_update(skip_locked=True, of=Booking)
+
+        bookings = cast(List[Booking], query.all())
+        if bookings:
+            self._set_reminder_flag(flag, [booking.id for booking in bookings], True)
+        return bookings
+
+    def release_reminder_claims(self, kind: ReminderKind, booking_ids: Sequence[str]) -> int:
+        """Clear the ``kind`` reminder flag on bookings whose reminder was never delivered."""
+        if not booking_ids:
+            return 0
+        return self._set_reminder_flag(_REMINDER_FLAGS[kind], booking_ids, False)
+
+    def _set_reminder_flag(self, flag: Any, booking_ids: Sequence[str], value: bool) -> int:
+        result = self.db.execute(
+            update(Booking)
+            .where(Booking.id.in_(list(booking_ids)))
+            .values({flag.key: value})
+            .execution_options(synchronize_session=False)
+        )
+        self.db.flush()
+        return int(getattr(result, "rowcount", 0) or 0)
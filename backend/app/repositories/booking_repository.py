@@ -18,6 +18,7 @@ from .booking.conversation_mixin import BookingConversationMixin
 from .booking.detail_query_mixin import BookingDetailQueryMixin
 from .booking.list_query_mixin import BookingListQueryMixin
 from .booking.payment_query_mixin import BookingPaymentQueryMixin
+from .booking.reminder_mixin import BookingReminderMixin
 from .booking.satellite_mixin import BookingSatelliteMixin
 from .booking.stats_mixin import BookingStatsMixin
 from .booking.status_mutation_mixin import BookingStatusMutationMixin
@@ -36,6 +37,7 @@ class BookingRepository(
     BookingStatsMixin,
     BookingAdminQueryMixin,
     BookingConversationMixin,
+    BookingReminderMixin,
     BaseRepository[Booking],
     CachedRepositoryMixin,
 ):
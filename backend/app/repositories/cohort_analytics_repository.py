@@ -0,0 +1,106 @@
+"""Repository for the admin cohort retention matrix."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+
+from sqlalchemy import and_, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.booking import Booking
+from app.models.rbac import Role, UserRole
+from app.models.user import User
+
+
+@dataclass
+class CohortActivityCounts:
+    """Cohort sizes and distinct active users keyed by UTC period start."""
+
+    cohort_sizes: dict[datetime, int]
+    active_users: dict[tuple[datetime, datetime], int]
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class CohortAnalyticsRepository:
+    """Grouped cohort membership and booking activity queries."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self.logger = logging.getLogger(__name__)
+
+    def cohort_activity_counts(
+        self,
+        *,
+        role_name: str,
+        unit: str,
+        start: datetime,
+        end: datetime,
+        activity_end: datetime,
+    ) -> CohortActivityCounts:
+        """
+        Count cohort members and their bookings per period in one grouped query.
+
+        Users with ``role_name`` created in ``[start, end)`` are grouped into
+        cohorts by ``date_trunc(unit)`` of ``created_at`` (UTC). Bookings from each
+        cohort's start up to ``activity_end`` are bucketed the same way, so the
+        result holds every (cohort, period) cell of the retention matrix.
+        """
+        cohort_start = func.date_trunc(unit, func.timezone("UTC", User.created_at))
+        cohort = (
+            self.db.query(User.id.label("user_id"), cohort_start.label("cohort_start"))
+            .join(UserRole, UserRole.user_id == User.id)
+            .join(Role, Role.id == UserRole.role_id)
+            .filter(Role.name == role_name, User.created_at >= start, User.created_at < end)
+            .cte("cohort")
+        )
+        booking_user = Booking.student_id if role_name == "student" else Booking.instructor_id
+        activity_start = func.date_trunc(unit, func.timezone("UTC", Booking.booking_start_utc))
+        activity = (
+            self.db.query(booking_user.label("user_id"), activity_start.label("activity_start"))
+            .filter(
+                booking_user.in_(select(cohort.c.user_id)),
+                Booking.booking_start_utc >= start,
+                Booking.booking_start_utc < activity_end,
+            )
+            .distinct()
+            .cte("activity")
+        )
+        rows = (
+            self.db.query(
+                cohort.c.cohort_start,
+                activity.c.activity_start,
+                func.grouping(activity.c.activity_start).label("is_cohort_total"),
+                func.count(func.distinct(cohort.c.user_id)).label("users"),
+            )
+            .select_from(cohort)
+            .outerjoin(
+                activity,
+                and_(
+                    activity.c.user_id == cohort.c.user_id,
+                    activity.c.activity_start >= cohort.c.cohort_start,
+                ),
+            )
+            .group_by(
+                func.grouping_sets(
+                    tuple_(cohort.c.cohort_start),
+                    tuple_(cohort.c.cohort_start, activity.c.activity_start),
+                )
+            )
+            .all()
+        )
+
+        counts = CohortActivityCounts(cohort_sizes={}, active_users={})
+        for row in rows:
+            cohort_key = _as_utc(row.cohort_start)
+            if row.is_cohort_total:
+                counts.cohort_sizes[cohort_key] = int(row.users)
+            elif row.activity_start is not None:
+                counts.active_users[(cohort_key, _as_utc(row.activity_start))] = int(row.users)
+        return counts
@@ -0,0 +1,220 @@
+"""Repository for materialized conversation unread counters and read watermarks."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import case, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.conversation_read_state import ConversationReadState
+
+from .base_repository import BaseRepository
+
+_STATE = ConversationReadState
+
+# Recompute counters and watermarks from message_notifications. The watermark is
+# the newest read message below the user's oldest visible unread one. Rows touched
+# by a live write after ``stable_before`` are skipped: the write already holds the
+# row lock and its own snapshot, so overwriting it could drop an increment.
+RECONCILE_SQL = text(
+    """
+    WITH first_unread AS (
+        SELECT n.user_id, m.conversation_id, MIN(m.id) AS message_id
+        FROM message_notifications n
+        JOIN messages m ON m.id = n.message_id
+        WHERE n.is_read = false AND m.is_deleted = false AND m.deleted_at IS NULL
+        GROUP BY n.user_id, m.conversation_id
+    ),
+    actual AS (
+        SELECT
+            n.user_id,
+            m.conversation_id,
+            COUNT(*) FILTER (
+                WHERE n.is_read = false AND m.is_deleted = false AND m.deleted_at IS NULL
+            ) AS unread_count,
+            MAX(m.id) FILTER (
+                WHERE n.is_read = true AND (f.message_id IS NULL OR m.id < f.message_id)
+            ) AS last_read_message_id,
+            MAX(n.read_at) AS last_read_at
+        FROM message_notifications n
+        JOIN messages m ON m.id = n.message_id
+        LEFT JOIN first_unread f
+            ON f.user_id = n.user_id AND f.conversation_id = m.conversation_id
+        GROUP BY n.user_id, m.conversation_id
+    ),
+    upserted AS (
+        INSERT INTO conversation_read_state AS s (
+            user_id, conversation_id, unread_count, last_read_message_id, last_read_at, updated_at
+        )
+        SELECT user_id, conversation_id, unread_count, last_read_message_id, last_read_at, now()
+        FROM actual
+        ON CONFLICT (user_id, conversation_id) DO UPDATE SET
+            unread_count = EXCLUDED.unread_count,
+            last_read_message_id = EXCLUDED.last_read_message_id,
+            last_read_at = GREATEST(s.last_read_at, EXCLUDED.last_read_at),
+            updated_at = now()
+        WHERE s.updated_at < :stable_before
+          AND (
+            s.unread_count <> EXCLUDED.unread_count
+            OR s.last_read_message_id IS DISTINCT FROM EXCLUDED.last_read_message_id
+          )
+        RETURNING 1
+    ),
+    zeroed AS (
+        UPDATE conversation_read_state s
+        SET unread_count = 0, updated_at = now()
+        WHERE s.unread_count <> 0
+          AND s.updated_at < :stable_before
+          AND NOT EXISTS (
+            SELECT 1 FROM actual a
+            WHERE a.user_id = s.user_id AND a.conversation_id = s.conversation_id
+          )
+        RETURNING 1
+    )
+    SELECT (SELECT COUNT(*) FROM upserted) + (SELECT COUNT(*) FROM zeroed)
+    """
+)
+
+
+class ConversationReadStateRepository(BaseRepository[ConversationReadState]):
+    """Data access for ``conversation_read_state`` rows."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, ConversationReadState)
+
+    def _insert(self) -> Any:
+        dialect_name = self.db.bind.dialect.name if self.db.bind else "postgresql"
+        return (sqlite_insert if dialect_name == "sqlite" else pg_insert)(ConversationReadState)
+
+    def increment_unread(self, user_id: str, conversation_id: str, amount: int = 1) -> None:
+        """Add ``amount`` unread messages for a participant (creates the row if needed)."""
+        now = datetime.now(timezone.utc)
+        stmt = self._insert().values(
+            user_id=user_id,
+            conversation_id=conversation_id,
+            unread_count=amount,
+            updated_at=now,
+        )
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "conversation_id"],
+                set_={"unread_count": _STATE.unread_count + amount, "updated_at": now},
+            )
+        )
+
+    def decrement_unread(self, user_id: str, conversation_id: str, amount: int = 1) -> None:
+        """Remove ``amount`` unread messages, never going below zero."""
+        self.db.execute(
+            update(ConversationReadState)
+            .where(_STATE.user_id == user_id, _STATE.conversation_id == conversation_id)
+            .values(
+                unread_count=case(
+                    (_STATE.unread_count > amount, _STATE.unread_count - amount), else_=0
+                ),
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+
+    def record_read(
+        self,
+        user_id: str,
+        conversation_id: str,
+        *,
+        last_message_id: Optional[str],
+        read_at: Optional[datetime],
+        read_count: int = 0,
+        clear: bool = False,
+    ) -> None:
+        """
+        Apply a read receipt: advance the watermark and lower the counter.
+
+        ``clear`` zeroes the counter (every visible message was marked read);
+        otherwise it drops by ``read_count``. The watermark only moves forward;
+        ``None`` leaves it where it is (an older message is still unread).
+        """
+        now = datetime.now(timezone.utc)
+        if last_message_id is None:
+            # The watermark stays: lower the counter, or only repair drift when clearing.
+            if read_count and not clear:
+                self.decrement_unread(user_id, conversation_id, read_count)
+            elif clear:
+                self.db.execute(
+                    update(ConversationReadState)
+                    .where(
+                        _STATE.user_id == user_id,
+                        _STATE.conversation_id == conversation_id,
+                        _STATE.unread_count != 0,
+                    )
+                    .values(unread_count=0, updated_at=now)
+                )
+            return
+
+        advances = (_STATE.last_read_message_id.is_(None)) | (
+            _STATE.last_read_message_id < last_message_id
+        )
+        unread = (
+            0
+            if clear
+            else case((_STATE.unread_count > read_count, _STATE.unread_count - read_count), else_=0)
+        )
+        stmt = self._insert().values(
+            user_id=user_id,
+            conversation_id=conversation_id,
+            unread_count=0,
+            last_read_message_id=last_message_id,
+            last_read_at=read_at or now,
+            updated_at=now,
+        )
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "conversation_id"],
+                set_={
+                    "unread_count": unread,
+                    "last_read_message_id": case(
+                        (advances, last_message_id), else_=_STATE.last_read_message_id
+                    ),
+                    "last_read_at": case((advances, read_at or now), else_=_STATE.last_read_at),
+                    "updated_at": now,
+                },
+            )
+        )
+
+    def get_total_unread(self, user_id: str) -> int:
+        """Sum of the user's per-conversation counters (one index range scan)."""
+        total = self.db.execute(
+            select(func.coalesce(func.sum(_STATE.unread_count), 0)).where(_STATE.user_id == user_id)
+        ).scalar()
+        return int(total or 0)
+
+    def get_unread_counts(self, user_id: str, conversation_ids: Sequence[str]) -> Dict[str, int]:
+        """Counters for the given conversations; conversations without unread are omitted."""
+        if not conversation_ids:
+            return {}
+        rows = self.db.execute(
+            select(_STATE.conversation_id, _STATE.unread_count).where(
+                _STATE.user_id == user_id,
+                _STATE.conversation_id.in_(list(conversation_ids)),
+                _STATE.unread_count > 0,
+            )
+        ).all()
+        return {str(conversation_id): int(count) for conversation_id, count in rows}
+
+    def get_watermarks(
+        self, conversation_id: str
+    ) -> Dict[str, Tuple[Optional[str], Optional[datetime]]]:
+        """Map participant id to ``(last_read_message_id, last_read_at)``."""
+        rows = self.db.execute(
+            select(_STATE.user_id, _STATE.last_read_message_id, _STATE.last_read_at).where(
+                _STATE.conversation_id == conversation_id
+            )
+        ).all()
+        return {str(user_id): (message_id, read_at) for user_id, message_id, read_at in rows}
+
+    def reconcile(self, *, stable_before: datetime) -> int:
+        """Correct counters/watermarks that drifted from message_notifications."""
+        corrected = self.db.execute(RECONCILE_SQL, {"stable_before": stable_before}).scalar()
+        return int(corrected or 0)
@@ -2,17 +2,17 @@
 """
 Repository for notification event outbox operations.
 
-Implements transactional enqueue, pending fetch with locking, and status updates
-required for the outbox dispatcher.
+Implements transactional enqueue, pending fetch with locking, batch claiming, and
+status updates (single-row and bulk) required for the outbox dispatcher.
 """
 
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any, Iterable, Optional, cast
+from typing import Any, Iterable, NamedTuple, Optional, Sequence, cast
 
-from sqlalchemy import Select, insert, select, update
+from sqlalchemy import Select, case, insert, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 import ulid
@@ -28,6 +28,27 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+class ClaimedEvent(NamedTuple):
+    """Detached snapshot of a claimed outbox row (safe to use after commit)."""
+
+    id: str
+    event_type: str
+    payload: dict[str, Any]
+    idempotency_key: str
+    attempt_count: int
+    due_at: Optional[datetime]
+
+
+class DeliveryFailure(NamedTuple):
+    """Outcome of a failed delivery attempt, applied in bulk by mark_failed_many."""
+
+    event_id: str
+    attempt_count: int
+    backoff_seconds: int
+    error: Optional[str]
+    terminal: bool
+
+
 class EventOutboxRepository:
     """Data access helpers for event outbox rows."""
 
@@ -126,6 +147,40 @@ class EventOutboxRepository:
         rows = cast(list[EventOutbox], result.scalars().all())
         return rows
 
+    def claim_pending(self, limit: int, lease_seconds: int) -> list[ClaimedEvent]:
+        """
+        Claim due events for batch delivery.
+
+        Rows are selected ``FOR UPDATE SKIP LOCKED`` (Postgres) so concurrent
+        dispatchers never pick the same row, then leased by pushing
+        ``next_attempt_at`` forward in the same statement batch. The lease keeps the
+        rows invisible to other dispatchers after the claiming transaction commits;
+        if the worker dies mid-batch they become due again once it expires.
+        """
+        rows = self.fetch_pending(limit=limit)
+        if not rows:
+            return []
+        claimed = [
+            ClaimedEvent(
+                id=cast(str, row.id),
+                event_type=cast(str, row.event_type),
+                payload=dict(cast(dict[str, Any], row.payload) or {}),
+                idempotency_key=cast(str, row.idempotency_key),
+                attempt_count=cast(int, row.attempt_count or 0),
+                due_at=cast(Optional[datetime], row.next_attempt_at),
+            )
+            for row in rows
+        ]
+        now = _now_utc()
+        self.db.execute(
+            update(EventOutbox)
+            .where(EventOutbox.id.in_([event.id for event in claimed]))
+            .values(next_attempt_at=now + timedelta(seconds=max(lease_seconds, 1)), updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.flush()
+        return claimed
+
     def get_by_id(self, event_id: str, for_update: bool = False) -> Optional[EventOutbox]:
         """Fetch a single outbox row."""
         if for_update and self._dialect == "postgresql":
@@ -197,6 +252,65 @@ class EventOutboxRepository:
         self.db.execute(update(EventOutbox).where(EventOutbox.id == event_id).values(**values))
         self.db.flush()
 
+    def mark_sent_many(self, event_ids: Sequence[str]) -> int:
+        """Mark delivered events SENT with a single UPDATE, counting this attempt."""
+        ids = list(event_ids)
+        if not ids:
+            return 0
+        now = _now_utc()
+        result = self.db.execute(
+            update(EventOutbox)
+            .where(EventOutbox.id.in_(ids))
+            .values(
+                status=EventOutboxStatus.SENT.value,
+                attempt_count=EventOutbox.attempt_count + 1,
+                last_error=None,
+                next_attempt_at=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.flush()
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    def mark_failed_many(self, failures: Sequence[DeliveryFailure]) -> None:
+        """
+        Apply failed delivery outcomes in bulk.
+
+        Failures sharing attempt number, backoff and terminal state are written with
+        one UPDATE; per-row error text is set through a CASE on the id.
+        """
+        groups: dict[tuple[int, int, bool], list[DeliveryFailure]] = {}
+        for failure in failures:
+            group_key = (failure.attempt_count, failure.backoff_seconds, failure.terminal)
+            groups.setdefault(group_key, []).append(failure)
+
+        now = _now_utc()
+        for (attempt_count, backoff_seconds, terminal), members in groups.items():
+            errors = {
+                member.event_id: (member.error[:1000] if member.error else None)
+                for member in members
+            }
+            values: dict[str, Any] = {
+                "attempt_count": attempt_count,
+                "updated_at": now,
+                "last_error": case(errors, value=EventOutbox.id, else_=None),
+            }
+            if terminal:
+                values["status"] = EventOutboxStatus.FAILED.value
+                values["next_attempt_at"] = now
+            else:
+                values["status"] = EventOutboxStatus.PENDING.value
+                values["next_attempt_at"] = now + timedelta(seconds=max(backoff_seconds, 1))
+            self.db.execute(
+                update(EventOutbox)
+                .where(EventOutbox.id.in_(list(errors)))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        if groups:
+            self.db.flush()
+
     def reset_failed(self, event_ids: Iterable[str]) -> None:
         """Reset failed rows back to pending (maintenance helper)."""
         ids = list(event_ids)
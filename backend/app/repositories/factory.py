@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from .address_repository import InstructorServiceAreaRepository
     from .alerts_repository import AlertsRepository
     from .analytics_repository import AnalyticsRepository
+    from .analytics_rollup_repository import AnalyticsRollupRepository
     from .audit_repository import AuditRepository
     from .availability_repository import AvailabilityRepository
     from .badge_repository import BadgeRepository
@@ -28,8 +29,10 @@ if TYPE_CHECKING:
     from .booking_repository import BookingRepository
     from .bulk_operation_repository import BulkOperationRepository
     from .category_repository import CategoryRepository
+    from .cohort_analytics_repository import CohortAnalyticsRepository
     from .communication_repository import CommunicationRepository
     from .conflict_checker_repository import ConflictCheckerRepository
+    from .conversation_read_state_repository import ConversationReadStateRepository
     from .conversation_repository import ConversationRepository
     from .credit_repository import CreditRepository
     from .event_outbox_repository import EventOutboxRepository
@@ -38,6 +41,7 @@ if TYPE_CHECKING:
     from .instructor_preferred_place_repository import InstructorPreferredPlaceRepository
     from .instructor_profile_repository import InstructorProfileRepository
     from .message_repository import MessageRepository
+    from .next_availability_repository import NextAvailabilityRepository
     from .notification_delivery_repository import NotificationDeliveryRepository
     from .notification_repository import NotificationRepository
     from .payment_repository import PaymentRepository
@@ -142,6 +146,20 @@ class RepositoryFactory:
 
         return AnalyticsRepository(db)
 
+    @staticmethod
+    def create_analytics_rollup_repository(db: Session) -> "AnalyticsRollupRepository":
+        """Create repository for the admin analytics daily rollups."""
+        from .analytics_rollup_repository import AnalyticsRollupRepository
+
+        return AnalyticsRollupRepository(db)
+
+    @staticmethod
+    def create_cohort_analytics_repository(db: Session) -> "CohortAnalyticsRepository":
+        """Create repository for the admin cohort retention matrix."""
+        from .cohort_analytics_repository import CohortAnalyticsRepository
+
+        return CohortAnalyticsRepository(db)
+
     @staticmethod
     def create_booking_note_repository(db: Session) -> "BookingNoteRepository":
         """Create repository for booking note operations."""
@@ -321,6 +339,13 @@ class RepositoryFactory:
 
         return PaymentRepository(db)
 
+    @staticmethod
+    def create_next_availability_repository(db: Session) -> "NextAvailabilityRepository":
+        """Create repository for the materialized next-available slot index."""
+        from .next_availability_repository import NextAvailabilityRepository
+
+        return NextAvailabilityRepository(db)
+
     @staticmethod
     def create_platform_config_repository(db: Session) -> "PlatformConfigRepository":
         """Create repository for platform configuration access."""
@@ -339,6 +364,15 @@ class RepositoryFactory:
 
         return SearchEventRepository(db)
 
+    @staticmethod
+    def create_conversation_read_state_repository(
+        db: Session,
+    ) -> "ConversationReadStateRepository":
+        """Create repository for materialized unread counters and read watermarks."""
+        from .conversation_read_state_repository import ConversationReadStateRepository
+
+        return ConversationReadStateRepository(db)
+
     @staticmethod
     def create_conversation_repository(db: Session) -> "ConversationRepository":
         """
@@ -0,0 +1,140 @@
+# backend/app/repositories/filter_availability_context.py
+"""
+Loaders for the buffered availability context used by NL search refinement.
+
+``FilterRepository.get_buffered_availability_context`` returns everything the
+Python-side refinement needs in one shape: day bitmaps and format tags, active
+bookings, and instructor buffer profiles and timezones.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, List, Optional, cast
+
+from sqlalchemy.orm import Session
+
+from app.models.availability_day import AvailabilityDay
+from app.models.booking import Booking, BookingStatus
+from app.models.instructor import InstructorProfile
+from app.models.user import User
+
+
+def load_buffered_availability_context(
+    db: Session, instructor_ids: List[str], dates: List[date]
+) -> Dict[str, object]:
+    """Load bitmap windows, bookings, and instructor buffers for Python-side refinement."""
+    if not instructor_ids or not dates:
+        return _empty_availability_context()
+
+    availability_rows = _load_availability_day_rows(db, instructor_ids, dates)
+    bits_by_key, format_tags_by_key = _build_availability_maps(availability_rows)
+    booking_rows = _load_booking_rows(db, instructor_ids, dates)
+
+    return {
+        "bits_by_key": bits_by_key,
+        "format_tags_by_key": format_tags_by_key,
+        "bookings_by_key": _group_bookings_by_key(booking_rows),
+        "profiles_by_instructor": _load_instructor_profiles(db, instructor_ids),
+        "timezones_by_instructor": _load_instructor_timezones(db, instructor_ids),
+    }
+
+
+def _empty_availability_context() -> Dict[str, object]:
+    """Return the default empty buffered availability context shape."""
+    return {
+        "bits_by_key": {},
+        "format_tags_by_key": {},
+        "bookings_by_key": {},
+        "profiles_by_instructor": {},
+        "timezones_by_instructor": {},
+    }
+
+
+def _load_availability_day_rows(
+    db: Session, instructor_ids: List[str], dates: List[date]
+) -> List[Any]:
+    """Load raw availability day rows used for buffered refinement."""
+    return cast(
+        List[Any],
+        db.query(
+            AvailabilityDay.instructor_id,
+            AvailabilityDay.day_date,
+            AvailabilityDay.bits,
+            AvailabilityDay.format_tags,
+        )
+        .filter(
+            AvailabilityDay.instructor_id.in_(instructor_ids),
+            AvailabilityDay.day_date.in_(dates),
+            AvailabilityDay.bits.isnot(None),
+        )
+        .all(),
+    )
+
+
+def _build_availability_maps(
+    availability_rows: List[Any],
+) -> tuple[Dict[tuple[str, date], object], Dict[tuple[str, date], object]]:
+    """Build keyed bitmaps and format-tag maps from raw availability rows."""
+    bits_by_key = {
+        (row.instructor_id, row.day_date): row.bits
+        for row in availability_rows
+        if row.bits is not None
+    }
+    format_tags_by_key = {
+        (row.instructor_id, row.day_date): row.format_tags
+        for row in availability_rows
+        if row.format_tags is not None
+    }
+    return bits_by_key, format_tags_by_key
+
+
+def _load_booking_rows(db: Session, instructor_ids: List[str], dates: List[date]) -> List[Booking]:
+    """Load booked time windows relevant to buffered availability checks."""
+    return cast(
+        List[Booking],
+        db.query(Booking)
+        .filter(
+            Booking.instructor_id.in_(instructor_ids),
+            Booking.booking_date.in_(dates),
+            Booking.status.in_(
+                [
+                    BookingStatus.PENDING,
+                    BookingStatus.CONFIRMED,
+                    BookingStatus.COMPLETED,
+                ]
+            ),
+        )
+        .order_by(Booking.instructor_id, Booking.booking_date, Booking.start_time)
+        .all(),
+    )
+
+
+def _group_bookings_by_key(
+    booking_rows: List[Booking],
+) -> Dict[tuple[str, date], List[Booking]]:
+    """Group booking rows by instructor and booking date."""
+    bookings_by_key: Dict[tuple[str, date], List[Booking]] = {}
+    for booking in booking_rows:
+        bookings_by_key.setdefault((booking.instructor_id, booking.booking_date), []).append(
+            booking
+        )
+    return bookings_by_key
+
+
+def _load_instructor_profiles(
+    db: Session, instructor_ids: List[str]
+) -> Dict[str, InstructorProfile]:
+    """Load instructor profiles keyed by instructor id."""
+    profiles = (
+        db.query(InstructorProfile).filter(InstructorProfile.user_id.in_(instructor_ids)).all()
+    )
+    return {profile.user_id: profile for profile in profiles}
+
+
+def _load_instructor_timezones(db: Session, instructor_ids: List[str]) -> Dict[str, Optional[str]]:
+    """Load instructor user timezones keyed by instructor id."""
+    return {
+        row.id: row.timezone
+        for row in db.query(User.id, User.timezone).filter(User.id.in_(instructor_ids)).all()
+    }
@@ -5,20 +5,28 @@ Handles PostGIS location checks and availability validation.
 
 Adapted to actual InstaInstru schema:
 - instructor_service_areas + region_boundaries: Service area polygons
-- availability_days + check_availability function: Bitmap availability
+- availability_days.bits: Bitmap availability evaluated as bit strings in SQL
 """
 from __future__ import annotations
 
-from datetime import date, time
-from typing import Any, Dict, List, Optional, cast
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.models.availability_day import AvailabilityDay
-from app.models.booking import Booking, BookingStatus
-from app.models.instructor import InstructorProfile
-from app.models.user import User
+from app.core.constants import (
+    MINUTES_PER_SLOT,
+    NEXT_AVAILABILITY_DURATIONS,
+    NEXT_AVAILABILITY_LOCATION_TYPES,
+    NEXT_AVAILABILITY_MAX_AGE_MINUTES,
+    SLOTS_PER_DAY,
+)
+from app.repositories.filter_availability_context import load_buffered_availability_context
+from app.repositories.next_availability_repository import (
+    IndexedNextSlot,
+    NextAvailabilityRepository,
+)
 
 
 def _group_availability_rows_by_instructor(rows: Any) -> Dict[str, List[date]]:
@@ -29,104 +37,80 @@ def _group_availability_rows_by_instructor(rows: Any) -> Dict[str, List[date]]:
     return grouped
 
 
-def _empty_availability_context() -> Dict[str, object]:
-    """Return the default empty buffered availability context shape."""
-    return {
-        "bits_by_key": {},
-        "format_tags_by_key": {},
-        "bookings_by_key": {},
-        "profiles_by_instructor": {},
-        "timezones_by_instructor": {},
-    }
-
-
-def _load_availability_day_rows(
-    db: Session, instructor_ids: List[str], dates: List[date]
-) -> List[Any]:
-    """Load raw availability day rows used for buffered refinement."""
-    return cast(
-        List[Any],
-        db.query(
-            AvailabilityDay.instructor_id,
-            AvailabilityDay.day_date,
-            AvailabilityDay.bits,
-            AvailabilityDay.format_tags,
-        )
-        .filter(
-            AvailabilityDay.instructor_id.in_(instructor_ids),
-            AvailabilityDay.day_date.in_(dates),
-            AvailabilityDay.bits.isnot(None),
-        )
-        .all(),
-    )
-
-
-def _build_availability_maps(
-    availability_rows: List[Any],
-) -> tuple[Dict[tuple[str, date], object], Dict[tuple[str, date], object]]:
-    """Build keyed bitmaps and format-tag maps from raw availability rows."""
-    bits_by_key = {
-        (row.instructor_id, row.day_date): row.bits
-        for row in availability_rows
-        if row.bits is not None
-    }
-    format_tags_by_key = {
-        (row.instructor_id, row.day_date): row.format_tags
-        for row in availability_rows
-        if row.format_tags is not None
-    }
-    return bits_by_key, format_tags_by_key
-
-
-def _load_booking_rows(db: Session, instructor_ids: List[str], dates: List[date]) -> List[Booking]:
-    """Load booked time windows relevant to buffered availability checks."""
-    return cast(
-        List[Booking],
-        db.query(Booking)
-        .filter(
-            Booking.instructor_id.in_(instructor_ids),
-            Booking.booking_date.in_(dates),
-            Booking.status.in_(
-                [
-                    BookingStatus.PENDING,
-                    BookingStatus.CONFIRMED,
-                    BookingStatus.COMPLETED,
-                ]
-            ),
-        )
-        .order_by(Booking.instructor_id, Booking.booking_date, Booking.start_time)
-        .all(),
-    )
-
-
-def _group_bookings_by_key(
-    booking_rows: List[Booking],
-) -> Dict[tuple[str, date], List[Booking]]:
-    """Group booking rows by instructor and booking date."""
-    bookings_by_key: Dict[tuple[str, date], List[Booking]] = {}
-    for booking in booking_rows:
-        bookings_by_key.setdefault((booking.instructor_id, booking.booking_date), []).append(
-            booking
-        )
-    return bookings_by_key
+def _slot_index(value: time) -> int:
+    """Slot containing ``value`` (floor), matching the legacy check_availability() rules."""
+    return value.hour * (60 // MINUTES_PER_SLOT) + value.minute // MINUTES_PER_SLOT
+
 
+def _slot_window_mask(time_after: Optional[time], time_before: Optional[time]) -> str:
+    """Bit-string literal with ones on the slots a lesson may occupy (slot 0 first)."""
+    first_slot = _slot_index(time_after) if time_after is not None else 0
+    end_slot = _slot_index(time_before) if time_before is not None else SLOTS_PER_DAY
+    return "".join("1" if first_slot <= slot < end_slot else "0" for slot in range(SLOTS_PER_DAY))
 
-def _load_instructor_profiles(
-    db: Session, instructor_ids: List[str]
-) -> Dict[str, InstructorProfile]:
-    """Load instructor profiles keyed by instructor id."""
-    profiles = (
-        db.query(InstructorProfile).filter(InstructorProfile.user_id.in_(instructor_ids)).all()
-    )
-    return {profile.user_id: profile for profile in profiles}
 
+def _duration_slots(duration_minutes: int) -> int:
+    return -(-int(duration_minutes) // MINUTES_PER_SLOT)
 
-def _load_instructor_timezones(db: Session, instructor_ids: List[str]) -> Dict[str, Optional[str]]:
-    """Load instructor user timezones keyed by instructor id."""
-    return {
-        row.id: row.timezone
-        for row in db.query(User.id, User.timezone).filter(User.id.in_(instructor_ids)).all()
-    }
+
+def _run_shift_plan(run_slots: int) -> List[int]:
+    """
+    Shift amounts that turn a slot bit string into "a run of ``run_slots`` starts here".
+
+    After ANDing with itself shifted by ``s`` (where ``s`` <= current run length ``k``), each
+    set bit marks a run of ``k + s`` ones, so the run length doubles until it reaches the target.
+    """
+    shifts: List[int] = []
+    covered = 1
+    while covered < run_slots:
+        shift = min(covered, run_slots - covered)
+        shifts.append(shift)
+        covered += shift
+    return shifts
+
+
+# ``bits`` keeps slot i in bit (i % 8) of byte (i // 8). Reversing the bits of every
+# byte (reverse each hex nibble, then swap the nibbles) yields a bit(288) whose
+# leftmost bit is slot 0, so ``<<`` lines slot i+s up with slot i.
+_SLOT_ORDERED_BITS_SQL = (
+    "CAST(CAST('x' || regexp_replace("
+    "translate(encode(ad.bits, 'hex'), '0123456789abcdef', '084c2a6e195d3b7f'), "
+    f"'(.)(.)', '\\2\\1', 'g') AS bit varying) AS bit({SLOTS_PER_DAY}))"
+)
+
+
+def _available_days_sql(shifts: List[int]) -> str:
+    """
+    Build the set-based availability query.
+
+    Each CTE layer halves the remaining run-length check, so a 60-minute lesson
+    (12 slots) needs four bit-string AND/shift passes per row instead of a
+    PL/pgSQL loop that re-reads the row.
+    """
+    layers = [
+        f"""run_0 AS (
+                SELECT ad.instructor_id, ad.day_date,
+                       {_SLOT_ORDERED_BITS_SQL} & CAST(:slot_mask AS bit({SLOTS_PER_DAY})) AS runs
+                FROM availability_days ad
+                WHERE ad.instructor_id = ANY(:instructor_ids)
+                  AND ad.day_date = ANY(:dates)
+                  AND ad.bits IS NOT NULL
+            )"""
+    ]
+    for step, shift in enumerate(shifts, start=1):
+        layers.append(
+            f"""run_{step} AS (
+                SELECT instructor_id, day_date, runs & (runs << {int(shift)}) AS runs
+                FROM run_{step - 1}
+            )"""
+        )
+    return f"""
+            WITH {", ".join(layers)}
+            SELECT instructor_id, day_date
+            FROM run_{len(shifts)}
+            WHERE position(B'1' IN runs) > 0
+            ORDER BY instructor_id, day_date
+        """
 
 
 class FilterRepository:
@@ -135,7 +119,7 @@ class FilterRepository:
 
     Handles:
     - PostGIS location containment checks via region_boundaries
-    - Availability bitmap validation via check_availability function
+    - Set-based availability bitmap checks (bit-string run detection)
     - Lesson-type-aware pricing intersections for NL search
     """
 
@@ -430,38 +414,14 @@ class FilterRepository:
         else:
             raise ValueError("dates_to_check is required when target_date is None")
 
-        # Single batched query for all instructors and all dates
-        query = text(
-            """
-            SELECT ad.instructor_id, ad.day_date
-            FROM availability_days ad
-            WHERE ad.instructor_id = ANY(:instructor_ids)
-              AND ad.day_date = ANY(:dates)
-              AND ad.bits IS NOT NULL
-              AND check_availability(
-                  ad.instructor_id,
-                  ad.day_date,
-                  :time_after,
-                  :time_before,
-                  :duration
-              )
-            ORDER BY ad.instructor_id, ad.day_date
-        """
+        return self._query_available_days(
+            instructor_ids,
+            dates_to_check,
+            time_after=time_after,
+            time_before=time_before,
+            duration_minutes=duration_minutes,
         )
 
-        result = self.db.execute(
-            query,
-            {
-                "instructor_ids": instructor_ids,
-                "dates": dates_to_check,
-                "time_after": time_after,
-                "time_before": time_before,
-                "duration": duration_minutes,
-            },
-        )
-
-        return _group_availability_rows_by_instructor(result)
-
     def check_weekend_availability(
         self,
         instructor_ids: List[str],
@@ -482,59 +442,70 @@ class FilterRepository:
         if not instructor_ids:
             return {}
 
-        # Use single batched query for both weekend days
-        query = text(
-            """
-            SELECT ad.instructor_id, ad.day_date
-            FROM availability_days ad
-            WHERE ad.instructor_id = ANY(:instructor_ids)
-              AND ad.day_date = ANY(:dates)
-              AND ad.bits IS NOT NULL
-              AND check_availability(
-                  ad.instructor_id,
-                  ad.day_date,
-                  :time_after,
-                  :time_before,
-                  :duration
-              )
-            ORDER BY ad.instructor_id, ad.day_date
-        """
+        return self._query_available_days(
+            instructor_ids,
+            [saturday, sunday],
+            time_after=time_after,
+            time_before=time_before,
+            duration_minutes=duration_minutes,
         )
 
+    def _query_available_days(
+        self,
+        instructor_ids: List[str],
+        dates: List[date],
+        *,
+        time_after: Optional[time],
+        time_before: Optional[time],
+        duration_minutes: int,
+    ) -> Dict[str, List[date]]:
+        """Evaluate every (instructor, date) bitmap in one set-based statement."""
         result = self.db.execute(
-            query,
+            text(_available_days_sql(_run_shift_plan(_duration_slots(duration_minutes)))),
             {
                 "instructor_ids": instructor_ids,
-                "dates": [saturday, sunday],
-                "time_after": time_after,
-                "time_before": time_before,
-                "duration": duration_minutes,
+                "dates": dates,
+                "slot_mask": _slot_window_mask(time_after, time_before),
             },
         )
-
         return _group_availability_rows_by_instructor(result)
 
     def get_buffered_availability_context(
         self, instructor_ids: List[str], dates: List[date]
     ) -> Dict[str, object]:
         """Load bitmap windows, bookings, and instructor buffers for Python-side refinement."""
-        if not instructor_ids or not dates:
-            return _empty_availability_context()
+        return load_buffered_availability_context(self.db, instructor_ids, dates)
 
-        availability_rows = _load_availability_day_rows(self.db, instructor_ids, dates)
-        bits_by_key, format_tags_by_key = _build_availability_maps(availability_rows)
-        booking_rows = _load_booking_rows(self.db, instructor_ids, dates)
-        bookings_by_key = _group_bookings_by_key(booking_rows)
-        profiles_by_instructor = _load_instructor_profiles(self.db, instructor_ids)
-        timezones_by_instructor = _load_instructor_timezones(self.db, instructor_ids)
+    def get_indexed_next_slots(
+        self,
+        instructor_ids: List[str],
+        *,
+        location_type: str,
+        duration_minutes: int,
+        through: date,
+    ) -> Dict[str, IndexedNextSlot]:
+        """
+        Read fresh rows from the next-available slot index.
 
-        return {
-            "bits_by_key": bits_by_key,
-            "format_tags_by_key": format_tags_by_key,
-            "bookings_by_key": bookings_by_key,
-            "profiles_by_instructor": profiles_by_instructor,
-            "timezones_by_instructor": timezones_by_instructor,
-        }
+        Instructors missing from the result have no trustworthy row. A slot without
+        ``next_date`` means nothing is bookable through ``through``.
+        """
+        if not instructor_ids:
+            return {}
+        if (
+            location_type not in NEXT_AVAILABILITY_LOCATION_TYPES
+            or duration_minutes not in NEXT_AVAILABILITY_DURATIONS
+        ):
+            return {}
+        now = datetime.now(timezone.utc)
+        return NextAvailabilityRepository(self.db).get_fresh_next_slots(
+            instructor_ids,
+            location_type=location_type,
+            duration_minutes=duration_minutes,
+            now=now,
+            fresh_after=now - timedelta(minutes=NEXT_AVAILABILITY_MAX_AGE_MINUTES),
+            through=through,
+        )
 
     # =========================================================================
     # Lesson Type Filtering (Online/In-Person)
@@ -12,6 +12,7 @@ from ...core.exceptions import RepositoryException
 from ...core.ulid_helper import generate_ulid
 from ...models.conversation import Conversation
 from ...models.message import MESSAGE_TYPE_SYSTEM_BOOKING_RESCHEDULED, Message, MessageNotification
+from ..conversation_read_state_repository import ConversationReadStateRepository
 from .mixin_base import MessageRepositoryMixinBase
 
 RESCHEDULE_DETECTION_WINDOW_MINUTES = 1
@@ -113,6 +114,9 @@ class MessageConversationQueriesMixin(MessageRepositoryMixinBase):
                 )
                 self.db.add(notification)
                 self.db.flush()
+                ConversationReadStateRepository(self.db).increment_unread(
+                    recipient_id, conversation_id
+                )
 
             self.logger.info(
                 "Created conversation message %s in conversation %s", message.id, conversation_id
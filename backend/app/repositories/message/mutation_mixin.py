@@ -9,7 +9,8 @@ from sqlalchemy.exc import IntegrityError
 
 from ...core.exceptions import NotFoundException, RepositoryException
 from ...models.conversation import Conversation
-from ...models.message import Message, MessageEdit, MessageReaction
+from ...models.message import Message, MessageEdit, MessageNotification, MessageReaction
+from ..conversation_read_state_repository import ConversationReadStateRepository
 from .mixin_base import MessageRepositoryMixinBase
 
 
@@ -62,6 +63,7 @@ class MessageMutationMixin(MessageRepositoryMixinBase):
             if not message:
                 return None
 
+            was_visible = not message.is_deleted and message.deleted_at is None
             message.is_deleted = True
             now = datetime.now(timezone.utc)
             message.deleted_at = now
@@ -84,6 +86,19 @@ class MessageMutationMixin(MessageRepositoryMixinBase):
                 str(message.conversation_id)
             )
             conversation.updated_at = now
+            if was_visible:
+                # Unread notifications of a deleted message no longer count as unread.
+                unread_recipients = (
+                    self.db.query(MessageNotification.user_id)
+                    .filter(
+                        MessageNotification.message_id == message_id,
+                        MessageNotification.is_read == False,
+                    )
+                    .all()
+                )
+                read_state = ConversationReadStateRepository(self.db)
+                for (recipient_id,) in unread_recipients:
+                    read_state.decrement_unread(recipient_id, str(message.conversation_id))
             self.db.flush()
             self.logger.info("Soft deleted message %s by user %s", message_id, user_id)
             return message
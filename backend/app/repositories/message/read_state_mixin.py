@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
-from sqlalchemy import and_, func, select, update
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import aliased, joinedload
 
 from ...core.exceptions import RepositoryException
 from ...models.message import Message, MessageNotification
+from ..conversation_read_state_repository import ConversationReadStateRepository
 from .mixin_base import MessageRepositoryMixinBase, _visible_message_filters
 from .types import AtomicMarkResult
 
@@ -65,32 +66,35 @@ class MessageReadStateMixin(MessageRepositoryMixinBase):
 
             flag_modified(message, "read_by")
 
-    def mark_messages_as_read(self, message_ids: List[str], user_id: str) -> int:
-        """Mark messages as read for a user."""
+    def mark_messages_as_read(
+        self, message_ids: List[str], user_id: str, *, write_read_by: bool = True
+    ) -> int:
+        """
+        Mark messages as read for a user.
+
+        Lowers the unread counters and advances the read watermark of every
+        conversation involved. ``write_read_by`` keeps the legacy per-message
+        ``read_by`` JSON in sync; it is off once receipts come from watermarks.
+        """
         try:
-            count = cast(
-                int,
-                (
-                    self.db.query(MessageNotification)
-                    .filter(
-                        and_(
-                            MessageNotification.message_id.in_(message_ids),
-                            MessageNotification.user_id == user_id,
-                            MessageNotification.is_read == False,
-                        )
-                    )
-                    .update(
-                        {
-                            MessageNotification.is_read: True,
-                            MessageNotification.read_at: datetime.now(timezone.utc),
-                        },
-                        synchronize_session=False,
-                    )
-                ),
-            )
+            read_at = datetime.now(timezone.utc)
+            rows = self.db.execute(
+                update(MessageNotification)
+                .where(
+                    MessageNotification.message_id.in_(message_ids),
+                    MessageNotification.user_id == user_id,
+                    MessageNotification.is_read == False,
+                )
+                .values(is_read=True, read_at=read_at)
+                .returning(MessageNotification.message_id)
+            ).fetchall()
+            marked_ids = [str(row.message_id) for row in rows]
+            count = len(marked_ids)
 
-            if count > 0:
-                self._update_message_read_by(message_ids, user_id)
+            if marked_ids:
+                self._apply_read_to_counters(marked_ids, user_id, read_at)
+                if write_read_by:
+                    self._update_message_read_by(marked_ids, user_id)
 
             self.logger.info("Marked %s messages as read for user %s", count, user_id)
             return count
@@ -99,10 +103,77 @@ class MessageReadStateMixin(MessageRepositoryMixinBase):
             self.logger.error("Error marking messages as read: %s", str(e))
             raise RepositoryException(f"Failed to mark messages as read: {str(e)}")
 
+    def _apply_read_to_counters(
+        self, message_ids: List[str], user_id: str, read_at: Optional[datetime]
+    ) -> None:
+        """Lower counters and advance watermarks per conversation for newly read messages."""
+        read_counts: Dict[str, int] = {}
+        rows = self.db.execute(
+            select(Message.conversation_id, Message.is_deleted, Message.deleted_at).where(
+                Message.id.in_(message_ids)
+            )
+        ).all()
+        for conversation_id, is_deleted, deleted_at in rows:
+            # Deleted messages were already taken off the counter when they were deleted.
+            visible = 0 if is_deleted or deleted_at is not None else 1
+            read_counts[str(conversation_id)] = read_counts.get(str(conversation_id), 0) + visible
+
+        read_state = ConversationReadStateRepository(self.db)
+        watermarks = self._read_watermarks(list(read_counts), user_id)
+        for conversation_id, count in read_counts.items():
+            read_state.record_read(
+                user_id,
+                conversation_id,
+                last_message_id=watermarks.get(conversation_id),
+                read_at=read_at,
+                read_count=count,
+            )
+
+    def _read_watermarks(self, conversation_ids: List[str], user_id: str) -> Dict[str, str]:
+        """
+        Newest message each conversation is read up to for ``user_id``.
+
+        A watermark stands for "everything at or below it is read", so it stops
+        below the user's oldest visible unread message; conversations with no
+        read message below that point are omitted.
+        """
+        unread_message = aliased(Message)
+        unread_notification = aliased(MessageNotification)
+        first_unread = (
+            select(func.min(unread_message.id))
+            .join(unread_notification, unread_notification.message_id == unread_message.id)
+            .where(
+                unread_message.conversation_id == Message.conversation_id,
+                unread_message.is_deleted == False,
+                unread_message.deleted_at.is_(None),
+                unread_notification.user_id == user_id,
+                unread_notification.is_read == False,
+            )
+            .scalar_subquery()
+        )
+        rows = self.db.execute(
+            select(Message.conversation_id, func.max(Message.id))
+            .join(MessageNotification, MessageNotification.message_id == Message.id)
+            .where(
+                Message.conversation_id.in_(conversation_ids),
+                MessageNotification.user_id == user_id,
+                MessageNotification.is_read == True,
+                or_(first_unread.is_(None), Message.id < first_unread),
+            )
+            .group_by(Message.conversation_id)
+        ).all()
+        return {str(conversation_id): str(message_id) for conversation_id, message_id in rows}
+
     def mark_unread_messages_read_atomic(
-        self, conversation_id: str, user_id: str
+        self, conversation_id: str, user_id: str, *, write_read_by: bool = True
     ) -> AtomicMarkResult:
-        """Atomically mark unread messages as read and return message IDs."""
+        """
+        Atomically mark unread messages as read and return message IDs.
+
+        Every visible message is read afterwards, so the conversation's unread
+        counter drops to zero and the watermark moves to the newest message the
+        user has read, including any read earlier out of order.
+        """
         try:
             visible_message_ids = select(Message.id).where(
                 *self._visible_message_filters(conversation_id)
@@ -123,7 +194,18 @@ class MessageReadStateMixin(MessageRepositoryMixinBase):
             rows = result.fetchall()
             message_ids = [str(row.message_id) for row in rows]
             timestamp = rows[0].read_at if rows else None
-            if message_ids:
+            ConversationReadStateRepository(self.db).record_read(
+                user_id,
+                conversation_id,
+                last_message_id=(
+                    self._read_watermarks([conversation_id], user_id).get(conversation_id)
+                    if message_ids
+                    else None
+                ),
+                read_at=timestamp,
+                clear=True,
+            )
+            if message_ids and write_read_by:
                 self._update_message_read_by(message_ids, user_id)
             return AtomicMarkResult(
                 rowcount=len(rows),
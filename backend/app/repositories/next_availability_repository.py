@@ -0,0 +1,146 @@
+"""Repository for the materialized next-available slot index."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Collection, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from sqlalchemy import and_, delete, exists, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.availability_day import AvailabilityDay
+from app.models.next_availability import InstructorNextAvailability
+
+from .base_repository import BaseRepository
+
+
+class IndexedNextSlot(NamedTuple):
+    """Earliest bookable start from one index row (both ``None`` when nothing is bookable)."""
+
+    next_date: Optional[date]
+    next_start_at: Optional[datetime]
+
+
+class NextAvailabilityRepository(BaseRepository[InstructorNextAvailability]):
+    """Data access for ``instructor_next_availability`` rows."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, InstructorNextAvailability)
+
+    def replace_for_instructor(self, instructor_id: str, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Swap every index row for an instructor with freshly computed ``rows``."""
+        self.db.execute(
+            delete(InstructorNextAvailability).where(
+                InstructorNextAvailability.instructor_id == instructor_id
+            )
+        )
+        if rows:
+            self.db.execute(
+                insert(InstructorNextAvailability),
+                [{**row, "instructor_id": instructor_id, "is_stale": False} for row in rows],
+            )
+        self.db.flush()
+        return len(rows)
+
+    def mark_stale(self, instructor_id: str) -> int:
+        """Flag an instructor's rows so readers fall back until the next refresh."""
+        result = self.db.execute(
+            update(InstructorNextAvailability)
+            .where(
+                InstructorNextAvailability.instructor_id == instructor_id,
+                InstructorNextAvailability.is_stale.is_(False),
+            )
+            .values(is_stale=True)
+        )
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    def get_fresh_next_slots(
+        self,
+        instructor_ids: Sequence[str],
+        *,
+        location_type: str,
+        duration_minutes: int,
+        now: datetime,
+        fresh_after: datetime,
+        through: date,
+    ) -> Dict[str, IndexedNextSlot]:
+        """
+        Return the indexed next slot for instructors whose row is trustworthy.
+
+        Instructors absent from the result have no usable row (missing, stale,
+        expired, or a horizon shorter than ``through``). A slot whose ``next_date``
+        is ``None`` means the index knows nothing is bookable through ``through``.
+        """
+        if not instructor_ids:
+            return {}
+        model = InstructorNextAvailability
+        rows = self.db.execute(
+            select(model.instructor_id, model.next_date, model.next_start_at).where(
+                model.instructor_id.in_(list(instructor_ids)),
+                model.location_type == location_type,
+                model.duration_minutes == duration_minutes,
+                model.is_stale.is_(False),
+                model.computed_at >= fresh_after,
+                or_(model.next_start_at.is_(None), model.next_start_at > now),
+                or_(model.next_date.is_not(None), model.horizon_end >= through),
+            )
+        ).all()
+        return {
+            str(row.instructor_id): IndexedNextSlot(row.next_date, row.next_start_at)
+            for row in rows
+        }
+
+    def list_instructor_ids_needing_refresh(
+        self,
+        *,
+        now: datetime,
+        fresh_after: datetime,
+        from_date: date,
+        limit: int,
+        exclude_ids: Collection[str] = (),
+    ) -> List[str]:
+        """
+        Instructors with stale/expired rows, then instructors with availability but no rows.
+
+        Stale instructors come back oldest ``computed_at`` first so a backlog larger
+        than ``limit`` drains in order instead of starving arbitrary instructors.
+        ``exclude_ids`` skips instructors already attempted by the current sweep.
+        """
+        excluded = list(exclude_ids)
+        model = InstructorNextAvailability
+        stale_ids = [
+            str(instructor_id)
+            for instructor_id in self.db.execute(
+                select(model.instructor_id)
+                .where(
+                    or_(
+                        model.is_stale.is_(True),
+                        model.computed_at < fresh_after,
+                        model.next_start_at <= now,
+                    ),
+                    model.instructor_id.not_in(excluded),
+                )
+                .group_by(model.instructor_id)
+                .order_by(func.min(model.computed_at), model.instructor_id)
+                .limit(limit)
+            ).scalars()
+        ]
+        remaining = limit - len(stale_ids)
+        if remaining <= 0:
+            return stale_ids
+        missing_ids = [
+            str(instructor_id)
+            for instructor_id in self.db.execute(
+                select(AvailabilityDay.instructor_id)
+                .where(
+                    and_(
+                        AvailabilityDay.day_date >= from_date,
+                        AvailabilityDay.instructor_id.not_in(excluded),
+                        ~exists().where(model.instructor_id == AvailabilityDay.instructor_id),
+                    )
+                )
+                .distinct()
+                .limit(remaining)
+            ).scalars()
+        ]
+        return stale_ids + missing_ids
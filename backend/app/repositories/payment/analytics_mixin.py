@@ -1,7 +1,7 @@
 """Payment analytics and reporting helpers."""
 
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 
 from sqlalchemy import and_, func
 from sqlalchemy.orm import joinedload
@@ -198,6 +198,58 @@ class PaymentAnalyticsMixin(PaymentRepositoryMixinBase):
             self.logger.error("Failed to get instructor payment history: %s", str(e))
             raise RepositoryException(f"Failed to get instructor payment history: {str(e)}")
 
+    def _earnings_export_query(
+        self,
+        instructor_id: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Any:
+        query = (
+            self.db.query(PaymentIntent)
+            .join(Booking, PaymentIntent.booking_id == Booking.id)
+            .options(
+                joinedload(PaymentIntent.booking).joinedload(Booking.student),
+                joinedload(PaymentIntent.booking).joinedload(Booking.instructor_service),
+            )
+            .filter(
+                PaymentIntent.status == "succeeded",
+                Booking.instructor_id == instructor_id,
+            )
+            .order_by(Booking.booking_date.desc(), PaymentIntent.created_at.desc())
+        )
+
+        if start_date:
+            query = query.filter(Booking.booking_date >= start_date)
+        if end_date:
+            query = query.filter(Booking.booking_date <= end_date)
+        return query
+
+    @staticmethod
+    def _earnings_export_row(payment: PaymentIntent) -> Optional[Dict[str, Any]]:
+        booking = payment.booking
+        if not booking:
+            return None
+
+        student = getattr(booking, "student", None)
+        student_name = None
+        if student:
+            last_initial = (student.last_name or "").strip()[:1]
+            student_name = (
+                f"{student.first_name} {last_initial}." if last_initial else student.first_name
+            )
+
+        return {
+            "lesson_date": booking.booking_date,
+            "student_name": student_name,
+            "service_name": booking.service_name,
+            "duration_minutes": booking.duration_minutes,
+            "hourly_rate": booking.hourly_rate,
+            "payment_amount_cents": payment.amount,
+            "application_fee_cents": payment.application_fee,
+            "status": payment.status,
+            "payment_id": payment.stripe_payment_intent_id,
+        }
+
     def get_instructor_earnings_for_export(
         self,
         instructor_id: str,
@@ -213,56 +265,37 @@ class PaymentAnalyticsMixin(PaymentRepositoryMixinBase):
             end_date: Optional booking end date filter
         """
         try:
-            query = (
-                self.db.query(PaymentIntent)
-                .join(Booking, PaymentIntent.booking_id == Booking.id)
-                .options(
-                    joinedload(PaymentIntent.booking).joinedload(Booking.student),
-                    joinedload(PaymentIntent.booking).joinedload(Booking.instructor_service),
-                )
-                .filter(
-                    PaymentIntent.status == "succeeded",
-                    Booking.instructor_id == instructor_id,
-                )
-                .order_by(Booking.booking_date.desc(), PaymentIntent.created_at.desc())
-            )
-
-            if start_date:
-                query = query.filter(Booking.booking_date >= start_date)
-            if end_date:
-                query = query.filter(Booking.booking_date <= end_date)
-
+            query = self._earnings_export_query(instructor_id, start_date, end_date)
             results: List[Dict[str, Any]] = []
             for payment in query.all():
-                booking = payment.booking
-                if not booking:
-                    continue
-
-                student = getattr(booking, "student", None)
-                student_name = None
-                if student:
-                    last_initial = (student.last_name or "").strip()[:1]
-                    student_name = (
-                        f"{student.first_name} {last_initial}."
-                        if last_initial
-                        else student.first_name
-                    )
-
-                results.append(
-                    {
-                        "lesson_date": booking.booking_date,
-                        "student_name": student_name,
-                        "service_name": booking.service_name,
-                        "duration_minutes": booking.duration_minutes,
-                        "hourly_rate": booking.hourly_rate,
-                        "payment_amount_cents": payment.amount,
-                        "application_fee_cents": payment.application_fee,
-                        "status": payment.status,
-                        "payment_id": payment.stripe_payment_intent_id,
-                    }
-                )
-
+                row = self._earnings_export_row(payment)
+                if row is not None:
+                    results.append(row)
             return results
         except Exception as e:
             self.logger.error("Failed to get instructor earnings export data: %s", str(e))
             raise RepositoryException(f"Failed to get instructor earnings export data: {str(e)}")
+
+    def iter_instructor_earnings_for_export(
+        self,
+        instructor_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        *,
+        batch_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream earnings export rows through a server-side cursor.
+
+        Same rows as ``get_instructor_earnings_for_export`` but fetched
+        ``batch_size`` at a time, so memory stays flat regardless of history length.
+        """
+        try:
+            query = self._earnings_export_query(instructor_id, start_date, end_date)
+            for payment in query.yield_per(batch_size):
+                row = self._earnings_export_row(payment)
+                if row is not None:
+                    yield row
+        except Exception as e:
+            self.logger.error("Failed to stream instructor earnings export data: %s", str(e))
+            raise RepositoryException(f"Failed to stream instructor earnings export data: {str(e)}")
@@ -15,7 +15,7 @@ import json
 import os
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -28,6 +28,82 @@ _GLOBAL_AVG_RATING_CACHED_AT: float = 0.0
 _GLOBAL_AVG_RATING_LOCK = threading.Lock()
 
 
+def _instructor_metrics_sql(where: str, review_scope: str = "") -> str:
+    """Instructor metrics query restricted by ``where`` on ``ip`` (reviews by ``review_scope``)."""
+    return f"""
+            SELECT
+                ip.user_id as instructor_id,
+                ip.last_active_at,
+                ip.response_rate,
+                ip.profile_completeness,
+                ip.is_founding_instructor,
+                -- Photo check from users table
+                u.profile_picture_key IS NOT NULL as has_photo,
+                -- Bio check (>= 100 chars)
+                LENGTH(COALESCE(ip.bio, '')) >= 100 as has_bio,
+                -- Background check passed
+                ip.bgc_status = 'passed' as has_background_check,
+                -- Identity verified
+                ip.identity_verified_at IS NOT NULL as has_identity_verified,
+                -- Aggregated review stats
+                COALESCE(rs.avg_rating, 0) as avg_rating,
+                COALESCE(rs.review_count, 0) as review_count
+            FROM instructor_profiles ip
+            JOIN users u ON u.id = ip.user_id
+            LEFT JOIN (
+                SELECT
+                    instructor_id,
+                    AVG(rating)::float as avg_rating,
+                    COUNT(*) as review_count
+                FROM reviews
+                WHERE status = 'published'
+                  {review_scope}
+                GROUP BY instructor_id
+            ) rs ON rs.instructor_id = ip.user_id
+            WHERE {where}
+        """
+
+
+def _metrics_from_row(row: Any) -> Dict[str, Any]:
+    return {
+        "avg_rating": float(row.avg_rating) if row.avg_rating else 0.0,
+        "review_count": int(row.review_count) if row.review_count else 0,
+        "last_active_at": row.last_active_at,
+        "response_rate": float(row.response_rate) if row.response_rate else 0.0,
+        "is_founding_instructor": bool(row.is_founding_instructor),
+        "has_photo": bool(row.has_photo),
+        "has_bio": bool(row.has_bio),
+        "has_background_check": bool(row.has_background_check),
+        "has_identity_verified": bool(row.has_identity_verified),
+        "profile_completeness": float(row.profile_completeness)
+        if row.profile_completeness
+        else 0.0,
+    }
+
+
+def _parse_skill_levels(filter_selections: Any) -> List[str]:
+    """Read ``filter_selections.skill_level``; empty or missing defaults to ["all"]."""
+    skill_levels: List[str] = []
+    selections: Dict[str, Any] = {}
+    if isinstance(filter_selections, dict):
+        selections = filter_selections
+    elif isinstance(filter_selections, str):
+        try:
+            decoded = json.loads(filter_selections)
+            if isinstance(decoded, dict):
+                selections = decoded
+        except Exception:
+            selections = {}
+
+    if selections:
+        raw_levels = selections.get("skill_level", [])
+        if isinstance(raw_levels, list):
+            skill_levels = [
+                str(level).strip().lower() for level in raw_levels if str(level).strip()
+            ]
+    return skill_levels or ["all"]
+
+
 class RankingRepository:
     """
     Repository for fetching instructor ranking signals.
@@ -64,62 +140,26 @@ class RankingRepository:
         if not instructor_ids:
             return {}
 
-        # Query with LEFT JOIN to reviews for aggregation
-        query = text(
-            """
-            SELECT
-                ip.user_id as instructor_id,
-                ip.last_active_at,
-                ip.response_rate,
-                ip.profile_completeness,
-                ip.is_founding_instructor,
-                -- Photo check from users table
-                u.profile_picture_key IS NOT NULL as has_photo,
-                -- Bio check (>= 100 chars)
-                LENGTH(COALESCE(ip.bio, '')) >= 100 as has_bio,
-                -- Background check passed
-                ip.bgc_status = 'passed' as has_background_check,
-                -- Identity verified
-                ip.identity_verified_at IS NOT NULL as has_identity_verified,
-                -- Aggregated review stats
-                COALESCE(rs.avg_rating, 0) as avg_rating,
-                COALESCE(rs.review_count, 0) as review_count
-            FROM instructor_profiles ip
-            JOIN users u ON u.id = ip.user_id
-            LEFT JOIN (
-                SELECT
-                    instructor_id,
-                    AVG(rating)::float as avg_rating,
-                    COUNT(*) as review_count
-                FROM reviews
-                WHERE status = 'published'
-                  AND instructor_id = ANY(:instructor_ids)
-                GROUP BY instructor_id
-            ) rs ON rs.instructor_id = ip.user_id
-            WHERE ip.user_id = ANY(:instructor_ids)
-        """
+        result = self.db.execute(
+            text(
+                _instructor_metrics_sql(
+                    "ip.user_id = ANY(:instructor_ids)",
+                    review_scope="AND instructor_id = ANY(:instructor_ids)",
+                )
+            ),
+            {"instructor_ids": instructor_ids},
         )
+        return {row.instructor_id: _metrics_from_row(row) for row in result}
 
-        result = self.db.execute(query, {"instructor_ids": instructor_ids})
+    def list_live_instructor_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch ranking metrics for every live instructor.
 
-        metrics: Dict[str, Dict[str, Any]] = {}
-        for row in result:
-            metrics[row.instructor_id] = {
-                "avg_rating": float(row.avg_rating) if row.avg_rating else 0.0,
-                "review_count": int(row.review_count) if row.review_count else 0,
-                "last_active_at": row.last_active_at,
-                "response_rate": float(row.response_rate) if row.response_rate else 0.0,
-                "is_founding_instructor": bool(row.is_founding_instructor),
-                "has_photo": bool(row.has_photo),
-                "has_bio": bool(row.has_bio),
-                "has_background_check": bool(row.has_background_check),
-                "has_identity_verified": bool(row.has_identity_verified),
-                "profile_completeness": float(row.profile_completeness)
-                if row.profile_completeness
-                else 0.0,
-            }
-
-        return metrics
+        Same shape as ``get_instructor_metrics``; used to build the in-process
+        ranking signal snapshot in a single query.
+        """
+        result = self.db.execute(text(_instructor_metrics_sql("ip.is_live = true")))
+        return {row.instructor_id: _metrics_from_row(row) for row in result}
 
     def get_global_average_rating(self) -> float:
         """
@@ -235,34 +275,42 @@ class RankingRepository:
         if not service_ids:
             return {}
 
-        skills: Dict[str, List[str]] = {}
         rows = (
             self.db.query(InstructorService.id, InstructorService.filter_selections)
             .filter(InstructorService.id.in_(service_ids))
             .all()
         )
-        for service_id, filter_selections in rows:
-            skill_levels: List[str] = []
-            selections: Dict[str, Any] = {}
-            if isinstance(filter_selections, dict):
-                selections = filter_selections
-            elif isinstance(filter_selections, str):
-                try:
-                    decoded = json.loads(filter_selections)
-                    if isinstance(decoded, dict):
-                        selections = decoded
-                except Exception:
-                    selections = {}
-
-            if selections:
-                raw_levels = selections.get("skill_level", [])
-                if isinstance(raw_levels, list):
-                    skill_levels = [
-                        str(level).strip().lower() for level in raw_levels if str(level).strip()
-                    ]
-            skills[str(service_id)] = skill_levels or ["all"]
-
-        return skills
+        return {
+            str(service_id): _parse_skill_levels(filter_selections)
+            for service_id, filter_selections in rows
+        }
+
+    def list_active_service_signals(self) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Get ``(audience, skill_levels)`` for every active instructor service.
+
+        Combines ``get_service_audience`` and ``get_service_skill_levels`` for the
+        in-process ranking signal snapshot.
+        """
+        query = text(
+            """
+            SELECT
+                id as service_id,
+                COALESCE(age_groups, ARRAY[]::text[]) as age_groups,
+                filter_selections
+            FROM instructor_services
+            WHERE is_active = true
+        """
+        )
+
+        signals: Dict[str, Tuple[str, List[str]]] = {}
+        for row in self.db.execute(query):
+            age_groups = list(row.age_groups) if row.age_groups else []
+            signals[str(row.service_id)] = (
+                self._classify_audience(age_groups),
+                _parse_skill_levels(row.filter_selections),
+            )
+        return signals
 
     def get_instructor_distances(
         self,
@@ -1,6 +1,6 @@
 """Candidate retrieval queries for the retriever repository."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 
 from sqlalchemy import text
 
@@ -89,6 +89,70 @@ class CandidateSearchMixin(RetrieverRepositoryMixinBase):
             for row in result
         ]
 
+    def services_for_catalogs(
+        self,
+        catalog_scores: Mapping[str, float],
+        limit: int = 30,
+    ) -> List[Dict[str, Any]]:
+        """
+        Hydrate bookable services for catalog entries ranked outside the database.
+
+        Used by the in-memory vector index: applies the same eligibility joins as
+        ``vector_search`` and returns rows in the same shape, scored with the
+        supplied per-catalog similarity and ordered best first.
+        """
+        if not catalog_scores or limit <= 0:
+            return []
+
+        query = text(
+            _price_cte_query(
+                """
+            SELECT
+                ins.id as instructor_service_id,
+                sc.id as catalog_id,
+                sc.name,
+                sc.description,
+                sps.min_hourly_rate,
+                ip.user_id as instructor_id,
+                ss.id as subcategory_id,
+                ss.name as subcategory_name,
+                scat.name as category_name
+            FROM service_catalog sc
+            JOIN service_subcategories ss ON ss.id = sc.subcategory_id
+            JOIN service_categories scat ON scat.id = ss.category_id
+            JOIN instructor_services ins ON ins.service_catalog_id = sc.id
+            JOIN service_price_summary sps ON sps.service_id = ins.id
+            JOIN instructor_profiles ip ON ip.id = ins.instructor_profile_id
+            WHERE sc.id = ANY(:catalog_ids)
+                AND sc.is_active = true
+                AND ins.is_active = true
+                AND ip.is_live = true
+                AND ip.bgc_status = 'passed'
+        """
+            )
+        )
+
+        result = self.db.execute(query, {"catalog_ids": list(catalog_scores)})
+
+        rows = [
+            {
+                "id": row.instructor_service_id,
+                "catalog_id": row.catalog_id,
+                "name": row.name,
+                "description": row.description,
+                "min_hourly_rate": float(row.min_hourly_rate),
+                "price_per_hour": float(row.min_hourly_rate),
+                "instructor_id": row.instructor_id,
+                "subcategory_id": row.subcategory_id,
+                "subcategory_name": row.subcategory_name,
+                "category_name": row.category_name,
+                "vector_score": float(catalog_scores[row.catalog_id]),
+            }
+            for row in result
+        ]
+        rows.sort(key=lambda row: row["vector_score"], reverse=True)
+        return rows[:limit]
+
     def text_search(
         self,
         corrected_query: str,
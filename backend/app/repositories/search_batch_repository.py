@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import math
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -102,7 +102,21 @@ class SearchBatchRepository:
         *,
         limit: int,
     ) -> Dict[str, Tuple[float, Dict[str, Any]]]:
-        rows = self._retriever_repo.vector_search(embedding, limit)
+        return self._vector_results(self._retriever_repo.vector_search(embedding, limit))
+
+    def services_for_catalogs(
+        self,
+        catalog_scores: Mapping[str, float],
+        *,
+        limit: int,
+    ) -> Dict[str, Tuple[float, Dict[str, Any]]]:
+        rows = self._retriever_repo.services_for_catalogs(catalog_scores, limit)
+        return self._vector_results(rows)
+
+    @staticmethod
+    def _vector_results(
+        rows: List[Dict[str, Any]],
+    ) -> Dict[str, Tuple[float, Dict[str, Any]]]:
         return {
             str(row["id"]): (
                 float(row["vector_score"]),
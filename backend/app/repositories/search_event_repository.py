@@ -8,7 +8,7 @@ Handles data access for individual search events used in analytics.
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Sequence, TypedDict, cast
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, insert, select, update
 from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
@@ -200,6 +200,63 @@ class SearchEventRepository(BaseRepository[SearchEvent]):
         self.db.flush()
         return len(objects)
 
+    def bulk_update_event_enrichment(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        Write derived analytics columns for many committed search events.
+
+        Used by: SearchHistoryService for write-behind enrichment. One bulk
+        UPDATE by primary key; rewriting the same values is harmless, so a batch
+        retried after a failed commit needs no special handling.
+
+        Args:
+            rows: Column dicts, each including the event ``id``
+
+        Returns:
+            Number of rows submitted
+        """
+        if not rows:
+            return 0
+
+        self.db.execute(update(SearchEvent), list(rows))
+        return len(rows)
+
+    def get_event_ids_with_candidates(self, search_event_ids: Sequence[str]) -> set[str]:
+        """
+        Get which of the given search events already have candidates stored.
+
+        Args:
+            search_event_ids: Search event ids to check
+
+        Returns:
+            Ids with at least one candidate row
+        """
+        if not search_event_ids:
+            return set()
+
+        rows = (
+            self.db.query(SearchEventCandidate.search_event_id)
+            .filter(SearchEventCandidate.search_event_id.in_(list(search_event_ids)))
+            .distinct()
+            .all()
+        )
+        return {str(row[0]) for row in rows}
+
+    def bulk_insert_candidate_rows(self, candidates: Sequence[Dict[str, Any]]) -> int:
+        """
+        Persist candidates for many search events in multi-row INSERT batches.
+
+        Args:
+            candidates: Candidate dicts including ``search_event_id``
+
+        Returns:
+            Number of rows inserted
+        """
+        if not candidates:
+            return 0
+
+        self.db.execute(insert(SearchEventCandidate), list(candidates))
+        return len(candidates)
+
     def get_popular_searches(self, limit: int = 10, days: int = 30) -> List[PopularSearch]:
         """
         Get popular search queries within a time period.
@@ -532,6 +589,40 @@ class SearchEventRepository(BaseRepository[SearchEvent]):
             query.order_by(SearchEvent.searched_at.desc()).first(),
         )
 
+    def get_first_search_times(
+        self,
+        user_ids: Sequence[str] = (),
+        guest_session_ids: Sequence[str] = (),
+    ) -> tuple[Dict[str, datetime], Dict[str, datetime]]:
+        """
+        Get the earliest search time per user and per guest session.
+
+        Batched form of ``get_previous_search_event`` for returning-user
+        detection over many events at once.
+
+        Returns:
+            (first search by user id, first search by guest session id)
+        """
+        by_user: Dict[str, datetime] = {}
+        by_guest: Dict[str, datetime] = {}
+        if user_ids:
+            rows = (
+                self.db.query(SearchEvent.user_id, func.min(SearchEvent.searched_at))
+                .filter(SearchEvent.user_id.in_(list(user_ids)))
+                .group_by(SearchEvent.user_id)
+                .all()
+            )
+            by_user = {str(user_id): first for user_id, first in rows}
+        if guest_session_ids:
+            rows = (
+                self.db.query(SearchEvent.guest_session_id, func.min(SearchEvent.searched_at))
+                .filter(SearchEvent.guest_session_id.in_(list(guest_session_ids)))
+                .group_by(SearchEvent.guest_session_id)
+                .all()
+            )
+            by_guest = {str(guest_id): first for guest_id, first in rows}
+        return by_user, by_guest
+
     def get_search_event_by_id(self, event_id: str) -> Optional[SearchEvent]:
         """
         Get search event by ID for validation.
@@ -1,6 +1,6 @@
 """Privacy/export helpers for search history data."""
 
-from typing import List, cast
+from typing import Iterator, List, cast
 
 from sqlalchemy import desc, func
 
@@ -24,6 +24,19 @@ class PrivacyMixin(SearchHistoryRepositoryMixinBase):
             List[SearchHistory], query.order_by(desc(SearchHistory.first_searched_at)).all()
         )
 
+    def iter_user_searches(
+        self, user_id: str, *, batch_size: int = 500, exclude_deleted: bool = True
+    ) -> Iterator[SearchHistory]:
+        """
+        Stream a user's searches through a server-side cursor, ``batch_size`` rows at a time.
+        """
+        query = self.db.query(SearchHistory).filter(SearchHistory.user_id == user_id)
+
+        if exclude_deleted:
+            query = query.filter(SearchHistory.deleted_at.is_(None))
+
+        yield from query.order_by(desc(SearchHistory.first_searched_at)).yield_per(batch_size)
+
     def delete_user_searches(self, user_id: str) -> int:
         """
         Delete all searches for a user (hard delete).
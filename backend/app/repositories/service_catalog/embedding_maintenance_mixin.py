@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import List, cast
+from typing import Any, List, Optional, Tuple, cast
 
 from sqlalchemy import or_
 
@@ -60,6 +60,34 @@ class EmbeddingMaintenanceMixin(ServiceCatalogRepositoryMixinBase):
         )
         return cast(List[ServiceCatalog], query.all())
 
+    def list_embedding_rows(
+        self, updated_since: Optional[datetime] = None
+    ) -> List[Tuple[str, Any, bool, Optional[datetime]]]:
+        """
+        Return ``(id, embedding_v2, is_active, updated_at)`` for catalog services.
+
+        Without ``updated_since`` only active, embedded services are returned (a full
+        index build). With it, every service touched at or after that time is returned,
+        including deactivated ones, so callers can drop them.
+        """
+        query = self.db.query(
+            ServiceCatalog.id,
+            ServiceCatalog.embedding_v2,
+            ServiceCatalog.is_active,
+            ServiceCatalog.updated_at,
+        )
+        if updated_since is None:
+            query = query.filter(
+                ServiceCatalog.is_active == True,
+                ServiceCatalog.embedding_v2 != None,
+            )
+        else:
+            query = query.filter(ServiceCatalog.updated_at >= updated_since)
+        return [
+            (str(row.id), row.embedding_v2, bool(row.is_active), row.updated_at)
+            for row in query.all()
+        ]
+
     def update_service_embedding(
         self,
         service_id: str,
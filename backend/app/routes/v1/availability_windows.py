@@ -101,6 +101,16 @@ def _set_bitmap_headers(
     response.headers["Access-Control-Expose-Headers"] = EXPOSE_HEADERS
 
 
+def _version_matches(if_none_match: Optional[str], version: str) -> bool:
+    """Match a week version against If-None-Match, quoted or bare, weak or strong."""
+    if not if_none_match:
+        return False
+    return any(
+        candidate.strip().removeprefix("W/").strip('"') == version
+        for candidate in if_none_match.split(",")
+    )
+
+
 logger = logging.getLogger(__name__)
 
 # v1 router - mounted under /api/v1/instructors/availability
@@ -128,11 +138,12 @@ def verify_instructor(current_user: User) -> User:
     },
 )
 def get_week_availability(
+    request: Request,
     response: Response,
     start_date: date = Query(..., description="Monday of the week"),
     current_user: User = Depends(get_current_active_user),
     availability_service: AvailabilityService = Depends(get_availability_service),
-) -> WeekBitmapResponse:
+) -> WeekBitmapResponse | Response:
     """
     Get availability for a specific week.
 
@@ -149,6 +160,10 @@ def get_week_availability(
         try:
             bitmaps_by_day = availability_service.get_week_bitmaps(current_user.id, start_date)
             version = availability_service.compute_week_version_bitmaps(bitmaps_by_day)
+            if _version_matches(request.headers.get("if-none-match"), version):
+                not_modified = Response(status_code=304)
+                _set_bitmap_headers(not_modified, version, None, allow_past=ALLOW_PAST)
+                return not_modified
             last_mod = availability_service.get_week_bitmap_last_modified(
                 current_user.id, start_date
             )
@@ -673,15 +673,15 @@ async def export_instructor_earnings(
 
     export_format = request.format
     if export_format == "pdf":
-        pdf_content = await asyncio.to_thread(
-            stripe_service.generate_earnings_pdf,
+        pdf_stream = await asyncio.to_thread(
+            stripe_service.stream_earnings_pdf,
             instructor_id=current_user.id,
             start_date=resolved_start,
             end_date=resolved_end,
         )
         filename = f"earnings_{resolved_start}_{resolved_end}.pdf"
         return StreamingResponse(
-            iter([pdf_content]),
+            pdf_stream,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -689,8 +689,9 @@ async def export_instructor_earnings(
             },
         )
 
-    csv_content = await asyncio.to_thread(
-        stripe_service.generate_earnings_csv,
+    # Rows are pulled from a server-side cursor as the response is written.
+    csv_stream = await asyncio.to_thread(
+        stripe_service.stream_earnings_csv,
         instructor_id=current_user.id,
         start_date=resolved_start,
         end_date=resolved_end,
@@ -698,7 +699,7 @@ async def export_instructor_earnings(
 
     filename = f"earnings_{resolved_start}_{resolved_end}.csv"
     return StreamingResponse(
-        iter([csv_content]),
+        csv_stream,
         media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
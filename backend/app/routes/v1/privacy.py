@@ -10,6 +10,7 @@ from collections.abc import Callable
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ...api.dependencies.services import get_auth_service, get_notification_service
@@ -306,6 +307,45 @@ async def export_my_data(
         )
 
 
+# openapi-exempt: file download (StreamingResponse) cannot have JSON response schema
+@router.get(
+    "/export/me/stream",
+    response_model=None,
+    dependencies=[Depends(rate_limit("read"))],
+)
+async def stream_my_data_export(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream all data for the current user as JSON lines (GDPR data portability).
+
+    Same content as ``/export/me`` with one record per line, suited to accounts
+    with long search and booking histories.
+    """
+    privacy_service = PrivacyService(db)
+
+    try:
+        export_stream = await asyncio.to_thread(
+            privacy_service.stream_user_data_export, current_user.id
+        )
+    except Exception as e:
+        logger.error("Error exporting user data: %s", str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export user data",
+        )
+
+    return StreamingResponse(
+        export_stream,
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": 'attachment; filename="data_export.jsonl"',
+            "Access-Control-Expose-Headers": "Content-Disposition",
+        },
+    )
+
+
 @router.post(
     "/delete/me",
     response_model=UserDataDeletionResponse,
@@ -45,7 +45,7 @@ from ...schemas.referrals import ReferralSendError, ReferralSendRequest, Referra
 from ...services import availability_service as availability_service_module
 from ...services.audit_service import AuditService
 from ...services.availability_service import AvailabilityService
-from ...services.cache_service import CacheService
+from ...services.cache_service import CacheKeyBuilder, CacheService
 from ...services.config_service import ConfigService
 from ...services.conflict_checker import ConflictChecker
 from ...services.email import EmailService
@@ -302,6 +302,119 @@ def _apply_min_advance_filter(
     )
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match check using the weak comparison RFC 9110 prescribes for GET."""
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def _content_etag(
+    instructor_id: str,
+    start_date: date,
+    end_date: date,
+    response_data: PublicInstructorAvailability,
+) -> str:
+    # Use model_dump_json with exclude_none to keep responses clean
+    response_json = response_data.model_dump_json(exclude_none=True)
+    etag_data = f"{instructor_id}:{start_date}:{end_date}:{response_json}"
+    etag_hash = hashlib.md5(etag_data.encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{etag_hash}"'  # Weak ETag as content may vary slightly
+
+
+def _not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"},
+    )
+
+
+# Field the availability input version is stored under inside the cached payload.
+_INPUT_VERSION_FIELD = "_input_version"
+
+
+async def _availability_input_version(
+    endpoint: str,
+    instructor_user: Any,
+    start_date: date,
+    end_date: date,
+    availability_service: AvailabilityService,
+    cache_service: Optional[CacheService],
+    *variant: object,
+) -> Optional[str]:
+    """
+    Version of the stored inputs behind a public availability response.
+
+    Combines the bitmap/blackout version of the range with the instructor's
+    availability cache generation (bumped by availability, booking and profile
+    changes) and the settings that shape the payload. This reads the database,
+    so the availability endpoint stores the result in its cached payload and
+    only calls here on a cache miss. Returns None when an input is unavailable.
+    """
+    if cache_service is None:
+        return None
+    instructor_id = instructor_user.id
+    try:
+        generation = await cache_service.get_generation(
+            CacheKeyBuilder.availability_scope(instructor_id)
+        )
+        if generation is None:
+            return None
+        range_version = await asyncio.to_thread(
+            availability_service.compute_range_version, instructor_id, start_date, end_date
+        )
+    except Exception as e:
+        logger.debug("Availability version unavailable for %s: %s", instructor_id, e)
+        return None
+
+    parts: List[object] = [
+        endpoint,
+        instructor_id,
+        start_date,
+        end_date,
+        generation,
+        range_version,
+        getattr(instructor_user, "timezone", None),
+        instructor_user.first_name,
+        instructor_user.last_name,
+        settings.public_availability_detail_level,
+        settings.public_availability_show_instructor_name,
+        *variant,
+    ]
+    return hashlib.sha1(
+        "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+def _request_stamp(availability_service: AvailabilityService) -> str:
+    """
+    Inputs that change without an input version change.
+
+    Booking rules are applied on every request and advance notice trimming moves
+    with the clock, so responses depend on the (in-process cached) rules version
+    and the current booking-step time slot.
+    """
+    _rules, rules_updated_at = ConfigService(availability_service.db).get_booking_rules_config()
+    time_slot = int(datetime.now(timezone.utc).timestamp()) // (BOOKING_START_STEP_MINUTES * 60)
+    return f"{rules_updated_at}|{time_slot}"
+
+
+def _stamped_etag(input_version: str, stamp: str) -> str:
+    digest = hashlib.sha1(f"{input_version}|{stamp}".encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def _version_etag(input_version: str, availability_service: AvailabilityService) -> str:
+    """Strong ETag from an input version plus the per-request stamp."""
+    return _stamped_etag(input_version, _request_stamp(availability_service))
+
+
 def get_availability_service(db: Session = Depends(get_db)) -> AvailabilityService:
     """Get availability service instance."""
     return AvailabilityService(db)
@@ -565,46 +678,62 @@ async def get_instructor_public_availability(
         f"{instructor_id}:{start_date}:{end_date}:{settings.public_availability_detail_level}:"
         f"{cache_location_type}"
     )
+    cached_result: Optional[Dict[str, Any]] = None
+    input_version: Optional[str] = None
     if cache_service:
         try:
-            cached_data = await cache_service.get(cache_key)
+            cached_data = await cache_service.get_versioned(
+                cache_key, CacheKeyBuilder.availability_scope(instructor_id)
+            )
             if cached_data:
-                logger.info("Cache hit for public availability: %s", cache_key)
-                cached_result = cast(Dict[str, Any], cached_data)
-                response_data = PublicInstructorAvailability(**cached_result)
-                if response_data.detail_level == "full" and response_data.availability_by_date:
-                    total_slots, earliest_date = _apply_public_booking_filters(
-                        availability_service,
-                        instructor_id,
-                        response_data.availability_by_date,
-                        location_type,
-                    )
-                    response_data.total_available_slots = total_slots
-                    response_data.earliest_available_date = earliest_date
-
-                # Generate ETag for cached response
-                response_json = response_data.model_dump_json(exclude_none=True)
-                etag_data = f"{instructor_id}:{start_date}:{end_date}:{response_json}"
-                etag_hash = hashlib.md5(etag_data.encode(), usedforsecurity=False).hexdigest()
-                etag = f'W/"{etag_hash}"'
-
-                # Check If-None-Match for 304 response
-                if_none_match = request.headers.get("If-None-Match")
-                if if_none_match and if_none_match == etag:
-                    return Response(
-                        status_code=status.HTTP_304_NOT_MODIFIED,
-                        headers={
-                            "ETag": etag,
-                            "Cache-Control": "public, max-age=120",
-                            "Vary": "Accept-Encoding",
-                        },
-                    )
+                cached_result = dict(cast(Dict[str, Any], cached_data))
+                cached_version = cached_result.pop(_INPUT_VERSION_FIELD, None)
+                input_version = cached_version if isinstance(cached_version, str) else None
+        except Exception as e:
+            logger.warning("Cache error: %s", e)
+
+    # Conditional GET: compare against the input version before any bitmap decode
+    # or availability computation. A cache hit carries the version with it.
+    if input_version is None:
+        input_version = await _availability_input_version(
+            "availability",
+            instructor_user,
+            start_date,
+            end_date,
+            availability_service,
+            cache_service,
+            location_type,
+        )
+    version_etag = _version_etag(input_version, availability_service) if input_version else None
+    if version_etag and _etag_matches(request, version_etag):
+        return _not_modified(version_etag, "public, max-age=60")
+
+    if cached_result is not None:
+        try:
+            logger.info("Cache hit for public availability: %s", cache_key)
+            response_data = PublicInstructorAvailability(**cached_result)
+            if response_data.detail_level == "full" and response_data.availability_by_date:
+                total_slots, earliest_date = _apply_public_booking_filters(
+                    availability_service,
+                    instructor_id,
+                    response_data.availability_by_date,
+                    location_type,
+                )
+                response_data.total_available_slots = total_slots
+                response_data.earliest_available_date = earliest_date
+
+            # Without an input version, fall back to an ETag over the cached response
+            etag = version_etag or _content_etag(instructor_id, start_date, end_date, response_data)
+
+            # Check If-None-Match for 304 response
+            if _etag_matches(request, etag):
+                return _not_modified(etag, "public, max-age=120")
 
-                # Return cached response (skip DB computation)
-                response_obj.headers["Cache-Control"] = "public, max-age=120"
-                response_obj.headers["ETag"] = etag
-                response_obj.headers["Vary"] = "Accept-Encoding"
-                return response_data
+            # Return cached response (skip DB computation)
+            response_obj.headers["Cache-Control"] = "public, max-age=120"
+            response_obj.headers["ETag"] = etag
+            response_obj.headers["Vary"] = "Accept-Encoding"
+            return response_data
         except Exception as e:
             logger.warning("Cache error: %s", e)
 
@@ -708,34 +837,24 @@ async def get_instructor_public_availability(
             detail="Failed to build availability response",
         )
 
-    # Use model_dump_json with exclude_none to keep responses clean
-    response_json = response_data.model_dump_json(exclude_none=True)
-
-    # Generate ETag based on response content
-    # Include instructor_id, date range, and response data in the hash
-    etag_data = f"{instructor_id}:{start_date}:{end_date}:{response_json}"
-    etag_hash = hashlib.md5(etag_data.encode(), usedforsecurity=False).hexdigest()
-    etag = f'W/"{etag_hash}"'  # Weak ETag as content may vary slightly
+    # Without an input version, fall back to an ETag over the response content
+    etag = version_etag or _content_etag(instructor_id, start_date, end_date, response_data)
 
     # Check If-None-Match header for conditional requests
-    if_none_match = request.headers.get("If-None-Match")
-    if if_none_match and if_none_match == etag:
-        return Response(
-            status_code=status.HTTP_304_NOT_MODIFIED,
-            headers={
-                "ETag": etag,
-                "Cache-Control": "public, max-age=60",
-                "Vary": "Accept-Encoding",
-            },
-        )
+    if _etag_matches(request, etag):
+        return _not_modified(etag, "public, max-age=60")
 
     # Cache the freshly computed response (we only reach here on cache miss)
     if cache_service:
         try:
             cache_source = response_data_raw or response_data
-            await cache_service.set(
+            cache_payload = cache_source.model_dump(exclude_none=True)
+            if input_version:
+                cache_payload[_INPUT_VERSION_FIELD] = input_version
+            await cache_service.set_versioned(
                 cache_key,
-                cache_source.model_dump(exclude_none=True),
+                CacheKeyBuilder.availability_scope(instructor_id),
+                cache_payload,
                 ttl=settings.public_availability_cache_ttl,
             )
         except Exception as e:
@@ -756,14 +875,15 @@ async def get_instructor_public_availability(
     description="Quick endpoint to find the next available booking slot",
 )
 async def get_next_available_slot(
+    request: Request,
     response_obj: Response,
     instructor_id: str = Path(..., description="Instructor ULID", pattern=ULID_PATH_PATTERN),
     duration_minutes: int = Query(60, description="Required duration in minutes"),
     availability_service: AvailabilityService = Depends(get_availability_service),
-    conflict_checker: ConflictChecker = Depends(get_conflict_checker),
     instructor_service: InstructorService = Depends(get_instructor_service),
+    cache_service: Optional[CacheService] = Depends(get_cache_service_dep),
     db: Session = Depends(get_db),
-) -> NextAvailableSlotResponse:
+) -> NextAvailableSlotResponse | Response:
     """
     Find the next available time slot for booking.
 
@@ -782,62 +902,112 @@ async def get_next_available_slot(
     # Search for next configured days using instructor's timezone
     search_days = settings.public_availability_days
     current_date = get_user_today(instructor_user)
-
-    for _ in range(search_days):
-        # Skip if blackout date
-        if await asyncio.to_thread(
-            conflict_checker.check_blackout_date, instructor_id, current_date
-        ):
-            current_date += timedelta(days=1)
-            continue
-
-        availability_map = await asyncio.to_thread(
-            availability_service.compute_public_availability,
-            instructor_id,
-            current_date,
-            current_date,
+    horizon_end = current_date + timedelta(days=search_days - 1)
+
+    # Polls are answered from the versioned cache entry, which carries its input
+    # version; the range version read and the horizon scan only run on a miss.
+    # The key includes the request stamp, so entries expire with the clock and
+    # booking rules.
+    cache_key: Optional[str] = None
+    stamp: Optional[str] = None
+    input_version: Optional[str] = None
+    cached_result: Optional[Dict[str, Any]] = None
+    if cache_service:
+        stamp = _request_stamp(availability_service)
+        stamp_digest = hashlib.sha1(stamp.encode(), usedforsecurity=False).hexdigest()[:16]
+        cache_key = (
+            f"public_next_available:{instructor_id}:{current_date}:{duration_minutes}:"
+            f"{stamp_digest}"
         )
-        slots = availability_map.get(current_date.isoformat(), [])
-
-        if slots:
-            # Find first slot that can accommodate the duration
-            for slot_start_time, slot_end_time in sorted(slots, key=lambda s: s[0]):
-                start_minute = time_to_minutes(slot_start_time, is_end_time=False)
-                end_minute = time_to_minutes(slot_end_time, is_end_time=True)
-                aligned_start_minute = AvailabilityService._first_aligned_start_in_window(
-                    start_minute,
-                    end_minute,
-                    duration_minutes=duration_minutes,
-                )
-                if aligned_start_minute is None:
-                    continue
-
-                aligned_start_time = AvailabilityService._minutes_to_time(aligned_start_minute)
-                end_time = (
-                    datetime.combine(  # tz-pattern-ok: time-only duration math
-                        date.min, aligned_start_time, tzinfo=timezone.utc
-                    )
-                    + timedelta(minutes=duration_minutes)
-                ).time()
-
-                # Set cache headers for successful results (2 minutes for next-available)
-                response_obj.headers["Cache-Control"] = "public, max-age=120"
-
-                return NextAvailableSlotResponse(
-                    found=True,
-                    date=current_date.isoformat(),
-                    start_time=aligned_start_time.strftime("%H:%M:%S"),
-                    end_time=end_time.strftime("%H:%M:%S"),
-                    duration_minutes=duration_minutes,
+        try:
+            cached_data = await cache_service.get_versioned(
+                cache_key, CacheKeyBuilder.availability_scope(instructor_id)
+            )
+            if cached_data:
+                cached_result = dict(cast(Dict[str, Any], cached_data))
+                cached_version = cached_result.pop(_INPUT_VERSION_FIELD, None)
+                input_version = cached_version if isinstance(cached_version, str) else None
+        except Exception as e:
+            logger.warning("Cache error: %s", e)
+        if input_version is None:
+            cached_result = None
+            input_version = await _availability_input_version(
+                "next-available",
+                instructor_user,
+                current_date,
+                horizon_end,
+                availability_service,
+                cache_service,
+                duration_minutes,
+            )
+    if input_version and stamp:
+        version_etag = _stamped_etag(input_version, stamp)
+        if _etag_matches(request, version_etag):
+            return _not_modified(version_etag, "public, max-age=60")
+        response_obj.headers["ETag"] = version_etag
+        response_obj.headers["Vary"] = "Accept-Encoding"
+
+    if cached_result is not None:
+        result = NextAvailableSlotResponse(**cached_result)
+    else:
+        result = await _find_next_available_slot(
+            availability_service, instructor_id, current_date, horizon_end, duration_minutes
+        )
+        if cache_service and cache_key and input_version:
+            try:
+                cache_payload = result.model_dump(exclude_none=True)
+                cache_payload[_INPUT_VERSION_FIELD] = input_version
+                await cache_service.set_versioned(
+                    cache_key,
+                    CacheKeyBuilder.availability_scope(instructor_id),
+                    cache_payload,
+                    ttl=BOOKING_START_STEP_MINUTES * 60,
                 )
+            except Exception as e:
+                logger.warning("Failed to cache next available slot: %s", e)
 
-        current_date += timedelta(days=1)
+    # Cache headers: 2 minutes for found slots, 1 minute for no availability
+    response_obj.headers["Cache-Control"] = (
+        "public, max-age=120" if result.found else "public, max-age=60"
+    )
+    return result
 
-    # Set cache headers for no-availability results (1 minute)
-    response_obj.headers["Cache-Control"] = "public, max-age=60"
 
+async def _find_next_available_slot(
+    availability_service: AvailabilityService,
+    instructor_id: str,
+    current_date: date,
+    horizon_end: date,
+    duration_minutes: int,
+) -> NextAvailableSlotResponse:
+    # One pass over the whole horizon (bitmaps, bookings and blackouts loaded once)
+    slot = await asyncio.to_thread(
+        availability_service.find_next_bookable_slot,
+        instructor_id,
+        current_date,
+        horizon_end,
+        duration_minutes,
+    )
+    if slot is None:
+        return NextAvailableSlotResponse(
+            found=False,
+            message=(
+                f"No available slots found in the next {settings.public_availability_days} days"
+            ),
+        )
+    slot_date, slot_start_time = slot
+    end_time = (
+        datetime.combine(  # tz-pattern-ok: time-only duration math
+            date.min, slot_start_time, tzinfo=timezone.utc
+        )
+        + timedelta(minutes=duration_minutes)
+    ).time()
     return NextAvailableSlotResponse(
-        found=False, message=f"No available slots found in the next {search_days} days"
+        found=True,
+        date=slot_date.isoformat(),
+        start_time=slot_start_time.strftime("%H:%M:%S"),
+        end_time=end_time.strftime("%H:%M:%S"),
+        duration_minutes=duration_minutes,
     )
 
 
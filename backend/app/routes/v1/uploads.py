@@ -215,9 +215,16 @@ def finalize_profile_picture(
     db: Session = Depends(get_db),
     asset_service: PersonalAssetService = Depends(get_personal_asset_service),
 ) -> SuccessResponse:
-    """Finalize a previously uploaded profile picture: validate, process, version, store."""
+    """Finalize a previously uploaded profile picture: validate, process, version, store.
+
+    When async processing is enabled the variants are produced by a Celery worker.
+    """
     try:
-        asset_service.finalize_profile_picture(current_user, payload.object_key)
+        outcome = asset_service.submit_profile_picture(current_user, payload.object_key)
+        if outcome == "queued":
+            return SuccessResponse(
+                success=True, message="Profile picture processing", data={"status": outcome}
+            )
         return SuccessResponse(success=True, message="Profile picture updated", data=None)
     except HTTPException:
         raise
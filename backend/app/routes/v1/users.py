@@ -47,7 +47,11 @@ def upload_finalize_profile_picture(
     asset_service: PersonalAssetService = Depends(get_personal_asset_service),
 ) -> SuccessResponse:
     try:
-        asset_service.finalize_profile_picture(current_user, payload.object_key)
+        outcome = asset_service.submit_profile_picture(current_user, payload.object_key)
+        if outcome == "queued":
+            return SuccessResponse(
+                success=True, message="Profile picture processing", data={"status": outcome}
+            )
         return SuccessResponse(success=True, message="Profile picture updated", data=None)
     except Exception as e:
         logger.error("Finalize profile picture failed: %s", e)
@@ -0,0 +1,86 @@
+# backend/app/services/analytics_rollup_service.py
+"""
+Incremental daily rollups for admin platform analytics.
+
+``PlatformAnalyticsService`` used to recompute dashboards from raw bookings,
+search events, payment events and availability bitmaps on every request. The
+periodic refresh task keeps per-day aggregates in the ``analytics_*_daily``
+tables instead:
+
+- A watermark records when the last refresh started. Each run looks for source
+  rows created or updated since then (less a small overlap for transactions that
+  committed late), recomputes every UTC day those rows touch, and upserts
+  availability slot counts for bitmaps saved since then.
+- Whole UTC days before the watermark's day are complete; readers combine them
+  with raw queries for the partial days at either end of a period.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..repositories.factory import RepositoryFactory
+from ..utils.bitset import popcount
+from .base import BaseService
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_NAME = "platform_daily"
+# Re-scan rows stamped shortly before the last watermark in case their
+# transaction committed after that refresh read its snapshot.
+WATERMARK_OVERLAP = timedelta(minutes=10)
+REBUILD_CHUNK_DAYS = 31
+
+
+def contiguous_day_ranges(
+    days: Iterable[date], max_days: int = REBUILD_CHUNK_DAYS
+) -> List[Tuple[date, date]]:
+    """Group days into half-open ``[start, end)`` runs of at most ``max_days``."""
+    ranges: List[Tuple[date, date]] = []
+    for day in sorted(set(days)):
+        if ranges and ranges[-1][1] == day and (day - ranges[-1][0]).days < max_days:
+            ranges[-1] = (ranges[-1][0], day + timedelta(days=1))
+        else:
+            ranges.append((day, day + timedelta(days=1)))
+    return ranges
+
+
+class AnalyticsRollupService(BaseService):
+    """Maintain the daily analytics rollups."""
+
+    def __init__(self, db: Session) -> None:
+        super().__init__(db)
+        self.rollup_repo = RepositoryFactory.create_analytics_rollup_repository(db)
+
+    @BaseService.measure_operation("analytics_rollup.refresh")
+    def refresh(self, *, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Fold source rows changed since the watermark into the rollups."""
+        now = now or datetime.now(timezone.utc)
+        watermark = self.rollup_repo.get_watermark(ROLLUP_NAME)
+        since: Optional[datetime]
+        if watermark is None:
+            since = None
+            first_day = now.date() - timedelta(days=settings.analytics_rollup_backfill_days)
+            days = {first_day + timedelta(days=n) for n in range((now.date() - first_day).days + 1)}
+        else:
+            since = watermark - WATERMARK_OVERLAP
+            days = self.rollup_repo.list_changed_days(since)
+
+        with self.transaction():
+            for start_day, end_day in contiguous_day_ranges(days):
+                self.rollup_repo.rebuild_days(start_day, end_day)
+            slots = [
+                (instructor_id, day, popcount(bits) if bits else 0)
+                for instructor_id, day, bits in self.rollup_repo.list_availability_changed_since(
+                    since
+                )
+            ]
+            self.rollup_repo.upsert_available_slots(slots)
+            self.rollup_repo.set_watermark(ROLLUP_NAME, now)
+
+        return {"days": len(days), "availability_days": len(slots)}
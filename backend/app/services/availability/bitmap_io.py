@@ -132,6 +132,31 @@ class AvailabilityBitmapIOMixin(AvailabilityMixinBase):
             )
         return hashlib.sha1(concat, usedforsecurity=False).hexdigest()
 
+    @BaseService.measure_operation("compute_range_version")
+    def compute_range_version(self, instructor_id: str, start_date: date, end_date: date) -> str:
+        """
+        Stable SHA1 of the stored bitmap rows and blackout dates for a date range.
+
+        Hashes raw ``bits``/``format_tags`` bytes as read from the table, so no
+        window is decoded. The range is widened by a day on each side because
+        windows crossing midnight make neighbouring days affect availability.
+        """
+        first_day = start_date - timedelta(days=1)
+        last_day = end_date + timedelta(days=1)
+        rows = self._bitmap_repo().get_days_in_range(instructor_id, first_day, last_day)
+        digest = hashlib.sha1(usedforsecurity=False)
+        for row in sorted(rows, key=lambda r: r.day_date):
+            digest.update(row.day_date.isoformat().encode())
+            digest.update(row.bits)
+            digest.update(row.format_tags or new_empty_tags())
+        blackout_days = sorted(
+            blackout.date
+            for blackout in self.repository.get_future_blackout_dates(instructor_id)
+            if first_day <= blackout.date <= last_day
+        )
+        digest.update(",".join(day.isoformat() for day in blackout_days).encode())
+        return digest.hexdigest()
+
     @BaseService.measure_operation("get_week_bitmap_last_modified")
     def get_week_bitmap_last_modified(
         self, instructor_id: str, week_start: date
@@ -459,6 +459,7 @@ class AvailabilityBitmapWriteMixin(AvailabilityMixinBase):
                 instructor_today=instructor_today,
                 clear_existing=clear_existing,
             )
+            self._mark_next_availability_stale(instructor_id)
         return self._finalize_bitmap_save_result(
             instructor_id=instructor_id,
             monday=monday,
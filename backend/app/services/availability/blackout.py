@@ -36,9 +36,11 @@ class AvailabilityBlackoutMixin(AvailabilityMixinBase):
 
         with self.transaction():
             try:
-                return self.repository.create_blackout_date(
+                blackout = self.repository.create_blackout_date(
                     instructor_id, blackout_data.date, blackout_data.reason
                 )
+                self._mark_next_availability_stale(instructor_id)
+                return blackout
             except RepositoryException as error:
                 if "already exists" in str(error):
                     raise ConflictException("Blackout date already exists")
@@ -52,6 +54,7 @@ class AvailabilityBlackoutMixin(AvailabilityMixinBase):
                 success = self.repository.delete_blackout_date(blackout_id, instructor_id)
                 if not success:
                     raise NotFoundException("Blackout date not found")
+                self._mark_next_availability_stale(instructor_id)
                 return True
             except RepositoryException as error:
                 logger.error("Error deleting blackout date: %s", error)
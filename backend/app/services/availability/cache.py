@@ -179,11 +179,9 @@ class AvailabilityCacheMixin(AvailabilityMixinBase):
         Invalidate caches for affected dates using enhanced cache service.
 
         Note: Ghost keys removed in v123 cleanup. The cache service's
-        invalidate_instructor_availability() handles all active patterns:
-        - avail:*:{instructor_id}:*
-        - week:*:{instructor_id}:*
-        - con:*:{instructor_id}:*
-        - public_availability:{instructor_id}:*
+        invalidate_instructor_availability() bumps the instructor's availability
+        generation (date-range, weekly, conflict and public_availability entries)
+        and deletes the affected avail:week keys.
         """
         if self.cache_service:
             try:
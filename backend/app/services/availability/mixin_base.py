@@ -44,6 +44,9 @@ class AvailabilityMixinBase(BaseService):
         def _bitmap_repo(self) -> AvailabilityDayRepository:
             ...
 
+        def _mark_next_availability_stale(self, instructor_id: str) -> None:
+            ...
+
         def get_week_bits(
             self,
             instructor_id: str,
@@ -11,8 +11,7 @@ from ...utils.bitset import (
     is_tag_compatible,
     new_empty_tags,
 )
-from ...utils.time_helpers import string_to_time
-from ...utils.time_utils import time_to_minutes
+from ...utils.time_utils import minutes_to_time, time_to_minutes
 from ..base import BaseService
 from ..config_service import is_instructor_travel_format, normalize_location_type
 from .mixin_base import AvailabilityMixinBase
@@ -307,17 +306,22 @@ class AvailabilityPublicMixin(AvailabilityMixinBase):
         tags_by_date: dict[date, bytes] = {}
         bitmap_repo = self._bitmap_repo()
         for day_row in bitmap_repo.get_days_in_range(instructor_id, start_date, end_date):
-            bits = day_row.bits
-            format_tags = day_row.format_tags or new_empty_tags()
-            tags_by_date[day_row.day_date] = format_tags
-            windows_str: list[tuple[str, str]] = availability_service_module().windows_from_bits(
-                bits
-            )
-            by_date[day_row.day_date] = [
-                (string_to_time(start_str), string_to_time(end_str))
-                for start_str, end_str in windows_str
-            ]
+            tags_by_date[day_row.day_date] = day_row.format_tags or new_empty_tags()
+            by_date[day_row.day_date] = self._decode_day_windows(day_row.bits)
+
+        bookings_by_date = self._load_bookings_by_date(instructor_id, start_date, end_date)
+        return by_date, tags_by_date, bookings_by_date
+
+    @staticmethod
+    def _decode_day_windows(bits: bytes) -> list[tuple[time, time]]:
+        return [
+            (minutes_to_time(start_min), minutes_to_time(end_min))
+            for start_min, end_min in availability_service_module().minute_windows_from_bits(bits)
+        ]
 
+    def _load_bookings_by_date(
+        self, instructor_id: str, start_date: date, end_date: date
+    ) -> dict[date, list[Any]]:
         bookings_by_date: dict[date, list[Any]] = {}
         for booking in self.conflict_repository.get_bookings_for_date_range(
             instructor_id,
@@ -325,7 +329,7 @@ class AvailabilityPublicMixin(AvailabilityMixinBase):
             end_date,
         ):
             bookings_by_date.setdefault(booking.booking_date, []).append(booking)
-        return by_date, tags_by_date, bookings_by_date
+        return bookings_by_date
 
     def _compute_day_available_windows(
         self,
@@ -400,22 +404,14 @@ class AvailabilityPublicMixin(AvailabilityMixinBase):
         earliest_allowed_minutes = time_to_minutes(earliest_allowed_local.time(), is_end_time=False)
         return earliest_allowed_date, earliest_allowed_minutes
 
-    @BaseService.measure_operation("compute_public_availability")
-    def compute_public_availability(
+    def _resolve_public_booking_constraints(
         self,
         instructor_id: str,
-        start_date: date,
-        end_date: date,
         *,
-        requested_location_type: str | None = None,
-        apply_min_advance: bool = True,
-    ) -> dict[str, list[tuple[time, time]]]:
-        """
-        Compute per-date availability intervals merged and with booked times subtracted.
-
-        Returns dict: { 'YYYY-MM-DD': [(start_time, end_time), ...] }
-        """
-        effective_requested_location_type = requested_location_type or "student_location"
+        requested_location_type: str,
+        apply_min_advance: bool,
+    ) -> tuple[int, int, Optional[date], Optional[int]]:
+        """Buffers and the advance-notice cutoff, read once per computation."""
         config_service = self.config_service
         if config_service is None:
             raise RuntimeError("Config service is required for public availability")
@@ -430,6 +426,39 @@ class AvailabilityPublicMixin(AvailabilityMixinBase):
             default_travel_buffer_minutes=default_travel_buffer_minutes,
         )
         earliest_allowed_date, earliest_allowed_minutes = self._resolve_earliest_allowed_booking(
+            instructor_id,
+            requested_location_type=requested_location_type,
+            apply_min_advance=apply_min_advance,
+        )
+        return (
+            non_travel_buffer_minutes,
+            travel_buffer_minutes,
+            earliest_allowed_date,
+            earliest_allowed_minutes,
+        )
+
+    @BaseService.measure_operation("compute_public_availability")
+    def compute_public_availability(
+        self,
+        instructor_id: str,
+        start_date: date,
+        end_date: date,
+        *,
+        requested_location_type: str | None = None,
+        apply_min_advance: bool = True,
+    ) -> dict[str, list[tuple[time, time]]]:
+        """
+        Compute per-date availability intervals merged and with booked times subtracted.
+
+        Returns dict: { 'YYYY-MM-DD': [(start_time, end_time), ...] }
+        """
+        effective_requested_location_type = requested_location_type or "student_location"
+        (
+            non_travel_buffer_minutes,
+            travel_buffer_minutes,
+            earliest_allowed_date,
+            earliest_allowed_minutes,
+        ) = self._resolve_public_booking_constraints(
             instructor_id,
             requested_location_type=effective_requested_location_type,
             apply_min_advance=apply_min_advance,
@@ -465,3 +494,77 @@ class AvailabilityPublicMixin(AvailabilityMixinBase):
             result[current_date.isoformat()] = remaining
             current_date += timedelta(days=1)
         return result
+
+    @BaseService.measure_operation("find_next_bookable_slot")
+    def find_next_bookable_slot(
+        self,
+        instructor_id: str,
+        start_date: date,
+        end_date: date,
+        duration_minutes: int,
+        *,
+        requested_location_type: str | None = None,
+        apply_min_advance: bool = True,
+    ) -> Optional[tuple[date, time]]:
+        """
+        Earliest aligned start between ``start_date`` and ``end_date`` that fits a lesson.
+
+        Windows match ``compute_public_availability`` (buffers, format tags and
+        advance notice) and blackout dates are skipped. The profile and config are
+        read once; bitmap rows, bookings and blackouts are each loaded with one
+        query for the whole horizon. Days are decoded in order and the scan stops
+        at the first fit.
+        """
+        effective_requested_location_type = requested_location_type or "student_location"
+        (
+            non_travel_buffer_minutes,
+            travel_buffer_minutes,
+            earliest_allowed_date,
+            earliest_allowed_minutes,
+        ) = self._resolve_public_booking_constraints(
+            instructor_id,
+            requested_location_type=effective_requested_location_type,
+            apply_min_advance=apply_min_advance,
+        )
+        if earliest_allowed_date is not None and earliest_allowed_date > start_date:
+            start_date = earliest_allowed_date
+        if start_date > end_date:
+            return None
+
+        day_rows = {
+            row.day_date: row
+            for row in self._bitmap_repo().get_days_in_range(instructor_id, start_date, end_date)
+        }
+        if not day_rows:
+            return None
+        bookings_by_date = self._load_bookings_by_date(instructor_id, start_date, end_date)
+        blackout_dates = {
+            blackout.date for blackout in self.repository.get_future_blackout_dates(instructor_id)
+        }
+
+        for current_date in sorted(day_rows):
+            if current_date in blackout_dates:
+                continue
+            row = day_rows[current_date]
+            remaining = self._compute_day_available_windows(
+                current_date=current_date,
+                by_date={current_date: self._decode_day_windows(row.bits)},
+                tags_by_date={current_date: row.format_tags or new_empty_tags()},
+                bookings_by_date=bookings_by_date,
+                requested_location_type=effective_requested_location_type,
+                non_travel_buffer_minutes=non_travel_buffer_minutes,
+                travel_buffer_minutes=travel_buffer_minutes,
+            )
+            if current_date == earliest_allowed_date and earliest_allowed_minutes is not None:
+                remaining = self._trim_windows_for_advance_notice(
+                    remaining, earliest_allowed_minutes
+                )
+            for window_start, window_end in sorted(remaining, key=lambda window: window[0]):
+                aligned_start = self._first_aligned_start_in_window(
+                    time_to_minutes(window_start, is_end_time=False),
+                    time_to_minutes(window_end, is_end_time=True),
+                    duration_minutes=duration_minutes,
+                )
+                if aligned_start is not None:
+                    return current_date, self._minutes_to_time(aligned_start)
+        return None
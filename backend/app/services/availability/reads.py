@@ -8,7 +8,8 @@ from typing import Any, Optional
 
 from ...monitoring.availability_perf import WEEK_GET_ENDPOINT, availability_perf_span
 from ...utils.bitset import new_empty_bits
-from ...utils.time_helpers import string_to_time, time_to_string
+from ...utils.time_helpers import time_to_string
+from ...utils.time_utils import minutes_to_time
 from ..base import BaseService
 from .mixin_base import AvailabilityMixinBase
 from .types import TimeSlotResponse, WeekAvailabilityResult, availability_service_module
@@ -63,20 +64,18 @@ class AvailabilityReadMixin(AvailabilityMixinBase):
             if bits is None:
                 return None
 
-            windows_str: list[tuple[str, str]] = availability_service_module().windows_from_bits(
-                bits
-            )
-            if not windows_str:
+            windows = availability_service_module().minute_windows_from_bits(bits)
+            if not windows:
                 return None
 
             result = {
                 "date": target_date.isoformat(),
                 "slots": [
                     TimeSlotResponse(
-                        start_time=time_to_string(string_to_time(start_str)),
-                        end_time=time_to_string(string_to_time(end_str)),
+                        start_time=time_to_string(minutes_to_time(start_min)),
+                        end_time=time_to_string(minutes_to_time(end_min)),
                     )
-                    for start_str, end_str in windows_str
+                    for start_min, end_min in windows
                 ],
             }
             if self.cache_service:
@@ -103,7 +102,7 @@ class AvailabilityReadMixin(AvailabilityMixinBase):
             result: dict[str, int] = {}
             for row in rows:
                 bits = row.bits or new_empty_bits()
-                windows = availability_service_module().windows_from_bits(bits)
+                windows = availability_service_module().minute_windows_from_bits(bits)
                 if windows:
                     result[row.day_date.isoformat()] = len(windows)
             return result
@@ -279,18 +278,18 @@ class AvailabilityReadMixin(AvailabilityMixinBase):
             current_date = start_date
             while current_date <= end_date:
                 bits = bits_by_date.get(current_date)
-                windows_str: list[tuple[str, str]] = (
-                    availability_service_module().windows_from_bits(bits) if bits else []
+                windows: list[tuple[int, int]] = (
+                    availability_service_module().minute_windows_from_bits(bits) if bits else []
                 )
                 result.append(
                     {
                         "date": current_date.isoformat(),
                         "slots": [
                             {
-                                "start_time": time_to_string(string_to_time(start_str)),
-                                "end_time": time_to_string(string_to_time(end_str)),
+                                "start_time": time_to_string(minutes_to_time(start_min)),
+                                "end_time": time_to_string(minutes_to_time(end_min)),
                             }
-                            for start_str, end_str in windows_str
+                            for start_min, end_min in windows
                         ],
                     }
                 )
@@ -369,15 +368,14 @@ class AvailabilityReadMixin(AvailabilityMixinBase):
         for current_date in sorted(bits_by_date):
             bits = bits_by_date[current_date]
             if bits:
-                day_windows_str: list[
-                    tuple[str, str]
-                ] = availability_service_module().windows_from_bits(bits)
-                for start_str, end_str in day_windows_str:
+                for start_min, end_min in availability_service_module().minute_windows_from_bits(
+                    bits
+                ):
                     windows.append(
                         {
                             "specific_date": current_date,
-                            "start_time": string_to_time(start_str),
-                            "end_time": string_to_time(end_str),
+                            "start_time": minutes_to_time(start_min),
+                            "end_time": minutes_to_time(end_min),
                         }
                     )
         return windows
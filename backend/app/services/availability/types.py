@@ -116,6 +116,7 @@ class AvailabilityServiceModuleProtocol(Protocol):
     get_user_today_by_id: Callable[..., date]
     invalidate_on_availability_change: Callable[..., None]
     windows_from_bits: Callable[..., list[tuple[str, str]]]
+    minute_windows_from_bits: Callable[..., list[tuple[int, int]]]
 
 
 __all__ = [
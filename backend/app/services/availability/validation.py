@@ -9,7 +9,7 @@ from ...core.exceptions import AvailabilityOverlapException, ConflictException
 from ...schemas.availability_window import SpecificDateAvailabilityCreate
 from ...utils.bitset import bits_from_windows
 from ...utils.time_helpers import string_to_time
-from ...utils.time_utils import time_to_minutes
+from ...utils.time_utils import minutes_to_time, time_to_minutes
 from ..base import BaseService
 from .mixin_base import AvailabilityMixinBase
 from .types import ProcessedSlot, availability_service_module
@@ -61,6 +61,7 @@ class AvailabilityValidationMixin(AvailabilityMixinBase):
                 new_bits = bits_from_windows([new_window_str])
 
             bitmap_repo.upsert_week(instructor_id, [(target_date, new_bits)])
+            self._mark_next_availability_stale(instructor_id)
 
         self._invalidate_availability_caches(instructor_id, [target_date])
         availability_service_module().invalidate_on_availability_change(instructor_id)
@@ -112,10 +113,13 @@ class AvailabilityValidationMixin(AvailabilityMixinBase):
             else:
                 bits = self._bitmap_repo().get_day_bits(instructor_id, target_date)
                 if bits:
-                    for start_str, end_str in availability_service_module().windows_from_bits(bits):
-                        start_obj = string_to_time(start_str)
-                        end_obj = time(0, 0) if end_str == "24:00:00" else string_to_time(end_str)
-                        existing_pairs.append((start_obj, end_obj))
+                    for (
+                        start_min,
+                        end_min,
+                    ) in availability_service_module().minute_windows_from_bits(bits):
+                        existing_pairs.append(
+                            (minutes_to_time(start_min), minutes_to_time(end_min))
+                        )
 
             existing_ranges = set(existing_pairs)
             filtered: list[ProcessedSlot] = []
@@ -11,7 +11,7 @@ from ..core.config import settings
 from ..core.timezone_utils import get_user_now_by_id, get_user_today_by_id
 from ..repositories.availability_day_repository import AvailabilityDayRepository
 from ..repositories.factory import RepositoryFactory
-from ..utils.bitset import windows_from_bits
+from ..utils.bitset import minute_windows_from_bits, windows_from_bits
 from .availability.audit_events import AvailabilityAuditEventsMixin
 from .availability.bitmap_io import AvailabilityBitmapIOMixin
 from .availability.bitmap_write import AvailabilityBitmapWriteMixin
@@ -39,6 +39,7 @@ from .availability.validation import AvailabilityValidationMixin
 from .availability.week_save import AvailabilityWeekSaveMixin
 from .base import BaseService
 from .config_service import ConfigService
+from .next_availability_refresh import schedule_next_availability_refresh
 from .search.cache_invalidation import invalidate_on_availability_change
 
 if TYPE_CHECKING:
@@ -46,6 +47,7 @@ if TYPE_CHECKING:
     from ..repositories.availability_repository import AvailabilityRepository
     from ..repositories.bulk_operation_repository import BulkOperationRepository
     from ..repositories.conflict_checker_repository import ConflictCheckerRepository
+    from ..repositories.next_availability_repository import NextAvailabilityRepository
     from .cache_service import CacheServiceSyncAdapter
 
 __all__ = [
@@ -69,6 +71,7 @@ __all__ = [
     "get_user_now_by_id",
     "get_user_today_by_id",
     "invalidate_on_availability_change",
+    "minute_windows_from_bits",
     "settings",
     "time",
     "timedelta",
@@ -123,6 +126,9 @@ class AvailabilityService(
         self.event_outbox_repository = RepositoryFactory.create_event_outbox_repository(db)
         self.booking_repository = RepositoryFactory.create_booking_repository(db)
         self.audit_repository = RepositoryFactory.create_audit_repository(db)
+        self._next_availability_repository = RepositoryFactory.create_next_availability_repository(
+            db
+        )
 
     @BaseService.measure_operation("bitmap_repo")
     def bitmap_repo(self) -> AvailabilityDayRepository:
@@ -134,3 +140,15 @@ class AvailabilityService(
 
     def _bitmap_repo(self) -> AvailabilityDayRepository:
         return self.bitmap_repo()
+
+    def _next_availability_repo(self) -> NextAvailabilityRepository:
+        repo = getattr(self, "_next_availability_repository", None)
+        if repo is None:
+            repo = RepositoryFactory.create_next_availability_repository(self.db)
+            self._next_availability_repository = repo
+        return cast("NextAvailabilityRepository", repo)
+
+    def _mark_next_availability_stale(self, instructor_id: str) -> None:
+        """Flag the instructor's next-available rows stale and refresh them after commit."""
+        self._next_availability_repo().mark_stale(instructor_id)
+        schedule_next_availability_refresh(self.db, instructor_id)
@@ -5,18 +5,20 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 import logging
-from typing import Any, ContextManager, Dict, Optional, Protocol, Set, cast
+from typing import Any, ContextManager, Dict, List, Optional, Protocol, Sequence, Set, cast
 
 from sqlalchemy.orm import Session
 
 from ..core.timezone_utils import get_user_timezone
 from ..models.badge import BadgeDefinition
 from ..notifications.policy import can_send_now, record_send
-from ..repositories.badge_repository import BadgeRepository
+from ..repositories.badge_repository import BadgeRepository, BulkAwardRow
 from ..repositories.factory import RepositoryFactory
 from ..services.cache_service import CacheService, CacheServiceSyncAdapter
 from ..services.notification_service import NotificationService
 from ..utils.streaks import compute_week_streak_local
+from .badge_batch_evaluation import backfill_outcomes, has_momentum_pair, is_eligible_from_facts
+from .badge_facts import StudentBadgeFacts, chunked, load_student_badge_facts
 
 logger = logging.getLogger(__name__)
 
@@ -177,10 +179,19 @@ class BadgeAwardService:
         confirmed = revoked = 0
         pending_rows = list(self.repository.get_pending_awards_due(now_utc))
 
+        # Eligibility inputs for every affected student are loaded up front in grouped
+        # queries instead of re-querying per award.
+        facts_by_student: Dict[str, StudentBadgeFacts] = {}
+        student_ids = list(dict.fromkeys(award.student_id for award, _ in pending_rows))
+        for chunk in chunked(student_ids):
+            facts_by_student.update(
+                load_student_badge_facts(self.repository, self.user_repository, chunk, now_utc)
+            )
+
         transactional_repo = cast(_TransactionalRepository, self.repository)
         with transactional_repo.transaction():
             for award, definition in pending_rows:
-                if self._is_student_currently_eligible(award.student_id, definition, now_utc):
+                if is_eligible_from_facts(facts_by_student[award.student_id], definition):
                     self.repository.mark_award_confirmed(award, confirmed_at=now_utc)
                     self._maybe_notify_badge_awarded(award.student_id, definition, now_utc)
                     confirmed += 1
@@ -592,6 +603,112 @@ class BadgeAwardService:
 
         return summary
 
+    def backfill_badges_for_students(
+        self,
+        student_ids: Sequence[str],
+        now_utc: datetime,
+        *,
+        quality_window_days: int = 90,
+        send_notifications: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Set-based ``backfill_user_badges`` for many students at once.
+
+        Inputs for the whole batch come from a fixed number of grouped queries,
+        criteria are evaluated in memory, and progress rows and awards are each
+        written with one statement. Returns the summed summary fields plus
+        ``processed_users``.
+        """
+
+        summary: Dict[str, Any] = {
+            "milestones": 0,
+            "streak": 0,
+            "explorer": 0,
+            "quality_pending": 0,
+            "skipped_existing": 0,
+            "processed_users": 0,
+            "dry_run": dry_run,
+        }
+        ids = list(dict.fromkeys(student_ids))
+        definitions = {
+            definition.slug: definition
+            for definition in self.repository.list_active_badge_definitions()
+        }
+        if not ids or not definitions:
+            return summary
+
+        window_days = int(quality_window_days or 0)
+        if window_days <= 0:
+            window_days = 90
+        window_start = now_utc - timedelta(days=window_days)
+        cancel_window_days = min(window_days, 60)
+
+        progress_rows: List[tuple[str, str, Dict[str, Any]]] = []
+        award_rows: List[BulkAwardRow] = []
+        for chunk in chunked(ids):
+            facts_by_student = load_student_badge_facts(
+                self.repository,
+                self.user_repository,
+                chunk,
+                now_utc,
+                review_since=window_start,
+                cancel_window_days=(cancel_window_days,),
+            )
+            for student_id in chunk:
+                facts = facts_by_student[student_id]
+                summary["processed_users"] += 1
+                for summary_field, definition, progress, award_snapshot in backfill_outcomes(
+                    definitions,
+                    facts,
+                    now_utc,
+                    milestone_slugs=self.MILESTONE_SLUGS,
+                    consistent_slug=self.CONSISTENT_SLUG,
+                    window_days=window_days,
+                    window_start=window_start,
+                    cancel_window_days=cancel_window_days,
+                ):
+                    if progress is not None:
+                        progress_rows.append((student_id, definition.id, progress))
+                    if award_snapshot is None:
+                        continue
+                    if definition.id in facts.active_award_badge_ids:
+                        summary["skipped_existing"] += 1
+                        continue
+                    summary[summary_field] += 1
+                    facts.active_award_badge_ids.add(definition.id)
+                    award_rows.append(
+                        BulkAwardRow(
+                            student_id=student_id,
+                            badge_id=definition.id,
+                            hold_hours=int((definition.criteria_config or {}).get("hold_hours", 0)),
+                            progress_snapshot=award_snapshot,
+                        )
+                    )
+
+        if dry_run:
+            return summary
+
+        for progress_chunk in chunked(progress_rows):
+            self.repository.bulk_upsert_progress(progress_chunk, now_utc=now_utc)
+        written: List[tuple[str, str]] = []
+        for award_chunk in chunked(award_rows):
+            written.extend(self.repository.bulk_insert_awards(award_chunk, now_utc=now_utc))
+        logger.info(
+            "Bulk badge backfill wrote %d progress rows and %d awards for %d students",
+            len(progress_rows),
+            len(written),
+            summary["processed_users"],
+        )
+
+        if send_notifications and written:
+            definitions_by_id = {definition.id: definition for definition in definitions.values()}
+            for student_id, badge_id in written:
+                definition = definitions_by_id[badge_id]
+                if int((definition.criteria_config or {}).get("hold_hours", 0)) <= 0:
+                    self._maybe_notify_badge_awarded(student_id, definition, now_utc)
+        return summary
+
     def _is_student_currently_eligible(
         self, student_id: str, definition: BadgeDefinition, now_utc: datetime
     ) -> bool:
@@ -776,42 +893,10 @@ class BadgeAwardService:
     def _is_momentum_criteria_currently_met(
         self, definition: BadgeDefinition, student_id: str
     ) -> bool:
-        criteria = definition.criteria_config or {}
-        window_days_to_book = int(criteria.get("window_days_to_book", 0) or 0)
-        window_days_to_complete = int(criteria.get("window_days_to_complete", 0) or 0)
-        require_same_instructor = bool(criteria.get("same_instructor_required"))
-
-        completed_lessons = self.repository.list_completed_lessons(student_id)
-        if len(completed_lessons) < 2:
-            return False
-
-        for i in range(1, len(completed_lessons)):
-            first = completed_lessons[i - 1]
-            second = completed_lessons[i]
-
-            first_completed_at = first["completed_at"]
-            second_completed_at = second["completed_at"]
-            booked_at = second["booked_at"] or second_completed_at
-
-            if require_same_instructor and first["instructor_id"] != second["instructor_id"]:
-                continue
-
-            if booked_at < first_completed_at:
-                continue
-
-            if window_days_to_book and booked_at - first_completed_at > timedelta(
-                days=window_days_to_book
-            ):
-                continue
-
-            if window_days_to_complete and second_completed_at - booked_at > timedelta(
-                days=window_days_to_complete
-            ):
-                continue
-
-            return True
-
-        return False
+        return has_momentum_pair(
+            self.repository.list_completed_lessons(student_id),
+            definition.criteria_config or {},
+        )
 
     def _is_top_student_eligible_now(
         self,
@@ -0,0 +1,239 @@
+# backend/app/services/badge_batch_evaluation.py
+"""
+Badge criteria evaluated in memory from preloaded ``StudentBadgeFacts``.
+
+``BadgeAwardService`` uses these for batch backfills and for confirming pending
+awards, so each criterion reads the facts instead of issuing per-student queries.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from ..models.badge import BadgeDefinition
+from .badge_facts import StudentBadgeFacts
+
+# (summary field, definition, progress JSON or None, award snapshot or None)
+BackfillOutcome = Tuple[str, BadgeDefinition, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def backfill_outcomes(
+    definitions: Dict[str, BadgeDefinition],
+    facts: StudentBadgeFacts,
+    now_utc: datetime,
+    *,
+    milestone_slugs: Sequence[str],
+    consistent_slug: str,
+    window_days: int,
+    window_start: datetime,
+    cancel_window_days: int,
+) -> Iterator[BackfillOutcome]:
+    """Outcomes for one student, in the order ``BadgeAwardService.backfill_user_badges`` uses."""
+
+    total_completed = facts.total_completed
+
+    for slug in milestone_slugs:
+        definition = definitions.get(slug)
+        if not definition:
+            continue
+        goal = int((definition.criteria_config or {}).get("goal", 0) or 0)
+        if goal <= 0:
+            continue
+        progress: Dict[str, Any] = {
+            "current": total_completed,
+            "goal": goal,
+            "percent": min(100, int((total_completed * 100) / goal)),
+        }
+        award: Optional[Dict[str, Any]] = (
+            {"current": total_completed, "goal": goal} if total_completed >= goal else None
+        )
+        yield "milestones", definition, progress, award
+
+    consistent_definition = definitions.get(consistent_slug)
+    if consistent_definition:
+        criteria = consistent_definition.criteria_config or {}
+        goal = int(criteria.get("goal", 0) or 3)
+        goal = goal if goal > 0 else 3
+        grace_days = int(criteria.get("grace_days", 1) or 1)
+        streak = facts.week_streak(now_utc, grace_days=grace_days)
+        progress = {
+            "current": streak,
+            "goal": goal,
+            "percent": min(100, int((min(streak, goal) / goal) * 100)),
+        }
+        award = (
+            {"streak": streak, "goal": goal, "grace_days": grace_days} if streak >= goal else None
+        )
+        yield "streak", consistent_definition, progress, award
+
+    explorer_definition = definitions.get("explorer")
+    if explorer_definition:
+        criteria = explorer_definition.criteria_config or {}
+        show_threshold = int(criteria.get("show_after_total_lessons", 0) or 0)
+        goal_categories = int(criteria.get("distinct_categories", 0) or 0)
+        min_avg_rating = float(criteria.get("min_overall_avg_rating", 0.0) or 0.0)
+        distinct_categories = facts.distinct_categories
+        has_rebook = facts.has_rebook
+        avg_rating = facts.review_stats["avg_rating"]
+
+        goal = goal_categories if goal_categories > 0 else max(distinct_categories, 1)
+        progress = {
+            "current": distinct_categories,
+            "goal": goal,
+            "percent": min(100, int((min(distinct_categories, goal) / goal) * 100)),
+            "has_rebook": has_rebook,
+            "avg_rating": round(avg_rating, 2),
+        }
+        award = None
+        if (
+            total_completed >= show_threshold
+            and (goal_categories <= 0 or distinct_categories >= goal_categories)
+            and has_rebook
+            and avg_rating >= min_avg_rating
+        ):
+            award = {
+                "distinct_categories": distinct_categories,
+                "has_rebook": has_rebook,
+                "avg_rating": round(avg_rating, 2),
+            }
+        yield "explorer", explorer_definition, progress, award
+
+    quality_definition = definitions.get("top_student")
+    if quality_definition:
+        criteria = quality_definition.criteria_config or {}
+        review_stats = facts.review_stats_since
+        cancel_rate = facts.cancel_rates.get(cancel_window_days, 0.0)
+        if top_student_criteria_met(
+            criteria,
+            total_completed=total_completed,
+            review_stats=review_stats,
+            cancel_rate=cancel_rate,
+            distinct_instructors=facts.distinct_instructors,
+            max_lessons_single=facts.max_lessons_single_instructor,
+        ):
+            quality_award: Dict[str, Any] = {
+                "window_start": window_start.isoformat(),
+                "review_count": review_stats["count"],
+                "avg_rating": round(review_stats["avg_rating"], 2),
+                "cancel_rate_pct": round(cancel_rate, 2),
+                "distinct_instructors": facts.distinct_instructors,
+                "max_lessons_single_instructor": facts.max_lessons_single_instructor,
+                "quality_window_days": window_days,
+            }
+            yield "quality_pending", quality_definition, None, quality_award
+
+
+def top_student_criteria_met(
+    criteria: Dict[str, Any],
+    *,
+    total_completed: int,
+    review_stats: Any,
+    cancel_rate: float,
+    distinct_instructors: int,
+    max_lessons_single: int,
+) -> bool:
+    if total_completed < int(criteria.get("min_total_lessons", 0) or 0):
+        return False
+    if review_stats["count"] < int(criteria.get("min_reviews", 0) or 0):
+        return False
+    if review_stats["avg_rating"] < float(criteria.get("min_avg_rating", 0.0) or 0.0):
+        return False
+    if cancel_rate > float(criteria.get("max_cancel_noshow_rate_pct_60d", 100.0) or 100.0):
+        return False
+    distinct_required = int(criteria.get("distinct_instructors_min", 0) or 0)
+    if distinct_required > 0 and distinct_instructors >= distinct_required:
+        return True
+    single_instructor_goal = int(criteria.get("or_single_instructor_min_lessons", 0) or 0)
+    return single_instructor_goal > 0 and max_lessons_single >= single_instructor_goal
+
+
+def is_eligible_from_facts(facts: StudentBadgeFacts, definition: BadgeDefinition) -> bool:
+    """In-memory counterpart of ``BadgeAwardService._is_student_currently_eligible``."""
+
+    criteria_type = (definition.criteria_type or "").lower()
+    criteria = definition.criteria_config or {}
+
+    if criteria_type == "milestone" and criteria.get("counts") == "completed_lessons":
+        goal = int(criteria.get("goal", 0))
+        return goal > 0 and facts.total_completed >= goal
+
+    if criteria_type == "velocity":
+        return has_momentum_pair(facts.completed_lessons, criteria)
+
+    if criteria_type == "quality":
+        return top_student_criteria_met(
+            criteria,
+            total_completed=facts.total_completed,
+            review_stats=facts.review_stats,
+            cancel_rate=facts.cancel_rates.get(60, 0.0),
+            distinct_instructors=facts.distinct_instructors,
+            max_lessons_single=facts.max_lessons_single_instructor,
+        )
+
+    if criteria_type == "exploration":
+        if facts.total_completed < int(criteria.get("show_after_total_lessons", 0) or 0):
+            return False
+        goal_categories = int(criteria.get("distinct_categories", 0) or 0)
+        if goal_categories and facts.distinct_categories < goal_categories:
+            return False
+        min_avg = float(criteria.get("min_overall_avg_rating", 0.0) or 0.0)
+        return facts.has_rebook and facts.review_stats["avg_rating"] >= min_avg
+
+    if criteria_type == "streak":
+        goal = int(criteria.get("goal", 0) or 0)
+        grace_days = int(criteria.get("grace_days", 1) or 1)
+        return goal > 0 and facts.week_streak(None, grace_days=grace_days) >= goal
+
+    # Default to True for badge types we do not re-evaluate yet.
+    return True
+
+
+def has_momentum_pair(
+    completed_lessons: Sequence[Dict[str, Any]], criteria: Dict[str, Any]
+) -> bool:
+    """True if two consecutive completed lessons satisfy the momentum windows."""
+
+    window_days_to_book = int(criteria.get("window_days_to_book", 0) or 0)
+    window_days_to_complete = int(criteria.get("window_days_to_complete", 0) or 0)
+    require_same_instructor = bool(criteria.get("same_instructor_required"))
+
+    if len(completed_lessons) < 2:
+        return False
+
+    for i in range(1, len(completed_lessons)):
+        first = completed_lessons[i - 1]
+        second = completed_lessons[i]
+
+        first_completed_at = first["completed_at"]
+        second_completed_at = second["completed_at"]
+        booked_at = second["booked_at"] or second_completed_at
+
+        if require_same_instructor and first["instructor_id"] != second["instructor_id"]:
+            continue
+
+        if booked_at < first_completed_at:
+            continue
+
+        if window_days_to_book and booked_at - first_completed_at > timedelta(
+            days=window_days_to_book
+        ):
+            continue
+
+        if window_days_to_complete and second_completed_at - booked_at > timedelta(
+            days=window_days_to_complete
+        ):
+            continue
+
+        return True
+
+    return False
+
+
+__all__ = [
+    "BackfillOutcome",
+    "backfill_outcomes",
+    "has_momentum_pair",
+    "is_eligible_from_facts",
+    "top_student_criteria_met",
+]
@@ -0,0 +1,157 @@
+# backend/app/services/badge_facts.py
+"""Per-student badge inputs loaded for many students with a fixed number of queries."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, TypeVar
+
+from ..core.timezone_utils import get_user_timezone
+from ..repositories.badge_repository import BadgeRepository, ReviewStats
+from ..repositories.user_repository import UserRepository
+from ..utils.streaks import compute_week_streak_local
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BADGE_BATCH_SIZE = 500
+
+
+def chunked(items: Iterable[T], size: int = BADGE_BATCH_SIZE) -> Iterator[List[T]]:
+    """Yield lists of at most ``size`` items, preserving order."""
+
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@dataclass
+class StudentBadgeFacts:
+    """Everything badge criteria need for one student, already loaded."""
+
+    student_id: str
+    completed_lessons: List[Dict[str, Any]] = field(default_factory=list)
+    category_counts: Dict[str, int] = field(default_factory=dict)
+    review_stats: ReviewStats = field(default_factory=lambda: ReviewStats(count=0, avg_rating=0.0))
+    review_stats_since: ReviewStats = field(
+        default_factory=lambda: ReviewStats(count=0, avg_rating=0.0)
+    )
+    cancel_rates: Dict[int, float] = field(default_factory=dict)
+    active_award_badge_ids: Set[str] = field(default_factory=set)
+    user_tz: Optional[tzinfo] = None
+
+    @property
+    def total_completed(self) -> int:
+        return len(self.completed_lessons)
+
+    @property
+    def distinct_instructors(self) -> int:
+        return len({lesson["instructor_id"] for lesson in self.completed_lessons})
+
+    @property
+    def max_lessons_single_instructor(self) -> int:
+        counts: Dict[str, int] = {}
+        for lesson in self.completed_lessons:
+            counts[lesson["instructor_id"]] = counts.get(lesson["instructor_id"], 0) + 1
+        return max(counts.values(), default=0)
+
+    @property
+    def distinct_categories(self) -> int:
+        return len(self.category_counts)
+
+    @property
+    def has_rebook(self) -> bool:
+        return any(count >= 2 for count in self.category_counts.values())
+
+    def week_streak(self, now_utc: Optional[datetime], *, grace_days: int) -> int:
+        """Weekly streak in the student's timezone; ``now_utc=None`` anchors on the last lesson."""
+
+        if self.user_tz is None or not self.completed_lessons:
+            return 0
+        completions_local = [
+            lesson["completed_at"].astimezone(self.user_tz) for lesson in self.completed_lessons
+        ]
+        anchor: datetime = now_utc or self.completed_lessons[-1]["completed_at"]
+        return compute_week_streak_local(
+            completions_local,
+            anchor.astimezone(self.user_tz),
+            grace_days=grace_days,
+        )
+
+
+def load_student_badge_facts(
+    repository: BadgeRepository,
+    user_repository: UserRepository,
+    student_ids: Sequence[str],
+    now_utc: datetime,
+    *,
+    review_since: Optional[datetime] = None,
+    cancel_window_days: Iterable[int] = (60,),
+) -> Dict[str, StudentBadgeFacts]:
+    """
+    Load ``StudentBadgeFacts`` for ``student_ids``.
+
+    Uses one grouped query per input (awards, completed lessons, categories,
+    reviews, cancel rates, users) regardless of how many students are passed.
+    """
+
+    ids = list(dict.fromkeys(student_ids))
+    if not ids:
+        return {}
+
+    awards = repository.list_badge_awards_for_students(ids)
+    lessons = repository.list_completed_lessons_for_students(ids)
+    categories = repository.count_completed_lessons_by_category_for_students(ids)
+    reviews = repository.get_review_stats_for_students(ids)
+    reviews_since = (
+        repository.get_review_stats_for_students(ids, since_utc=review_since)
+        if review_since is not None
+        else {}
+    )
+    cancel_rates = {
+        window: repository.get_cancel_noshow_rates_for_students(ids, now_utc, window)
+        for window in set(cancel_window_days)
+    }
+    timezones: Dict[str, Optional[tzinfo]] = {}
+    for user in user_repository.get_by_ids(ids):
+        try:
+            timezones[user.id] = get_user_timezone(user)
+        except Exception as exc:
+            logger.debug("Skipping streak timezone for %s: %s", user.id, exc)
+            timezones[user.id] = None
+
+    facts: Dict[str, StudentBadgeFacts] = {}
+    for student_id in ids:
+        facts[student_id] = StudentBadgeFacts(
+            student_id=student_id,
+            completed_lessons=lessons.get(student_id, []),
+            category_counts=categories.get(student_id, {}),
+            review_stats=reviews.get(student_id, ReviewStats(count=0, avg_rating=0.0)),
+            review_stats_since=reviews_since.get(student_id, ReviewStats(count=0, avg_rating=0.0)),
+            cancel_rates={
+                window: rates.get(student_id, 0.0) for window, rates in cancel_rates.items()
+            },
+            active_award_badge_ids={
+                row["badge_id"]
+                for row in awards.get(student_id, [])
+                if row.get("badge_id") and row.get("status") in {"pending", "confirmed"}
+            },
+            user_tz=timezones.get(student_id),
+        )
+    return facts
+
+
+__all__ = [
+    "BADGE_BATCH_SIZE",
+    "StudentBadgeFacts",
+    "chunked",
+    "load_student_badge_facts",
+]
@@ -10,7 +10,6 @@ from ...models.booking import Booking
 from ...models.instructor import InstructorProfile
 from ...repositories.availability_day_repository import AvailabilityDayRepository
 from ...utils.bitset import get_slot_tag, is_tag_compatible, new_empty_tags
-from ...utils.time_helpers import string_to_time
 from ...utils.time_utils import time_to_minutes
 from ..base import BaseService
 from ..config_service import normalize_location_type
@@ -46,14 +45,6 @@ class BookingAvailabilityOpportunitiesMixin:
             return time(0, 0)
         return time(value // 60, value % 60)
 
-    @staticmethod
-    def _bitmap_str_to_minutes(value: str, *, is_end_time: bool = False) -> int:
-        """Convert bitmap strings (e.g., '24:00:00') into minute offsets."""
-        if value.startswith("24:"):
-            is_end_time = True
-        minutes: int = time_to_minutes(string_to_time(value), is_end_time=is_end_time)
-        return minutes
-
     @staticmethod
     def _booking_window_to_minutes(booking: Booking) -> tuple[int, int]:
         """Convert a booking's start/end times into minute offsets."""
@@ -203,20 +194,17 @@ class BookingAvailabilityOpportunitiesMixin:
         latest_time: time,
     ) -> List[dict[str, Any]]:
         """Get instructor availability windows for a date from bitmap storage."""
-        from ...utils.bitset import windows_from_bits
+        from ...utils.bitset import minute_windows_from_bits
 
         repo = AvailabilityDayRepository(self.db)
         bits = repo.get_day_bits(instructor_id, target_date)
         if not bits:
             return []
 
-        windows_str: list[tuple[str, str]] = windows_from_bits(bits)
         earliest_minutes = self._time_to_minutes(earliest_time, is_end_time=False)
         latest_minutes = self._time_to_minutes(latest_time, is_end_time=True)
         result: list[dict[str, Any]] = []
-        for start_str, end_str in windows_str:
-            start_minutes = self._bitmap_str_to_minutes(start_str, is_end_time=False)
-            end_minutes = self._bitmap_str_to_minutes(end_str, is_end_time=True)
+        for start_minutes, end_minutes in minute_windows_from_bits(bits):
             if end_minutes <= earliest_minutes or start_minutes >= latest_minutes:
                 continue
             result.append(
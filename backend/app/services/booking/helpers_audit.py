@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import logging
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ContextManager, Optional
 
 from ...models.audit_log import AuditLog
 from ...models.booking import Booking, BookingStatus
 from ...models.user import User
 from ..audit_redaction import redact
 from ..base import BaseService
+from ..next_availability_refresh import mark_next_availability_stale
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -38,6 +39,9 @@ class BookingAuditCacheMixin:
         audit_repository: AuditRepository
         cache_service: Optional[CacheServiceSyncAdapter]
 
+        def transaction(self) -> ContextManager[None]:
+            ...
+
         def _resolve_actor_payload(
             self,
             actor: Any | None,
@@ -205,6 +209,14 @@ class BookingAuditCacheMixin:
 
         self._invalidate_booking_caches(target_booking)
 
+    def _mark_next_availability_stale(self, instructor_id: str) -> None:
+        """Flag the instructor's next-available index rows and refresh them after commit."""
+        try:
+            with self.transaction():
+                mark_next_availability_stale(self.db, instructor_id)
+        except Exception as stale_error:
+            logger.warning("Failed to mark next-availability index stale: %s", stale_error)
+
     def _invalidate_booking_caches(self, booking: Booking) -> None:
         """
         Invalidate caches affected by booking changes using enhanced cache service.
@@ -215,6 +227,7 @@ class BookingAuditCacheMixin:
         - BookingRepository cached methods via delete_pattern
         """
         booking_service_module = _booking_service_module()
+        self._mark_next_availability_stale(str(booking.instructor_id))
         if self.cache_service:
             try:
                 self.cache_service.invalidate_instructor_availability(
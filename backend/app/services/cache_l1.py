@@ -0,0 +1,201 @@
+# backend/app/services/cache_l1.py
+"""
+Per-worker L1 cache in front of the shared Redis (L2) cache.
+
+Hot, rarely changing keys (catalog listings, parsed search queries) are kept in a
+bounded LRU with a short TTL inside each worker process so repeat reads skip the
+Redis round trip. Only keys matching ``settings.cache_l1_prefixes`` are eligible.
+
+Consistency across gunicorn workers and Celery processes:
+- Every CacheService write/delete of an eligible key publishes an invalidation on
+  ``L1_INVALIDATION_CHANNEL`` using the plain Redis client, so any process can publish.
+- API workers subscribe through the shared Broadcaster (``app.core.broadcast``) and
+  evict matching entries. Messages from the same worker are ignored; the writer has
+  already evicted locally.
+- The L1 only serves reads while that subscription is live. Processes without a
+  listener (Celery, scripts, tests) always read through to Redis, and a dropped
+  subscription clears the tier.
+- The L1 TTL bounds staleness if an invalidation message is lost.
+
+Keys mutated with raw Redis commands (e.g. ``INCR`` on the search version key) bypass
+these hooks and must not be listed as L1 prefixes.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+import json
+import logging
+import threading
+import time
+from typing import Any, Iterable, Optional, Tuple
+import uuid
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+L1_INVALIDATION_CHANNEL = "cache:l1:invalidate"
+
+# Identifies this worker process so it can skip its own invalidation messages.
+WORKER_ORIGIN = uuid.uuid4().hex
+
+_WILDCARD_CHARS = "*?["
+
+
+class L1Cache:
+    """Thread-safe bounded LRU whose entries expire ``ttl_seconds`` after being stored."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, prefixes: Iterable[str]):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.prefixes: Tuple[str, ...] = tuple(p for p in prefixes if p)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every eviction so a read that raced an invalidation is not cached.
+        self.version = 0
+        # Set by the invalidation listener; reads are only served while it is live.
+        self.listening = False
+
+    @property
+    def active(self) -> bool:
+        return self.listening and self.ttl_seconds > 0 and bool(self.prefixes)
+
+    def is_eligible(self, key: str) -> bool:
+        return key.startswith(self.prefixes)
+
+    def may_match_pattern(self, pattern: str) -> bool:
+        """Return True when a glob pattern could match an eligible key."""
+        literal = pattern
+        for index, char in enumerate(pattern):
+            if char in _WILDCARD_CHARS:
+                literal = pattern[:index]
+                break
+        return any(
+            prefix.startswith(literal) or literal.startswith(prefix) for prefix in self.prefixes
+        )
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(hit, value)``; expired entries are dropped and count as misses."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, *, if_version: Optional[int] = None) -> None:
+        """Store ``value``; skipped when ``if_version`` no longer matches ``version``."""
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if if_version is not None and if_version != self.version:
+                return
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            self.version += 1
+            return self._entries.pop(key, None) is not None
+
+    def delete_pattern(self, pattern: str) -> int:
+        with self._lock:
+            self.version += 1
+            doomed = [key for key in self._entries if fnmatchcase(key, pattern)]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _parse_prefixes(raw: str) -> Tuple[str, ...]:
+    return tuple(token.strip() for token in (raw or "").split(",") if token.strip())
+
+
+_l1_cache: Optional[L1Cache] = None
+_l1_lock = threading.Lock()
+
+
+def get_l1_cache() -> Optional[L1Cache]:
+    """Return the process-wide L1 cache, or None when disabled in settings."""
+    global _l1_cache
+    if not getattr(settings, "cache_l1_enabled", False):
+        return None
+    if _l1_cache is None:
+        with _l1_lock:
+            if _l1_cache is None:
+                _l1_cache = L1Cache(
+                    max_entries=settings.cache_l1_max_entries,
+                    ttl_seconds=settings.cache_l1_ttl_seconds,
+                    prefixes=_parse_prefixes(settings.cache_l1_prefixes),
+                )
+    return _l1_cache
+
+
+def build_invalidation_message(*, keys: Iterable[str] = (), patterns: Iterable[str] = ()) -> str:
+    return json.dumps({"origin": WORKER_ORIGIN, "keys": list(keys), "patterns": list(patterns)})
+
+
+def apply_invalidation_message(raw: Any, l1: Optional[L1Cache] = None) -> int:
+    """Evict entries named by an invalidation message from another worker."""
+    cache = l1 or get_l1_cache()
+    if cache is None:
+        return 0
+    try:
+        payload = json.loads(raw)
+    except (TypeError, ValueError):
+        logger.warning("[CACHE-L1] Ignoring malformed invalidation message: %r", raw)
+        return 0
+    if not isinstance(payload, dict) or payload.get("origin") == WORKER_ORIGIN:
+        return 0
+
+    evicted = 0
+    for key in payload.get("keys") or ():
+        evicted += int(cache.delete(str(key)))
+    for pattern in payload.get("patterns") or ():
+        evicted += cache.delete_pattern(str(pattern))
+    return evicted
+
+
+async def run_invalidation_listener() -> None:
+    """
+    Subscribe to L1 invalidations through the shared Broadcaster until disconnect.
+
+    The L1 serves reads only while this coroutine is subscribed; on exit the tier is
+    disabled and cleared because invalidations may have been missed.
+    """
+    from ..core.broadcast import get_broadcast
+
+    l1 = get_l1_cache()
+    if l1 is None:
+        return
+
+    try:
+        async with get_broadcast().subscribe(channel=L1_INVALIDATION_CHANNEL) as subscriber:
+            l1.clear()
+            l1.listening = True
+            logger.info("[CACHE-L1] Listening for invalidations on %s", L1_INVALIDATION_CHANNEL)
+            async for event in subscriber:
+                apply_invalidation_message(event.message, l1)
+    except Exception as exc:
+        logger.warning("[CACHE-L1] Invalidation listener stopped: %s", exc)
+    finally:
+        l1.listening = False
+        l1.clear()
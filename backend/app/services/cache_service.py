@@ -30,6 +30,8 @@ from typing import (
     List,
     Optional,
     ParamSpec,
+    Sequence,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -43,11 +45,15 @@ from sqlalchemy.orm import Session
 from app.middleware.perf_counters import (
     note_cache_hit,
     note_cache_miss,
+    note_cache_tier,
     record_cache_key,
 )
 
+from ..core.config import settings
 from ..database import get_db
+from ..monitoring.prometheus_metrics import PrometheusMetrics
 from .base import BaseService
+from .cache_l1 import L1_INVALIDATION_CHANNEL, L1Cache, build_invalidation_message, get_l1_cache
 
 logger = logging.getLogger(__name__)
 
@@ -203,6 +209,11 @@ class CacheKeyBuilder:
 
         return ":".join(formatted_parts)
 
+    @staticmethod
+    def availability_scope(instructor_id: Union[int, str]) -> str:
+        """Generation scope for an instructor's versioned availability entries."""
+        return CacheKeyBuilder.build("availability", instructor_id)
+
     @staticmethod
     def hash_complex_key(data: Dict[str, Any]) -> str:
         """Generate a hash for complex cache keys."""
@@ -261,6 +272,9 @@ class CacheService(BaseService):
         # Redis connection (async, shared pool via app.core.cache_redis)
         self.redis: Optional[Redis] = redis_client
 
+        # Per-worker L1 tier in front of Redis for hot keys (see cache_l1)
+        self.l1: Optional[L1Cache] = get_l1_cache()
+
         # Initialize statistics
         self._stats: Dict[str, int] = self._initialize_stats()
 
@@ -308,21 +322,79 @@ class CacheService(BaseService):
             "availability_hits": 0,
             "availability_misses": 0,
             "availability_invalidations": 0,
+            "l1_hits": 0,
+            "l1_misses": 0,
+            "l2_hits": 0,
+            "l2_misses": 0,
         }
 
     # Internal helpers -------------------------------------------------
 
+    def _record_tier(self, tier: str, hit: bool) -> None:
+        """Count a per-tier lookup outcome in stats, perf counters and Prometheus."""
+        self._stats[f"{tier}_hits" if hit else f"{tier}_misses"] += 1
+        note_cache_tier(tier, hit)
+        PrometheusMetrics.record_cache_tier(tier, hit)
+
+    def _active_l1_for(self, key: str) -> Optional[L1Cache]:
+        """Return the L1 tier when it may serve ``key``."""
+        l1 = self.l1
+        if l1 is None or not l1.active or not l1.is_eligible(key):
+            return None
+        return l1
+
+    async def _invalidate_l1(
+        self,
+        redis_client: Redis,
+        *,
+        keys: Sequence[str] = (),
+        patterns: Sequence[str] = (),
+    ) -> None:
+        """Evict eligible keys locally and tell the other workers to do the same."""
+        l1 = self.l1
+        if l1 is None:
+            return
+        eligible_keys = [key for key in keys if l1.is_eligible(key)]
+        eligible_patterns = [pattern for pattern in patterns if l1.may_match_pattern(pattern)]
+        if not eligible_keys and not eligible_patterns:
+            return
+
+        for key in eligible_keys:
+            l1.delete(key)
+        for pattern in eligible_patterns:
+            l1.delete_pattern(pattern)
+        try:
+            await redis_client.publish(
+                L1_INVALIDATION_CHANNEL,
+                build_invalidation_message(keys=eligible_keys, patterns=eligible_patterns),
+            )
+        except Exception as exc:
+            logger.warning("L1 invalidation publish failed: %s", exc)
+
     async def _backend_get(self, key: str) -> Optional[Any]:
         """Fetch raw value from the active backend without instrumentation."""
         redis_client = await self._get_redis_client()
 
+        l1 = self._active_l1_for(key) if redis_client is not None else None
+        l1_version = 0
+        if l1 is not None:
+            hit, value = l1.get(key)
+            self._record_tier("l1", hit)
+            if hit:
+                return value
+            l1_version = l1.version
+
         try:
             if redis_client and self.circuit_breaker.state != CircuitState.OPEN:
 
                 async def _get_from_redis() -> Optional[Any]:
                     return await redis_client.get(key)
 
-                return await self.circuit_breaker.call(_get_from_redis)
+                raw_value = await self.circuit_breaker.call(_get_from_redis)
+                self._record_tier("l2", raw_value is not None)
+                if raw_value is not None and l1 is not None:
+                    l1.set(key, raw_value, if_version=l1_version)
+                return raw_value
 
             if redis_client is None:
                 cached = self._memory_cache.get(key)
@@ -363,6 +435,7 @@ class CacheService(BaseService):
                 result = await self.circuit_breaker.call(_set_in_redis)
                 if result:
                     self._stats["sets"] += 1
+                    await self._invalidate_l1(redis_client, keys=[key])
                     return True
             elif redis_client is None:
                 self._memory_cache[key] = value
@@ -467,6 +540,7 @@ class CacheService(BaseService):
                 result = await self.circuit_breaker.call(_set_in_redis)
                 if result:
                     self._stats["sets"] += 1
+                    await self._invalidate_l1(redis, keys=[key])
                     return True
             elif redis_client is None:
                 # In-memory fallback
@@ -497,6 +571,7 @@ class CacheService(BaseService):
                     return bool(await redis_client.delete(key))
 
                 result = await self.circuit_breaker.call(_delete_from_redis)
+                await self._invalidate_l1(redis_client, keys=[key])
                 if result:
                     self._stats["deletes"] += 1
                     return True
@@ -527,6 +602,7 @@ class CacheService(BaseService):
             redis_client = await self._get_redis_client()
             if redis_client:
                 count = await self._delete_pattern_redis(pattern)
+                await self._invalidate_l1(redis_client, patterns=[pattern])
             else:
                 count = self._delete_pattern_memory(pattern)
 
@@ -556,16 +632,59 @@ class CacheService(BaseService):
         pattern = prefix if prefix.endswith("*") else f"{prefix}*"
         return await self.delete_pattern(pattern)
 
+    @BaseService.measure_operation("cache_delete_many")
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete exact keys in one pipelined round trip; returns the number removed."""
+        if not keys:
+            return 0
+        try:
+            redis_client = await self._get_redis_client()
+            if redis_client:
+                count = await self._unlink_keys(redis_client, keys)
+                await self._invalidate_l1(redis_client, keys=keys)
+            else:
+                count = 0
+                for key in keys:
+                    if self._memory_cache.pop(key, None) is not None:
+                        count += 1
+                    self._memory_expiry.pop(key, None)
+
+            self._stats["deletes"] += count
+            return count
+
+        except Exception as e:
+            logger.error("Cache delete_many error: %s", e)
+            self._stats["errors"] += 1
+            return 0
+
     async def _delete_pattern_redis(self, pattern: str) -> int:
-        """Delete pattern from Redis using SCAN."""
-        count = 0
+        """
+        Unlink keys matching ``pattern``.
+
+        Each SCAN page is unlinked with one pipelined round trip instead of one awaited
+        DELETE per key; UNLINK frees memory off Redis' main thread.
+        """
         redis_client = await self._get_redis_client()
         if redis_client is None:
             return 0
-        async for key in redis_client.scan_iter(match=pattern):
-            if await redis_client.delete(key):
-                count += 1
-        return count
+
+        scan_count = settings.cache_scan_count
+        count = 0
+        cursor: int = 0
+        while True:
+            cursor, keys = await redis_client.scan(cursor=cursor, match=pattern, count=scan_count)
+            if keys:
+                count += await self._unlink_keys(redis_client, keys)
+            if not cursor:
+                return count
+
+    @staticmethod
+    async def _unlink_keys(redis_client: Redis, keys: Sequence[Any]) -> int:
+        pipe = redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.unlink(key)
+        results = await pipe.execute()
+        return sum(int(result or 0) for result in results)
 
     def _delete_pattern_memory(self, pattern: str) -> int:
         """Delete pattern from in-memory cache."""
@@ -668,6 +787,7 @@ class CacheService(BaseService):
                     else:
                         self._stats["misses"] += 1
                         note_cache_miss(key)
+                    self._record_tier("l2", value is not None)
             else:
                 # In-memory
                 for key in keys:
@@ -702,6 +822,7 @@ class CacheService(BaseService):
                 for key, value in serialized_data.items():
                     pipe.setex(key, ttl, value)
                 await pipe.execute()
+                await self._invalidate_l1(redis_client, keys=list(serialized_data))
             else:
                 # In-memory
                 for key, value in data.items():
@@ -715,6 +836,131 @@ class CacheService(BaseService):
             self._stats["errors"] += 1
             return False
 
+    # Generation-based invalidation
+
+    GENERATION_PREFIX = "gen"
+
+    def _generation_key(self, scope: str) -> str:
+        return f"{self.GENERATION_PREFIX}:{scope}"
+
+    async def _get_with_generation(self, key: str, scope: str) -> Tuple[Optional[Any], int]:
+        """Fetch a raw value and its scope's current generation in one round trip."""
+        generation_key = self._generation_key(scope)
+        redis_client = await self._get_redis_client()
+        if redis_client is None:
+            raw_value = await self._backend_get(key)
+            raw_generation = await self._backend_get(generation_key)
+            return raw_value, int(raw_generation or 0)
+
+        async def _mget_from_redis() -> List[Optional[Any]]:
+            return cast(List[Optional[Any]], await redis_client.mget([key, generation_key]))
+
+        values = await self.circuit_breaker.call(_mget_from_redis)
+        if not values:
+            return None, 0
+        raw_value, raw_generation = values
+        self._record_tier("l2", raw_value is not None)
+        return raw_value, int(raw_generation or 0)
+
+    @BaseService.measure_operation("cache_get_versioned")
+    async def get_versioned(self, key: str, scope: str) -> Optional[Any]:
+        """
+        Get a value stored by ``set_versioned``.
+
+        Entries stamped with an older generation than the scope's current one are
+        misses; they are never deleted and simply expire with their TTL.
+        """
+        try:
+            record_cache_key(key)
+            raw_value, generation = await self._get_with_generation(key, scope)
+            envelope: Any = raw_value
+            if isinstance(raw_value, (bytes, str)):
+                envelope = json.loads(raw_value)
+            if not isinstance(envelope, dict) or envelope.get("g") != generation:
+                self._stats["misses"] += 1
+                note_cache_miss(key)
+                return None
+
+            self._stats["hits"] += 1
+            note_cache_hit(key)
+            return envelope.get("v")
+
+        except Exception as e:
+            logger.error("Cache get_versioned error for key %s: %s", key, e)
+            self._stats["errors"] += 1
+            return None
+
+    @BaseService.measure_operation("cache_set_versioned")
+    async def set_versioned(
+        self,
+        key: str,
+        scope: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tier: str = "warm",
+    ) -> bool:
+        """Store ``value`` stamped with the scope's current generation."""
+        try:
+            if ttl is None:
+                ttl = self.TTL_TIERS.get(tier, self.TTL_TIERS["warm"])
+            generation = int(await self._backend_get(self._generation_key(scope)) or 0)
+            payload = json.dumps({"g": generation, "v": value}, default=str)
+            return await self._backend_set(key, payload, ttl)
+
+        except Exception as e:
+            logger.error("Cache set_versioned error for key %s: %s", key, e)
+            self._stats["errors"] += 1
+            return False
+
+    @BaseService.measure_operation("cache_get_generation")
+    async def get_generation(self, scope: str) -> Optional[int]:
+        """
+        Current generation of ``scope`` as seen by every worker.
+
+        Returns None without Redis: the in-memory fallback counter is per process
+        and misses bumps made elsewhere, so it cannot version shared responses.
+        """
+        try:
+            redis_client = await self._get_redis_client()
+            if redis_client is None:
+                return None
+
+            async def _get_from_redis() -> Optional[Any]:
+                return await redis_client.get(self._generation_key(scope))
+
+            return int(await self.circuit_breaker.call(_get_from_redis) or 0)
+
+        except Exception as e:
+            logger.error("Cache generation read error for scope %s: %s", scope, e)
+            self._stats["errors"] += 1
+            return None
+
+    @BaseService.measure_operation("cache_bump_generation")
+    async def bump_generation(self, scope: str) -> Optional[int]:
+        """
+        Invalidate every versioned entry in ``scope`` with a single INCR.
+
+        Generation keys carry no TTL: a counter that expired and restarted could
+        re-validate entries stamped before the reset.
+        """
+        generation_key = self._generation_key(scope)
+        try:
+            redis_client = await self._get_redis_client()
+            if redis_client is None:
+                generation = int(self._memory_cache.get(generation_key) or 0) + 1
+                self._memory_cache[generation_key] = str(generation)
+                return generation
+
+            async def _incr_in_redis() -> int:
+                return int(await redis_client.incr(generation_key))
+
+            return await self.circuit_breaker.call(_incr_in_redis)
+
+        except Exception as e:
+            logger.error("Cache generation bump error for scope %s: %s", scope, e)
+            self._stats["errors"] += 1
+            return None
+
     # Domain-Specific Methods
 
     @BaseService.measure_operation("cache_week_availability")
@@ -766,7 +1012,9 @@ class CacheService(BaseService):
         else:
             tier = "warm"  # 1 hour
 
-        return await self.set(key, availability_data, tier=tier)
+        return await self.set_versioned(
+            key, CacheKeyBuilder.availability_scope(instructor_id), availability_data, tier=tier
+        )
 
     @BaseService.measure_operation("get_instructor_availability_date_range")
     async def get_instructor_availability_date_range(
@@ -774,7 +1022,10 @@ class CacheService(BaseService):
     ) -> Optional[List[Dict[str, Any]]]:
         """Get cached instructor availability for date range."""
         key = self.key_builder.build("availability", "range", instructor_id, start_date, end_date)
-        result = cast(Optional[List[Dict[str, Any]]], await self.get(key))
+        result = cast(
+            Optional[List[Dict[str, Any]]],
+            await self.get_versioned(key, CacheKeyBuilder.availability_scope(instructor_id)),
+        )
 
         # Track availability-specific metrics
         if result is not None:
@@ -790,7 +1041,12 @@ class CacheService(BaseService):
     ) -> bool:
         """Cache instructor's weekly availability pattern with 5-minute TTL."""
         key = self.key_builder.build("availability", "weekly", instructor_id)
-        return await self.set(key, weekly_data, tier="hot")  # 5 minutes
+        return await self.set_versioned(
+            key,
+            CacheKeyBuilder.availability_scope(instructor_id),
+            weekly_data,
+            tier="hot",  # 5 minutes
+        )
 
     @BaseService.measure_operation("get_instructor_weekly_availability")
     async def get_instructor_weekly_availability(
@@ -798,7 +1054,10 @@ class CacheService(BaseService):
     ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """Get cached instructor weekly availability pattern."""
         key = self.key_builder.build("availability", "weekly", instructor_id)
-        result = cast(Optional[Dict[str, List[Dict[str, Any]]]], await self.get(key))
+        result = cast(
+            Optional[Dict[str, List[Dict[str, Any]]]],
+            await self.get_versioned(key, CacheKeyBuilder.availability_scope(instructor_id)),
+        )
 
         # Track availability-specific metrics
         if result is not None:
@@ -812,6 +1071,7 @@ class CacheService(BaseService):
     async def batch_cache_availability(self, availability_entries: List[Dict[str, Any]]) -> int:
         """Batch cache multiple availability entries for performance."""
         cache_data: Dict[str, Any] = {}
+        cached_ranges = 0
 
         for entry in availability_entries:
             instructor_id = entry["instructor_id"]
@@ -822,44 +1082,53 @@ class CacheService(BaseService):
                 )
                 cache_data[key] = entry["data"]
             elif "start_date" in entry and "end_date" in entry:
-                # Date range availability
+                # Date range availability is versioned, so it is stamped individually
                 key = self.key_builder.build(
                     "availability", "range", instructor_id, entry["start_date"], entry["end_date"]
                 )
-                cache_data[key] = entry["data"]
+                if await self.set_versioned(
+                    key,
+                    CacheKeyBuilder.availability_scope(instructor_id),
+                    entry["data"],
+                    tier="hot",
+                ):
+                    cached_ranges += 1
 
         if not cache_data:
-            return 0
+            return cached_ranges
 
         success = await self.mset(cache_data, tier="hot")
-        return len(cache_data) if success else 0
+        return cached_ranges + (len(cache_data) if success else 0)
 
     @BaseService.measure_operation("invalidate_instructor_availability")
     async def invalidate_instructor_availability(
         self, instructor_id: Union[int, str], dates: Optional[List[date]] = None
     ) -> None:
-        """Invalidate all availability caches for an instructor."""
-        patterns = [
-            f"avail:*:{instructor_id}:*",
-            f"week:*:{instructor_id}:*",
-            f"con:*:{instructor_id}:*",  # Bug fix: was "conf:" but prefix is "con"
-            # Always invalidate public availability for this instructor (any date range)
-            f"public_availability:{instructor_id}:*",
-        ]
-
-        if dates:
-            # Also invalidate specific date patterns
-            for d in dates:
-                patterns.extend(
-                    [
-                        f"*:{instructor_id}:{d.isoformat()}",
-                        f"*:{instructor_id}:*:{d.isoformat()}",
-                    ]
-                )
+        """
+        Invalidate all availability caches for an instructor.
 
+        Date-range, weekly, conflict and public availability entries are versioned
+        under the instructor's availability scope and drop out with one INCR. Week
+        keys are shared with the availability service's JSON cache and stay
+        unversioned: with ``dates`` the affected weeks are deleted by key, otherwise
+        the instructor's ``avail:`` keys are removed with a pattern scan.
+        """
         total_deleted = 0
-        for pattern in patterns:
-            total_deleted += await self.delete_pattern(pattern)
+        # A generation bump counts as one invalidation alongside deleted keys.
+        if (
+            await self.bump_generation(CacheKeyBuilder.availability_scope(instructor_id))
+            is not None
+        ):
+            total_deleted += 1
+
+        if dates:
+            week_keys: List[str] = []
+            for week_start in sorted({d - timedelta(days=d.weekday()) for d in dates}):
+                week_key = self.key_builder.build("availability", "week", instructor_id, week_start)
+                week_keys.extend([week_key, f"{week_key}:with_slots"])
+            total_deleted += await self.delete_many(week_keys)
+        else:
+            total_deleted += await self.delete_pattern(f"avail:*:{instructor_id}:*")
 
         # Track availability-specific invalidations
         self._stats["availability_invalidations"] += total_deleted
@@ -886,7 +1155,9 @@ class CacheService(BaseService):
         key_hash = self.key_builder.hash_complex_key(key_data)
         key = self.key_builder.build("conflict", instructor_id, check_date, key_hash)
 
-        return await self.set(key, conflicts, tier="hot")
+        return await self.set_versioned(
+            key, CacheKeyBuilder.availability_scope(instructor_id), conflicts, tier="hot"
+        )
 
     # Cache Warming
 
@@ -979,6 +1250,14 @@ class CacheService(BaseService):
         # Add circuit breaker info
         stats["circuit_breaker"] = self._get_circuit_breaker_stats()
 
+        if self.l1 is not None:
+            stats["l1"] = {
+                "active": self.l1.active,
+                "entries": len(self.l1),
+                "max_entries": self.l1.max_entries,
+                "ttl_seconds": self.l1.ttl_seconds,
+            }
+
         # Add Redis info if available
         redis_info = await self._get_redis_info()
         if redis_info:
@@ -918,7 +918,10 @@ class ConflictChecker(BaseService):
         """
         Find the next available time slot for booking.
 
-        Searches for gaps between existing bookings.
+        Searches for gaps between existing bookings on a single date. Availability
+        windows, buffers and advance notice are not consulted; use
+        ``AvailabilityService.find_next_bookable_slot`` for a bookable slot across
+        a date range.
 
         Args:
             instructor_id: The instructor ID
@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 
 from sqlalchemy.orm import Session
 
+from ..core.config import settings
 from ..models.booking import Booking
 from ..models.conversation import Conversation
 from ..models.message import MESSAGE_TYPE_USER, Message
@@ -127,6 +128,7 @@ class ConversationService(BaseService):
             db
         )
         self.conversation_state_repository = ConversationStateRepository(db)
+        self.read_state_repository = RepositoryFactory.create_conversation_read_state_repository(db)
         self.notification_service = notification_service
         self.logger = logging.getLogger(__name__)
 
@@ -240,6 +242,9 @@ class ConversationService(BaseService):
     @BaseService.measure_operation("get_unread_count")
     def get_unread_count(self, conversation_id: str, user_id: str) -> int:
         """Count unread messages for a user in a conversation."""
+        if settings.messaging_unread_counters_enabled:
+            counts = self.read_state_repository.get_unread_counts(user_id, [conversation_id])
+            return counts.get(conversation_id, 0)
         return self.conversation_repository.get_unread_count(conversation_id, user_id)
 
     def _restore_participants_to_active(
@@ -552,6 +557,8 @@ class ConversationService(BaseService):
         Returns:
             Dict mapping conversation_id to unread count
         """
+        if settings.messaging_unread_counters_enabled:
+            return self.read_state_repository.get_unread_counts(user_id, conversation_ids)
         return self.conversation_repository.batch_get_unread_counts(conversation_ids, user_id)
 
     @BaseService.measure_operation("batch_get_latest_messages")
@@ -742,6 +749,10 @@ class ConversationService(BaseService):
         # Reverse to return in chronological order
         messages.reverse()
 
+        watermarks: Dict[str, Tuple[Optional[str], Optional[datetime]]] = {}
+        if settings.messaging_unread_counters_enabled and messages:
+            watermarks = self.read_state_repository.get_watermarks(conversation_id)
+
         # Collect booking IDs to batch-fetch
         booking_ids = [m.booking_id for m in messages if m.booking_id and m.message_type != "user"]
         bookings_by_id: Dict[str, Booking] = {}
@@ -781,6 +792,8 @@ class ConversationService(BaseService):
                 for r in (msg.read_by or [])
                 if isinstance(r, dict) and "user_id" in r
             ]
+            if watermarks:
+                read_by_entries = self._merge_watermark_receipts(msg, read_by_entries, watermarks)
 
             # Transform reactions
             reactions = [
@@ -811,6 +824,36 @@ class ConversationService(BaseService):
             conversation_found=True,
         )
 
+    @staticmethod
+    def _merge_watermark_receipts(
+        msg: Message,
+        read_by_entries: List[Dict[str, Any]],
+        watermarks: Dict[str, Tuple[Optional[str], Optional[datetime]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Add receipts implied by each participant's read watermark to legacy read_by.
+
+        Watermarks mean "read up to": the repository never moves one past a
+        message that is still unread, so every message at or below it is read.
+        """
+        seen = {entry["user_id"] for entry in read_by_entries}
+        for reader_id, (last_read_id, last_read_at) in watermarks.items():
+            if (
+                last_read_id is None
+                or reader_id in seen
+                or not msg.sender_id
+                or msg.sender_id == reader_id
+                or str(msg.id) > last_read_id
+            ):
+                continue
+            read_by_entries.append(
+                {
+                    "user_id": reader_id,
+                    "read_at": last_read_at.isoformat() if last_read_at else "",
+                }
+            )
+        return read_by_entries
+
     @BaseService.measure_operation("send_message_with_context")
     def send_message_with_context(
         self,
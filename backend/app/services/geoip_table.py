@@ -0,0 +1,294 @@
+# backend/app/services/geoip_table.py
+"""
+Offline IP-to-location table for GeolocationService.
+
+``GeolocationService.get_location_from_ip`` used to call ipapi.co / ip-api.com
+on every cache miss. When ``settings.geoip_database_path`` points at a table
+built by ``scripts/build_geoip_table.py``, lookups are a binary search over
+sorted integer ranges instead: no network, microseconds per lookup.
+
+File layout (little-endian):
+
+  b"IIGEOIP1" | uint64 header length | header JSON | pad to 8
+  uint32 v4_start[n4] | uint32 v4_end[n4] | uint32 v4_location[n4] | pad to 8
+  uint64 v6_start[n6] | uint64 v6_end[n6] | uint32 v6_location[n6]
+
+The header holds the range counts and the de-duplicated location dicts, which
+already include the NYC enrichment (``is_nyc``/``borough``). IPv6 ranges are
+keyed by their /64 network prefix, the finest granularity geolocation sources
+publish. IPv4-mapped IPv6 addresses are looked up in the IPv4 ranges.
+
+The file is memory-mapped read-only, so every worker on a host shares one copy
+of the range arrays through the page cache. The builder replaces the file
+atomically; workers pick up a rebuilt table on restart.
+"""
+
+from __future__ import annotations
+
+import csv
+import ipaddress
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"IIGEOIP1"
+LOCATION_FIELDS = (
+    "country_code",
+    "country_name",
+    "state",
+    "city",
+    "postal_code",
+    "latitude",
+    "longitude",
+    "timezone",
+)
+_FLOAT_FIELDS = frozenset({"latitude", "longitude"})
+_V6_PREFIX_SHIFT = 64
+
+# NYC boroughs mapping for enhanced local tracking
+NYC_BOROUGHS = {
+    "Brooklyn": "Brooklyn",
+    "Queens": "Queens",
+    "Manhattan": "Manhattan",
+    "The Bronx": "Bronx",
+    "Staten Island": "Staten Island",
+    # Alternative names
+    "Bronx": "Bronx",
+    "New York": "Manhattan",  # Most APIs return "New York" for Manhattan
+}
+_NYC_CITIES = frozenset(
+    {"new york", "brooklyn", "queens", "bronx", "staten island", "the bronx", "manhattan"}
+)
+
+
+def enhance_nyc_data(location_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flag NYC locations and map the city to a standardized borough name."""
+    city = location_data.get("city", "")
+    state = location_data.get("state", "")
+
+    logger.debug("NYC detection - city: '%s', state: '%s'", city, state)
+
+    is_nyc = (
+        state.strip().lower() in ["new york", "ny"] and city.strip().lower() in _NYC_CITIES
+        if state and city
+        else False
+    )
+
+    location_data["is_nyc"] = is_nyc
+
+    if is_nyc:
+        borough = NYC_BOROUGHS.get(city)
+        if borough:
+            location_data["borough"] = borough
+
+        # Ensure city is "New York" for NYC locations
+        location_data["city"] = "New York"
+
+    return location_data
+
+
+def _pad8(length: int) -> int:
+    return -length % 8
+
+
+def _range_bounds(row: Mapping[str, str]) -> Tuple[int, int, int]:
+    """Return (ip version, first address, last address) for a CSV row."""
+    network = (row.get("network") or "").strip()
+    if network:
+        net = ipaddress.ip_network(network, strict=False)
+        return net.version, int(net.network_address), int(net.broadcast_address)
+    start = ipaddress.ip_address(row["start_ip"].strip())
+    end = ipaddress.ip_address(row["end_ip"].strip())
+    if start.version != end.version:
+        raise ValueError(f"Mixed IP versions in range {start}-{end}")
+    return start.version, int(start), int(end)
+
+
+def _location(row: Mapping[str, str]) -> Dict[str, Any]:
+    location: Dict[str, Any] = {}
+    for name in LOCATION_FIELDS:
+        raw = (row.get(name) or "").strip()
+        if name in _FLOAT_FIELDS:
+            location[name] = float(raw) if raw else None
+        else:
+            location[name] = raw or None
+    return enhance_nyc_data(location)
+
+
+def build_geoip_table(rows: Iterable[Mapping[str, str]]) -> bytes:
+    """
+    Build the binary table from CSV-style rows.
+
+    Each row has either ``network`` (CIDR) or ``start_ip``/``end_ip``, plus any
+    of ``LOCATION_FIELDS``. Overlapping ranges keep the one that starts first.
+    """
+    locations: List[Dict[str, Any]] = []
+    location_index: Dict[str, int] = {}
+    ranges: Dict[int, List[Tuple[int, int, int]]] = {4: [], 6: []}
+
+    for row in rows:
+        version, start, end = _range_bounds(row)
+        if version == 6:
+            start >>= _V6_PREFIX_SHIFT
+            end >>= _V6_PREFIX_SHIFT
+        location = _location(row)
+        key = json.dumps(location, sort_keys=True)
+        index = location_index.get(key)
+        if index is None:
+            index = location_index[key] = len(locations)
+            locations.append(location)
+        ranges[version].append((start, end, index))
+
+    tables: Dict[int, List[Tuple[int, int, int]]] = {}
+    for version, entries in ranges.items():
+        entries.sort()
+        kept: List[Tuple[int, int, int]] = []
+        for entry in entries:
+            if kept and entry[0] <= kept[-1][1]:
+                continue
+            kept.append(entry)
+        if len(kept) < len(entries):
+            logger.warning("Skipped %s overlapping IPv%s ranges", len(entries) - len(kept), version)
+        tables[version] = kept
+
+    header = json.dumps(
+        {"v4": len(tables[4]), "v6": len(tables[6]), "locations": locations},
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    parts = [MAGIC, struct.pack("<Q", len(header)), header]
+    parts.append(b"\0" * _pad8(len(MAGIC) + 8 + len(header)))
+    v4 = tables[4]
+    parts += [
+        np.array([r[0] for r in v4], dtype="<u4").tobytes(),
+        np.array([r[1] for r in v4], dtype="<u4").tobytes(),
+        np.array([r[2] for r in v4], dtype="<u4").tobytes(),
+        b"\0" * _pad8(12 * len(v4)),
+    ]
+    v6 = tables[6]
+    parts += [
+        np.array([r[0] for r in v6], dtype="<u8").tobytes(),
+        np.array([r[1] for r in v6], dtype="<u8").tobytes(),
+        np.array([r[2] for r in v6], dtype="<u4").tobytes(),
+    ]
+    return b"".join(parts)
+
+
+def write_geoip_table(csv_path: Path, output_path: Path) -> Dict[str, int]:
+    """Build a table from a CSV file and atomically replace ``output_path``."""
+    with csv_path.open(newline="", encoding="utf-8") as handle:
+        data = build_geoip_table(csv.DictReader(handle))
+
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, output_path)
+
+    table = GeoIPTable(data)
+    return {"ipv4_ranges": table.ipv4_ranges, "ipv6_ranges": table.ipv6_ranges}
+
+
+class GeoIPTable:
+    """Read-only view over a built table (bytes or a memory map)."""
+
+    def __init__(self, buffer: Any) -> None:
+        if bytes(buffer[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a geoip table")
+        (header_len,) = struct.unpack_from("<Q", buffer, len(MAGIC))
+        offset = len(MAGIC) + 8
+        header = json.loads(bytes(buffer[offset : offset + header_len]))
+        offset += header_len + _pad8(offset + header_len)
+
+        self._locations: List[Dict[str, Any]] = header["locations"]
+        n4, n6 = int(header["v4"]), int(header["v6"])
+
+        def take(dtype: str, count: int) -> np.ndarray:
+            nonlocal offset
+            array: np.ndarray = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes
+            return array
+
+        self._v4_start = take("<u4", n4)
+        self._v4_end = take("<u4", n4)
+        self._v4_location = take("<u4", n4)
+        offset += _pad8(12 * n4)
+        self._v6_start = take("<u8", n6)
+        self._v6_end = take("<u8", n6)
+        self._v6_location = take("<u4", n6)
+
+    @classmethod
+    def open(cls, path: str | Path) -> GeoIPTable:
+        with open(path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped)
+
+    @property
+    def ipv4_ranges(self) -> int:
+        return len(self._v4_start)
+
+    @property
+    def ipv6_ranges(self) -> int:
+        return len(self._v6_start)
+
+    def lookup(self, ip_address: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the location covering ``ip_address``, if any."""
+        try:
+            address = ipaddress.ip_address(ip_address)
+        except ValueError:
+            return None
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+            address = address.ipv4_mapped
+
+        if address.version == 4:
+            key = int(address)
+            starts, ends, locations = self._v4_start, self._v4_end, self._v4_location
+        else:
+            key = int(address) >> _V6_PREFIX_SHIFT
+            starts, ends, locations = self._v6_start, self._v6_end, self._v6_location
+
+        index = int(np.searchsorted(starts, key, side="right")) - 1
+        if index < 0 or int(ends[index]) < key:
+            return None
+        return dict(self._locations[int(locations[index])])
+
+
+_table: Optional[GeoIPTable] = None
+_table_path: Optional[str] = None
+_table_lock = threading.Lock()
+
+
+def get_geoip_table() -> Optional[GeoIPTable]:
+    """Return the configured table, opening it on first use (None if not configured)."""
+    global _table, _table_path
+    path = settings.geoip_database_path
+    if not path:
+        return None
+    if _table_path == path:
+        return _table
+    with _table_lock:
+        if _table_path != path:
+            try:
+                _table = GeoIPTable.open(path)
+                logger.info(
+                    "Loaded geoip table %s (%s IPv4 / %s IPv6 ranges)",
+                    path,
+                    _table.ipv4_ranges,
+                    _table.ipv6_ranges,
+                )
+            except (OSError, ValueError) as exc:
+                # Remember the failure so requests fall back to HTTP without retrying.
+                logger.warning("Failed to load geoip table %s: %s", path, exc)
+                _table = None
+            _table_path = path
+    return _table
@@ -4,6 +4,7 @@ GeolocationService for NYC-specific tracking and analytics.
 
 Provides IP geolocation services with:
 - NYC borough detection
+- Offline IP range table lookups (see geoip_table), falling back to HTTP services
 - Redis caching for performance
 - Privacy-aware (no street-level data)
 - Rate limiting protection
@@ -19,6 +20,7 @@ from sqlalchemy.orm import Session
 from starlette.requests import Request
 
 from .base import BaseService
+from .geoip_table import NYC_BOROUGHS, enhance_nyc_data, get_geoip_table
 
 logger = logging.getLogger(__name__)
 
@@ -32,16 +34,7 @@ class GeolocationService(BaseService):
     """
 
     # NYC boroughs mapping for enhanced local tracking
-    NYC_BOROUGHS = {
-        "Brooklyn": "Brooklyn",
-        "Queens": "Queens",
-        "Manhattan": "Manhattan",
-        "The Bronx": "Bronx",
-        "Staten Island": "Staten Island",
-        # Alternative names
-        "Bronx": "Bronx",
-        "New York": "Manhattan",  # Most APIs return "New York" for Manhattan
-    }
+    NYC_BOROUGHS = NYC_BOROUGHS
 
     def __init__(self, db: Session, cache_service: Any | None = None) -> None:
         super().__init__(db)
@@ -80,6 +73,12 @@ class GeolocationService(BaseService):
             logger.debug("Skipping private IP: %s", ip_address)
             return self._get_default_location()
 
+        # Offline range table: no network and no cache round trip
+        table = get_geoip_table()
+        if table is not None:
+            location = table.lookup(ip_address)
+            return location if location is not None else self._get_default_location()
+
         # Check cache first
         cache_key = f"geo:ip:{self._hash_ip(ip_address)}"
         if self.cache_service:
@@ -182,43 +181,7 @@ class GeolocationService(BaseService):
 
     def _enhance_nyc_data(self, location_data: dict[str, Any]) -> dict[str, Any]:  # no-metrics
         """Enhance location data with NYC-specific information."""
-        city = location_data.get("city", "")
-        state = location_data.get("state", "")
-
-        # Debug logging
-        logger.debug("NYC detection - city: '%s', state: '%s'", city, state)
-
-        # Check if this is NYC - normalize and strip whitespace
-        is_nyc = (
-            (
-                state.strip().lower() in ["new york", "ny"]
-                and city.strip().lower()
-                in [
-                    "new york",
-                    "brooklyn",
-                    "queens",
-                    "bronx",
-                    "staten island",
-                    "the bronx",
-                    "manhattan",
-                ]
-            )
-            if state and city
-            else False
-        )
-
-        location_data["is_nyc"] = is_nyc
-
-        if is_nyc:
-            # Map to standardized borough name
-            borough = self.NYC_BOROUGHS.get(city)
-            if borough:
-                location_data["borough"] = borough
-
-            # Ensure city is "New York" for NYC locations
-            location_data["city"] = "New York"
-
-        return location_data
+        return enhance_nyc_data(location_data)
 
     def _is_valid_ip(self, ip_address: str) -> bool:  # no-metrics
         """Check if string is a valid IP address."""
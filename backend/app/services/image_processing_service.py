@@ -6,14 +6,20 @@ Validates and processes profile images:
 - Size and aspect ratio checks
 - Center-crop to square and resize to variants
 - Convert transparency to white background
+- Optional WebP/AVIF copies of the square variants
+
+JPEG sources are decoded in draft mode (libjpeg DCT scaling) when they are at
+least twice the largest size we keep, and downscaling uses ``reducing_gap`` so
+Pillow runs its cheap box ``reduce()`` before the final Lanczos pass.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import io
 import logging
-from typing import Tuple
+import math
+from typing import Dict, Sequence, Tuple
 
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, features
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +27,17 @@ logger = logging.getLogger(__name__)
 ALLOWED_CONTENT_TYPES = {"image/jpeg", "image/png"}
 MAX_PROFILE_PHOTO_BYTES = 10 * 1024 * 1024
 MAX_ASPECT_RATIO = 2.0  # width/height or height/width must not exceed 2:1
+MAX_ORIGINAL_EDGE = 2048  # longest edge of the stored "original" variant
+DISPLAY_SIZE = (400, 400)
+THUMB_SIZE = (200, 200)
+REDUCING_GAP = 3.0
+
+# Encoder settings for the optional formats; AVIF "speed" trades size for CPU.
+EXTRA_FORMAT_OPTIONS: Dict[str, Dict[str, int]] = {
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60, "speed": 8},
+}
+EXTRA_FORMAT_CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
 
 
 @dataclass
@@ -28,11 +45,25 @@ class ProcessedImages:
     original: bytes
     display_400: bytes
     thumb_200: bytes
+    # {"webp": {"display": b"...", "thumb": b"..."}} for each extra format produced
+    extra_formats: Dict[str, Dict[str, bytes]] = field(default_factory=dict)
 
 
 class ImageProcessingService:
-    def __init__(self) -> None:
-        pass
+    def __init__(self, extra_formats: Sequence[str] = ()) -> None:
+        self.extra_formats: Tuple[str, ...] = tuple(
+            fmt for fmt in dict.fromkeys(extra_formats) if self._encoder_available(fmt)
+        )
+
+    @staticmethod
+    def _encoder_available(fmt: str) -> bool:
+        if fmt not in EXTRA_FORMAT_OPTIONS:
+            logger.warning("Ignoring unknown profile picture format %s", fmt)
+            return False
+        if not features.check(fmt):
+            logger.warning("Pillow was built without %s support; skipping that format", fmt)
+            return False
+        return True
 
     def _verify_magic_bytes(self, data: bytes) -> str:
         """Verify image magic bytes using PIL and return content type."""
@@ -57,19 +88,43 @@ class ImageProcessingService:
             if ratio > MAX_ASPECT_RATIO:
                 raise ValueError("Aspect ratio exceeds 2:1")
 
-    def _normalize_to_jpeg(self, data: bytes) -> Image.Image:
+    def _normalize_to_jpeg(self, data: bytes, max_edge: int = MAX_ORIGINAL_EDGE) -> Image.Image:
         with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+            scale = max_edge / max(width, height)
+            if img.format == "JPEG" and scale < 0.5:
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale, never below what we keep.
+                img.draft(None, (math.ceil(width * scale), math.ceil(height * scale)))
             img = ImageOps.exif_transpose(img)
-            img = img.convert("RGBA")
-            # Flatten transparency to white
-            background = Image.new("RGBA", img.size, (255, 255, 255, 255))
-            composite = Image.alpha_composite(background, img)
-            return composite.convert("RGB")
-
-    def _center_crop_square(self, img: Image.Image) -> Image.Image:
-        return ImageOps.fit(
-            img, (min(img.size), min(img.size)), method=Image.LANCZOS, centering=(0.5, 0.5)
-        )
+            if img.mode in {"RGBA", "LA", "PA"} or "transparency" in img.info:
+                # Flatten transparency to white
+                rgba = img.convert("RGBA")
+                background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+                img = Image.alpha_composite(background, rgba)
+            img = img.convert("RGB")
+        if max(img.size) > max_edge:
+            img = self._downscale(img, self._fit_within(img.size, max_edge))
+        return img
+
+    @staticmethod
+    def _fit_within(size: Tuple[int, int], max_edge: int) -> Tuple[int, int]:
+        width, height = size
+        scale = max_edge / max(width, height)
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def _downscale(
+        self,
+        img: Image.Image,
+        size: Tuple[int, int],
+        box: Tuple[int, int, int, int] | None = None,
+    ) -> Image.Image:
+        return img.resize(size, Image.LANCZOS, box=box, reducing_gap=REDUCING_GAP)
+
+    def _center_crop_square(self, img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        side = min(img.size)
+        left = (img.width - side) // 2
+        top = (img.height - side) // 2
+        return self._downscale(img, size, box=(left, top, left + side, top + side))
 
     def _encode_jpeg(
         self, img: Image.Image, size: Tuple[int, int] | None = None, quality: int = 85
@@ -77,10 +132,15 @@ class ImageProcessingService:
         out = io.BytesIO()
         work = img
         if size is not None:
-            work = img.resize(size, Image.LANCZOS)
+            work = self._downscale(img, size)
         work.save(out, format="JPEG", quality=quality, optimize=True)
         return out.getvalue()
 
+    def _encode_extra(self, img: Image.Image, fmt: str) -> bytes:
+        out = io.BytesIO()
+        img.save(out, format=fmt.upper(), **EXTRA_FORMAT_OPTIONS[fmt])
+        return out.getvalue()
+
     def process_profile_picture(
         self, uploaded_bytes: bytes, browser_content_type: str
     ) -> ProcessedImages:
@@ -88,14 +148,24 @@ class ImageProcessingService:
         detected = self._verify_magic_bytes(uploaded_bytes)
         self._enforce_constraints(detected, uploaded_bytes)
 
-        # Decode and normalize
+        # Decode (draft-scaled for large JPEGs) and normalize
         base = self._normalize_to_jpeg(uploaded_bytes)
 
-        # Build variants
-        square = self._center_crop_square(base)
-
-        original_jpeg = self._encode_jpeg(base, None, quality=85)
-        display = self._encode_jpeg(square, (400, 400), quality=85)
-        thumb = self._encode_jpeg(square, (200, 200), quality=85)
-
-        return ProcessedImages(original=original_jpeg, display_400=display, thumb_200=thumb)
+        # Crop and scale once to the display size; the thumbnail derives from it
+        display_img = self._center_crop_square(base, DISPLAY_SIZE)
+        thumb_img = self._downscale(display_img, THUMB_SIZE)
+
+        extra_formats = {
+            fmt: {
+                "display": self._encode_extra(display_img, fmt),
+                "thumb": self._encode_extra(thumb_img, fmt),
+            }
+            for fmt in self.extra_formats
+        }
+
+        return ProcessedImages(
+            original=self._encode_jpeg(base, None, quality=85),
+            display_400=self._encode_jpeg(display_img, None, quality=85),
+            thumb_200=self._encode_jpeg(thumb_img, None, quality=85),
+            extra_formats=extra_formats,
+        )
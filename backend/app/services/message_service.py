@@ -10,12 +10,13 @@ Handles business logic for the messaging system including:
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import logging
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
+from ..core.config import settings
 from ..core.enums import PermissionName
 from ..core.exceptions import ForbiddenException, NotFoundException, ValidationException
 from ..models.message import Message
@@ -79,6 +80,7 @@ class MessageService(BaseService):
         super().__init__(db)
         self.repository: MessageRepository = RepositoryFactory.create_message_repository(db)
         self.conversation_repository = RepositoryFactory.create_conversation_repository(db)
+        self.read_state_repository = RepositoryFactory.create_conversation_read_state_repository(db)
         self.logger = logging.getLogger(__name__)
 
     @BaseService.measure_operation("get_stream_context")
@@ -161,6 +163,8 @@ class MessageService(BaseService):
         Returns:
             Total number of unread messages
         """
+        if settings.messaging_unread_counters_enabled:
+            return self.read_state_repository.get_total_unread(user_id)
         count = self.repository.get_unread_count_for_user(user_id)
         return int(count or 0)
 
@@ -180,7 +184,9 @@ class MessageService(BaseService):
             return 0
 
         with self.transaction():
-            count = self.repository.mark_messages_as_read(message_ids, user_id)
+            count = self.repository.mark_messages_as_read(
+                message_ids, user_id, write_read_by=not settings.messaging_unread_counters_enabled
+            )
             self.logger.info("Marked %s messages as read for user %s", count, user_id)
             return int(count or 0)
 
@@ -205,6 +211,21 @@ class MessageService(BaseService):
         count = self.mark_messages_as_read(message_ids, user_id)
         return count
 
+    @BaseService.measure_operation("reconcile_unread_counters")
+    def reconcile_unread_counters(self, stable_for: timedelta = timedelta(minutes=5)) -> int:
+        """
+        Rebuild drifted unread counters and read watermarks from message notifications.
+
+        Rows written within ``stable_for`` are left to the live write path. The
+        first run backfills every participant that has notifications.
+        """
+        stable_before = datetime.now(timezone.utc) - stable_for
+        with self.transaction():
+            corrected = self.read_state_repository.reconcile(stable_before=stable_before)
+        if corrected:
+            self.logger.info("Reconciled %s conversation unread counters", corrected)
+        return corrected
+
     @BaseService.measure_operation("delete_message")
     def delete_message(self, message_id: str, user_id: str) -> bool:
         """
@@ -422,7 +443,9 @@ class MessageService(BaseService):
             actual_conversation_id = conversation_id
             with self.transaction():
                 atomic_result = self.repository.mark_unread_messages_read_atomic(
-                    conversation_id, user_id
+                    conversation_id,
+                    user_id,
+                    write_read_by=not settings.messaging_unread_counters_enabled,
                 )
                 count = atomic_result.rowcount
                 marked_message_ids = atomic_result.message_ids
@@ -435,7 +458,11 @@ class MessageService(BaseService):
         elif message_ids:
             marked_message_ids = message_ids
             with self.transaction():
-                count = self.repository.mark_messages_as_read(message_ids, user_id)
+                count = self.repository.mark_messages_as_read(
+                    message_ids,
+                    user_id,
+                    write_read_by=not settings.messaging_unread_counters_enabled,
+                )
                 self.logger.info("Marked %s messages as read for user %s", count, user_id)
 
             # Get conversation_id from first message for notification
@@ -32,7 +32,12 @@ from app.services.messaging.publisher import (
     publish_typing_status,
     publish_typing_status_direct,
 )
-from app.services.messaging.sse_stream import create_sse_stream, ensure_db_health, publish_to_user
+from app.services.messaging.sse_stream import (
+    create_sse_stream,
+    ensure_db_health,
+    publish_to_user,
+    publish_to_users,
+)
 
 __all__ = [
     # Publishers (DB-based - fetch participants internally)
@@ -50,6 +55,7 @@ __all__ = [
     "publish_message_deleted_direct",
     "publish_reaction_update_direct",
     "publish_to_user",  # Broadcaster-based publish
+    "publish_to_users",  # Batched multi-user publish (sharded fan-out)
     # SSE Stream (uses Broadcaster v4.0)
     "create_sse_stream",
     "ensure_db_health",
@@ -0,0 +1,355 @@
+# backend/app/services/messaging/fanout_hub.py
+"""
+Sharded per-worker fan-out hub for SSE messaging.
+
+The v4.0 design subscribed one Broadcaster channel per connected user
+(``user:{id}``), so every SSE client cost a Redis SUBSCRIBE, a Broadcaster queue
+and a reader task. The hub replaces that with a fixed set of shard channels:
+
+  publisher → PUBLISH sse:shard:{n} {"to": [...], "event": {...}}
+            → 1 Broadcaster subscription per shard (per worker)
+            → hub parses once → user_id → SSEConnection queues → SSE clients
+
+Users are hashed onto ``settings.sse_fanout_shards`` channels with CRC32, so the
+shard count must be identical for every API and Celery process that publishes.
+Each message carries its recipient list; a worker without a local connection for
+a recipient simply skips it.
+
+Each connection has a bounded queue (``settings.sse_connection_queue_size``):
+- ``typing_status`` events coalesce per (conversation, typist): only the latest
+  pending state is delivered.
+- ``read_receipt`` events coalesce per (conversation, reader), merging message ids.
+- When the queue is full, ephemeral events are shed first. A queue full of durable
+  events marks the connection overflowed; its stream ends and the client
+  reconnects with Last-Event-ID, which replays missed messages from the database.
+
+A shard subscription that drops is retried with capped exponential backoff. The
+first failure of an outage closes the worker's clients (they catch up through
+Last-Event-ID once the hub is running again); retries within the same outage do not.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import json
+import logging
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+import zlib
+
+from app.core.config import settings
+from app.monitoring.prometheus_metrics import PrometheusMetrics
+
+logger = logging.getLogger(__name__)
+
+SHARD_CHANNEL_PREFIX = "sse:shard:"
+
+# Events that are safe to coalesce or shed under backpressure.
+EPHEMERAL_EVENT_TYPES = frozenset({"typing_status", "read_receipt"})
+
+# Backoff between shard resubscription attempts after a listener drops.
+RESUBSCRIBE_BACKOFF_BASE_SECONDS = 0.5
+RESUBSCRIBE_BACKOFF_CAP_SECONDS = 30.0
+
+CoalesceKey = Tuple[str, Any, Any]
+
+
+def shard_for(user_id: str, shards: Optional[int] = None) -> int:
+    """Return the shard a user's events are published on."""
+    count = max(1, int(shards or settings.sse_fanout_shards))
+    return zlib.crc32(user_id.encode("utf-8")) % count
+
+
+def shard_channel(shard: int) -> str:
+    return f"{SHARD_CHANNEL_PREFIX}{shard}"
+
+
+def group_by_shard(user_ids: Iterable[str], shards: Optional[int] = None) -> Dict[int, List[str]]:
+    """Group recipients by shard, de-duplicating while preserving order."""
+    grouped: Dict[int, List[str]] = {}
+    seen: Set[str] = set()
+    for user_id in user_ids:
+        if not user_id or user_id in seen:
+            continue
+        seen.add(user_id)
+        grouped.setdefault(shard_for(user_id, shards), []).append(user_id)
+    return grouped
+
+
+def build_envelope(user_ids: Iterable[str], event: Dict[str, Any]) -> str:
+    return json.dumps({"to": list(user_ids), "event": event})
+
+
+def _coalesce_key(event: Dict[str, Any]) -> Optional[CoalesceKey]:
+    event_type = event.get("type")
+    if event_type not in EPHEMERAL_EVENT_TYPES:
+        return None
+    payload = event.get("payload") or {}
+    if event_type == "typing_status":
+        return ("typing_status", payload.get("conversation_id"), payload.get("user_id"))
+    return ("read_receipt", payload.get("conversation_id"), payload.get("reader_id"))
+
+
+def _merge_read_receipts(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine two pending receipts from the same reader so no message id is lost."""
+    merged_ids = list((older.get("payload") or {}).get("message_ids") or [])
+    for message_id in (newer.get("payload") or {}).get("message_ids") or []:
+        if message_id not in merged_ids:
+            merged_ids.append(message_id)
+    merged = dict(newer)
+    merged["payload"] = {**(newer.get("payload") or {}), "message_ids": merged_ids}
+    return merged
+
+
+class _Slot:
+    __slots__ = ("key", "event")
+
+    def __init__(self, key: Optional[CoalesceKey], event: Dict[str, Any]):
+        self.key = key
+        self.event = event
+
+
+class SSEConnection:
+    """Bounded, coalescing event queue for one SSE client."""
+
+    def __init__(self, user_id: str, max_pending: int):
+        self.user_id = user_id
+        self.max_pending = max(1, int(max_pending))
+        self._pending: Deque[_Slot] = deque()
+        self._coalescing: Dict[CoalesceKey, _Slot] = {}
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.overflowed = False
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def push(self, event: Dict[str, Any]) -> bool:
+        """Queue an event; returns False when it was shed."""
+        if self.closed:
+            return False
+        event_type = str(event.get("type", "unknown"))
+        key = _coalesce_key(event)
+        if key is not None:
+            slot = self._coalescing.get(key)
+            if slot is not None:
+                if event_type == "read_receipt":
+                    slot.event = _merge_read_receipts(slot.event, event)
+                else:
+                    slot.event = event
+                self.coalesced += 1
+                PrometheusMetrics.record_sse_shed(event_type, "coalesced")
+                return True
+
+        if len(self._pending) >= self.max_pending:
+            if key is not None:
+                self.dropped += 1
+                PrometheusMetrics.record_sse_shed(event_type, "dropped")
+                return False
+            if not self._evict_oldest_ephemeral():
+                self.overflowed = True
+                PrometheusMetrics.record_sse_shed(event_type, "overflow")
+                self.close()
+                return False
+
+        slot = _Slot(key, event)
+        self._pending.append(slot)
+        if key is not None:
+            self._coalescing[key] = slot
+        self._ready.set()
+        return True
+
+    def _evict_oldest_ephemeral(self) -> bool:
+        for slot in self._pending:
+            if slot.key is not None:
+                self._pending.remove(slot)
+                self._coalescing.pop(slot.key, None)
+                self.dropped += 1
+                PrometheusMetrics.record_sse_shed(str(slot.event.get("type")), "dropped")
+                return True
+        return False
+
+    def pop_nowait(self) -> Optional[Dict[str, Any]]:
+        if not self._pending:
+            return None
+        slot = self._pending.popleft()
+        if slot.key is not None and self._coalescing.get(slot.key) is slot:
+            del self._coalescing[slot.key]
+        return slot.event
+
+    async def next_event(self, timeout: float) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Wait for the next event.
+
+        Returns ``("message", event)``, ``("timeout", None)`` when nothing arrived
+        within ``timeout`` (caller sends a heartbeat), or ``("done", None)`` once the
+        connection is closed and drained.
+        """
+        if not self._pending and not self.closed:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return "timeout", None
+        event = self.pop_nowait()
+        if event is not None:
+            return "message", event
+        return "done", None
+
+    def close(self) -> None:
+        self.closed = True
+        if self.overflowed:
+            # The client will catch up from the database; don't replay a partial queue.
+            self._pending.clear()
+            self._coalescing.clear()
+        self._ready.set()
+
+
+class SSEFanoutHub:
+    """Owns the shard subscriptions of one worker and dispatches to local connections."""
+
+    def __init__(self, shards: int, queue_size: int):
+        self.shards = max(1, int(shards))
+        self.queue_size = max(1, int(queue_size))
+        self._connections: Dict[str, Set[SSEConnection]] = {}
+        self._tasks: List[asyncio.Task[None]] = []
+        self._subscribed: Set[int] = set()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return not self._stopping and len(self._subscribed) == self.shards
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(conns) for conns in self._connections.values())
+
+    def register(self, user_id: str) -> SSEConnection:
+        connection = SSEConnection(user_id, self.queue_size)
+        self._connections.setdefault(user_id, set()).add(connection)
+        return connection
+
+    def unregister(self, connection: SSEConnection) -> None:
+        connection.close()
+        conns = self._connections.get(connection.user_id)
+        if conns is None:
+            return
+        conns.discard(connection)
+        if not conns:
+            del self._connections[connection.user_id]
+
+    def dispatch(self, raw: Any) -> int:
+        """Deliver one shard message to every local connection of its recipients."""
+        try:
+            envelope = json.loads(raw)
+            recipients = envelope["to"]
+            event = envelope["event"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("[SSE-HUB] Ignoring malformed shard message")
+            return 0
+        if not isinstance(event, dict):
+            return 0
+
+        delivered = 0
+        for user_id in recipients:
+            for connection in tuple(self._connections.get(user_id, ())):
+                delivered += int(connection.push(event))
+        return delivered
+
+    async def start(self, broadcast: Any) -> None:
+        """Subscribe every shard channel and wait until all subscriptions are live."""
+        self._stopping = False
+        ready = [asyncio.Event() for _ in range(self.shards)]
+        self._tasks = [
+            asyncio.create_task(self._listen(broadcast, shard, ready[shard]))
+            for shard in range(self.shards)
+        ]
+        await asyncio.gather(*(event.wait() for event in ready))
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except BaseException:
+                pass
+        self._tasks = []
+        self._close_all()
+
+    async def _listen(self, broadcast: Any, shard: int, ready: asyncio.Event) -> None:
+        channel = shard_channel(shard)
+        failures = 0
+        while not self._stopping:
+            try:
+                async with broadcast.subscribe(channel=channel) as subscriber:
+                    self._subscribed.add(shard)
+                    ready.set()
+                    if failures:
+                        logger.info("[SSE-HUB] Shard %s resubscribed", channel)
+                    failures = 0
+                    async for event in subscriber:
+                        self.dispatch(event.message)
+                logger.warning("[SSE-HUB] Shard %s subscription ended", channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("[SSE-HUB] Shard %s listener failed: %s", channel, exc)
+            finally:
+                self._subscribed.discard(shard)
+                ready.set()
+            if self._stopping:
+                return
+            if failures == 0:
+                # Events for this worker may have been missed; make clients reconnect.
+                self._close_all()
+            await asyncio.sleep(self._resubscribe_delay(failures))
+            failures += 1
+
+    @staticmethod
+    def _resubscribe_delay(failures: int) -> float:
+        return float(
+            min(
+                RESUBSCRIBE_BACKOFF_CAP_SECONDS,
+                RESUBSCRIBE_BACKOFF_BASE_SECONDS * (2 ** min(failures, 16)),
+            )
+        )
+
+    def _close_all(self) -> None:
+        for conns in list(self._connections.values()):
+            for connection in list(conns):
+                connection.close()
+        self._connections.clear()
+
+
+_hub: Optional[SSEFanoutHub] = None
+
+
+def get_fanout_hub() -> Optional[SSEFanoutHub]:
+    """Return this worker's running hub, or None when disabled or not started."""
+    return _hub
+
+
+async def start_fanout_hub() -> Optional[SSEFanoutHub]:
+    """Start the hub on the shared Broadcaster. Call from the lifespan after connect."""
+    global _hub
+    from app.core.broadcast import get_broadcast, is_broadcast_initialized
+
+    if not settings.sse_fanout_enabled or not is_broadcast_initialized():
+        return None
+    if _hub is None:
+        hub = SSEFanoutHub(settings.sse_fanout_shards, settings.sse_connection_queue_size)
+        await hub.start(get_broadcast())
+        _hub = hub
+        logger.info("[SSE-HUB] Subscribed to %s shard channels", hub.shards)
+    return _hub
+
+
+async def stop_fanout_hub() -> None:
+    global _hub
+    hub, _hub = _hub, None
+    if hub is not None:
+        await hub.stop()
@@ -24,6 +24,7 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.repositories.conversation_repository import ConversationRepository
 from app.repositories.factory import RepositoryFactory
 from app.services.messaging.events import (
@@ -34,7 +35,7 @@ from app.services.messaging.events import (
     build_read_receipt_event,
     build_typing_status_event,
 )
-from app.services.messaging.sse_stream import publish_to_user
+from app.services.messaging.sse_stream import publish_to_user, publish_to_users
 from app.utils.privacy import format_private_display_name
 
 logger = logging.getLogger(__name__)
@@ -42,12 +43,18 @@ logger = logging.getLogger(__name__)
 
 async def _publish_to_users(user_ids: List[str], event: Dict[str, Any]) -> None:
     """
-    Publish an event to multiple users via Broadcaster.
+    Publish an event to multiple users.
+
+    Recipients are batched into one pipelined publish when the fan-out hub is
+    enabled; otherwise each user's channel is published individually.
 
     Args:
         user_ids: List of user ULIDs to publish to
         event: Event dict to publish
     """
+    if settings.sse_fanout_enabled:
+        await publish_to_users(user_ids, event)
+        return
     for user_id in user_ids:
         await publish_to_user(user_id, event)
 
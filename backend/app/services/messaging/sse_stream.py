@@ -12,6 +12,11 @@ Architecture:
   N SSE clients → 1 Broadcaster instance → 1 Redis connection per worker
   (Previously: N SSE clients → N Redis connections → maxclients ceiling)
 
+With ``settings.sse_fanout_enabled`` (default) streams attach to the per-worker
+sharded fan-out hub (see fanout_hub.py) instead of subscribing ``user:{id}``
+channels individually, and publishers send one message per shard for all
+recipients of an event.
+
 Event types:
 - new_message: Includes SSE `id:` field for Last-Event-ID tracking
 - reaction_update, read_receipt, typing_status, message_edited: No `id:` field
@@ -20,10 +25,11 @@ Event types:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from datetime import datetime, timezone
 import json
 import logging
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Iterable, List, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy import text
@@ -31,8 +37,15 @@ from sqlalchemy.orm import Session
 
 from app.core.broadcast import get_broadcast
 from app.core.config import settings
+from app.core.redis import get_async_redis_client
 from app.models.message import Message
 from app.repositories.message_repository import MessageRepository
+from app.services.messaging.fanout_hub import (
+    build_envelope,
+    get_fanout_hub,
+    group_by_shard,
+    shard_channel,
+)
 
 if TYPE_CHECKING:
     pass
@@ -105,6 +118,12 @@ async def create_sse_stream(
         ),
     }
 
+    if settings.sse_fanout_enabled:
+        async with contextlib.aclosing(_stream_from_hub(user_id)) as hub_events:
+            async for sse_event in hub_events:
+                yield sse_event
+        return
+
     # Step 3: Subscribe via shared Broadcaster (1 Redis connection per worker)
     try:
         broadcast = get_broadcast()
@@ -174,15 +193,7 @@ async def create_sse_stream(
                         # No message within timeout - send heartbeat
                         logger.debug("[SSE-HEARTBEAT] Sending heartbeat for user %s", user_id)
                         try:
-                            yield {
-                                "event": "heartbeat",
-                                "data": json.dumps(
-                                    {
-                                        "type": "heartbeat",
-                                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                                    }
-                                ),
-                            }
+                            yield _heartbeat_event()
                         except GeneratorExit:
                             logger.info("[SSE-STREAM] Client disconnected for user %s", user_id)
                             return  # Exit cleanly
@@ -204,15 +215,7 @@ async def create_sse_stream(
         else:
             # Broadcast not initialized or other runtime error
             logger.error("[SSE-STREAM] Broadcast error for user %s: %s", user_id, e)
-            yield {
-                "event": "error",
-                "data": json.dumps(
-                    {
-                        "error": "service_unavailable",
-                        "message": "Real-time service temporarily unavailable",
-                    }
-                ),
-            }
+            yield _service_unavailable_event()
     except Exception as e:
         logger.error(
             "[SSE-STREAM] Unexpected error for user %s: %s",
@@ -225,16 +228,125 @@ async def create_sse_stream(
     logger.info("[SSE-STREAM] User %s unsubscribed from channel %s", user_id, channel)
 
 
-async def publish_to_user(user_id: str, message: Dict[str, Any]) -> None:
+async def _stream_from_hub(user_id: str) -> AsyncGenerator[Dict[str, str], None]:
+    """Stream events for one client from the worker's sharded fan-out hub."""
+    hub = get_fanout_hub()
+    if hub is None or not hub.running:
+        logger.error("[SSE-STREAM] Fan-out hub not running for user %s", user_id)
+        yield _service_unavailable_event()
+        return
+
+    connection = hub.register(user_id)
+    try:
+        while True:
+            kind, event = await connection.next_event(HEARTBEAT_INTERVAL)
+            if kind == "message" and event is not None:
+                yield format_redis_event(_copy_for_recipient(event), user_id)
+            elif kind == "timeout":
+                logger.debug("[SSE-HEARTBEAT] Sending heartbeat for user %s", user_id)
+                yield _heartbeat_event()
+            else:
+                if connection.overflowed:
+                    logger.warning(
+                        "[SSE-STREAM] Queue overflow for user %s; closing for catch-up", user_id
+                    )
+                break
+    finally:
+        hub.unregister(connection)
+    logger.info("[SSE-STREAM] User %s detached from fan-out hub", user_id)
+
+
+def _copy_for_recipient(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow-copy a shared event; format_redis_event annotates the payload per user."""
+    copied = dict(event)
+    payload = copied.get("payload")
+    if isinstance(payload, dict):
+        copied["payload"] = dict(payload)
+    return copied
+
+
+def _heartbeat_event() -> Dict[str, str]:
+    return {
+        "event": "heartbeat",
+        "data": json.dumps(
+            {
+                "type": "heartbeat",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+        ),
+    }
+
+
+def _service_unavailable_event() -> Dict[str, str]:
+    return {
+        "event": "error",
+        "data": json.dumps(
+            {
+                "error": "service_unavailable",
+                "message": "Real-time service temporarily unavailable",
+            }
+        ),
+    }
+
+
+async def publish_to_users(user_ids: Iterable[str], message: Dict[str, Any]) -> None:
     """
-    Publish a message to a user's channel via Broadcaster.
+    Publish one event to several users.
 
-    Uses the shared Broadcaster connection for efficient publishing.
+    With the fan-out hub enabled, recipients are grouped by shard and each shard
+    receives a single envelope; all shard PUBLISHes go out in one pipelined round
+    trip. Falls back to the Broadcaster when the async Redis client is unavailable.
+
+    Args:
+        user_ids: Target user ULIDs (duplicates are ignored)
+        message: The message payload (will be JSON serialized)
+    """
+    if not settings.sse_fanout_enabled:
+        for user_id in dict.fromkeys(user_ids):
+            await _publish_to_user_channel(user_id, message)
+        return
+
+    by_shard = group_by_shard(user_ids)
+    if not by_shard:
+        return
+    envelopes = [
+        (shard_channel(shard), build_envelope(recipients, message))
+        for shard, recipients in by_shard.items()
+    ]
+    try:
+        redis_client = await get_async_redis_client()
+        if redis_client is not None:
+            pipe = redis_client.pipeline(transaction=False)
+            for channel, envelope in envelopes:
+                pipe.publish(channel, envelope)
+            await pipe.execute()
+        else:
+            broadcast = get_broadcast()
+            for channel, envelope in envelopes:
+                await broadcast.publish(channel=channel, message=envelope)
+        logger.debug("[SSE-PUBLISH] Published to %s shard(s)", len(envelopes))
+    except RuntimeError as e:
+        logger.warning("[SSE-PUBLISH] Broadcast not initialized, cannot publish: %s", e)
+    except Exception as e:
+        logger.error("[SSE-PUBLISH] Failed to publish to shards %s: %s", sorted(by_shard), e)
+
+
+async def publish_to_user(user_id: str, message: Dict[str, Any]) -> None:
+    """
+    Publish a message to a single user.
 
     Args:
         user_id: The target user's ULID
         message: The message payload (will be JSON serialized)
     """
+    if settings.sse_fanout_enabled:
+        await publish_to_users([user_id], message)
+    else:
+        await _publish_to_user_channel(user_id, message)
+
+
+async def _publish_to_user_channel(user_id: str, message: Dict[str, Any]) -> None:
+    """Publish to the legacy per-user ``user:{id}`` channel via Broadcaster."""
     channel = f"user:{user_id}"
     try:
         broadcast = get_broadcast()
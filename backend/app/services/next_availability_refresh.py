@@ -0,0 +1,63 @@
+# backend/app/services/next_availability_refresh.py
+"""
+Post-commit refresh scheduling for the next-available slot index.
+
+Availability, blackout and booking writes mark the instructor's index rows stale
+inside their own transaction and ask for a refresh here. The
+``availability.refresh_next_available`` task is enqueued only once the session
+commits, so workers never recompute from uncommitted state and rolled-back writes
+enqueue nothing. The periodic sweep still covers anything a lost task misses.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..repositories.factory import RepositoryFactory
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "next_availability_refresh_ids"
+REFRESH_TASK_NAME = "availability.refresh_next_available"
+
+
+def mark_next_availability_stale(db: Session, instructor_id: str) -> None:
+    """Flag an instructor's index rows stale and refresh them after commit."""
+    RepositoryFactory.create_next_availability_repository(db).mark_stale(instructor_id)
+    schedule_next_availability_refresh(db, instructor_id)
+
+
+def schedule_next_availability_refresh(db: Session, instructor_id: str) -> None:
+    """Queue an index refresh for ``instructor_id`` once ``db`` commits."""
+    if not isinstance(db, Session):
+        return
+    pending: Set[str] = db.info.setdefault(_PENDING_KEY, set())
+    pending.add(str(instructor_id))
+
+
+def _enqueue_pending_refreshes(session: Session) -> None:
+    pending: Set[str] = session.info.pop(_PENDING_KEY, set())
+    if not pending:
+        return
+
+    from ..tasks.enqueue import enqueue_task
+
+    for instructor_id in sorted(pending):
+        try:
+            enqueue_task(REFRESH_TASK_NAME, args=(instructor_id,))
+        except Exception as exc:
+            logger.warning(
+                "Failed to enqueue next-availability refresh for %s: %s", instructor_id, exc
+            )
+
+
+def _discard_pending_refreshes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_commit", _enqueue_pending_refreshes)
+event.listen(Session, "after_rollback", _discard_pending_refreshes)
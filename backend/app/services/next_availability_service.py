@@ -0,0 +1,183 @@
+# backend/app/services/next_availability_service.py
+"""
+Next-available slot index.
+
+Maintains ``instructor_next_availability``: the earliest bookable start per
+instructor for each indexed (location type, lesson duration) pair, so search can
+rank by "available soonest" without recomputing availability for every candidate.
+
+Writers never recompute inline. Availability, blackout and booking writes mark an
+instructor's rows stale and enqueue a per-instructor refresh after commit (see
+``next_availability_refresh``); the periodic sweep recomputes whatever is still
+stale, expired or missing. Rows are computed through
+``AvailabilityService.compute_public_availability`` so the index honours the same
+buffers, format tags, blackouts and advance notice as the public availability
+endpoints.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+import logging
+import time as time_module
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.constants import (
+    NEXT_AVAILABILITY_DURATIONS,
+    NEXT_AVAILABILITY_LOCATION_TYPES,
+    NEXT_AVAILABILITY_MAX_AGE_MINUTES,
+)
+from ..core.timezone_utils import get_user_today
+from ..repositories.factory import RepositoryFactory
+from ..utils.time_utils import time_to_minutes
+from .availability_service import AvailabilityService
+from .base import BaseService
+from .timezone_service import TimezoneService
+
+logger = logging.getLogger(__name__)
+
+# Rows older than this are ignored by readers and picked up by the refresh sweep.
+INDEX_MAX_AGE = timedelta(minutes=NEXT_AVAILABILITY_MAX_AGE_MINUTES)
+REFRESH_BATCH_SIZE = 200
+# Keep one sweep shorter than its 5-minute beat interval.
+REFRESH_TIME_BUDGET_SECONDS = 180.0
+
+
+def find_first_bookable_slot(
+    windows_by_date: Mapping[str, Iterable[Tuple[time, time]]],
+    duration_minutes: int,
+    *,
+    skip_dates: Optional[Iterable[date]] = None,
+) -> Optional[Tuple[date, time]]:
+    """Return the earliest aligned start that fits ``duration_minutes``, if any."""
+    skipped = set(skip_dates or ())
+    for date_str in sorted(windows_by_date):
+        day = date.fromisoformat(date_str)
+        if day in skipped:
+            continue
+        for start, end in sorted(windows_by_date[date_str], key=lambda window: window[0]):
+            aligned_start = AvailabilityService._first_aligned_start_in_window(
+                time_to_minutes(start, is_end_time=False),
+                time_to_minutes(end, is_end_time=True),
+                duration_minutes=duration_minutes,
+            )
+            if aligned_start is not None:
+                return day, AvailabilityService._minutes_to_time(aligned_start)
+    return None
+
+
+class NextAvailabilityService(BaseService):
+    """Compute and persist the next-available slot index."""
+
+    def __init__(
+        self,
+        db: Session,
+        availability_service: Optional[AvailabilityService] = None,
+    ) -> None:
+        super().__init__(db)
+        self.availability_service = availability_service or AvailabilityService(db)
+        self.repository = RepositoryFactory.create_next_availability_repository(db)
+        self.user_repository = RepositoryFactory.create_user_repository(db)
+
+    def _compute_rows(self, instructor_id: str) -> List[Dict[str, Any]]:
+        """Compute index rows for one instructor across every indexed combination."""
+        user = self.user_repository.get_by_id(instructor_id)
+        if user is None:
+            return []
+
+        today = get_user_today(user)
+        horizon_end = today + timedelta(days=max(1, settings.public_availability_days) - 1)
+        blackout_dates = {
+            blackout.date
+            for blackout in self.availability_service.repository.get_future_blackout_dates(
+                instructor_id
+            )
+        }
+        computed_at = datetime.now(timezone.utc)
+
+        rows: List[Dict[str, Any]] = []
+        for location_type in NEXT_AVAILABILITY_LOCATION_TYPES:
+            windows_by_date = self.availability_service.compute_public_availability(
+                instructor_id,
+                today,
+                horizon_end,
+                requested_location_type=location_type,
+            )
+            for duration_minutes in NEXT_AVAILABILITY_DURATIONS:
+                slot = find_first_bookable_slot(
+                    windows_by_date, duration_minutes, skip_dates=blackout_dates
+                )
+                next_date, next_start_time = slot if slot is not None else (None, None)
+                rows.append(
+                    {
+                        "location_type": location_type,
+                        "duration_minutes": duration_minutes,
+                        "next_date": next_date,
+                        "next_start_time": next_start_time,
+                        "next_start_at": self._to_utc(next_date, next_start_time, user.timezone),
+                        "horizon_end": horizon_end,
+                        "computed_at": computed_at,
+                    }
+                )
+        return rows
+
+    @staticmethod
+    def _to_utc(
+        next_date: Optional[date], next_start_time: Optional[time], timezone_str: str
+    ) -> Optional[datetime]:
+        if next_date is None or next_start_time is None:
+            return None
+        try:
+            return TimezoneService.local_to_utc(next_date, next_start_time, timezone_str)
+        except ValueError:
+            # Start falls in a DST gap; the row then expires by age only.
+            return None
+
+    @BaseService.measure_operation("refresh_next_availability")
+    def refresh_instructor(self, instructor_id: str) -> int:
+        """Recompute and persist the index rows for one instructor."""
+        with self.transaction():
+            rows = self._compute_rows(instructor_id)
+            return self.repository.replace_for_instructor(instructor_id, rows)
+
+    @BaseService.measure_operation("refresh_stale_next_availability")
+    def refresh_stale(
+        self,
+        limit: int = REFRESH_BATCH_SIZE,
+        time_budget_seconds: float = REFRESH_TIME_BUDGET_SECONDS,
+    ) -> Dict[str, int]:
+        """
+        Refresh stale, expired and missing rows in batches, oldest first.
+
+        Batches continue until nothing is left or the time budget runs out. Each
+        instructor is attempted at most once per sweep; failures are logged and skipped.
+        """
+        deadline = time_module.monotonic() + time_budget_seconds
+        attempted: set[str] = set()
+        refreshed = 0
+        failed = 0
+        while time_module.monotonic() < deadline:
+            now = datetime.now(timezone.utc)
+            instructor_ids = self.repository.list_instructor_ids_needing_refresh(
+                now=now,
+                fresh_after=now - INDEX_MAX_AGE,
+                from_date=now.date() - timedelta(days=1),
+                limit=limit,
+                exclude_ids=attempted,
+            )
+            if not instructor_ids:
+                break
+            for instructor_id in instructor_ids:
+                attempted.add(instructor_id)
+                try:
+                    self.refresh_instructor(instructor_id)
+                    refreshed += 1
+                except Exception as exc:
+                    failed += 1
+                    logger.warning(
+                        "Failed to refresh next-availability index for %s: %s", instructor_id, exc
+                    )
+        return {"candidates": len(attempted), "refreshed": refreshed, "failed": failed}
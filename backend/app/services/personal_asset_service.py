@@ -12,6 +12,7 @@ import base64
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import hashlib
 import logging
 import threading
 from typing import Any, Literal, Optional, Sequence, TypedDict, cast
@@ -29,7 +30,7 @@ from ..monitoring.prometheus_metrics import (
 from ..repositories.user_repository import UserRepository
 from .base import BaseService
 from .cache_service import CacheService, CacheServiceSyncAdapter, get_cache_service
-from .image_processing_service import ImageProcessingService
+from .image_processing_service import EXTRA_FORMAT_CONTENT_TYPES, ImageProcessingService
 from .r2_storage_client import PresignedUrl, R2StorageClient
 from .search.cache_invalidation import invalidate_on_instructor_profile_change
 from .storage_null_client import NullStorageClient
@@ -41,6 +42,7 @@ _STORAGE_SEMAPHORE = threading.Semaphore(5)
 _STORAGE_EXECUTOR = ThreadPoolExecutor(max_workers=5)
 
 AssetPurpose = Literal["profile_picture", "background_check"]
+ProfilePictureSubmission = Literal["processed", "queued"]
 
 
 @dataclass
@@ -83,7 +85,13 @@ class PersonalAssetService(BaseService):
     ) -> None:
         super().__init__(db)
         self.storage = storage if storage is not None else self._build_storage()
-        self.images = images if images is not None else ImageProcessingService()
+        self.images = (
+            images
+            if images is not None
+            else ImageProcessingService(
+                extra_formats=getattr(settings, "profile_picture_extra_formats", ())
+            )
+        )
         self.users = users_repo if users_repo is not None else UserRepository(db)
         raw_cache = cache_service if cache_service is not None else get_cache_service(self.db)
         self.cache = (
@@ -144,6 +152,13 @@ class PersonalAssetService(BaseService):
             "thumb": f"{base}/thumb_200x200.jpg",
         }
 
+    def _profile_picture_extra_keys(self, user_id: str, version: int, fmt: str) -> dict[str, str]:
+        base = self._profile_picture_prefix(user_id, version)
+        return {
+            "display": f"{base}/display_400x400.{fmt}",
+            "thumb": f"{base}/thumb_200x200.{fmt}",
+        }
+
     def _generate_presigned_with_limits(
         self,
         object_key: str,
@@ -246,6 +261,34 @@ class PersonalAssetService(BaseService):
         }
 
     # Finalize flows
+    @BaseService.measure_operation("submit_profile_picture")
+    def submit_profile_picture(self, user: User, temp_object_key: str) -> ProfilePictureSubmission:
+        """
+        Finalize an uploaded profile picture inline, or queue it for a Celery worker.
+
+        With ``profile_picture_async_processing_enabled`` the request only enqueues
+        ``app.tasks.image_tasks.process_profile_picture``; the new version becomes
+        visible once the worker has uploaded every variant.
+        """
+        if not getattr(settings, "profile_picture_async_processing_enabled", False):
+            self.finalize_profile_picture(user, temp_object_key)
+            return "processed"
+
+        from ..tasks.enqueue import enqueue_task
+
+        enqueue_task(
+            "app.tasks.image_tasks.process_profile_picture",
+            args=(user.id, temp_object_key),
+        )
+        logger.info("Queued profile picture processing for user %s", user.id)
+        return "queued"
+
+    def _delete_temp_upload(self, temp_object_key: str) -> None:
+        try:
+            self.storage.delete_object(temp_object_key)
+        except Exception:
+            logger.warning("Failed to delete temp upload: %s", temp_object_key)
+
     @BaseService.measure_operation("finalize_profile_picture")
     def finalize_profile_picture(self, user: User, temp_object_key: str) -> bool:
         # Download temp
@@ -263,6 +306,15 @@ class PersonalAssetService(BaseService):
             else:
                 raise ValueError("Uploaded object not found")
 
+        # Re-uploading the picture we already serve: keep the current version as is
+        content_hash = hashlib.sha256(data).hexdigest()
+        if (user.profile_picture_version or 0) > 0 and (
+            getattr(user, "profile_picture_hash", None) == content_hash
+        ):
+            logger.info("Profile picture unchanged for user %s; skipping processing", user.id)
+            self._delete_temp_upload(temp_object_key)
+            return True
+
         processed = self.images.process_profile_picture(data, "application/octet-stream")
 
         # Increment version
@@ -270,9 +322,9 @@ class PersonalAssetService(BaseService):
         keys = self._profile_picture_keys(user.id, next_version)
 
         # Upload variants
-        def _safe_upload(object_key: str, blob: bytes) -> bool:
+        def _safe_upload(object_key: str, blob: bytes, content_type: str = "image/jpeg") -> bool:
             try:
-                ok, _ = self.storage.upload_bytes(object_key, blob, "image/jpeg")
+                ok, _ = self.storage.upload_bytes(object_key, blob, content_type)
                 if not ok and bool(getattr(settings, "is_testing", False)):
                     logger.warning(
                         "Upload returned false in test mode for %s; treating as success",
@@ -295,6 +347,13 @@ class PersonalAssetService(BaseService):
         if not (ok1 and ok2 and ok3):
             raise RuntimeError("Failed to upload processed images")
 
+        # Extra formats are best-effort; the JPEG variants remain canonical
+        for fmt, blobs in getattr(processed, "extra_formats", {}).items():
+            extra_keys = self._profile_picture_extra_keys(user.id, next_version, fmt)
+            for variant, blob in blobs.items():
+                if not _safe_upload(extra_keys[variant], blob, EXTRA_FORMAT_CONTENT_TYPES[fmt]):
+                    logger.warning("Failed to upload %s %s variant for %s", fmt, variant, user.id)
+
         # Update user via repository
         repo = self.users
         updated = repo.update_profile(
@@ -302,16 +361,14 @@ class PersonalAssetService(BaseService):
             profile_picture_key=keys["original"],
             profile_picture_uploaded_at=datetime.now(timezone.utc),
             profile_picture_version=next_version,
+            profile_picture_hash=content_hash,
         )
         if not updated:
             raise RuntimeError("Failed to update user record with profile picture metadata")
         invalidate_cached_user_by_id_sync(user.id, self.db)
 
         # Best-effort cleanup of temp
-        try:
-            self.storage.delete_object(temp_object_key)
-        except Exception:
-            logger.warning("Failed to delete temp upload: %s", temp_object_key)
+        self._delete_temp_upload(temp_object_key)
 
         self._invalidate_profile_picture_caches(user)
 
@@ -323,8 +380,10 @@ class PersonalAssetService(BaseService):
         version = user.profile_picture_version or 0
         if version <= 0:
             return True
-        keys = self._profile_picture_keys(user.id, version)
-        for k in keys.values():
+        keys = list(self._profile_picture_keys(user.id, version).values())
+        for fmt in EXTRA_FORMAT_CONTENT_TYPES:
+            keys.extend(self._profile_picture_extra_keys(user.id, version, fmt).values())
+        for k in keys:
             try:
                 self.storage.delete_object(k)
             except Exception:
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from typing import Callable, Iterator, cast
 import uuid
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.repositories.analytics_repository import CategoryBookingRow
+from app.repositories.analytics_rollup_repository import (
+    AnalyticsRollupRepository,
+    FunnelRollupTotals,
+    InstructorRollupTotals,
+)
 from app.repositories.factory import RepositoryFactory
 from app.schemas.admin_analytics import (
     Alert,
@@ -44,8 +51,10 @@ from app.schemas.admin_analytics import (
     SupplyMetrics,
     UnfulfilledSearch,
 )
+from app.services.analytics_rollup_service import ROLLUP_NAME
 from app.services.base import BaseService
-from app.utils.bitset import unpack_indexes
+from app.services.timezone_service import TimezoneService
+from app.utils.bitset import popcount
 
 ALERT_THRESHOLDS = {
     "revenue_drop_pct": Decimal("20"),
@@ -69,6 +78,24 @@ class _BookingSummary:
     gmv: Decimal
     instructor_payouts: Decimal
 
+    def __add__(self, other: _BookingSummary) -> _BookingSummary:
+        return _BookingSummary(
+            total=self.total + other.total,
+            completed=self.completed + other.completed,
+            cancelled=self.cancelled + other.cancelled,
+            gmv=self.gmv + other.gmv,
+            instructor_payouts=self.instructor_payouts + other.instructor_payouts,
+        )
+
+
+@dataclass(frozen=True)
+class _RollupWindow:
+    """Whole UTC days ``[first_day, end_day)`` read from rollups plus raw edge ranges."""
+
+    first_day: date
+    end_day: date
+    raw_ranges: tuple[tuple[datetime, datetime], ...]
+
 
 @dataclass
 class _CategoryDemand:
@@ -92,6 +119,13 @@ class PlatformAnalyticsService(BaseService):
     def __init__(self, db: Session) -> None:
         super().__init__(db)
         self.analytics_repo = RepositoryFactory.create_analytics_repository(db)
+        self.rollup_repo: AnalyticsRollupRepository = (
+            RepositoryFactory.create_analytics_rollup_repository(db)
+        )
+        self.cohort_repo = RepositoryFactory.create_cohort_analytics_repository(db)
+        self._rollup_coverage_loaded = False
+        self._rollup_covered_until: date | None = None
+        self._funnel_rollup_cache: dict[tuple[date, date], FunnelRollupTotals] = {}
 
     @BaseService.measure_operation("admin.analytics.revenue_dashboard")
     def revenue_dashboard(
@@ -159,23 +193,48 @@ class PlatformAnalyticsService(BaseService):
         segment_by: FunnelSegmentBy | None,
     ) -> BookingFunnel:
         start, end = _resolve_period(RevenuePeriod(period.value))
-        search_count = self.analytics_repo.count_search_events(start=start, end=end)
-        view_profile_count = self.analytics_repo.count_search_interactions(
-            start=start, end=end, interaction_type="view_profile"
+        search_count = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._funnel_rollups(window).searches,
+            lambda s, e: self.analytics_repo.count_search_events(start=s, end=e),
         )
-        start_booking_count = self.analytics_repo.count_bookings(
-            start=start, end=end, date_field="created_at"
+        view_profile_count = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._funnel_rollups(window).profile_views,
+            lambda s, e: self.analytics_repo.count_search_interactions(
+                start=s, end=e, interaction_type="view_profile"
+            ),
         )
-        payment_count = self.analytics_repo.count_payment_events(
-            start=start,
-            end=end,
-            event_types=["auth_succeeded", "captured"],
+        start_booking_count = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._funnel_rollups(window).bookings_created,
+            lambda s, e: self.analytics_repo.count_bookings(
+                start=s, end=e, date_field="created_at"
+            ),
         )
-        confirmed_count = self.analytics_repo.count_bookings(
-            start=start,
-            end=end,
-            date_field="created_at",
-            statuses=["CONFIRMED", "COMPLETED"],
+        payment_count = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._funnel_rollups(window).payment_successes,
+            lambda s, e: self.analytics_repo.count_payment_events(
+                start=s,
+                end=e,
+                event_types=["auth_succeeded", "captured"],
+            ),
+        )
+        confirmed_count = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._funnel_rollups(window).bookings_confirmed,
+            lambda s, e: self.analytics_repo.count_bookings(
+                start=s,
+                end=e,
+                date_field="created_at",
+                statuses=["CONFIRMED", "COMPLETED"],
+            ),
         )
 
         stages = _build_funnel_stages(
@@ -246,30 +305,53 @@ class PlatformAnalyticsService(BaseService):
             region_ids=region_ids or None,
         )
 
-        total_searches = self.analytics_repo.count_search_events(start=start, end=end)
+        total_searches = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._funnel_rollups(window).searches,
+            lambda s, e: self.analytics_repo.count_search_events(start=s, end=e),
+        )
         unique_searchers = self.analytics_repo.count_unique_searchers(start=start, end=end)
-        booking_attempts = self.analytics_repo.count_bookings(
-            start=start,
-            end=end,
-            date_field="created_at",
-            instructor_ids=instructor_ids or None,
+        booking_attempts = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._instructor_rollups(window, instructor_ids).bookings_created,
+            lambda s, e: self.analytics_repo.count_bookings(
+                start=s,
+                end=e,
+                date_field="created_at",
+                instructor_ids=instructor_ids or None,
+            ),
         )
-        successful_bookings = self.analytics_repo.count_bookings(
-            start=start,
-            end=end,
-            date_field="created_at",
-            instructor_ids=instructor_ids or None,
-            statuses=["CONFIRMED", "COMPLETED"],
+        successful_bookings = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._instructor_rollups(window, instructor_ids).bookings_confirmed,
+            lambda s, e: self.analytics_repo.count_bookings(
+                start=s,
+                end=e,
+                date_field="created_at",
+                instructor_ids=instructor_ids or None,
+                statuses=["CONFIRMED", "COMPLETED"],
+            ),
         )
-        unfulfilled_searches = self.analytics_repo.count_search_events_zero_results(
-            start=start, end=end
+        unfulfilled_searches = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._funnel_rollups(window).zero_result_searches,
+            lambda s, e: self.analytics_repo.count_search_events_zero_results(start=s, end=e),
         )
 
-        booked_minutes = self.analytics_repo.sum_booking_duration_minutes(
-            start=start,
-            end=end,
-            statuses=["COMPLETED"],
-            instructor_ids=instructor_ids or None,
+        booked_minutes = self._sum_with_rollups(
+            start,
+            end,
+            lambda window: self._instructor_rollups(window, instructor_ids).completed_minutes,
+            lambda s, e: self.analytics_repo.sum_booking_duration_minutes(
+                start=s,
+                end=e,
+                statuses=["COMPLETED"],
+                instructor_ids=instructor_ids or None,
+            ),
         )
         booked_hours = Decimal(booked_minutes) / Decimal("60")
         supply_utilization = _safe_div(booked_hours, availability_hours)
@@ -320,16 +402,22 @@ class PlatformAnalyticsService(BaseService):
     ) -> CategoryPerformance:
         start, end = _resolve_category_period(period)
         previous_start, previous_end = _resolve_previous_period(start, end)
-        current_rows = self.analytics_repo.list_category_booking_rows(start=start, end=end)
-        previous_rows = self.analytics_repo.list_category_booking_rows(
-            start=previous_start, end=previous_end
-        )
-        review_ratings = self._category_review_ratings(start, end)
+        if self._rollups_covered_until() is not None:
+            current_metrics = self._category_metrics_with_rollups(start, end, with_ratings=True)
+            previous_metrics = self._category_metrics_with_rollups(
+                previous_start, previous_end, with_ratings=False
+            )
+        else:
+            current_rows = self.analytics_repo.list_category_booking_rows(start=start, end=end)
+            previous_rows = self.analytics_repo.list_category_booking_rows(
+                start=previous_start, end=previous_end
+            )
+            review_ratings = self._category_review_ratings(start, end)
 
-        current_metrics = self._build_category_metrics(current_rows, review_ratings, start, end)
-        previous_metrics = self._build_category_metrics(
-            previous_rows, {}, previous_start, previous_end
-        )
+            current_metrics = self._build_category_metrics(current_rows, review_ratings, start, end)
+            previous_metrics = self._build_category_metrics(
+                previous_rows, {}, previous_start, previous_end
+            )
         metrics_with_growth = []
         for metric in current_metrics.values():
             prev = previous_metrics.get(metric.category_id)
@@ -371,31 +459,26 @@ class PlatformAnalyticsService(BaseService):
     ) -> CohortRetention:
         now = datetime.now(timezone.utc)
         period_start = _start_of_period(now, cohort_period)
+        counts = self.cohort_repo.cohort_activity_counts(
+            role_name=user_type.value,
+            unit=cohort_period.value,
+            start=_shift_period(period_start, cohort_period, 1 - periods_back),
+            end=_shift_period(period_start, cohort_period, 1),
+            activity_end=_shift_period(period_start, cohort_period, periods_back),
+        )
         cohorts: list[CohortData] = []
         for offset in range(periods_back):
             start = _shift_period(period_start, cohort_period, -offset)
-            end = _shift_period(start, cohort_period, 1)
-            users = self.analytics_repo.list_users_created_between(
-                role_name=user_type.value,
-                start=start,
-                end=end,
-            )
-            user_ids = [user.id for user in users]
+            cohort_size = counts.cohort_sizes.get(start, 0)
             retention = []
             for period_index in range(periods_back):
-                period_start_idx = _shift_period(start, cohort_period, period_index)
-                period_end_idx = _shift_period(start, cohort_period, period_index + 1)
-                retained = self.analytics_repo.list_user_ids_with_bookings(
-                    user_ids=user_ids,
-                    role=user_type.value,
-                    start=period_start_idx,
-                    end=period_end_idx,
-                )
-                retention.append(_percentage(Decimal(len(retained)), Decimal(len(user_ids))))
+                period_key = (start, _shift_period(start, cohort_period, period_index))
+                active = counts.active_users.get(period_key, 0)
+                retention.append(_percentage(Decimal(active), Decimal(cohort_size)))
             cohorts.append(
                 CohortData(
                     cohort_label=_format_cohort_label(start, cohort_period),
-                    cohort_size=len(user_ids),
+                    cohort_size=cohort_size,
                     retention=[_quantize(value) for value in retention],
                 )
             )
@@ -452,7 +535,82 @@ class PlatformAnalyticsService(BaseService):
             by_category=by_category,
         )
 
+    def _rollups_covered_until(self) -> date | None:
+        """First UTC day the rollups do not cover yet; None when they are not in use."""
+        if not settings.analytics_rollups_enabled:
+            return None
+        if not self._rollup_coverage_loaded:
+            watermark = self.rollup_repo.get_watermark(ROLLUP_NAME)
+            self._rollup_covered_until = (
+                watermark.astimezone(timezone.utc).date() if watermark is not None else None
+            )
+            self._rollup_coverage_loaded = True
+        return self._rollup_covered_until
+
+    def _rollup_window(self, start: datetime, end: datetime) -> _RollupWindow | None:
+        covered_until = self._rollups_covered_until()
+        if covered_until is None:
+            return None
+        return _split_rollup_window(start, end, covered_until)
+
+    def _sum_with_rollups(
+        self,
+        start: datetime,
+        end: datetime,
+        from_rollups: Callable[[_RollupWindow], int],
+        from_raw: Callable[[datetime, datetime], int],
+    ) -> int:
+        window = self._rollup_window(start, end)
+        if window is None:
+            return from_raw(start, end)
+        return from_rollups(window) + sum(from_raw(s, e) for s, e in window.raw_ranges)
+
+    def _funnel_rollups(self, window: _RollupWindow) -> FunnelRollupTotals:
+        key = (window.first_day, window.end_day)
+        if key not in self._funnel_rollup_cache:
+            self._funnel_rollup_cache[key] = self.rollup_repo.sum_funnel_rollups(
+                start_day=window.first_day, end_day=window.end_day
+            )
+        return self._funnel_rollup_cache[key]
+
+    def _instructor_rollups(
+        self, window: _RollupWindow, instructor_ids: list[str]
+    ) -> InstructorRollupTotals:
+        return self.rollup_repo.sum_instructor_rollups(
+            start_day=window.first_day,
+            end_day=window.end_day,
+            instructor_ids=instructor_ids or None,
+        )
+
     def _summarize_bookings(self, start: datetime, end: datetime) -> _BookingSummary:
+        window = self._rollup_window(start, end)
+        if window is None:
+            return self._summarize_raw_bookings(start, end)
+        summary = _BookingSummary(
+            total=0,
+            completed=0,
+            cancelled=0,
+            gmv=Decimal("0"),
+            instructor_payouts=Decimal("0"),
+        )
+        for totals in self.rollup_repo.sum_booking_rollups(
+            start_day=window.first_day, end_day=window.end_day
+        ):
+            status = totals.status.upper()
+            summary.total += totals.bookings
+            if status == "COMPLETED":
+                summary.completed += totals.bookings
+                summary.gmv += totals.gmv
+                summary.instructor_payouts += Decimal(totals.instructor_payout_cents) / Decimal(
+                    "100"
+                )
+            elif status == "CANCELLED":
+                summary.cancelled += totals.bookings
+        for raw_start, raw_end in window.raw_ranges:
+            summary += self._summarize_raw_bookings(raw_start, raw_end)
+        return summary
+
+    def _summarize_raw_bookings(self, start: datetime, end: datetime) -> _BookingSummary:
         bookings = self.analytics_repo.list_bookings_by_start(start=start, end=end)
         total = len(bookings)
         completed = 0
@@ -480,20 +638,34 @@ class PlatformAnalyticsService(BaseService):
     def _build_revenue_breakdown(
         self, start: datetime, end: datetime, breakdown_by: RevenueBreakdownBy
     ) -> list[RevenuePeriodBreakdown]:
+        window = self._rollup_window(start, end)
+        raw_ranges = ((start, end),) if window is None else window.raw_ranges
         if breakdown_by == RevenueBreakdownBy.CATEGORY:
-            rows = self.analytics_repo.list_category_booking_rows(start=start, end=end)
             bucket: dict[str, dict[str, Decimal | int]] = {}
-            for row in rows:
-                entry = bucket.setdefault(
-                    row.category_name,
-                    {"gmv": Decimal("0"), "revenue": Decimal("0"), "bookings": 0},
-                )
-                entry["bookings"] = int(entry["bookings"]) + 1
-                if row.status.upper() == "COMPLETED":
-                    gmv = _decimal(row.total_price)
-                    payout = Decimal(int(row.instructor_payout_amount or 0)) / Decimal("100")
-                    entry["gmv"] = Decimal(entry["gmv"]) + gmv
-                    entry["revenue"] = Decimal(entry["revenue"]) + (gmv - payout)
+            if window is not None:
+                for totals in self.rollup_repo.sum_booking_rollups(
+                    start_day=window.first_day, end_day=window.end_day, by_category=True
+                ):
+                    _add_revenue(
+                        bucket,
+                        str(totals.category_name),
+                        totals.status,
+                        totals.bookings,
+                        totals.gmv,
+                        totals.instructor_payout_cents,
+                    )
+            for raw_start, raw_end in raw_ranges:
+                for row in self.analytics_repo.list_category_booking_rows(
+                    start=raw_start, end=raw_end
+                ):
+                    _add_revenue(
+                        bucket,
+                        row.category_name,
+                        row.status,
+                        1,
+                        _decimal(row.total_price),
+                        int(row.instructor_payout_amount or 0),
+                    )
             return [
                 RevenuePeriodBreakdown(
                     period_label=label,
@@ -504,27 +676,35 @@ class PlatformAnalyticsService(BaseService):
                 for label, values in bucket.items()
             ]
 
-        bookings = self.analytics_repo.list_bookings_by_start(start=start, end=end)
-        buckets: dict[str, dict[str, Decimal | int]] = {}
-        for booking in bookings:
-            timestamp = booking.booking_start_utc
+        def period_label(timestamp: datetime) -> str:
             if breakdown_by == RevenueBreakdownBy.WEEK:
-                period_label = _week_label(timestamp)
-            else:
-                period_label = timestamp.date().isoformat()
-            entry = buckets.setdefault(
-                period_label,
-                {"gmv": Decimal("0"), "revenue": Decimal("0"), "bookings": 0},
-            )
-            entry["bookings"] = int(entry["bookings"]) + 1
-            if (booking.status or "").upper() == "COMPLETED":
-                gmv = _decimal(booking.total_price)
+                return _week_label(timestamp)
+            return timestamp.date().isoformat()
+
+        buckets: dict[str, dict[str, Decimal | int]] = {}
+        if window is not None:
+            for totals in self.rollup_repo.sum_booking_rollups(
+                start_day=window.first_day, end_day=window.end_day, by_day=True
+            ):
+                _add_revenue(
+                    buckets,
+                    period_label(TimezoneService.utc_day_start(cast(date, totals.day))),
+                    totals.status,
+                    totals.bookings,
+                    totals.gmv,
+                    totals.instructor_payout_cents,
+                )
+        for raw_start, raw_end in raw_ranges:
+            for booking in self.analytics_repo.list_bookings_by_start(start=raw_start, end=raw_end):
                 pd = booking.payment_detail
-                payout = Decimal(int((pd.instructor_payout_amount if pd else None) or 0)) / Decimal(
-                    "100"
+                _add_revenue(
+                    buckets,
+                    period_label(booking.booking_start_utc),
+                    booking.status or "",
+                    1,
+                    _decimal(booking.total_price),
+                    int((pd.instructor_payout_amount if pd else None) or 0),
                 )
-                entry["gmv"] = Decimal(entry["gmv"]) + gmv
-                entry["revenue"] = Decimal(entry["revenue"]) + (gmv - payout)
 
         return [
             RevenuePeriodBreakdown(
@@ -558,6 +738,13 @@ class PlatformAnalyticsService(BaseService):
     def _availability_hours(
         self, *, instructor_ids: list[str], start: datetime, end: datetime
     ) -> Decimal:
+        if self._rollups_covered_until() is not None:
+            slots = self.rollup_repo.sum_available_slots(
+                instructor_ids=instructor_ids,
+                start_date=start.date(),
+                end_date=end.date(),
+            )
+            return Decimal(slots) * Decimal("0.5")
         days = self.analytics_repo.list_availability_days(
             instructor_ids=instructor_ids,
             start_date=start.date(),
@@ -567,20 +754,19 @@ class PlatformAnalyticsService(BaseService):
         for day in days:
             bits = day.bits or b""
             if bits:
-                slots += len(unpack_indexes(bits))
+                slots += popcount(bits)
         return Decimal(slots) * Decimal("0.5")
 
     def _build_supply_gaps(
         self, start: datetime, end: datetime, location: str | None
     ) -> list[SupplyGap]:
-        rows = self.analytics_repo.list_category_booking_rows(start=start, end=end)
         category_counts: dict[str, _CategoryDemand] = {}
-        for row in rows:
-            entry = category_counts.get(row.category_id)
+        for category_id, category_name, bookings in self._category_booking_counts(start, end):
+            entry = category_counts.get(category_id)
             if entry is None:
-                entry = _CategoryDemand(name=row.category_name, demand=Decimal("0"))
-                category_counts[row.category_id] = entry
-            entry.demand += Decimal("1")
+                entry = _CategoryDemand(name=category_name, demand=Decimal("0"))
+                category_counts[category_id] = entry
+            entry.demand += Decimal(bookings)
         gaps: list[SupplyGap] = []
         for category_id, values in category_counts.items():
             demand_score = values.demand
@@ -597,6 +783,20 @@ class PlatformAnalyticsService(BaseService):
             )
         return gaps
 
+    def _category_booking_counts(
+        self, start: datetime, end: datetime
+    ) -> Iterator[tuple[str, str, int]]:
+        """Yield ``(category_id, category_name, bookings)`` groups for the period."""
+        window = self._rollup_window(start, end)
+        if window is not None:
+            for totals in self.rollup_repo.sum_booking_rollups(
+                start_day=window.first_day, end_day=window.end_day, by_category=True
+            ):
+                yield str(totals.category_id), str(totals.category_name), totals.bookings
+        for raw_start, raw_end in ((start, end),) if window is None else window.raw_ranges:
+            for row in self.analytics_repo.list_category_booking_rows(start=raw_start, end=raw_end):
+                yield row.category_id, row.category_name, 1
+
     def _build_top_unfulfilled(self, start: datetime, end: datetime) -> list[UnfulfilledSearch]:
         rows = self.analytics_repo.list_top_unfulfilled_searches(start=start, end=end)
         return [
@@ -653,28 +853,89 @@ class PlatformAnalyticsService(BaseService):
         metrics: dict[str, _CategoryAccumulator] = {}
         student_counts: dict[str, dict[str, int]] = {}
         for row in rows:
-            entry = metrics.get(row.category_id)
-            if entry is None:
-                entry = _CategoryAccumulator(
-                    category_id=row.category_id,
-                    category_name=row.category_name,
-                    bookings=0,
-                    gmv=Decimal("0"),
-                    payouts=Decimal("0"),
-                    completed=0,
-                )
-                metrics[row.category_id] = entry
-            entry.bookings += 1
-            if row.status.upper() == "COMPLETED":
-                entry.completed += 1
-                gmv = _decimal(row.total_price)
-                payout = Decimal(int(row.instructor_payout_amount or 0)) / Decimal("100")
-                entry.gmv += gmv
-                entry.payouts += payout
+            _add_category_bookings(
+                metrics,
+                row.category_id,
+                row.category_name,
+                row.status,
+                1,
+                _decimal(row.total_price),
+                int(row.instructor_payout_amount or 0),
+            )
             student_counts.setdefault(row.category_id, {})[row.student_id] = (
                 student_counts.get(row.category_id, {}).get(row.student_id, 0) + 1
             )
 
+        repeat_rates: dict[str, Decimal] = {}
+        distinct_students: dict[str, int] = {}
+        for category_id in metrics:
+            students = student_counts.get(category_id, {})
+            repeaters = len([count for count in students.values() if count > 1])
+            repeat_rates[category_id] = _percentage(Decimal(repeaters), Decimal(len(students)))
+            distinct_students[category_id] = self.analytics_repo.count_students_for_category(
+                start=start,
+                end=end,
+                category_id=category_id,
+            )
+        return self._finalize_category_metrics(
+            metrics, review_ratings, repeat_rates, distinct_students
+        )
+
+    def _category_metrics_with_rollups(
+        self, start: datetime, end: datetime, *, with_ratings: bool
+    ) -> dict[str, CategoryMetrics]:
+        window = self._rollup_window(start, end)
+        metrics: dict[str, _CategoryAccumulator] = {}
+        if window is not None:
+            for totals in self.rollup_repo.sum_booking_rollups(
+                start_day=window.first_day, end_day=window.end_day, by_category=True
+            ):
+                _add_category_bookings(
+                    metrics,
+                    str(totals.category_id),
+                    str(totals.category_name),
+                    totals.status,
+                    totals.bookings,
+                    totals.gmv,
+                    totals.instructor_payout_cents,
+                )
+        for raw_start, raw_end in ((start, end),) if window is None else window.raw_ranges:
+            for row in self.analytics_repo.list_category_booking_rows(start=raw_start, end=raw_end):
+                _add_category_bookings(
+                    metrics,
+                    row.category_id,
+                    row.category_name,
+                    row.status,
+                    1,
+                    _decimal(row.total_price),
+                    int(row.instructor_payout_amount or 0),
+                )
+
+        # Distinct-student counts are not additive across days, so they come
+        # from one grouped query over the whole period.
+        student_stats = self.analytics_repo.category_student_counts(start=start, end=end)
+        repeat_rates = {
+            category_id: _percentage(Decimal(repeaters), Decimal(students))
+            for category_id, (students, repeaters) in student_stats.items()
+        }
+        distinct_students = {
+            category_id: students for category_id, (students, _) in student_stats.items()
+        }
+        review_ratings: dict[str, Decimal] = {}
+        if with_ratings and metrics:
+            avg_rating = Decimal(str(self.analytics_repo.avg_review_rating(start=start, end=end)))
+            review_ratings = dict.fromkeys(metrics, avg_rating)
+        return self._finalize_category_metrics(
+            metrics, review_ratings, repeat_rates, distinct_students
+        )
+
+    def _finalize_category_metrics(
+        self,
+        metrics: dict[str, _CategoryAccumulator],
+        review_ratings: dict[str, Decimal],
+        repeat_rates: dict[str, Decimal],
+        student_counts: dict[str, int],
+    ) -> dict[str, CategoryMetrics]:
         results: dict[str, CategoryMetrics] = {}
         for category_id, values in metrics.items():
             gmv = values.gmv
@@ -684,15 +945,7 @@ class PlatformAnalyticsService(BaseService):
             completed = values.completed
             avg_price = _safe_div(gmv, Decimal(bookings))
             conversion_rate = _percentage(Decimal(completed), Decimal(bookings))
-            students = student_counts.get(category_id, {})
-            repeaters = len([count for count in students.values() if count > 1])
-            repeat_rate = _percentage(Decimal(repeaters), Decimal(len(students)))
             instructor_count = self.analytics_repo.count_instructors_for_category(category_id)
-            student_count = self.analytics_repo.count_students_for_category(
-                start=start,
-                end=end,
-                category_id=category_id,
-            )
             avg_rating = review_ratings.get(category_id, Decimal("0"))
             results[category_id] = CategoryMetrics(
                 category_id=category_id,
@@ -703,9 +956,9 @@ class PlatformAnalyticsService(BaseService):
                 avg_price=_quantize(avg_price),
                 avg_rating=_quantize(avg_rating),
                 instructor_count=instructor_count,
-                student_count=student_count,
+                student_count=student_counts.get(category_id, 0),
                 conversion_rate=_quantize(conversion_rate),
-                repeat_rate=_quantize(repeat_rate),
+                repeat_rate=_quantize(repeat_rates.get(category_id, Decimal("0"))),
                 growth_pct=Decimal("0"),
                 rank_change=0,
             )
@@ -923,6 +1176,78 @@ def _percentage(numerator: Decimal, denominator: Decimal) -> Decimal:
     return (numerator / denominator) * Decimal("100")
 
 
+def _split_rollup_window(
+    start: datetime, end: datetime, covered_until: date
+) -> _RollupWindow | None:
+    """
+    Split ``[start, end]`` into whole rollup days and raw edge ranges.
+
+    Raw ranges keep the repository's inclusive end, so the tail range also picks
+    up rows stamped exactly at ``end`` as the raw-only path does.
+    """
+    first_day = (
+        start.date()
+        if start == TimezoneService.utc_day_start(start.date())
+        else start.date() + timedelta(1)
+    )
+    end_day = min(end.date(), covered_until)
+    if first_day >= end_day:
+        return None
+    raw_ranges = []
+    if start < TimezoneService.utc_day_start(first_day):
+        raw_ranges.append(
+            (start, TimezoneService.utc_day_start(first_day) - timedelta(microseconds=1))
+        )
+    raw_ranges.append((TimezoneService.utc_day_start(end_day), end))
+    return _RollupWindow(first_day=first_day, end_day=end_day, raw_ranges=tuple(raw_ranges))
+
+
+def _add_revenue(
+    buckets: dict[str, dict[str, Decimal | int]],
+    label: str,
+    status: str,
+    bookings: int,
+    gmv: Decimal,
+    payout_cents: int,
+) -> None:
+    entry = buckets.setdefault(
+        label,
+        {"gmv": Decimal("0"), "revenue": Decimal("0"), "bookings": 0},
+    )
+    entry["bookings"] = int(entry["bookings"]) + bookings
+    if status.upper() == "COMPLETED":
+        payout = Decimal(payout_cents) / Decimal("100")
+        entry["gmv"] = Decimal(entry["gmv"]) + gmv
+        entry["revenue"] = Decimal(entry["revenue"]) + (gmv - payout)
+
+
+def _add_category_bookings(
+    metrics: dict[str, _CategoryAccumulator],
+    category_id: str,
+    category_name: str,
+    status: str,
+    bookings: int,
+    gmv: Decimal,
+    payout_cents: int,
+) -> None:
+    entry = metrics.get(category_id)
+    if entry is None:
+        entry = _CategoryAccumulator(
+            category_id=category_id,
+            category_name=category_name,
+            bookings=0,
+            gmv=Decimal("0"),
+            payouts=Decimal("0"),
+            completed=0,
+        )
+        metrics[category_id] = entry
+    entry.bookings += bookings
+    if status.upper() == "COMPLETED":
+        entry.completed += bookings
+        entry.gmv += gmv
+        entry.payouts += Decimal(payout_cents) / Decimal("100")
+
+
 def _resolve_period(period: RevenuePeriod) -> tuple[datetime, datetime]:
     now = datetime.now(timezone.utc)
     if period == RevenuePeriod.TODAY:
@@ -8,16 +8,18 @@ Provides centralized privacy management across all data types.
 
 from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any
+from typing import Any, Iterator, Optional
 
 from sqlalchemy.orm import Session
 
 from ..core.auth_cache import invalidate_cached_user_by_id_sync
 from ..core.config import settings
+from ..core.ulid_helper import generate_ulid
 from ..domain.neighborhood_helpers import display_area_from_region
 from ..repositories.factory import RepositoryFactory
 from ..schemas.privacy import PrivacyStatistics, RetentionStats
 from .base import BaseService
+from .streaming_export import StoredExport, iter_json_lines, store_export
 
 logger = logging.getLogger(__name__)
 
@@ -60,118 +62,173 @@ class PrivacyService(BaseService):
         if not user:
             raise ValueError(f"User {user_id} not found")
 
-        search_history_data: list[dict[str, Any]] = []
-        booking_data: list[dict[str, Any]] = []
-
         export_data: dict[str, Any] = {
             "export_date": datetime.now(timezone.utc).isoformat(),
-            "user_profile": {
-                "id": user.id,
-                "email": user.email,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "is_active": user.is_active,
-                "account_status": user.account_status,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-                "updated_at": user.updated_at.isoformat() if user.updated_at else None,
-            },
-            "search_history": search_history_data,
-            "bookings": booking_data,
+            "user_profile": self._user_profile_record(user),
+            "search_history": [],
+            "bookings": [],
             "instructor_profile": None,
             "student_profile": None,
         }
 
         # Export search history
         searches = self.search_history_repository.get_user_searches(user_id, exclude_deleted=True)
-
-        for search in searches:
-            search_history_data.append(
-                {
-                    "search_query": search.search_query,
-                    "search_type": search.search_type,
-                    "results_count": search.results_count,
-                    "search_count": search.search_count,
-                    "first_searched_at": search.first_searched_at.isoformat(),
-                    "last_searched_at": search.last_searched_at.isoformat(),
-                }
-            )
+        export_data["search_history"] = [self._search_history_record(s) for s in searches]
 
         # Export bookings
         student_bookings = self.booking_repository.get_student_bookings(user_id)
         instructor_bookings = self.booking_repository.get_instructor_bookings(user_id)
-        bookings = student_bookings + instructor_bookings
-
-        for booking in bookings:
-            booking_data.append(
-                {
-                    "id": booking.id,
-                    "booking_date": booking.booking_date.isoformat(),
-                    "start_time": str(booking.start_time),
-                    "end_time": str(booking.end_time),
-                    "service_name": booking.service_name,
-                    "total_price": float(booking.total_price),
-                    "status": booking.status,
-                    "role": "instructor" if booking.instructor_id == user_id else "student",
-                    "created_at": booking.created_at.isoformat() if booking.created_at else None,
-                }
-            )
+        export_data["bookings"] = [
+            self._booking_record(booking, user_id)
+            for booking in student_bookings + instructor_bookings
+        ]
 
         # Export instructor profile if exists
-        instructor = self.instructor_repository.get_by_user_id(user_id)
-        if instructor:
-            service_area_records = self.service_area_repository.list_for_instructor(user_id)
-            service_area_neighborhoods: list[dict[str, Any]] = []
-            boroughs: set[str] = set()
-            seen_display_keys: set[str] = set()
-
-            for area in service_area_records:
-                region = getattr(area, "neighborhood", None)
-                item = display_area_from_region(region)
-                if not item:
-                    continue
-
-                borough = item["borough"]
-                if borough:
-                    boroughs.add(borough)
-
-                if item["display_key"] in seen_display_keys:
-                    continue
-                seen_display_keys.add(item["display_key"])
-                service_area_neighborhoods.append(item)
-
-            sorted_boroughs = sorted(boroughs)
-            if sorted_boroughs:
-                if len(sorted_boroughs) <= 2:
-                    service_area_summary = ", ".join(sorted_boroughs)
-                else:
-                    service_area_summary = f"{sorted_boroughs[0]} + {len(sorted_boroughs) - 1} more"
-            else:
-                service_area_summary = ""
-
-            export_data["instructor_profile"] = {
-                "bio": instructor.bio,
-                "years_experience": instructor.years_experience,
-                "non_travel_buffer_minutes": getattr(instructor, "non_travel_buffer_minutes", 15),
-                "travel_buffer_minutes": getattr(instructor, "travel_buffer_minutes", 60),
-                "overnight_protection_enabled": getattr(
-                    instructor, "overnight_protection_enabled", True
-                ),
-                "calendar_settings_acknowledged_at": (
-                    instructor.calendar_settings_acknowledged_at.isoformat()
-                    if getattr(instructor, "calendar_settings_acknowledged_at", None)
-                    else None
-                ),
-                "created_at": instructor.created_at.isoformat() if instructor.created_at else None,
-                "service_area_neighborhoods": service_area_neighborhoods,
-                "service_area_boroughs": sorted_boroughs,
-                "service_area_summary": service_area_summary,
-            }
+        export_data["instructor_profile"] = self._instructor_profile_record(user_id)
 
         # For students, the user record is sufficient (no separate student profile table)
 
         logger.info("Exported data for user %s", user_id)
         return export_data
 
+    @BaseService.measure_operation("stream_user_data_export")
+    def stream_user_data_export(self, user_id: str) -> Iterator[str]:
+        """
+        Stream a user's data export as JSON lines.
+
+        Each line is one record tagged with ``record_type`` (``export``,
+        ``user_profile``, ``search_history``, ``booking``, ``instructor_profile``).
+        Search history and bookings are read through server-side cursors, so memory
+        stays flat regardless of account age. The user lookup happens eagerly so an
+        unknown user fails before anything is streamed.
+        """
+        user = self.user_repository.get_by_id(user_id)
+        if not user:
+            raise ValueError(f"User {user_id} not found")
+        return iter_json_lines(self._iter_user_data_records(user))
+
+    @BaseService.measure_operation("export_user_data_to_storage")
+    def export_user_data_to_storage(
+        self, user_id: str, *, request_id: Optional[str] = None
+    ) -> StoredExport:
+        """Write the JSON-lines export to R2 and return a presigned download URL."""
+        chunks = self.stream_user_data_export(user_id)
+        object_key = f"exports/privacy/{user_id}/{request_id or generate_ulid()}.jsonl"
+        return store_export(chunks, object_key=object_key, content_type="application/x-ndjson")
+
+    def _iter_user_data_records(self, user: Any) -> Iterator[dict[str, Any]]:
+        user_id = user.id
+        batch_size = settings.export_stream_batch_size
+        yield {
+            "record_type": "export",
+            "export_date": datetime.now(timezone.utc).isoformat(),
+            "user_id": user_id,
+        }
+        yield {"record_type": "user_profile", **self._user_profile_record(user)}
+        for search in self.search_history_repository.iter_user_searches(
+            user_id, batch_size=batch_size
+        ):
+            yield {"record_type": "search_history", **self._search_history_record(search)}
+        for booking in self.booking_repository.iter_user_bookings_for_export(
+            user_id, batch_size=batch_size
+        ):
+            yield {"record_type": "booking", **self._booking_record(booking, user_id)}
+        instructor_profile = self._instructor_profile_record(user_id)
+        if instructor_profile is not None:
+            yield {"record_type": "instructor_profile", **instructor_profile}
+        logger.info("Streamed data export for user %s", user_id)
+
+    @staticmethod
+    def _user_profile_record(user: Any) -> dict[str, Any]:
+        return {
+            "id": user.id,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_active": user.is_active,
+            "account_status": user.account_status,
+            "created_at": user.created_at.isoformat() if user.created_at else None,
+            "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+        }
+
+    @staticmethod
+    def _search_history_record(search: Any) -> dict[str, Any]:
+        return {
+            "search_query": search.search_query,
+            "search_type": search.search_type,
+            "results_count": search.results_count,
+            "search_count": search.search_count,
+            "first_searched_at": search.first_searched_at.isoformat(),
+            "last_searched_at": search.last_searched_at.isoformat(),
+        }
+
+    @staticmethod
+    def _booking_record(booking: Any, user_id: str) -> dict[str, Any]:
+        return {
+            "id": booking.id,
+            "booking_date": booking.booking_date.isoformat(),
+            "start_time": str(booking.start_time),
+            "end_time": str(booking.end_time),
+            "service_name": booking.service_name,
+            "total_price": float(booking.total_price),
+            "status": booking.status,
+            "role": "instructor" if booking.instructor_id == user_id else "student",
+            "created_at": booking.created_at.isoformat() if booking.created_at else None,
+        }
+
+    def _instructor_profile_record(self, user_id: str) -> Optional[dict[str, Any]]:
+        instructor = self.instructor_repository.get_by_user_id(user_id)
+        if not instructor:
+            return None
+
+        service_area_records = self.service_area_repository.list_for_instructor(user_id)
+        service_area_neighborhoods: list[dict[str, Any]] = []
+        boroughs: set[str] = set()
+        seen_display_keys: set[str] = set()
+
+        for area in service_area_records:
+            region = getattr(area, "neighborhood", None)
+            item = display_area_from_region(region)
+            if not item:
+                continue
+
+            borough = item["borough"]
+            if borough:
+                boroughs.add(borough)
+
+            if item["display_key"] in seen_display_keys:
+                continue
+            seen_display_keys.add(item["display_key"])
+            service_area_neighborhoods.append(item)
+
+        sorted_boroughs = sorted(boroughs)
+        if sorted_boroughs:
+            if len(sorted_boroughs) <= 2:
+                service_area_summary = ", ".join(sorted_boroughs)
+            else:
+                service_area_summary = f"{sorted_boroughs[0]} + {len(sorted_boroughs) - 1} more"
+        else:
+            service_area_summary = ""
+
+        return {
+            "bio": instructor.bio,
+            "years_experience": instructor.years_experience,
+            "non_travel_buffer_minutes": getattr(instructor, "non_travel_buffer_minutes", 15),
+            "travel_buffer_minutes": getattr(instructor, "travel_buffer_minutes", 60),
+            "overnight_protection_enabled": getattr(
+                instructor, "overnight_protection_enabled", True
+            ),
+            "calendar_settings_acknowledged_at": (
+                instructor.calendar_settings_acknowledged_at.isoformat()
+                if getattr(instructor, "calendar_settings_acknowledged_at", None)
+                else None
+            ),
+            "created_at": instructor.created_at.isoformat() if instructor.created_at else None,
+            "service_area_neighborhoods": service_area_neighborhoods,
+            "service_area_boroughs": sorted_boroughs,
+            "service_area_summary": service_area_summary,
+        }
+
     @BaseService.measure_operation("delete_user_data")
     def delete_user_data(self, user_id: str, delete_account: bool = False) -> dict[str, int]:
         """
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 import hashlib
 import hmac
 import logging
-from typing import Dict, Optional, Tuple
+from typing import IO, Any, Dict, Optional, Tuple, cast
 
 import requests
 
@@ -164,6 +164,19 @@ class R2StorageClient:
             logger.error("Failed to upload %s: %s", object_key, e)
             return (False, None)
 
+    def upload_fileobj(
+        self, object_key: str, fileobj: IO[bytes], content_type: str
+    ) -> Tuple[bool, Optional[int]]:
+        """Stream a seekable file to R2 without reading it into memory."""
+        try:
+            pre = self.generate_presigned_put(object_key, content_type)
+            # requests streams file objects (Content-Length from fstat); its stubs only list bytes
+            resp = requests.put(pre.url, data=cast(Any, fileobj), headers=pre.headers, timeout=300)
+            return (200 <= resp.status_code < 300, resp.status_code)
+        except Exception as e:
+            logger.error("Failed to upload %s: %s", object_key, e)
+            return (False, None)
+
     def download_bytes(self, object_key: str) -> Optional[bytes]:
         try:
             pre = self.generate_presigned_get(object_key)
@@ -0,0 +1,319 @@
+# backend/app/services/search/ann_index.py
+"""
+Per-process approximate nearest-neighbour index over catalog service embeddings.
+
+An alternative to sending every query embedding to pgvector. Embeddings live on
+``service_catalog.embedding_v2`` (one vector per catalog service, shared by every
+instructor offering it), so the index ranks catalog entries in memory and the
+caller hydrates eligible instructor services for the winners with a primary-key
+lookup that applies the same joins as ``RetrieverRepository.vector_search``.
+
+Index layout:
+- Unit-normalised float32 matrix, so cosine similarity is a dot product and the
+  score matches pgvector's ``GREATEST(0, 1 - (a <=> b))``.
+- Below ``IVF_MIN_VECTORS`` every query is an exact scan (fastest at catalog scale).
+- Above it an IVF layer (spherical k-means, ~sqrt(n) lists) restricts each query
+  to ``settings.nl_search_ann_nprobe`` lists.
+
+Each change publishes a new immutable snapshot. ``refresher`` (see
+``snapshot_refresher``) builds the index at startup and pulls changed rows (by
+``updated_at``) every ``settings.nl_search_ann_refresh_seconds``; embeddings
+written in-process through ``EmbeddingService.update_service_embedding`` are
+applied immediately.
+Enabled with ``settings.nl_search_vector_backend = "memory"``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.search.metrics import record_vector_backend, set_vector_index_size
+from app.services.search.snapshot_refresher import SnapshotRefresher
+
+logger = logging.getLogger(__name__)
+
+VectorResults = Dict[str, Tuple[float, Dict[str, Any]]]
+Hydrate = Callable[[Dict[str, float], int], VectorResults]
+
+IVF_MIN_VECTORS = 4096
+KMEANS_ITERATIONS = 10
+# Re-read rows touched slightly before the watermark so late commits are not missed.
+REFRESH_OVERLAP = timedelta(minutes=5)
+# Catalog entries without a bookable instructor yield no rows; widen by this factor.
+EXPANSION_FACTOR = 4
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized: np.ndarray = (matrix / norms).astype(np.float32, copy=False)
+    return normalized
+
+
+def _spherical_kmeans(vectors: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """Train ``nlist`` unit centroids on unit vectors (cosine k-means)."""
+    rng = np.random.default_rng(seed)
+    centroids: np.ndarray = vectors[rng.choice(len(vectors), size=nlist, replace=False)].copy()
+    for _ in range(KMEANS_ITERATIONS):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        filled = np.bincount(assignment, minlength=nlist) > 0
+        # Empty lists keep their previous centroid.
+        centroids[filled] = _normalize_rows(sums[filled])
+    return centroids
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    ids: Tuple[str, ...]
+    rows: Dict[str, int]
+    vectors: np.ndarray
+    centroids: Optional[np.ndarray]
+    lists: Tuple[np.ndarray, ...]
+    trained_size: int
+
+
+class ServiceEmbeddingIndex:
+    """In-memory cosine index of catalog service embeddings."""
+
+    def __init__(self, nprobe: int = 16, ivf_min_vectors: int = IVF_MIN_VECTORS) -> None:
+        self.nprobe = max(1, int(nprobe))
+        self.ivf_min_vectors = max(1, int(ivf_min_vectors))
+        self.watermark: Optional[datetime] = None
+        self._snapshot: Optional[_Snapshot] = None
+        self._write_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        snapshot = self._snapshot
+        return len(snapshot.ids) if snapshot is not None else 0
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def dimension(self) -> Optional[int]:
+        snapshot = self._snapshot
+        return int(snapshot.vectors.shape[1]) if snapshot is not None else None
+
+    def build(self, items: Iterable[Tuple[str, Sequence[float]]]) -> None:
+        """Replace the index contents (retrains the IVF layer)."""
+        pairs = [(str(item_id), vector) for item_id, vector in items if vector is not None]
+        ids = tuple(item_id for item_id, _ in pairs)
+        if pairs:
+            vectors = _normalize_rows(np.asarray([v for _, v in pairs], dtype=np.float32))
+        else:
+            vectors = np.zeros((0, self.dimension or 0), dtype=np.float32)
+        with self._write_lock:
+            self._publish(ids, vectors, centroids=None)
+
+    def apply(
+        self,
+        upserts: Iterable[Tuple[str, Sequence[float]]] = (),
+        removals: Iterable[str] = (),
+    ) -> int:
+        """Upsert and remove entries in one snapshot swap; returns entries changed."""
+        with self._write_lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                return 0
+            ids = list(snapshot.ids)
+            vectors = snapshot.vectors
+            dimension = vectors.shape[1] if ids else None
+            removed = {str(item_id) for item_id in removals} & snapshot.rows.keys()
+
+            updates: Dict[int, np.ndarray] = {}
+            appended: List[Tuple[str, np.ndarray]] = []
+            for item_id, vector in upserts:
+                item_id = str(item_id)
+                unit = _normalize_rows(np.asarray(vector, dtype=np.float32).reshape(1, -1))[0]
+                if dimension is None:
+                    dimension = unit.shape[0]
+                elif unit.shape[0] != dimension:
+                    logger.warning("[ANN] Skipping %s: dimension %s", item_id, unit.shape[0])
+                    continue
+                removed.discard(item_id)
+                row = snapshot.rows.get(item_id)
+                if row is None:
+                    appended.append((item_id, unit))
+                elif not np.allclose(vectors[row], unit, atol=1e-6):
+                    updates[row] = unit
+
+            if not (removed or updates or appended):
+                return 0
+            vectors = vectors.copy()
+            for row, unit in updates.items():
+                vectors[row] = unit
+            if appended:
+                ids.extend(item_id for item_id, _ in appended)
+                existing = [vectors] if len(vectors) else []
+                vectors = np.vstack(existing + [unit.reshape(1, -1) for _, unit in appended])
+            if removed:
+                keep = np.array([item_id not in removed for item_id in ids], dtype=bool)
+                ids = [item_id for item_id in ids if item_id not in removed]
+                vectors = vectors[keep]
+            self._publish(tuple(ids), vectors, centroids=snapshot.centroids, previous=snapshot)
+            return len(removed) + len(updates) + len(appended)
+
+    def search(self, query: Sequence[float], k: int) -> Optional[List[Tuple[str, float]]]:
+        """
+        Return up to ``k`` ``(catalog_id, score)`` pairs, best first.
+
+        Returns None when the index is not built or the query dimension does not
+        match (e.g. mid embedding-model migration); callers fall back to pgvector.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        q = np.asarray(query, dtype=np.float32)
+        if q.ndim != 1 or q.shape[0] != snapshot.vectors.shape[1]:
+            return None
+        if not snapshot.ids or k <= 0:
+            return []
+        norm = float(np.linalg.norm(q))
+        if norm:
+            q = q / norm
+
+        if snapshot.centroids is None:
+            candidates: Optional[np.ndarray] = None
+            scores = snapshot.vectors @ q
+        else:
+            nprobe = min(self.nprobe, len(snapshot.lists))
+            probe = np.argpartition(-(snapshot.centroids @ q), nprobe - 1)[:nprobe]
+            candidates = np.concatenate([snapshot.lists[i] for i in probe])
+            scores = snapshot.vectors[candidates] @ q
+
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        rows = top if candidates is None else candidates[top]
+        return [
+            (snapshot.ids[int(row)], max(0.0, float(score)))
+            for row, score in zip(rows, scores[top])
+        ]
+
+    def _publish(
+        self,
+        ids: Tuple[str, ...],
+        vectors: np.ndarray,
+        *,
+        centroids: Optional[np.ndarray],
+        previous: Optional[_Snapshot] = None,
+    ) -> None:
+        size = len(ids)
+        trained_size = previous.trained_size if previous is not None else 0
+        if size < self.ivf_min_vectors:
+            centroids, trained_size = None, 0
+        elif centroids is None or size > 2 * trained_size or 2 * size < trained_size:
+            nlist = max(1, int(np.sqrt(size)))
+            centroids, trained_size = _spherical_kmeans(vectors, nlist), size
+
+        lists: Tuple[np.ndarray, ...] = ()
+        if centroids is not None:
+            assignment: np.ndarray = np.argmax(vectors @ centroids.T, axis=1)
+            order: np.ndarray = np.argsort(assignment, kind="stable")
+            counts = np.bincount(assignment, minlength=len(centroids))
+            bounds = np.concatenate(([0], np.cumsum(counts)))
+            lists = tuple(order[bounds[i] : bounds[i + 1]] for i in range(len(centroids)))
+
+        self._snapshot = _Snapshot(
+            ids=ids,
+            rows={item_id: row for row, item_id in enumerate(ids)},
+            vectors=vectors,
+            centroids=centroids,
+            lists=lists,
+            trained_size=trained_size,
+        )
+        set_vector_index_size(size)
+
+    # ------------------------------------------------------------------
+    # Database synchronisation
+    # ------------------------------------------------------------------
+
+    def load(self, repository: Any) -> int:
+        """Full build from ``ServiceCatalogRepository.list_embedding_rows``."""
+        rows = repository.list_embedding_rows()
+        self.build((item_id, embedding) for item_id, embedding, _active, _ts in rows)
+        self.watermark = max((ts for *_rest, ts in rows if ts is not None), default=None)
+        return len(rows)
+
+    def refresh(self, repository: Any) -> int:
+        """Apply catalog rows changed since the last load/refresh."""
+        if self.watermark is None:
+            return self.load(repository)
+        rows = repository.list_embedding_rows(updated_since=self.watermark - REFRESH_OVERLAP)
+        upserts = [(i, emb) for i, emb, active, _ts in rows if active and emb is not None]
+        removals = [i for i, emb, active, _ts in rows if not active or emb is None]
+        changed = self.apply(upserts, removals)
+        newest = max((ts for *_rest, ts in rows if ts is not None), default=None)
+        if newest is not None and newest > self.watermark:
+            self.watermark = newest
+        return changed
+
+
+def search_services(
+    index: Optional[ServiceEmbeddingIndex],
+    query_embedding: Sequence[float],
+    limit: int,
+    hydrate: Hydrate,
+) -> Optional[VectorResults]:
+    """
+    Rank catalog entries in memory and hydrate the top ``limit`` bookable services.
+
+    ``hydrate(catalog_scores, limit)`` returns vector results in the shape the
+    pgvector path produces. Returns None when the index cannot answer, so callers
+    can fall back to pgvector.
+    """
+    if index is None or not index.ready:
+        return None
+    k = max(1, limit)
+    while True:
+        hits = index.search(query_embedding, k)
+        if hits is None:
+            return None
+        results = hydrate(dict(hits), limit)
+        # Every service of a lower-ranked catalog entry scores no higher than the
+        # k-th entry, so once k entries yield ``limit`` rows the top rows are final.
+        if len(results) >= limit or len(hits) < k:
+            record_vector_backend("memory")
+            return results
+        k *= EXPANSION_FACTOR
+
+
+def _sync_from_db(index: ServiceEmbeddingIndex) -> int:
+    from app.database import get_db_session
+    from app.repositories.service_catalog_repository import ServiceCatalogRepository
+
+    with get_db_session() as db:
+        return index.refresh(ServiceCatalogRepository(db))
+
+
+refresher: SnapshotRefresher[ServiceEmbeddingIndex] = SnapshotRefresher(
+    "service embedding index",
+    log_prefix="[ANN]",
+    enabled=lambda: settings.nl_search_vector_backend == "memory",
+    create=lambda: ServiceEmbeddingIndex(nprobe=settings.nl_search_ann_nprobe),
+    sync=_sync_from_db,
+    interval_seconds=lambda: settings.nl_search_ann_refresh_seconds,
+)
+
+
+def get_service_embedding_index() -> Optional[ServiceEmbeddingIndex]:
+    """Return this process's index when the memory backend is enabled and built."""
+    return refresher.get()
+
+
+def note_service_embedding(service_id: str, embedding: Sequence[float]) -> None:
+    """Apply an embedding written by this process (no-op without a built index)."""
+    index = refresher.current
+    if index is not None and index.ready:
+        index.apply(upserts=[(service_id, embedding)])
@@ -0,0 +1,264 @@
+# backend/app/services/search/availability_engine.py
+"""
+Batched buffered-availability refinement for NL search.
+
+Replaces the per-instructor, per-date window arithmetic in
+``FilterService._refine_buffered_availability_map`` with array operations over
+every (instructor, date) pair at once.
+
+Semantics mirror the scalar path in ``AvailabilityPublicMixin`` exactly:
+1. Bitmap slots are expanded to a per-minute grid.
+2. Bookings (plus their travel/non-travel buffer) are subtracted at minute resolution.
+3. Each remaining window is floored to whole slots and intersected with the
+   slots whose format tag is compatible with the requested location type.
+   Windows stay distinct even when they touch after flooring.
+4. A day passes when some ``BOOKING_START_STEP_MINUTES``-aligned start fits
+   ``duration_minutes`` inside one window and inside the time_after/time_before bounds.
+"""
+from __future__ import annotations
+
+from datetime import date, time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, cast
+
+import numpy as np
+
+from app.core.constants import (
+    BOOKING_START_STEP_MINUTES,
+    BYTES_PER_DAY,
+    MINUTES_PER_SLOT,
+    SLOTS_PER_DAY,
+    TAG_BYTES_PER_DAY,
+    TAG_RESERVED,
+)
+from app.services.config_service import is_instructor_travel_format, normalize_location_type
+from app.utils.bitset import is_tag_compatible
+from app.utils.time_utils import time_to_minutes
+
+MINUTES_PER_DAY = SLOTS_PER_DAY * MINUTES_PER_SLOT
+
+# Aligned booking starts expressed in slots (0, 3, 6, ... 288 for 15-minute steps).
+_STEP_SLOTS = BOOKING_START_STEP_MINUTES // MINUTES_PER_SLOT
+_CANDIDATE_START_SLOTS: np.ndarray = np.arange(0, SLOTS_PER_DAY + 1, _STEP_SLOTS)
+_CANDIDATE_START_MINUTES: np.ndarray = _CANDIDATE_START_SLOTS * MINUTES_PER_SLOT
+
+BufferMinutes = Tuple[int, int]
+DayKey = Tuple[str, date]
+
+
+def _pack_rows(values: Sequence[Optional[bytes]], width: int, label: str) -> np.ndarray:
+    """Stack per-day bytea values into a ``(rows, width)`` uint8 matrix (``None`` -> zeros)."""
+    out: np.ndarray = np.zeros((len(values), width), dtype=np.uint8)
+    for row, value in enumerate(values):
+        if value is None:
+            continue
+        raw = bytes(value)
+        if len(raw) != width:
+            raise ValueError(f"{label} length must be {width}")
+        out[row] = np.frombuffer(raw, dtype=np.uint8)
+    return out
+
+
+def _unpack_slots(bits: np.ndarray) -> np.ndarray:
+    """Return a ``(rows, SLOTS_PER_DAY)`` bool matrix from packed day bitmaps."""
+    return cast(
+        np.ndarray,
+        np.unpackbits(bits, axis=1, bitorder="little")[:, :SLOTS_PER_DAY].astype(bool),
+    )
+
+
+def _unpack_tags(tags: np.ndarray) -> np.ndarray:
+    """Return a ``(rows, SLOTS_PER_DAY)`` matrix of 2-bit format tags."""
+    flat = np.unpackbits(tags, axis=1, bitorder="little")[:, : SLOTS_PER_DAY * 2]
+    return cast(np.ndarray, flat[:, 0::2] | (flat[:, 1::2] << 1))
+
+
+def _tag_compatibility_table(requested_location_type: str | None) -> np.ndarray:
+    normalized = normalize_location_type(requested_location_type)
+    return cast(
+        np.ndarray,
+        np.array(
+            [is_tag_compatible(tag, normalized) for tag in range(TAG_RESERVED + 1)], dtype=bool
+        ),
+    )
+
+
+def _booking_cut_minutes(
+    bookings: Iterable[object],
+    *,
+    requested_is_travel: bool,
+    non_travel_buffer_minutes: int,
+    travel_buffer_minutes: int,
+) -> List[Tuple[int, int]]:
+    """Return buffered booking intervals in minutes, matching the scalar subtraction rules."""
+    cuts: List[Tuple[int, int]] = []
+    for booking in bookings:
+        start_time = getattr(booking, "start_time", None)
+        end_time = getattr(booking, "end_time", None)
+        if not isinstance(start_time, time) or not isinstance(end_time, time):
+            continue
+        buffer_minutes = (
+            travel_buffer_minutes
+            if requested_is_travel
+            or is_instructor_travel_format(getattr(booking, "location_type", None))
+            else non_travel_buffer_minutes
+        )
+        buffer_minutes = max(0, buffer_minutes)
+        start_minute = max(0, time_to_minutes(start_time, is_end_time=False) - buffer_minutes)
+        end_minute = min(
+            MINUTES_PER_DAY, time_to_minutes(end_time, is_end_time=True) + buffer_minutes
+        )
+        if end_minute > start_minute:
+            cuts.append((start_minute, end_minute))
+    return cuts
+
+
+def _run_end_slots(open_slots: np.ndarray, window_starts: np.ndarray) -> np.ndarray:
+    """For each slot, the exclusive end slot of the window that contains it."""
+    rows = open_slots.shape[0]
+    next_open = np.zeros_like(open_slots)
+    next_open[:, :-1] = open_slots[:, 1:] & ~window_starts[:, 1:]
+    is_last = open_slots & ~next_open
+    sentinel = SLOTS_PER_DAY + 1
+    end_marker = np.where(is_last, np.arange(1, SLOTS_PER_DAY + 1), sentinel)
+    run_end = np.minimum.accumulate(end_marker[:, ::-1], axis=1)[:, ::-1]
+    return cast(np.ndarray, np.concatenate([run_end, np.full((rows, 1), sentinel)], axis=1))
+
+
+def evaluate_days(
+    bits: Sequence[bytes],
+    format_tags: Sequence[Optional[bytes]],
+    cuts: Sequence[Sequence[Tuple[int, int]]],
+    *,
+    requested_location_type: str | None,
+    time_after: time | None,
+    time_before: time | None,
+    duration_minutes: int,
+) -> np.ndarray:
+    """
+    Return a bool per day telling whether a request of ``duration_minutes`` fits.
+
+    ``bits``/``format_tags``/``cuts`` are parallel sequences: one packed bitmap, one
+    packed tag map (or ``None``) and the buffered booking intervals for each day.
+    """
+    rows = len(bits)
+    if rows == 0:
+        return cast(np.ndarray, np.zeros(0, dtype=bool))
+
+    # 1. Bitmap slots -> minute grid, minus buffered bookings.
+    open_minutes = np.repeat(
+        _unpack_slots(_pack_rows(bits, BYTES_PER_DAY, "bits")), MINUTES_PER_SLOT, axis=1
+    )
+    cut_delta: np.ndarray = np.zeros((rows, MINUTES_PER_DAY + 1), dtype=np.int32)
+    cut_rows = [row for row, day_cuts in enumerate(cuts) for _ in day_cuts]
+    if cut_rows:
+        cut_starts = [start for day_cuts in cuts for start, _ in day_cuts]
+        cut_ends = [end for day_cuts in cuts for _, end in day_cuts]
+        np.add.at(cut_delta, (cut_rows, cut_starts), 1)
+        np.add.at(cut_delta, (cut_rows, cut_ends), -1)
+        open_minutes &= np.cumsum(cut_delta, axis=1)[:, :MINUTES_PER_DAY] == 0
+
+    # 2. Floor each remaining minute window to whole slots, remembering where windows start.
+    previous = np.zeros_like(open_minutes)
+    previous[:, 1:] = open_minutes[:, :-1]
+    following = np.zeros_like(open_minutes)
+    following[:, :-1] = open_minutes[:, 1:]
+    start_rows, start_minutes = np.nonzero(open_minutes & ~previous)
+    end_rows, end_minutes = np.nonzero(open_minutes & ~following)
+    slot_delta: np.ndarray = np.zeros((rows, SLOTS_PER_DAY + 1), dtype=np.int32)
+    np.add.at(slot_delta, (start_rows, start_minutes // MINUTES_PER_SLOT), 1)
+    np.add.at(slot_delta, (end_rows, (end_minutes + 1) // MINUTES_PER_SLOT), -1)
+    window_slots = np.cumsum(slot_delta, axis=1)[:, :SLOTS_PER_DAY] > 0
+    window_starts: np.ndarray = np.zeros((rows, SLOTS_PER_DAY), dtype=bool)
+    window_starts[start_rows, start_minutes // MINUTES_PER_SLOT] = True
+
+    # 3. Keep only slots whose format tag admits the requested location type.
+    compatible = _tag_compatibility_table(requested_location_type)[
+        _unpack_tags(_pack_rows(format_tags, TAG_BYTES_PER_DAY, "tags"))
+    ]
+    open_slots = window_slots & compatible
+
+    # 4. Duration run-length check at aligned starts, bounded by time_after/time_before.
+    earliest = time_to_minutes(time_after, is_end_time=False) if time_after is not None else 0
+    latest = (
+        time_to_minutes(time_before, is_end_time=True)
+        if time_before is not None
+        else MINUTES_PER_DAY
+    )
+    required = max(0, int(duration_minutes))
+    padded_open = np.concatenate([open_slots, np.zeros((rows, 1), dtype=bool)], axis=1)
+    run_end = _run_end_slots(open_slots, window_starts)
+    covered = padded_open[:, _CANDIDATE_START_SLOTS]
+    fits = covered & (
+        _CANDIDATE_START_MINUTES + required <= run_end[:, _CANDIDATE_START_SLOTS] * MINUTES_PER_SLOT
+    )
+    if required == 0:
+        # A zero-length request may also start exactly where a window ends.
+        previous_slot = np.maximum(_CANDIDATE_START_SLOTS - 1, 0)
+        ends_here = (run_end[:, previous_slot] == _CANDIDATE_START_SLOTS) & padded_open[
+            :, previous_slot
+        ]
+        ends_here[:, 0] = False
+        fits |= ends_here
+    in_bounds = (_CANDIDATE_START_MINUTES >= earliest) & (
+        _CANDIDATE_START_MINUTES + required <= latest
+    )
+    return cast(np.ndarray, np.any(fits & in_bounds, axis=1))
+
+
+def refine_availability_map(
+    availability_map: Mapping[str, List[date]],
+    *,
+    bits_by_key: Mapping[DayKey, object],
+    format_tags_by_key: Mapping[DayKey, object],
+    bookings_by_key: Mapping[DayKey, Iterable[object]],
+    buffers_by_instructor: Mapping[str, BufferMinutes],
+    earliest_date_by_instructor: Mapping[str, date],
+    requested_location_type: str | None,
+    time_after: time | None,
+    time_before: time | None,
+    duration_minutes: int,
+) -> Dict[str, List[date]]:
+    """Drop dates that cannot fit the request once buffers and format tags apply."""
+    requested_is_travel = is_instructor_travel_format(
+        normalize_location_type(requested_location_type)
+    )
+    keys: List[DayKey] = []
+    day_bits: List[bytes] = []
+    day_tags: List[Optional[bytes]] = []
+    day_cuts: List[List[Tuple[int, int]]] = []
+    for instructor_id, available_dates in availability_map.items():
+        earliest_date = earliest_date_by_instructor.get(instructor_id)
+        non_travel_buffer, travel_buffer = buffers_by_instructor[instructor_id]
+        for available_date in available_dates:
+            if earliest_date is not None and available_date < earliest_date:
+                continue
+            key = (instructor_id, available_date)
+            bits = bits_by_key.get(key)
+            if bits is None:
+                continue
+            keys.append(key)
+            day_bits.append(cast(bytes, bits))
+            day_tags.append(cast(Optional[bytes], format_tags_by_key.get(key) or None))
+            day_cuts.append(
+                _booking_cut_minutes(
+                    bookings_by_key.get(key, []),
+                    requested_is_travel=requested_is_travel,
+                    non_travel_buffer_minutes=non_travel_buffer,
+                    travel_buffer_minutes=travel_buffer,
+                )
+            )
+
+    passing = evaluate_days(
+        day_bits,
+        day_tags,
+        day_cuts,
+        requested_location_type=requested_location_type,
+        time_after=time_after,
+        time_before=time_before,
+        duration_minutes=duration_minutes,
+    )
+    refined: Dict[str, List[date]] = {}
+    for (instructor_id, available_date), passed in zip(keys, passing.tolist()):
+        if passed:
+            refined.setdefault(instructor_id, []).append(available_date)
+    return refined
@@ -16,6 +16,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional
 
+from app.services.search.ranking_snapshot import note_ranking_signal_change
 from app.services.search.search_cache import SearchCacheService
 
 if TYPE_CHECKING:
@@ -145,6 +146,7 @@ def invalidate_on_service_change(
         service_id: The service that changed
         change_type: "create", "update", or "delete"
     """
+    note_ranking_signal_change(service_id=service_id)
     cache = get_search_cache()
     context = f"service {change_type} ({service_id})"
 
@@ -210,6 +212,7 @@ def invalidate_on_instructor_profile_change(
     Args:
         instructor_id: The instructor whose profile changed
     """
+    note_ranking_signal_change(instructor_id=instructor_id)
     cache = get_search_cache()
     context = f"profile change ({instructor_id})"
 
@@ -233,6 +236,7 @@ def invalidate_on_review_change(
         instructor_id: The instructor who received the review
         review_id: The review that changed (optional)
     """
+    note_ranking_signal_change(instructor_id=instructor_id)
     cache = get_search_cache()
     context = f"review change ({instructor_id})"
 
@@ -15,6 +15,7 @@ import weakref
 
 from app.repositories.service_catalog_repository import ServiceCatalogRepository
 from app.services.cache_service import CacheService, CircuitState
+from app.services.search.ann_index import note_service_embedding
 from app.services.search.circuit_breaker import EMBEDDING_CIRCUIT, CircuitOpenError
 from app.services.search.config import get_search_config
 from app.services.search.embedding_provider import (
@@ -427,6 +428,9 @@ class EmbeddingService:
 
         Updates embedding_v2 and metadata columns.
         """
-        return ServiceCatalogRepository(db).update_service_embedding(
+        updated = ServiceCatalogRepository(db).update_service_embedding(
             service_id, embedding, _get_current_model(), text_hash
         )
+        if updated:
+            note_service_embedding(service_id, embedding)
+        return updated
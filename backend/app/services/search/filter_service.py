@@ -16,13 +16,13 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db_session
 from app.repositories.filter_repository import FilterRepository
+from app.repositories.next_availability_repository import IndexedNextSlot
 from app.services.base import BaseService
 from app.services.config_service import ConfigService
+from app.services.search.availability_engine import refine_availability_map
 from app.services.search.location_resolver import LocationResolver, ResolvedLocation
 from app.services.search.retriever import ServiceCandidate
 from app.services.timezone_service import TimezoneService
-from app.utils.bitset import windows_from_bits
-from app.utils.time_helpers import string_to_time
 
 if TYPE_CHECKING:
     from app.services.search.query_parser import ParsedQuery
@@ -63,6 +63,7 @@ class FilteredCandidate:
 
     available_dates: List[date] = field(default_factory=list)
     earliest_available: Optional[date] = None
+    next_available_at: Optional[datetime] = None
 
     def __init__(
         self,
@@ -83,6 +84,7 @@ class FilteredCandidate:
         soft_filter_reasons: Optional[List[str]] = None,
         available_dates: Optional[List[date]] = None,
         earliest_available: Optional[date] = None,
+        next_available_at: Optional[datetime] = None,
     ) -> None:
         rate = min_hourly_rate if min_hourly_rate is not None else price_per_hour
         if rate is None:
@@ -105,6 +107,7 @@ class FilteredCandidate:
         self.soft_filter_reasons = list(soft_filter_reasons or [])
         self.available_dates = list(available_dates or [])
         self.earliest_available = earliest_available
+        self.next_available_at = next_available_at
 
     @property
     def price_per_hour(self) -> float:
@@ -675,6 +678,7 @@ class FilterService(BaseService):
             return []
 
         instructor_ids = list({c.instructor_id for c in candidates})
+        indexed_slots: Dict[str, IndexedNextSlot] = {}
 
         # Parse time constraints
         time_after = self._parse_time(parsed_query.time_after)
@@ -713,13 +717,32 @@ class FilterService(BaseService):
                 duration_minutes=duration_minutes,
             )
         else:
-            # No date specified - check next 7 days
-            availability_map = self.repository.filter_by_availability(
-                instructor_ids,
-                dates_to_check=self._build_rolling_search_dates(requester_timezone),
-                time_after=time_after,
-                time_before=time_before,
-                duration_minutes=duration_minutes,
+            # No date specified - check next 7 days. Fresh next-available index rows
+            # drop instructors with nothing bookable before the bitmap scan and give
+            # the rest an exact start for "soonest" ordering.
+            rolling_dates = self._build_rolling_search_dates(requester_timezone)
+            if time_after is None and time_before is None:
+                indexed_slots = self._indexed_next_slots(
+                    instructor_ids,
+                    parsed_query=parsed_query,
+                    duration_minutes=duration_minutes,
+                    rolling_dates=rolling_dates,
+                )
+                instructor_ids = [
+                    i
+                    for i in instructor_ids
+                    if i not in indexed_slots or indexed_slots[i].next_date is not None
+                ]
+            availability_map = (
+                self.repository.filter_by_availability(
+                    instructor_ids,
+                    dates_to_check=rolling_dates,
+                    time_after=time_after,
+                    time_before=time_before,
+                    duration_minutes=duration_minutes,
+                )
+                if instructor_ids
+                else {}
             )
         availability_map = self._refine_buffered_availability_map(
             availability_map,
@@ -738,12 +761,53 @@ class FilterService(BaseService):
                 c.passed_availability = True
                 c.available_dates = available_dates
                 c.earliest_available = min(available_dates) if available_dates else None
+                slot = indexed_slots.get(c.instructor_id)
+                if slot is not None and slot.next_date == c.earliest_available:
+                    c.next_available_at = slot.next_start_at
                 filtered.append(c)
             else:
                 c.passed_availability = False
 
         return filtered
 
+    def _indexed_next_slots(
+        self,
+        instructor_ids: List[str],
+        *,
+        parsed_query: "ParsedQuery",
+        duration_minutes: int,
+        rolling_dates: List[date],
+    ) -> Dict[str, IndexedNextSlot]:
+        """
+        Read the next-available index for an unconstrained window.
+
+        Returns slots for instructors with a fresh row; a slot without ``next_date``
+        means nothing is bookable inside the window. The bitmap path still decides
+        which dates pass, so the index only narrows and orders candidates.
+        """
+        getter = getattr(self.repository, "get_indexed_next_slots", None)
+        if not callable(getter) or not instructor_ids or not rolling_dates:
+            return {}
+        indexed = getter(
+            instructor_ids,
+            location_type=self._search_requested_location_type(parsed_query),
+            duration_minutes=duration_minutes,
+            through=rolling_dates[-1],
+        )
+        if not isinstance(indexed, dict):
+            return {}
+        first_date, last_date = rolling_dates[0], rolling_dates[-1]
+        resolved: Dict[str, IndexedNextSlot] = {}
+        for instructor_id, slot in indexed.items():
+            if not isinstance(slot, IndexedNextSlot):
+                continue
+            if slot.next_date is None or slot.next_date > last_date:
+                resolved[instructor_id] = IndexedNextSlot(None, None)
+            elif slot.next_date >= first_date:
+                resolved[instructor_id] = slot
+            # Dates before the requester's window (timezone skew) are left to the bitmap path.
+        return resolved
+
     @staticmethod
     def _search_requested_location_type(parsed_query: "ParsedQuery") -> str:
         return "online" if parsed_query.lesson_type == "online" else "student_location"
@@ -805,61 +869,40 @@ class FilterService(BaseService):
                 "student_location"
             )
 
-        refined: Dict[str, List[date]] = {}
-        for instructor_id, available_dates in availability_map.items():
-            kept_dates: List[date] = []
-            profile = profiles_by_instructor.get(instructor_id)
-            instructor_today: date | None = None
-            if (
-                parsed_query.date is None
-                and parsed_query.date_range_start is None
-                and parsed_query.date_range_end is None
-            ):
+        buffers_by_instructor: Dict[str, tuple[int, int]] = {}
+        earliest_date_by_instructor: Dict[str, date] = {}
+        check_instructor_today = (
+            parsed_query.date is None
+            and parsed_query.date_range_start is None
+            and parsed_query.date_range_end is None
+        )
+        for instructor_id in availability_map:
+            if check_instructor_today:
                 instructor_timezone = timezones_by_instructor.get(instructor_id)
                 if isinstance(instructor_timezone, str) and instructor_timezone:
-                    instructor_today = datetime.now(
+                    earliest_date_by_instructor[instructor_id] = datetime.now(
                         TimezoneService.get_timezone(instructor_timezone)
                     ).date()
-            (
-                non_travel_buffer_minutes,
-                travel_buffer_minutes,
-            ) = AvailabilityService._resolve_buffer_profile_values(
-                profile,
+            buffers_by_instructor[
+                instructor_id
+            ] = AvailabilityService._resolve_buffer_profile_values(
+                profiles_by_instructor.get(instructor_id),
                 default_non_travel_buffer_minutes=default_non_travel_buffer_minutes,
                 default_travel_buffer_minutes=default_travel_buffer_minutes,
             )
-            for available_date in available_dates:
-                if instructor_today is not None and available_date < instructor_today:
-                    continue
-                bits = bits_by_key.get((instructor_id, available_date))
-                if bits is None:
-                    continue
-                base_windows = [
-                    (string_to_time(start_str), string_to_time(end_str))
-                    for start_str, end_str in windows_from_bits(bits)
-                ]
-                remaining_windows = AvailabilityService._subtract_buffered_bookings_from_windows(
-                    base_windows,
-                    bookings_by_key.get((instructor_id, available_date), []),
-                    requested_location_type=requested_location_type,
-                    non_travel_buffer_minutes=non_travel_buffer_minutes,
-                    travel_buffer_minutes=travel_buffer_minutes,
-                )
-                remaining_windows = AvailabilityService._filter_windows_by_format_tags(
-                    remaining_windows,
-                    format_tags_by_key.get((instructor_id, available_date)),
-                    requested_location_type=requested_location_type,
-                )
-                if AvailabilityService._windows_support_booking_request(
-                    remaining_windows,
-                    time_after=time_after,
-                    time_before=time_before,
-                    duration_minutes=duration_minutes,
-                ):
-                    kept_dates.append(available_date)
-            if kept_dates:
-                refined[instructor_id] = kept_dates
-        return refined
+
+        return refine_availability_map(
+            availability_map,
+            bits_by_key=bits_by_key,
+            format_tags_by_key=format_tags_by_key,
+            bookings_by_key=bookings_by_key,
+            buffers_by_instructor=buffers_by_instructor,
+            earliest_date_by_instructor=earliest_date_by_instructor,
+            requested_location_type=requested_location_type,
+            time_after=time_after,
+            time_before=time_before,
+            duration_minutes=duration_minutes,
+        )
 
     def _parse_time(self, time_str: Optional[str]) -> Optional[time]:
         """Parse time string (HH:MM) to time object."""
@@ -0,0 +1,127 @@
+# backend/app/services/search/keyword_automaton.py
+"""
+Aho-Corasick automaton over the generated taxonomy keyword dictionaries.
+
+``QueryParser`` used to try one ``\\b<keyword>\\b`` regex per keyword, so parse
+cost grew with the catalog. The automaton matches every service, subcategory and
+category keyword in a single scan of the query and keeps the regex semantics:
+
+- Word boundaries: a match is kept when the characters around it differ in
+  word-ness from the keyword's first/last character (``isalnum()`` or ``_``,
+  the same test ``re`` uses for ``\\w``).
+- Longest keyword wins within each level; equal lengths go to the keyword that
+  comes first in the dictionary, like the length-sorted regex list did.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Tuple
+
+KEYWORD_LEVELS: Dict[str, str] = {
+    "service": "service_keywords",
+    "subcategory": "subcategory_keywords",
+    "category": "category_keywords",
+}
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    keyword: str
+    value: str
+
+
+@dataclass(frozen=True)
+class _Entry:
+    keyword: str
+    length: int
+    starts_word: bool
+    ends_word: bool
+    # (level, rank, value); lower rank = longer / earlier keyword.
+    targets: Tuple[Tuple[str, int, str], ...]
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordAutomaton:
+    """Multi-level keyword matcher built once per keyword dictionary set."""
+
+    def __init__(self, keyword_maps: Mapping[str, Mapping[str, str]]) -> None:
+        targets: Dict[str, List[Tuple[str, int, str]]] = {}
+        for level, keyword_map in keyword_maps.items():
+            ranked = sorted(keyword_map.items(), key=lambda item: len(item[0]), reverse=True)
+            for rank, (keyword, value) in enumerate(ranked):
+                if keyword:
+                    targets.setdefault(keyword.lower(), []).append((level, rank, value))
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        outputs: List[List[_Entry]] = [[]]
+        for keyword, keyword_targets in targets.items():
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = next_node
+            outputs[node].append(
+                _Entry(
+                    keyword=keyword,
+                    length=len(keyword),
+                    starts_word=_is_word(keyword[0]),
+                    ends_word=_is_word(keyword[-1]),
+                    targets=tuple(keyword_targets),
+                )
+            )
+
+        # Breadth-first fail links; each node also reports its suffix keywords.
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[child] = link if link != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+                queue.append(child)
+        self._outputs: Tuple[Tuple[_Entry, ...], ...] = tuple(tuple(out) for out in outputs)
+        self.keyword_count = len(targets)
+
+    @classmethod
+    def from_keyword_dicts(cls, keyword_dicts: Mapping[str, Mapping[str, str]]) -> KeywordAutomaton:
+        """Build from ``get_keyword_dicts`` output."""
+        return cls({level: keyword_dicts.get(key) or {} for level, key in KEYWORD_LEVELS.items()})
+
+    def search(self, text: str) -> Dict[str, KeywordMatch]:
+        """Return the best boundary-safe match per level found in ``text``."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        best: Dict[str, Tuple[int, str, str]] = {}
+        size = len(text)
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for entry in outputs[node]:
+                start = end - entry.length
+                if (start > 0 and _is_word(text[start - 1])) == entry.starts_word:
+                    continue
+                if (end < size and _is_word(text[end])) == entry.ends_word:
+                    continue
+                for level, rank, value in entry.targets:
+                    current = best.get(level)
+                    if current is None or rank < current[0]:
+                        best[level] = (rank, entry.keyword, value)
+        return {level: KeywordMatch(keyword, value) for level, (_, keyword, value) in best.items()}
+
+
+__all__ = ["KEYWORD_LEVELS", "KeywordAutomaton", "KeywordMatch"]
@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from app.repositories.category_repository import CategoryRepository
 from app.repositories.service_catalog_repository import ServiceCatalogRepository
 from app.repositories.subcategory_repository import SubcategoryRepository
+from app.services.search.keyword_automaton import KeywordAutomaton
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +27,32 @@ class KeywordDictCache:
         self._lock = threading.Lock()
         self._dicts: dict[str, dict[str, str]] | None = None
         self._source: str | None = None
+        self._automaton: KeywordAutomaton | None = None
+        self._automaton_dicts: dict[str, dict[str, str]] | None = None
 
     def invalidate(self) -> None:
         """Clear cached dictionaries so the next read rebuilds from source."""
         with self._lock:
             self._dicts = None
             self._source = None
+            self._automaton = None
+            self._automaton_dicts = None
+
+    def automaton(self, keyword_dicts: dict[str, dict[str, str]]) -> KeywordAutomaton:
+        """Return the keyword automaton for ``keyword_dicts``.
+
+        Built once per cached dictionary set; dictionaries that did not come from
+        this cache (tests, ad-hoc callers) get a fresh, uncached automaton.
+        """
+        with self._lock:
+            if self._automaton is not None and self._automaton_dicts is keyword_dicts:
+                return self._automaton
+        automaton = KeywordAutomaton.from_keyword_dicts(keyword_dicts)
+        with self._lock:
+            if keyword_dicts is self._dicts:
+                self._automaton = automaton
+                self._automaton_dicts = keyword_dicts
+        return automaton
 
     def get(
         self,
@@ -393,9 +414,19 @@ def get_keyword_dicts(
     return _keyword_dict_cache.get(db=db, force_refresh=force_refresh)
 
 
+def get_keyword_automaton(keyword_dicts: dict[str, dict[str, str]]) -> KeywordAutomaton:
+    """Return the (cached) keyword automaton for dictionaries from ``get_keyword_dicts``."""
+    return _keyword_dict_cache.automaton(keyword_dicts)
+
+
 def invalidate_keyword_dict_cache() -> None:
-    """Clear in-process keyword dictionaries."""
+    """Clear in-process keyword dictionaries and their automaton."""
     _keyword_dict_cache.invalidate()
 
 
-__all__ = ["generate_keyword_dicts", "get_keyword_dicts", "invalidate_keyword_dict_cache"]
+__all__ = [
+    "generate_keyword_dicts",
+    "get_keyword_automaton",
+    "get_keyword_dicts",
+    "invalidate_keyword_dict_cache",
+]
@@ -92,6 +92,26 @@ DEGRADATION_EVENTS = Counter(
     registry=REGISTRY,
 )
 
+SINGLE_FLIGHT = Counter(
+    "instainstru_nl_search_single_flight_total",
+    "Response-cache misses by coalescing outcome (leader, shared, stale, remote)",
+    ["outcome"],
+    registry=REGISTRY,
+)
+
+VECTOR_BACKEND = Counter(
+    "instainstru_nl_search_vector_backend_total",
+    "Vector candidate searches by the backend that answered (memory, pgvector)",
+    ["backend"],
+    registry=REGISTRY,
+)
+
+VECTOR_INDEX_SIZE = Gauge(
+    "instainstru_nl_search_vector_index_size",
+    "Catalog embeddings held by this process's in-memory vector index",
+    registry=REGISTRY,
+)
+
 # Search volume
 SEARCH_REQUESTS = Counter(
     "instainstru_nl_search_requests_total",
@@ -188,6 +208,24 @@ def record_cache_event(cache_type: str, hit: bool) -> None:
     PrometheusMetrics._invalidate_cache()
 
 
+def record_single_flight(outcome: str) -> None:
+    """Record how a response-cache miss was served under request coalescing."""
+    SINGLE_FLIGHT.labels(outcome=outcome).inc()
+    PrometheusMetrics._invalidate_cache()
+
+
+def record_vector_backend(backend: str) -> None:
+    """Record which backend answered a vector candidate search."""
+    VECTOR_BACKEND.labels(backend=backend).inc()
+    PrometheusMetrics._invalidate_cache()
+
+
+def set_vector_index_size(size: int) -> None:
+    """Update the in-memory vector index size gauge."""
+    VECTOR_INDEX_SIZE.set(size)
+    PrometheusMetrics._invalidate_cache()
+
+
 def record_openai_latency(endpoint: str, latency_ms: int) -> None:
     """Record OpenAI API call latency."""
     OPENAI_LATENCY.labels(endpoint=endpoint).observe(latency_ms)
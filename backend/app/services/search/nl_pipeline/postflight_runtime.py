@@ -246,6 +246,7 @@ def rank_results(
                     completeness_score=0.5,
                     available_dates=list(candidate.available_dates),
                     earliest_available=candidate.earliest_available,
+                    next_available_at=candidate.next_available_at,
                 )
                 for index, candidate in enumerate(filter_result.candidates)
             ],
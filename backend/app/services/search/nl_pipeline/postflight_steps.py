@@ -9,8 +9,9 @@ from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.schemas.nl_search import NLSearchContentFilterDefinition
-from app.services.search import retriever as retriever_module
+from app.services.search import ann_index, retriever as retriever_module
 from app.services.search.filter_service import FilterResult
+from app.services.search.metrics import record_vector_backend
 from app.services.search.nl_pipeline.models import (
     PostBurstCallbacks,
     PostBurstDeps,
@@ -96,9 +97,18 @@ def execute_retrieval_and_fusion(
     vector_search_used = False
     if query_embedding and not skip_vector:
         vector_start = time.perf_counter()
-        vector_results = batch.vector_search(
-            query_embedding, limit=min(vector_top_k, max_candidates)
+        vector_limit = min(vector_top_k, max_candidates)
+        ann_results = ann_index.search_services(
+            ann_index.get_service_embedding_index(),
+            query_embedding,
+            vector_limit,
+            lambda scores, limit: batch.services_for_catalogs(scores, limit=limit),
         )
+        if ann_results is not None:
+            vector_results = ann_results
+        else:
+            record_vector_backend("pgvector")
+            vector_results = batch.vector_search(query_embedding, limit=vector_limit)
         vector_latency_ms = int((time.perf_counter() - vector_start) * 1000)
         vector_search_used = True
     candidates = retriever.fuse_results(
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import time
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
+from app.core.config import settings
 from app.core.exceptions import raise_503_if_pool_exhaustion
 from app.monitoring.otel import create_span
 from app.schemas.nl_search import NLSearchResponse, NLSearchResultItem, StageStatus
+from app.services.search import metrics as search_metrics
 from app.services.search.embedding_service import EmbeddingService
 from app.services.search.filter_service import FilterService
 from app.services.search.location_embedding_service import LocationEmbeddingService
@@ -24,11 +27,10 @@ from app.services.search.nl_pipeline import (
 from app.services.search.nl_pipeline.models import PipelineTimer, SearchMetrics
 from app.services.search.ranking_service import RankingService
 from app.services.search.retriever import PostgresRetriever
-from app.services.search.search_cache import SearchCacheService
+from app.services.search.search_cache import SearchCacheService, response_key_hash
+from app.services.search.single_flight import SingleFlight
 
 if TYPE_CHECKING:
-    import asyncio
-
     from app.services.cache_service import CacheService
     from app.services.search.location_resolver import ResolvedLocation
     from app.services.search.nl_pipeline.models import (
@@ -42,6 +44,11 @@ if TYPE_CHECKING:
     from app.services.search.retriever import RetrievalResult
 
 
+# Cache misses in flight on this worker, keyed by response cache key (+ timezone).
+_SEARCH_FLIGHTS: SingleFlight[NLSearchResponse] = SingleFlight()
+_REMOTE_POLL_INTERVAL_S = 0.1
+
+
 @dataclass(slots=True)
 class _SearchRequest:
     query: str
@@ -72,11 +79,6 @@ class _SearchContext:
     inflight_incremented: bool = False
 
 
-@dataclass(slots=True)
-class _CachedSearchResult:
-    response: NLSearchResponse
-
-
 @dataclass(slots=True)
 class _PreflightStageResult:
     budget: RequestBudget
@@ -122,11 +124,11 @@ class NLSearchService:
         self.location_embedding_service = LocationEmbeddingService(repository=None)
         self.location_llm_service = LocationLLMService()
 
-    async def _run_preflight_stage(
+    async def _check_response_cache(
         self,
         request: _SearchRequest,
         context: _SearchContext,
-    ) -> _CachedSearchResult | _PreflightStageResult:
+    ) -> Optional[NLSearchResponse]:
         cached, context.cache_check_ms = await response.get_cached_search_response(
             self,
             query=request.query,
@@ -135,19 +137,166 @@ class NLSearchService:
             timer=context.timer,
             cache_filters=context.cache_filters,
         )
-        if cached:
-            return _CachedSearchResult(
-                response=response.build_cached_response(
-                    self,
-                    cached=cached,
-                    perf_start=context.perf_start,
-                    cache_check_ms=context.cache_check_ms,
-                    timer=context.timer,
-                    candidates_flow=context.candidates_flow,
-                    include_diagnostics=request.include_diagnostics,
-                )
+        if not cached:
+            return None
+        return self._respond_from_cache(request, context, cached)
+
+    def _respond_from_cache(
+        self,
+        request: _SearchRequest,
+        context: _SearchContext,
+        cached: Dict[str, object],
+    ) -> NLSearchResponse:
+        return response.build_cached_response(
+            self,
+            cached=cached,
+            perf_start=context.perf_start,
+            cache_check_ms=context.cache_check_ms,
+            timer=context.timer,
+            candidates_flow=context.candidates_flow,
+            include_diagnostics=request.include_diagnostics,
+        )
+
+    def _single_flight_key(self, request: _SearchRequest, context: _SearchContext) -> Optional[str]:
+        """
+        Key for coalescing this cache miss, or None when it must run on its own.
+
+        Mirrors the response cache key (responses are already shared across users
+        through that cache). Diagnostic, budgeted and forced-degradation requests
+        produce caller-specific output and are never coalesced.
+        """
+        if not settings.nl_search_single_flight_enabled:
+            return None
+        if (
+            request.include_diagnostics
+            or request.budget_ms is not None
+            or request.force_skip_tier5
+            or request.force_skip_tier4
+            or request.force_skip_vector
+            or request.force_skip_embedding
+            or request.force_high_load
+        ):
+            return None
+        key_hash = response_key_hash(
+            request.query,
+            request.user_location,
+            cast(Optional[Dict[str, Any]], context.cache_filters),
+            request.limit,
+            self._region_code,
+        )
+        return f"{key_hash}:{request.requester_timezone or ''}"
+
+    async def _coalesced_search(
+        self,
+        flight_key: str,
+        request: _SearchRequest,
+        context: _SearchContext,
+    ) -> NLSearchResponse:
+        if _SEARCH_FLIGHTS.in_flight(flight_key):
+            stale = await self._stale_response(request, context)
+            if stale is not None:
+                return stale
+
+        result, shared = await _SEARCH_FLIGHTS.do(
+            flight_key, lambda: self._rebuild_response(request, context)
+        )
+        if not shared:
+            return result
+        search_metrics.record_single_flight("shared")
+        return result.model_copy(deep=True)
+
+    async def _rebuild_response(
+        self,
+        request: _SearchRequest,
+        context: _SearchContext,
+    ) -> NLSearchResponse:
+        """Run the pipeline as this worker's leader; defer to a remote rebuild holding the lock."""
+        if not settings.nl_search_single_flight_distributed:
+            search_metrics.record_single_flight("leader")
+            return await self._run_uncached_search(request, context)
+
+        acquired, lock_key = await self.search_cache.acquire_rebuild_lock(
+            request.query,
+            request.user_location,
+            filters=context.cache_filters,
+            limit=request.limit,
+            region_code=self._region_code,
+            ttl=settings.nl_search_single_flight_lock_ttl_seconds,
+        )
+        if not acquired:
+            served = await self._await_remote_rebuild(request, context)
+            if served is not None:
+                return served
+        search_metrics.record_single_flight("leader")
+        try:
+            return await self._run_uncached_search(request, context)
+        finally:
+            if acquired:
+                await self.search_cache.release_rebuild_lock(lock_key)
+
+    async def _await_remote_rebuild(
+        self,
+        request: _SearchRequest,
+        context: _SearchContext,
+    ) -> Optional[NLSearchResponse]:
+        """Serve stale, or poll for the response another worker is building."""
+        stale = await self._stale_response(request, context)
+        if stale is not None:
+            return stale
+
+        deadline = time.monotonic() + settings.nl_search_single_flight_wait_ms / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_REMOTE_POLL_INTERVAL_S)
+            cached = await response.check_cache_for_service(
+                self,
+                request.query,
+                request.user_location,
+                request.limit,
+                filters=context.cache_filters,
             )
+            if cached:
+                search_metrics.record_single_flight("remote")
+                return self._respond_from_cache(request, context, cached)
+        return None
+
+    async def _stale_response(
+        self,
+        request: _SearchRequest,
+        context: _SearchContext,
+    ) -> Optional[NLSearchResponse]:
+        if not settings.nl_search_stale_while_revalidate:
+            return None
+        stale = await self.search_cache.get_stale_response(
+            request.query,
+            request.user_location,
+            filters=context.cache_filters,
+            limit=request.limit,
+            region_code=self._region_code,
+        )
+        if not stale:
+            return None
+        search_metrics.record_single_flight("stale")
+        return self._respond_from_cache(request, context, cast(Dict[str, object], stale))
+
+    async def _run_uncached_search(
+        self,
+        request: _SearchRequest,
+        context: _SearchContext,
+    ) -> NLSearchResponse:
+        try:
+            preflight_result = await self._run_preflight_stage(request, context)
+            ai_result = await self._run_ai_stage(request, context, preflight_result)
+            return await self._run_postflight_stage(request, context, preflight_result, ai_result)
+        finally:
+            if context.inflight_incremented:
+                context.inflight_incremented = False
+                await runtime._decrement_search_inflight()
 
+    async def _run_preflight_stage(
+        self,
+        request: _SearchRequest,
+        context: _SearchContext,
+    ) -> _PreflightStageResult:
         (
             budget,
             parsed_query_cached,
@@ -405,15 +554,14 @@ class NLSearchService:
         )
 
         try:
-            preflight_result = await self._run_preflight_stage(request, context)
-            if isinstance(preflight_result, _CachedSearchResult):
-                return preflight_result.response
+            cached = await self._check_response_cache(request, context)
+            if cached is not None:
+                return cached
 
-            ai_result = await self._run_ai_stage(request, context, preflight_result)
-            return await self._run_postflight_stage(request, context, preflight_result, ai_result)
+            flight_key = self._single_flight_key(request, context)
+            if flight_key is None:
+                return await self._run_uncached_search(request, context)
+            return await self._coalesced_search(flight_key, request, context)
         except Exception as exc:
             raise_503_if_pool_exhaustion(exc)
             raise
-        finally:
-            if context.inflight_incremented:
-                await runtime._decrement_search_inflight()
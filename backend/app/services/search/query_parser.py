@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple
 
 import dateparser
 
-from app.services.search.keyword_generator import get_keyword_dicts
+from app.services.search.keyword_generator import get_keyword_automaton, get_keyword_dicts
 from app.services.search.patterns import (
     ADULT_KEYWORDS,
     AGE_EXPLICIT,
@@ -85,22 +85,6 @@ def _contains_keyword(text: str, keyword: str) -> bool:
     return re.search(r"\b" + re.escape(keyword) + r"\b", text, re.IGNORECASE) is not None
 
 
-def _build_keyword_patterns(keyword_map: Dict[str, str]) -> List[Tuple[str, re.Pattern[str], str]]:
-    """Precompile boundary-safe keyword regex patterns sorted by specificity."""
-    patterns: List[Tuple[str, re.Pattern[str], str]] = []
-    for keyword, mapped_value in sorted(
-        keyword_map.items(), key=lambda item: len(item[0]), reverse=True
-    ):
-        patterns.append(
-            (
-                keyword,
-                re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE),
-                mapped_value,
-            )
-        )
-    return patterns
-
-
 @dataclass
 class ParsedQuery:
     """Structured representation of a parsed natural language search query."""
@@ -183,9 +167,7 @@ class QueryParser:
         self._category_keywords = keyword_dicts["category_keywords"]
         self._subcategory_keywords = keyword_dicts["subcategory_keywords"]
         self._service_keywords = keyword_dicts["service_keywords"]
-        self._category_keyword_patterns = _build_keyword_patterns(self._category_keywords)
-        self._subcategory_keyword_patterns = _build_keyword_patterns(self._subcategory_keywords)
-        self._service_keyword_patterns = _build_keyword_patterns(self._service_keywords)
+        self._keyword_automaton = get_keyword_automaton(keyword_dicts)
 
     def _get_user_today(self) -> DateType:
         """
@@ -782,11 +764,8 @@ class QueryParser:
 
     def _detect_category(self, query: str) -> str:
         """Detect service category from query text (for price intent resolution)."""
-        query_lower = query.lower()
-        for _keyword, pattern, category_name in self._category_keyword_patterns:
-            if pattern.search(query_lower):
-                return category_name
-        return "general"
+        match = self._keyword_automaton.search(query.lower()).get("category")
+        return match.value if match is not None else "general"
 
     def _detect_taxonomy(self, result: ParsedQuery) -> ParsedQuery:
         """Detect 3-level taxonomy hints from the service query.
@@ -794,31 +773,31 @@ class QueryParser:
         Resolution priority: service → subcategory → category (most specific wins).
         """
         text = (result.service_query or result.original_query).lower()
-
-        # 1. Try service keywords (most specific)
-        for keyword, pattern, service_name in self._service_keyword_patterns:
-            if pattern.search(text):
-                result.service_hint = service_name
-                # Derive subcategory and category from service match
-                if keyword in self._subcategory_keywords:
-                    result.subcategory_hint = self._subcategory_keywords[keyword]
-                if keyword in self._category_keywords:
-                    result.category_hint = self._category_keywords[keyword]
-                return result
-
-        # 2. Try subcategory keywords
-        for keyword, pattern, subcategory_name in self._subcategory_keyword_patterns:
-            if pattern.search(text):
-                result.subcategory_hint = subcategory_name
-                if keyword in self._category_keywords:
-                    result.category_hint = self._category_keywords[keyword]
-                return result
-
-        # 3. Try category keywords (broadest)
-        for _keyword, pattern, category_name in self._category_keyword_patterns:
-            if pattern.search(text):
-                result.category_hint = category_name
-                return result
+        matches = self._keyword_automaton.search(text)
+
+        # 1. Service keywords (most specific)
+        service = matches.get("service")
+        if service is not None:
+            result.service_hint = service.value
+            # Derive subcategory and category from service match
+            if service.keyword in self._subcategory_keywords:
+                result.subcategory_hint = self._subcategory_keywords[service.keyword]
+            if service.keyword in self._category_keywords:
+                result.category_hint = self._category_keywords[service.keyword]
+            return result
+
+        # 2. Subcategory keywords
+        subcategory = matches.get("subcategory")
+        if subcategory is not None:
+            result.subcategory_hint = subcategory.value
+            if subcategory.keyword in self._category_keywords:
+                result.category_hint = self._category_keywords[subcategory.keyword]
+            return result
+
+        # 3. Category keywords (broadest)
+        category = matches.get("category")
+        if category is not None:
+            result.category_hint = category.value
 
         return result
 
@@ -35,6 +35,7 @@ if TYPE_CHECKING:
 from app.database import get_db_session
 from app.repositories.ranking_repository import RankingRepository
 from app.services.config_service import DEFAULT_PRICING_CONFIG, ConfigService
+from app.services.search.ranking_snapshot import get_ranking_signal_store
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,9 @@ SKILL_ADJACENT_BOOST = 0.02
 # Bayesian averaging parameters
 BAYESIAN_MIN_REVIEWS = 5
 
+# Soonest-sort tie-break for results without an indexed start time.
+_NO_NEXT_START = datetime.max.replace(tzinfo=timezone.utc)
+
 
 @dataclass(init=False)
 class RankedResult:
@@ -98,6 +102,7 @@ class RankedResult:
     # Availability
     available_dates: List[date] = field(default_factory=list)
     earliest_available: Optional[date] = None
+    next_available_at: Optional[datetime] = None
 
     def __init__(
         self,
@@ -124,6 +129,7 @@ class RankedResult:
         soft_filter_reasons: Optional[List[str]] = None,
         available_dates: Optional[List[date]] = None,
         earliest_available: Optional[date] = None,
+        next_available_at: Optional[datetime] = None,
     ) -> None:
         rate = min_hourly_rate if min_hourly_rate is not None else price_per_hour
         if rate is None:
@@ -152,6 +158,7 @@ class RankedResult:
         self.soft_filter_reasons = list(soft_filter_reasons or [])
         self.available_dates = list(available_dates or [])
         self.earliest_available = earliest_available
+        self.next_available_at = next_available_at
 
     @property
     def price_per_hour(self) -> float:
@@ -256,26 +263,6 @@ class RankingService:
         instructor_ids = list({c.instructor_id for c in candidates})
         service_ids = [c.service_id for c in candidates]
 
-        # Fetch all metrics in batch
-        metrics_start = time_module.perf_counter()
-        instructor_metrics = self.repository.get_instructor_metrics(instructor_ids)
-        perf["instructor_metrics_ms"] = int((time_module.perf_counter() - metrics_start) * 1000)
-        pricing_config = DEFAULT_PRICING_CONFIG
-        if isinstance(self.repository, RankingRepository):
-            pricing_config, _ = ConfigService(self.repository.db).get_pricing_config()
-        founding_boost = self._resolve_founding_boost(pricing_config)
-        # Audience + skill are boosts only; skip these queries unless hints are present.
-        service_audiences: Dict[str, str] = {}
-        service_skills: Dict[str, List[str]] = {}
-        if parsed_query.audience_hint:
-            audience_start = time_module.perf_counter()
-            service_audiences = self.repository.get_service_audience(service_ids)
-            perf["service_audience_ms"] = int((time_module.perf_counter() - audience_start) * 1000)
-        if parsed_query.skill_level:
-            skills_start = time_module.perf_counter()
-            service_skills = self.repository.get_service_skill_levels(service_ids)
-            perf["service_skills_ms"] = int((time_module.perf_counter() - skills_start) * 1000)
-
         # Get distances if user location provided
         distances: Dict[str, float] = {}
         if user_location:
@@ -284,26 +271,16 @@ class RankingService:
             distances = self.repository.get_instructor_distances(instructor_ids, lng, lat)
             perf["distance_query_ms"] = int((time_module.perf_counter() - distance_start) * 1000)
 
-        # Score each candidate
-        scoring_start = time_module.perf_counter()
-        scored: List[RankedResult] = []
-        for candidate in candidates:
-            metrics = instructor_metrics.get(candidate.instructor_id, {})
-            audience = service_audiences.get(candidate.service_id, "both")
-            skills = service_skills.get(candidate.service_id, ["all"])
-            distance_km = distances.get(candidate.instructor_id)
+        store = get_ranking_signal_store()
+        snapshot = store.snapshot if store is not None else None
+        if store is not None and snapshot is not None:
+            from app.services.search.ranking_vectorized import score_from_snapshot
 
-            result = self._score_candidate(
-                candidate,
-                metrics,
-                audience,
-                skills,
-                distance_km,
-                parsed_query,
-                founding_boost,
+            scored = score_from_snapshot(
+                self, store, snapshot, candidates, parsed_query, distances, perf
             )
-            scored.append(result)
-        perf["scoring_ms"] = int((time_module.perf_counter() - scoring_start) * 1000)
+        else:
+            scored = self._score_from_repository(candidates, parsed_query, distances, perf)
 
         # Sort by final_score descending
         sort_start = time_module.perf_counter()
@@ -312,10 +289,11 @@ class RankingService:
 
         # Handle special sort orders
         if parsed_query.urgency == "high":
-            # Sort by earliest available first, then by score
+            # Sort by earliest available first (exact start when indexed), then by score
             scored.sort(
                 key=lambda r: (
                     r.earliest_available or date.max,
+                    r.next_available_at or _NO_NEXT_START,
                     -r.final_score,
                 )
             )
@@ -353,6 +331,59 @@ class RankingService:
             ranking_signals_used=signals_used,
         )
 
+    def _score_from_repository(
+        self,
+        candidates: List["FilteredCandidate"],
+        parsed_query: "ParsedQuery",
+        distances: Dict[str, float],
+        perf: Dict[str, int],
+    ) -> List[RankedResult]:
+        """Fetch ranking signals from the repository and score candidates one by one."""
+        instructor_ids = list({c.instructor_id for c in candidates})
+        service_ids = [c.service_id for c in candidates]
+
+        # Fetch all metrics in batch
+        metrics_start = time_module.perf_counter()
+        instructor_metrics = self.repository.get_instructor_metrics(instructor_ids)
+        perf["instructor_metrics_ms"] = int((time_module.perf_counter() - metrics_start) * 1000)
+        pricing_config = DEFAULT_PRICING_CONFIG
+        if isinstance(self.repository, RankingRepository):
+            pricing_config, _ = ConfigService(self.repository.db).get_pricing_config()
+        founding_boost = self._resolve_founding_boost(pricing_config)
+        # Audience + skill are boosts only; skip these queries unless hints are present.
+        service_audiences: Dict[str, str] = {}
+        service_skills: Dict[str, List[str]] = {}
+        if parsed_query.audience_hint:
+            audience_start = time_module.perf_counter()
+            service_audiences = self.repository.get_service_audience(service_ids)
+            perf["service_audience_ms"] = int((time_module.perf_counter() - audience_start) * 1000)
+        if parsed_query.skill_level:
+            skills_start = time_module.perf_counter()
+            service_skills = self.repository.get_service_skill_levels(service_ids)
+            perf["service_skills_ms"] = int((time_module.perf_counter() - skills_start) * 1000)
+
+        # Score each candidate
+        scoring_start = time_module.perf_counter()
+        scored: List[RankedResult] = []
+        for candidate in candidates:
+            metrics = instructor_metrics.get(candidate.instructor_id, {})
+            audience = service_audiences.get(candidate.service_id, "both")
+            skills = service_skills.get(candidate.service_id, ["all"])
+            distance_km = distances.get(candidate.instructor_id)
+
+            result = self._score_candidate(
+                candidate,
+                metrics,
+                audience,
+                skills,
+                distance_km,
+                parsed_query,
+                founding_boost,
+            )
+            scored.append(result)
+        perf["scoring_ms"] = int((time_module.perf_counter() - scoring_start) * 1000)
+        return scored
+
     def _score_candidate(
         self,
         candidate: "FilteredCandidate",
@@ -434,6 +465,7 @@ class RankingService:
             soft_filter_reasons=list(candidate.soft_filter_reasons),
             available_dates=list(candidate.available_dates),
             earliest_available=candidate.earliest_available,
+            next_available_at=candidate.next_available_at,
         )
 
     @staticmethod
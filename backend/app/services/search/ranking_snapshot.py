@@ -0,0 +1,271 @@
+# backend/app/services/search/ranking_snapshot.py
+"""
+Per-process columnar snapshot of NL search ranking signals.
+
+Ratings, review counts, activity, profile completeness, founding status and the
+per-service audience/skill tags change slowly, yet every ranked search used to
+read them from Postgres. The snapshot holds them as NumPy columns (one row per
+live instructor / active instructor service) so ``RankingService`` can gather
+candidate signals by row index and score them with array arithmetic.
+
+Freshness:
+- ``refresher`` (see ``snapshot_refresher``) rebuilds the snapshot at startup
+  and every ``settings.nl_search_ranking_snapshot_refresh_seconds``.
+- Write hooks in ``cache_invalidation`` mark instructors/services stale in this
+  process; stale and unknown ids are read through ``RankingRepository`` until
+  the next rebuild, so local writes are reflected immediately. Other processes
+  pick them up on their next rebuild.
+
+Enabled with ``settings.nl_search_ranking_snapshot_enabled``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+import logging
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from app.core.config import settings
+from app.services.search.snapshot_refresher import SnapshotRefresher
+
+logger = logging.getLogger(__name__)
+
+AUDIENCES: Tuple[str, ...] = ("both", "kids", "adults")
+_AUDIENCE_CODES = {audience: code for code, audience in enumerate(AUDIENCES)}
+# Date ordinals start at 1, so 0 marks an instructor with no recorded activity.
+NO_ACTIVITY = 0
+
+
+def _day_ordinal(value: Any) -> int:
+    """Match ``RankingService._calculate_freshness_score``'s date handling."""
+    if value is None:
+        return NO_ACTIVITY
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    return NO_ACTIVITY
+
+
+@dataclass(frozen=True)
+class InstructorSignals:
+    """Column-per-signal view of ``RankingRepository.get_instructor_metrics`` rows."""
+
+    avg_rating: np.ndarray
+    review_count: np.ndarray
+    last_active_day: np.ndarray
+    response_rate: np.ndarray
+    has_photo: np.ndarray
+    has_bio: np.ndarray
+    has_background_check: np.ndarray
+    has_identity_verified: np.ndarray
+    is_founding: np.ndarray
+
+    @classmethod
+    def from_metrics(cls, metrics: Sequence[Mapping[str, Any]]) -> InstructorSignals:
+        """Build columns from metric dicts; missing keys take the scalar path's defaults."""
+
+        def flag(key: str) -> npt.NDArray[np.bool_]:
+            column: npt.NDArray[np.bool_] = np.fromiter(
+                (bool(m.get(key)) for m in metrics), dtype=bool, count=len(metrics)
+            )
+            return column
+
+        return cls(
+            avg_rating=np.fromiter(
+                (float(m.get("avg_rating") or 0) for m in metrics),
+                dtype=np.float64,
+                count=len(metrics),
+            ),
+            review_count=np.fromiter(
+                (int(m.get("review_count") or 0) for m in metrics),
+                dtype=np.int64,
+                count=len(metrics),
+            ),
+            last_active_day=np.fromiter(
+                (_day_ordinal(m.get("last_active_at")) for m in metrics),
+                dtype=np.int64,
+                count=len(metrics),
+            ),
+            response_rate=np.fromiter(
+                (float(m.get("response_rate") or 0) for m in metrics),
+                dtype=np.float64,
+                count=len(metrics),
+            ),
+            has_photo=flag("has_photo"),
+            has_bio=flag("has_bio"),
+            has_background_check=flag("has_background_check"),
+            has_identity_verified=flag("has_identity_verified"),
+            is_founding=flag("is_founding_instructor"),
+        )
+
+    def __len__(self) -> int:
+        return int(self.avg_rating.shape[0])
+
+    def take(self, rows: np.ndarray) -> InstructorSignals:
+        """Gather rows (e.g. one per candidate) into new columns."""
+        return InstructorSignals(**{f.name: getattr(self, f.name)[rows] for f in fields(self)})
+
+    def extend(self, other: InstructorSignals) -> InstructorSignals:
+        """Append ``other``'s rows after this instance's rows."""
+        return InstructorSignals(
+            **{
+                f.name: np.concatenate((getattr(self, f.name), getattr(other, f.name)))
+                for f in fields(self)
+            }
+        )
+
+
+def _marked_since(marks: Dict[str, float], cutoff: float) -> Dict[str, float]:
+    return {item_id: marked_at for item_id, marked_at in marks.items() if marked_at >= cutoff}
+
+
+@dataclass(frozen=True)
+class RankingSignalSnapshot:
+    instructor_rows: Dict[str, int]
+    instructors: InstructorSignals
+    service_rows: Dict[str, int]
+    service_audience: np.ndarray
+    service_skills: Tuple[Tuple[str, ...], ...]
+    global_avg_rating: float
+    founding_boost: float
+    built_at: float
+
+
+class RankingSignalStore:
+    """Holds the current snapshot plus ids invalidated since it was read from the DB."""
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[RankingSignalSnapshot] = None
+        self._stale_instructors: Dict[str, float] = {}
+        self._stale_services: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Frozen copies for lock-free reads on the ranking path.
+        self.stale_instructors: FrozenSet[str] = frozenset()
+        self.stale_services: FrozenSet[str] = frozenset()
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def snapshot(self) -> Optional[RankingSignalSnapshot]:
+        return self._snapshot
+
+    def build(
+        self,
+        instructor_metrics: Mapping[str, Mapping[str, Any]],
+        service_signals: Mapping[str, Tuple[str, Sequence[str]]],
+        *,
+        global_avg_rating: float,
+        founding_boost: float,
+        read_started_at: Optional[float] = None,
+    ) -> None:
+        """
+        Publish a new snapshot.
+
+        ``read_started_at`` is the monotonic time the source rows were read; stale
+        marks made after it survive, since the rows may predate those writes.
+        """
+        instructor_ids = list(instructor_metrics)
+        service_ids = list(service_signals)
+        snapshot = RankingSignalSnapshot(
+            instructor_rows={item_id: row for row, item_id in enumerate(instructor_ids)},
+            instructors=InstructorSignals.from_metrics(
+                [instructor_metrics[item_id] for item_id in instructor_ids]
+            ),
+            service_rows={item_id: row for row, item_id in enumerate(service_ids)},
+            service_audience=np.fromiter(
+                (_AUDIENCE_CODES.get(service_signals[s][0], 0) for s in service_ids),
+                dtype=np.int8,
+                count=len(service_ids),
+            ),
+            service_skills=tuple(tuple(service_signals[s][1]) for s in service_ids),
+            global_avg_rating=float(global_avg_rating),
+            founding_boost=float(founding_boost),
+            built_at=time.monotonic(),
+        )
+        cutoff = snapshot.built_at if read_started_at is None else read_started_at
+        with self._lock:
+            self._snapshot = snapshot
+            self._stale_instructors = _marked_since(self._stale_instructors, cutoff)
+            self._stale_services = _marked_since(self._stale_services, cutoff)
+            self._publish_stale()
+
+    def mark_stale(
+        self,
+        instructor_ids: Iterable[str] = (),
+        service_ids: Iterable[str] = (),
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for item_id in instructor_ids:
+                self._stale_instructors[str(item_id)] = now
+            for item_id in service_ids:
+                self._stale_services[str(item_id)] = now
+            self._publish_stale()
+
+    def _publish_stale(self) -> None:
+        self.stale_instructors = frozenset(self._stale_instructors)
+        self.stale_services = frozenset(self._stale_services)
+
+    def load(self, repository: Any, founding_boost: float) -> int:
+        """Full rebuild from ``RankingRepository``; returns the instructor count."""
+        started_at = time.monotonic()
+        instructor_metrics = repository.list_live_instructor_metrics()
+        service_signals = repository.list_active_service_signals()
+        self.build(
+            instructor_metrics,
+            service_signals,
+            global_avg_rating=repository.get_global_average_rating(),
+            founding_boost=founding_boost,
+            read_started_at=started_at,
+        )
+        return len(instructor_metrics)
+
+
+def _sync_from_db(store: RankingSignalStore) -> int:
+    from app.database import get_db_session
+    from app.repositories.ranking_repository import RankingRepository
+    from app.services.config_service import ConfigService
+    from app.services.search.ranking_service import RankingService
+
+    with get_db_session() as db:
+        pricing_config, _ = ConfigService(db).get_pricing_config()
+        founding_boost = RankingService._resolve_founding_boost(pricing_config)
+        return store.load(RankingRepository(db), founding_boost)
+
+
+refresher: SnapshotRefresher[RankingSignalStore] = SnapshotRefresher(
+    "ranking signal snapshot",
+    log_prefix="[RANKING]",
+    enabled=lambda: settings.nl_search_ranking_snapshot_enabled,
+    create=RankingSignalStore,
+    sync=_sync_from_db,
+    interval_seconds=lambda: settings.nl_search_ranking_snapshot_refresh_seconds,
+)
+
+
+def get_ranking_signal_store() -> Optional[RankingSignalStore]:
+    """Return this process's store when the snapshot is enabled and built."""
+    return refresher.get()
+
+
+def note_ranking_signal_change(
+    *,
+    instructor_id: Optional[str] = None,
+    service_id: Optional[str] = None,
+) -> None:
+    """Read these ids through the DB until the next rebuild (no-op without a store)."""
+    store = refresher.current
+    if store is None:
+        return
+    store.mark_stale(
+        instructor_ids=[instructor_id] if instructor_id else (),
+        service_ids=[service_id] if service_id else (),
+    )
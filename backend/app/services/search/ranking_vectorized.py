@@ -0,0 +1,292 @@
+# backend/app/services/search/ranking_vectorized.py
+"""
+Array implementation of the NL search ranking formula over the signal snapshot.
+
+``RankingService`` scores candidates here when the in-process
+``RankingSignalStore`` is built. Each signal mirrors one of the service's
+``_calculate_*`` methods so both paths produce the same scores; only ids missing
+from the snapshot or marked stale since it was built are read through the
+repository.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import time as time_module
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Tuple, TypeAlias, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from app.services.search.ranking_service import (
+    BAYESIAN_MIN_REVIEWS,
+    WEIGHT_COMPLETENESS,
+    WEIGHT_DISTANCE,
+    WEIGHT_FRESHNESS,
+    WEIGHT_PRICE,
+    WEIGHT_QUALITY,
+    WEIGHT_RELEVANCE,
+    RankedResult,
+    RankingService,
+)
+from app.services.search.ranking_snapshot import (
+    AUDIENCES,
+    NO_ACTIVITY,
+    InstructorSignals,
+    RankingSignalSnapshot,
+    RankingSignalStore,
+)
+
+if TYPE_CHECKING:
+    from app.services.search.filter_service import FilteredCandidate
+    from app.services.search.query_parser import ParsedQuery
+
+Scores: TypeAlias = npt.NDArray[np.float64]
+
+# Completeness by number of components met; summed the way _calculate_completeness_score does.
+_COMPLETENESS_BY_COUNT: Scores = np.cumsum([0.0] + [0.2] * 5)
+_ALL_SKILLS: Tuple[str, ...] = ("all",)
+
+_T = TypeVar("_T")
+
+
+def score_from_snapshot(
+    service: RankingService,
+    store: RankingSignalStore,
+    snapshot: RankingSignalSnapshot,
+    candidates: List["FilteredCandidate"],
+    parsed_query: "ParsedQuery",
+    distances: Dict[str, float],
+    perf: Dict[str, int],
+) -> List[RankedResult]:
+    """Score all candidates at once from the snapshot; same scores as ``_score_candidate``."""
+    count = len(candidates)
+    lookup_start = time_module.perf_counter()
+    columns = _instructor_columns(service, store, snapshot, candidates, perf)
+    audience_boost = _audience_boosts(service, store, snapshot, candidates, parsed_query)
+    skill_boost = _skill_boosts(service, store, snapshot, candidates, parsed_query)
+    perf["snapshot_lookup_ms"] = int((time_module.perf_counter() - lookup_start) * 1000)
+
+    scoring_start = time_module.perf_counter()
+    relevance: Scores = np.fromiter((c.hybrid_score for c in candidates), np.float64, count)
+    quality = _quality_scores(columns, snapshot.global_avg_rating)
+    distance = _distance_scores(
+        np.fromiter((distances.get(c.instructor_id, np.nan) for c in candidates), np.float64, count)
+    )
+    price = _price_scores(
+        np.fromiter((c.effective_hourly_rate for c in candidates), np.float64, count),
+        parsed_query.max_price,
+    )
+    freshness = _freshness_scores(columns.last_active_day)
+    completeness = _completeness_scores(columns)
+
+    base = (
+        WEIGHT_RELEVANCE * relevance
+        + WEIGHT_QUALITY * quality
+        + WEIGHT_DISTANCE * distance
+        + WEIGHT_PRICE * price
+        + WEIGHT_FRESHNESS * freshness
+        + WEIGHT_COMPLETENESS * completeness
+    )
+    final = base + audience_boost + skill_boost
+    final = np.where(columns.is_founding, final * snapshot.founding_boost, final)
+
+    scored = [
+        RankedResult(
+            service_id=candidate.service_id,
+            service_catalog_id=candidate.service_catalog_id,
+            instructor_id=candidate.instructor_id,
+            name=candidate.name,
+            description=candidate.description,
+            min_hourly_rate=candidate.min_hourly_rate,
+            effective_hourly_rate=candidate.effective_hourly_rate,
+            final_score=float(final[i]),
+            rank=0,  # Set later after sorting
+            relevance_score=float(relevance[i]),
+            quality_score=float(quality[i]),
+            distance_score=float(distance[i]),
+            price_score=float(price[i]),
+            freshness_score=float(freshness[i]),
+            completeness_score=float(completeness[i]),
+            audience_boost=float(audience_boost[i]),
+            skill_boost=float(skill_boost[i]),
+            soft_filtered=candidate.soft_filtered,
+            soft_filter_reasons=list(candidate.soft_filter_reasons),
+            available_dates=list(candidate.available_dates),
+            earliest_available=candidate.earliest_available,
+            next_available_at=candidate.next_available_at,
+        )
+        for i, candidate in enumerate(candidates)
+    ]
+    perf["scoring_ms"] = int((time_module.perf_counter() - scoring_start) * 1000)
+    return scored
+
+
+def _instructor_columns(
+    service: RankingService,
+    store: RankingSignalStore,
+    snapshot: RankingSignalSnapshot,
+    candidates: List["FilteredCandidate"],
+    perf: Dict[str, int],
+) -> InstructorSignals:
+    """One signal row per candidate; missing or stale instructors are read from the DB."""
+    signals = snapshot.instructors
+    instructor_rows: Dict[str, int] = {}
+    missing: List[str] = []
+    for instructor_id in dict.fromkeys(c.instructor_id for c in candidates):
+        row = snapshot.instructor_rows.get(instructor_id, -1)
+        if row < 0 or instructor_id in store.stale_instructors:
+            row = len(signals) + len(missing)
+            missing.append(instructor_id)
+        instructor_rows[instructor_id] = row
+    if missing:
+        fetched = service.repository.get_instructor_metrics(missing)
+        signals = signals.extend(
+            InstructorSignals.from_metrics([fetched.get(i, {}) for i in missing])
+        )
+        perf["instructor_metrics_fallback"] = len(missing)
+    rows = np.fromiter(
+        (instructor_rows[c.instructor_id] for c in candidates),
+        dtype=np.int64,
+        count=len(candidates),
+    )
+    return signals.take(rows)
+
+
+def _audience_boosts(
+    service: RankingService,
+    store: RankingSignalStore,
+    snapshot: RankingSignalSnapshot,
+    candidates: List["FilteredCandidate"],
+    parsed_query: "ParsedQuery",
+) -> Scores:
+    if not parsed_query.audience_hint:
+        return np.zeros(len(candidates))
+    audiences = _service_values(
+        store,
+        snapshot,
+        candidates,
+        lambda row: AUDIENCES[int(snapshot.service_audience[row])],
+        service.repository.get_service_audience,
+        "both",
+    )
+    boost_for = {
+        audience: service._calculate_audience_boost(audience, parsed_query.audience_hint)
+        for audience in set(audiences)
+    }
+    return np.fromiter((boost_for[a] for a in audiences), np.float64, len(candidates))
+
+
+def _skill_boosts(
+    service: RankingService,
+    store: RankingSignalStore,
+    snapshot: RankingSignalSnapshot,
+    candidates: List["FilteredCandidate"],
+    parsed_query: "ParsedQuery",
+) -> Scores:
+    if not parsed_query.skill_level:
+        return np.zeros(len(candidates))
+
+    def fetch(service_ids: List[str]) -> Dict[str, Tuple[str, ...]]:
+        skills = service.repository.get_service_skill_levels(service_ids)
+        return {service_id: tuple(levels) for service_id, levels in skills.items()}
+
+    skills = _service_values(
+        store,
+        snapshot,
+        candidates,
+        lambda row: snapshot.service_skills[row],
+        fetch,
+        _ALL_SKILLS,
+    )
+    boost_for = {
+        levels: service._calculate_skill_boost(list(levels), parsed_query.skill_level)
+        for levels in set(skills)
+    }
+    return np.fromiter((boost_for[s] for s in skills), np.float64, len(candidates))
+
+
+def _service_values(
+    store: RankingSignalStore,
+    snapshot: RankingSignalSnapshot,
+    candidates: List["FilteredCandidate"],
+    from_row: Callable[[int], _T],
+    fetch: Callable[[List[str]], Mapping[str, _T]],
+    default: _T,
+) -> List[_T]:
+    """Per-candidate service signal; ids missing or stale in the snapshot use ``fetch``."""
+    values: Dict[str, _T] = {}
+    missing: List[str] = []
+    for service_id in dict.fromkeys(c.service_id for c in candidates):
+        row = snapshot.service_rows.get(service_id)
+        if row is None or service_id in store.stale_services:
+            missing.append(service_id)
+        else:
+            values[service_id] = from_row(row)
+    fetched = fetch(missing) if missing else {}
+    for service_id in missing:
+        values[service_id] = fetched.get(service_id, default)
+    return [values[c.service_id] for c in candidates]
+
+
+def _quality_scores(columns: InstructorSignals, global_avg: float) -> Scores:
+    """Bayesian average; no reviews falls back to the global average."""
+    reviews = columns.review_count
+    quality: Scores = np.where(
+        reviews == 0,
+        global_avg / 5.0,
+        (columns.avg_rating * reviews + global_avg * BAYESIAN_MIN_REVIEWS)
+        / (reviews + BAYESIAN_MIN_REVIEWS)
+        / 5.0,
+    )
+    return quality
+
+
+def _distance_scores(distance_km: Scores) -> Scores:
+    """Distance decay; NaN marks an unknown distance."""
+    with np.errstate(invalid="ignore"):
+        distance: Scores = np.select(
+            [np.isnan(distance_km), distance_km <= 1, distance_km <= 10],
+            [0.7, 1.0, 1.0 - ((distance_km - 1) / 9) * 0.5],
+            np.maximum(0.2, 0.5 - ((distance_km - 10) / 20) * 0.3),
+        )
+    return distance
+
+
+def _price_scores(rates: Scores, max_price: Optional[int]) -> Scores:
+    if max_price is None:
+        return np.full(len(rates), 0.7)
+    ratio = rates / max_price
+    price: Scores = np.select(
+        [ratio <= 0.7, ratio <= 1.0], [1.0, 1.0 - ((ratio - 0.7) / 0.3) * 0.3], 0.5
+    )
+    return price
+
+
+def _freshness_scores(last_active_day: npt.NDArray[np.int64]) -> Scores:
+    today = datetime.now(timezone.utc).date().toordinal()
+    days_since: npt.NDArray[np.int64] = today - last_active_day
+    freshness: Scores = np.select(
+        [
+            last_active_day == NO_ACTIVITY,
+            days_since <= 1,
+            days_since <= 7,
+            days_since <= 30,
+            days_since <= 90,
+        ],
+        [0.5, 1.0, 0.9, 0.7, 0.5],
+        0.3,
+    )
+    return freshness
+
+
+def _completeness_scores(columns: InstructorSignals) -> Scores:
+    """Response rate is stored as 0-100."""
+    completed = (
+        columns.has_photo.astype(np.int64)
+        + columns.has_bio
+        + columns.has_background_check
+        + columns.has_identity_verified
+        + (columns.response_rate / 100 > 0.8)
+    )
+    completeness: Scores = _COMPLETENESS_BY_COUNT[completed]
+    return completeness
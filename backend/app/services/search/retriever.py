@@ -20,8 +20,10 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol,
 
 from app.database import get_db_session
 from app.repositories.retriever_repository import RetrieverRepository
+from app.services.search import ann_index
 from app.services.search.config import get_search_config
 from app.services.search.embedding_service import EmbeddingService
+from app.services.search.metrics import record_vector_backend
 
 # Type alias for service data dictionary
 ServiceData = Dict[str, Any]
@@ -364,12 +366,24 @@ class PostgresRetriever:
         top_k: int,
     ) -> Dict[str, Tuple[float, ServiceData]]:
         """
-        Run semantic vector similarity search using pgvector.
+        Run semantic vector similarity search.
 
-        Returns dict mapping service_id to (score, service_data).
+        Uses the in-memory catalog embedding index when it is enabled and built,
+        otherwise pgvector. Returns dict mapping service_id to (score, service_data).
         """
-        rows = repo.vector_search(query_embedding, top_k)
+        results = ann_index.search_services(
+            ann_index.get_service_embedding_index(),
+            query_embedding,
+            top_k,
+            lambda scores, limit: self._vector_rows(repo.services_for_catalogs(scores, limit)),
+        )
+        if results is not None:
+            return results
+        record_vector_backend("pgvector")
+        return self._vector_rows(repo.vector_search(query_embedding, top_k))
 
+    @staticmethod
+    def _vector_rows(rows: List[Dict[str, Any]]) -> Dict[str, Tuple[float, ServiceData]]:
         return {
             str(row["id"]): (
                 float(row["vector_score"]),
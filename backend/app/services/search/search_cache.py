@@ -63,6 +63,27 @@ RELATIVE_DATE_INDICATORS = [
 ]
 
 
+def response_key_hash(
+    query: str,
+    user_location: Optional[tuple[float, float]],
+    filters: Optional[Dict[str, Any]],
+    limit: int,
+    region_code: str,
+) -> str:
+    """Hash a normalized search request; shared by every version of its response key."""
+    # Normalize query: lowercase, strip whitespace, collapse multiple spaces
+    normalized_query = " ".join(query.lower().split())
+    key_data = {
+        "q": normalized_query,
+        "loc": f"{user_location[0]:.3f},{user_location[1]:.3f}" if user_location else None,
+        "f": json.dumps(filters, sort_keys=True) if filters else None,
+        "limit": limit,
+        "region": region_code.lower().strip(),
+    }
+    key_str = json.dumps(key_data, sort_keys=True)
+    return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+
+
 @dataclass
 class CachedLocation:
     """Cached location data from geocoding."""
@@ -182,24 +203,89 @@ class SearchCacheService:
     ) -> str:
         """Generate versioned response cache key."""
         version = await self._get_cache_version()
-        region = (region_code or self._region_code).lower().strip()
+        key_hash = self._response_key_hash(
+            query, user_location, filters, limit, region_code=region_code
+        )
+        return f"{RESPONSE_PREFIX}:v{version}:{key_hash}"
 
-        # Build normalized key data
-        # Normalize query: lowercase, strip whitespace, collapse multiple spaces
-        normalized_query = " ".join(query.lower().split())
-        key_data = {
-            "q": normalized_query,
-            "loc": f"{user_location[0]:.3f},{user_location[1]:.3f}" if user_location else None,
-            "f": json.dumps(filters, sort_keys=True) if filters else None,
-            "limit": limit,
-            "region": region,
-        }
+    def _response_key_hash(
+        self,
+        query: str,
+        user_location: Optional[tuple[float, float]],
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        region_code: str | None = None,
+    ) -> str:
+        return response_key_hash(
+            query, user_location, filters, limit, region_code or self._region_code
+        )
 
-        # Hash the key data
-        key_str = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.sha256(key_str.encode()).hexdigest()[:16]
+    async def get_stale_response(
+        self,
+        query: str,
+        user_location: Optional[tuple[float, float]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        region_code: str | None = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the response cached under the previous cache version, if still present.
 
-        return f"{RESPONSE_PREFIX}:v{version}:{key_hash}"
+        Used for stale-while-revalidate right after ``invalidate_response_cache``:
+        entries from the old version stay readable until their TTL expires.
+        """
+        if not self.cache:
+            return None
+
+        try:
+            version = await self._get_cache_version()
+            if version <= 1:
+                return None
+            key_hash = self._response_key_hash(
+                query, user_location, filters, limit, region_code=region_code
+            )
+            cached = await self.cache.get(f"{RESPONSE_PREFIX}:v{version - 1}:{key_hash}")
+            if cached:
+                logger.debug("Stale response cache HIT: %s", key_hash)
+                return self._deserialize_response(cached)
+        except Exception as e:
+            logger.warning("Stale response cache error: %s", e)
+
+        return None
+
+    async def acquire_rebuild_lock(
+        self,
+        query: str,
+        user_location: Optional[tuple[float, float]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        region_code: str | None = None,
+        ttl: int = 15,
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Try to become the one worker rebuilding a response cache entry.
+
+        Returns ``(acquired, lock_key)``. Without a cache backend every caller is
+        allowed to rebuild.
+        """
+        if not self.cache:
+            return True, None
+
+        key = await self._response_cache_key(
+            query, user_location, filters, limit, region_code=region_code
+        )
+        lock_key = f"lock:{key}"
+        acquired = await self.cache.acquire_lock(lock_key, ttl=ttl)
+        return bool(acquired), lock_key if acquired else None
+
+    async def release_rebuild_lock(self, lock_key: Optional[str]) -> None:
+        """Release a lock returned by ``acquire_rebuild_lock``."""
+        if not self.cache or not lock_key:
+            return
+        try:
+            await self.cache.release_lock(lock_key)
+        except Exception as e:
+            logger.warning("Failed to release rebuild lock %s: %s", lock_key, e)
 
     async def _get_cache_version(self) -> int:
         """Get current cache version."""
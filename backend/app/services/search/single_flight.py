@@ -0,0 +1,52 @@
+# backend/app/services/search/single_flight.py
+"""
+Per-worker request coalescing ("single-flight") for NL search.
+
+Concurrent callers that miss the response cache with the same key share one
+pipeline run instead of each hitting OpenAI and Postgres. The shared work runs in
+its own task, so a leader whose client disconnects does not cancel the result the
+followers are waiting on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, Dict, Generic, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Deduplicate concurrent async calls by key within one event loop."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Future[T]] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run ``fn`` unless a call for ``key`` is already in flight.
+
+        Returns ``(result, shared)`` where ``shared`` is True for callers that
+        joined an existing call. Exceptions propagate to every caller.
+        """
+        call = self._calls.get(key)
+        shared = call is not None
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(call), shared
+
+    def _forget(self, key: str, call: asyncio.Future[T]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # Mark the exception retrieved even if every caller went away.
+            call.exception()
@@ -0,0 +1,88 @@
+# backend/app/services/search/snapshot_refresher.py
+"""
+Process-wide owner for in-memory search structures rebuilt from the database.
+
+The ANN service index and the ranking signal snapshot share one lifecycle: the
+API worker publishes the structure, syncs it from Postgres in a worker thread at
+startup and then on a fixed interval, and drops it at shutdown. Readers never
+lock: each sync publishes a new immutable snapshot inside the structure, and
+callers only see it once ``ready`` is true.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import Callable, Generic, Optional, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot(Protocol):
+    @property
+    def ready(self) -> bool:
+        ...
+
+
+S = TypeVar("S", bound=Snapshot)
+
+
+class SnapshotRefresher(Generic[S]):
+    """Publishes one snapshot-backed structure and keeps it in sync on a schedule."""
+
+    def __init__(
+        self,
+        label: str,
+        *,
+        log_prefix: str,
+        enabled: Callable[[], bool],
+        create: Callable[[], S],
+        sync: Callable[[S], int],
+        interval_seconds: Callable[[], float],
+    ) -> None:
+        self.label = label
+        self.log_prefix = log_prefix
+        self._enabled = enabled
+        self._create = create
+        self._sync = sync
+        self._interval_seconds = interval_seconds
+        self.current: Optional[S] = None
+
+    def get(self) -> Optional[S]:
+        """Return the published structure when enabled and built."""
+        if not self._enabled():
+            return None
+        current = self.current
+        return current if current is not None and current.ready else None
+
+    async def run(self, target: S) -> None:
+        """Publish ``target``, build it, then re-sync it until cancelled."""
+        # Publish before the first build so in-process writes during it are recorded.
+        self.current = target
+        while True:
+            try:
+                was_ready = target.ready
+                count = await asyncio.to_thread(self._sync, target)
+                if not was_ready:
+                    logger.info("%s %s built (%s entries)", self.log_prefix, self.label, count)
+                else:
+                    logger.debug("%s %s refreshed (%s)", self.log_prefix, self.label, count)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("%s %s refresh failed: %s", self.log_prefix, self.label, exc)
+            await asyncio.sleep(self._interval_seconds())
+
+    def start(self) -> Optional[asyncio.Task[None]]:
+        """Start the refresher task when enabled. Call from the lifespan."""
+        if not self._enabled():
+            return None
+        return asyncio.create_task(self.run(self._create()))
+
+    async def stop(self, task: Optional[asyncio.Task[None]]) -> None:
+        """Cancel the refresher task and drop the published structure."""
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(BaseException):
+                await task
+        self.current = None
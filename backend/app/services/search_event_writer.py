@@ -0,0 +1,206 @@
+# backend/app/services/search_event_writer.py
+"""
+Write-behind buffer for search analytics enrichment.
+
+Recording a search used to upsert the history row and then, on the request
+path, enforce the per-user history limit, resolve geolocation, parse the user
+agent, look up returning-user state and insert the search event plus its
+observability candidates. With ``settings.search_event_write_behind_enabled``
+the request upserts the history row and inserts the bare event row, so its id
+is valid in every worker as soon as the search returns. The derived writes are
+queued here once that row is committed:
+
+  record_search → event row inserted, PendingSearchEvent queued after commit
+                → bounded per-worker deque
+                → flusher task → SearchHistoryService.persist_search_events(batch)
+                → one bulk UPDATE for enrichment, one multi-row INSERT for candidates
+
+Backpressure: the deque holds at most ``settings.search_event_buffer_size``
+events. When it is full (or the flusher is not running in this process),
+``submit`` returns False and the search writes the derived data itself, so
+load turns into request latency instead of unbounded memory.
+
+Delivery is at-least-once for the life of the worker: a failed batch is retried
+record by record. Enrichment updates are idempotent and candidates are only
+inserted for events that have none yet, so a retried batch never duplicates
+rows. Records that keep failing are dropped after ``MAX_ATTEMPTS``. Shutdown
+drains the buffer; a crashed worker leaves its buffered events unenriched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import contextlib
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.schemas.search_context import SearchUserContext
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+
+
+@dataclass
+class PendingSearchEvent:
+    """A committed search event whose derived data is not yet written."""
+
+    event_id: str
+    searched_at: datetime
+    context: SearchUserContext
+    request_ip: Optional[str] = None
+    user_agent: Optional[str] = None
+    device_context: Optional[Dict[str, Any]] = None
+    candidates: List[Dict[str, Any]] = field(default_factory=list)
+    attempts: int = 0
+
+
+BatchWriter = Callable[[Sequence[PendingSearchEvent]], Awaitable[None]]
+
+
+class SearchEventWriter:
+    """Bounded in-process buffer flushed in batches by a single task."""
+
+    def __init__(
+        self,
+        write_batch: BatchWriter,
+        *,
+        max_pending: int,
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        self._write_batch = write_batch
+        self._max_pending = max(1, max_pending)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._queue: Deque[PendingSearchEvent] = deque()
+        self._wake = asyncio.Event()
+        self._closed = False
+        self.loop = asyncio.get_running_loop()
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def submit(self, record: PendingSearchEvent) -> bool:
+        """Queue ``record``; False means the caller must write it itself."""
+        if self._closed or len(self._queue) >= self._max_pending:
+            return False
+        self._queue.append(record)
+        if len(self._queue) >= self._batch_size:
+            self._wake.set()
+        return True
+
+    async def run(self) -> None:
+        """Flush on a timer or whenever a full batch is waiting, until cancelled."""
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self._flush_interval)
+            self._wake.clear()
+            while self._queue:
+                if not await self.flush_once():
+                    break
+
+    async def drain(self) -> None:
+        """Stop accepting events and write what is still buffered."""
+        self._closed = True
+        failures = 0
+        while self._queue and failures < MAX_ATTEMPTS:
+            if not await self.flush_once():
+                failures += 1
+        if self._queue:
+            logger.error("[SEARCH-EVENTS] Dropping %s unwritten search events", len(self._queue))
+
+    async def flush_once(self) -> bool:
+        """Write the oldest batch. Returns False if any record had to be requeued."""
+        batch = [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+        if not batch:
+            return True
+        try:
+            await self._write_batch(batch)
+            failed: List[PendingSearchEvent] = []
+        except Exception as exc:
+            logger.warning(
+                "[SEARCH-EVENTS] Batch of %s failed, retrying singly: %s", len(batch), exc
+            )
+            failed = await self._write_singly(batch) if len(batch) > 1 else batch
+
+        retry = []
+        for record in failed:
+            record.attempts += 1
+            if record.attempts < MAX_ATTEMPTS:
+                retry.append(record)
+            else:
+                logger.error(
+                    "[SEARCH-EVENTS] Dropping search event %s after %s attempts",
+                    record.event_id,
+                    record.attempts,
+                )
+        # Retried records go back to the front so events stay roughly in order.
+        self._queue.extendleft(reversed(retry))
+        return not retry
+
+    async def _write_singly(self, batch: Sequence[PendingSearchEvent]) -> List[PendingSearchEvent]:
+        failed: List[PendingSearchEvent] = []
+        for record in batch:
+            try:
+                await self._write_batch([record])
+            except Exception as exc:
+                logger.warning(
+                    "[SEARCH-EVENTS] Failed to write search event %s: %s", record.event_id, exc
+                )
+                failed.append(record)
+        return failed
+
+
+async def _persist_batch(batch: Sequence[PendingSearchEvent]) -> None:
+    from app.database import get_db_session
+    from app.services.search_history_service import SearchHistoryService
+
+    with get_db_session() as db:
+        await SearchHistoryService(db).persist_search_events(batch)
+
+
+_writer: Optional[SearchEventWriter] = None
+
+
+def get_search_event_writer() -> Optional[SearchEventWriter]:
+    """Return this worker's writer when it runs on the calling event loop."""
+    if _writer is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _writer if _writer.loop is loop else None
+
+
+def start_search_event_writer() -> Optional[asyncio.Task[None]]:
+    """Start the flusher task. Call from the lifespan."""
+    global _writer
+    if not settings.search_event_write_behind_enabled:
+        return None
+    _writer = SearchEventWriter(
+        _persist_batch,
+        max_pending=settings.search_event_buffer_size,
+        batch_size=settings.search_event_flush_batch_size,
+        flush_interval=settings.search_event_flush_interval_ms / 1000.0,
+    )
+    return asyncio.create_task(_writer.run())
+
+
+async def stop_search_event_writer(task: Optional[asyncio.Task[None]]) -> None:
+    """Stop the flusher and drain buffered events."""
+    global _writer
+    if task is None:
+        return
+    task.cancel()
+    with contextlib.suppress(BaseException):
+        await task
+    writer, _writer = _writer, None
+    if writer is not None:
+        await writer.drain()
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta, timezone
 import hashlib
 import logging
 import math
-from typing import Any, Optional, cast
+from typing import Any, Optional, Sequence, cast
 
 from sqlalchemy.orm import Session
 
@@ -27,6 +27,7 @@ from ..schemas.search_context import SearchUserContext
 from .base import BaseService
 from .device_tracking_service import DeviceTrackingService
 from .geolocation_service import GeolocationService
+from .search_event_writer import PendingSearchEvent, get_search_event_writer
 
 
 def _get_attr(obj: Any, key: str, default: Any = None) -> Any:
@@ -40,6 +41,63 @@ def _get_attr(obj: Any, key: str, default: Any = None) -> Any:
 
 logger = logging.getLogger(__name__)
 
+# Guests count as returning once their session has searches older than this.
+GUEST_RETURNING_AFTER = timedelta(minutes=30)
+
+
+def _hash_ip(request_ip: str | None) -> str | None:
+    return hashlib.sha256(request_ip.encode()).hexdigest() if request_ip else None
+
+
+def _normalize_candidates(candidates: list[dict[str, Any]] | None) -> list[dict[str, Any]]:
+    """Normalize observability candidate payload keys."""
+    return [
+        {
+            "position": int(_get_attr(c, "position", idx + 1)),
+            "service_catalog_id": _get_attr(c, "service_catalog_id") or _get_attr(c, "id"),
+            "score": _get_attr(c, "score"),
+            "vector_score": _get_attr(c, "vector_score"),
+            "lexical_score": _get_attr(c, "lexical_score"),
+            "source": _get_attr(c, "source", "hybrid"),
+        }
+        for idx, c in enumerate(candidates or [])
+    ]
+
+
+def _event_fields(
+    context: SearchUserContext,
+    search_data: dict[str, Any],
+    ip_hash: str | None,
+    geo_data: dict[str, Any] | None,
+    browser_info: dict[str, Any] | None,
+    device_context: dict[str, Any] | None,
+    is_returning: bool,
+) -> dict[str, Any]:
+    search_context = search_data.get("context")
+    return {
+        "user_id": context.user_id,
+        "guest_session_id": context.guest_session_id,
+        "search_query": search_data["search_query"],
+        "search_type": search_data.get("search_type", "natural_language"),
+        "results_count": search_data.get("results_count", 0),
+        "session_id": getattr(context, "session_id", None),
+        "referrer": search_data.get("referrer"),
+        "search_context": search_context,
+        # Enhanced analytics fields
+        "ip_address": None,  # Never store raw IP
+        "ip_address_hash": ip_hash,
+        "geo_data": geo_data,
+        "device_type": _get_attr(device_context, "device_type"),
+        "browser_info": browser_info,
+        "connection_type": _get_attr(device_context, "connection_type"),
+        "is_returning_user": is_returning,
+        "page_view_count": search_context.get("page_view_count") if search_context else None,
+        "session_duration": search_context.get("session_duration") if search_context else None,
+        "consent_given": True,  # Default for now
+        "consent_type": "analytics",  # Default for now
+    }
+
+
 ALLOWED_INTERACTION_TYPES = {
     "view",
     "click",
@@ -172,125 +230,28 @@ class SearchHistoryService(BaseService):
                     result.search_count,
                 )
 
-            # Maintain limit per user/guest
-            await asyncio.to_thread(self._enforce_search_limit, context)
-
-            # Process analytics data
-            ip_hash: str | None = None
-            geo_data: dict[str, Any] | None = None
-            browser_info: dict[str, Any] | None = None
-
-            # Hash IP address for privacy
-            if request_ip:
-                ip_hash = hashlib.sha256(request_ip.encode()).hexdigest()
-
-                # Get geolocation data
-                try:
-                    geo_data = await self.geolocation_service.get_location_from_ip(request_ip)
-                except Exception as e:
-                    logger.warning("Failed to get geolocation: %s", str(e))
-
-            # Parse device/browser info
-            if user_agent:
-                device_info = self.device_tracking_service.parse_user_agent(user_agent)
-                browser_info = self.device_tracking_service.format_for_analytics(device_info)
-
-            # Merge with frontend device context
-            if device_context and browser_info:
-                browser_info.update(
-                    {
-                        "device": {
-                            **browser_info.get("device", {}),
-                            "type": _get_attr(
-                                device_context,
-                                "device_type",
-                                browser_info.get("device", {}).get("type"),
-                            ),
-                        },
-                        "viewport": _get_attr(device_context, "viewport_size"),
-                        "screen": _get_attr(device_context, "screen_resolution"),
-                        "connection": {
-                            "type": _get_attr(device_context, "connection_type"),
-                            "effective_type": _get_attr(
-                                device_context, "connection_effective_type"
-                            ),
-                        },
-                    }
-                )
-
-            # Check if returning user
-            is_returning = False
-            if context.user_id:
-                # Check if user has searched before
-                previous_search = await asyncio.to_thread(
-                    self.event_repository.get_previous_search_event,
-                    cast(Any, context.user_id),
-                    None,
-                    datetime.now(timezone.utc),
-                )
-                is_returning = previous_search is not None
-            elif context.guest_session_id:
-                # Check guest session history (with 30 minute offset)
-                previous_search = await asyncio.to_thread(
-                    self.event_repository.get_previous_search_event,
-                    None,
-                    context.guest_session_id,
-                    datetime.now(timezone.utc) - timedelta(minutes=30),
+            writer = get_search_event_writer()
+            pending: PendingSearchEvent | None = None
+            if writer is not None:
+                pending = await self._insert_search_event_row(
+                    context,
+                    search_data,
+                    request_ip,
+                    user_agent,
+                    device_context,
+                    observability_candidates,
                 )
-                is_returning = previous_search is not None
-
-            # Always create event for analytics (append-only) with enhanced data
-            event_data = {
-                "user_id": context.user_id,
-                "guest_session_id": context.guest_session_id,
-                "search_query": search_data["search_query"],
-                "search_type": search_data.get("search_type", "natural_language"),
-                "results_count": search_data.get("results_count", 0),
-                "session_id": getattr(context, "session_id", None),
-                "referrer": search_data.get("referrer"),
-                "search_context": search_data.get("context"),
-                # Enhanced analytics fields
-                "ip_address": None,  # Never store raw IP
-                "ip_address_hash": ip_hash,
-                "geo_data": geo_data,
-                "device_type": _get_attr(device_context, "device_type"),
-                "browser_info": browser_info,
-                "connection_type": _get_attr(device_context, "connection_type"),
-                "is_returning_user": is_returning,
-                "page_view_count": search_data.get("context", {}).get("page_view_count")
-                if search_data.get("context")
-                else None,
-                "session_duration": search_data.get("context", {}).get("session_duration")
-                if search_data.get("context")
-                else None,
-                "consent_given": True,  # Default for now
-                "consent_type": "analytics",  # Default for now
-            }
-            event = await asyncio.to_thread(self.event_repository.create_event, event_data)
-
-            # Persist observability top-N candidates if provided
-            try:
-                if observability_candidates:
-                    # Normalize candidate payload keys (use module-level _get_attr helper)
-                    normalized = []
-                    for idx, c in enumerate(observability_candidates):
-                        normalized.append(
-                            {
-                                "position": int(_get_attr(c, "position", idx + 1)),
-                                "service_catalog_id": _get_attr(c, "service_catalog_id")
-                                or _get_attr(c, "id"),
-                                "score": _get_attr(c, "score"),
-                                "vector_score": _get_attr(c, "vector_score"),
-                                "lexical_score": _get_attr(c, "lexical_score"),
-                                "source": _get_attr(c, "source", "hybrid"),
-                            }
-                        )
-                    await asyncio.to_thread(
-                        self.event_repository.bulk_insert_candidates, event.id, normalized
-                    )
-            except Exception as e:
-                logger.warning(
-                    "Failed to persist observability candidates for event %s: %s", event.id, e
+                event_id = pending.event_id
+            else:
+                # Maintain limit per user/guest
+                await asyncio.to_thread(self._enforce_search_limit, context)
+                event_id = await self._create_search_event(
+                    context,
+                    search_data,
+                    request_ip,
+                    user_agent,
+                    device_context,
+                    observability_candidates,
                 )
 
             # Use service transaction pattern instead of direct DB operations
@@ -301,8 +262,12 @@ class SearchHistoryService(BaseService):
             # repo-pattern-ignore: Refresh after upsert to get updated values belongs in service layer
             await asyncio.to_thread(self.db.refresh, result)
 
+            # Derived writes are queued only once the event row is committed.
+            if pending is not None and writer is not None and not writer.submit(pending):
+                await self._persist_now(pending)
+
             # Store the event ID on the result for frontend use
-            setattr(result, "search_event_id", event.id)
+            setattr(result, "search_event_id", event_id)
 
             return result
 
@@ -310,6 +275,209 @@ class SearchHistoryService(BaseService):
             logger.error("Error recording search: %s", str(e))
             raise
 
+    async def _insert_search_event_row(
+        self,
+        context: SearchUserContext,
+        search_data: dict[str, Any],
+        request_ip: str | None,
+        user_agent: str | None,
+        device_context: dict[str, Any] | None,
+        observability_candidates: list[dict[str, Any]] | None,
+    ) -> PendingSearchEvent:
+        """Insert the event row without derived data; the rest is written write-behind."""
+        searched_at = datetime.now(timezone.utc)
+        event_data = _event_fields(
+            context, search_data, _hash_ip(request_ip), None, None, device_context, False
+        )
+        event = await asyncio.to_thread(
+            self.event_repository.create_event, {**event_data, "searched_at": searched_at}
+        )
+        return PendingSearchEvent(
+            event_id=str(event.id),
+            searched_at=searched_at,
+            context=context,
+            request_ip=request_ip,
+            user_agent=user_agent,
+            device_context=device_context,
+            candidates=_normalize_candidates(observability_candidates),
+        )
+
+    async def _persist_now(self, pending: PendingSearchEvent) -> None:
+        """Write derived data on the request path when the buffer cannot take it."""
+        try:
+            await self.persist_search_events([pending])
+        except Exception as e:
+            logger.warning("Failed to enrich search event %s: %s", pending.event_id, e)
+
+    async def _create_search_event(
+        self,
+        context: SearchUserContext,
+        search_data: dict[str, Any],
+        request_ip: str | None,
+        user_agent: str | None,
+        device_context: dict[str, Any] | None,
+        observability_candidates: list[dict[str, Any]] | None,
+    ) -> str:
+        """Write one search event and its candidates on the request path."""
+        # Hash IP address for privacy
+        ip_hash = _hash_ip(request_ip)
+        geo_data = await self._lookup_geolocation(request_ip)
+        browser_info = self._browser_info(user_agent, device_context)
+
+        # Check if returning user
+        is_returning = False
+        if context.user_id:
+            # Check if user has searched before
+            previous_search = await asyncio.to_thread(
+                self.event_repository.get_previous_search_event,
+                cast(Any, context.user_id),
+                None,
+                datetime.now(timezone.utc),
+            )
+            is_returning = previous_search is not None
+        elif context.guest_session_id:
+            # Check guest session history (with 30 minute offset)
+            previous_search = await asyncio.to_thread(
+                self.event_repository.get_previous_search_event,
+                None,
+                context.guest_session_id,
+                datetime.now(timezone.utc) - GUEST_RETURNING_AFTER,
+            )
+            is_returning = previous_search is not None
+
+        # Always create event for analytics (append-only) with enhanced data
+        event_data = _event_fields(
+            context, search_data, ip_hash, geo_data, browser_info, device_context, is_returning
+        )
+        event = await asyncio.to_thread(self.event_repository.create_event, event_data)
+
+        # Persist observability top-N candidates if provided
+        try:
+            if observability_candidates:
+                await asyncio.to_thread(
+                    self.event_repository.bulk_insert_candidates,
+                    event.id,
+                    _normalize_candidates(observability_candidates),
+                )
+        except Exception as e:
+            logger.warning(
+                "Failed to persist observability candidates for event %s: %s", event.id, e
+            )
+
+        return str(event.id)
+
+    async def _lookup_geolocation(self, request_ip: str | None) -> dict[str, Any] | None:
+        if not request_ip:
+            return None
+        try:
+            return await self.geolocation_service.get_location_from_ip(request_ip)
+        except Exception as e:
+            logger.warning("Failed to get geolocation: %s", str(e))
+            return None
+
+    def _browser_info(
+        self, user_agent: str | None, device_context: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Parse device/browser info and merge the frontend device context."""
+        if not user_agent:
+            return None
+        device_info = self.device_tracking_service.parse_user_agent(user_agent)
+        browser_info = self.device_tracking_service.format_for_analytics(device_info)
+
+        if device_context and browser_info:
+            browser_info.update(
+                {
+                    "device": {
+                        **browser_info.get("device", {}),
+                        "type": _get_attr(
+                            device_context,
+                            "device_type",
+                            browser_info.get("device", {}).get("type"),
+                        ),
+                    },
+                    "viewport": _get_attr(device_context, "viewport_size"),
+                    "screen": _get_attr(device_context, "screen_resolution"),
+                    "connection": {
+                        "type": _get_attr(device_context, "connection_type"),
+                        "effective_type": _get_attr(device_context, "connection_effective_type"),
+                    },
+                }
+            )
+        return cast(dict[str, Any] | None, browser_info)
+
+    @BaseService.measure_operation("persist_search_events")
+    async def persist_search_events(self, records: Sequence[PendingSearchEvent]) -> int:
+        """
+        Write derived data for a batch of committed search events.
+
+        Enrichment runs once per distinct IP, returning-user detection uses one
+        grouped query, enrichment is written with one bulk UPDATE and candidates
+        with one multi-row INSERT in one transaction, and the history limit is
+        enforced once per user/guest in the batch.
+
+        Args:
+            records: Events queued by ``record_search``
+
+        Returns:
+            Number of events enriched
+        """
+        geo_by_ip: dict[str, dict[str, Any] | None] = {}
+        for ip in {record.request_ip for record in records if record.request_ip}:
+            geo_by_ip[ip] = await self._lookup_geolocation(ip)
+
+        # The events themselves are already stored, so each one's own row is the
+        # earliest only when it is the user's (or guest's) first search.
+        first_by_user, first_by_guest = await asyncio.to_thread(
+            self.event_repository.get_first_search_times,
+            sorted({r.context.user_id for r in records if r.context.user_id}),
+            sorted({r.context.guest_session_id for r in records if r.context.guest_session_id}),
+        )
+
+        updates: list[dict[str, Any]] = []
+        candidates: list[dict[str, Any]] = []
+        contexts: dict[str, SearchUserContext] = {}
+        for record in records:
+            context = record.context
+            if context.user_id:
+                first = first_by_user.get(context.user_id)
+                is_returning = first is not None and first < record.searched_at
+            elif context.guest_session_id:
+                first = first_by_guest.get(context.guest_session_id)
+                is_returning = (
+                    first is not None and first < record.searched_at - GUEST_RETURNING_AFTER
+                )
+            else:
+                is_returning = False
+
+            updates.append(
+                {
+                    "id": record.event_id,
+                    "geo_data": geo_by_ip.get(record.request_ip) if record.request_ip else None,
+                    "browser_info": self._browser_info(record.user_agent, record.device_context),
+                    "is_returning_user": is_returning,
+                }
+            )
+            candidates.extend(
+                {**candidate, "search_event_id": record.event_id} for candidate in record.candidates
+            )
+            contexts.setdefault(context.identifier, context)
+
+        def _write() -> int:
+            with self.transaction():
+                self.event_repository.bulk_update_event_enrichment(updates)
+                # A retried batch may already have written its candidates.
+                written = self.event_repository.get_event_ids_with_candidates(
+                    sorted({c["search_event_id"] for c in candidates})
+                )
+                self.event_repository.bulk_insert_candidate_rows(
+                    [c for c in candidates if c["search_event_id"] not in written]
+                )
+            for context in contexts.values():
+                self._enforce_search_limit(context)
+            return len(updates)
+
+        return await asyncio.to_thread(_write)
+
     @BaseService.measure_operation("get_recent_searches")
     def get_recent_searches(
         self,
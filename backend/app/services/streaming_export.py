@@ -0,0 +1,129 @@
+# backend/app/services/streaming_export.py
+"""
+Chunked CSV / JSON-lines encoders and object-storage delivery for large exports.
+
+Encoders consume row iterators lazily and yield text chunks, so callers can hand
+them straight to ``StreamingResponse`` (or ``store_export``) without ever holding
+the full document in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import io
+import json
+import logging
+import tempfile
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+from ..core.config import settings
+from ..core.exceptions import ServiceException
+from .r2_storage_client import R2StorageClient
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_ROWS = 200
+
+
+def iter_csv_chunks(
+    header: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    *,
+    rows_per_chunk: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[str]:
+    """Yield CSV text (header first) in chunks of at most ``rows_per_chunk`` rows."""
+
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    tail = buffer.getvalue()
+    if tail:
+        yield tail
+
+
+def iter_json_lines(
+    records: Iterable[Mapping[str, Any]],
+    *,
+    rows_per_chunk: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[str]:
+    """Yield newline-delimited JSON, one record per line, batched into chunks."""
+
+    lines: list[str] = []
+    for record in records:
+        lines.append(json.dumps(record, default=str, separators=(",", ":")))
+        if len(lines) >= rows_per_chunk:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+@dataclass(frozen=True)
+class StoredExport:
+    """Location of an export written to object storage."""
+
+    object_key: str
+    download_url: str
+    expires_at: str
+    size_bytes: int
+
+
+def store_export(
+    chunks: Iterable[Union[str, bytes]],
+    *,
+    object_key: str,
+    content_type: str,
+    storage: Optional[R2StorageClient] = None,
+    url_ttl_seconds: Optional[int] = None,
+) -> StoredExport:
+    """
+    Write an export to R2 and return a presigned download URL.
+
+    Chunks are spooled to a temporary file rather than joined in memory; R2 needs
+    a Content-Length on PUT, which the spooled file provides.
+    """
+
+    client = storage if storage is not None else R2StorageClient()
+    ttl = url_ttl_seconds or settings.export_download_url_ttl_seconds
+
+    with tempfile.TemporaryFile() as spool:
+        for chunk in chunks:
+            spool.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        size_bytes = spool.tell()
+        spool.seek(0)
+        uploaded, status_code = client.upload_fileobj(object_key, spool, content_type)
+
+    if not uploaded:
+        raise ServiceException(
+            f"Failed to upload export (status={status_code})", code="export_upload_failed"
+        )
+
+    presigned = client.generate_presigned_get(object_key, expires_seconds=ttl)
+    expires_at = (datetime.now(timezone.utc) + timedelta(seconds=ttl)).replace(microsecond=0)
+    logger.info("Stored export %s (%s bytes)", object_key, size_bytes)
+    return StoredExport(
+        object_key=object_key,
+        download_url=presigned.url,
+        expires_at=expires_at.isoformat(),
+        size_bytes=size_bytes,
+    )
+
+
+__all__ = [
+    "EXPORT_CHUNK_ROWS",
+    "StoredExport",
+    "iter_csv_chunks",
+    "iter_json_lines",
+    "store_export",
+]
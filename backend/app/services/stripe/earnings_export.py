@@ -4,15 +4,18 @@ import csv
 from datetime import date
 from decimal import Decimal
 import io
+from itertools import islice
 import logging
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
 from ...constants.payment_status import map_payment_status
 from ...constants.pricing_defaults import PRICING_DEFAULTS
+from ...core.config import settings
 from ...core.exceptions import ServiceException
 from ..base import BaseService
 from ..config_service import ConfigService
 from ..pricing_helpers import _coerce_tier_bound
+from ..streaming_export import iter_csv_chunks
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -22,6 +25,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+EARNINGS_CSV_HEADER = [
+    "Date",
+    "Student",
+    "Service",
+    "Duration (min)",
+    "Lesson Price",
+    "Platform Fee",
+    "Net Earnings",
+    "Status",
+    "Payment ID",
+]
+
 
 class StripeEarningsExportMixin(BaseService):
     """Instructor earnings CSV/PDF export helpers."""
@@ -136,6 +151,46 @@ class StripeEarningsExportMixin(BaseService):
             for row in earnings_rows
         ]
 
+    def _iter_earnings_export_rows(
+        self,
+        *,
+        instructor_id: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream formatted export rows from a server-side cursor.
+
+        The instructor context is resolved eagerly so a missing profile fails before
+        any bytes are streamed.
+        """
+        context = self._load_earnings_export_context(instructor_id)
+        fallback_tier_pct = context["fallback_tier_pct"]
+        earnings_rows = self.payment_repository.iter_instructor_earnings_for_export(
+            instructor_id,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=settings.export_stream_batch_size,
+        )
+        return (
+            self._format_earnings_export_row(row=row, fallback_tier_pct=fallback_tier_pct)
+            for row in earnings_rows
+        )
+
+    def _earnings_csv_values(self, row: dict[str, Any]) -> list[Any]:
+        lesson_date = row.get("lesson_date")
+        return [
+            lesson_date.isoformat() if lesson_date else "",
+            row.get("student_name"),
+            row.get("service_name"),
+            row.get("duration_minutes"),
+            f"${row.get('lesson_price_cents', 0) / 100:.2f}",
+            f"${row.get('platform_fee_cents', 0) / 100:.2f}",
+            f"${row.get('net_earnings_cents', 0) / 100:.2f}",
+            row.get("status"),
+            row.get("payment_id"),
+        ]
+
     @BaseService.measure_operation("stripe_generate_earnings_csv")
     def generate_earnings_csv(
         self,
@@ -153,36 +208,29 @@ class StripeEarningsExportMixin(BaseService):
 
         output = io.StringIO(newline="")
         writer = csv.writer(output)
-        writer.writerow(
-            [
-                "Date",
-                "Student",
-                "Service",
-                "Duration (min)",
-                "Lesson Price",
-                "Platform Fee",
-                "Net Earnings",
-                "Status",
-                "Payment ID",
-            ]
-        )
+        writer.writerow(EARNINGS_CSV_HEADER)
         for row in rows:
-            lesson_date = row.get("lesson_date")
-            writer.writerow(
-                [
-                    lesson_date.isoformat() if lesson_date else "",
-                    row.get("student_name"),
-                    row.get("service_name"),
-                    row.get("duration_minutes"),
-                    f"${row.get('lesson_price_cents', 0) / 100:.2f}",
-                    f"${row.get('platform_fee_cents', 0) / 100:.2f}",
-                    f"${row.get('net_earnings_cents', 0) / 100:.2f}",
-                    row.get("status"),
-                    row.get("payment_id"),
-                ]
-            )
+            writer.writerow(self._earnings_csv_values(row))
         return output.getvalue()
 
+    @BaseService.measure_operation("stripe_stream_earnings_csv")
+    def stream_earnings_csv(
+        self,
+        *,
+        instructor_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[str]:
+        """Stream the earnings CSV in chunks without materializing the full history."""
+        rows = self._iter_earnings_export_rows(
+            instructor_id=instructor_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return iter_csv_chunks(
+            EARNINGS_CSV_HEADER, (self._earnings_csv_values(row) for row in rows)
+        )
+
     def _earnings_pdf_columns(self) -> list[dict[str, Any]]:
         return [
             {"label": "Date", "width": 10, "align": "left"},
@@ -227,29 +275,31 @@ class StripeEarningsExportMixin(BaseService):
     def _build_earnings_pdf_body_lines(
         self, rows: list[dict[str, Any]], columns: list[dict[str, Any]]
     ) -> list[str]:
-        if not rows:
-            return ["No earnings found for the selected range."]
+        return list(self._iter_earnings_pdf_body_lines(rows, columns))
 
-        body_lines: list[str] = []
+    def _iter_earnings_pdf_body_lines(
+        self, rows: Iterable[dict[str, Any]], columns: list[dict[str, Any]]
+    ) -> Iterator[str]:
+        empty = True
         for row in rows:
+            empty = False
             lesson_date = row.get("lesson_date")
-            body_lines.append(
-                self._format_pdf_row(
-                    [
-                        lesson_date.isoformat() if lesson_date else "",
-                        str(row.get("student_name") or ""),
-                        str(row.get("service_name") or ""),
-                        str(row.get("duration_minutes") or 0),
-                        f"${row.get('lesson_price_cents', 0) / 100:.2f}",
-                        f"${row.get('platform_fee_cents', 0) / 100:.2f}",
-                        f"${row.get('net_earnings_cents', 0) / 100:.2f}",
-                        str(row.get("status") or ""),
-                        str(row.get("payment_id") or ""),
-                    ],
-                    columns,
-                )
+            yield self._format_pdf_row(
+                [
+                    lesson_date.isoformat() if lesson_date else "",
+                    str(row.get("student_name") or ""),
+                    str(row.get("service_name") or ""),
+                    str(row.get("duration_minutes") or 0),
+                    f"${row.get('lesson_price_cents', 0) / 100:.2f}",
+                    f"${row.get('platform_fee_cents', 0) / 100:.2f}",
+                    f"${row.get('net_earnings_cents', 0) / 100:.2f}",
+                    str(row.get("status") or ""),
+                    str(row.get("payment_id") or ""),
+                ],
+                columns,
             )
-        return body_lines
+        if empty:
+            yield "No earnings found for the selected range."
 
     def _escape_pdf_text(self, value: str) -> str:
         sanitized = value.encode("ascii", "replace").decode("ascii")
@@ -262,6 +312,17 @@ class StripeEarningsExportMixin(BaseService):
         )
 
     def _render_pdf_document(self, *, header: list[str], data_lines: list[str]) -> bytes:
+        return b"".join(self._iter_pdf_document(header=header, data_lines=data_lines))
+
+    def _iter_pdf_document(
+        self, *, header: list[str], data_lines: Iterable[str]
+    ) -> Iterator[bytes]:
+        """
+        Emit a PDF page by page as ``data_lines`` arrive.
+
+        Page objects are written first and the catalog/page tree last, so only the
+        per-object byte offsets (for the xref table) are kept in memory.
+        """
         page_width = 612
         page_height = 792
         left_margin = 40
@@ -271,30 +332,37 @@ class StripeEarningsExportMixin(BaseService):
         usable_height = top_margin - 72
         lines_per_page = max(1, int(usable_height / line_height))
         data_per_page = max(1, lines_per_page - len(header))
-        if not data_lines:
-            pages = [header + [""]]
-        else:
-            pages = [
-                header + data_lines[idx : idx + data_per_page]
-                for idx in range(0, len(data_lines), data_per_page)
-            ]
-
-        page_obj_nums = [4 + index * 2 for index in range(len(pages))]
-        content_obj_nums = [5 + index * 2 for index in range(len(pages))]
-        kids = " ".join(f"{num} 0 R" for num in page_obj_nums)
-        objects: list[bytes] = [
-            b"<< /Type /Catalog /Pages 2 0 R >>",
-            f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode("ascii"),
-            b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>",
-        ]
 
-        for page_index, page_lines in enumerate(pages):
-            content_obj_num = content_obj_nums[page_index]
-            page_obj = (
-                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width} {page_height}] "
-                f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_obj_num} 0 R >>"
-            ).encode("ascii")
-            objects.append(page_obj)
+        offsets: dict[int, int] = {}
+        position = 0
+
+        def emit(obj_num: int, body: bytes) -> bytes:
+            nonlocal position
+            offsets[obj_num] = position
+            chunk = f"{obj_num} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+            position += len(chunk)
+            return chunk
+
+        preamble = b"%PDF-1.4\n"
+        position = len(preamble)
+        yield preamble
+
+        lines = iter(data_lines)
+        page_count = 0
+        while True:
+            page_data = list(islice(lines, data_per_page))
+            if not page_data and page_count:
+                break
+            page_lines = header + (page_data or [""])
+            page_obj_num = 4 + page_count * 2
+            content_obj_num = page_obj_num + 1
+            yield emit(
+                page_obj_num,
+                (
+                    f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width} {page_height}] "
+                    f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_obj_num} 0 R >>"
+                ).encode("ascii"),
+            )
             content_lines = ["BT", f"/F1 {font_size} Tf", f"{left_margin} {top_margin} Td"]
             for line_index, line in enumerate(page_lines):
                 if line_index > 0:
@@ -302,31 +370,27 @@ class StripeEarningsExportMixin(BaseService):
                 content_lines.append(f"({self._escape_pdf_text(line)}) Tj")
             content_lines.append("ET")
             content_stream = "\n".join(content_lines).encode("ascii")
-            objects.append(
+            yield emit(
+                content_obj_num,
                 f"<< /Length {len(content_stream)} >>\nstream\n".encode("ascii")
                 + content_stream
-                + b"\nendstream"
+                + b"\nendstream",
             )
+            page_count += 1
+
+        kids = " ".join(f"{4 + index * 2} 0 R" for index in range(page_count))
+        yield emit(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        yield emit(2, f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode("ascii"))
+        yield emit(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>")
 
-        buffer = io.BytesIO()
-        buffer.write(b"%PDF-1.4\n")
-        offsets = [0]
-        for index, obj in enumerate(objects, start=1):
-            offsets.append(buffer.tell())
-            buffer.write(f"{index} 0 obj\n".encode("ascii"))
-            buffer.write(obj)
-            buffer.write(b"\nendobj\n")
-        xref_offset = buffer.tell()
-        buffer.write(f"xref\n0 {len(objects) + 1}\n".encode("ascii"))
-        buffer.write(b"0000000000 65535 f \n")
-        for offset in offsets[1:]:
-            buffer.write(f"{offset:010d} 00000 n \n".encode("ascii"))
-        buffer.write(b"trailer\n")
-        buffer.write(f"<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode("ascii"))
-        buffer.write(b"startxref\n")
-        buffer.write(f"{xref_offset}\n".encode("ascii"))
-        buffer.write(b"%%EOF")
-        return buffer.getvalue()
+        object_count = 3 + page_count * 2
+        trailer = [f"xref\n0 {object_count + 1}\n", "0000000000 65535 f \n"]
+        trailer.extend(f"{offsets[num]:010d} 00000 n \n" for num in range(1, object_count + 1))
+        trailer.append("trailer\n")
+        trailer.append(f"<< /Size {object_count + 1} /Root 1 0 R >>\n")
+        trailer.append("startxref\n")
+        trailer.append(f"{position}\n")
+        yield "".join(trailer).encode("ascii") + b"%%EOF"
 
     @BaseService.measure_operation("stripe_generate_earnings_pdf")
     def generate_earnings_pdf(
@@ -350,3 +414,28 @@ class StripeEarningsExportMixin(BaseService):
         )
         body_lines = self._build_earnings_pdf_body_lines(rows, columns)
         return self._render_pdf_document(header=header_lines, data_lines=body_lines)
+
+    @BaseService.measure_operation("stripe_stream_earnings_pdf")
+    def stream_earnings_pdf(
+        self,
+        *,
+        instructor_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[bytes]:
+        """Stream the earnings PDF page by page from a server-side cursor."""
+        rows = self._iter_earnings_export_rows(
+            instructor_id=instructor_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        columns = self._earnings_pdf_columns()
+        header_lines = self._build_earnings_pdf_header_lines(
+            columns=columns,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return self._iter_pdf_document(
+            header=header_lines,
+            data_lines=self._iter_earnings_pdf_body_lines(rows, columns),
+        )
@@ -24,7 +24,7 @@ from __future__ import annotations
 from datetime import timedelta
 import logging
 import time as _time
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, Optional, Protocol
 import uuid
 
 from sqlalchemy.orm import Session
@@ -80,6 +80,8 @@ if TYPE_CHECKING:  # pragma: no cover
     class StripeEarningsExportMixin(BaseService):
         generate_earnings_pdf: Callable[..., bytes]
         generate_earnings_csv: Callable[..., bytes]
+        stream_earnings_pdf: Callable[..., Iterator[bytes]]
+        stream_earnings_csv: Callable[..., Iterator[str]]
 
     class StripeCaptureRefundMixin(BaseService):
         capture_payment_intent: Callable[..., dict[str, Any]]
@@ -59,6 +59,11 @@ class TimezoneService:
 
         return local_dt.astimezone(timezone.utc)
 
+    @staticmethod
+    def utc_day_start(day: date) -> datetime:
+        """Return midnight UTC at the start of ``day`` (for UTC-bucketed aggregates)."""
+        return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
     @staticmethod
     def utc_to_local(utc_dt: datetime, timezone_str: str) -> datetime:
         """Convert UTC datetime to local timezone."""
@@ -34,6 +34,7 @@ from ..repositories.factory import RepositoryFactory
 from ..utils.bitset import new_empty_bits, new_empty_tags, windows_from_bits
 from .audit_redaction import redact
 from .base import BaseService
+from .next_availability_refresh import mark_next_availability_stale
 
 if TYPE_CHECKING:
     from ..repositories.audit_repository import AuditRepository
@@ -177,6 +178,7 @@ class WeekOperationService(BaseService):
             with self.transaction():
                 repo = self.availability_service.bitmap_repo()
                 repo.upsert_week(instructor_id, items)
+                mark_next_availability_stale(self.db, instructor_id)
 
                 before_payload = self._build_copy_audit_payload(
                     instructor_id,
@@ -12,6 +12,7 @@ from typing import List
 # These imports trigger the @celery_app.task decorators to register tasks
 from app.tasks import (
     analytics,  # noqa: F401
+    availability_index,  # noqa: F401
     db_maintenance,  # noqa: F401
     monitoring_tasks,  # noqa: F401
     notification_tasks,  # noqa: F401
@@ -30,6 +31,7 @@ ALL_TASKS = [
     "app.tasks.analytics.calculate_analytics",
     "app.tasks.analytics.generate_daily_report",
     "app.tasks.analytics.update_service_metrics",
+    "app.tasks.analytics.refresh_platform_rollups",
     "app.tasks.task_executions.purge_old",
     # Monitoring tasks
     "app.tasks.monitoring_tasks.process_monitoring_alert",
@@ -47,6 +49,10 @@ ALL_TASKS = [
     "db_maintenance.analyze_high_churn_tables",
     "db_maintenance.cleanup_stale_2fa_setups",
     "db_maintenance.cleanup_expired_trusted_devices",
+    "db_maintenance.reconcile_unread_counters",
+    # Next-available slot index
+    "availability.refresh_next_available",
+    "availability.refresh_stale_next_available",
     # Notification outbox
     "outbox.dispatch_pending",
     "outbox.deliver_event",
@@ -261,3 +261,35 @@ def update_service_metrics(self: BaseTask, service_id: str) -> Dict[str, Any]:
     except Exception as exc:
         logger.error("Failed to update service %s metrics: %s", service_id, exc)
         raise
+
+
+@typed_task(
+    base=BaseTask,
+    name="app.tasks.analytics.refresh_platform_rollups",
+    bind=True,
+    max_retries=2,
+)
+def refresh_platform_rollups(self: BaseTask) -> Dict[str, Any]:
+    """
+    Fold bookings, search and payment activity changed since the last run into
+    the daily rollups read by the admin platform analytics dashboards.
+
+    Returns:
+        dict: Number of rebuilt days and refreshed availability days
+    """
+    from app.services.analytics_rollup_service import AnalyticsRollupService
+
+    try:
+        with get_db_session() as db:
+            summary = AnalyticsRollupService(db).refresh()
+    except Exception as exc:
+        logger.error("Failed to refresh platform analytics rollups: %s", exc, exc_info=True)
+        raise self.retry(exc=exc, countdown=120)
+
+    if summary["days"] or summary["availability_days"]:
+        logger.info(
+            "Refreshed platform analytics rollups: %d days, %d availability days",
+            summary["days"],
+            summary["availability_days"],
+        )
+    return {"status": "success", **summary}
@@ -0,0 +1,54 @@
+# backend/app/tasks/availability_index.py
+"""
+Celery tasks maintaining the next-available slot index.
+
+Availability, blackout and booking writes mark index rows stale and enqueue a
+per-instructor refresh after commit; the periodic sweep recomputes whatever is
+still stale, expired or missing. Both run off the request path.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, TypeVar, cast
+
+from celery import shared_task
+
+from app.database import get_db_session
+from app.services.next_availability_service import REFRESH_BATCH_SIZE, NextAvailabilityService
+
+logger = logging.getLogger(__name__)
+
+_TaskFunc = TypeVar("_TaskFunc", bound=Callable[..., Any])
+
+
+def _typed_shared_task(*args: Any, **kwargs: Any) -> Callable[[_TaskFunc], _TaskFunc]:
+    """Typed wrapper for Celery's shared_task decorator."""
+    return cast(Callable[[_TaskFunc], _TaskFunc], shared_task(*args, **kwargs))
+
+
+@_typed_shared_task(name="availability.refresh_next_available", ignore_result=True)
+def refresh_next_available(instructor_id: str) -> None:
+    """Recompute the index rows for a single instructor."""
+    with get_db_session() as db:
+        try:
+            NextAvailabilityService(db).refresh_instructor(instructor_id)
+        except Exception:
+            logger.warning(
+                "[NEXT-AVAIL] Refresh failed for instructor %s", instructor_id, exc_info=True
+            )
+
+
+@_typed_shared_task(name="availability.refresh_stale_next_available")
+def refresh_stale_next_available(limit: int = REFRESH_BATCH_SIZE) -> Dict[str, int]:
+    """Recompute stale, expired and missing index rows in one bounded sweep."""
+    with get_db_session() as db:
+        summary = NextAvailabilityService(db).refresh_stale(limit=limit)
+    if summary["candidates"]:
+        logger.info(
+            "[NEXT-AVAIL] Refreshed %d/%d instructors (%d failed)",
+            summary["refreshed"],
+            summary["candidates"],
+            summary["failed"],
+        )
+    return summary
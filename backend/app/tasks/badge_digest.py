@@ -3,19 +3,63 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence
 
+from ..models.badge import BadgeDefinition
 from ..models.user import User
 from ..notifications.policy import can_send_now, record_send
-from ..repositories.badge_repository import BadgeRepository
+from ..repositories.badge_repository import (
+    BadgeRepository,
+    StudentBadgeAwardRow,
+    StudentBadgeProgressRow,
+)
+from ..services.badge_facts import chunked
 from ..services.cache_service import CacheService, CacheServiceSyncAdapter
 from ..services.notification_service import NotificationService
 
 
+class _BadgeStateReader(Protocol):
+    def list_active_badge_definitions(self) -> List[BadgeDefinition]:
+        ...
+
+    def list_student_badge_awards(self, student_id: str) -> List[StudentBadgeAwardRow]:
+        ...
+
+    def list_student_badge_progress(self, student_id: str) -> List[StudentBadgeProgressRow]:
+        ...
+
+
+class _PrefetchedBadgeState:
+    """Serves the per-user digest reads from rows loaded once for a batch of users."""
+
+    def __init__(
+        self,
+        repository: BadgeRepository,
+        definitions: List[BadgeDefinition],
+        user_ids: Sequence[str],
+    ):
+        self._definitions = definitions
+        self._awards: Dict[
+            str, List[StudentBadgeAwardRow]
+        ] = repository.list_badge_awards_for_students(user_ids)
+        self._progress: Dict[
+            str, List[StudentBadgeProgressRow]
+        ] = repository.list_badge_progress_for_students(user_ids)
+
+    def list_active_badge_definitions(self) -> List[BadgeDefinition]:
+        return self._definitions
+
+    def list_student_badge_awards(self, student_id: str) -> List[StudentBadgeAwardRow]:
+        return self._awards.get(student_id, [])
+
+    def list_student_badge_progress(self, student_id: str) -> List[StudentBadgeProgressRow]:
+        return self._progress.get(student_id, [])
+
+
 def build_weekly_badge_progress_digest(
     user_id: str,
     now_utc: datetime,
-    repository: BadgeRepository,
+    repository: _BadgeStateReader,
 ) -> Dict[str, Any]:
     definitions = repository.list_active_badge_definitions()
     awards = repository.list_student_badge_awards(user_id)
@@ -73,19 +117,23 @@ def send_weekly_digest(
     if isinstance(cache_service, CacheService):
         cache_service = CacheServiceSyncAdapter(cache_service)
     summary = {"scanned": 0, "sent": 0}
-    for user in users:
-        summary["scanned"] += 1
-        digest = build_weekly_badge_progress_digest(user.id, now_utc, repository)
-        if not digest["items"]:
-            continue
-        allowed, reason, key = can_send_now(user, now_utc, cache_service)
-        if not allowed:
-            continue
-        if notification_service and notification_service.send_badge_digest_email(
-            user, digest["items"]
-        ):
-            record_send(key, cache_service)
-            summary["sent"] += 1
+    # Definitions once per run; awards and progress once per chunk of users.
+    definitions = repository.list_active_badge_definitions()
+    for chunk in chunked(users):
+        state = _PrefetchedBadgeState(repository, definitions, [user.id for user in chunk])
+        for user in chunk:
+            summary["scanned"] += 1
+            digest = build_weekly_badge_progress_digest(user.id, now_utc, state)
+            if not digest["items"]:
+                continue
+            allowed, reason, key = can_send_now(user, now_utc, cache_service)
+            if not allowed:
+                continue
+            if notification_service and notification_service.send_badge_digest_email(
+                user, digest["items"]
+            ):
+                record_send(key, cache_service)
+                summary["sent"] += 1
     return summary
 
 
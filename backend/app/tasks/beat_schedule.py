@@ -47,6 +47,15 @@ CELERYBEAT_SCHEDULE = {
         },
         # Note: Calculate service analytics every 3 hours
     },
+    # Fold recent bookings/search/payment activity into the admin analytics rollups
+    "refresh-platform-analytics-rollups": {
+        "task": "app.tasks.analytics.refresh_platform_rollups",
+        "schedule": crontab(minute="*/15"),  # Every 15 minutes
+        "options": {
+            "queue": "analytics",
+            "priority": 4,
+        },
+    },
     # Generate daily report - runs after analytics calculation
     "generate-daily-analytics-report": {
         "task": "app.tasks.analytics.generate_daily_report",
@@ -139,6 +148,24 @@ CELERYBEAT_SCHEDULE = {
             "priority": 1,
         },
     },
+    # Rebuild conversation unread counters/watermarks that drifted from notifications
+    "reconcile-unread-counters": {
+        "task": "db_maintenance.reconcile_unread_counters",
+        "schedule": crontab(hour=4, minute=30),  # Daily at 4:30 AM UTC
+        "options": {
+            "queue": "celery",
+            "priority": 1,
+        },
+    },
+    # Recompute stale/expired rows of the next-available slot index used by search
+    "refresh-next-available-index": {
+        "task": "availability.refresh_stale_next_available",
+        "schedule": timedelta(minutes=5),
+        "options": {
+            "queue": "celery",
+            "priority": 4,
+        },
+    },
     # Self-learning: promote unresolved location queries into trusted aliases
     "learn-location-aliases": {
         "task": "app.tasks.location_learning.process_location_learning",
@@ -0,0 +1,321 @@
+# backend/app/tasks/booking_reminders.py
+"""
+Batched booking reminder pipeline behind ``send_booking_reminders``.
+
+Due bookings are claimed per reminder window in chunks (``FOR UPDATE SKIP LOCKED``
+on Postgres) with their ``reminder_*_sent`` flag set in the claiming transaction,
+so overlapping runs never claim the same booking. Claimed chunks are snapshotted
+into ``ReminderJob`` tuples and sent through a bounded thread pool.
+
+Instructor and student notifications are tracked separately. Once a window is
+drained, recipients that failed are retried in the same run (the next run's
+window no longer covers the booking). A claim is released only when neither
+recipient could be notified; re-sending a half-delivered reminder would
+duplicate it for the recipient who already has it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+import threading
+from time import monotonic, sleep
+from typing import Any, Literal, NamedTuple, cast
+
+from celery.utils.log import get_task_logger
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal, get_db_session
+from app.models.booking import Booking
+from app.monitoring.prometheus_metrics import PrometheusMetrics
+from app.repositories.booking.reminder_mixin import ReminderKind
+from app.repositories.booking_repository import BookingRepository
+from app.services.notification_service import NotificationService
+from app.services.notification_templates import (
+    INSTRUCTOR_REMINDER_1H,
+    INSTRUCTOR_REMINDER_24H,
+    STUDENT_REMINDER_1H,
+    STUDENT_REMINDER_24H,
+    NotificationTemplate,
+)
+from app.services.sms_templates import REMINDER_1H, REMINDER_24H, SMSTemplate
+
+logger = get_task_logger(__name__)
+
+REMINDER_WINDOW = timedelta(minutes=15)
+# Send attempts per recipient within one run, and the pause before each retry round.
+REMINDER_SEND_ATTEMPTS = 3
+REMINDER_RETRY_DELAY_SECONDS = 2.0
+
+Recipient = Literal["instructor", "student"]
+RECIPIENTS: tuple[Recipient, ...] = ("instructor", "student")
+
+
+def format_display_name(user: Any) -> str:
+    first = (getattr(user, "first_name", "") or "").strip() if user else ""
+    last = (getattr(user, "last_name", "") or "").strip() if user else ""
+    if first and last:
+        return f"{first} {last[0]}."
+    return first or "Someone"
+
+
+def format_booking_date(booking: Booking) -> str:
+    booking_date = getattr(booking, "booking_date", None)
+    if isinstance(booking_date, date):
+        return booking_date.strftime("%B %d").replace(" 0", " ")
+    return str(booking_date or "")
+
+
+def format_booking_time(booking: Booking) -> str:
+    start_time = getattr(booking, "start_time", None)
+    if isinstance(start_time, time):
+        return start_time.strftime("%I:%M %p").lstrip("0")
+    if start_time:
+        return str(start_time)
+    return ""
+
+
+def resolve_service_name(booking: Booking) -> str:
+    name = getattr(booking, "service_name", None)
+    if isinstance(name, str) and name.strip():
+        return name.strip()
+    service = getattr(booking, "instructor_service", None)
+    service_name = getattr(service, "name", None)
+    if isinstance(service_name, str) and service_name.strip():
+        return service_name.strip()
+    return "Lesson"
+
+
+class _ReminderPlan(NamedTuple):
+    kind: ReminderKind
+    lead: timedelta
+    instructor_template: NotificationTemplate
+    student_template: NotificationTemplate
+    sms_template: SMSTemplate
+
+
+_REMINDER_PLANS = (
+    _ReminderPlan(
+        "24h", timedelta(hours=24), INSTRUCTOR_REMINDER_24H, STUDENT_REMINDER_24H, REMINDER_24H
+    ),
+    _ReminderPlan(
+        "1h", timedelta(hours=1), INSTRUCTOR_REMINDER_1H, STUDENT_REMINDER_1H, REMINDER_1H
+    ),
+)
+
+
+class ReminderJob(NamedTuple):
+    """Detached snapshot of a claimed booking with its template context already formatted."""
+
+    booking_id: str
+    instructor_id: str
+    student_id: str
+    student_name: str
+    instructor_name: str
+    service_name: str
+    date: str
+    time: str
+
+
+def _reminder_job(booking: Booking) -> ReminderJob:
+    return ReminderJob(
+        booking_id=cast(str, booking.id),
+        instructor_id=cast(str, booking.instructor_id),
+        student_id=cast(str, booking.student_id),
+        student_name=format_display_name(getattr(booking, "student", None)),
+        instructor_name=format_display_name(getattr(booking, "instructor", None)),
+        service_name=resolve_service_name(booking),
+        date=format_booking_date(booking),
+        time=format_booking_time(booking),
+    )
+
+
+class _SendResult(NamedTuple):
+    job: ReminderJob
+    attempted: tuple[Recipient, ...]
+    errors: dict[Recipient, Exception]
+
+
+class _ReminderSender:
+    """
+    Send reminders from pool threads.
+
+    ``NotificationService`` and its session are not thread-safe, so each worker
+    thread lazily opens its own session, service and event loop and keeps them
+    for the lifetime of the pool. ``close`` releases everything that was opened.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: list[tuple[Session, asyncio.AbstractEventLoop]] = []
+
+    def _resources(self) -> tuple[Session, NotificationService, asyncio.AbstractEventLoop]:
+        resources = getattr(self._local, "resources", None)
+        if resources is None:
+            session = SessionLocal()
+            loop = asyncio.new_event_loop()
+            resources = (session, NotificationService(session), loop)
+            self._local.resources = resources
+            with self._lock:
+                self._opened.append((session, loop))
+        return cast(tuple[Session, NotificationService, asyncio.AbstractEventLoop], resources)
+
+    def send(
+        self, plan: _ReminderPlan, job: ReminderJob, recipients: tuple[Recipient, ...]
+    ) -> _SendResult:
+        """Notify each recipient independently; one failing does not skip the other."""
+        session, service, loop = self._resources()
+        errors: dict[Recipient, Exception] = {}
+        for recipient in recipients:
+            try:
+                loop.run_until_complete(service.notify_user(**_notify_kwargs(plan, job, recipient)))
+            except Exception as exc:
+                PrometheusMetrics.record_booking_reminder(plan.kind, recipient, "failed")
+                session.rollback()
+                errors[recipient] = exc
+            else:
+                PrometheusMetrics.record_booking_reminder(plan.kind, recipient, "sent")
+        return _SendResult(job, recipients, errors)
+
+    def close(self) -> None:
+        with self._lock:
+            opened, self._opened = self._opened, []
+        for session, loop in opened:
+            try:
+                loop.close()
+            finally:
+                session.close()
+
+
+def _notify_kwargs(plan: _ReminderPlan, job: ReminderJob, recipient: Recipient) -> dict[str, Any]:
+    common: dict[str, Any] = {
+        "service_name": job.service_name,
+        "date": job.date,
+        "time": job.time,
+        "booking_id": job.booking_id,
+        "send_email": False,
+        "send_sms": True,
+        "sms_template": plan.sms_template,
+    }
+    if recipient == "instructor":
+        return {
+            **common,
+            "user_id": job.instructor_id,
+            "template": plan.instructor_template,
+            "student_name": job.student_name,
+            "other_party_name": job.student_name,
+        }
+    return {
+        **common,
+        "user_id": job.student_id,
+        "template": plan.student_template,
+        "instructor_name": job.instructor_name,
+        "other_party_name": job.instructor_name,
+    }
+
+
+# Booking id -> (job, errors of the recipients still to notify).
+_Failures = dict[str, tuple[ReminderJob, dict[Recipient, Exception]]]
+
+
+def _send_round(
+    plan: _ReminderPlan,
+    executor: ThreadPoolExecutor,
+    sender: _ReminderSender,
+    batch: list[tuple[ReminderJob, tuple[Recipient, ...]]],
+    failures: _Failures,
+) -> int:
+    """Send one batch concurrently, record what failed and return notifications sent."""
+    started = monotonic()
+    sent = 0
+    for result in executor.map(lambda item: sender.send(plan, *item), batch):
+        sent += len(result.attempted) - len(result.errors)
+        if result.errors:
+            failures[result.job.booking_id] = (result.job, result.errors)
+    PrometheusMetrics.observe_booking_reminder_batch(
+        plan.kind, len(batch), sent, monotonic() - started
+    )
+    return sent
+
+
+def _send_plan(
+    plan: _ReminderPlan,
+    now: datetime,
+    executor: ThreadPoolExecutor,
+    sender: _ReminderSender,
+) -> int:
+    """Drain one reminder window, retry failed recipients and return notifications sent."""
+    batch_size = settings.booking_reminder_batch_size
+    window_end = now + plan.lead
+    failures: _Failures = {}
+    sent = 0
+    while True:
+        with get_db_session() as session:
+            jobs = [
+                _reminder_job(booking)
+                for booking in BookingRepository(session).claim_due_reminders(
+                    plan.kind, window_end - REMINDER_WINDOW, window_end, batch_size
+                )
+            ]
+        if not jobs:
+            break
+        sent += _send_round(plan, executor, sender, [(job, RECIPIENTS) for job in jobs], failures)
+        if len(jobs) < batch_size:
+            break
+
+    for _attempt in range(1, REMINDER_SEND_ATTEMPTS):
+        if not failures:
+            break
+        sleep(REMINDER_RETRY_DELAY_SECONDS)
+        retry = [(job, tuple(errors)) for job, errors in failures.values()]
+        failures = {}
+        sent += _send_round(plan, executor, sender, retry, failures)
+
+    unsent: list[str] = []
+    for booking_id, (_job, errors) in failures.items():
+        for recipient, error in errors.items():
+            logger.error(
+                "Failed to send %s reminder for booking %s to %s: %s",
+                plan.kind,
+                booking_id,
+                recipient,
+                error,
+            )
+        # Failed recipients only shrink across rounds, so all of them failing means nobody got it.
+        if len(errors) == len(RECIPIENTS):
+            unsent.append(booking_id)
+    if unsent:
+        with get_db_session() as session:
+            BookingRepository(session).release_reminder_claims(plan.kind, unsent)
+    return sent
+
+
+def send_reminder_batches(now: datetime) -> dict[str, int]:
+    """Claim and send every due reminder window; returns notifications sent per kind."""
+    counts = {"reminders_24h_sent": 0, "reminders_1h_sent": 0}
+    sender = _ReminderSender()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=settings.booking_reminder_concurrency,
+            thread_name_prefix="booking-reminder",
+        ) as executor:
+            for plan in _REMINDER_PLANS:
+                counts[f"reminders_{plan.kind}_sent"] = _send_plan(plan, now, executor, sender)
+    finally:
+        sender.close()
+    return counts
+
+
+__all__ = [
+    "REMINDER_SEND_ATTEMPTS",
+    "REMINDER_WINDOW",
+    "ReminderJob",
+    "format_booking_date",
+    "format_booking_time",
+    "format_display_name",
+    "resolve_service_name",
+    "send_reminder_batches",
+]
@@ -248,8 +248,12 @@ def create_celery_app() -> Celery:
             "app.tasks.embedding_migration",
             # Periodic DB maintenance (ANALYZE on high-churn tables)
             "app.tasks.db_maintenance",
+            # Next-available slot index refresh
+            "app.tasks.availability_index",
             # Video session monitoring and no-show detection
             "app.tasks.video_tasks",
+            # Profile picture variants generated off the request path
+            "app.tasks.image_tasks",
         }
     )
 
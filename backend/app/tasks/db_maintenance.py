@@ -4,7 +4,8 @@ Periodic database maintenance tasks.
 
 Keeps query-planner statistics fresh on high-churn tables so the
 optimizer chooses the right indexes (especially partial indexes).
-Also handles stale data cleanup (e.g. abandoned 2FA setup secrets).
+Also handles stale data cleanup (e.g. abandoned 2FA setup secrets) and
+reconciles the materialized conversation unread counters.
 """
 
 from datetime import datetime, timedelta, timezone
@@ -15,6 +16,7 @@ from celery import shared_task
 from sqlalchemy import text
 
 from app.database import get_db_session
+from app.services.message_service import MessageService
 from app.services.trusted_device_service import TrustedDeviceService
 
 logger = logging.getLogger(__name__)
@@ -78,3 +80,15 @@ def cleanup_expired_trusted_devices() -> None:
                 logger.info("[DB-MAINT] Deleted %d expired trusted devices", deleted)
         except Exception:
             logger.warning("[DB-MAINT] cleanup_expired_trusted_devices failed", exc_info=True)
+
+
+@_typed_shared_task(name="db_maintenance.reconcile_unread_counters", ignore_result=True)
+def reconcile_unread_counters() -> None:
+    """Correct drifted conversation unread counters and read watermarks."""
+    with get_db_session() as db:
+        try:
+            corrected = MessageService(db).reconcile_unread_counters()
+            if corrected:
+                logger.info("[DB-MAINT] Reconciled %d unread counters", corrected)
+        except Exception:
+            logger.warning("[DB-MAINT] reconcile_unread_counters failed", exc_info=True)
@@ -0,0 +1,73 @@
+# backend/app/tasks/image_tasks.py
+"""
+Celery tasks for image processing kept off the request path.
+
+Variant generation is CPU-bound Pillow work; running it in prefork workers keeps
+it out of the API's thread pool and away from the GIL of request workers.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, ParamSpec, Protocol, TypeVar, cast
+
+from app.database import get_db_session
+from app.repositories.user_repository import UserRepository
+from app.services.personal_asset_service import PersonalAssetService
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R", covariant=True)
+
+
+class TaskWrapper(Protocol[P, R]):
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        ...
+
+    def delay(self, *args: P.args, **kwargs: P.kwargs) -> Any:
+        ...
+
+    def apply_async(self, *args: Any, **kwargs: Any) -> Any:
+        ...
+
+
+def typed_task(
+    *task_args: Any, **task_kwargs: Any
+) -> Callable[[Callable[P, R]], TaskWrapper[P, R]]:
+    """Return a typed Celery task decorator for mypy."""
+    return cast(
+        Callable[[Callable[P, R]], TaskWrapper[P, R]],
+        celery_app.task(*task_args, **task_kwargs),
+    )
+
+
+@typed_task(
+    bind=True,
+    name="app.tasks.image_tasks.process_profile_picture",
+    max_retries=3,
+    acks_late=True,
+)
+def process_profile_picture(self: Any, user_id: str, temp_object_key: str) -> Dict[str, str]:
+    """
+    Validate, resize and store a profile picture uploaded via presigned PUT.
+
+    Invalid images are dropped without retry; storage or database failures are
+    retried with backoff.
+    """
+    try:
+        with get_db_session() as db:
+            user = UserRepository(db).get_by_id(user_id)
+            if user is None:
+                logger.warning("Profile picture for unknown user %s dropped", user_id)
+                return {"status": "skipped", "reason": "user_not_found"}
+            PersonalAssetService(db).finalize_profile_picture(user, temp_object_key)
+    except ValueError as exc:
+        logger.warning("Rejected profile picture %s for user %s: %s", temp_object_key, user_id, exc)
+        return {"status": "rejected", "reason": str(exc)}
+    except Exception as exc:
+        logger.error("Profile picture processing failed for user %s: %s", user_id, exc)
+        raise self.retry(exc=exc, countdown=30 * (2**self.request.retries))
+
+    return {"status": "processed", "user_id": user_id}
@@ -2,7 +2,14 @@
 """
 Celery tasks for dispatching notification outbox events.
 
-Implements a two-step workflow:
+Batch mode (``settings.outbox_batch_delivery_enabled``, default):
+`outbox.dispatch_pending` claims due rows with ``FOR UPDATE SKIP LOCKED`` plus a
+short lease, delivers each batch concurrently through ``NotificationProvider`` on a
+bounded thread pool and records outcomes with bulk UPDATEs. Failed events are
+rescheduled on the row itself (``next_attempt_at`` backoff) instead of via Celery
+retries.
+
+Legacy two-step workflow:
 1. `outbox.dispatch_pending` periodically enqueues delivery tasks.
 2. `outbox.deliver_event` performs delivery with retries and backoff.
 """
@@ -10,8 +17,9 @@ Implements a two-step workflow:
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from datetime import date, datetime, time, timedelta, timezone
+from datetime import datetime, timedelta, timezone
 from time import monotonic
 from typing import Any, Iterator, Optional, cast
 
@@ -19,11 +27,16 @@ from celery.app.task import Task  # noqa: F401 - used for type hints
 from celery.utils.log import get_task_logger
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.config import settings
 from app.database import SessionLocal
 from app.models.booking import Booking, BookingStatus
 from app.monitoring.prometheus_metrics import PrometheusMetrics
 from app.monitoring.sentry_crons import monitor_if_configured
-from app.repositories.event_outbox_repository import EventOutboxRepository
+from app.repositories.event_outbox_repository import (
+    ClaimedEvent,
+    DeliveryFailure,
+    EventOutboxRepository,
+)
 from app.services.notification_provider import (
     NotificationProvider,
     NotificationProviderTemporaryError,
@@ -37,6 +50,13 @@ from app.services.notification_templates import (
     NotificationTemplate,
 )
 from app.services.sms_templates import REMINDER_1H, REMINDER_24H, SMSTemplate
+from app.tasks.booking_reminders import (
+    format_booking_date,
+    format_booking_time,
+    format_display_name,
+    resolve_service_name,
+    send_reminder_batches,
+)
 from app.tasks.celery_app import typed_task
 from app.tasks.enqueue import enqueue_task
 
@@ -71,8 +91,11 @@ def dispatch_pending() -> int:
     """
     Fetch pending outbox events and enqueue delivery tasks.
 
-    Returns the number of events scheduled.
+    Returns the number of events scheduled (or, in batch mode, processed).
     """
+    if settings.outbox_batch_delivery_enabled:
+        return deliver_pending_batches()
+
     with _session_scope() as session:
         repo = EventOutboxRepository(session)
         pending = repo.fetch_pending(limit=200)
@@ -88,6 +111,128 @@ def dispatch_pending() -> int:
         return scheduled
 
 
+def deliver_pending_batches() -> int:
+    """
+    Claim and deliver due outbox events batch by batch.
+
+    Keeps claiming until the queue is drained or the per-run time budget is spent.
+    Returns the number of events processed (sent or failed).
+    """
+    batch_size = settings.outbox_batch_size
+    deadline = monotonic() + settings.outbox_dispatch_time_budget_seconds
+    provider = NotificationProvider()
+    processed = 0
+
+    with ThreadPoolExecutor(
+        max_workers=settings.outbox_delivery_concurrency,
+        thread_name_prefix="outbox-delivery",
+    ) as executor:
+        while True:
+            with _session_scope() as session:
+                claimed = EventOutboxRepository(session).claim_pending(
+                    limit=batch_size,
+                    lease_seconds=settings.outbox_claim_lease_seconds,
+                )
+            if not claimed:
+                break
+
+            claimed_at = datetime.now(timezone.utc)
+            started = monotonic()
+            sent, failed = _deliver_batch(provider, executor, claimed)
+            PrometheusMetrics.observe_outbox_batch(
+                len(claimed),
+                monotonic() - started,
+                [_lag_seconds(event, claimed_at) for event in claimed if event.due_at],
+            )
+            processed += len(claimed)
+            logger.info(
+                "Delivered outbox batch size=%s sent=%s failed=%s", len(claimed), sent, failed
+            )
+
+            if len(claimed) < batch_size or monotonic() >= deadline:
+                break
+
+    return processed
+
+
+def _lag_seconds(event: ClaimedEvent, claimed_at: datetime) -> float:
+    due_at = cast(datetime, event.due_at)
+    if due_at.tzinfo is None:
+        due_at = due_at.replace(tzinfo=timezone.utc)
+    return (claimed_at - due_at).total_seconds()
+
+
+def _send_claimed(
+    provider: NotificationProvider, event: ClaimedEvent
+) -> tuple[ClaimedEvent, Optional[Exception], float]:
+    PrometheusMetrics.record_notification_attempt(event.event_type)
+    start = monotonic()
+    try:
+        provider.send(
+            event_type=event.event_type,
+            payload=event.payload,
+            idempotency_key=event.idempotency_key,
+        )
+    except Exception as exc:
+        return event, exc, monotonic() - start
+    return event, None, monotonic() - start
+
+
+def _deliver_batch(
+    provider: NotificationProvider,
+    executor: ThreadPoolExecutor,
+    events: list[ClaimedEvent],
+) -> tuple[int, int]:
+    """Send a claimed batch concurrently and persist all outcomes in bulk."""
+    sent_ids: list[str] = []
+    failures: list[DeliveryFailure] = []
+
+    for event, error, duration in executor.map(lambda e: _send_claimed(provider, e), events):
+        PrometheusMetrics.observe_notification_dispatch(event.event_type, duration)
+        if error is None:
+            sent_ids.append(event.id)
+            PrometheusMetrics.record_notification_outcome(event.event_type, "sent")
+            continue
+
+        attempt_number = event.attempt_count + 1
+        terminal = attempt_number >= MAX_DELIVERY_ATTEMPTS
+        backoff = _next_backoff(attempt_number)
+        failures.append(
+            DeliveryFailure(
+                event_id=event.id,
+                attempt_count=attempt_number,
+                backoff_seconds=backoff,
+                error=str(error),
+                terminal=terminal,
+            )
+        )
+        if terminal:
+            PrometheusMetrics.record_notification_outcome(event.event_type, "failed")
+            logger.error(
+                "Outbox event %s failed permanently after %s attempts: %s",
+                event.id,
+                attempt_number,
+                error,
+            )
+        else:
+            logger.warning(
+                "Retrying outbox event %s attempt=%s backoff=%ss: %s",
+                event.id,
+                attempt_number,
+                backoff,
+                error,
+            )
+
+    # If this write fails the rows stay leased and are redelivered once the lease
+    # expires; NotificationProvider de-duplicates on the idempotency key.
+    with _session_scope() as session:
+        repo = EventOutboxRepository(session)
+        repo.mark_sent_many(sent_ids)
+        repo.mark_failed_many(failures)
+
+    return len(sent_ids), len(failures)
+
+
 @typed_task(
     name="outbox.deliver_event",
     bind=True,
@@ -191,41 +336,6 @@ def deliver_event(self: "Task[Any, Any]", event_id: str) -> Optional[str]:
         session.close()
 
 
-def _format_display_name(user: Any) -> str:
-    first = (getattr(user, "first_name", "") or "").strip() if user else ""
-    last = (getattr(user, "last_name", "") or "").strip() if user else ""
-    if first and last:
-        return f"{first} {last[0]}."
-    return first or "Someone"
-
-
-def _format_booking_date(booking: Booking) -> str:
-    booking_date = getattr(booking, "booking_date", None)
-    if isinstance(booking_date, date):
-        return booking_date.strftime("%B %d").replace(" 0", " ")
-    return str(booking_date or "")
-
-
-def _format_booking_time(booking: Booking) -> str:
-    start_time = getattr(booking, "start_time", None)
-    if isinstance(start_time, time):
-        return start_time.strftime("%I:%M %p").lstrip("0")
-    if start_time:
-        return str(start_time)
-    return ""
-
-
-def _resolve_service_name(booking: Booking) -> str:
-    name = getattr(booking, "service_name", None)
-    if isinstance(name, str) and name.strip():
-        return name.strip()
-    service = getattr(booking, "instructor_service", None)
-    service_name = getattr(service, "name", None)
-    if isinstance(service_name, str) and service_name.strip():
-        return service_name.strip()
-    return "Lesson"
-
-
 def _send_reminder_notifications(
     service: NotificationService,
     booking: Booking,
@@ -233,11 +343,11 @@ def _send_reminder_notifications(
     student_template: NotificationTemplate,
     sms_template: SMSTemplate,
 ) -> bool:
-    student_name = _format_display_name(getattr(booking, "student", None))
-    instructor_name = _format_display_name(getattr(booking, "instructor", None))
-    service_name = _resolve_service_name(booking)
-    date_str = _format_booking_date(booking)
-    time_str = _format_booking_time(booking)
+    student_name = format_display_name(getattr(booking, "student", None))
+    instructor_name = format_display_name(getattr(booking, "instructor", None))
+    service_name = resolve_service_name(booking)
+    date_str = format_booking_date(booking)
+    time_str = format_booking_time(booking)
 
     async def _notify() -> None:
         await service.notify_user(
@@ -287,6 +397,8 @@ def send_booking_reminders() -> dict[str, int]:
     Runs every 15 minutes via Celery Beat.
     """
     now = datetime.now(timezone.utc)
+    if settings.booking_reminder_batch_enabled:
+        return send_reminder_batches(now)
 
     reminder_24h_start = now + timedelta(hours=24) - timedelta(minutes=15)
     reminder_24h_end = now + timedelta(hours=24)
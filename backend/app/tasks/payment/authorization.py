@@ -14,6 +14,7 @@ from app.tasks.payment.common import (
     PaymentTasksFacadeApi,
     notify_payment_failed_once,
 )
+from app.tasks.payment.concurrent_runner import run_payment_jobs
 
 
 def load_auth_booking_context(
@@ -258,7 +259,13 @@ def collect_authorization_candidates(
             getattr(booking.payment_detail, "payment_status", None) == PaymentStatus.SCHEDULED.value
             and due_for_auth
         ):
-            candidates.append({"booking_id": booking.id, "hours_until_lesson": hours_until_lesson})
+            candidates.append(
+                {
+                    "booking_id": booking.id,
+                    "hours_until_lesson": hours_until_lesson,
+                    "instructor_id": getattr(booking, "instructor_id", None),
+                }
+            )
     return candidates
 
 
@@ -302,39 +309,53 @@ def send_t24_failure_warning_if_needed(
         db_notify.close()
 
 
+def _authorize_candidate(api: PaymentTasksFacadeApi, data: Dict[str, Any]) -> Dict[str, Any]:
+    booking_id = data["booking_id"]
+    hours_until_lesson = data["hours_until_lesson"]
+    outcome: Dict[str, Any] = {"success": 0, "failed": 0, "failures": []}
+    try:
+        with api.booking_lock_sync(booking_id) as acquired:
+            if not acquired:
+                return outcome
+            auth_result = api._process_authorization_for_booking(booking_id, hours_until_lesson)
+        if auth_result.get("skipped"):
+            return outcome
+        if auth_result.get("success"):
+            outcome["success"] = 1
+            return outcome
+        outcome["failed"] = 1
+        outcome["failures"].append(
+            {
+                "booking_id": booking_id,
+                "error": auth_result.get("error", "Unknown error"),
+                "type": auth_result.get("error_type", "system_error"),
+            }
+        )
+        send_t24_failure_warning_if_needed(api, booking_id, hours_until_lesson, auth_result)
+    except Exception as exc:
+        api.logger.error("Error processing authorization for booking %s: %s", booking_id, exc)
+        outcome["failed"] = 1
+        outcome["failures"].append(
+            {"booking_id": booking_id, "error": str(exc), "type": "system_error"}
+        )
+    return outcome
+
+
 def process_authorization_batch(
     api: PaymentTasksFacadeApi,
     booking_data: List[Dict[str, Any]],
     results: AuthorizationJobResults,
 ) -> AuthorizationJobResults:
-    for data in booking_data:
-        booking_id = data["booking_id"]
-        hours_until_lesson = data["hours_until_lesson"]
-        try:
-            with api.booking_lock_sync(booking_id) as acquired:
-                if not acquired:
-                    continue
-                auth_result = api._process_authorization_for_booking(booking_id, hours_until_lesson)
-            if auth_result.get("skipped"):
-                continue
-            if auth_result.get("success"):
-                results["success"] += 1
-                continue
-            results["failed"] += 1
-            results["failures"].append(
-                {
-                    "booking_id": booking_id,
-                    "error": auth_result.get("error", "Unknown error"),
-                    "type": auth_result.get("error_type", "system_error"),
-                }
-            )
-            send_t24_failure_warning_if_needed(api, booking_id, hours_until_lesson, auth_result)
-        except Exception as exc:
-            api.logger.error("Error processing authorization for booking %s: %s", booking_id, exc)
-            results["failed"] += 1
-            results["failures"].append(
-                {"booking_id": booking_id, "error": str(exc), "type": "system_error"}
-            )
+    outcomes = run_payment_jobs(
+        booking_data,
+        lambda data: _authorize_candidate(api, data),
+        key=lambda data: data["booking_id"],
+        rate_key=lambda data: data.get("instructor_id"),
+    )
+    for outcome in outcomes:
+        results["success"] += outcome["success"]
+        results["failed"] += outcome["failed"]
+        results["failures"].extend(outcome["failures"])
     return results
 
 
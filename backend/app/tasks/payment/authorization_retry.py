@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import ServiceException
 from app.models.booking import Booking, BookingStatus, PaymentStatus
 from app.tasks.payment.common import PaymentTasksFacadeApi, RetryJobResults
+from app.tasks.payment.concurrent_runner import run_payment_jobs
 
 
 def mark_booking_payment_failed_impl(
@@ -253,6 +254,7 @@ def plan_retry_actions(
                 {
                     "booking_id": booking.id,
                     "hours_until_lesson": hours_until_lesson,
+                    "instructor_id": getattr(booking, "instructor_id", None),
                     "action": "mark_payment_failed",
                 }
             )
@@ -264,6 +266,7 @@ def plan_retry_actions(
                     {
                         "booking_id": booking.id,
                         "hours_until_lesson": hours_until_lesson,
+                        "instructor_id": getattr(booking, "instructor_id", None),
                         "action": "warn_only",
                     }
                 )
@@ -272,6 +275,7 @@ def plan_retry_actions(
                     {
                         "booking_id": booking.id,
                         "hours_until_lesson": hours_until_lesson,
+                        "instructor_id": getattr(booking, "instructor_id", None),
                         "action": "retry_with_warning",
                     }
                 )
@@ -281,6 +285,7 @@ def plan_retry_actions(
                 {
                     "booking_id": booking.id,
                     "hours_until_lesson": hours_until_lesson,
+                    "instructor_id": getattr(booking, "instructor_id", None),
                     "action": "silent_retry",
                 }
             )
@@ -319,6 +324,28 @@ def _run_retry_action(
             results["failed"] += 1
 
 
+def _run_booking_retry_actions(
+    api: PaymentTasksFacadeApi, actions: List[Dict[str, Any]], now: datetime
+) -> RetryJobResults:
+    outcome: RetryJobResults = {
+        "retried": 0,
+        "success": 0,
+        "failed": 0,
+        "cancelled": 0,
+        "warnings_sent": 0,
+        "processed_at": now.isoformat(),
+    }
+    for action_data in actions:
+        try:
+            _run_retry_action(api, action_data, now, outcome)
+        except Exception as exc:
+            api.logger.error(
+                "Error processing retry for booking %s: %s", action_data["booking_id"], exc
+            )
+            outcome["failed"] += 1
+    return outcome
+
+
 def retry_failed_authorizations_impl(api: PaymentTasksFacadeApi) -> RetryJobResults:
     """Retry failed payment authorizations."""
     from app.database import SessionLocal
@@ -338,14 +365,22 @@ def retry_failed_authorizations_impl(api: PaymentTasksFacadeApi) -> RetryJobResu
         db_read.commit()
     finally:
         db_read.close()
+    # Actions for one booking (warning, then retry) stay ordered on one worker.
+    actions_by_booking: Dict[str, List[Dict[str, Any]]] = {}
     for action_data in booking_actions:
-        try:
-            _run_retry_action(api, action_data, now, results)
-        except Exception as exc:
-            api.logger.error(
-                "Error processing retry for booking %s: %s", action_data["booking_id"], exc
-            )
-            results["failed"] += 1
+        actions_by_booking.setdefault(action_data["booking_id"], []).append(action_data)
+    outcomes = run_payment_jobs(
+        list(actions_by_booking.values()),
+        lambda actions: _run_booking_retry_actions(api, actions, now),
+        key=lambda actions: actions[0]["booking_id"],
+        rate_key=lambda actions: actions[0].get("instructor_id"),
+    )
+    for outcome in outcomes:
+        results["retried"] += outcome["retried"]
+        results["success"] += outcome["success"]
+        results["failed"] += outcome["failed"]
+        results["cancelled"] += outcome["cancelled"]
+        results["warnings_sent"] += outcome["warnings_sent"]
     api.logger.info(
         "Retry job completed: %s attempted, %s success, %s failed, %s payment-failed, %s warnings sent",
         results["retried"],
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Sequence, cast
+from typing import Any, Dict, List, Optional, Sequence, cast
 
 from sqlalchemy.orm import Session
 
 from app.models.booking import Booking, BookingStatus, PaymentStatus
 from app.models.payment import PaymentEvent
 from app.tasks.payment.common import CaptureJobResults, PaymentTasksFacadeApi
+from app.tasks.payment.concurrent_runner import run_payment_jobs
 
 
 def complete_booking_status(
@@ -158,17 +159,19 @@ def collect_capture_candidates(
     capture_cutoff = now - timedelta(hours=24)
     auto_complete_cutoff = now - timedelta(hours=24)
     seven_days_ago = now - timedelta(days=7)
-    capture_booking_ids = [
-        booking.id
-        for booking in cast(Sequence[Booking], booking_repo.get_bookings_for_payment_capture())
-        if api._get_booking_end_utc(booking) <= capture_cutoff
-        and (getattr(booking.payment_detail, "payment_intent_id", None) or booking.has_locked_funds)
-    ]
-    auto_complete_booking_ids = [
-        booking.id
-        for booking in cast(Sequence[Booking], booking_repo.get_bookings_for_auto_completion())
-        if api._get_booking_end_utc(booking) <= auto_complete_cutoff
-    ]
+    rate_keys: Dict[str, Optional[str]] = {}
+    capture_booking_ids: List[str] = []
+    for booking in cast(Sequence[Booking], booking_repo.get_bookings_for_payment_capture()):
+        if api._get_booking_end_utc(booking) <= capture_cutoff and (
+            getattr(booking.payment_detail, "payment_intent_id", None) or booking.has_locked_funds
+        ):
+            capture_booking_ids.append(booking.id)
+            rate_keys[booking.id] = getattr(booking, "instructor_id", None)
+    auto_complete_booking_ids: List[str] = []
+    for booking in cast(Sequence[Booking], booking_repo.get_bookings_for_auto_completion()):
+        if api._get_booking_end_utc(booking) <= auto_complete_cutoff:
+            auto_complete_booking_ids.append(booking.id)
+            rate_keys[booking.id] = getattr(booking, "instructor_id", None)
     expired_auth_data: List[Dict[str, Any]] = []
     for booking in cast(Sequence[Booking], booking_repo.get_bookings_with_expired_auth()):
         auth_events = cast(
@@ -183,6 +186,7 @@ def collect_capture_candidates(
             None,
         )
         if auth_event and auth_event.created_at <= seven_days_ago:
+            rate_keys[booking.id] = getattr(booking, "instructor_id", None)
             expired_auth_data.append(
                 {
                     "booking_id": booking.id,
@@ -194,6 +198,7 @@ def collect_capture_candidates(
         "capture_booking_ids": capture_booking_ids,
         "auto_complete_booking_ids": auto_complete_booking_ids,
         "expired_auth_data": expired_auth_data,
+        "rate_keys": rate_keys,
     }
 
 
@@ -284,6 +289,16 @@ def _handle_expired_auth_booking(
         db_expired.close()
 
 
+def _empty_capture_outcome(results: CaptureJobResults) -> CaptureJobResults:
+    return {
+        "captured": 0,
+        "failed": 0,
+        "auto_completed": 0,
+        "expired_handled": 0,
+        "processed_at": results["processed_at"],
+    }
+
+
 def capture_completed_lessons_impl(api: PaymentTasksFacadeApi) -> CaptureJobResults:
     """Capture payments for completed lessons."""
     from app.database import SessionLocal
@@ -302,28 +317,62 @@ def capture_completed_lessons_impl(api: PaymentTasksFacadeApi) -> CaptureJobResu
         db_read.commit()
     finally:
         db_read.close()
-    for booking_id in candidate_data["capture_booking_ids"]:
+    rate_keys: Dict[str, Optional[str]] = candidate_data.get("rate_keys", {})
+
+    def _capture(booking_id: str) -> CaptureJobResults:
+        outcome = _empty_capture_outcome(results)
         try:
-            _process_completed_capture(api, booking_id, results)
+            _process_completed_capture(api, booking_id, outcome)
         except Exception as exc:
             api.logger.error("Error processing capture for booking %s: %s", booking_id, exc)
-            results["failed"] += 1
-    for booking_id in candidate_data["auto_complete_booking_ids"]:
+            outcome["failed"] += 1
+        return outcome
+
+    def _auto_complete(booking_id: str) -> CaptureJobResults:
+        outcome = _empty_capture_outcome(results)
         try:
-            _process_auto_complete(api, booking_id, now, results)
+            _process_auto_complete(api, booking_id, now, outcome)
         except Exception as exc:
             api.logger.error("Error auto-completing booking %s: %s", booking_id, exc)
-            results["failed"] += 1
-    for expired_data in candidate_data["expired_auth_data"]:
+            outcome["failed"] += 1
+        return outcome
+
+    def _expired(expired_data: Dict[str, Any]) -> CaptureJobResults:
         booking_id = expired_data["booking_id"]
+        outcome = _empty_capture_outcome(results)
         try:
             with api.booking_lock_sync(booking_id) as acquired:
-                if not acquired:
-                    continue
-                _handle_expired_auth_booking(api, booking_id, expired_data, now, results)
+                if acquired:
+                    _handle_expired_auth_booking(api, booking_id, expired_data, now, outcome)
         except Exception as exc:
             api.logger.error("Error handling expired auth for booking %s: %s", booking_id, exc)
-            results["failed"] += 1
+            outcome["failed"] += 1
+        return outcome
+
+    # The three phases run in order; bookings within a phase run concurrently.
+    outcomes = run_payment_jobs(
+        candidate_data["capture_booking_ids"],
+        _capture,
+        key=lambda booking_id: booking_id,
+        rate_key=rate_keys.get,
+    )
+    outcomes += run_payment_jobs(
+        candidate_data["auto_complete_booking_ids"],
+        _auto_complete,
+        key=lambda booking_id: booking_id,
+        rate_key=rate_keys.get,
+    )
+    outcomes += run_payment_jobs(
+        candidate_data["expired_auth_data"],
+        _expired,
+        key=lambda expired_data: expired_data["booking_id"],
+        rate_key=lambda expired_data: rate_keys.get(expired_data["booking_id"]),
+    )
+    for outcome in outcomes:
+        results["captured"] += outcome["captured"]
+        results["failed"] += outcome["failed"]
+        results["auto_completed"] += outcome["auto_completed"]
+        results["expired_handled"] += outcome["expired_handled"]
     api.logger.info(
         "Capture job completed: %s captured, %s failed, %s auto-completed, %s expired handled",
         results["captured"],
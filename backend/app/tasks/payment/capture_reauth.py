@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import ServiceException
 from app.models.booking import Booking, BookingStatus, PaymentStatus
 from app.tasks.payment.common import PaymentTasksFacadeApi, resolve_payout_cents
+from app.tasks.payment.concurrent_runner import pace_stripe_call
 
 
 def run_reauth_lock_guard(
@@ -46,6 +47,7 @@ def run_reauthorization(
             config_service=api.ConfigService(db_stripe),
             pricing_service=api.PricingService(db_stripe),
         )
+        pace_stripe_call()
         new_intent = stripe_service.create_or_retry_booking_payment_intent(
             booking_id=booking.id,
             payment_method_id=payment.payment_method_id,
@@ -58,6 +60,7 @@ def run_reauthorization(
             raise ServiceException(
                 f"No payment intent id after reauthorization for booking {booking.id}"
             )
+        pace_stripe_call()
         capture_result = stripe_service.capture_booking_payment_intent(
             booking_id=booking.id,
             payment_intent_id=str(resolved_intent_id),
@@ -0,0 +1,142 @@
+"""Bounded-concurrency runner shared by the scheduled payment jobs."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+GLOBAL_RATE_KEY = "__platform__"
+
+
+class StripeRateShaper:
+    """
+    Token buckets that pace Stripe calls for the platform and per connected account.
+
+    ``acquire(key)`` blocks until both the platform bucket and the bucket for
+    ``key`` hold a token, so one instructor with many bookings cannot use up the
+    platform's request budget. A rate of ``0`` disables that bucket.
+    """
+
+    def __init__(
+        self,
+        global_rate: float,
+        account_rate: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rates = {"global": float(global_rate), "account": float(account_rate)}
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        # key -> (tokens, last refill timestamp)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def _wait_for(self, key: str, rate: float, now: float) -> float:
+        if rate <= 0:
+            return 0.0
+        capacity = max(1.0, rate)
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        self._buckets[key] = (tokens, now)
+        return 0.0 if tokens >= 1.0 else (1.0 - tokens) / rate
+
+    def _take(self, key: str, rate: float) -> None:
+        if rate > 0:
+            tokens, updated = self._buckets[key]
+            self._buckets[key] = (tokens - 1.0, updated)
+
+    def acquire(self, key: Optional[str] = None) -> None:
+        """Block until a Stripe call for ``key`` fits within both rate limits."""
+        global_rate = self._rates["global"]
+        account_rate = self._rates["account"] if key else 0.0
+        account_key = f"account:{key}"
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = max(
+                    self._wait_for(GLOBAL_RATE_KEY, global_rate, now),
+                    self._wait_for(account_key, account_rate, now),
+                )
+                if wait <= 0:
+                    self._take(GLOBAL_RATE_KEY, global_rate)
+                    self._take(account_key, account_rate)
+                    return
+            self._sleep(wait)
+
+
+def default_rate_shaper() -> StripeRateShaper:
+    return StripeRateShaper(
+        settings.payment_jobs_stripe_rps, settings.payment_jobs_stripe_account_rps
+    )
+
+
+# (shaper, account key) for the item the current pool thread is processing.
+_stripe_pacing: ContextVar[Optional[Tuple[StripeRateShaper, Optional[str]]]] = ContextVar(
+    "payment_job_stripe_pacing", default=None
+)
+
+
+def pace_stripe_call() -> None:
+    """
+    Wait for a Stripe call slot when running inside a pooled ``run_payment_jobs``.
+
+    Call right before each Stripe request so bookings that are locked, skipped or
+    settled without Stripe take no tokens. Outside a pool this is a no-op.
+    """
+    pacing = _stripe_pacing.get()
+    if pacing is not None:
+        shaper, account_key = pacing
+        shaper.acquire(account_key)
+
+
+def run_payment_jobs(
+    items: Sequence[T],
+    worker: Callable[[T], R],
+    *,
+    key: Callable[[T], Hashable],
+    rate_key: Callable[[T], Optional[str]] = lambda _item: None,
+    max_workers: Optional[int] = None,
+    shaper: Optional[StripeRateShaper] = None,
+) -> List[R]:
+    """
+    Run ``worker`` once per distinct ``key`` and return the outcomes in input order.
+
+    Workers must open their own DB sessions (the per-booking payment helpers do)
+    and return their outcome instead of mutating shared results; callers fold the
+    returned outcomes into the job totals on the calling thread. Items repeating
+    an already-seen key are dropped, so a booking listed twice is processed and
+    counted once. With one worker the items run inline on the calling thread and
+    Stripe calls are not paced; pooled workers pace them via ``pace_stripe_call``
+    under the ``rate_key`` account.
+    """
+    unique: Dict[Hashable, T] = {}
+    for item in items:
+        unique.setdefault(key(item), item)
+    pending = list(unique.values())
+    if not pending:
+        return []
+
+    workers = settings.payment_jobs_concurrency if max_workers is None else max_workers
+    workers = max(1, min(int(workers), len(pending)))
+    if workers == 1:
+        return [worker(item) for item in pending]
+    pool_shaper = shaper or default_rate_shaper()
+
+    def _run(item: T) -> R:
+        token = _stripe_pacing.set((pool_shaper, rate_key(item)))
+        try:
+            return worker(item)
+        finally:
+            _stripe_pacing.reset(token)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="payment-job") as pool:
+        return list(pool.map(_run, pending))
@@ -51,6 +51,7 @@ from app.tasks.payment.common import (
     resolve_locked_booking_from_task_impl,
     typed_task,
 )
+from app.tasks.payment.concurrent_runner import pace_stripe_call
 
 
 def _facade_api() -> PaymentTasksFacadeApi:
@@ -115,6 +116,7 @@ def _process_authorization_for_booking(
                 if ctx.student_pay_cents <= 0:
                     stripe_result = authorization.build_auth_credits_only_result(ctx)
                 elif existing_payment_intent_id:
+                    pace_stripe_call()
                     payment_record = stripe_service.confirm_payment_intent(
                         existing_payment_intent_id, payment_method_id
                     )
@@ -131,6 +133,7 @@ def _process_authorization_for_booking(
                 else:
                     if not payment_method_id:
                         raise ServiceException("Payment method required for authorization")
+                    pace_stripe_call()
                     payment_intent = stripe_service.create_or_retry_booking_payment_intent(
                         booking_id=booking_id,
                         payment_method_id=payment_method_id,
@@ -219,6 +222,7 @@ def _process_retry_authorization(
             if ctx.student_pay_cents <= 0:
                 stripe_result = authorization_retry.build_retry_credits_only_result(ctx)
             else:
+                pace_stripe_call()
                 payment_intent = stripe_service.create_or_retry_booking_payment_intent(
                     booking_id=booking_id,
                     payment_method_id=payment_method_id,
@@ -347,6 +351,7 @@ def _process_capture_for_booking(
             db_stripe.commit()
         finally:
             db_stripe.close()
+        pace_stripe_call()
         capture_payload = stripe_service.capture_booking_payment_intent(
             booking_id=booking_id,
             payment_intent_id=payment_intent_id,
@@ -217,6 +217,7 @@ def process_data_export_request(
     self: "DatabaseTask",
     user_id: str,
     request_id: Optional[str] = None,
+    deliver_to_storage: bool = False,
 ) -> Dict[str, Any]:
     """
     Process a user data export request.
@@ -226,6 +227,8 @@ def process_data_export_request(
     Args:
         user_id: ULID of the user requesting data export
         request_id: Optional request ID for tracking
+        deliver_to_storage: Stream the export to R2 as JSON lines and return a
+            presigned download URL instead of the export payload
 
     Returns:
         Dictionary with export results
@@ -235,6 +238,19 @@ def process_data_export_request(
     try:
         with get_db_session() as db:
             privacy_service = PrivacyService(db)
+            if deliver_to_storage:
+                stored = privacy_service.export_user_data_to_storage(user_id, request_id=request_id)
+                logger.info("Data export stored for user %s at %s", user_id, stored.object_key)
+                return {
+                    "user_id": user_id,
+                    "request_id": request_id,
+                    "processed_at": datetime.now(timezone.utc).isoformat(),
+                    "object_key": stored.object_key,
+                    "download_url": stored.download_url,
+                    "expires_at": stored.expires_at,
+                    "size_bytes": stored.size_bytes,
+                }
+
             export_data: Dict[str, Any] = privacy_service.export_user_data(user_id)
 
             # Add metadata
@@ -14,6 +14,107 @@ from app.core.constants import (
     TAG_RESERVED as TAG_RESERVED,
 )
 
+# Day bitmaps are little-endian per byte: slot ``n`` is bit ``n % 8`` of byte ``n // 8``,
+# which is exactly bit ``n`` of ``int.from_bytes(bits, "little")``. The helpers below
+# work on that integer so runs, ranges and masks cost O(words) instead of O(slots).
+_ALL_SLOTS = (1 << SLOTS_PER_DAY) - 1
+_BYTE_INDEXES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in range(8) if (value >> bit) & 1) for value in range(256)
+)
+
+
+def _check_bits(bits: bytes) -> None:
+    if len(bits) != BYTES_PER_DAY:
+        raise ValueError(f"bits length must be {BYTES_PER_DAY}")
+
+
+def _check_tags(tags: bytes) -> None:
+    if len(tags) != TAG_BYTES_PER_DAY:
+        raise ValueError(f"tags length must be {TAG_BYTES_PER_DAY}")
+
+
+def _range_mask(start_slot: int, end_slot: int) -> int:
+    if not (0 <= start_slot <= end_slot <= SLOTS_PER_DAY):
+        raise ValueError("range out of bounds")
+    return ((1 << (end_slot - start_slot)) - 1) << start_slot
+
+
+# _TAG_UNITS[n] is 0b0101...01 over n 2-bit fields; times a tag, it repeats that tag.
+_TAG_UNITS: Tuple[int, ...] = tuple(
+    ((1 << (BITS_PER_TAG * count)) - 1) // 3 for count in range(SLOTS_PER_DAY + 1)
+)
+
+
+def _tag_pattern(count: int, tag: int) -> int:
+    """``tag`` repeated in ``count`` consecutive 2-bit fields."""
+    return tag * _TAG_UNITS[count]
+
+
+def bits_to_int(bits: bytes) -> int:
+    _check_bits(bits)
+    return int.from_bytes(bits, "little") & _ALL_SLOTS
+
+
+def int_to_bits(value: int) -> bytes:
+    if value < 0 or value > _ALL_SLOTS:
+        raise ValueError("value out of range")
+    return value.to_bytes(BYTES_PER_DAY, "little")
+
+
+def popcount(bits: bytes) -> int:
+    """Number of available slots in a day bitmap."""
+    return bits_to_int(bits).bit_count()
+
+
+def and_bits(bits: bytes, mask: bytes) -> bytes:
+    return int_to_bits(bits_to_int(bits) & bits_to_int(mask))
+
+
+def andnot_bits(bits: bytes, mask: bytes) -> bytes:
+    """Slots set in ``bits`` but not in ``mask`` (e.g. availability minus bookings)."""
+    return int_to_bits(bits_to_int(bits) & ~bits_to_int(mask))
+
+
+def set_range(bits: bytes, start_slot: int, end_slot: int, value: bool = True) -> bytes:
+    """Set (or clear) slots ``[start_slot, end_slot)``."""
+    current = bits_to_int(bits)
+    mask = _range_mask(start_slot, end_slot)
+    return int_to_bits(current | mask if value else current & ~mask)
+
+
+def range_mask_bits(start_slot: int, end_slot: int) -> bytes:
+    """Bitmap with only slots ``[start_slot, end_slot)`` set (e.g. a booking mask)."""
+    return int_to_bits(_range_mask(start_slot, end_slot))
+
+
+def iter_runs(value: int) -> List[Tuple[int, int]]:
+    """``[start, end)`` slot runs of consecutive set bits in a day integer."""
+    # A run starts at a set bit whose lower neighbour is clear and ends after a set
+    # bit whose upper neighbour is clear; pair them off lowest first.
+    starts = value & ~(value << 1)
+    ends = value & ~(value >> 1)
+    runs: List[Tuple[int, int]] = []
+    while starts:
+        start_bit = starts & -starts
+        end_bit = ends & -ends
+        runs.append((start_bit.bit_length() - 1, end_bit.bit_length()))
+        starts ^= start_bit
+        ends ^= end_bit
+    return runs
+
+
+def slot_runs_from_bits(bits: bytes) -> List[Tuple[int, int]]:
+    """Merged ``[start, end)`` slot runs of a day bitmap."""
+    return iter_runs(bits_to_int(bits))
+
+
+def minute_windows_from_bits(bits: bytes) -> List[Tuple[int, int]]:
+    """Merged windows as ``(start_minute, end_minute)``; the day end is 1440."""
+    return [
+        (start * MINUTES_PER_SLOT, end * MINUTES_PER_SLOT)
+        for start, end in slot_runs_from_bits(bits)
+    ]
+
 
 def new_empty_bits() -> bytes:
     return bytes(BYTES_PER_DAY)
@@ -35,16 +136,14 @@ def pack_indexes(indexes: List[int]) -> bytes:
 
 
 def unpack_indexes(bits: bytes) -> List[int]:
-    if len(bits) != BYTES_PER_DAY:
-        raise ValueError(f"bits length must be {BYTES_PER_DAY}")
+    _check_bits(bits)
     out: List[int] = []
     for byte_i, val in enumerate(bits):
-        for bit_i in range(8):
-            idx = byte_i * 8 + bit_i
-            if idx >= SLOTS_PER_DAY:
-                break
-            if (val >> bit_i) & 1:
-                out.append(idx)
+        if val:
+            base = byte_i * 8
+            out.extend(base + bit for bit in _BYTE_INDEXES[val])
+    while out and out[-1] >= SLOTS_PER_DAY:
+        out.pop()  # padding bits beyond the last slot
     return out
 
 
@@ -91,33 +190,33 @@ def set_slot_tag(tags: bytes, slot: int, tag: int) -> bytes:
 
 
 def set_range_tag(tags: bytes, start_slot: int, count: int, tag: int) -> bytes:
-    if len(tags) != TAG_BYTES_PER_DAY:
-        raise ValueError(f"tags length must be {TAG_BYTES_PER_DAY}")
+    _check_tags(tags)
     if count <= 0:
         raise ValueError("count must be greater than 0")
     if start_slot < 0 or start_slot + count > SLOTS_PER_DAY:
         raise ValueError("range out of bounds")
     if not (TAG_NONE <= tag <= TAG_RESERVED):
         raise ValueError("tag must be 0-3")
-    result = bytearray(tags)
-    for i in range(count):
-        slot = start_slot + i
-        bit_offset = slot * BITS_PER_TAG
-        byte_idx = bit_offset // 8
-        bit_pos = bit_offset % 8
-        result[byte_idx] &= ~(0b11 << bit_pos)
-        result[byte_idx] |= (tag & 0b11) << bit_pos
-    return bytes(result)
+    shift = start_slot * BITS_PER_TAG
+    field_mask = ((1 << (count * BITS_PER_TAG)) - 1) << shift
+    value = int.from_bytes(tags, "little")
+    value = (value & ~field_mask) | (_tag_pattern(count, tag) << shift)
+    return value.to_bytes(TAG_BYTES_PER_DAY, "little")
 
 
 def get_range_tag(tags: bytes, start_slot: int, count: int) -> int | None:
     if count <= 0:
         raise ValueError("count must be greater than 0")
-    first = get_slot_tag(tags, start_slot)
-    for i in range(1, count):
-        if get_slot_tag(tags, start_slot + i) != first:
-            return None
-    return first
+    _check_tags(tags)
+    if not (0 <= start_slot and start_slot + count <= SLOTS_PER_DAY):
+        raise ValueError("slot out of range")
+    shift = start_slot * BITS_PER_TAG
+    first_byte = shift // 8
+    last_byte = (shift + count * BITS_PER_TAG + 7) // 8
+    fields = int.from_bytes(tags[first_byte:last_byte], "little") >> (shift - first_byte * 8)
+    fields &= (1 << (count * BITS_PER_TAG)) - 1
+    first = fields & 0b11
+    return first if fields == _tag_pattern(count, first) else None
 
 
 def is_tag_compatible(tag: int, location_type: str) -> bool:
@@ -132,18 +231,6 @@ def is_tag_compatible(tag: int, location_type: str) -> bool:
 
 def windows_from_bits(bits: bytes) -> List[Tuple[str, str]]:
     """Return merged windows as ('HH:MM:SS','HH:MM:SS') tuples."""
-    idxs = unpack_indexes(bits)
-    if not idxs:
-        return []
-    windows: List[Tuple[int, int]] = []
-    start = prev = idxs[0]
-    for idx in idxs[1:]:
-        if idx == prev + 1:
-            prev = idx
-            continue
-        windows.append((start, prev + 1))
-        start = prev = idx
-    windows.append((start, prev + 1))
 
     def idx_to_time(i: int) -> str:
         minutes = i * MINUTES_PER_SLOT
@@ -151,7 +238,7 @@ def windows_from_bits(bits: bytes) -> List[Tuple[str, str]]:
         mm = minutes % 60
         return f"{hh:02d}:{mm:02d}:00"
 
-    return [(idx_to_time(s), idx_to_time(e)) for s, e in windows]
+    return [(idx_to_time(s), idx_to_time(e)) for s, e in slot_runs_from_bits(bits)]
 
 
 def bits_from_windows(windows: List[Tuple[str, str]]) -> bytes:
@@ -166,11 +253,11 @@ def bits_from_windows(windows: List[Tuple[str, str]]) -> bytes:
             return SLOTS_PER_DAY
         return (hh * 60 + mm) // MINUTES_PER_SLOT
 
-    idxs: List[int] = []
+    value = 0
     for start, end in windows:
         s = time_to_index(start)
         e = time_to_index(end, is_end=True)
         if not (0 <= s <= e <= SLOTS_PER_DAY):
             raise ValueError(f"window out of bounds: {start}-{end}")
-        idxs.extend(range(s, e))
-    return pack_indexes(idxs)
+        value |= _range_mask(s, e)
+    return int_to_bits(value)
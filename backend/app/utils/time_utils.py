@@ -20,6 +20,19 @@ def time_to_minutes(t: time, *, is_end_time: bool = False) -> int:
     return minutes
 
 
+def minutes_to_time(minutes: int) -> time:
+    """
+    Convert minutes since midnight to a time.
+
+    1440 (end of day) wraps to time(0, 0), matching string_to_time("24:00:00").
+    """
+    if not 0 <= minutes <= 24 * 60:
+        raise ValueError(f"minutes out of range: {minutes}")
+    if minutes == 24 * 60:
+        return time(0, 0)
+    return time(minutes // 60, minutes % 60)
+
+
 def minutes_to_time_str(minutes: int) -> str:
     """
     Convert minutes since midnight to HH:MM.
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-backfill_badges.py — thin CLI wrapper for BadgeAwardService.backfill_user_badges.
+backfill_badges.py — thin CLI wrapper for BadgeAwardService.backfill_badges_for_students.
 
 Default behavior is a dry run with notifications disabled. Use --no-dry-run to
 persist awards and --send-notifications to fire immediate badge notifications.
@@ -197,26 +197,23 @@ def _process_users_chunk(
     chunk_totals: Dict[str, int] = {field: 0 for field in SUMMARY_FIELDS}
     chunk_totals["processed_users"] = 0
 
-    for student in students:
-        student_id = getattr(student, "id", None)
-        if not student_id:
-            continue
+    student_ids = [student.id for student in students if getattr(student, "id", None)]
+    if student_ids:
         try:
-            result = badge_service.backfill_user_badges(
-                student_id,
+            # One set-based pass per chunk instead of one backfill call per student.
+            result = badge_service.backfill_badges_for_students(
+                student_ids,
                 datetime.now(timezone.utc),
                 quality_window_days=args.quality_window_days,
                 send_notifications=args.send_notifications,
                 dry_run=args.dry_run,
             )
         except Exception as exc:  # pragma: no cover - defensive logging
-            logger.exception("Failed to backfill user %s: %s", student_id, exc)
-            continue
+            logger.exception("Failed to backfill chunk %s: %s", chunk_index, exc)
+            result = {}
         result = result or {}
 
-        chunk_totals["processed_users"] += 1
-        summary["processed_users"] += 1
-        for field in SUMMARY_FIELDS:
+        for field in (*SUMMARY_FIELDS, "processed_users"):
             value = int(result.get(field, 0) or 0)
             chunk_totals[field] += value
             summary[field] += value
@@ -0,0 +1,47 @@
+"""Build the offline IP-to-location table used by GeolocationService.
+
+The CSV needs a header row with either ``network`` (CIDR) or ``start_ip`` and
+``end_ip`` columns, plus any of: country_code, country_name, state, city,
+postal_code, latitude, longitude, timezone.
+
+Usage:
+  python scripts/build_geoip_table.py ip_ranges.csv --output data/geoip.bin
+
+Point GEOIP_DATABASE_PATH at the output file; workers load it on restart.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+# Make sure 'backend' is on sys.path so `app` can be imported when run directly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.config import settings
+from app.services.geoip_table import write_geoip_table
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the offline geoip range table")
+    parser.add_argument("csv_path", type=Path, help="CSV of IP ranges and locations")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(settings.geoip_database_path or "data/geoip.bin"),
+        help="Table file to write (default: GEOIP_DATABASE_PATH or data/geoip.bin)",
+    )
+    args = parser.parse_args()
+
+    if not args.csv_path.exists():
+        print(f"CSV not found: {args.csv_path}", file=sys.stderr)
+        return 1
+
+    counts = write_geoip_table(args.csv_path, args.output)
+    print(
+        f"Wrote {args.output}: {counts['ipv4_ranges']} IPv4 ranges, "
+        f"{counts['ipv6_ranges']} IPv6 ranges"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
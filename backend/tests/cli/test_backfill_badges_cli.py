@@ -69,6 +69,16 @@ def cli_setup(monkeypatch):
             self.calls.append({"student_id": student_id, **kwargs})
             return result
 
+        def backfill_badges_for_students(self, student_ids, now_utc, **kwargs):
+            totals = {field: 0 for field in cli.SUMMARY_FIELDS}
+            totals["processed_users"] = 0
+            for student_id in student_ids:
+                result = self.backfill_user_badges(student_id, now_utc, **kwargs)
+                totals["processed_users"] += 1
+                for field in cli.SUMMARY_FIELDS:
+                    totals[field] += int(result.get(field, 0) or 0)
+            return totals
+
     def import_stub():
         return session_factory, factory, FakeBadgeService
 
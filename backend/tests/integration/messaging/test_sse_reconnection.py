@@ -9,9 +9,16 @@ import pytest
 
 from app.repositories.conversation_repository import ConversationRepository
 from app.repositories.message_repository import MessageRepository
+from app.services.messaging import sse_stream as sse_stream_module
 from app.services.messaging.sse_stream import create_sse_stream, fetch_messages_after
 
 
+@pytest.fixture(autouse=True)
+def _legacy_per_user_channels(monkeypatch: pytest.MonkeyPatch) -> None:
+    """These tests cover the per-user channel path; the sharded hub has its own tests."""
+    monkeypatch.setattr(sse_stream_module.settings, "sse_fanout_enabled", False)
+
+
 @pytest.mark.asyncio
 async def test_reconnection_catches_up(
     db,
@@ -71,6 +71,30 @@ def test_vector_search_and_embedding_counts(db, test_instructor):
     assert isinstance(results, list)
 
 
+def test_services_for_catalogs_matches_vector_search_rows(db, test_instructor):
+    repo = RetrieverRepository(db)
+    service = (
+        db.query(InstructorService)
+        .filter(InstructorService.instructor_profile_id == test_instructor.instructor_profile.id)
+        .first()
+    )
+    catalog = db.get(ServiceCatalog, service.service_catalog_id)
+    _ensure_embedding(db, catalog)
+    db.commit()
+
+    pg_rows = {row["id"]: row for row in repo.vector_search([0.01] * 1536, limit=200)}
+    rows = repo.services_for_catalogs({catalog.id: 0.75}, limit=200)
+
+    assert rows and all(row["catalog_id"] == catalog.id for row in rows)
+    assert all(row["vector_score"] == 0.75 for row in rows)
+    for row in rows:
+        if row["id"] in pg_rows:
+            assert {k: v for k, v in row.items() if k != "vector_score"} == {
+                k: v for k, v in pg_rows[row["id"]].items() if k != "vector_score"
+            }
+    assert repo.services_for_catalogs({}, limit=5) == []
+
+
 def test_text_search_and_text_only(db, test_instructor):
     repo = RetrieverRepository(db)
     results = repo.text_search("piano", "piano", limit=5)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from redis.exceptions import RedisError
@@ -286,15 +286,14 @@ async def test_get_redis_client_fallback(monkeypatch, memory_cache_service: Cach
 async def test_delete_pattern_redis(redis_cache_service):
     service, redis_client = redis_cache_service
 
-    async def _scan_iter(*_args, **_kwargs):
-        for key in ["k1", "k2"]:
-            yield key
-
-    redis_client.scan_iter = _scan_iter
-    redis_client.delete = AsyncMock(return_value=True)
+    redis_client.scan = AsyncMock(side_effect=[(7, ["k1"]), (0, ["k2"])])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1])
+    redis_client.pipeline = MagicMock(return_value=pipe)
 
     deleted = await service.delete_pattern("k*")
     assert deleted == 2
+    assert redis_client.scan.await_args_list[1].kwargs["cursor"] == 7
 
 
 @pytest.mark.asyncio
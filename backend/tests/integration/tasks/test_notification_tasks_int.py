@@ -11,6 +11,7 @@ from app.models.event_outbox import EventOutbox, EventOutboxStatus
 from app.repositories.event_outbox_repository import EventOutboxRepository
 from app.services import notification_provider
 from app.services.notification_provider import NotificationProviderTemporaryError
+from app.tasks import notification_tasks
 from app.tasks.notification_tasks import (
     MAX_DELIVERY_ATTEMPTS,
     deliver_event,
@@ -31,7 +32,8 @@ def _enqueue_outbox(db, *, event_type: str, aggregate_id: str, key: str) -> Even
     return event
 
 
-def test_dispatch_pending_enqueues_events(db):
+def test_dispatch_pending_enqueues_events(db, monkeypatch):
+    monkeypatch.setattr(notification_tasks.settings, "outbox_batch_delivery_enabled", False)
     event1 = _enqueue_outbox(
         db,
         event_type="booking.created",
@@ -53,6 +55,33 @@ def test_dispatch_pending_enqueues_events(db):
     assert {event1.id, event2.id} == called_ids
 
 
+def test_dispatch_pending_batch_mode_delivers_and_reschedules(db, monkeypatch):
+    monkeypatch.setattr(notification_tasks.settings, "outbox_batch_delivery_enabled", True)
+    ok = _enqueue_outbox(
+        db,
+        event_type="booking.created",
+        aggregate_id="booking-b1",
+        key="booking:booking-b1:booking.created",
+    )
+    flaky = _enqueue_outbox(
+        db,
+        event_type="booking.created",
+        aggregate_id="booking-b2",
+        key="booking:booking-b2:booking.created",
+    )
+    monkeypatch.setattr(notification_provider, "NOTIFICATION_PROVIDER_RAISE_ON", ("booking-b2",))
+
+    with patch("app.tasks.notification_tasks.enqueue_task") as mocked_enqueue:
+        processed = dispatch_pending()
+
+    assert processed == 2
+    mocked_enqueue.assert_not_called()
+    db.expire_all()
+    assert db.get(EventOutbox, ok.id).status == EventOutboxStatus.SENT.value
+    retried = db.get(EventOutbox, flaky.id)
+    assert (retried.status, retried.attempt_count) == (EventOutboxStatus.PENDING.value, 1)
+
+
 def test_deliver_event_missing_returns_none():
     assert deliver_event.run("missing-event-id") is None
 
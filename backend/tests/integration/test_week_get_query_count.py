@@ -6,15 +6,17 @@ from fastapi.testclient import TestClient
 import pytest
 from sqlalchemy.orm import Session
 
-from app.middleware.perf_counters import PerfCounterMiddleware
+from app.middleware.request_pipeline import RequestPipelineMiddleware
 from tests._utils.bitmap_avail import seed_week
 
 
 def _ensure_perf_mode(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("AVAILABILITY_PERF_DEBUG", "1")
-    existing = {middleware.cls for middleware in client.app.user_middleware}
-    if PerfCounterMiddleware not in existing:
-        client.app.add_middleware(PerfCounterMiddleware)
+    if not any(
+        middleware.cls is RequestPipelineMiddleware and middleware.kwargs.get("perf_counters")
+        for middleware in client.app.user_middleware
+    ):
+        client.app.add_middleware(RequestPipelineMiddleware, perf_counters=True)
 
 
 @pytest.mark.usefixtures("STRICT_ON")
@@ -6,28 +6,28 @@ import sys
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import pytest
-from starlette.requests import Request
 from starlette.responses import Response
 
 BACKEND_ROOT = pathlib.Path(__file__).resolve().parents[2]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
+from app.middleware import request_pipeline
 import app.middleware.perf_counters as perf_counters_module
 from app.middleware.perf_counters import (
-    PerfCounterMiddleware,
     inc_db_query,
     note_cache_hit,
     note_cache_miss,
     record_cache_key,
     snapshot,
 )
+from app.middleware.request_pipeline import RequestPipelineMiddleware
 
 
 def _build_client(monkeypatch, include_cache_route: bool = False) -> TestClient:
     monkeypatch.setenv("AVAILABILITY_PERF_DEBUG", "1")
     app = FastAPI()
-    app.add_middleware(PerfCounterMiddleware)
+    app.add_middleware(RequestPipelineMiddleware, perf_counters=True)
 
     @app.get("/ping")
     def ping() -> dict[str, str]:
@@ -103,7 +103,7 @@ def test_cache_helpers_noop_when_perf_debug_disabled(monkeypatch) -> None:
 def test_middleware_handles_missing_context_state(monkeypatch) -> None:
     monkeypatch.setenv("AVAILABILITY_PERF_DEBUG", "1")
     app = FastAPI()
-    app.add_middleware(PerfCounterMiddleware)
+    app.add_middleware(RequestPipelineMiddleware, perf_counters=True)
 
     @app.get("/state-reset")
     def state_reset() -> dict[str, str]:
@@ -122,8 +122,8 @@ def test_middleware_handles_missing_context_state(monkeypatch) -> None:
 def test_middleware_falls_back_to_empty_state_when_reset_is_disabled(monkeypatch) -> None:
     monkeypatch.setenv("AVAILABILITY_PERF_DEBUG", "1")
     app = FastAPI()
-    app.add_middleware(PerfCounterMiddleware)
-    monkeypatch.setattr(perf_counters_module, "reset_counters", lambda: None)
+    app.add_middleware(RequestPipelineMiddleware, perf_counters=True)
+    monkeypatch.setattr(request_pipeline, "reset_counters", lambda: None)
 
     @app.get("/no-reset")
     def no_reset() -> dict[str, str]:
@@ -137,16 +137,21 @@ def test_middleware_falls_back_to_empty_state_when_reset_is_disabled(monkeypatch
 
 
 @pytest.mark.asyncio
-async def test_dispatch_fallback_creates_state_when_none(monkeypatch) -> None:
-    monkeypatch.setattr(perf_counters_module, "perf_counters_enabled", lambda: True)
-    monkeypatch.setattr(perf_counters_module, "reset_counters", lambda: None)
+async def test_pipeline_fallback_creates_state_when_none(monkeypatch) -> None:
+    monkeypatch.setattr(request_pipeline, "perf_counters_enabled", lambda: True)
+    monkeypatch.setattr(request_pipeline, "reset_counters", lambda: None)
     perf_counters_module._state_var.set(None)
-    middleware = PerfCounterMiddleware(FastAPI())
-    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    middleware = RequestPipelineMiddleware(Response("ok"), perf_counters=True)
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+    messages: list[dict] = []
 
-    async def _call_next(_request: Request) -> Response:
-        return Response("ok")
+    async def _receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
 
-    response = await middleware.dispatch(request, _call_next)
+    async def _send(message: dict) -> None:
+        messages.append(message)
 
-    assert response.headers["x-db-query-count"] == "0"
+    await middleware(scope, _receive, _send)
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"x-db-query-count"] == b"0"
@@ -0,0 +1,131 @@
+# backend/tests/performance/test_ann_index_benchmark.py
+"""
+Benchmark: in-memory catalog embedding index vs pgvector.
+
+1. Synthetic: 20k clustered 1536-d vectors; exact scan vs the IVF layer
+   (recall@30 and per-query latency), no database required.
+2. pgvector: assigns random embeddings to the active catalog rows inside the test
+   transaction, builds the index from ``list_embedding_rows`` and compares its
+   top-30 and latency with ``ORDER BY embedding_v2 <=> :q`` on the same data.
+
+Run with: pytest tests/performance/test_ann_index_benchmark.py -m slow -s
+"""
+
+from __future__ import annotations
+
+import time
+from typing import List
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.service_catalog import ServiceCatalog
+from app.repositories.service_catalog_repository import ServiceCatalogRepository
+from app.services.search.ann_index import ServiceEmbeddingIndex
+
+DIM = 1536
+TOP_K = 30
+QUERIES = 100
+NPROBES = (8, 16, 32)
+# Per-dimension noise relative to unit-variance cluster centres.
+NOISE = 3.0
+
+PGVECTOR_TOP_K = text(
+    """
+    SELECT id
+    FROM service_catalog
+    WHERE is_active = true AND embedding_v2 IS NOT NULL
+    ORDER BY embedding_v2 <=> CAST(:embedding AS vector)
+    LIMIT :limit
+"""
+)
+
+
+def _clustered(rng: np.random.Generator, centers: np.ndarray, count: int) -> np.ndarray:
+    labels = rng.integers(0, len(centers), size=count)
+    noise = NOISE * rng.normal(size=(count, DIM)).astype(np.float32)
+    noisy: np.ndarray = centers[labels] + noise
+    return noisy
+
+
+def _recall(found: List[str], expected: List[str]) -> float:
+    return len(set(found) & set(expected)) / max(1, len(expected))
+
+
+@pytest.mark.slow
+def test_ivf_recall_and_latency_against_exact_scan() -> None:
+    rng = np.random.default_rng(11)
+    centers = rng.normal(size=(200, DIM)).astype(np.float32)
+    vectors = _clustered(rng, centers, 20_000)
+    ids = [f"svc-{i}" for i in range(len(vectors))]
+    queries = _clustered(rng, centers, QUERIES)
+
+    exact = ServiceEmbeddingIndex(ivf_min_vectors=len(vectors) + 1)
+    ivf = ServiceEmbeddingIndex(ivf_min_vectors=1)
+    build_started = time.perf_counter()
+    ivf.build(zip(ids, vectors))
+    build_seconds = time.perf_counter() - build_started
+    exact.build(zip(ids, vectors))
+
+    started = time.perf_counter()
+    expected = [[item_id for item_id, _ in exact.search(query, TOP_K)] for query in queries]
+    exact_ms = (time.perf_counter() - started) / QUERIES * 1000
+    print(
+        f"\nANN synthetic: {len(vectors)} x {DIM}, IVF build {build_seconds * 1000:.0f} ms, "
+        f"exact scan {exact_ms:.2f} ms/q"
+    )
+
+    recalls = {}
+    for nprobe in NPROBES:
+        ivf.nprobe = nprobe
+        started = time.perf_counter()
+        found = [[item_id for item_id, _ in ivf.search(query, TOP_K)] for query in queries]
+        ivf_ms = (time.perf_counter() - started) / QUERIES * 1000
+        recalls[nprobe] = sum(map(_recall, found, expected)) / QUERIES
+        print(f"  nprobe={nprobe:>2}: {ivf_ms:.2f} ms/q, recall@{TOP_K} {recalls[nprobe]:.3f}")
+
+    assert recalls[NPROBES[-1]] >= 0.9
+    assert recalls[NPROBES[-1]] >= recalls[NPROBES[0]]
+
+
+@pytest.mark.slow
+def test_memory_index_matches_pgvector_top_k(db: Session) -> None:
+    catalogs = db.query(ServiceCatalog).filter(ServiceCatalog.is_active == True).all()
+    if len(catalogs) < TOP_K:
+        pytest.skip("needs a seeded service catalog")
+
+    rng = np.random.default_rng(5)
+    centers = rng.normal(size=(max(2, len(catalogs) // 10), DIM)).astype(np.float32)
+    vectors = _clustered(rng, centers, len(catalogs))
+    for catalog, vector in zip(catalogs, vectors):
+        catalog.embedding_v2 = vector.tolist()
+    db.flush()
+
+    index = ServiceEmbeddingIndex()
+    index.load(ServiceCatalogRepository(db))
+    assert len(index) == len(catalogs)
+
+    timings = {"pgvector": 0.0, "memory": 0.0}
+    recalls = []
+    for query in _clustered(rng, centers, QUERIES):
+        serialized = "[" + ",".join(f"{value:.6f}" for value in query) + "]"
+        started = time.perf_counter()
+        expected = [
+            str(row.id)
+            for row in db.execute(PGVECTOR_TOP_K, {"embedding": serialized, "limit": TOP_K})
+        ]
+        timings["pgvector"] += time.perf_counter() - started
+        started = time.perf_counter()
+        found = [item_id for item_id, _ in index.search(query, TOP_K)]
+        timings["memory"] += time.perf_counter() - started
+        recalls.append(_recall(found, expected))
+
+    mean_recall = sum(recalls) / len(recalls)
+    print(
+        f"\nANN vs pgvector: {len(catalogs)} catalog rows; "
+        f"pgvector {timings['pgvector'] / QUERIES * 1000:.2f} ms/q, "
+        f"memory {timings['memory'] / QUERIES * 1000:.3f} ms/q, recall@{TOP_K} {mean_recall:.3f}"
+    )
+    assert mean_recall >= 0.95
@@ -0,0 +1,146 @@
+# backend/tests/performance/test_availability_filter_benchmark.py
+"""
+Benchmark: legacy per-row check_availability() vs the set-based bit-string query.
+
+Seeds N synthetic instructors x 7 days of bitmaps, runs both statements over the
+same inputs, asserts identical results and prints the timings.
+
+Run with: pytest tests/performance/test_availability_filter_benchmark.py -m slow -s
+"""
+
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+import random
+import time as time_module
+from typing import Dict, List
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from app.core.constants import SLOTS_PER_DAY
+from app.core.ulid_helper import generate_ulid
+from app.models.availability_day import AvailabilityDay
+from app.models.user import User
+from app.repositories.filter_repository import FilterRepository
+from app.utils.bitset import pack_indexes
+
+LEGACY_QUERY = text(
+    """
+    SELECT ad.instructor_id, ad.day_date
+    FROM availability_days ad
+    WHERE ad.instructor_id = ANY(:instructor_ids)
+      AND ad.day_date = ANY(:dates)
+      AND ad.bits IS NOT NULL
+      AND check_availability(
+          ad.instructor_id,
+          ad.day_date,
+          :time_after,
+          :time_before,
+          :duration
+      )
+    ORDER BY ad.instructor_id, ad.day_date
+"""
+)
+
+QUERY_SHAPES = [
+    {"time_after": None, "time_before": None, "duration_minutes": 60},
+    {"time_after": time(17, 0), "time_before": None, "duration_minutes": 90},
+    {"time_after": time(9, 0), "time_before": time(12, 0), "duration_minutes": 45},
+]
+
+
+def _random_bits(rng: random.Random) -> bytes:
+    slots: set[int] = set()
+    for _ in range(rng.randint(0, 4)):
+        start = rng.randrange(SLOTS_PER_DAY)
+        slots.update(range(start, min(SLOTS_PER_DAY, start + rng.randint(3, 72))))
+    return pack_indexes(sorted(slots))
+
+
+def _seed(db: Session, instructor_count: int, dates: List[date]) -> List[str]:
+    rng = random.Random(instructor_count)
+    instructor_ids = [generate_ulid() for _ in range(instructor_count)]
+    db.execute(
+        insert(User),
+        [
+            {
+                "id": instructor_id,
+                "email": f"bench-{instructor_id.lower()}@example.com",
+                "hashed_password": "x",
+                "first_name": "Bench",
+                "last_name": "Instructor",
+                "zip_code": "10001",
+            }
+            for instructor_id in instructor_ids
+        ],
+    )
+    db.execute(
+        insert(AvailabilityDay),
+        [
+            {"instructor_id": instructor_id, "day_date": day, "bits": _random_bits(rng)}
+            for instructor_id in instructor_ids
+            for day in dates
+        ],
+    )
+    db.flush()
+    return instructor_ids
+
+
+def _timed(fn) -> tuple[float, Dict[str, List[date]]]:
+    started = time_module.perf_counter()
+    result = fn()
+    return (time_module.perf_counter() - started) * 1000, result
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("instructor_count", [1_000, 10_000])
+def test_set_based_availability_matches_and_outpaces_legacy(
+    db: Session, instructor_count: int
+) -> None:
+    if db.bind is None or db.bind.dialect.name != "postgresql":
+        pytest.skip("Benchmark requires PostgreSQL")
+
+    dates = [date(2031, 1, 6) + timedelta(days=offset) for offset in range(7)]
+    instructor_ids = _seed(db, instructor_count, dates)
+    repo = FilterRepository(db)
+
+    for shape in QUERY_SHAPES:
+
+        def legacy() -> Dict[str, List[date]]:
+            grouped: Dict[str, List[date]] = {}
+            for row in db.execute(
+                LEGACY_QUERY,
+                {
+                    "instructor_ids": instructor_ids,
+                    "dates": dates,
+                    "time_after": shape["time_after"],
+                    "time_before": shape["time_before"],
+                    "duration": shape["duration_minutes"],
+                },
+            ):
+                grouped.setdefault(row.instructor_id, []).append(row.day_date)
+            return grouped
+
+        def set_based() -> Dict[str, List[date]]:
+            return repo.filter_by_availability(
+                instructor_ids,
+                dates_to_check=dates,
+                time_after=shape["time_after"],
+                time_before=shape["time_before"],
+                duration_minutes=shape["duration_minutes"],
+            )
+
+        legacy()  # warm caches so both paths read hot pages
+        legacy_ms, expected = _timed(legacy)
+        set_ms, actual = _timed(set_based)
+
+        assert actual == expected
+        print(
+            f"\n[availability filter] {instructor_count} instructors x 7 days {shape}: "
+            f"legacy={legacy_ms:.1f}ms set_based={set_ms:.1f}ms "
+            f"speedup={legacy_ms / max(set_ms, 0.001):.1f}x"
+        )
+
+    db.rollback()
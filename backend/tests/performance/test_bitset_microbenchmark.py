@@ -0,0 +1,233 @@
+# backend/tests/performance/test_bitset_microbenchmark.py
+"""
+Microbenchmarks for app/utils/bitset.py.
+
+Each public helper runs over the same randomised day bitmaps/tags. Where the
+int-based fast path replaced a per-bit loop, the previous loop implementation is
+kept here as a reference: results are asserted identical and both timings printed.
+
+Run with: pytest tests/performance/test_bitset_microbenchmark.py -m slow -s
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from app.core.constants import MINUTES_PER_SLOT, SLOTS_PER_DAY, TAG_BYTES_PER_DAY
+from app.utils import bitset
+from app.utils.time_helpers import string_to_time
+from app.utils.time_utils import time_to_minutes
+
+DAYS = 2_000
+REPEAT = 3
+
+
+def _legacy_unpack_indexes(bits: bytes) -> List[int]:
+    out: List[int] = []
+    for byte_i, val in enumerate(bits):
+        for bit_i in range(8):
+            idx = byte_i * 8 + bit_i
+            if idx >= SLOTS_PER_DAY:
+                break
+            if (val >> bit_i) & 1:
+                out.append(idx)
+    return out
+
+
+def _legacy_windows_from_bits(bits: bytes) -> List[Tuple[str, str]]:
+    idxs = _legacy_unpack_indexes(bits)
+    if not idxs:
+        return []
+    windows: List[Tuple[int, int]] = []
+    start = prev = idxs[0]
+    for idx in idxs[1:]:
+        if idx == prev + 1:
+            prev = idx
+            continue
+        windows.append((start, prev + 1))
+        start = prev = idx
+    windows.append((start, prev + 1))
+
+    def idx_to_time(i: int) -> str:
+        minutes = i * MINUTES_PER_SLOT
+        return f"{minutes // 60:02d}:{minutes % 60:02d}:00"
+
+    return [(idx_to_time(s), idx_to_time(e)) for s, e in windows]
+
+
+def _legacy_minute_windows(bits: bytes) -> List[Tuple[int, int]]:
+    """What callers did before: format HH:MM:SS strings, then parse them back."""
+    out = []
+    for start_str, end_str in _legacy_windows_from_bits(bits):
+        end_min = 24 * 60 if end_str.startswith("24:") else None
+        out.append(
+            (
+                time_to_minutes(string_to_time(start_str)),
+                end_min or time_to_minutes(string_to_time(end_str), is_end_time=True),
+            )
+        )
+    return out
+
+
+def _legacy_set_range_tag(tags: bytes, start_slot: int, count: int, tag: int) -> bytes:
+    result = bytearray(tags)
+    for slot in range(start_slot, start_slot + count):
+        bit_offset = slot * 2
+        result[bit_offset // 8] &= ~(0b11 << (bit_offset % 8))
+        result[bit_offset // 8] |= (tag & 0b11) << (bit_offset % 8)
+    return bytes(result)
+
+
+def _legacy_get_range_tag(tags: bytes, start_slot: int, count: int) -> int | None:
+    first = bitset.get_slot_tag(tags, start_slot)
+    for i in range(1, count):
+        if bitset.get_slot_tag(tags, start_slot + i) != first:
+            return None
+    return first
+
+
+def _legacy_bits_from_windows(windows: List[Tuple[str, str]]) -> bytes:
+    idxs: List[int] = []
+    for start, end in windows:
+        hh, mm = (int(part) for part in start.split(":")[:2])
+        eh, em = (int(part) for part in end.split(":")[:2])
+        s = (hh * 60 + mm) // MINUTES_PER_SLOT
+        e = SLOTS_PER_DAY if (eh, em) == (0, 0) else (eh * 60 + em) // MINUTES_PER_SLOT
+        idxs.extend(range(s, e))
+    return bitset.pack_indexes(idxs)
+
+
+def _legacy_andnot(bits: bytes, mask: bytes) -> bytes:
+    return bytes(a & ~b & 0xFF for a, b in zip(bits, mask))
+
+
+def _legacy_and(bits: bytes, mask: bytes) -> bytes:
+    return bytes(a & b for a, b in zip(bits, mask))
+
+
+def _legacy_popcount(bits: bytes) -> int:
+    return len(_legacy_unpack_indexes(bits))
+
+
+def _legacy_set_range(bits: bytes, start: int, end: int) -> bytes:
+    out = bits
+    for idx in range(start, end):
+        out = bitset.toggle_index(out, idx, True)
+    return out
+
+
+def _random_day(rng: random.Random) -> bytes:
+    slots: set[int] = set()
+    for _ in range(rng.randint(0, 6)):
+        start = rng.randrange(SLOTS_PER_DAY)
+        slots.update(range(start, min(SLOTS_PER_DAY, start + rng.randint(1, 96))))
+    return bitset.pack_indexes(sorted(slots))
+
+
+def _random_tags(rng: random.Random) -> bytes:
+    """Format tags come in runs (whole windows share a format), not per-slot noise."""
+    tags = bytes(TAG_BYTES_PER_DAY)
+    for _ in range(rng.randint(0, 3)):
+        start = rng.randrange(SLOTS_PER_DAY)
+        count = rng.randint(1, SLOTS_PER_DAY - start)
+        tags = _legacy_set_range_tag(tags, start, count, rng.randint(1, 3))
+    return tags
+
+
+def _time(fn: Callable[..., Any], args: List[Tuple[Any, ...]]) -> Tuple[float, List[Any]]:
+    best = float("inf")
+    results: List[Any] = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        results = [fn(*arg) for arg in args]
+        best = min(best, time.perf_counter() - started)
+    return best / len(args) * 1e6, results
+
+
+@pytest.mark.slow
+def test_bitset_microbenchmarks() -> None:
+    rng = random.Random(42)
+    days = [_random_day(rng) for _ in range(DAYS)]
+    masks = [_random_day(rng) for _ in range(DAYS)]
+    tags = [_random_tags(rng) for _ in range(DAYS)]
+    ranges = []
+    for _ in range(DAYS):
+        start = rng.randrange(SLOTS_PER_DAY)
+        ranges.append((start, rng.randint(start + 1, SLOTS_PER_DAY)))
+    tag_ranges = [(t, s, e - s, rng.randint(0, 3)) for t, (s, e) in zip(tags, ranges)]
+    windows = [bitset.windows_from_bits(day) for day in days]
+
+    cases: List[
+        Tuple[str, Callable[..., Any], Callable[..., Any] | None, List[Tuple[Any, ...]]]
+    ] = [
+        ("unpack_indexes", bitset.unpack_indexes, _legacy_unpack_indexes, [(d,) for d in days]),
+        (
+            "windows_from_bits",
+            bitset.windows_from_bits,
+            _legacy_windows_from_bits,
+            [(d,) for d in days],
+        ),
+        (
+            "minute_windows_from_bits",
+            bitset.minute_windows_from_bits,
+            _legacy_minute_windows,
+            [(d,) for d in days],
+        ),
+        ("slot_runs_from_bits", bitset.slot_runs_from_bits, None, [(d,) for d in days]),
+        (
+            "bits_from_windows",
+            bitset.bits_from_windows,
+            _legacy_bits_from_windows,
+            [(w,) for w in windows],
+        ),
+        ("popcount", bitset.popcount, _legacy_popcount, [(d,) for d in days]),
+        ("and_bits", bitset.and_bits, _legacy_and, list(zip(days, masks))),
+        ("andnot_bits", bitset.andnot_bits, _legacy_andnot, list(zip(days, masks))),
+        (
+            "set_range",
+            bitset.set_range,
+            _legacy_set_range,
+            [(d, s, e) for d, (s, e) in zip(days, ranges)],
+        ),
+        ("range_mask_bits", bitset.range_mask_bits, None, ranges),
+        ("set_range_tag", bitset.set_range_tag, _legacy_set_range_tag, tag_ranges),
+        ("get_range_tag", bitset.get_range_tag, _legacy_get_range_tag, [a[:3] for a in tag_ranges]),
+        ("pack_indexes", bitset.pack_indexes, None, [(bitset.unpack_indexes(d),) for d in days]),
+        (
+            "toggle_index",
+            bitset.toggle_index,
+            None,
+            [(d, s, True) for d, (s, _) in zip(days, ranges)],
+        ),
+        ("get_slot_tag", bitset.get_slot_tag, None, [(t, s) for t, (s, _) in zip(tags, ranges)]),
+        ("set_slot_tag", bitset.set_slot_tag, None, [(t, s, 2) for t, (s, _) in zip(tags, ranges)]),
+        (
+            "is_tag_compatible",
+            bitset.is_tag_compatible,
+            None,
+            [(rng.randint(0, 3), "online") for _ in days],
+        ),
+        (
+            "bits_to_int/int_to_bits",
+            lambda d: bitset.int_to_bits(bitset.bits_to_int(d)),
+            None,
+            [(d,) for d in days],
+        ),
+    ]
+
+    print(f"\nbitset microbenchmarks ({DAYS} days, best of {REPEAT}, us/call):")
+    for name, fast, legacy, args in cases:
+        fast_us, fast_results = _time(fast, args)
+        if legacy is None:
+            print(f"  {name:<26} {fast_us:8.2f}")
+            continue
+        legacy_us, legacy_results = _time(legacy, args)
+        assert fast_results == legacy_results, name
+        print(
+            f"  {name:<26} {fast_us:8.2f}  (loop {legacy_us:8.2f}, "
+            f"x{legacy_us / max(fast_us, 1e-9):.1f})"
+        )
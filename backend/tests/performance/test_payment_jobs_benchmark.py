@@ -0,0 +1,115 @@
+# backend/tests/performance/test_payment_jobs_benchmark.py
+"""
+Benchmark: scheduled authorization batch, sequential vs bounded concurrency.
+
+Starts a local fake Stripe API (threaded HTTP server answering every request
+with a payment intent after a fixed latency) and points the Stripe SDK at it.
+Each booking's authorization makes one real ``stripe.PaymentIntent.create``
+call, then ``process_authorization_batch`` runs the same candidates with
+``payment_jobs_concurrency`` 1 and 8.
+
+Run with: pytest tests/performance/test_payment_jobs_benchmark.py -m slow -s
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import stripe
+
+from app.tasks.payment import authorization, concurrent_runner
+
+BOOKINGS = 64
+INSTRUCTORS = 16
+STRIPE_LATENCY_S = 0.04
+
+
+class _FakeStripeHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(STRIPE_LATENCY_S)
+        body = json.dumps(
+            {"id": "pi_fake", "object": "payment_intent", "status": "requires_capture"}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return None
+
+
+@pytest.fixture
+def fake_stripe(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeStripeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(stripe, "api_base", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(stripe, "api_key", "sk_test_benchmark")
+    monkeypatch.setattr(stripe, "max_network_retries", 0)
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def _api():
+    @contextmanager
+    def booking_lock_sync(booking_id):
+        yield True
+
+    def process_authorization(booking_id, hours_until_lesson):
+        concurrent_runner.pace_stripe_call()
+        intent = stripe.PaymentIntent.create(
+            amount=5000, currency="usd", capture_method="manual", metadata={"b": booking_id}
+        )
+        return {"success": True, "payment_intent_id": intent.id}
+
+    return SimpleNamespace(
+        booking_lock_sync=booking_lock_sync,
+        _process_authorization_for_booking=process_authorization,
+        logger=logging.getLogger(__name__),
+    )
+
+
+def _run(api, candidates):
+    results = {"success": 0, "failed": 0, "failures": [], "processed_at": ""}
+    start = time.perf_counter()
+    results = authorization.process_authorization_batch(api, candidates, results)
+    return time.perf_counter() - start, results
+
+
+@pytest.mark.slow
+def test_concurrent_authorization_batch(fake_stripe, monkeypatch):
+    monkeypatch.setattr(concurrent_runner.settings, "payment_jobs_stripe_rps", 100.0)
+    monkeypatch.setattr(concurrent_runner.settings, "payment_jobs_stripe_account_rps", 10.0)
+    candidates = [
+        {
+            "booking_id": f"b{i:03d}",
+            "hours_until_lesson": 24.0,
+            "instructor_id": f"i{i % INSTRUCTORS}",
+        }
+        for i in range(BOOKINGS)
+    ]
+    api = _api()
+
+    monkeypatch.setattr(concurrent_runner.settings, "payment_jobs_concurrency", 1)
+    sequential, sequential_results = _run(api, candidates)
+    monkeypatch.setattr(concurrent_runner.settings, "payment_jobs_concurrency", 8)
+    concurrent, concurrent_results = _run(api, candidates)
+
+    print(
+        f"\n{BOOKINGS} authorizations at {STRIPE_LATENCY_S * 1000:.0f}ms Stripe latency: "
+        f"sequential={sequential:.2f}s concurrency=8 {concurrent:.2f}s "
+        f"({sequential / concurrent:.1f}x)"
+    )
+    assert sequential_results["success"] == concurrent_results["success"] == BOOKINGS
+    assert concurrent < sequential
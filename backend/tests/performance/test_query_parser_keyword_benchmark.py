@@ -0,0 +1,105 @@
+# backend/tests/performance/test_query_parser_keyword_benchmark.py
+"""
+Benchmark: per-keyword regex scan vs the Aho-Corasick keyword automaton.
+
+Uses the full seeded taxonomy (``get_keyword_dicts()`` without a session) and a
+mix of realistic queries. The regex path mirrors what ``QueryParser`` did before:
+compile one ``\\b<keyword>\\b`` pattern per keyword, then try them longest-first for
+each level. Results are asserted identical and both timings printed.
+
+Run with: pytest tests/performance/test_query_parser_keyword_benchmark.py -m slow -s
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+
+from app.services.search.keyword_automaton import KEYWORD_LEVELS, KeywordAutomaton
+from app.services.search.keyword_generator import get_keyword_dicts
+
+QUERIES = 2_000
+REPEAT = 3
+
+Patterns = List[Tuple[str, re.Pattern[str], str]]
+
+
+def _legacy_patterns(keyword_map: Dict[str, str]) -> Patterns:
+    return [
+        (keyword, re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE), value)
+        for keyword, value in sorted(
+            keyword_map.items(), key=lambda item: len(item[0]), reverse=True
+        )
+    ]
+
+
+def _legacy_detect(patterns: Dict[str, Patterns], text: str) -> Dict[str, Tuple[str, str]]:
+    found: Dict[str, Tuple[str, str]] = {}
+    for level, level_patterns in patterns.items():
+        for keyword, pattern, value in level_patterns:
+            if pattern.search(text):
+                found[level] = (keyword, value)
+                break
+    return found
+
+
+def _automaton_detect(automaton: KeywordAutomaton, text: str) -> Dict[str, Tuple[str, str]]:
+    return {level: (m.keyword, m.value) for level, m in automaton.search(text).items()}
+
+
+def _queries(dicts: Dict[str, Dict[str, str]]) -> List[str]:
+    rng = random.Random(3)
+    keywords = sorted({kw for key in KEYWORD_LEVELS.values() for kw in dicts[key]})
+    templates = [
+        "{kw} lessons",
+        "{kw} for kids near me",
+        "cheap {kw} teacher in brooklyn tomorrow",
+        "advanced {kw} under $80",
+        "looking for someone to help my daughter with {kw}",
+        "online tutor",
+        "weekend lessons near me",
+    ]
+    return [rng.choice(templates).format(kw=rng.choice(keywords)) for _ in range(QUERIES)]
+
+
+def _best_of(fn: Callable[..., Any], *args: Any) -> Tuple[float, Any]:
+    best = float("inf")
+    result: Any = None
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+@pytest.mark.slow
+def test_keyword_automaton_vs_regex_scan() -> None:
+    dicts = get_keyword_dicts()
+    queries = _queries(dicts)
+    keyword_total = sum(len(dicts[key]) for key in KEYWORD_LEVELS.values())
+
+    regex_build_s, patterns = _best_of(
+        lambda: {level: _legacy_patterns(dicts[key]) for level, key in KEYWORD_LEVELS.items()}
+    )
+    automaton_build_s, automaton = _best_of(KeywordAutomaton.from_keyword_dicts, dicts)
+
+    regex_s, regex_results = _best_of(lambda: [_legacy_detect(patterns, q) for q in queries])
+    automaton_s, automaton_results = _best_of(
+        lambda: [_automaton_detect(automaton, q) for q in queries]
+    )
+    assert automaton_results == regex_results
+
+    regex_us = regex_s / QUERIES * 1e6
+    automaton_us = automaton_s / QUERIES * 1e6
+    print(
+        f"\nkeyword detection over {keyword_total} taxonomy keywords, {QUERIES} queries:"
+        f"\n  build: regex patterns {regex_build_s * 1000:.1f} ms, "
+        f"automaton {automaton_build_s * 1000:.1f} ms (once per keyword-dict refresh)"
+        f"\n  detect: regex {regex_us:.1f} us/query, automaton {automaton_us:.1f} us/query "
+        f"(x{regex_us / max(automaton_us, 1e-9):.1f})"
+    )
+    assert automaton_s < regex_s
@@ -0,0 +1,96 @@
+# backend/tests/performance/test_request_pipeline_benchmark.py
+"""
+Benchmark: per-request middleware overhead, BaseHTTPMiddleware layer vs fused pipeline.
+
+Drives a trivial ASGI endpoint directly (no server, no HTTP client) through:
+
+1. reference: a single no-op BaseHTTPMiddleware layer, the per-layer cost the
+   identity, site-header, CORS, perf-counter and Prometheus layers each paid
+   before they were fused;
+2. fused: RequestPipelineMiddleware doing all of that work in one pure-ASGI layer.
+
+Reports the mean per-request time of each minus the bare endpoint.
+
+Run with: pytest tests/performance/test_request_pipeline_benchmark.py -m slow -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.request_pipeline import RequestPipelineMiddleware
+
+REQUESTS = 5_000
+WARMUP = 200
+ORIGINS = ["https://app.example.com"]
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/api/v1/bookings/123",
+    "raw_path": b"/api/v1/bookings/123",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"testserver"), (b"origin", b"https://app.example.com")],
+    "client": ("10.0.0.5", 1234),
+    "server": ("testserver", 80),
+}
+
+
+async def _endpoint(scope, receive, send):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", b"2")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _passthrough(request, call_next):
+    return await call_next(request)
+
+
+def _reference_layer():
+    return BaseHTTPMiddleware(_endpoint, dispatch=_passthrough)
+
+
+def _fused_stack():
+    return RequestPipelineMiddleware(_endpoint, allowed_origins=ORIGINS, perf_counters=True)
+
+
+async def _per_request_us(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        return None
+
+    for _ in range(WARMUP):
+        await app(dict(SCOPE), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_fused_pipeline_overhead(monkeypatch):
+    monkeypatch.setenv("AVAILABILITY_PERF_DEBUG", "1")
+
+    bare = await _per_request_us(_endpoint, REQUESTS)
+    reference = await _per_request_us(_reference_layer(), REQUESTS)
+    fused = await _per_request_us(_fused_stack(), REQUESTS)
+
+    print(
+        f"\nper-request middleware overhead over {REQUESTS} requests: "
+        f"one BaseHTTPMiddleware layer={reference - bare:.1f}us fused={fused - bare:.1f}us"
+    )
+    assert fused < reference
@@ -0,0 +1,112 @@
+# backend/tests/performance/test_sse_fanout_benchmark.py
+"""
+Load benchmark: 10k SSE connections on one worker through the sharded fan-out hub.
+
+Uses an in-process stand-in for Redis pub/sub (channel → subscriber queues, the
+same shape Broadcaster exposes), registers 10k connections, publishes a burst of
+conversation events with two recipients each plus typing noise, and measures the
+time until every connection has drained its queue.
+
+Run with: pytest tests/performance/test_sse_fanout_benchmark.py -m slow -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import random
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from app.services.messaging.fanout_hub import (
+    SSEConnection,
+    SSEFanoutHub,
+    build_envelope,
+    group_by_shard,
+    shard_channel,
+)
+
+CONNECTIONS = 10_000
+EVENTS = 20_000
+SHARDS = 16
+
+
+class _LocalPubSub:
+    """Minimal Broadcaster-compatible pub/sub living in the event loop."""
+
+    def __init__(self) -> None:
+        self.subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers.setdefault(channel, []).append(queue)
+
+        async def _iter():
+            while True:
+                yield SimpleNamespace(channel=channel, message=await queue.get())
+
+        try:
+            yield _iter()
+        finally:
+            self.subscribers[channel].remove(queue)
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait(message)
+
+
+async def _drain(connection: SSEConnection, expected: int) -> int:
+    received = 0
+    while received < expected:
+        kind, _event = await connection.next_event(5)
+        if kind != "message":
+            break
+        received += 1
+    return received
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_fanout_hub_handles_10k_connections() -> None:
+    rng = random.Random(7)
+    pubsub = _LocalPubSub()
+    hub = SSEFanoutHub(shards=SHARDS, queue_size=256)
+    await hub.start(pubsub)
+
+    user_ids = [f"user-{index:05d}" for index in range(CONNECTIONS)]
+    connections = {user_id: hub.register(user_id) for user_id in user_ids}
+    expected = dict.fromkeys(user_ids, 0)
+
+    publish_started = time.perf_counter()
+    for index in range(EVENTS):
+        sender, recipient = rng.sample(user_ids, 2)
+        event = {
+            "type": "new_message",
+            "payload": {"message": {"id": f"m{index}", "sender_id": sender}},
+        }
+        for shard, recipients in group_by_shard([sender, recipient], SHARDS).items():
+            await pubsub.publish(shard_channel(shard), build_envelope(recipients, event))
+        expected[sender] += 1
+        expected[recipient] += 1
+    publish_seconds = time.perf_counter() - publish_started
+
+    drain_started = time.perf_counter()
+    received = await asyncio.gather(
+        *(_drain(connections[user_id], expected[user_id]) for user_id in user_ids)
+    )
+    drain_seconds = time.perf_counter() - drain_started
+    await hub.stop()
+
+    assert received == [expected[user_id] for user_id in user_ids]
+    assert not any(connection.overflowed for connection in connections.values())
+    deliveries = sum(received)
+    print(
+        f"\nSSE fan-out: {CONNECTIONS} connections, {EVENTS} events, {deliveries} deliveries; "
+        f"publish {publish_seconds * 1000:.0f} ms, "
+        f"dispatch+drain {drain_seconds * 1000:.0f} ms "
+        f"({deliveries / max(drain_seconds, 1e-9):,.0f} deliveries/s)"
+    )
@@ -0,0 +1,96 @@
+"""Integration tests for BookingRepository reminder claims against Postgres."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.booking import Booking, BookingStatus
+from app.repositories.booking_repository import BookingRepository
+
+try:  # pragma: no cover - allow running from backend/ root
+    from backend.tests.conftest import TestSessionLocal
+    from backend.tests.factories.booking_builders import create_booking_pg_safe
+except ModuleNotFoundError:  # pragma: no cover
+    from tests.conftest import TestSessionLocal
+    from tests.factories.booking_builders import create_booking_pg_safe
+
+
+def _create_confirmed_booking(db, test_booking, start_utc: datetime) -> Booking:
+    return create_booking_pg_safe(
+        db,
+        student_id=test_booking.student_id,
+        instructor_id=test_booking.instructor_id,
+        instructor_service_id=test_booking.instructor_service_id,
+        booking_date=start_utc.date(),
+        start_time=start_utc.time(),
+        end_time=(start_utc + timedelta(minutes=60)).time(),
+        status=BookingStatus.CONFIRMED,
+        duration_minutes=60,
+        service_name="Reminder Lesson",
+        hourly_rate=50.0,
+        total_price=50.0,
+        instructor_timezone="UTC",
+        booking_start_utc=start_utc,
+        booking_end_utc=start_utc + timedelta(minutes=60),
+        allow_overlap=True,
+    )
+
+
+@pytest.fixture
+def reminder_window(db, test_booking):
+    """Three due bookings inside a four-hour window and one just after it."""
+    window_start = (datetime.now(timezone.utc) + timedelta(days=5)).replace(
+        minute=0, second=0, microsecond=0
+    )
+    due = [
+        _create_confirmed_booking(db, test_booking, window_start + timedelta(hours=hour))
+        for hour in range(3)
+    ]
+    later = _create_confirmed_booking(db, test_booking, window_start + timedelta(hours=5))
+    db.commit()
+    return window_start, window_start + timedelta(hours=4), due, later
+
+
+@pytest.mark.integration
+def test_concurrent_claims_skip_locked_rows_and_flag_in_bulk(db, reminder_window) -> None:
+    window_start, window_end, due, later = reminder_window
+    first, second = TestSessionLocal(), TestSessionLocal()
+    try:
+        claimed_first = BookingRepository(first).claim_due_reminders(
+            "24h", window_start, window_end, 1
+        )
+        # The first transaction still holds its row lock; the second skips it instead of waiting.
+        claimed_second = BookingRepository(second).claim_due_reminders(
+            "24h", window_start, window_end, 10
+        )
+        assert [b.id for b in claimed_first] == [due[0].id]
+        assert [b.id for b in claimed_second] == [due[1].id, due[2].id]
+        first.commit()
+        second.commit()
+    finally:
+        first.close()
+        second.close()
+
+    db.expire_all()
+    assert all(db.get(Booking, b.id).reminder_24h_sent for b in due)
+    assert db.get(Booking, later.id).reminder_24h_sent is False
+    assert all(db.get(Booking, b.id).reminder_1h_sent is False for b in due)
+    assert BookingRepository(db).claim_due_reminders("24h", window_start, window_end, 10) == []
+
+
+@pytest.mark.integration
+def test_release_clears_only_released_claims(db, reminder_window) -> None:
+    window_start, window_end, due, _later = reminder_window
+    repo = BookingRepository(db)
+    repo.claim_due_reminders("24h", window_start, window_end, 10)
+    db.commit()
+
+    assert repo.release_reminder_claims("24h", [due[1].id]) == 1
+    assert repo.release_reminder_claims("24h", []) == 0
+    db.commit()
+
+    reclaimed = repo.claim_due_reminders("24h", window_start, window_end, 10)
+    assert [b.id for b in reclaimed] == [due[1].id]
+    db.commit()
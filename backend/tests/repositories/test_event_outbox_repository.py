@@ -6,7 +6,7 @@ Tests cover:
 - Event enqueueing with idempotency
 - Pending event fetching with locking
 - State transitions (mark_sent, mark_failed)
-- Batch operations (reset_failed)
+- Batch operations (reset_failed, claim_pending, mark_sent_many, mark_failed_many)
 - Dialect-specific behavior (PostgreSQL vs SQLite)
 """
 
@@ -16,7 +16,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from app.models.event_outbox import EventOutboxStatus
-from app.repositories.event_outbox_repository import EventOutboxRepository
+from app.repositories.event_outbox_repository import DeliveryFailure, EventOutboxRepository
 
 
 class TestEnqueue:
@@ -568,6 +568,47 @@ class TestResetFailed:
         assert event.next_attempt_at >= before_reset - timedelta(seconds=2)
 
 
+class TestBatchDelivery:
+    """Tests for batch claiming and bulk outcome updates."""
+
+    def test_claim_pending_leases_rows(self, db):
+        """Claimed rows are pushed past now so a second claim skips them."""
+        repo = EventOutboxRepository(db)
+        event = repo.enqueue(event_type="test_event", aggregate_id="agg-claim", payload={"a": 1})
+        db.flush()
+
+        claimed = repo.claim_pending(limit=10, lease_seconds=300)
+
+        assert [item.id for item in claimed] == [event.id]
+        assert claimed[0].payload == {"a": 1}
+        assert claimed[0].attempt_count == 0
+        assert repo.claim_pending(limit=10, lease_seconds=300) == []
+
+    def test_bulk_outcomes(self, db):
+        """mark_sent_many and mark_failed_many update every row in place."""
+        repo = EventOutboxRepository(db)
+        sent, retry, dead = (
+            repo.enqueue(event_type="test_event", aggregate_id=f"agg-bulk-{i}") for i in range(3)
+        )
+        db.flush()
+
+        assert repo.mark_sent_many([sent.id]) == 1
+        repo.mark_failed_many(
+            [
+                DeliveryFailure(retry.id, 1, 30, "transient", False),
+                DeliveryFailure(dead.id, 5, 7200, "x" * 2000, True),
+            ]
+        )
+        for row in (sent, retry, dead):
+            db.refresh(row)
+
+        assert (sent.status, sent.attempt_count) == (EventOutboxStatus.SENT.value, 1)
+        assert (retry.status, retry.attempt_count) == (EventOutboxStatus.PENDING.value, 1)
+        assert retry.last_error == "transient"
+        assert dead.status == EventOutboxStatus.FAILED.value
+        assert len(dead.last_error) == 1000
+
+
 class TestDialectHandling:
     """Tests for dialect-specific behavior."""
 
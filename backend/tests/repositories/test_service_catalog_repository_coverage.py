@@ -159,7 +159,9 @@ def test_active_services_with_categories_and_counts(db, test_instructor):
     assert empty_bulk == {}
 
 
-def test_count_active_instructors_bulk_excludes_non_live_instructors(db, test_instructor, sample_catalog_services):
+def test_count_active_instructors_bulk_excludes_non_live_instructors(
+    db, test_instructor, sample_catalog_services
+):
     repo = ServiceCatalogRepository(db)
     test_instructor.instructor_profile.is_live = False
 
@@ -231,6 +233,23 @@ def test_update_service_embedding_success_and_failure(db, sample_catalog_service
     )
 
 
+def test_list_embedding_rows_full_and_incremental(db, sample_catalog_services):
+    service, other = sample_catalog_services[0], sample_catalog_services[1]
+    repo = ServiceCatalogRepository(db)
+    repo.update_service_embedding(service.id, _vector(1536, 0.02), "model_test", "hash")
+    other.is_active = False
+    db.flush()
+
+    full = {row[0]: row for row in repo.list_embedding_rows()}
+    assert service.id in full and other.id not in full
+    assert all(active and embedding is not None for _, embedding, active, _ in full.values())
+
+    since = datetime.now(timezone.utc) - timedelta(minutes=1)
+    changed = {row[0]: row for row in repo.list_embedding_rows(updated_since=since)}
+    assert changed[other.id][2] is False
+    assert changed[service.id][2] is True
+
+
 def test_services_available_for_kids_minimal(db, test_instructor, monkeypatch):
     repo = ServiceCatalogRepository(db)
 
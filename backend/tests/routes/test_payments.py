@@ -1468,15 +1468,17 @@ class TestSetupIntentEndpoints:
 class TestEarningsExport:
     """Tests for earnings export endpoint."""
 
-    @patch("app.services.stripe_service.StripeService.generate_earnings_csv")
+    @patch("app.services.stripe_service.StripeService.stream_earnings_csv")
     def test_export_returns_csv(
         self,
         mock_export,
         client: TestClient,
         auth_headers_instructor: Dict[str, str],
     ):
-        mock_export.return_value = (
-            "Date,Student,Service,Duration (min),Lesson Price,Platform Fee,Net Earnings,Status,Payment ID\n"
+        mock_export.return_value = iter(
+            [
+                "Date,Student,Service,Duration (min),Lesson Price,Platform Fee,Net Earnings,Status,Payment ID\n"
+            ]
         )
 
         response = client.post(
@@ -1490,14 +1492,14 @@ class TestEarningsExport:
         assert "attachment" in response.headers["content-disposition"]
         assert response.text.startswith("Date,Student,Service")
 
-    @patch("app.services.stripe_service.StripeService.generate_earnings_pdf")
+    @patch("app.services.stripe_service.StripeService.stream_earnings_pdf")
     def test_export_returns_pdf(
         self,
         mock_export,
         client: TestClient,
         auth_headers_instructor: Dict[str, str],
     ):
-        mock_export.return_value = b"%PDF-1.4\n%EOF"
+        mock_export.return_value = iter([b"%PDF-1.4\n", b"%EOF"])
 
         response = client.post(
             "/api/v1/payments/earnings/export",
@@ -1521,14 +1523,14 @@ class TestEarningsExport:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    @patch("app.services.stripe_service.StripeService.generate_earnings_csv")
+    @patch("app.services.stripe_service.StripeService.stream_earnings_csv")
     def test_export_with_date_range(
         self,
         mock_export,
         client: TestClient,
         auth_headers_instructor: Dict[str, str],
     ):
-        mock_export.return_value = "Date,Student,Service\n"
+        mock_export.return_value = iter(["Date,Student,Service\n"])
 
         response = client.post(
             "/api/v1/payments/earnings/export",
@@ -1541,8 +1543,8 @@ class TestEarningsExport:
         assert kwargs["start_date"] == date(2025, 1, 1)
         assert kwargs["end_date"] == date(2025, 1, 31)
 
-    @patch("app.services.stripe_service.StripeService.generate_earnings_pdf")
-    @patch("app.services.stripe_service.StripeService.generate_earnings_csv")
+    @patch("app.services.stripe_service.StripeService.stream_earnings_pdf")
+    @patch("app.services.stripe_service.StripeService.stream_earnings_csv")
     def test_export_rejects_inverted_date_range(
         self,
         mock_csv_export,
@@ -1561,15 +1563,17 @@ class TestEarningsExport:
         mock_csv_export.assert_not_called()
         mock_pdf_export.assert_not_called()
 
-    @patch("app.services.stripe_service.StripeService.generate_earnings_csv")
+    @patch("app.services.stripe_service.StripeService.stream_earnings_csv")
     def test_export_csv_has_correct_columns(
         self,
         mock_export,
         client: TestClient,
         auth_headers_instructor: Dict[str, str],
     ):
-        mock_export.return_value = (
-            "Date,Student,Service,Duration (min),Lesson Price,Platform Fee,Net Earnings,Status,Payment ID\n"
+        mock_export.return_value = iter(
+            [
+                "Date,Student,Service,Duration (min),Lesson Price,Platform Fee,Net Earnings,Status,Payment ID\n"
+            ]
         )
 
         response = client.post(
@@ -1586,15 +1590,17 @@ class TestEarningsExport:
         assert "Platform Fee" in first_line
         assert "Net Earnings" in first_line
 
-    @patch("app.services.stripe_service.StripeService.generate_earnings_csv")
+    @patch("app.services.stripe_service.StripeService.stream_earnings_csv")
     def test_export_empty_when_no_earnings(
         self,
         mock_export,
         client: TestClient,
         auth_headers_instructor: Dict[str, str],
     ):
-        mock_export.return_value = (
-            "Date,Student,Service,Duration (min),Lesson Price,Platform Fee,Net Earnings,Status,Payment ID\n"
+        mock_export.return_value = iter(
+            [
+                "Date,Student,Service,Duration (min),Lesson Price,Platform Fee,Net Earnings,Status,Payment ID\n"
+            ]
         )
 
         response = client.post(
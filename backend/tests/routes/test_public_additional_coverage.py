@@ -286,11 +286,11 @@ async def test_public_availability_cache_key_varies_by_location_type(monkeypatch
     seen_keys: list[str] = []
 
     class DummyCache:
-        async def get(self, key: str):
+        async def get_versioned(self, key: str, _scope: str):
             seen_keys.append(key)
             return None
 
-        async def set(self, key: str, _value, ttl: int):
+        async def set_versioned(self, key: str, _scope: str, _value, ttl: int):
             seen_keys.append(f"set:{key}:{ttl}")
 
     monkeypatch.setattr(
@@ -708,7 +708,7 @@ async def test_public_availability_cache_hit_etag_304(monkeypatch):
     )
 
     class DummyCache:
-        async def get(self, _key: str):
+        async def get_versioned(self, _key: str, _scope: str):
             return cached.model_dump(exclude_none=True)
 
     request = _make_request()
@@ -800,7 +800,7 @@ async def test_public_availability_cache_hit_applies_live_overnight_filter(monke
     )
 
     class DummyCache:
-        async def get(self, _key: str):
+        async def get_versioned(self, _key: str, _scope: str):
             return cached.model_dump(exclude_none=True)
 
     monkeypatch.setattr(
@@ -915,6 +915,109 @@ async def test_public_availability_etag_on_cache_miss(monkeypatch):
     assert result.status_code == 304
 
 
+def test_etag_matches_lists_weak_and_wildcard():
+    etag = '"abc"'
+    assert public_routes._etag_matches(_make_request({"If-None-Match": '"x", W/"abc"'}), etag)
+    assert public_routes._etag_matches(_make_request({"If-None-Match": "*"}), etag)
+    assert not public_routes._etag_matches(_make_request({"If-None-Match": '"abcd"'}), etag)
+    assert not public_routes._etag_matches(_make_request(), etag)
+
+
+@pytest.mark.asyncio
+async def test_public_availability_version_etag_short_circuits_before_compute(monkeypatch):
+    user = SimpleNamespace(
+        id="instructor-3",
+        first_name="Test",
+        last_name="Teacher",
+        timezone="America/New_York",
+    )
+
+    class DummyInstructorService:
+        def get_instructor_user(self, _instructor_id: str):
+            return user
+
+    class VersionedAvailabilityService:
+        db = None
+
+        def __init__(self) -> None:
+            self.computed = 0
+            self.versions = 0
+
+        def compute_range_version(self, _instructor_id, _start, _end):
+            self.versions += 1
+            return "bitmaps-v1"
+
+        def get_blackout_dates(self, *_args, **_kwargs):
+            return []
+
+        def compute_public_availability(self, *_args, **_kwargs):
+            self.computed += 1
+            return {}
+
+    class GenerationCache:
+        def __init__(self) -> None:
+            self.generation = 3
+            self.entries = {}
+
+        async def get_generation(self, _scope: str):
+            return self.generation
+
+        async def get_versioned(self, key: str, _scope: str):
+            generation, value = self.entries.get(key, (None, None))
+            return value if generation == self.generation else None
+
+        async def set_versioned(self, key: str, _scope: str, value, ttl: int):
+            self.entries[key] = (self.generation, value)
+            return True
+
+    monkeypatch.setattr(public_routes.settings, "public_availability_detail_level", "minimal")
+    monkeypatch.setattr(
+        ConfigService,
+        "get_booking_rules_config",
+        lambda self: (deepcopy(DEFAULT_BOOKING_RULES_CONFIG), None),
+    )
+    monkeypatch.setattr(
+        public_routes.ConfigService,
+        "get_advance_notice_minutes",
+        lambda self, location_type=None: 0,
+    )
+    service = VersionedAvailabilityService()
+    cache = GenerationCache()
+    start_date = date.today() + timedelta(days=1)
+
+    async def call(headers=None):
+        response = Response()
+        result = await public_routes.get_instructor_public_availability(
+            instructor_id=user.id,
+            request=_make_request(headers),
+            response_obj=response,
+            start_date=start_date,
+            end_date=start_date,
+            availability_service=service,
+            conflict_checker=SimpleNamespace(),
+            instructor_service=DummyInstructorService(),
+            cache_service=cache,
+            db=None,
+        )
+        return result, response
+
+    _result, response = await call()
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and service.computed == 1
+
+    # The cached payload carries its input version: no version read, no compute.
+    result, _response = await call({"If-None-Match": etag})
+    assert result.status_code == 304
+    assert result.headers["ETag"] == etag
+    assert (service.computed, service.versions) == (1, 1)
+
+    # A booking (or any availability invalidation) bumps the generation.
+    cache.generation += 1
+    _result, response = await call({"If-None-Match": etag})
+    assert response.headers["ETag"] != etag
+    assert (service.computed, service.versions) == (2, 2)
+
+
 @pytest.mark.asyncio
 async def test_send_referral_invites_validation_and_partial_failure(monkeypatch):
     class StubEmailService:
@@ -1111,43 +1214,39 @@ async def test_next_available_slot_found_and_not_found(monkeypatch):
         def get_instructor_user(self, _instructor_id: str):
             return user
 
-    class DummyConflictChecker:
-        def check_blackout_date(self, _instructor_id: str, _date_value: date):
-            return False
-
     class DummyAvailabilityService:
-        def compute_public_availability(self, *_args, **_kwargs):
-            return {
-                date.today().isoformat(): [
-                    (time(9, 0), time(11, 0)),
-                ]
-            }
+        def find_next_bookable_slot(self, *_args, **_kwargs):
+            return date.today(), time(9, 0)
 
     response = Response()
     result = await public_routes.get_next_available_slot(
+        request=_make_request(),
         instructor_id=user.id,
         response_obj=response,
         duration_minutes=30,
         availability_service=DummyAvailabilityService(),
-        conflict_checker=DummyConflictChecker(),
         instructor_service=DummyInstructorService(),
+        cache_service=None,
         db=None,
     )
     assert result.found is True
+    assert result.start_time == "09:00:00"
+    assert result.end_time == "09:30:00"
     assert response.headers.get("Cache-Control") == "public, max-age=120"
 
     class EmptyAvailabilityService:
-        def compute_public_availability(self, *_args, **_kwargs):
-            return {}
+        def find_next_bookable_slot(self, *_args, **_kwargs):
+            return None
 
     response = Response()
     result = await public_routes.get_next_available_slot(
+        request=_make_request(),
         instructor_id=user.id,
         response_obj=response,
         duration_minutes=30,
         availability_service=EmptyAvailabilityService(),
-        conflict_checker=DummyConflictChecker(),
         instructor_service=DummyInstructorService(),
+        cache_service=None,
         db=None,
     )
     assert result.found is False
@@ -1155,9 +1254,9 @@ async def test_next_available_slot_found_and_not_found(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_next_available_slot_skips_blackout_day(monkeypatch):
+async def test_next_available_slot_polls_are_answered_from_versioned_cache(monkeypatch):
     user = SimpleNamespace(
-        id="instructor-blackout",
+        id="instructor-poll",
         first_name="Test",
         last_name="Teacher",
         timezone="America/New_York",
@@ -1167,31 +1266,76 @@ async def test_next_available_slot_skips_blackout_day(monkeypatch):
         def get_instructor_user(self, _instructor_id: str):
             return user
 
-    class DummyConflictChecker:
+    class CountingAvailabilityService:
+        db = None
+
         def __init__(self) -> None:
-            self.calls = 0
+            self.scans = 0
+            self.versions = 0
 
-        def check_blackout_date(self, _instructor_id: str, _date_value: date):
-            self.calls += 1
-            return self.calls == 1
+        def compute_range_version(self, _instructor_id, _start, _end):
+            self.versions += 1
+            return "bitmaps-v1"
 
-    class DummyAvailabilityService:
-        def compute_public_availability(self, _instructor_id: str, start: date, _end: date):
-            return {start.isoformat(): [(time(10, 0), time(11, 30))]}
+        def find_next_bookable_slot(self, *_args, **_kwargs):
+            self.scans += 1
+            return date.today() + timedelta(days=1), time(9, 0)
 
-    response = Response()
-    result = await public_routes.get_next_available_slot(
-        instructor_id=user.id,
-        response_obj=response,
-        duration_minutes=60,
-        availability_service=DummyAvailabilityService(),
-        conflict_checker=DummyConflictChecker(),
-        instructor_service=DummyInstructorService(),
-        db=None,
+    class GenerationCache:
+        def __init__(self) -> None:
+            self.generation = 1
+            self.entries = {}
+
+        async def get_generation(self, _scope: str):
+            return self.generation
+
+        async def get_versioned(self, key: str, _scope: str):
+            generation, value = self.entries.get(key, (None, None))
+            return value if generation == self.generation else None
+
+        async def set_versioned(self, key: str, _scope: str, value, ttl: int):
+            self.entries[key] = (self.generation, value)
+            return True
+
+    monkeypatch.setattr(
+        ConfigService,
+        "get_booking_rules_config",
+        lambda self: (deepcopy(DEFAULT_BOOKING_RULES_CONFIG), None),
     )
+    service = CountingAvailabilityService()
+    cache = GenerationCache()
 
-    assert result.found is True
-    assert response.headers.get("Cache-Control") == "public, max-age=120"
+    async def call(headers=None):
+        response = Response()
+        result = await public_routes.get_next_available_slot(
+            request=_make_request(headers),
+            instructor_id=user.id,
+            response_obj=response,
+            duration_minutes=60,
+            availability_service=service,
+            instructor_service=DummyInstructorService(),
+            cache_service=cache,
+            db=None,
+        )
+        return result, response
+
+    result, response = await call()
+    etag = response.headers["ETag"]
+    assert result.found is True and (service.scans, service.versions) == (1, 1)
+
+    # Conditional and unconditional polls read neither the range version nor scan.
+    result, _response = await call({"If-None-Match": etag})
+    assert result.status_code == 304 and result.headers["ETag"] == etag
+    result, response = await call()
+    assert result.start_time == "09:00:00" and response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "public, max-age=120"
+    assert (service.scans, service.versions) == (1, 1)
+
+    # Availability or booking changes bump the generation and force a rescan.
+    cache.generation += 1
+    _result, response = await call({"If-None-Match": etag})
+    assert response.headers["ETag"] != etag
+    assert (service.scans, service.versions) == (2, 2)
 
 
 @pytest.mark.asyncio
@@ -1200,22 +1344,19 @@ async def test_next_available_slot_instructor_not_found():
         def get_instructor_user(self, _instructor_id: str):
             raise RuntimeError("missing")
 
-    class DummyConflictChecker:
-        def check_blackout_date(self, _instructor_id: str, _date_value: date):
-            return False
-
     class DummyAvailabilityService:
-        def compute_public_availability(self, *_args, **_kwargs):
-            return {}
+        def find_next_bookable_slot(self, *_args, **_kwargs):
+            return None
 
     with pytest.raises(HTTPException) as exc:
         await public_routes.get_next_available_slot(
+            request=_make_request(),
             instructor_id="missing",
             response_obj=Response(),
             duration_minutes=30,
             availability_service=DummyAvailabilityService(),
-            conflict_checker=DummyConflictChecker(),
             instructor_service=DummyInstructorService(),
+            cache_service=None,
             db=None,
         )
     assert exc.value.status_code == 404
@@ -168,10 +168,10 @@ async def test_availability_full_cache_write_fails_gracefully(monkeypatch):
             }
 
     class FailingCache:
-        async def get(self, _key: str):
+        async def get_versioned(self, _key: str, _scope: str):
             return None
 
-        async def set(self, _key: str, _data, ttl=None):
+        async def set_versioned(self, _key: str, _scope: str, _data, ttl=None):
             raise RuntimeError("cache write failed")
 
     monkeypatch.setattr(public_routes.settings, "public_availability_detail_level", "full")
@@ -209,29 +209,33 @@ async def test_next_available_slot_skip_short_duration(monkeypatch):
         def get_instructor_user(self, _id: str):
             return user
 
-    class DummyConflictChecker:
-        def check_blackout_date(self, _id: str, _d: date):
-            return False
-
     class DummyAvailabilityService:
-        def compute_public_availability(self, *_args, **_kwargs):
-            # Only 30-min slot, request 60
-            return {
-                date.today().isoformat(): [(time(9, 0), time(9, 30))],
-            }
+        def __init__(self) -> None:
+            self.calls = []
+
+        def find_next_bookable_slot(self, instructor_id, start, end, duration):
+            # Only a 30-min window exists, so a 60-min search finds nothing
+            self.calls.append((instructor_id, start, end, duration))
+            return None
 
     monkeypatch.setattr(public_routes.settings, "public_availability_days", 1)
 
+    availability_service = DummyAvailabilityService()
     response = Response()
     result = await public_routes.get_next_available_slot(
+        request=_make_request(),
         instructor_id=user.id,
         response_obj=response,
         duration_minutes=60,
-        availability_service=DummyAvailabilityService(),
-        conflict_checker=DummyConflictChecker(),
+        availability_service=availability_service,
         instructor_service=DummyInstructorService(),
+        cache_service=None,
         db=None,
     )
+    assert len(availability_service.calls) == 1
+    _, start, end, duration = availability_service.calls[0]
+    assert start == end
+    assert duration == 60
     assert result.found is False
 
 
@@ -261,7 +265,7 @@ async def test_availability_cache_read_error_falls_through(monkeypatch):
             return {}
 
     class FailingCache:
-        async def get(self, _key: str):
+        async def get_versioned(self, _key: str, _scope: str):
             raise RuntimeError("cache read failed")
 
     monkeypatch.setattr(public_routes.settings, "public_availability_detail_level", "minimal")
@@ -41,6 +41,10 @@ class _StubAssetService:
         if object_key == "boom":
             raise ValueError("boom")
 
+    def submit_profile_picture(self, user, object_key):
+        self.finalize_profile_picture(user, object_key)
+        return "processed"
+
 
 @pytest.fixture
 def asset_service_override(client):
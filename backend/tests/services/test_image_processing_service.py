@@ -4,6 +4,7 @@ from PIL import Image
 import pytest
 
 from app.services.image_processing_service import (
+    MAX_ORIGINAL_EDGE,
     MAX_PROFILE_PHOTO_BYTES,
     ImageProcessingService,
 )
@@ -65,3 +66,31 @@ def test_process_profile_picture_applies_exif_orientation_before_encoding():
 
     with Image.open(io.BytesIO(out.original)) as normalized:
         assert normalized.size == (100, 200)
+
+
+def test_large_jpeg_is_draft_decoded_and_capped():
+    svc = ImageProcessingService(extra_formats=["webp", "avif", "gif"])
+    data = _make_img_bytes(mode="RGB", size=(4400, 3000), color=(0, 128, 255), fmt="JPEG")
+
+    out = svc.process_profile_picture(uploaded_bytes=data, browser_content_type="image/jpeg")
+
+    with Image.open(io.BytesIO(out.original)) as original:
+        assert original.size == (MAX_ORIGINAL_EDGE, 1396)
+    with Image.open(io.BytesIO(out.display_400)) as display:
+        assert display.size == (400, 400)
+    with Image.open(io.BytesIO(out.thumb_200)) as thumb:
+        assert thumb.size == (200, 200)
+    assert set(out.extra_formats) == {"webp", "avif"}  # unknown formats are ignored
+    with Image.open(io.BytesIO(out.extra_formats["webp"]["thumb"])) as webp_thumb:
+        assert (webp_thumb.format, webp_thumb.size) == ("WEBP", (200, 200))
+
+
+def test_transparent_png_is_flattened_to_white():
+    svc = ImageProcessingService()
+    data = _make_img_bytes(mode="RGBA", size=(300, 300), color=(0, 0, 0, 0))
+
+    out = svc.process_profile_picture(uploaded_bytes=data, browser_content_type="image/png")
+
+    assert out.extra_formats == {}
+    with Image.open(io.BytesIO(out.display_400)) as display:
+        assert all(channel > 245 for channel in display.getpixel((200, 200)))
@@ -534,3 +534,103 @@ def test_get_profile_picture_urls_batch_normalizes(monkeypatch):
     assert "user7" in result
     assert result["user7"] is not None
     assert result["user8"] is None
+
+
+class _RecordingStorage:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.uploads: dict[str, str] = {}
+        self.deleted: list[str] = []
+
+    def download_bytes(self, key):
+        return self.data
+
+    def upload_bytes(self, key, content, ct):
+        self.uploads[key] = ct
+        return True, 200
+
+    def delete_object(self, key):
+        self.deleted.append(key)
+        return True
+
+
+def test_finalize_profile_picture_stores_extra_formats_and_content_hash(monkeypatch):
+    import hashlib
+
+    from app.services import personal_asset_service as module
+    from app.services.image_processing_service import ImageProcessingService
+
+    monkeypatch.setattr(module, "invalidate_cached_user_by_id_sync", lambda *args: True)
+    data = _png_bytes()
+    storage = _RecordingStorage(data)
+    users = MagicMock()
+    service = PersonalAssetService(
+        db=MagicMock(),
+        storage=storage,
+        images=ImageProcessingService(extra_formats=["webp"]),
+        users_repo=users,
+        cache_service=None,
+    )
+    user = SimpleNamespace(id="user-hash", profile_picture_version=1, profile_picture_hash="old")
+
+    assert service.finalize_profile_picture(user, "uploads/profile_picture/x.png") is True
+
+    prefix = "private/personal-assets/profile-pictures/user-hash/v2"
+    assert storage.uploads == {
+        f"{prefix}/original.jpg": "image/jpeg",
+        f"{prefix}/display_400x400.jpg": "image/jpeg",
+        f"{prefix}/thumb_200x200.jpg": "image/jpeg",
+        f"{prefix}/display_400x400.webp": "image/webp",
+        f"{prefix}/thumb_200x200.webp": "image/webp",
+    }
+    kwargs = users.update_profile.call_args.kwargs
+    assert kwargs["profile_picture_hash"] == hashlib.sha256(data).hexdigest()
+    assert kwargs["profile_picture_version"] == 2
+
+
+def test_finalize_profile_picture_skips_unchanged_upload():
+    import hashlib
+
+    data = _png_bytes()
+    storage = _RecordingStorage(data)
+    images = MagicMock()
+    users = MagicMock()
+    service = PersonalAssetService(
+        db=MagicMock(), storage=storage, images=images, users_repo=users, cache_service=None
+    )
+    user = SimpleNamespace(
+        id="user-same",
+        profile_picture_version=3,
+        profile_picture_hash=hashlib.sha256(data).hexdigest(),
+    )
+
+    assert service.finalize_profile_picture(user, "uploads/profile_picture/x.png") is True
+    images.process_profile_picture.assert_not_called()
+    users.update_profile.assert_not_called()
+    assert storage.uploads == {}
+    assert storage.deleted == ["uploads/profile_picture/x.png"]
+
+
+def test_submit_profile_picture_queues_when_async_enabled(monkeypatch):
+    from app.services import personal_asset_service as module
+    from app.tasks import enqueue
+
+    queued: list[tuple[str, tuple]] = []
+    monkeypatch.setattr(module.settings, "profile_picture_async_processing_enabled", True)
+    monkeypatch.setattr(
+        enqueue, "enqueue_task", lambda name, args=None, **kw: queued.append((name, args))
+    )
+    images = MagicMock()
+    service = PersonalAssetService(
+        db=MagicMock(), storage=MagicMock(), images=images, cache_service=None
+    )
+    user = SimpleNamespace(id="user-async", profile_picture_version=0)
+
+    assert service.submit_profile_picture(user, "uploads/profile_picture/x.png") == "queued"
+    assert queued == [
+        (
+            "app.tasks.image_tasks.process_profile_picture",
+            ("user-async", "uploads/profile_picture/x.png"),
+        )
+    ]
+    images.process_profile_picture.assert_not_called()
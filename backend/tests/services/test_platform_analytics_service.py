@@ -15,6 +15,7 @@ from app.models.search_event import SearchEvent
 from app.models.search_interaction import SearchInteraction
 from app.models.service_catalog import InstructorService, ServiceCatalog
 from app.repositories.analytics_repository import CategoryBookingRow
+from app.repositories.cohort_analytics_repository import CohortActivityCounts
 from app.schemas.admin_analytics import (
     Alert,
     AlertCategory,
@@ -51,7 +52,9 @@ from app.services.platform_analytics_service import (
     _resolve_comparison_period,
     _resolve_period,
     _safe_div,
+    _shift_period,
     _sort_category_metrics,
+    _start_of_period,
     _week_label,
 )
 from app.utils.bitset import new_empty_bits
@@ -440,6 +443,43 @@ def test_cohort_retention_student_and_instructor(db, test_student, test_instruct
     assert instructor_retention.cohorts
 
 
+def test_cohort_retention_folds_grouped_counts_into_matrix(monkeypatch, db):
+    service = _service(db)
+    current = _start_of_period(datetime.now(timezone.utc), CohortPeriod.WEEK)
+    previous = _shift_period(current, CohortPeriod.WEEK, -1)
+    calls = []
+
+    def _counts(**kwargs):
+        calls.append(kwargs)
+        return CohortActivityCounts(
+            cohort_sizes={previous: 4, current: 2},
+            active_users={(previous, previous): 4, (previous, current): 1, (current, current): 1},
+        )
+
+    monkeypatch.setattr(service.cohort_repo, "cohort_activity_counts", _counts)
+
+    result = service.cohort_retention(
+        user_type=CohortUserType.STUDENT,
+        cohort_period=CohortPeriod.WEEK,
+        periods_back=2,
+        metric=CohortMetric.ACTIVE,
+    )
+
+    assert calls == [
+        {
+            "role_name": "student",
+            "unit": "week",
+            "start": previous,
+            "end": _shift_period(current, CohortPeriod.WEEK, 1),
+            "activity_end": _shift_period(current, CohortPeriod.WEEK, 2),
+        }
+    ]
+    assert [(c.cohort_size, c.retention) for c in result.cohorts] == [
+        (2, [Decimal("50.00"), Decimal("0.00")]),
+        (4, [Decimal("100.00"), Decimal("25.00")]),
+    ]
+
+
 @pytest.mark.usefixtures("catalog_data")
 def test_platform_alerts_filters(db, test_student, test_instructor):
     service = _service(db)
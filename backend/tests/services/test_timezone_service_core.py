@@ -82,6 +82,15 @@ class TestLocalToUtc:
         assert result.hour == 16
 
 
+class TestUtcDayStart:
+    """Test UTC day boundaries for UTC-bucketed aggregates."""
+
+    def test_midnight_utc(self):
+        result = TimezoneService.utc_day_start(date(2025, 3, 9))
+        assert result == datetime(2025, 3, 9, tzinfo=timezone.utc)
+        assert result.utcoffset() == timedelta(0)
+
+
 class TestUtcToLocal:
     """Test utc_to_local conversion."""
 
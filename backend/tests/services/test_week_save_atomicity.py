@@ -14,7 +14,7 @@ from tests.utils.availability_builders import (
 )
 
 import app.main
-from app.middleware.perf_counters import PerfCounterMiddleware
+from app.middleware.request_pipeline import RequestPipelineMiddleware
 
 # AvailabilitySlot model removed - bitmap-only storage now
 from app.models.availability_day import AvailabilityDay
@@ -34,8 +34,11 @@ def perf_client():
     try:
         reload(app.main)
         app_instance = app.main.fastapi_app
-        if PerfCounterMiddleware not in {mw.cls for mw in app_instance.user_middleware}:
-            app_instance.add_middleware(PerfCounterMiddleware)
+        if not any(
+            mw.cls is RequestPipelineMiddleware and mw.kwargs.get("perf_counters")
+            for mw in app_instance.user_middleware
+        ):
+            app_instance.add_middleware(RequestPipelineMiddleware, perf_counters=True)
         client = TestClient(app_instance, raise_server_exceptions=False)
         try:
             yield client
@@ -9,74 +9,13 @@ import pytest
 
 import app.core.middleware_setup as middleware_module
 from app.core.middleware_setup import (
-    EnsureCorsOnErrorMiddleware,
     SSEAwareGZipMiddleware,
     _compute_allowed_origins,
     _log_bgc_config_summary,
     _resolve_origin_regex,
-    add_site_headers,
-    attach_identity,
     register_middleware,
 )
-
-# ---------------------------------------------------------------------------
-# add_site_headers
-# ---------------------------------------------------------------------------
-
-
-class TestAddSiteHeaders:
-    @pytest.mark.asyncio
-    async def test_sets_headers(self) -> None:
-        request = MagicMock()
-        response = MagicMock()
-        response.headers = {}
-        call_next = AsyncMock(return_value=response)
-
-        with patch.dict(os.environ, {"SITE_MODE": "beta"}):
-            result = await add_site_headers(request, call_next)
-
-        assert result.headers["X-Site-Mode"] == "beta"
-        assert "X-Phase" in result.headers
-
-    @pytest.mark.asyncio
-    async def test_exception_caught(self) -> None:
-        request = MagicMock()
-        response = MagicMock()
-        response.headers = property(lambda self: (_ for _ in ()).throw(Exception("boom")))
-        call_next = AsyncMock(return_value=response)
-
-        result = await add_site_headers(request, call_next)
-        assert result is response
-
-
-# ---------------------------------------------------------------------------
-# attach_identity
-# ---------------------------------------------------------------------------
-
-
-class TestAttachIdentity:
-    @pytest.mark.asyncio
-    async def test_success(self) -> None:
-        request = MagicMock()
-        request.state = MagicMock()
-        call_next = AsyncMock(return_value=MagicMock())
-
-        with patch("app.core.middleware_setup.resolve_identity", return_value="user:123"):
-            await attach_identity(request, call_next)
-
-        assert request.state.rate_identity == "user:123"
-
-    @pytest.mark.asyncio
-    async def test_exception_falls_back(self) -> None:
-        request = MagicMock()
-        request.state = MagicMock()
-        call_next = AsyncMock(return_value=MagicMock())
-
-        with patch("app.core.middleware_setup.resolve_identity", side_effect=Exception("fail")):
-            await attach_identity(request, call_next)
-
-        assert request.state.rate_identity == "ip:unknown"
-
+from app.middleware.request_pipeline import RequestPipelineMiddleware
 
 # ---------------------------------------------------------------------------
 # _compute_allowed_origins
@@ -155,13 +94,13 @@ class TestResolveOriginRegex:
 
 
 # ---------------------------------------------------------------------------
-# EnsureCorsOnErrorMiddleware
+# RequestPipelineMiddleware CORS backfill allowlist
 # ---------------------------------------------------------------------------
 
 
-class TestEnsureCorsOnErrorMiddleware:
+class TestRequestPipelineOriginAllowed:
     def test_origin_in_allowlist(self) -> None:
-        mw = EnsureCorsOnErrorMiddleware(
+        mw = RequestPipelineMiddleware(
             MagicMock(), allowed_origins=["https://example.com"], origin_regex=None,
         )
         assert mw._origin_allowed("https://example.com") is True
@@ -169,7 +108,7 @@ class TestEnsureCorsOnErrorMiddleware:
         assert mw._origin_allowed(None) is False
 
     def test_origin_matches_regex(self) -> None:
-        mw = EnsureCorsOnErrorMiddleware(
+        mw = RequestPipelineMiddleware(
             MagicMock(), allowed_origins=[], origin_regex=r"https://.*\.example\.com",
         )
         assert mw._origin_allowed("https://sub.example.com") is True
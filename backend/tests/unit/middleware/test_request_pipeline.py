@@ -0,0 +1,193 @@
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.constants import SSE_PATH_PREFIX
+from app.core.middleware_setup import register_middleware
+from app.middleware import perf_counters, request_pipeline
+from app.middleware.request_pipeline import RequestPipelineMiddleware, endpoint_label
+
+
+async def _run_app(app, scope):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+def _scope(path="/api/v1/bookings/123", headers=None):
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": headers or [],
+        "client": ("10.0.0.5", 1234),
+    }
+
+
+def _endpoint(seen, headers=None):
+    async def app(scope, receive, send):
+        seen.update(scope.get("state", {}))
+        perf_counters.inc_db_query("SELECT 1 FROM availability_slots")
+        await send({"type": "http.response.start", "status": 200, "headers": headers or []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(request_pipeline, "prometheus_metrics", mock)
+    return mock
+
+
+def test_endpoint_label_strips_numeric_ids():
+    assert endpoint_label("/api/v1/bookings/123/notes/7") == "/api/v1/bookings/:id/notes/:id"
+    assert endpoint_label("/api/v1/bookings/abc") == "/api/v1/bookings/abc"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_sets_identity_site_headers_and_metrics(monkeypatch, metrics):
+    monkeypatch.setenv("SITE_MODE", "Preview")
+    seen = {}
+    middleware = RequestPipelineMiddleware(
+        _endpoint(seen, headers=[(b"x-beta-phase", b"open_beta ")])
+    )
+
+    messages = await _run_app(middleware, _scope())
+
+    headers = dict(messages[0]["headers"])
+    assert seen["rate_identity"] == "ip:10.0.0.5"
+    assert headers[b"x-site-mode"] == b"preview"
+    assert headers[b"x-phase"] == b"open_beta"
+    assert b"x-db-query-count" not in headers
+    assert messages[1]["body"] == b"ok"
+    metrics.track_http_request_start.assert_called_once_with("GET", "/api/v1/bookings/:id")
+    metrics.track_http_request_end.assert_called_once_with("GET", "/api/v1/bookings/:id")
+    call = metrics.record_http_request.call_args.kwargs
+    assert (call["endpoint"], call["status_code"]) == ("/api/v1/bookings/:id", 200)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_falls_back_to_unknown_identity(monkeypatch, metrics):
+    def _fail(request):
+        raise RuntimeError("no client")
+
+    monkeypatch.setattr(request_pipeline, "resolve_identity", _fail)
+    monkeypatch.delenv("SITE_MODE", raising=False)
+    seen = {}
+
+    messages = await _run_app(RequestPipelineMiddleware(_endpoint(seen)), _scope())
+
+    headers = dict(messages[0]["headers"])
+    assert seen["rate_identity"] == "ip:unknown"
+    assert headers[b"x-site-mode"] == b"unset"
+    assert headers[b"x-phase"] == b"beta"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_backfills_cors_only_for_allowed_origins(metrics):
+    middleware = RequestPipelineMiddleware(
+        _endpoint({}),
+        allowed_origins=["https://app.example.com"],
+        origin_regex=r"^https://preview-\d+\.example\.com$",
+    )
+
+    for origin, expected in (
+        (b"https://app.example.com", b"https://app.example.com"),
+        (b"https://preview-42.example.com", b"https://preview-42.example.com"),
+        (b"https://evil.example.com", None),
+    ):
+        messages = await _run_app(middleware, _scope(headers=[(b"origin", origin)]))
+        headers = dict(messages[0]["headers"])
+        assert headers.get(b"access-control-allow-origin") == expected
+        if expected:
+            assert headers[b"access-control-allow-credentials"] == b"true"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_existing_cors_header(metrics):
+    middleware = RequestPipelineMiddleware(
+        _endpoint({}, headers=[(b"access-control-allow-origin", b"https://other")]),
+        allowed_origins=["https://app.example.com"],
+    )
+
+    messages = await _run_app(middleware, _scope(headers=[(b"origin", b"https://app.example.com")]))
+
+    headers = messages[0]["headers"]
+    assert headers.count((b"access-control-allow-origin", b"https://other")) == 1
+    assert b"access-control-allow-credentials" not in dict(headers)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_adds_perf_counter_headers(monkeypatch, metrics):
+    monkeypatch.setenv("AVAILABILITY_PERF_DEBUG", "1")
+    seen = {}
+    middleware = RequestPipelineMiddleware(_endpoint(seen), perf_counters=True)
+    scope = _scope(headers=[(b"x-debug-sql", b"true")])
+
+    messages = await _run_app(middleware, scope)
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"x-db-query-count"] == b"1"
+    assert headers[b"x-db-table-availability_slots"] == b"1"
+    assert headers[b"x-db-sql-samples"] == b"1"
+    assert scope["state"]["query_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_metrics_for_sse_and_ends_gauge_on_error(metrics):
+    await _run_app(RequestPipelineMiddleware(_endpoint({})), _scope(path=SSE_PATH_PREFIX))
+    metrics.track_http_request_start.assert_not_called()
+
+    async def failing(scope, receive, send):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await _run_app(RequestPipelineMiddleware(failing), _scope(path="/api/v1/x"))
+    metrics.track_http_request_end.assert_called_once_with("GET", "/api/v1/x")
+    metrics.record_http_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_passes_through_non_http_scopes(metrics):
+    called = []
+
+    async def app(scope, receive, send):
+        called.append(scope["type"])
+
+    await RequestPipelineMiddleware(app)({"type": "lifespan"}, None, None)
+    assert called == ["lifespan"]
+    metrics.track_http_request_start.assert_not_called()
+
+
+def test_register_middleware_uses_no_base_http_layers(monkeypatch):
+    monkeypatch.delenv("SITE_MODE", raising=False)
+    app = FastAPI()
+    register_middleware(app)
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    stack: list[Middleware] = app.user_middleware
+    assert sum(m.cls is RequestPipelineMiddleware for m in stack) == 1
+    assert not [
+        m for m in stack if isinstance(m.cls, type) and issubclass(m.cls, BaseHTTPMiddleware)
+    ]
+
+    response = TestClient(app).get("/ping")
+    assert response.status_code == 200
+    assert response.headers["x-site-mode"] == "unset"
+    assert response.headers["x-phase"] == "beta"
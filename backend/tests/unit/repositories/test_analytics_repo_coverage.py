@@ -147,15 +147,3 @@ class TestListAvailabilityDays:
             instructor_ids=[], start_date=date.today(), end_date=date.today()
         )
         assert result == []
-
-
-class TestListUserIdsWithBookings:
-    """Empty user_ids early return."""
-
-    def test_empty_ids_returns_empty_set(self) -> None:
-        repo, _ = _make_repo()
-        now = datetime.now(timezone.utc)
-        result = repo.list_user_ids_with_bookings(
-            user_ids=[], role="student", start=now, end=now
-        )
-        assert result == set()
@@ -143,15 +143,11 @@ def test_search_segment_and_booking_role_helpers():
     q_device = _query(all_result=[("mobile", 4), (None, 1)])
     q_source = _query(all_result=[("google", 2)])
     q_type = _query(all_result=[("keyword", 3)])
-    q_bookings_student = _query(all_result=[SimpleNamespace(student_id="s1", instructor_id="i1")])
-    q_bookings_instructor = _query(all_result=[SimpleNamespace(student_id="s2", instructor_id="i2")])
     q_availability_ids = _query(all_result=[("ins-1",), ("ins-2",)])
     db.query.side_effect = [
         q_device,
         q_source,
         q_type,
-        q_bookings_student,
-        q_bookings_instructor,
         q_availability_ids,
     ]
 
@@ -168,19 +164,6 @@ def test_search_segment_and_booking_role_helpers():
         "keyword": 3,
     }
 
-    assert repo.list_user_ids_with_bookings(user_ids=[], role="student", start=_dt(), end=_dt()) == set()
-    assert (
-        repo.list_user_ids_with_bookings(
-            user_ids=["s1"], role="student", start=_dt(), end=_dt()
-        )
-        == {"s1"}
-    )
-    assert (
-        repo.list_user_ids_with_bookings(
-            user_ids=["i2"], role="instructor", start=_dt(), end=_dt()
-        )
-        == {"i2"}
-    )
     assert repo.list_availability_instructor_ids(["cat"]) == ["ins-1", "ins-2"]
 
 
@@ -267,7 +250,6 @@ def test_role_and_user_listing_helpers():
     q_ids = _query(all_result=[("u1",), ("u2",)])
     q_ids_range = _query(all_result=[("u3",)])
     user_obj = SimpleNamespace(id="u4")
-    q_users_between = _query(all_result=[user_obj])
     q_users_by_role = _query(all_result=[user_obj])
     q_instructors_for_category = _query(scalar_result=9)
     q_students_for_category = _query(scalar_result=10)
@@ -275,7 +257,6 @@ def test_role_and_user_listing_helpers():
     db.query.side_effect = [
         q_ids,
         q_ids_range,
-        q_users_between,
         q_users_by_role,
         q_instructors_for_category,
         q_students_for_category,
@@ -286,7 +267,6 @@ def test_role_and_user_listing_helpers():
 
     assert repo.list_user_ids_by_role("student") == ["u1", "u2"]
     assert repo.list_user_ids_by_role_in_range(role_name="student", start=_dt(), end=_dt()) == ["u3"]
-    assert repo.list_users_created_between(role_name="student", start=_dt(), end=_dt()) == [user_obj]
     assert repo.list_users_by_role("student") == [user_obj]
     assert repo.count_instructors_for_category("cat-1") == 9
     assert repo.count_students_for_category(start=_dt(), end=_dt(), category_id="cat-1") == 10
@@ -0,0 +1,60 @@
+"""Unit tests for CohortAnalyticsRepository."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy import column, table
+
+from app.repositories.cohort_analytics_repository import CohortAnalyticsRepository
+
+
+def _query(*, all_result=None):
+    q = MagicMock()
+    q.filter.return_value = q
+    q.join.return_value = q
+    q.outerjoin.return_value = q
+    q.group_by.return_value = q
+    q.distinct.return_value = q
+    q.all.return_value = [] if all_result is None else all_result
+    return q
+
+
+def _dt() -> datetime:
+    return datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def test_cohort_activity_counts_folds_grouping_sets():
+    db = MagicMock()
+    q_cohort = _query()
+    q_cohort.cte.return_value = table("cohort", column("user_id"), column("cohort_start"))
+    q_activity = _query()
+    q_activity.cte.return_value = table("activity", column("user_id"), column("activity_start"))
+    week = datetime(2030, 1, 7)
+    next_week = datetime(2030, 1, 14)
+    q_matrix = _query(
+        all_result=[
+            SimpleNamespace(cohort_start=week, activity_start=None, is_cohort_total=1, users=3),
+            SimpleNamespace(cohort_start=week, activity_start=week, is_cohort_total=0, users=2),
+            SimpleNamespace(
+                cohort_start=week, activity_start=next_week, is_cohort_total=0, users=1
+            ),
+            # Cohort members without bookings in range (LEFT JOIN miss).
+            SimpleNamespace(cohort_start=week, activity_start=None, is_cohort_total=0, users=1),
+        ]
+    )
+    q_matrix.select_from.return_value = q_matrix
+    db.query.side_effect = [q_cohort, q_activity, q_matrix]
+
+    counts = CohortAnalyticsRepository(db).cohort_activity_counts(
+        role_name="instructor", unit="week", start=_dt(), end=_dt(), activity_end=_dt()
+    )
+
+    utc_week = week.replace(tzinfo=timezone.utc)
+    assert counts.cohort_sizes == {utc_week: 3}
+    assert counts.active_users == {
+        (utc_week, utc_week): 2,
+        (utc_week, next_week.replace(tzinfo=timezone.utc)): 1,
+    }
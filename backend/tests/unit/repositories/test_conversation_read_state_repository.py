@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from app.models.conversation_read_state import ConversationReadState
+from app.models.message import Message, MessageNotification
+from app.repositories.conversation_read_state_repository import ConversationReadStateRepository
+from app.repositories.message_repository import MessageRepository
+import app.services.conversation_service as conversation_service_module
+from app.services.conversation_service import ConversationService
+import app.services.message_service as message_service_module
+from app.services.message_service import MessageService
+
+T0 = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+T1 = datetime(2026, 3, 10, 13, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repo():
+    engine = create_engine("sqlite://")
+    ConversationReadState.__table__.create(engine)
+    with Session(engine) as session:
+        yield ConversationReadStateRepository(session)
+
+
+def _row(repo, user_id="u1", conversation_id="c1") -> ConversationReadState:
+    repo.db.expire_all()
+    return repo.db.get(ConversationReadState, (user_id, conversation_id))
+
+
+def test_increment_and_decrement_maintain_counters(repo):
+    repo.increment_unread("u1", "c1")
+    repo.increment_unread("u1", "c1")
+    repo.increment_unread("u1", "c2")
+    repo.increment_unread("u2", "c1")
+
+    assert repo.get_total_unread("u1") == 3
+    assert repo.get_unread_counts("u1", ["c1", "c2", "c3"]) == {"c1": 2, "c2": 1}
+
+    repo.decrement_unread("u1", "c1", amount=5)
+    assert _row(repo).unread_count == 0
+    assert repo.get_unread_counts("u1", ["c1", "c2"]) == {"c2": 1}
+    assert repo.get_total_unread("nobody") == 0
+    assert repo.get_unread_counts("u1", []) == {}
+
+
+def test_record_read_clears_counter_and_only_advances_watermark(repo):
+    for _ in range(3):
+        repo.increment_unread("u1", "c1")
+
+    repo.record_read("u1", "c1", last_message_id="01B", read_at=T0, read_count=1)
+    row = _row(repo)
+    assert (row.unread_count, row.last_read_message_id) == (2, "01B")
+
+    # An older message read later does not move the watermark back.
+    repo.record_read("u1", "c1", last_message_id="01A", read_at=T1, read_count=1)
+    row = _row(repo)
+    assert (row.unread_count, row.last_read_message_id) == (1, "01B")
+    assert row.last_read_at.replace(tzinfo=timezone.utc) == T0
+
+    repo.record_read("u1", "c1", last_message_id="01C", read_at=T1, clear=True)
+    row = _row(repo)
+    assert (row.unread_count, row.last_read_message_id) == (0, "01C")
+    assert repo.get_watermarks("c1")["u1"][0] == "01C"
+
+
+def test_record_read_without_new_reads_only_repairs_drift(repo):
+    repo.increment_unread("u1", "c1")
+
+    repo.record_read("u1", "c1", last_message_id=None, read_at=None, clear=True)
+    assert _row(repo).unread_count == 0
+    assert _row(repo).last_read_message_id is None
+
+    repo.record_read("u2", "c9", last_message_id=None, read_at=None, clear=True)
+    assert _row(repo, "u2", "c9") is None
+
+
+@pytest.fixture
+def messages():
+    engine = create_engine("sqlite://")
+    for model in (ConversationReadState, Message, MessageNotification):
+        model.__table__.create(engine)
+    with Session(engine) as session:
+        for message_id in ("01A", "01B", "01C"):
+            session.add(Message(id=message_id, conversation_id="c1", sender_id="u2", content="hi"))
+            session.add(MessageNotification(message_id=message_id, user_id="u1"))
+        session.flush()
+        ConversationReadStateRepository(session).increment_unread("u1", "c1", amount=3)
+        yield MessageRepository(session)
+
+
+def test_subset_read_only_advances_watermark_past_contiguous_reads(messages):
+    read_state = ConversationReadStateRepository(messages.db)
+
+    # Reading a later message leaves the older one unread: the watermark stays put.
+    assert messages.mark_messages_as_read(["01B"], "u1", write_read_by=False) == 1
+    row = _row(read_state)
+    assert (row.unread_count, row.last_read_message_id) == (2, None)
+
+    # Once the gap is read, the watermark moves past both.
+    messages.mark_messages_as_read(["01A"], "u1", write_read_by=False)
+    row = _row(read_state)
+    assert (row.unread_count, row.last_read_message_id) == (1, "01B")
+
+    # A deleted unread message does not hold the watermark back.
+    messages.db.execute(update(Message).where(Message.id == "01C").values(is_deleted=True))
+    assert messages._read_watermarks(["c1"], "u1") == {"c1": "01B"}
+
+
+def test_atomic_read_moves_watermark_past_earlier_out_of_order_reads(messages):
+    messages.mark_messages_as_read(["01C"], "u1", write_read_by=False)
+
+    result = messages.mark_unread_messages_read_atomic("c1", "u1", write_read_by=False)
+
+    assert sorted(result.message_ids) == ["01A", "01B"]
+    row = _row(ConversationReadStateRepository(messages.db))
+    assert (row.unread_count, row.last_read_message_id) == (0, "01C")
+
+
+def test_services_read_counters_when_enabled(monkeypatch):
+    monkeypatch.setattr(message_service_module.settings, "messaging_unread_counters_enabled", True)
+    message_service = MessageService(MagicMock())
+    message_service.repository = MagicMock()
+    message_service.read_state_repository = MagicMock()
+    message_service.read_state_repository.get_total_unread.return_value = 7
+
+    assert message_service.get_unread_count("u1") == 7
+    message_service.repository.get_unread_count_for_user.assert_not_called()
+
+    conversation_service = ConversationService(
+        MagicMock(), conversation_repository=MagicMock(), message_repository=MagicMock()
+    )
+    conversation_service.read_state_repository = MagicMock()
+    conversation_service.read_state_repository.get_unread_counts.return_value = {"c1": 2}
+    assert conversation_service_module.settings.messaging_unread_counters_enabled
+
+    assert conversation_service.batch_get_unread_counts(["c1", "c2"], "u1") == {"c1": 2}
+    assert conversation_service.get_unread_count("c2", "u1") == 0
+    conversation_service.conversation_repository.batch_get_unread_counts.assert_not_called()
+
+
+def test_watermark_receipts_merge_with_legacy_read_by():
+    watermarks = {"student": ("01C", T0), "instructor": ("01A", T1), "idle": (None, None)}
+
+    def merge(message_id, sender_id, read_by):
+        msg = SimpleNamespace(id=message_id, sender_id=sender_id)
+        return ConversationService._merge_watermark_receipts(msg, read_by, watermarks)
+
+    assert merge("01B", "instructor", []) == [{"user_id": "student", "read_at": T0.isoformat()}]
+    assert merge("01D", "instructor", []) == []
+    assert merge("01B", "student", []) == []
+    assert merge("01B", None, []) == []
+    legacy = [{"user_id": "student", "read_at": "2026-01-01"}]
+    assert merge("01B", "instructor", list(legacy)) == legacy
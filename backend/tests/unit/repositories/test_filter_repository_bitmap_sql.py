@@ -0,0 +1,100 @@
+"""Python model of the set-based availability SQL, checked against check_availability()."""
+
+from __future__ import annotations
+
+from datetime import date, time
+import math
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from app.core.constants import SLOTS_PER_DAY
+from app.repositories.filter_repository import (
+    FilterRepository,
+    _available_days_sql,
+    _duration_slots,
+    _run_shift_plan,
+    _slot_window_mask,
+)
+from app.utils.bitset import pack_indexes
+
+_NIBBLE_REVERSE = str.maketrans("0123456789abcdef", "084c2a6e195d3b7f")
+
+
+def _legacy_check_availability(
+    bits: bytes, time_after: time | None, time_before: time | None, duration_minutes: int
+) -> bool:
+    """Line-for-line port of the PL/pgSQL check_availability() loop from migration 003."""
+    start_slot = time_after.hour * 12 + time_after.minute // 5 if time_after else 0
+    end_slot = time_before.hour * 12 + time_before.minute // 5 - 1 if time_before else 287
+    duration_slots = math.ceil(duration_minutes / 5)
+    contiguous = 0
+    for slot in range(start_slot, end_slot + 1):
+        if (bits[slot // 8] >> (slot % 8)) & 1:
+            contiguous += 1
+            if contiguous >= duration_slots:
+                return True
+        else:
+            contiguous = 0
+    return False
+
+
+def _sql_model(
+    bits: bytes, time_after: time | None, time_before: time | None, duration_minutes: int
+) -> bool:
+    """Evaluate the same steps the SQL performs, using Python ints as bit(288) values."""
+    hex_value = bits.hex().translate(_NIBBLE_REVERSE)
+    swapped = "".join(hex_value[i + 1] + hex_value[i] for i in range(0, len(hex_value), 2))
+    full = (1 << SLOTS_PER_DAY) - 1
+    runs = int(swapped, 16) & int(_slot_window_mask(time_after, time_before), 2)
+    for shift in _run_shift_plan(_duration_slots(duration_minutes)):
+        runs &= (runs << shift) & full
+    return runs != 0
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_set_based_bitmap_check_matches_legacy_function(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(300):
+        slots: set[int] = set()
+        for _ in range(rng.randint(0, 5)):
+            start = rng.randrange(SLOTS_PER_DAY)
+            slots.update(range(start, min(SLOTS_PER_DAY, start + rng.randint(1, 40))))
+        bits = pack_indexes(sorted(slots))
+        time_after = rng.choice([None, time(0, 0), time(9, 0), time(12, 7), time(23, 55)])
+        time_before = rng.choice([None, time(0, 0), time(12, 0), time(17, 33), time(23, 59)])
+        duration = rng.choice([0, 5, 15, 30, 45, 60, 62, 90, 120, 240])
+
+        assert _sql_model(bits, time_after, time_before, duration) == _legacy_check_availability(
+            bits, time_after, time_before, duration
+        )
+
+
+def test_run_shift_plan_doubles_until_duration() -> None:
+    assert _run_shift_plan(0) == []
+    assert _run_shift_plan(1) == []
+    assert _run_shift_plan(12) == [1, 2, 4, 4]
+    assert sum(_run_shift_plan(48)) == 47
+
+
+def test_query_available_days_binds_mask_and_uses_no_plpgsql() -> None:
+    db = Mock()
+    db.execute.return_value = []
+    repo = FilterRepository(db)
+
+    repo.filter_by_availability(
+        ["inst-1"],
+        target_date=date(2026, 3, 2),
+        time_after=time(9, 0),
+        time_before=time(10, 0),
+        duration_minutes=60,
+    )
+
+    statement, params = db.execute.call_args.args
+    sql = str(statement)
+    assert "check_availability" not in sql
+    assert "run_4" in sql and "run_5" not in sql
+    assert params["dates"] == [date(2026, 3, 2)]
+    assert params["slot_mask"] == "0" * 108 + "1" * 12 + "0" * 168
+    assert "run_0" in _available_days_sql([])
@@ -173,6 +173,52 @@ class TestGetInstructorMetrics:
         assert repo.get_instructor_metrics([]) == {}
 
 
+class TestSnapshotQueries:
+    """Bulk reads used to build the ranking signal snapshot."""
+
+    def test_list_live_instructor_metrics_scopes_to_live_profiles(self) -> None:
+        repo, mock_db = _make_repo()
+        row = MagicMock(
+            instructor_id="inst-01",
+            avg_rating=4.5,
+            review_count=3,
+            last_active_at=None,
+            response_rate=None,
+            is_founding_instructor=True,
+            has_photo=True,
+            has_bio=False,
+            has_background_check=True,
+            has_identity_verified=False,
+            profile_completeness=None,
+        )
+        mock_db.execute.return_value = [row]
+
+        result = repo.list_live_instructor_metrics()
+
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "ip.is_live = true" in sql
+        assert ":instructor_ids" not in sql
+        assert result["inst-01"]["review_count"] == 3
+        assert result["inst-01"]["response_rate"] == 0.0
+        assert result["inst-01"]["is_founding_instructor"] is True
+
+    def test_list_active_service_signals(self) -> None:
+        repo, mock_db = _make_repo()
+        mock_db.execute.return_value = [
+            MagicMock(service_id="svc-01", age_groups=["kids"], filter_selections=None),
+            MagicMock(
+                service_id="svc-02",
+                age_groups=None,
+                filter_selections={"skill_level": ["Advanced"]},
+            ),
+        ]
+
+        assert repo.list_active_service_signals() == {
+            "svc-01": ("kids", ["all"]),
+            "svc-02": ("both", ["advanced"]),
+        }
+
+
 class TestGetInstructorDistances:
     """Empty IDs early return."""
 
@@ -0,0 +1,256 @@
+# backend/tests/unit/services/messaging/test_fanout_hub.py
+"""Unit tests for the sharded SSE fan-out hub and batched multi-user publish."""
+
+import asyncio
+from contextlib import asynccontextmanager
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.messaging import fanout_hub, sse_stream
+from app.services.messaging.fanout_hub import (
+    SSEConnection,
+    SSEFanoutHub,
+    build_envelope,
+    group_by_shard,
+    shard_channel,
+    shard_for,
+)
+
+
+def _typing(conversation_id: str, user_id: str, is_typing: bool) -> dict:
+    return {
+        "type": "typing_status",
+        "payload": {"conversation_id": conversation_id, "user_id": user_id, "is_typing": is_typing},
+    }
+
+
+def _receipt(conversation_id: str, reader_id: str, message_ids: list) -> dict:
+    return {
+        "type": "read_receipt",
+        "payload": {
+            "conversation_id": conversation_id,
+            "reader_id": reader_id,
+            "message_ids": message_ids,
+        },
+    }
+
+
+def _message(message_id: str, sender_id: str = "u-sender") -> dict:
+    return {
+        "type": "new_message",
+        "payload": {"message": {"id": message_id, "sender_id": sender_id}},
+    }
+
+
+class _FakeBroadcast:
+    """In-process stand-in for Broadcaster: channel → subscriber queues."""
+
+    def __init__(self) -> None:
+        self.queues: dict = {}
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        queue: asyncio.Queue = asyncio.Queue()
+        self.queues.setdefault(channel, []).append(queue)
+
+        async def _iter():
+            while True:
+                message = await queue.get()
+                if isinstance(message, Exception):
+                    raise message
+                yield SimpleNamespace(channel=channel, message=message)
+
+        try:
+            yield _iter()
+        finally:
+            self.queues[channel].remove(queue)
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self.queues.get(channel, []):
+            queue.put_nowait(message)
+
+
+def test_group_by_shard_is_stable_and_deduplicates() -> None:
+    grouped = group_by_shard(["a", "b", "a", "", "c"], shards=4)
+
+    assert sorted(user for users in grouped.values() for user in users) == ["a", "b", "c"]
+    for shard, users in grouped.items():
+        assert all(shard_for(user, 4) == shard for user in users)
+    assert shard_channel(3) == "sse:shard:3"
+
+
+def test_connection_coalesces_typing_and_merges_read_receipts() -> None:
+    connection = SSEConnection("u1", max_pending=8)
+
+    connection.push(_typing("c1", "u2", True))
+    connection.push(_message("m1"))
+    connection.push(_typing("c1", "u2", False))
+    connection.push(_receipt("c1", "u2", ["m0"]))
+    connection.push(_receipt("c1", "u2", ["m0", "m1"]))
+
+    events = [connection.pop_nowait() for _ in range(len(connection))]
+    assert [event["type"] for event in events] == ["typing_status", "new_message", "read_receipt"]
+    assert events[0]["payload"]["is_typing"] is False
+    assert events[2]["payload"]["message_ids"] == ["m0", "m1"]
+    assert connection.coalesced == 2
+
+
+def test_full_connection_sheds_ephemeral_before_overflowing() -> None:
+    connection = SSEConnection("u1", max_pending=2)
+    connection.push(_typing("c1", "u2", True))
+    connection.push(_message("m1"))
+
+    assert connection.push(_typing("c2", "u3", True)) is False
+    assert connection.push(_message("m2")) is True
+    assert [connection.pop_nowait()["type"] for _ in range(2)] == ["new_message"] * 2
+    assert connection.dropped == 2
+
+    connection.push(_message("m3"))
+    connection.push(_message("m4"))
+    assert connection.push(_message("m5")) is False
+    assert connection.overflowed and connection.closed
+    assert len(connection) == 0
+
+
+@pytest.mark.asyncio
+async def test_hub_dispatches_envelope_to_local_recipients_only() -> None:
+    broadcast = _FakeBroadcast()
+    hub = SSEFanoutHub(shards=2, queue_size=8)
+    await hub.start(broadcast)
+    assert hub.running
+    try:
+        first = hub.register("u1")
+        second = hub.register("u1")
+        other = hub.register("u2")
+
+        await broadcast.publish(
+            shard_channel(shard_for("u1", 2)), build_envelope(["u1"], _message("m1"))
+        )
+        assert await first.next_event(1) == ("message", _message("m1"))
+        assert (await second.next_event(1))[0] == "message"
+        assert len(other) == 0
+
+        hub.unregister(second)
+        assert hub.connection_count == 2
+        assert await second.next_event(1) == ("done", None)
+    finally:
+        await hub.stop()
+    assert await first.next_event(1) == ("done", None)
+
+
+class _FlakyBroadcast(_FakeBroadcast):
+    """Fake broadcaster whose next ``fail_subscribes`` subscribe calls raise."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fail_subscribes = 0
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        if self.fail_subscribes:
+            self.fail_subscribes -= 1
+            raise ConnectionError("redis down")
+        async with super().subscribe(channel) as subscriber:
+            yield subscriber
+
+    async def drop(self, channel: str) -> None:
+        await self.publish(channel, ConnectionError("connection lost"))
+
+
+@pytest.mark.asyncio
+async def test_hub_resubscribes_after_outage_and_closes_clients_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(fanout_hub, "RESUBSCRIBE_BACKOFF_BASE_SECONDS", 0)
+    broadcast = _FlakyBroadcast()
+    hub = SSEFanoutHub(shards=1, queue_size=8)
+    await hub.start(broadcast)
+    close_all = MagicMock(wraps=hub._close_all)
+    monkeypatch.setattr(hub, "_close_all", close_all)
+    try:
+        before = hub.register("u1")
+        broadcast.fail_subscribes = 3
+        await broadcast.drop(shard_channel(0))
+        assert await before.next_event(1) == ("done", None)
+
+        for _ in range(100):
+            if hub.running:
+                break
+            await asyncio.sleep(0)
+        assert hub.running
+        assert broadcast.fail_subscribes == 0
+        close_all.assert_called_once()
+
+        after = hub.register("u1")
+        await broadcast.publish(shard_channel(0), build_envelope(["u1"], _message("m2")))
+        assert await after.next_event(1) == ("message", _message("m2"))
+    finally:
+        await hub.stop()
+
+
+def test_resubscribe_delay_is_exponential_and_capped() -> None:
+    delays = [SSEFanoutHub._resubscribe_delay(failures) for failures in range(10)]
+    assert delays[:3] == [0.5, 1.0, 2.0]
+    assert max(delays) == fanout_hub.RESUBSCRIBE_BACKOFF_CAP_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_stream_from_hub_copies_event_per_recipient(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fanout_hub.settings, "sse_fanout_enabled", True)
+    hub = SSEFanoutHub(shards=1, queue_size=8)
+    await hub.start(_FakeBroadcast())
+    monkeypatch.setattr(fanout_hub, "_hub", hub)
+    try:
+        streams = {uid: sse_stream.create_sse_stream(uid) for uid in ("u-sender", "u-other")}
+        for stream in streams.values():
+            assert (await stream.__anext__())["event"] == "connected"
+        pending = {uid: asyncio.ensure_future(s.__anext__()) for uid, s in streams.items()}
+        await asyncio.sleep(0)
+
+        shared = _message("m1")
+        hub.dispatch(build_envelope(list(streams), shared))
+
+        mine = json.loads((await pending["u-sender"])["data"])["is_mine"]
+        theirs = json.loads((await pending["u-other"])["data"])["is_mine"]
+        assert (mine, theirs) == (True, False)
+        assert "is_mine" not in shared["payload"]
+        for stream in streams.values():
+            await stream.aclose()
+        assert hub.connection_count == 0
+    finally:
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_unavailable_without_hub(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fanout_hub.settings, "sse_fanout_enabled", True)
+    monkeypatch.setattr(fanout_hub, "_hub", None)
+
+    events = [event async for event in sse_stream.create_sse_stream("u1")]
+
+    assert [event["event"] for event in events] == ["connected", "error"]
+
+
+@pytest.mark.asyncio
+async def test_publish_to_users_pipelines_one_message_per_shard(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(fanout_hub.settings, "sse_fanout_enabled", True)
+    monkeypatch.setattr(fanout_hub.settings, "sse_fanout_shards", 4)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1])
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+    monkeypatch.setattr(sse_stream, "get_async_redis_client", AsyncMock(return_value=redis_client))
+
+    users = [f"user-{index}" for index in range(20)]
+    await sse_stream.publish_to_users(users + users[:3], _message("m1"))
+
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    pipe.execute.assert_awaited_once()
+    published = {call.args[0]: json.loads(call.args[1]) for call in pipe.publish.call_args_list}
+    assert set(published) == {shard_channel(shard) for shard in group_by_shard(users, 4)}
+    assert sorted(uid for envelope in published.values() for uid in envelope["to"]) == sorted(users)
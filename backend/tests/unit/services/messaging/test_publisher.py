@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.services.messaging import publisher as publisher_module
 from app.services.messaging.publisher import (
     publish_message_deleted,
     publish_message_edited,
@@ -16,6 +17,12 @@ from app.services.messaging.publisher import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _legacy_per_user_channels(monkeypatch: pytest.MonkeyPatch) -> None:
+    """These tests cover the per-user channel path; the sharded hub has its own tests."""
+    monkeypatch.setattr(publisher_module.settings, "sse_fanout_enabled", False)
+
+
 @pytest.fixture
 def mock_publish_to_user() -> AsyncMock:
     """Mock the publish_to_user function."""
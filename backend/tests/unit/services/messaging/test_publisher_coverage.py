@@ -7,6 +7,12 @@ import pytest
 from app.services.messaging import publisher
 
 
+@pytest.fixture(autouse=True)
+def _legacy_per_user_channels(monkeypatch: pytest.MonkeyPatch) -> None:
+    """These tests cover the per-user channel path; the sharded hub has its own tests."""
+    monkeypatch.setattr(publisher.settings, "sse_fanout_enabled", False)
+
+
 @pytest.mark.asyncio
 async def test_publish_new_message_direct_sends_to_all(monkeypatch):
     publish_mock = AsyncMock()
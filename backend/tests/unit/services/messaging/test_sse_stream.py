@@ -17,6 +17,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 import pytest
 
 from app.repositories.message_repository import MessageRepository
+from app.services.messaging import sse_stream as sse_stream_module
 from app.services.messaging.sse_stream import (
     create_sse_stream,
     ensure_db_health,
@@ -27,6 +28,12 @@ from app.services.messaging.sse_stream import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _legacy_per_user_channels(monkeypatch: pytest.MonkeyPatch) -> None:
+    """These tests cover the per-user channel path; the sharded hub has its own tests."""
+    monkeypatch.setattr(sse_stream_module.settings, "sse_fanout_enabled", False)
+
+
 class TestFormatRedisEvent:
     """Test SSE event formatting from Redis events."""
 
@@ -0,0 +1,164 @@
+# backend/tests/unit/services/search/test_ann_index.py
+"""Unit tests for the in-memory catalog embedding index (memory retriever backend)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.search import ann_index
+from app.services.search.ann_index import ServiceEmbeddingIndex, search_services
+from app.services.search.retriever import PostgresRetriever
+
+
+def _unit(*values: float) -> List[float]:
+    return list(values)
+
+
+def _exact_top(vectors: np.ndarray, ids: List[str], query: np.ndarray, k: int) -> List[str]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return [ids[i] for i in np.argsort(-scores)[:k]]
+
+
+class _FakeCatalogRepo:
+    def __init__(self, rows: List[Tuple[str, Optional[List[float]], bool, datetime]]) -> None:
+        self.rows = rows
+        self.calls: List[Optional[datetime]] = []
+
+    def list_embedding_rows(self, updated_since: Optional[datetime] = None) -> List[Any]:
+        self.calls.append(updated_since)
+        if updated_since is None:
+            return [row for row in self.rows if row[2] and row[1] is not None]
+        return [row for row in self.rows if row[3] >= updated_since]
+
+
+@pytest.fixture(autouse=True)
+def _clear_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ann_index.refresher, "current", None)
+
+
+def test_exact_search_ranks_by_cosine_and_clamps_negative_scores() -> None:
+    index = ServiceEmbeddingIndex()
+    assert index.search([1.0, 0.0], 3) is None
+
+    index.build([("a", _unit(1, 0)), ("b", _unit(1, 1)), ("c", _unit(-1, 0)), ("d", None)])
+
+    hits = index.search([2.0, 0.0], 3)
+    assert [item_id for item_id, _ in hits] == ["a", "b", "c"]
+    assert hits[0][1] == pytest.approx(1.0)
+    assert hits[1][1] == pytest.approx(2**-0.5)
+    assert hits[2][1] == 0.0
+    assert index.search([1.0, 0.0, 0.0], 3) is None
+    assert len(index) == 3 and index.dimension == 2
+
+
+def test_ivf_layer_keeps_high_recall_against_exact_scan() -> None:
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(20, 32))
+    vectors = np.vstack([c + 0.3 * rng.normal(size=(50, 32)) for c in centers])
+    ids = [f"svc-{i}" for i in range(len(vectors))]
+    index = ServiceEmbeddingIndex(nprobe=6, ivf_min_vectors=100)
+    index.build(zip(ids, vectors.tolist()))
+
+    recalls = []
+    for query in centers + 0.2 * rng.normal(size=centers.shape):
+        approx = {item_id for item_id, _ in index.search(query.tolist(), 10)}
+        recalls.append(len(approx & set(_exact_top(vectors, ids, query, 10))) / 10)
+
+    assert index._snapshot is not None and index._snapshot.centroids is not None
+    assert sum(recalls) / len(recalls) >= 0.95
+
+
+def test_apply_upserts_removes_and_skips_unchanged_vectors() -> None:
+    index = ServiceEmbeddingIndex()
+    index.build([("a", _unit(1, 0)), ("b", _unit(0, 1))])
+    snapshot = index._snapshot
+
+    assert index.apply(upserts=[("a", _unit(2, 0))]) == 0
+    assert index._snapshot is snapshot
+
+    changed = index.apply(upserts=[("b", _unit(1, 0.1)), ("c", _unit(0, 1))], removals=["a", "x"])
+    assert changed == 3
+    assert [item_id for item_id, _ in index.search([0.0, 1.0], 5)] == ["c", "b"]
+    assert index.apply(upserts=[("d", _unit(1, 0, 0))]) == 0
+
+
+def test_refresh_pulls_changes_since_watermark() -> None:
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    repo = _FakeCatalogRepo(
+        [("a", _unit(1, 0), True, t0), ("b", _unit(0, 1), True, t0), ("z", None, True, t0)]
+    )
+    index = ServiceEmbeddingIndex()
+    assert index.refresh(repo) == 2
+    assert index.watermark == t0
+
+    t1 = t0 + timedelta(hours=1)
+    repo.rows = [
+        ("a", _unit(1, 0), False, t1),
+        ("b", _unit(0, 1), True, t0),
+        ("c", _unit(1, 1), True, t1),
+    ]
+    assert index.refresh(repo) == 2
+    assert repo.calls[-1] == t0 - ann_index.REFRESH_OVERLAP
+    assert index.watermark == t1
+    assert sorted(index._snapshot.ids) == ["b", "c"]
+
+
+def test_search_services_widens_until_enough_bookable_rows() -> None:
+    index = ServiceEmbeddingIndex()
+    index.build([(f"cat-{i}", _unit(1, i / 10)) for i in range(10)])
+    bookable = {"cat-5", "cat-8"}
+    requested: List[int] = []
+
+    def hydrate(scores: Dict[str, float], limit: int) -> Dict[str, Tuple[float, Dict[str, Any]]]:
+        requested.append(len(scores))
+        rows = {
+            f"svc-{cat}": (score, {"service_catalog_id": cat})
+            for cat, score in scores.items()
+            if cat in bookable
+        }
+        return dict(sorted(rows.items(), key=lambda item: -item[1][0])[:limit])
+
+    results = search_services(index, [1.0, 0.0], 2, hydrate)
+
+    assert list(results) == ["svc-cat-5", "svc-cat-8"]
+    assert requested == [2, 8, 10]
+    assert search_services(None, [1.0, 0.0], 2, hydrate) is None
+
+
+def test_retriever_uses_memory_backend_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    index = ServiceEmbeddingIndex()
+    index.build([("cat-1", _unit(1, 0)), ("cat-2", _unit(0, 1))])
+    repo = MagicMock()
+    repo.services_for_catalogs.return_value = [
+        {
+            "id": "svc-1",
+            "catalog_id": "cat-1",
+            "name": "Piano",
+            "description": None,
+            "min_hourly_rate": 60.0,
+            "instructor_id": "inst-1",
+            "subcategory_id": "sub-1",
+            "vector_score": 1.0,
+        }
+    ]
+    retriever = PostgresRetriever(MagicMock(), repository=repo)
+
+    monkeypatch.setattr(ann_index.settings, "nl_search_vector_backend", "pgvector")
+    monkeypatch.setattr(ann_index.refresher, "current", index)
+    retriever._vector_search(repo, [1.0, 0.0], 1)
+    repo.vector_search.assert_called_once()
+
+    monkeypatch.setattr(ann_index.settings, "nl_search_vector_backend", "memory")
+    results = retriever._vector_search(repo, [1.0, 0.0], 1)
+    assert results["svc-1"][0] == 1.0
+    assert repo.services_for_catalogs.call_args.args[0] == {"cat-1": pytest.approx(1.0)}
+    repo.vector_search.assert_called_once()
+
+    ann_index.note_service_embedding("cat-3", _unit(1, 0.01))
+    assert len(index) == 3
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+import random
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+
+from app.core.constants import SLOTS_PER_DAY, TAG_BYTES_PER_DAY
+from app.services.availability_service import AvailabilityService
+from app.services.search.availability_engine import evaluate_days, refine_availability_map
+from app.utils.bitset import (
+    bits_from_windows,
+    new_empty_tags,
+    pack_indexes,
+    set_range_tag,
+    windows_from_bits,
+)
+from app.utils.time_helpers import string_to_time
+from app.utils.time_utils import time_to_minutes
+
+LOCATION_TYPES = ["online", "student_location", "instructor_location", "neutral_location"]
+
+
+def _scalar_day_passes(
+    bits: bytes,
+    tags: Optional[bytes],
+    bookings: List[SimpleNamespace],
+    *,
+    requested_location_type: str,
+    non_travel_buffer: int,
+    travel_buffer: int,
+    time_after: time | None,
+    time_before: time | None,
+    duration_minutes: int,
+) -> bool:
+    """Reference implementation: the pre-batch per-day path from FilterService."""
+    base = [(string_to_time(s), string_to_time(e)) for s, e in windows_from_bits(bits)]
+    remaining = AvailabilityService._subtract_buffered_bookings_from_windows(
+        base,
+        bookings,
+        requested_location_type=requested_location_type,
+        non_travel_buffer_minutes=non_travel_buffer,
+        travel_buffer_minutes=travel_buffer,
+    )
+    remaining = AvailabilityService._filter_windows_by_format_tags(
+        remaining, tags, requested_location_type=requested_location_type
+    )
+    return AvailabilityService._windows_support_booking_request(
+        remaining,
+        time_after=time_after,
+        time_before=time_before,
+        duration_minutes=duration_minutes,
+    )
+
+
+def _minutes(value: int) -> time:
+    value = value % (24 * 60)
+    return time(value // 60, value % 60)
+
+
+def _random_day(rng: random.Random) -> tuple[bytes, Optional[bytes], List[SimpleNamespace]]:
+    slots: set[int] = set()
+    for _ in range(rng.randint(0, 4)):
+        start = rng.randrange(SLOTS_PER_DAY)
+        slots.update(range(start, min(SLOTS_PER_DAY, start + rng.randint(1, 60))))
+    bits = pack_indexes(sorted(slots))
+
+    tags: Optional[bytes] = None
+    if rng.random() < 0.7:
+        tags = new_empty_tags()
+        for _ in range(rng.randint(0, 3)):
+            start = rng.randrange(SLOTS_PER_DAY - 1)
+            count = rng.randint(1, SLOTS_PER_DAY - start)
+            tags = set_range_tag(tags, start, count, rng.randint(0, 3))
+
+    bookings = []
+    for _ in range(rng.randint(0, 3)):
+        start_minute = rng.randrange(0, 24 * 60 - 15)
+        end_minute = min(24 * 60, start_minute + rng.choice([15, 30, 45, 60, 90, 7, 13]))
+        bookings.append(
+            SimpleNamespace(
+                start_time=_minutes(start_minute),
+                end_time=_minutes(end_minute),
+                location_type=rng.choice(LOCATION_TYPES + [None]),
+            )
+        )
+    return bits, tags, bookings
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_evaluate_days_matches_scalar_path(seed: int) -> None:
+    rng = random.Random(seed)
+    days = [_random_day(rng) for _ in range(40)]
+    for _ in range(6):
+        requested = rng.choice(LOCATION_TYPES)
+        non_travel_buffer = rng.choice([0, 5, 10, 15, 17])
+        travel_buffer = rng.choice([0, 30, 45, 60, 61])
+        time_after = rng.choice([None, time(9, 0), time(12, 10), time(18, 0)])
+        time_before = rng.choice([None, time(12, 0), time(17, 0), time(0, 0)])
+        duration = rng.choice([0, 15, 30, 60, 90, 120])
+        expected = [
+            _scalar_day_passes(
+                bits,
+                tags,
+                bookings,
+                requested_location_type=requested,
+                non_travel_buffer=non_travel_buffer,
+                travel_buffer=travel_buffer,
+                time_after=time_after,
+                time_before=time_before,
+                duration_minutes=duration,
+            )
+            for bits, tags, bookings in days
+        ]
+        travel = requested in {"student_location", "neutral_location"}
+        cuts = []
+        for _, _, bookings in days:
+            day_cuts = []
+            for booking in bookings:
+                buffer = (
+                    travel_buffer
+                    if travel or booking.location_type in {"student_location", "neutral_location"}
+                    else non_travel_buffer
+                )
+                start = max(0, time_to_minutes(booking.start_time) - buffer)
+                end = min(24 * 60, time_to_minutes(booking.end_time, is_end_time=True) + buffer)
+                if end > start:
+                    day_cuts.append((start, end))
+            cuts.append(day_cuts)
+
+        actual = evaluate_days(
+            [bits for bits, _, _ in days],
+            [tags for _, tags, _ in days],
+            cuts,
+            requested_location_type=requested,
+            time_after=time_after,
+            time_before=time_before,
+            duration_minutes=duration,
+        )
+        assert actual.tolist() == expected
+
+
+def test_windows_touching_after_slot_flooring_stay_separate() -> None:
+    # 10:00-11:00 open, booking 10:32-10:33 with no buffer leaves 10:00-10:32 and 10:33-11:00,
+    # which floor to 10:00-10:30 and 10:30-11:00; neither fits 45 minutes on its own.
+    bits = bits_from_windows([("10:00:00", "11:00:00")])
+    booking = SimpleNamespace(start_time=time(10, 32), end_time=time(10, 33), location_type="online")
+    assert not _scalar_day_passes(
+        bits,
+        None,
+        [booking],
+        requested_location_type="online",
+        non_travel_buffer=0,
+        travel_buffer=0,
+        time_after=None,
+        time_before=None,
+        duration_minutes=45,
+    )
+    assert evaluate_days(
+        [bits],
+        [None],
+        [[(632, 633)]],
+        requested_location_type="online",
+        time_after=None,
+        time_before=None,
+        duration_minutes=45,
+    ).tolist() == [False]
+
+
+def test_refine_availability_map_applies_buffers_tags_and_earliest_date() -> None:
+    today = date(2026, 3, 2)
+    tomorrow = today + timedelta(days=1)
+    open_bits = bits_from_windows([("09:00:00", "12:00:00")])
+    online_only = set_range_tag(new_empty_tags(), 0, SLOTS_PER_DAY, 1)
+    availability_map = {"inst_1": [today, tomorrow], "inst_2": [tomorrow], "inst_3": [tomorrow]}
+
+    refined = refine_availability_map(
+        availability_map,
+        bits_by_key={
+            ("inst_1", today): open_bits,
+            ("inst_1", tomorrow): open_bits,
+            ("inst_2", tomorrow): open_bits,
+            ("inst_3", tomorrow): open_bits,
+        },
+        format_tags_by_key={("inst_3", tomorrow): online_only},
+        bookings_by_key={
+            ("inst_2", tomorrow): [
+                SimpleNamespace(
+                    start_time=time(10, 0), end_time=time(11, 0), location_type="online"
+                )
+            ]
+        },
+        buffers_by_instructor={"inst_1": (15, 60), "inst_2": (15, 60), "inst_3": (15, 60)},
+        earliest_date_by_instructor={"inst_1": tomorrow},
+        requested_location_type="student_location",
+        time_after=None,
+        time_before=None,
+        duration_minutes=60,
+    )
+
+    # inst_2 loses 09:00-12:00 entirely to the 60-minute travel buffer; inst_3 is online-only.
+    assert refined == {"inst_1": [tomorrow]}
+
+
+def test_evaluate_days_rejects_malformed_bitmaps() -> None:
+    with pytest.raises(ValueError):
+        evaluate_days(
+            [b"\x00"],
+            [None],
+            [[]],
+            requested_location_type="online",
+            time_after=None,
+            time_before=None,
+            duration_minutes=60,
+        )
+    with pytest.raises(ValueError):
+        evaluate_days(
+            [bytes(36)],
+            [bytes(TAG_BYTES_PER_DAY - 1)],
+            [[]],
+            requested_location_type="online",
+            time_after=None,
+            time_before=None,
+            duration_minutes=60,
+        )
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from app.repositories.next_availability_repository import IndexedNextSlot
 import app.services.search.filter_service as filter_service_module
 from app.services.search.filter_service import (
     MIN_RESULTS_BEFORE_SOFT_FILTER,
@@ -684,3 +685,76 @@ def test_apply_soft_filtering_location_soft_borough_only_returns_candidates(repo
 
     assert filtered
     assert relaxed is not None
+
+
+def test_filter_availability_uses_next_available_index_for_open_window(
+    repository: Mock, monkeypatch
+) -> None:
+    service = FilterService(repository=repository, location_resolver=Mock(), region_code="nyc")
+    today = date(2026, 3, 2)
+    rolling = [today + timedelta(days=i) for i in range(7)]
+    inst_1_start = datetime(2026, 3, 4, 14, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(
+        FilterService, "_build_rolling_search_dates", staticmethod(lambda _tz: rolling)
+    )
+    repository.get_indexed_next_slots.return_value = {
+        "inst_1": IndexedNextSlot(today + timedelta(days=2), inst_1_start),
+        "inst_2": IndexedNextSlot(None, None),
+        "inst_4": IndexedNextSlot(today + timedelta(days=9), None),
+    }
+    repository.filter_by_availability.return_value = {
+        "inst_1": [today + timedelta(days=2), today + timedelta(days=3)],
+        "inst_3": [today, today + timedelta(days=1)],
+    }
+    repository.get_buffered_availability_context.return_value = None
+
+    candidates = [
+        filter_service_module.FilteredCandidate(
+            service_id=f"svc_{idx}",
+            service_catalog_id=f"cat_{idx}",
+            instructor_id=f"inst_{idx}",
+            hybrid_score=0.5,
+            name="Service",
+            description=None,
+            min_hourly_rate=50,
+        )
+        for idx in range(1, 5)
+    ]
+
+    result = service._filter_availability(candidates, _base_query(lesson_type="online"), 60)
+
+    repository.get_indexed_next_slots.assert_called_once()
+    index_kwargs = repository.get_indexed_next_slots.call_args.kwargs
+    assert index_kwargs["location_type"] == "online"
+    assert index_kwargs["duration_minutes"] == 60
+    assert index_kwargs["through"] == rolling[-1]
+    # Nothing bookable in the window: skipped before the bitmap scan.
+    assert sorted(repository.filter_by_availability.call_args.args[0]) == ["inst_1", "inst_3"]
+    by_id = {c.instructor_id: c for c in result}
+    assert set(by_id) == {"inst_1", "inst_3"}
+    # Dates still come from the bitmap path; the index only adds the exact start.
+    assert by_id["inst_1"].available_dates == [today + timedelta(days=2), today + timedelta(days=3)]
+    assert by_id["inst_1"].next_available_at == inst_1_start
+    assert by_id["inst_3"].earliest_available == today
+    assert by_id["inst_3"].next_available_at is None
+
+
+def test_filter_availability_skips_index_when_time_constrained(repository: Mock) -> None:
+    service = FilterService(repository=repository, location_resolver=Mock(), region_code="nyc")
+    repository.filter_by_availability.return_value = {}
+    candidates = [
+        filter_service_module.FilteredCandidate(
+            service_id="svc_1",
+            service_catalog_id="cat_1",
+            instructor_id="inst_1",
+            hybrid_score=0.5,
+            name="Service",
+            description=None,
+            min_hourly_rate=50,
+        )
+    ]
+
+    service._filter_availability(candidates, _base_query(time_after="17:00"), 60)
+
+    repository.get_indexed_next_slots.assert_not_called()
+    repository.filter_by_availability.assert_called_once()
@@ -0,0 +1,130 @@
+# backend/tests/unit/services/search/test_keyword_automaton.py
+"""Unit tests for the Aho-Corasick taxonomy keyword automaton."""
+
+from __future__ import annotations
+
+import random
+import re
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from app.services.search import keyword_generator as kg
+from app.services.search.keyword_automaton import KEYWORD_LEVELS, KeywordAutomaton
+
+
+def _regex_patterns(keyword_map: Dict[str, str]) -> List[Tuple[str, re.Pattern[str], str]]:
+    """Reference: the per-keyword ``\\b`` regexes QueryParser used before."""
+    return [
+        (keyword, re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE), value)
+        for keyword, value in sorted(
+            keyword_map.items(), key=lambda item: len(item[0]), reverse=True
+        )
+    ]
+
+
+def _regex_best(keyword_map: Dict[str, str], text: str) -> Optional[Tuple[str, str]]:
+    return _first_pattern(_regex_patterns(keyword_map), text)
+
+
+def _first_pattern(
+    patterns: List[Tuple[str, re.Pattern[str], str]], text: str
+) -> Optional[Tuple[str, str]]:
+    for keyword, pattern, value in patterns:
+        if pattern.search(text):
+            return keyword, value
+    return None
+
+
+def _automaton_best(
+    automaton: KeywordAutomaton, level: str, text: str
+) -> Optional[Tuple[str, str]]:
+    match = automaton.search(text).get(level)
+    return (match.keyword, match.value) if match is not None else None
+
+
+@pytest.fixture(scope="module")
+def seed_dicts() -> Dict[str, Dict[str, str]]:
+    categories, subcategories, services = kg._load_taxonomy_from_seed()
+    return kg._build_keyword_dicts(categories, subcategories, services)
+
+
+def test_matches_regex_scan_across_seed_taxonomy(seed_dicts: Dict[str, Dict[str, str]]) -> None:
+    automaton = KeywordAutomaton.from_keyword_dicts(seed_dicts)
+    keywords = sorted({kw for key in KEYWORD_LEVELS.values() for kw in seed_dicts[key]})
+    fillers = ["lessons", "for", "kids", "near", "me", "under", "$50", "-", "pro", "xyz"]
+    rng = random.Random(7)
+
+    queries = [
+        "piano lessons",
+        "sat tutor",
+        "jiu-jitsu",
+        "krav maga near me",
+        "sign language tutor",
+        "pianos",
+        "",
+    ]
+    for _ in range(500):
+        words = rng.sample(keywords, rng.randint(0, 2)) + rng.sample(fillers, rng.randint(0, 3))
+        rng.shuffle(words)
+        joiner = rng.choice([" ", " ", "-", ", ", ""])
+        queries.append(joiner.join(words))
+
+    patterns = {level: _regex_patterns(seed_dicts[key]) for level, key in KEYWORD_LEVELS.items()}
+    for query in queries:
+        for level, level_patterns in patterns.items():
+            expected = _first_pattern(level_patterns, query)
+            assert _automaton_best(automaton, level, query) == expected, (level, query)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        # ``\bc\+\+\b`` needs a word character after "++", so plain "c" wins here.
+        ("c++ lessons", ("c", "C")),
+        ("learn c++", ("c", "C")),
+        ("c++x", ("c++", "Cpp")),
+        ("abc++ lessons", None),
+        ("c_sharp", None),
+        ("r&b singing", ("r&b", "R&B")),
+        ("Voice-Over", ("voice-over", "Voice Over")),
+    ],
+)
+def test_word_boundaries_follow_regex_rules(text: str, expected: Optional[Tuple[str, str]]) -> None:
+    keyword_map = {"c++": "Cpp", "c": "C", "r&b": "R&B", "voice-over": "Voice Over"}
+    automaton = KeywordAutomaton({"service": keyword_map})
+
+    assert _automaton_best(automaton, "service", text.lower()) == expected
+    assert _regex_best(keyword_map, text.lower()) == expected
+
+
+def test_longest_keyword_wins_and_ties_keep_dictionary_order() -> None:
+    automaton = KeywordAutomaton(
+        {
+            "service": {"guitar": "Guitar", "bass guitar": "Bass Guitar", "bass": "Bass"},
+            "category": {"drum": "Drums", "bass": "Music"},
+        }
+    )
+
+    matches = automaton.search("electric bass guitar and drum lessons")
+    assert matches["service"].value == "Bass Guitar"
+    # "drum" and "bass" are the same length: dictionary order decides, as before.
+    assert matches["category"].value == "Drums"
+    assert automaton.search("no taxonomy here") == {}
+
+
+def test_automaton_is_cached_per_dictionary_set_and_rebuilt_on_invalidate() -> None:
+    cache = kg.KeywordDictCache()
+    dicts = cache.get()
+
+    first = cache.automaton(dicts)
+    assert cache.automaton(dicts) is first
+
+    other = {key: dict(value) for key, value in dicts.items()}
+    assert cache.automaton(other) is not first
+    assert cache.automaton(dicts) is first
+
+    cache.invalidate()
+    rebuilt = cache.automaton(cache.get())
+    assert rebuilt is not first
+    assert rebuilt.keyword_count == first.keyword_count
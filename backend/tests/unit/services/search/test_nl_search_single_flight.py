@@ -0,0 +1,178 @@
+# backend/tests/unit/services/search/test_nl_search_single_flight.py
+"""Unit tests for NL search request coalescing and stale-while-revalidate."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.schemas.nl_search import NLSearchResponse
+from app.services.cache_service import CacheService
+from app.services.search import nl_search_service as nl_module
+from app.services.search.nl_search_service import NLSearchService
+from app.services.search.search_cache import SearchCacheService
+from app.services.search.single_flight import SingleFlight
+
+
+def _response_dict(query: str, total: int = 0) -> Dict[str, Any]:
+    return {
+        "results": [],
+        "meta": {
+            "query": query,
+            "parsed": {"service_query": query},
+            "total_results": total,
+            "limit": 20,
+            "latency_ms": 50,
+            "cache_hit": False,
+            "degraded": False,
+            "degradation_reasons": [],
+            "parsing_mode": "regex",
+        },
+    }
+
+
+def _search_cache() -> AsyncMock:
+    cache = AsyncMock()
+    cache.get_cached_response = AsyncMock(return_value=None)
+    cache.get_stale_response = AsyncMock(return_value=None)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_flights(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(nl_module, "_SEARCH_FLIGHTS", SingleFlight())
+    monkeypatch.setattr(nl_module.settings, "nl_search_single_flight_enabled", True)
+    monkeypatch.setattr(nl_module.settings, "nl_search_single_flight_distributed", False)
+    monkeypatch.setattr(nl_module.settings, "nl_search_stale_while_revalidate", True)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_result_and_survives_leader_cancel() -> None:
+    flights: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "done"
+
+    leader = asyncio.ensure_future(flights.do("k", work))
+    follower = asyncio.ensure_future(flights.do("k", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == ("done", True)
+    assert calls == 1
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_misses_run_pipeline_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = asyncio.Event()
+    runs = 0
+
+    async def fake_pipeline(self, request, context) -> NLSearchResponse:
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return NLSearchResponse(**_response_dict(request.query, total=3))
+
+    monkeypatch.setattr(NLSearchService, "_run_uncached_search", fake_pipeline)
+    service = NLSearchService(search_cache=_search_cache())
+
+    searches = [asyncio.ensure_future(service.search("Piano  lessons")) for _ in range(3)]
+    other = asyncio.ensure_future(service.search("guitar"))
+    await asyncio.sleep(0.01)
+    release.set()
+    responses = await asyncio.gather(*searches, other)
+
+    assert runs == 2
+    # Followers receive their own copies of the leader's response.
+    assert len({id(r) for r in responses[:3]}) == 3
+    assert all(r.meta.total_results == 3 for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_followers_get_stale_response_while_rebuild_in_flight(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = asyncio.Event()
+
+    async def fake_pipeline(self, request, context) -> NLSearchResponse:
+        await release.wait()
+        return NLSearchResponse(**_response_dict(request.query, total=5))
+
+    monkeypatch.setattr(NLSearchService, "_run_uncached_search", fake_pipeline)
+    search_cache = _search_cache()
+    search_cache.get_stale_response.return_value = _response_dict("piano", total=1)
+    service = NLSearchService(search_cache=search_cache)
+
+    leader = asyncio.ensure_future(service.search("piano"))
+    await asyncio.sleep(0)
+    follower = await service.search("piano")
+    release.set()
+
+    assert follower.meta.total_results == 1
+    assert follower.meta.cache_hit is True
+    assert (await leader).meta.total_results == 5
+
+
+@pytest.mark.asyncio
+async def test_diagnostic_requests_are_not_coalesced(monkeypatch: pytest.MonkeyPatch) -> None:
+    pipeline = AsyncMock(return_value=NLSearchResponse(**_response_dict("piano")))
+    monkeypatch.setattr(NLSearchService, "_run_uncached_search", pipeline)
+    service = NLSearchService(search_cache=_search_cache())
+
+    await asyncio.gather(
+        service.search("piano", include_diagnostics=True),
+        service.search("piano", include_diagnostics=True),
+    )
+
+    assert pipeline.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_remote_rebuild_is_awaited_through_the_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(nl_module.settings, "nl_search_single_flight_distributed", True)
+    monkeypatch.setattr(nl_module, "_REMOTE_POLL_INTERVAL_S", 0)
+    pipeline = AsyncMock()
+    monkeypatch.setattr(NLSearchService, "_run_uncached_search", pipeline)
+    search_cache = _search_cache()
+    search_cache.acquire_rebuild_lock.return_value = (False, None)
+    search_cache.get_cached_response.side_effect = [None, None, _response_dict("piano", total=7)]
+    service = NLSearchService(search_cache=search_cache)
+
+    result = await service.search("piano")
+
+    assert result.meta.total_results == 7
+    pipeline.assert_not_awaited()
+    search_cache.release_rebuild_lock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_search_cache_reads_previous_version_and_locks_per_key() -> None:
+    cache = CacheService(redis_client=None)
+    cache.force_memory_cache = True
+    search_cache = SearchCacheService(cache_service=cache)
+
+    await search_cache.cache_response("piano", _response_dict("piano", total=2))
+    assert await search_cache.get_stale_response("piano") is None
+
+    await cache.set("search:current_version", 2)
+    assert await search_cache.get_cached_response("piano") is None
+    stale = await search_cache.get_stale_response("piano")
+    assert stale is not None and stale["meta"]["total_results"] == 2
+
+    acquired, lock_key = await search_cache.acquire_rebuild_lock("piano")
+    assert acquired and lock_key and lock_key.startswith("lock:search:v2:")
+    assert (await search_cache.acquire_rebuild_lock("piano"))[0] is False
+    await search_cache.release_rebuild_lock(lock_key)
+    assert (await search_cache.acquire_rebuild_lock("piano"))[0] is True
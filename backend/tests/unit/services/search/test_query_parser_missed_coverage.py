@@ -586,10 +586,10 @@ class TestDetectTaxonomySubcategory:
         # "sat" maps to "Test Prep" in subcategory_keywords (from _make_parser).
         # But "sat" is also a day abbreviation. Use the parse method with internal bypass.
         # Simplest: add a subcategory-only keyword.
-        parser._subcategory_keyword_patterns = [
-            ("martial", __import__("re").compile(r"\bmartial\b", __import__("re").IGNORECASE), "Martial Arts"),
-        ]
-        parser._service_keyword_patterns = []  # Remove service patterns to hit subcategory path.
+        from app.services.search.keyword_automaton import KeywordAutomaton
+
+        # No service keywords, so detection falls through to the subcategory level.
+        parser._keyword_automaton = KeywordAutomaton({"subcategory": {"martial": "Martial Arts"}})
         parser._category_keywords["martial"] = "Sports & Fitness"
         with patch.object(parser, "_get_user_today", return_value=datetime.date(2024, 6, 1)):
             result = parser.parse("martial training")
@@ -598,12 +598,10 @@ class TestDetectTaxonomySubcategory:
 
     def test_subcategory_keyword_no_category_propagation(self):
         """L813-814: subcategory keyword NOT in _category_keywords -> no category_hint."""
-        import re as _re
+        from app.services.search.keyword_automaton import KeywordAutomaton
+
         parser = _make_parser()
-        parser._subcategory_keyword_patterns = [
-            ("niche", _re.compile(r"\bniche\b", _re.IGNORECASE), "Niche Sub"),
-        ]
-        parser._service_keyword_patterns = []
+        parser._keyword_automaton = KeywordAutomaton({"subcategory": {"niche": "Niche Sub"}})
         # "niche" is not in _category_keywords -> no category propagation
         with patch.object(parser, "_get_user_today", return_value=datetime.date(2024, 6, 1)):
             result = parser.parse("niche lessons")
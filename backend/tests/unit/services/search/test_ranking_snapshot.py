@@ -0,0 +1,209 @@
+# backend/tests/unit/services/search/test_ranking_snapshot.py
+"""Unit tests for the in-process ranking signal snapshot and its scoring path."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+import random
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.config_service import DEFAULT_PRICING_CONFIG
+from app.services.search import ranking_snapshot
+from app.services.search.filter_service import FilteredCandidate
+from app.services.search.query_parser import ParsedQuery
+from app.services.search.ranking_service import RankedResult, RankingService
+from app.services.search.ranking_snapshot import RankingSignalStore
+
+_SCORE_FIELDS = (
+    "final_score",
+    "relevance_score",
+    "quality_score",
+    "distance_score",
+    "price_score",
+    "freshness_score",
+    "completeness_score",
+    "audience_boost",
+    "skill_boost",
+)
+
+
+@pytest.fixture(autouse=True)
+def _snapshot_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ranking_snapshot.settings, "nl_search_ranking_snapshot_enabled", True)
+    monkeypatch.setattr(ranking_snapshot.refresher, "current", None)
+
+
+def _random_metrics(rng: random.Random) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    last_active = rng.choice(
+        [None, now, now.date() - timedelta(days=rng.randint(0, 200))]
+        + [now - timedelta(days=d) for d in (1, 2, 7, 8, 30, 31, 90, 91)]
+    )
+    return {
+        "avg_rating": round(rng.uniform(1, 5), 2),
+        "review_count": rng.choice([0, 0, 1, 4, 5, 30]),
+        "last_active_at": last_active,
+        "response_rate": rng.choice([0.0, 50.0, 80.0, 81.0, 100.0]),
+        "is_founding_instructor": rng.random() < 0.3,
+        "has_photo": rng.random() < 0.5,
+        "has_bio": rng.random() < 0.5,
+        "has_background_check": rng.random() < 0.5,
+        "has_identity_verified": rng.random() < 0.5,
+    }
+
+
+def _catalog(
+    seed: int, instructors: int = 40, services: int = 120
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Tuple[str, List[str]]], List[FilteredCandidate]]:
+    rng = random.Random(seed)
+    metrics = {f"inst-{i}": _random_metrics(rng) for i in range(instructors)}
+    skills = [["all"], ["beginner"], ["intermediate"], ["advanced"], ["beginner", "advanced"]]
+    signals = {
+        f"svc-{i}": (rng.choice(["both", "kids", "adults"]), rng.choice(skills))
+        for i in range(services)
+    }
+    candidates = [
+        FilteredCandidate(
+            service_id=f"svc-{i}",
+            service_catalog_id=f"cat-{i % 7}",
+            instructor_id=f"inst-{rng.randrange(instructors + 3)}",  # a few unknown instructors
+            hybrid_score=rng.random(),
+            name=f"Service {i}",
+            description=None,
+            price_per_hour=rng.choice([30, 60, 70, 90, 100, 150]),
+            earliest_available=date.today() + timedelta(days=rng.randint(0, 5)),
+        )
+        for i in range(services)
+    ]
+    return metrics, signals, candidates
+
+
+def _repository(
+    metrics: Dict[str, Dict[str, Any]],
+    signals: Dict[str, Tuple[str, List[str]]],
+    distances: Optional[Dict[str, float]] = None,
+) -> Mock:
+    repo = Mock()
+    repo.get_global_average_rating.return_value = 4.3
+    repo.get_instructor_metrics.side_effect = lambda ids: {i: metrics[i] for i in ids if i in metrics}
+    repo.get_service_audience.side_effect = lambda ids: {i: signals[i][0] for i in ids}
+    repo.get_service_skill_levels.side_effect = lambda ids: {i: list(signals[i][1]) for i in ids}
+    repo.get_instructor_distances.return_value = distances or {}
+    repo.list_live_instructor_metrics.return_value = metrics
+    repo.list_active_service_signals.return_value = signals
+    return repo
+
+
+def _scores(results: List[RankedResult]) -> List[Tuple[Any, ...]]:
+    return [(r.service_id, r.rank) + tuple(getattr(r, f) for f in _SCORE_FIELDS) for r in results]
+
+
+def _rank(
+    repo: Mock,
+    candidates: List[FilteredCandidate],
+    query: ParsedQuery,
+    location: Optional[Tuple[float, float]] = None,
+) -> List[RankedResult]:
+    return RankingService(repository=repo).rank_candidates(candidates, query, location).results
+
+
+@pytest.mark.parametrize(
+    ("audience_hint", "skill_level", "max_price", "location"),
+    [
+        (None, None, None, None),
+        ("kids", "intermediate", 80, (-73.98, 40.75)),
+        ("adults", "beginner", 150, (-73.98, 40.75)),
+        (None, "advanced", None, None),
+    ],
+)
+def test_snapshot_scores_match_repository_path(
+    audience_hint: Optional[str],
+    skill_level: Optional[str],
+    max_price: Optional[int],
+    location: Optional[Tuple[float, float]],
+) -> None:
+    metrics, signals, candidates = _catalog(seed=7)
+    distances = {f"inst-{i}": d for i, d in enumerate([0.5, 1.0, 4.0, 10.0, 12.0, 45.0] * 7)}
+    query = ParsedQuery(
+        original_query="lessons",
+        service_query="lessons",
+        parsing_mode="regex",
+        audience_hint=audience_hint,
+        skill_level=skill_level,
+        max_price=max_price,
+    )
+
+    expected = _rank(_repository(metrics, signals, distances), candidates, query, location)
+
+    store = RankingSignalStore()
+    # With a non-DB repository the scalar path uses the default pricing config.
+    founding_boost = RankingService._resolve_founding_boost(DEFAULT_PRICING_CONFIG)
+    assert store.load(_repository(metrics, signals), founding_boost) == len(metrics)
+    ranking_snapshot.refresher.current = store
+    repo = _repository(metrics, signals, distances)
+    actual = _rank(repo, candidates, query, location)
+
+    assert _scores(actual) == pytest.approx(_scores(expected))
+    # Only the three unknown instructors are read from the database.
+    fetched = repo.get_instructor_metrics.call_args.args[0]
+    assert set(fetched) <= {f"inst-{i}" for i in range(40, 43)}
+    repo.get_service_audience.assert_not_called()
+    repo.get_service_skill_levels.assert_not_called()
+    repo.get_global_average_rating.assert_not_called()
+
+
+def test_stale_marks_read_through_until_rebuild() -> None:
+    metrics, signals, candidates = _catalog(seed=3, instructors=5, services=10)
+    candidates = [c for c in candidates if c.instructor_id in metrics]
+    store = RankingSignalStore()
+    store.build(metrics, signals, global_avg_rating=4.3, founding_boost=1.0)
+    ranking_snapshot.refresher.current = store
+    query = ParsedQuery(
+        original_query="piano", service_query="piano", parsing_mode="regex", skill_level="beginner"
+    )
+
+    repo = _repository(metrics, signals)
+    _rank(repo, candidates, query)
+    repo.get_instructor_metrics.assert_not_called()
+
+    target = candidates[0]
+    updated = {**metrics[target.instructor_id], "review_count": 99, "avg_rating": 5.0}
+    ranking_snapshot.note_ranking_signal_change(instructor_id=target.instructor_id)
+    ranking_snapshot.note_ranking_signal_change(service_id=target.service_id)
+    repo = _repository({**metrics, target.instructor_id: updated}, signals)
+    results = _rank(repo, candidates, query)
+
+    assert repo.get_instructor_metrics.call_args.args[0] == [target.instructor_id]
+    assert repo.get_service_skill_levels.call_args.args[0] == [target.service_id]
+    result = next(r for r in results if r.service_id == target.service_id)
+    assert result.quality_score == pytest.approx((5.0 * 99 + 4.3 * 5) / 104 / 5.0)
+
+    # A rebuild that read its rows after the write clears the marks.
+    store.build(metrics, signals, global_avg_rating=4.3, founding_boost=1.0)
+    assert store.stale_instructors == frozenset()
+    assert store.stale_services == frozenset()
+
+
+def test_marks_made_during_a_rebuild_survive_it() -> None:
+    store = RankingSignalStore()
+    store.build({}, {}, global_avg_rating=4.2, founding_boost=1.0)
+    read_started_at = ranking_snapshot.time.monotonic()
+    store.mark_stale(instructor_ids=["inst-1"])
+    store.build({}, {}, global_avg_rating=4.2, founding_boost=1.0, read_started_at=read_started_at)
+    assert store.stale_instructors == frozenset({"inst-1"})
+
+
+def test_store_is_ignored_when_disabled_or_not_built(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = RankingSignalStore()
+    ranking_snapshot.refresher.current = store
+    assert ranking_snapshot.get_ranking_signal_store() is None
+
+    store.build({}, {}, global_avg_rating=4.2, founding_boost=1.0)
+    assert ranking_snapshot.get_ranking_signal_store() is store
+
+    monkeypatch.setattr(ranking_snapshot.settings, "nl_search_ranking_snapshot_enabled", False)
+    assert ranking_snapshot.get_ranking_signal_store() is None
+    assert ranking_snapshot.refresher.start() is None
@@ -0,0 +1,83 @@
+# backend/tests/unit/services/search/test_snapshot_refresher.py
+"""Unit tests for the shared search snapshot refresher lifecycle."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.services.search.snapshot_refresher import SnapshotRefresher
+
+
+class _Structure:
+    def __init__(self) -> None:
+        self.ready = False
+        self.syncs = 0
+
+
+def _refresher(enabled: List[bool], *, fail: bool = False) -> SnapshotRefresher[_Structure]:
+    def _sync(target: _Structure) -> int:
+        target.syncs += 1
+        if fail:
+            raise RuntimeError("db down")
+        target.ready = True
+        return 3
+
+    return SnapshotRefresher(
+        "test structure",
+        log_prefix="[TEST]",
+        enabled=lambda: enabled[0],
+        create=_Structure,
+        sync=_sync,
+        interval_seconds=lambda: 0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_start_publishes_syncs_and_stop_clears() -> None:
+    refresher = _refresher([True])
+    task = refresher.start()
+    assert task is not None
+
+    for _ in range(50):
+        if refresher.current is not None and refresher.current.syncs >= 2:
+            break
+        await asyncio.sleep(0.01)
+
+    current = refresher.get()
+    assert current is not None and current.syncs >= 2
+
+    await refresher.stop(task)
+    assert task.cancelled()
+    assert refresher.current is None
+    assert refresher.get() is None
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_keeps_structure_unready_and_keeps_running() -> None:
+    refresher = _refresher([True], fail=True)
+    task = refresher.start()
+
+    for _ in range(50):
+        if refresher.current is not None and refresher.current.syncs >= 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert refresher.current is not None and refresher.current.syncs >= 2
+    assert refresher.get() is None
+    await refresher.stop(task)
+
+
+def test_disabled_refresher_neither_starts_nor_serves() -> None:
+    enabled = [False]
+    refresher = _refresher(enabled)
+    assert refresher.start() is None
+
+    structure = _Structure()
+    structure.ready = True
+    refresher.current = structure
+    assert refresher.get() is None
+    enabled[0] = True
+    assert refresher.get() is structure
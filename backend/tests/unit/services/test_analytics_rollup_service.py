@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories.analytics_rollup_repository import BookingRollupTotals, FunnelRollupTotals
+from app.schemas.admin_analytics import RevenueBreakdownBy
+import app.services.analytics_rollup_service as rollup_module
+from app.services.analytics_rollup_service import (
+    ROLLUP_NAME,
+    WATERMARK_OVERLAP,
+    AnalyticsRollupService,
+    contiguous_day_ranges,
+)
+import app.services.platform_analytics_service as platform_module
+from app.services.platform_analytics_service import PlatformAnalyticsService, _split_rollup_window
+
+NOW = datetime(2026, 3, 10, 14, 30, tzinfo=timezone.utc)
+
+
+def _at(day: int, hour: int = 0, minute: int = 0) -> datetime:
+    return datetime(2026, 3, day, hour, minute, tzinfo=timezone.utc)
+
+
+def test_contiguous_day_ranges_merges_runs_and_caps_length() -> None:
+    days = [date(2026, 3, 1), date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 7)]
+    assert contiguous_day_ranges(reversed(days)) == [
+        (date(2026, 3, 1), date(2026, 3, 4)),
+        (date(2026, 3, 7), date(2026, 3, 8)),
+    ]
+    assert contiguous_day_ranges(days[:3], max_days=2) == [
+        (date(2026, 3, 1), date(2026, 3, 3)),
+        (date(2026, 3, 3), date(2026, 3, 4)),
+    ]
+    assert contiguous_day_ranges([]) == []
+
+
+def _rollup_service(watermark: datetime | None) -> AnalyticsRollupService:
+    service = AnalyticsRollupService(MagicMock())
+    service.rollup_repo = MagicMock()
+    service.rollup_repo.get_watermark.return_value = watermark
+    service.rollup_repo.list_availability_changed_since.return_value = [
+        ("inst-1", date(2026, 3, 9), b"\x0f" + b"\x00" * 35),
+        ("inst-2", date(2026, 3, 9), b""),
+    ]
+    return service
+
+
+def test_refresh_backfills_history_without_a_watermark(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rollup_module.settings, "analytics_rollup_backfill_days", 40)
+    service = _rollup_service(None)
+
+    summary = service.refresh(now=NOW)
+
+    assert summary == {"days": 41, "availability_days": 2}
+    rebuilt = [call.args for call in service.rollup_repo.rebuild_days.call_args_list]
+    assert rebuilt == [
+        (date(2026, 1, 29), date(2026, 3, 1)),
+        (date(2026, 3, 1), date(2026, 3, 11)),
+    ]
+    service.rollup_repo.list_availability_changed_since.assert_called_once_with(None)
+    service.rollup_repo.upsert_available_slots.assert_called_once_with(
+        [("inst-1", date(2026, 3, 9), 4), ("inst-2", date(2026, 3, 9), 0)]
+    )
+    service.rollup_repo.set_watermark.assert_called_once_with(ROLLUP_NAME, NOW)
+
+
+def test_refresh_rebuilds_only_days_touched_since_the_watermark() -> None:
+    watermark = NOW - timedelta(minutes=15)
+    service = _rollup_service(watermark)
+    service.rollup_repo.list_changed_days.return_value = {
+        date(2026, 3, 10),
+        date(2026, 2, 14),
+        date(2026, 3, 9),
+    }
+
+    summary = service.refresh(now=NOW)
+
+    assert summary["days"] == 3
+    since = watermark - WATERMARK_OVERLAP
+    service.rollup_repo.list_changed_days.assert_called_once_with(since)
+    service.rollup_repo.list_availability_changed_since.assert_called_once_with(since)
+    assert [call.args for call in service.rollup_repo.rebuild_days.call_args_list] == [
+        (date(2026, 2, 14), date(2026, 2, 15)),
+        (date(2026, 3, 9), date(2026, 3, 11)),
+    ]
+    service.rollup_repo.set_watermark.assert_called_once_with(ROLLUP_NAME, NOW)
+
+
+def test_split_rollup_window_keeps_partial_days_raw() -> None:
+    window = _split_rollup_window(_at(2, 9), _at(9, 14), covered_until=date(2026, 3, 10))
+    assert window is not None
+    assert (window.first_day, window.end_day) == (date(2026, 3, 3), date(2026, 3, 9))
+    assert window.raw_ranges == (
+        (_at(2, 9), _at(3) - timedelta(microseconds=1)),
+        (_at(9), _at(9, 14)),
+    )
+
+    # Midnight-aligned periods need no head range; the rollup lag widens the tail.
+    window = _split_rollup_window(_at(1), _at(9, 14), covered_until=date(2026, 3, 7))
+    assert window is not None
+    assert (window.first_day, window.end_day) == (date(2026, 3, 1), date(2026, 3, 7))
+    assert window.raw_ranges == ((_at(7), _at(9, 14)),)
+
+    assert _split_rollup_window(_at(9), _at(9, 14), covered_until=date(2026, 3, 10)) is None
+    assert _split_rollup_window(_at(1), _at(9, 14), covered_until=date(2026, 3, 1)) is None
+
+
+_BOOKINGS = [
+    # (start, status, total_price, payout cents)
+    (_at(2, 8), "COMPLETED", "80.00", 6400),
+    (_at(3, 0), "COMPLETED", "50.00", 4000),
+    (_at(4, 12), "CANCELLED", "40.00", None),
+    (_at(4, 13), "COMPLETED", "120.00", 9600),
+    (_at(6, 23, 59), "CONFIRMED", "60.00", None),
+    (_at(9, 10), "COMPLETED", "70.00", 5600),
+]
+
+
+def _booking(start: datetime, status: str, price: str, payout: int | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        booking_start_utc=start,
+        status=status,
+        total_price=Decimal(price),
+        payment_detail=SimpleNamespace(instructor_payout_amount=payout),
+    )
+
+
+def _raw_bookings(*, start: datetime, end: datetime, **_kwargs: object) -> list[SimpleNamespace]:
+    return [_booking(*row) for row in _BOOKINGS if start <= row[0] <= end]
+
+
+def _booking_rollups(
+    *, start_day: date, end_day: date, by_day: bool = False, by_category: bool = False
+) -> list[BookingRollupTotals]:
+    groups: dict[tuple[date | None, str], BookingRollupTotals] = {}
+    for start, status, price, payout in _BOOKINGS:
+        if not start_day <= start.date() < end_day:
+            continue
+        key = (start.date() if by_day else None, status)
+        totals = groups.setdefault(
+            key,
+            BookingRollupTotals(
+                status=status, bookings=0, gmv=Decimal("0"), instructor_payout_cents=0, day=key[0]
+            ),
+        )
+        totals.bookings += 1
+        totals.gmv += Decimal(price)
+        totals.instructor_payout_cents += payout or 0
+    return list(groups.values())
+
+
+def _platform_service(
+    monkeypatch: pytest.MonkeyPatch, *, enabled: bool
+) -> PlatformAnalyticsService:
+    monkeypatch.setattr(platform_module.settings, "analytics_rollups_enabled", enabled)
+    service = PlatformAnalyticsService(MagicMock())
+    service.analytics_repo = MagicMock()
+    service.analytics_repo.list_bookings_by_start.side_effect = _raw_bookings
+    service.rollup_repo = MagicMock()
+    service.rollup_repo.get_watermark.return_value = _at(8, 0, 5)
+    service.rollup_repo.sum_booking_rollups.side_effect = _booking_rollups
+    return service
+
+
+def test_booking_summary_and_breakdown_match_raw_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    start, end = _at(2, 8), _at(9, 14)
+    raw = _platform_service(monkeypatch, enabled=False)
+    expected_summary = raw._summarize_bookings(start, end)
+    expected_days = raw._build_revenue_breakdown(start, end, RevenueBreakdownBy.DAY)
+    expected_weeks = raw._build_revenue_breakdown(start, end, RevenueBreakdownBy.WEEK)
+    raw.rollup_repo.get_watermark.assert_not_called()
+
+    rolled = _platform_service(monkeypatch, enabled=True)
+    assert rolled._summarize_bookings(start, end) == expected_summary
+    assert rolled._build_revenue_breakdown(start, end, RevenueBreakdownBy.DAY) == expected_days
+    assert rolled._build_revenue_breakdown(start, end, RevenueBreakdownBy.WEEK) == expected_weeks
+
+    # Whole days come from the rollups; only the edges hit raw bookings.
+    raw_calls = {
+        (call.kwargs["start"], call.kwargs["end"])
+        for call in rolled.analytics_repo.list_bookings_by_start.call_args_list
+    }
+    assert raw_calls == {(_at(2, 8), _at(3) - timedelta(microseconds=1)), (_at(8), end)}
+    rolled.rollup_repo.get_watermark.assert_called_once_with(ROLLUP_NAME)
+
+
+def test_funnel_counts_add_rollup_days_to_raw_edges(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _platform_service(monkeypatch, enabled=True)
+    service.rollup_repo.sum_funnel_rollups.return_value = FunnelRollupTotals(searches=100)
+    service.analytics_repo.count_search_events.return_value = 7
+
+    count = service._sum_with_rollups(
+        _at(2, 8),
+        _at(9, 14),
+        lambda window: service._funnel_rollups(window).searches,
+        lambda s, e: service.analytics_repo.count_search_events(start=s, end=e),
+    )
+    # Funnel totals are cached per window, so later funnel metrics reuse the query.
+    service._funnel_rollups(_split_rollup_window(_at(2, 8), _at(9, 14), date(2026, 3, 8)))
+
+    assert count == 100 + 7 * 2
+    service.rollup_repo.sum_funnel_rollups.assert_called_once_with(
+        start_day=date(2026, 3, 3), end_day=date(2026, 3, 8)
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.services.availability_service import AvailabilityService
+from app.utils.bitset import bits_from_windows
+
+TODAY = date(2026, 3, 2)
+
+
+def _service(rows, *, bookings=(), blackouts=(), earliest=(None, None)):
+    config_service = MagicMock()
+    config_service.get_default_buffer_minutes.return_value = 0
+    service = AvailabilityService(MagicMock(), config_service=config_service)
+    service.instructor_repository = MagicMock()
+    service.instructor_repository.get_by_user_id.return_value = None
+    bitmap_repo = MagicMock()
+    bitmap_repo.get_days_in_range.return_value = [
+        SimpleNamespace(day_date=day, bits=bits_from_windows(windows), format_tags=None)
+        for day, windows in rows.items()
+    ]
+    service._bitmap_repo = MagicMock(return_value=bitmap_repo)
+    service.conflict_repository = MagicMock()
+    service.conflict_repository.get_bookings_for_date_range.return_value = list(bookings)
+    service.repository = MagicMock()
+    service.repository.get_future_blackout_dates.return_value = [
+        SimpleNamespace(date=day) for day in blackouts
+    ]
+    service._resolve_earliest_allowed_booking = MagicMock(return_value=earliest)
+    return service, bitmap_repo
+
+
+def test_find_next_bookable_slot_skips_blackouts_and_short_windows() -> None:
+    tomorrow = TODAY + timedelta(days=1)
+    later = TODAY + timedelta(days=2)
+    service, bitmap_repo = _service(
+        {
+            later: [("08:00:00", "09:00:00")],
+            TODAY: [("09:00:00", "12:00:00")],
+            tomorrow: [("10:00:00", "10:30:00"), ("14:05:00", "16:00:00")],
+        },
+        blackouts=[TODAY],
+    )
+
+    end = TODAY + timedelta(days=6)
+    assert service.find_next_bookable_slot("inst", TODAY, end, 60) == (tomorrow, time(14, 15))
+    assert service.find_next_bookable_slot("inst", TODAY, end, 30) == (tomorrow, time(10, 0))
+    assert service.find_next_bookable_slot("inst", TODAY, end, 180) is None
+
+    # Horizon data is loaded with one range query per call, never per day
+    assert bitmap_repo.get_days_in_range.call_count == 3
+    assert service.conflict_repository.get_bookings_for_date_range.call_count == 3
+
+
+def test_find_next_bookable_slot_subtracts_bookings() -> None:
+    booking = SimpleNamespace(
+        booking_date=TODAY,
+        start_time=time(9, 0),
+        end_time=time(10, 0),
+        location_type="online",
+    )
+    service, _ = _service({TODAY: [("09:00:00", "11:00:00")]}, bookings=[booking])
+
+    assert service.find_next_bookable_slot("inst", TODAY, TODAY, 60) == (TODAY, time(10, 0))
+    assert service.find_next_bookable_slot("inst", TODAY, TODAY, 90) is None
+
+
+def test_find_next_bookable_slot_applies_advance_notice() -> None:
+    tomorrow = TODAY + timedelta(days=1)
+    service, bitmap_repo = _service(
+        {tomorrow: [("09:00:00", "12:00:00")]},
+        earliest=(tomorrow, 10 * 60 + 30),
+    )
+
+    assert service.find_next_bookable_slot("inst", TODAY, tomorrow, 60) == (tomorrow, time(10, 30))
+    bitmap_repo.get_days_in_range.assert_called_once_with("inst", tomorrow, tomorrow)
+
+    service, bitmap_repo = _service({}, earliest=(tomorrow + timedelta(days=1), 0))
+    assert service.find_next_bookable_slot("inst", TODAY, tomorrow, 60) is None
+    bitmap_repo.get_days_in_range.assert_not_called()
@@ -416,8 +416,8 @@ def test_compute_public_availability_exercises_merge_trim_and_buffer_edge_paths(
         lambda *_: datetime(2030, 1, 6, 10, 0, tzinfo=timezone.utc),
     )
     monkeypatch.setattr(
-        "app.services.availability_service.windows_from_bits",
-        lambda _bits: [("09:00:00", "10:00:00"), ("09:30:00", "10:30:00")],
+        "app.services.availability_service.minute_windows_from_bits",
+        lambda _bits: [(9 * 60, 10 * 60), (9 * 60 + 30, 10 * 60 + 30)],
     )
     monkeypatch.setattr(
         ConfigService,
@@ -0,0 +1,191 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.services.badge_award_service import BadgeAwardService
+from app.services.badge_facts import StudentBadgeFacts, chunked
+
+NOW = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _definition(slug, criteria_type="milestone", criteria_config=None):
+    return SimpleNamespace(
+        id=f"DEF_{slug.upper()}",
+        slug=slug,
+        name=f"Badge {slug}",
+        criteria_type=criteria_type,
+        criteria_config=criteria_config or {},
+        is_active=True,
+    )
+
+
+def _lessons(instructors, *, start=NOW - timedelta(days=30)):
+    return [
+        {
+            "booking_id": f"b{idx}",
+            "instructor_id": instructor_id,
+            "completed_at": start + timedelta(days=idx),
+            "booked_at": start + timedelta(days=idx, hours=-2),
+        }
+        for idx, instructor_id in enumerate(instructors)
+    ]
+
+
+def _service(definitions, *, lessons, categories=None, reviews=None, awards=None):
+    service = BadgeAwardService.__new__(BadgeAwardService)
+    service.db = MagicMock()
+    service.repository = MagicMock()
+    service.user_repository = MagicMock()
+    service.cache_service = None
+    service.notification_service = None
+
+    repo = service.repository
+    repo.list_active_badge_definitions.return_value = definitions
+    repo.list_badge_awards_for_students.side_effect = lambda ids: {
+        sid: (awards or {}).get(sid, []) for sid in ids
+    }
+    repo.list_completed_lessons_for_students.side_effect = lambda ids: {
+        sid: lessons.get(sid, []) for sid in ids
+    }
+    repo.count_completed_lessons_by_category_for_students.side_effect = lambda ids: {
+        sid: (categories or {}).get(sid, {}) for sid in ids
+    }
+    repo.get_review_stats_for_students.side_effect = lambda ids, since_utc=None: {
+        sid: (reviews or {}).get(sid, {"count": 0, "avg_rating": 0.0}) for sid in ids
+    }
+    repo.get_cancel_noshow_rates_for_students.side_effect = lambda ids, _now, _window: {
+        sid: 0.0 for sid in ids
+    }
+    repo.bulk_insert_awards.side_effect = lambda rows, now_utc: [
+        (row["student_id"], row["badge_id"]) for row in rows
+    ]
+    service.user_repository.get_by_ids.return_value = []
+    return service
+
+
+def test_student_badge_facts_derives_counts_in_memory():
+    facts = StudentBadgeFacts(
+        student_id="s1",
+        completed_lessons=_lessons(["i1", "i2", "i1", "i1"]),
+        category_counts={"music": 1, "art": 2},
+        user_tz=timezone.utc,
+    )
+
+    assert facts.total_completed == 4
+    assert facts.distinct_instructors == 2
+    assert facts.max_lessons_single_instructor == 3
+    assert facts.distinct_categories == 2
+    assert facts.has_rebook is True
+    assert facts.week_streak(None, grace_days=1) >= 1
+    assert StudentBadgeFacts(student_id="s2").week_streak(NOW, grace_days=1) == 0
+    assert [len(chunk) for chunk in chunked(range(5), 2)] == [2, 2, 1]
+
+
+def test_backfill_badges_for_students_uses_grouped_reads_and_bulk_writes():
+    welcome = _definition("welcome_aboard", criteria_config={"goal": 1, "hold_hours": 24})
+    first_steps = _definition("first_steps", criteria_config={"goal": 3})
+    explorer = _definition(
+        "explorer",
+        "exploration",
+        {"show_after_total_lessons": 2, "distinct_categories": 2, "min_overall_avg_rating": 4.0},
+    )
+    top_student = _definition(
+        "top_student",
+        "quality",
+        {
+            "min_total_lessons": 3,
+            "min_reviews": 1,
+            "min_avg_rating": 4.5,
+            "distinct_instructors_min": 2,
+        },
+    )
+    service = _service(
+        [welcome, first_steps, explorer, top_student],
+        lessons={"s1": _lessons(["i1", "i2", "i1"]), "s2": _lessons(["i1"])},
+        categories={"s1": {"music": 2, "art": 1}, "s2": {"music": 1}},
+        reviews={"s1": {"count": 2, "avg_rating": 5.0}},
+        awards={"s1": [{"badge_id": welcome.id, "status": "confirmed"}]},
+    )
+
+    summary = service.backfill_badges_for_students(["s1", "s2", "s1"], NOW, dry_run=False)
+
+    assert summary["processed_users"] == 2
+    assert summary["milestones"] == 2  # s1 first_steps, s2 welcome_aboard
+    assert summary["explorer"] == 1
+    assert summary["quality_pending"] == 1
+    assert summary["skipped_existing"] == 1  # s1 already holds welcome_aboard
+
+    repo = service.repository
+    repo.count_completed_lessons.assert_not_called()
+    repo.upsert_progress.assert_not_called()
+    repo.list_completed_lessons_for_students.assert_called_once_with(["s1", "s2"])
+    repo.bulk_upsert_progress.assert_called_once()
+    progress_rows = repo.bulk_upsert_progress.call_args.args[0]
+    assert len(progress_rows) == 6  # two milestones + explorer, per student
+
+    award_rows = repo.bulk_insert_awards.call_args.args[0]
+    assert sorted((row["student_id"], row["badge_id"]) for row in award_rows) == [
+        ("s1", explorer.id),
+        ("s1", first_steps.id),
+        ("s1", top_student.id),
+        ("s2", welcome.id),
+    ]
+    welcome_row = next(row for row in award_rows if row["badge_id"] == welcome.id)
+    assert welcome_row["hold_hours"] == 24
+    assert welcome_row["progress_snapshot"] == {"current": 1, "goal": 1}
+
+
+def test_backfill_badges_for_students_dry_run_skips_writes():
+    service = _service(
+        [_definition("welcome_aboard", criteria_config={"goal": 1})],
+        lessons={"s1": _lessons(["i1"])},
+    )
+
+    summary = service.backfill_badges_for_students(["s1"], NOW, dry_run=True)
+
+    assert summary["milestones"] == 1
+    service.repository.bulk_upsert_progress.assert_not_called()
+    service.repository.bulk_insert_awards.assert_not_called()
+
+
+def test_finalize_pending_badges_evaluates_from_prefetched_facts():
+    milestone = _definition(
+        "first_steps", criteria_config={"goal": 3, "counts": "completed_lessons"}
+    )
+    momentum = _definition(
+        "momentum_starter",
+        "velocity",
+        {"window_days_to_book": 7, "window_days_to_complete": 7, "same_instructor_required": True},
+    )
+    service = _service(
+        [milestone, momentum],
+        lessons={"s1": _lessons(["i1", "i1", "i1"]), "s2": _lessons(["i1", "i2"])},
+    )
+    awards = {
+        ("s1", milestone.id): SimpleNamespace(student_id="s1"),
+        ("s1", momentum.id): SimpleNamespace(student_id="s1"),
+        ("s2", milestone.id): SimpleNamespace(student_id="s2"),
+        ("s2", momentum.id): SimpleNamespace(student_id="s2"),
+    }
+    service.repository.get_pending_awards_due.return_value = [
+        (awards[("s1", milestone.id)], milestone),
+        (awards[("s1", momentum.id)], momentum),
+        (awards[("s2", milestone.id)], milestone),
+        (awards[("s2", momentum.id)], momentum),
+    ]
+
+    @contextmanager
+    def transaction():
+        yield service.db
+
+    service.repository.transaction = transaction
+
+    summary = service.finalize_pending_badges(NOW)
+
+    assert summary == {"confirmed": 2, "revoked": 2}
+    confirmed = [call.args[0] for call in service.repository.mark_award_confirmed.call_args_list]
+    assert confirmed == [awards[("s1", milestone.id)], awards[("s1", momentum.id)]]
+    service.repository.list_completed_lessons_for_students.assert_called_once_with(["s1", "s2"])
+    service.repository.count_completed_lessons.assert_not_called()
+    service.repository.list_completed_lessons.assert_not_called()
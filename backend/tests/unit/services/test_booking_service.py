@@ -1468,13 +1468,13 @@ def test_get_instructor_availability_windows_filters_by_range(
 ) -> None:
     with (
         patch("app.repositories.availability_day_repository.AvailabilityDayRepository") as repo_cls,
-        patch("app.utils.bitset.windows_from_bits") as windows_from_bits,
+        patch("app.utils.bitset.minute_windows_from_bits") as minute_windows_from_bits,
     ):
         repo_cls.return_value.get_day_bits.return_value = b"\xff"
-        windows_from_bits.return_value = [
-            ("06:00:00", "08:00:00"),
-            ("09:00:00", "11:00:00"),
-            ("22:00:00", "23:00:00"),
+        minute_windows_from_bits.return_value = [
+            (6 * 60, 8 * 60),
+            (9 * 60, 11 * 60),
+            (22 * 60, 23 * 60),
         ]
 
         result = booking_service._get_instructor_availability_windows(
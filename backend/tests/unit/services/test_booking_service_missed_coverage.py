@@ -720,21 +720,6 @@ class TestGetBookingEndUtcFallback:
         assert result == dt
 
 
-@pytest.mark.unit
-class TestBitmapStrToMinutes:
-    def test_normal_time(self):
-        from app.services.booking_service import BookingService
-
-        result = BookingService._bitmap_str_to_minutes("10:30:00")
-        assert result == 630
-
-    def test_midnight_24(self):
-        from app.services.booking_service import BookingService
-
-        result = BookingService._bitmap_str_to_minutes("24:00:00")
-        assert result == 1440
-
-
 @pytest.mark.unit
 class TestBuildConflictDetails:
     def test_details_structure(self):
@@ -0,0 +1,133 @@
+"""Unit tests for the per-worker L1 cache tier and its CacheService integration."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+import app.services.cache_l1 as cache_l1_module
+from app.services.cache_l1 import (
+    L1_INVALIDATION_CHANNEL,
+    L1Cache,
+    apply_invalidation_message,
+    build_invalidation_message,
+)
+from app.services.cache_service import CacheService
+
+
+def _l1(**overrides) -> L1Cache:
+    options = {"max_entries": 3, "ttl_seconds": 30, "prefixes": ("catalog:", "parsed:")}
+    options.update(overrides)
+    l1 = L1Cache(**options)
+    l1.listening = True
+    return l1
+
+
+def test_l1_evicts_least_recently_used_and_expired(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(cache_l1_module.time, "monotonic", lambda: clock[0])
+    l1 = _l1()
+
+    for key in ("catalog:a", "catalog:b", "catalog:c"):
+        l1.set(key, key)
+    assert l1.get("catalog:a") == (True, "catalog:a")
+    l1.set("catalog:d", "d")
+
+    assert l1.get("catalog:b") == (False, None)
+    assert l1.get("catalog:a")[0] is True
+
+    clock[0] += 31
+    assert l1.get("catalog:a") == (False, None)
+    assert len(l1) == 2
+
+
+def test_l1_skips_fill_that_raced_an_invalidation() -> None:
+    l1 = _l1()
+    version = l1.version
+    l1.delete("catalog:a")
+
+    l1.set("catalog:a", "stale", if_version=version)
+
+    assert l1.get("catalog:a") == (False, None)
+
+
+def test_l1_pattern_eligibility() -> None:
+    l1 = _l1()
+
+    assert l1.may_match_pattern("catalog:services:*")
+    assert l1.may_match_pattern("cat*")
+    assert l1.may_match_pattern("*")
+    assert not l1.may_match_pattern("avail:*")
+    assert not l1.is_eligible("search:v1:abc")
+
+
+def test_apply_invalidation_message_ignores_own_origin() -> None:
+    l1 = _l1()
+    l1.set("catalog:a", "a")
+    l1.set("catalog:services:1", "s")
+
+    assert apply_invalidation_message(build_invalidation_message(keys=["catalog:a"]), l1) == 0
+
+    remote = json.dumps(
+        {"origin": "other-worker", "keys": ["catalog:a"], "patterns": ["catalog:services:*"]}
+    )
+    assert apply_invalidation_message(remote, l1) == 2
+    assert len(l1) == 0
+    assert apply_invalidation_message("not json", l1) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_service_serves_repeat_reads_from_l1() -> None:
+    redis = AsyncMock()
+    redis.get.return_value = json.dumps({"items": [1]})
+    cache = CacheService(redis_client=redis)
+    cache.force_memory_cache = False
+    cache.l1 = _l1()
+
+    assert await cache.get("catalog:browse") == {"items": [1]}
+    assert await cache.get("catalog:browse") == {"items": [1]}
+    assert await cache.get("avail:week:x") == {"items": [1]}
+
+    assert redis.get.await_count == 2
+    stats = cache._calculate_basic_stats()
+    assert (stats["l1_hits"], stats["l1_misses"]) == (1, 1)
+    assert (stats["l2_hits"], stats["l2_misses"]) == (2, 0)
+    assert len(cache.l1) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_service_writes_evict_locally_and_publish() -> None:
+    redis = AsyncMock()
+    redis.get.return_value = '"v1"'
+    cache = CacheService(redis_client=redis)
+    cache.force_memory_cache = False
+    cache.l1 = _l1()
+    await cache.get("catalog:browse")
+
+    assert await cache.set("catalog:browse", "v2") is True
+    assert cache.l1.get("catalog:browse") == (False, None)
+    channel, message = redis.publish.await_args.args
+    assert channel == L1_INVALIDATION_CHANNEL
+    assert json.loads(message)["keys"] == ["catalog:browse"]
+
+    redis.publish.reset_mock()
+    await cache.set("avail:week:x", "v")
+    redis.publish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cache_service_bypasses_l1_without_listener() -> None:
+    redis = AsyncMock()
+    redis.get.return_value = '"v"'
+    cache = CacheService(redis_client=redis)
+    cache.force_memory_cache = False
+    cache.l1 = _l1()
+    cache.l1.listening = False
+
+    await cache.get("catalog:browse")
+    await cache.get("catalog:browse")
+
+    assert redis.get.await_count == 2
+    assert len(cache.l1) == 0
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from datetime import date, datetime, timedelta, timezone
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -98,19 +98,24 @@ async def test_delete_pattern_redis_none_returns_zero() -> None:
     assert await cache._delete_pattern_redis("missing:*") == 0
 
 
-@pytest.mark.asyncio
-async def test_delete_pattern_redis_counts_deletes() -> None:
+def _pipelined_redis(scan_pages: list[tuple[int, list[str]]], unlink_results: list[int]):
     redis_client = AsyncMock()
+    redis_client.scan = AsyncMock(side_effect=scan_pages)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=unlink_results)
+    redis_client.pipeline = MagicMock(return_value=pipe)
+    return redis_client, pipe
 
-    async def _scan_iter(match: str):
-        yield "key-1"
 
-    redis_client.scan_iter = _scan_iter
-    redis_client.delete = AsyncMock(return_value=1)
+@pytest.mark.asyncio
+async def test_delete_pattern_redis_counts_deletes() -> None:
+    redis_client, pipe = _pipelined_redis([(0, ["key-1"])], [1])
     cache = CacheService(redis_client=redis_client)
     cache.force_memory_cache = False
 
     assert await cache._delete_pattern_redis("key-*") == 1
+    pipe.unlink.assert_called_once_with("key-1")
+    redis_client.delete.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -301,14 +306,7 @@ async def test_delete_pattern_handles_backend_exception(monkeypatch: pytest.Monk
 
 @pytest.mark.asyncio
 async def test_delete_pattern_redis_skips_non_deleted_entries() -> None:
-    redis_client = AsyncMock()
-
-    async def _scan_iter(match: str):
-        yield "key-1"
-        yield "key-2"
-
-    redis_client.scan_iter = _scan_iter
-    redis_client.delete = AsyncMock(side_effect=[1, 0])
+    redis_client, _pipe = _pipelined_redis([(0, ["key-1", "key-2"])], [1, 0])
     cache = CacheService(redis_client=redis_client)
     cache.force_memory_cache = False
     assert await cache._delete_pattern_redis("key-*") == 1
@@ -0,0 +1,95 @@
+"""Unit tests for pipelined and generation-based CacheService invalidation."""
+
+from __future__ import annotations
+
+from datetime import date
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.cache_service import CacheKeyBuilder, CacheService
+
+
+def _memory_cache() -> CacheService:
+    cache = CacheService(redis_client=None)
+    cache.force_memory_cache = True
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_bump_generation_hides_versioned_entries() -> None:
+    cache = _memory_cache()
+    scope = CacheKeyBuilder.availability_scope("inst")
+
+    assert await cache.set_versioned("public_availability:inst:x", scope, {"v": 1}, ttl=60)
+    assert await cache.get_versioned("public_availability:inst:x", scope) == {"v": 1}
+
+    assert await cache.bump_generation(scope) == 1
+    assert await cache.get_versioned("public_availability:inst:x", scope) is None
+
+    assert await cache.set_versioned("public_availability:inst:x", scope, {"v": 2}, ttl=60)
+    assert await cache.get_versioned("public_availability:inst:x", scope) == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_reads_value_and_generation_in_one_round_trip() -> None:
+    redis_client = AsyncMock()
+    redis_client.mget.return_value = [json.dumps({"g": 3, "v": [1]}), "3"]
+    cache = CacheService(redis_client=redis_client)
+    cache.force_memory_cache = False
+
+    assert await cache.get_versioned("avail:range:inst:a:b", "avail:inst") == [1]
+    redis_client.mget.assert_awaited_once_with(["avail:range:inst:a:b", "gen:avail:inst"])
+    redis_client.get.assert_not_awaited()
+
+    redis_client.mget.return_value = [json.dumps({"g": 3, "v": [1]}), "4"]
+    assert await cache.get_versioned("avail:range:inst:a:b", "avail:inst") is None
+
+    # Entries written before versioning have no envelope and are treated as misses.
+    redis_client.mget.return_value = [json.dumps([1]), None]
+    assert await cache.get_versioned("avail:range:inst:a:b", "avail:inst") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_with_dates_bumps_generation_and_unlinks_week_keys() -> None:
+    redis_client = AsyncMock()
+    redis_client.incr.return_value = 5
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 0])
+    redis_client.pipeline = MagicMock(return_value=pipe)
+    cache = CacheService(redis_client=redis_client)
+    cache.force_memory_cache = False
+
+    await cache.invalidate_instructor_availability("inst", [date(2025, 7, 16), date(2025, 7, 17)])
+
+    redis_client.incr.assert_awaited_once_with("gen:avail:inst")
+    redis_client.scan.assert_not_awaited()
+    assert [call.args[0] for call in pipe.unlink.call_args_list] == [
+        "avail:week:inst:2025-07-14",
+        "avail:week:inst:2025-07-14:with_slots",
+    ]
+    assert cache._stats["availability_invalidations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_pattern_redis_unlinks_each_scan_page_in_one_pipeline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("app.services.cache_service.settings.cache_scan_count", 250)
+    redis_client = AsyncMock()
+    redis_client.scan = AsyncMock(side_effect=[(42, ["a", "b"]), (0, []), (0, ["c"])])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=[[1, 1], [1]])
+    redis_client.pipeline = MagicMock(return_value=pipe)
+    cache = CacheService(redis_client=redis_client)
+    cache.force_memory_cache = False
+
+    assert await cache._delete_pattern_redis("avail:*") == 2
+    assert redis_client.scan.await_count == 2
+    assert redis_client.scan.await_args_list[0].kwargs == {
+        "cursor": 0,
+        "match": "avail:*",
+        "count": 250,
+    }
+    redis_client.pipeline.assert_called_once_with(transaction=False)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import app.services.geoip_table as geoip_module
+from app.services.geoip_table import GeoIPTable, build_geoip_table, write_geoip_table
+from app.services.geolocation_service import GeolocationService
+
+ROWS = [
+    {
+        "network": "203.0.113.0/24",
+        "country_code": "US",
+        "state": "New York",
+        "city": "Brooklyn",
+        "latitude": "40.65",
+        "longitude": "-73.95",
+    },
+    {
+        "start_ip": "198.51.100.10",
+        "end_ip": "198.51.100.20",
+        "country_code": "US",
+        "state": "California",
+        "city": "San Francisco",
+    },
+    # Overlaps the /24 above and is skipped.
+    {"network": "203.0.113.128/25", "country_code": "CA", "city": "Toronto"},
+    {"network": "2001:db8:1::/48", "country_code": "US", "state": "NY", "city": "Queens"},
+]
+
+
+def test_lookup_finds_covering_range_with_nyc_enrichment() -> None:
+    table = GeoIPTable(build_geoip_table(ROWS))
+
+    assert (table.ipv4_ranges, table.ipv6_ranges) == (2, 1)
+    brooklyn = table.lookup("203.0.113.200")
+    assert brooklyn is not None
+    assert brooklyn["city"] == "New York"
+    assert brooklyn["borough"] == "Brooklyn"
+    assert brooklyn["is_nyc"] is True
+    assert brooklyn["latitude"] == 40.65
+
+    assert table.lookup("198.51.100.10")["city"] == "San Francisco"
+    assert table.lookup("198.51.100.20")["is_nyc"] is False
+    assert table.lookup("::ffff:203.0.113.1")["borough"] == "Brooklyn"
+    assert table.lookup("2001:db8:1:ffff::1")["borough"] == "Queens"
+
+    for miss in ("198.51.100.21", "198.51.100.9", "1.1.1.1", "2001:db8:2::1", "not-an-ip"):
+        assert table.lookup(miss) is None
+
+
+def test_lookup_returns_copies() -> None:
+    table = GeoIPTable(build_geoip_table(ROWS))
+    table.lookup("203.0.113.5")["city"] = "mutated"
+    assert table.lookup("203.0.113.5")["city"] == "New York"
+
+
+def test_empty_and_invalid_tables() -> None:
+    assert GeoIPTable(build_geoip_table([])).lookup("203.0.113.5") is None
+    with pytest.raises(ValueError):
+        GeoIPTable(b"not a table")
+
+
+@pytest.mark.asyncio
+async def test_written_table_is_memory_mapped_and_served_without_http(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "ranges.csv"
+    csv_path.write_text(
+        "network,country_code,state,city\n"
+        "74.125.0.0/16,US,New York,Queens\n"
+        "2001:db8::/32,US,Texas,Austin\n"
+    )
+    output = tmp_path / "geoip.bin"
+
+    assert write_geoip_table(csv_path, output) == {"ipv4_ranges": 1, "ipv6_ranges": 1}
+
+    monkeypatch.setattr(geoip_module.settings, "geoip_database_path", str(output))
+    monkeypatch.setattr(geoip_module, "_table_path", None)
+    monkeypatch.setattr(geoip_module, "_table", None)
+    service = GeolocationService(MagicMock())
+    service._lookup_with_fallback = MagicMock(side_effect=AssertionError("no HTTP"))
+
+    queens = await service.get_location_from_ip("74.125.3.9")
+    assert queens["borough"] == "Queens"
+    assert await service.get_location_from_ip("8.8.8.8") == service._get_default_location()
+    assert geoip_module.get_geoip_table() is geoip_module.get_geoip_table()
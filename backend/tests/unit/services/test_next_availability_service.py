@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.constants import NEXT_AVAILABILITY_DURATIONS, NEXT_AVAILABILITY_LOCATION_TYPES
+from app.services.next_availability_refresh import schedule_next_availability_refresh
+import app.services.next_availability_service as next_availability_module
+from app.services.next_availability_service import (
+    NextAvailabilityService,
+    find_first_bookable_slot,
+)
+
+TODAY = date(2026, 3, 2)
+
+
+def test_find_first_bookable_slot_aligns_start_and_skips_blackouts() -> None:
+    windows = {
+        TODAY.isoformat(): [(time(13, 0), time(13, 30)), (time(8, 0), time(8, 20))],
+        (TODAY + timedelta(days=1)).isoformat(): [(time(9, 5), time(11, 0))],
+    }
+
+    assert find_first_bookable_slot(windows, 30) == (TODAY, time(13, 0))
+    assert find_first_bookable_slot(windows, 60) == (TODAY + timedelta(days=1), time(9, 15))
+    assert find_first_bookable_slot(windows, 30, skip_dates=[TODAY]) == (
+        TODAY + timedelta(days=1),
+        time(9, 15),
+    )
+    assert find_first_bookable_slot(windows, 120) is None
+
+
+def _service(windows_by_location: dict[str, dict[str, list[tuple[time, time]]]]):
+    availability_service = MagicMock()
+    availability_service.repository.get_future_blackout_dates.return_value = [
+        SimpleNamespace(date=TODAY)
+    ]
+    availability_service.compute_public_availability.side_effect = (
+        lambda _id, _start, _end, *, requested_location_type: windows_by_location.get(
+            requested_location_type, {}
+        )
+    )
+    service = NextAvailabilityService(MagicMock(), availability_service=availability_service)
+    service.user_repository = MagicMock()
+    service.user_repository.get_by_id.return_value = SimpleNamespace(timezone="America/New_York")
+    service.repository = MagicMock()
+    return service, availability_service
+
+
+def test_compute_rows_covers_every_indexed_combination(monkeypatch) -> None:
+    monkeypatch.setattr(next_availability_module, "get_user_today", lambda _user: TODAY)
+    tomorrow = TODAY + timedelta(days=1)
+    service, availability_service = _service(
+        {
+            "online": {
+                TODAY.isoformat(): [(time(9, 0), time(17, 0))],
+                tomorrow.isoformat(): [(time(18, 0), time(19, 0))],
+            },
+        }
+    )
+
+    rows = service._compute_rows("inst_1")
+
+    assert len(rows) == len(NEXT_AVAILABILITY_LOCATION_TYPES) * len(NEXT_AVAILABILITY_DURATIONS)
+    assert availability_service.compute_public_availability.call_count == len(
+        NEXT_AVAILABILITY_LOCATION_TYPES
+    )
+    by_key = {(row["location_type"], row["duration_minutes"]): row for row in rows}
+    # TODAY is blacked out, so online lessons fall to tomorrow evening.
+    online_60 = by_key[("online", 60)]
+    assert (online_60["next_date"], online_60["next_start_time"]) == (tomorrow, time(18, 0))
+    assert online_60["next_start_at"].isoformat() == "2026-03-03T23:00:00+00:00"
+    assert by_key[("online", 90)]["next_date"] is None
+    assert by_key[("student_location", 60)]["next_start_at"] is None
+    assert {row["horizon_end"] for row in rows} == {
+        TODAY + timedelta(days=next_availability_module.settings.public_availability_days - 1)
+    }
+
+
+def test_compute_rows_returns_empty_for_unknown_instructor() -> None:
+    service, availability_service = _service({})
+    service.user_repository.get_by_id.return_value = None
+
+    assert service._compute_rows("missing") == []
+    availability_service.compute_public_availability.assert_not_called()
+
+
+def test_refresh_stale_drains_batches_and_attempts_each_instructor_once() -> None:
+    service, _ = _service({})
+    # "b" stays stale after failing; the sweep must not pick it up again.
+    service.repository.list_instructor_ids_needing_refresh.side_effect = [["a", "b"], ["c"], []]
+    refreshed: list[str] = []
+
+    def _refresh(instructor_id: str) -> int:
+        if instructor_id == "b":
+            raise RuntimeError("boom")
+        refreshed.append(instructor_id)
+        return 15
+
+    service.refresh_instructor = _refresh  # type: ignore[method-assign]
+
+    assert service.refresh_stale(limit=2) == {"candidates": 3, "refreshed": 2, "failed": 1}
+    assert refreshed == ["a", "c"]
+    calls = service.repository.list_instructor_ids_needing_refresh.call_args_list
+    assert len(calls) == 3
+    assert calls[-1].kwargs["exclude_ids"] == {"a", "b", "c"}
+
+
+def test_refresh_stale_stops_when_time_budget_is_spent() -> None:
+    service, _ = _service({})
+    service.repository.list_instructor_ids_needing_refresh.return_value = ["a"]
+
+    assert service.refresh_stale(time_budget_seconds=0) == {
+        "candidates": 0,
+        "refreshed": 0,
+        "failed": 0,
+    }
+    service.repository.list_instructor_ids_needing_refresh.assert_not_called()
+
+
+def test_refresh_is_enqueued_after_commit_and_dropped_on_rollback(monkeypatch) -> None:
+    enqueued: list[tuple[str, tuple[str, ...]]] = []
+    monkeypatch.setattr(
+        "app.tasks.enqueue.enqueue_task",
+        lambda name, args=None, **_kwargs: enqueued.append((name, args)),
+    )
+    session = Session(create_engine("sqlite://"))
+
+    session.execute(text("SELECT 1"))
+    schedule_next_availability_refresh(session, "inst_1")
+    schedule_next_availability_refresh(session, "inst_1")
+    assert enqueued == []
+    session.commit()
+    assert enqueued == [("availability.refresh_next_available", ("inst_1",))]
+
+    session.execute(text("SELECT 1"))
+    schedule_next_availability_refresh(session, "inst_2")
+    session.rollback()
+    session.execute(text("SELECT 1"))
+    session.commit()
+    assert enqueued == [("availability.refresh_next_available", ("inst_1",))]
+    session.close()
+
+
+def test_to_utc_returns_none_inside_dst_gap() -> None:
+    tz_name = "America/New_York"
+    assert NextAvailabilityService._to_utc(date(2026, 3, 8), time(2, 30), tz_name) is None
+    assert NextAvailabilityService._to_utc(None, None, tz_name) is None
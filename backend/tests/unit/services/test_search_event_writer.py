@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from app.schemas.search_context import SearchUserContext
+import app.services.search_event_writer as writer_module
+from app.services.search_event_writer import MAX_ATTEMPTS, PendingSearchEvent, SearchEventWriter
+from app.services.search_history_service import SearchHistoryService
+
+T0 = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def _record(event_id: str, *, user: str | None = "user-1", minutes: int = 0) -> PendingSearchEvent:
+    context = SearchUserContext.from_user(user) if user else SearchUserContext.from_guest("g-1")
+    return PendingSearchEvent(
+        event_id=event_id,
+        searched_at=T0 + timedelta(minutes=minutes),
+        context=context,
+    )
+
+
+def _writer(write_batch, **kwargs) -> SearchEventWriter:
+    options = {"max_pending": 10, "batch_size": 3, "flush_interval": 0.01}
+    options.update(kwargs)
+    return SearchEventWriter(write_batch, **options)
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_buffer_is_full_or_closed():
+    writer = _writer(Mock(), max_pending=2)
+
+    assert writer.submit(_record("e1"))
+    assert writer.submit(_record("e2"))
+    assert not writer.submit(_record("e3"))
+    assert writer.pending == 2
+
+    writer._queue.clear()
+    writer._closed = True
+    assert not writer.submit(_record("e4"))
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_in_batches_and_clears_pending_ids():
+    batches: list[list[str]] = []
+
+    async def write_batch(batch):
+        batches.append([record.event_id for record in batch])
+
+    writer = _writer(write_batch)
+    for n in range(5):
+        writer.submit(_record(f"e{n}"))
+
+    assert await writer.flush_once()
+    assert await writer.flush_once()
+
+    assert batches == [["e0", "e1", "e2"], ["e3", "e4"]]
+    assert writer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_singly_and_poison_records_are_dropped():
+    written: list[str] = []
+
+    async def write_batch(batch):
+        if len(batch) > 1 or batch[0].event_id == "bad":
+            raise RuntimeError("insert failed")
+        written.append(batch[0].event_id)
+
+    writer = _writer(write_batch)
+    for event_id in ("e1", "bad", "e2"):
+        writer.submit(_record(event_id))
+
+    assert not await writer.flush_once()
+    assert written == ["e1", "e2"]
+    assert [record.event_id for record in writer._queue] == ["bad"]
+
+    for _ in range(MAX_ATTEMPTS - 1):
+        await writer.flush_once()
+    assert writer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_run_flushes_on_the_timer_and_drain_empties_the_buffer():
+    written: list[str] = []
+
+    async def write_batch(batch):
+        written.extend(record.event_id for record in batch)
+
+    writer = _writer(write_batch, flush_interval=0.01)
+    task = asyncio.create_task(writer.run())
+    writer.submit(_record("e1"))
+
+    for _ in range(100):
+        if written:
+            break
+        await asyncio.sleep(0.01)
+    assert written == ["e1"]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    writer.submit(_record("e2"))
+    await writer.drain()
+    assert written == ["e1", "e2"]
+    assert not writer.submit(_record("e3"))
+
+
+@contextmanager
+def _tx():
+    yield
+
+
+def _service() -> SearchHistoryService:
+    service = SearchHistoryService.__new__(SearchHistoryService)
+    service.db = MagicMock()
+    service.repository = MagicMock()
+    service.event_repository = MagicMock()
+    service.interaction_repository = MagicMock()
+    service.geolocation_service = MagicMock()
+    service.device_tracking_service = MagicMock()
+    service.transaction = Mock(side_effect=lambda: _tx())
+    return service
+
+
+def _record_search(service: SearchHistoryService):
+    return service._record_search_impl(
+        SearchUserContext.from_user("user-1"),
+        {"search_query": "Piano", "results_count": 3},
+        request_ip="127.0.0.1",
+        observability_candidates=[{"id": "svc_1", "score": 0.9}],
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_search_inserts_event_row_and_queues_derived_writes(monkeypatch):
+    service = _service()
+    service.repository.upsert_search.return_value = SimpleNamespace(search_count=1)
+    service.event_repository.create_event.return_value = SimpleNamespace(id="evt-1")
+    service._enforce_search_limit = Mock()
+    writer = _writer(Mock())
+    monkeypatch.setattr(writer_module, "_writer", writer)
+
+    result = await _record_search(service)
+
+    # The id handed to the client already exists in the database.
+    assert result.search_event_id == "evt-1"
+    event_data = service.event_repository.create_event.call_args[0][0]
+    assert event_data["search_query"] == "Piano"
+    assert event_data["geo_data"] is None
+    record = writer._queue[0]
+    assert record.event_id == "evt-1"
+    assert record.searched_at == event_data["searched_at"]
+    assert record.candidates[0]["service_catalog_id"] == "svc_1"
+    service.geolocation_service.get_location_from_ip.assert_not_called()
+    service.event_repository.bulk_insert_candidates.assert_not_called()
+    service._enforce_search_limit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_record_search_writes_derived_data_itself_when_buffer_is_full(monkeypatch):
+    service = _service()
+    service.repository.upsert_search.return_value = SimpleNamespace(search_count=1)
+    service.event_repository.create_event.return_value = SimpleNamespace(id="evt-1")
+    service.persist_search_events = AsyncMock(side_effect=RuntimeError("db down"))
+    writer = _writer(Mock(), max_pending=1)
+    writer.submit(_record("queued"))
+    monkeypatch.setattr(writer_module, "_writer", writer)
+
+    result = await _record_search(service)
+
+    assert result.search_event_id == "evt-1"
+    (batch,) = service.persist_search_events.await_args[0]
+    assert [record.event_id for record in batch] == ["evt-1"]
+    assert writer.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_persist_search_events_batches_enrichment_and_returning_lookup(monkeypatch):
+    async def _to_thread(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "to_thread", _to_thread)
+    service = _service()
+    service._enforce_search_limit = Mock()
+    service.geolocation_service.get_location_from_ip = Mock(
+        side_effect=lambda ip: asyncio.sleep(0, result={"city": "NYC"})
+    )
+    # Rows are already stored, so the minimum includes each first search itself.
+    service.event_repository.get_first_search_times.return_value = (
+        {"user-1": T0},
+        {"g-1": T0 - timedelta(minutes=10)},
+    )
+    # "g-early" was written by an earlier attempt of this batch.
+    service.event_repository.get_event_ids_with_candidates.return_value = {"g-early"}
+
+    records = [
+        _record("u-later", minutes=5),
+        _record("u-first"),
+        _record("g-early", user=None),
+        _record("g-late", user=None, minutes=45),
+    ]
+    for record in records:
+        record.request_ip = "10.0.0.1"
+        record.candidates = [{"position": 1, "service_catalog_id": "svc"}]
+
+    enriched = await service.persist_search_events(records)
+
+    assert enriched == 4
+    service.geolocation_service.get_location_from_ip.assert_called_once_with("10.0.0.1")
+    rows = {
+        row["id"]: row
+        for row in service.event_repository.bulk_update_event_enrichment.call_args[0][0]
+    }
+    assert rows["u-first"]["is_returning_user"] is False
+    assert rows["u-later"]["is_returning_user"] is True
+    assert rows["g-early"]["is_returning_user"] is False
+    assert rows["g-late"]["is_returning_user"] is True
+    assert rows["u-first"]["geo_data"] == {"city": "NYC"}
+    candidate_rows = service.event_repository.bulk_insert_candidate_rows.call_args[0][0]
+    assert sorted(c["search_event_id"] for c in candidate_rows) == ["g-late", "u-first", "u-later"]
+    assert service._enforce_search_limit.call_count == 2
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.exceptions import ServiceException
+from app.services.privacy_service import PrivacyService
+from app.services.r2_storage_client import PresignedUrl
+from app.services.streaming_export import iter_csv_chunks, iter_json_lines, store_export
+from app.services.stripe.earnings_export import StripeEarningsExportMixin
+
+NOW = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+
+
+def _earnings_row(idx: int) -> dict:
+    return {
+        "lesson_date": date(2026, 1, 1 + idx % 28),
+        "student_name": f"Student {idx}",
+        "service_name": "Piano",
+        "duration_minutes": 60,
+        "hourly_rate": 100,
+        "payment_amount_cents": 10000,
+        "application_fee_cents": 1200,
+        "status": "succeeded",
+        "payment_id": f"pi_{idx}",
+    }
+
+
+def _earnings_service(rows: list[dict]) -> StripeEarningsExportMixin:
+    service = StripeEarningsExportMixin.__new__(StripeEarningsExportMixin)
+    service.instructor_repository = MagicMock()
+    service.instructor_repository.get_by_user_id.return_value = SimpleNamespace(
+        is_founding_instructor=False, current_tier_pct=None
+    )
+    service.config_service = MagicMock()
+    service.config_service.get_pricing_config.return_value = ({}, None)
+    service.payment_repository = MagicMock()
+    service.payment_repository.get_instructor_earnings_for_export.return_value = rows
+    service.payment_repository.iter_instructor_earnings_for_export.side_effect = (
+        lambda *args, **kwargs: iter(rows)
+    )
+    return service
+
+
+def test_encoders_yield_bounded_chunks() -> None:
+    chunks = list(iter_csv_chunks(["a", "b"], ([i, i * 2] for i in range(5)), rows_per_chunk=2))
+    assert chunks == ["a,b\r\n0,0\r\n1,2\r\n", "2,4\r\n3,6\r\n", "4,8\r\n"]
+
+    lines = "".join(iter_json_lines(({"n": i, "at": NOW} for i in range(3)), rows_per_chunk=2))
+    assert [json.loads(line)["n"] for line in lines.splitlines()] == [0, 1, 2]
+    assert list(iter_json_lines([])) == []
+
+
+def test_store_export_spools_to_file_and_returns_presigned_url() -> None:
+    uploaded = {}
+
+    def _upload(object_key, fileobj, content_type):
+        uploaded.update(key=object_key, body=fileobj.read(), content_type=content_type)
+        return True, 200
+
+    storage = MagicMock()
+    storage.upload_fileobj.side_effect = _upload
+    storage.generate_presigned_get.return_value = PresignedUrl(
+        url="https://r2/exports/x.csv", headers={}, expires_at=""
+    )
+
+    stored = store_export(
+        iter(["a,b\n", b"1,2\n"]),
+        object_key="exports/x.csv",
+        content_type="text/csv",
+        storage=storage,
+        url_ttl_seconds=600,
+    )
+
+    assert uploaded == {"key": "exports/x.csv", "body": b"a,b\n1,2\n", "content_type": "text/csv"}
+    assert stored.download_url == "https://r2/exports/x.csv"
+    assert stored.size_bytes == 8
+    storage.generate_presigned_get.assert_called_once_with("exports/x.csv", expires_seconds=600)
+
+    storage.upload_fileobj.side_effect = None
+    storage.upload_fileobj.return_value = (False, 411)
+    with pytest.raises(ServiceException):
+        store_export(["x"], object_key="k", content_type="text/csv", storage=storage)
+
+
+def test_stream_earnings_csv_matches_buffered_export() -> None:
+    rows = [_earnings_row(idx) for idx in range(450)]
+    service = _earnings_service(rows)
+
+    chunks = list(service.stream_earnings_csv(instructor_id="inst"))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == service.generate_earnings_csv(instructor_id="inst")
+    service.payment_repository.iter_instructor_earnings_for_export.assert_called_once()
+
+
+def test_stream_earnings_pdf_writes_valid_multi_page_document() -> None:
+    service = _earnings_service([_earnings_row(idx) for idx in range(130)])
+
+    pdf = b"".join(service.stream_earnings_pdf(instructor_id="inst"))
+
+    assert pdf.startswith(b"%PDF-1.4") and pdf.endswith(b"%%EOF")
+    assert pdf.count(b"/Type /Page ") == 3
+    xref_at = pdf.index(b"\nxref\n") + 1
+    assert int(pdf.split(b"startxref\n")[1].split(b"\n")[0]) == xref_at
+    xref_lines = pdf[xref_at:].split(b"\n")
+    for obj_num in range(1, int(xref_lines[1].split()[1])):
+        offset = int(xref_lines[2 + obj_num][:10])
+        assert pdf[offset:].startswith(f"{obj_num} 0 obj".encode())
+
+
+def test_stream_earnings_fails_before_streaming_without_profile() -> None:
+    service = _earnings_service([])
+    service.instructor_repository.get_by_user_id.return_value = None
+
+    with pytest.raises(ServiceException):
+        service.stream_earnings_csv(instructor_id="inst")
+
+
+def test_stream_user_data_export_emits_json_lines_from_cursors() -> None:
+    service = PrivacyService.__new__(PrivacyService)
+    user = SimpleNamespace(
+        id="u1",
+        email="u1@example.com",
+        first_name="U",
+        last_name="One",
+        is_active=True,
+        account_status="active",
+        created_at=NOW,
+        updated_at=None,
+    )
+    search = SimpleNamespace(
+        search_query="piano",
+        search_type="natural_language",
+        results_count=3,
+        search_count=1,
+        first_searched_at=NOW,
+        last_searched_at=NOW,
+    )
+    booking = SimpleNamespace(
+        id="b1",
+        booking_date=date(2026, 3, 1),
+        start_time="09:00:00",
+        end_time="10:00:00",
+        service_name="Piano",
+        total_price=80,
+        status="COMPLETED",
+        instructor_id="i1",
+        created_at=None,
+    )
+    service.user_repository = MagicMock(get_by_id=MagicMock(return_value=user))
+    service.search_history_repository = MagicMock()
+    service.search_history_repository.iter_user_searches.return_value = iter([search])
+    service.booking_repository = MagicMock()
+    service.booking_repository.iter_user_bookings_for_export.return_value = iter([booking])
+    service.instructor_repository = MagicMock(get_by_user_id=MagicMock(return_value=None))
+
+    records = [
+        json.loads(line) for line in "".join(service.stream_user_data_export("u1")).splitlines()
+    ]
+
+    assert [record["record_type"] for record in records] == [
+        "export",
+        "user_profile",
+        "search_history",
+        "booking",
+    ]
+    assert records[3]["role"] == "student"
+    service.search_history_repository.get_user_searches.assert_not_called()
+    service.booking_repository.get_student_bookings.assert_not_called()
+
+    service.user_repository.get_by_id.return_value = None
+    with pytest.raises(ValueError):
+        service.stream_user_data_export("missing")
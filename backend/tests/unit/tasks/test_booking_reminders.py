@@ -0,0 +1,143 @@
+"""Unit tests for the batched booking reminder pipeline."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from app.tasks import booking_reminders
+from app.tasks.booking_reminders import REMINDER_SEND_ATTEMPTS, send_reminder_batches
+
+
+def _booking(booking_id):
+    booking = MagicMock()
+    booking.id = booking_id
+    booking.instructor_id = f"inst-{booking_id}"
+    booking.student_id = f"stud-{booking_id}"
+    booking.service_name = "Piano"
+    booking.booking_date = date(2026, 3, 2)
+    booking.start_time = time(9, 0)
+    booking.student.first_name = "Sam"
+    booking.student.last_name = "Lee"
+    booking.instructor.first_name = "Ana"
+    booking.instructor.last_name = "Ruiz"
+    return booking
+
+
+@contextmanager
+def _pipeline(repo, notify_user, sessions=None):
+    def _session_local():
+        session = MagicMock()
+        if sessions is not None:
+            sessions.append(session)
+        return session
+
+    with patch("app.tasks.booking_reminders.get_db_session"), patch(
+        "app.tasks.booking_reminders.BookingRepository", return_value=repo
+    ), patch("app.tasks.booking_reminders.SessionLocal", side_effect=_session_local), patch(
+        "app.tasks.booking_reminders.NotificationService"
+    ) as service_cls, patch(
+        "app.tasks.booking_reminders.PrometheusMetrics"
+    ) as metrics, patch(
+        "app.tasks.booking_reminders.sleep"
+    ) as sleep:
+        service_cls.return_value.notify_user.side_effect = notify_user
+        yield service_cls.return_value.notify_user, metrics, sleep
+
+
+def _claims_repo(claims):
+    repo = MagicMock()
+    repo.claim_due_reminders.side_effect = lambda kind, start, end, limit: claims[kind].pop(0)
+    return repo
+
+
+def _recipients(notify_user):
+    return [c.kwargs["user_id"] for c in notify_user.call_args_list]
+
+
+class TestReminderBatches:
+    """Chunked reminder claims sent through the concurrent sender."""
+
+    def test_claims_chunks_sends_concurrently_and_retries_failed_recipient(self, monkeypatch):
+        from app.tasks.notification_tasks import send_booking_reminders
+
+        monkeypatch.setattr(booking_reminders.settings, "booking_reminder_batch_enabled", True)
+        monkeypatch.setattr(booking_reminders.settings, "booking_reminder_batch_size", 2)
+        monkeypatch.setattr(booking_reminders.settings, "booking_reminder_concurrency", 2)
+        repo = _claims_repo(
+            {"24h": [[_booking("b1"), _booking("b2")], []], "1h": [[_booking("b3")]]}
+        )
+        flaky = {"stud-b2": 1}
+
+        async def _notify_user(*, user_id, **kwargs):
+            if flaky.get(user_id):
+                flaky[user_id] -= 1
+                raise RuntimeError("sms down")
+
+        sessions = []
+        with _pipeline(repo, _notify_user, sessions) as (notify_user, metrics, sleep):
+            result = send_booking_reminders()
+
+        assert result == {"reminders_24h_sent": 4, "reminders_1h_sent": 2}
+        assert [c.args[0] for c in repo.claim_due_reminders.call_args_list] == ["24h", "24h", "1h"]
+        _kind, start, end, limit = repo.claim_due_reminders.call_args_list[0].args
+        assert end - start == timedelta(minutes=15) and limit == 2
+        repo.release_reminder_claims.assert_not_called()
+
+        # Only the failed student is retried; the instructor is not notified twice.
+        recipients = _recipients(notify_user)
+        assert recipients.count("stud-b2") == 2 and recipients.count("inst-b2") == 1
+        assert len(recipients) == 7
+        sleep.assert_called_once()
+        b1_student = next(
+            c.kwargs for c in notify_user.call_args_list if c.kwargs["user_id"] == "stud-b1"
+        )
+        assert b1_student["instructor_name"] == "Ana R."
+        assert b1_student["date"] == "March 2" and b1_student["time"] == "9:00 AM"
+
+        outcomes = [c.args for c in metrics.record_booking_reminder.call_args_list]
+        assert outcomes.count(("24h", "student", "failed")) == 1
+        assert outcomes.count(("24h", "student", "sent")) == 2
+        assert outcomes.count(("1h", "student", "sent")) == 1
+        assert metrics.observe_booking_reminder_batch.call_count == 3
+
+        # One session per worker thread, all closed when the pool shuts down
+        assert 1 <= len(sessions) <= 2
+        assert all(session.close.called for session in sessions)
+        assert sum(session.rollback.call_count for session in sessions) == 1
+
+    def test_releases_only_bookings_no_recipient_received(self, monkeypatch):
+        monkeypatch.setattr(booking_reminders.settings, "booking_reminder_batch_size", 10)
+        repo = _claims_repo({"24h": [[_booking("b1"), _booking("b2")]], "1h": [[]]})
+
+        async def _notify_user(*, user_id, **kwargs):
+            if user_id in {"stud-b1", "inst-b2", "stud-b2"}:
+                raise RuntimeError("sms down")
+
+        with _pipeline(repo, _notify_user) as (notify_user, _metrics, sleep):
+            with patch("app.tasks.booking_reminders.logger") as logger:
+                result = send_reminder_batches(datetime.now(timezone.utc))
+
+        assert result == {"reminders_24h_sent": 1, "reminders_1h_sent": 0}
+        # b1's instructor already has the reminder, so b1 stays claimed.
+        repo.release_reminder_claims.assert_called_once_with("24h", ["b2"])
+        recipients = _recipients(notify_user)
+        assert recipients.count("inst-b1") == 1
+        for user_id in ("stud-b1", "inst-b2", "stud-b2"):
+            assert recipients.count(user_id) == REMINDER_SEND_ATTEMPTS
+        assert sleep.call_count == REMINDER_SEND_ATTEMPTS - 1
+        assert logger.error.call_count == 3
+
+    def test_nothing_due_skips_sender(self):
+        repo = MagicMock()
+        repo.claim_due_reminders.return_value = []
+        with patch("app.tasks.booking_reminders.get_db_session"):
+            with patch("app.tasks.booking_reminders.BookingRepository", return_value=repo):
+                with patch("app.tasks.booking_reminders.SessionLocal") as session_local:
+                    result = send_reminder_batches(datetime.now(timezone.utc))
+
+        assert result == {"reminders_24h_sent": 0, "reminders_1h_sent": 0}
+        assert repo.claim_due_reminders.call_count == 2
+        session_local.assert_not_called()
+        repo.release_reminder_claims.assert_not_called()
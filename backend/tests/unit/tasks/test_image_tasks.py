@@ -0,0 +1,66 @@
+"""Unit tests for the profile picture processing Celery task."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from celery.exceptions import Retry
+import pytest
+
+
+@contextmanager
+def _db_session_ctx(db):
+    yield db
+
+
+@patch("app.tasks.image_tasks.PersonalAssetService")
+@patch("app.tasks.image_tasks.UserRepository")
+@patch("app.tasks.image_tasks.get_db_session")
+def test_process_profile_picture_finalizes_for_user(mock_get_db, mock_users, mock_svc) -> None:
+    from app.tasks.image_tasks import process_profile_picture
+
+    mock_get_db.return_value = _db_session_ctx(MagicMock())
+    user = MagicMock(id="user-1")
+    mock_users.return_value.get_by_id.return_value = user
+
+    result = process_profile_picture("user-1", "uploads/profile_picture/user-1/a.png")
+
+    assert result == {"status": "processed", "user_id": "user-1"}
+    mock_svc.return_value.finalize_profile_picture.assert_called_once_with(
+        user, "uploads/profile_picture/user-1/a.png"
+    )
+
+
+@patch("app.tasks.image_tasks.PersonalAssetService")
+@patch("app.tasks.image_tasks.UserRepository")
+@patch("app.tasks.image_tasks.get_db_session")
+def test_process_profile_picture_rejects_invalid_images_without_retry(
+    mock_get_db, mock_users, mock_svc
+) -> None:
+    from app.tasks.image_tasks import process_profile_picture
+
+    mock_get_db.return_value = _db_session_ctx(MagicMock())
+    mock_svc.return_value.finalize_profile_picture.side_effect = ValueError("Invalid image type")
+
+    result = process_profile_picture("user-1", "uploads/x.png")
+
+    assert result == {"status": "rejected", "reason": "Invalid image type"}
+
+
+@patch("app.tasks.image_tasks.PersonalAssetService")
+@patch("app.tasks.image_tasks.UserRepository")
+@patch("app.tasks.image_tasks.get_db_session")
+def test_process_profile_picture_retries_storage_failures(
+    mock_get_db, mock_users, mock_svc
+) -> None:
+    from app.tasks.image_tasks import process_profile_picture
+
+    mock_get_db.return_value = _db_session_ctx(MagicMock())
+    mock_svc.return_value.finalize_profile_picture.side_effect = RuntimeError("upload failed")
+
+    with patch.object(process_profile_picture, "retry", side_effect=Retry()) as retry:
+        with pytest.raises(Retry):
+            process_profile_picture("user-1", "uploads/x.png")
+
+    assert isinstance(retry.call_args.kwargs["exc"], RuntimeError)
@@ -3,10 +3,10 @@ Unit tests for notification_tasks targeting coverage improvements.
 
 Coverage focus:
 - _next_backoff helper function
-- _format_display_name helper
-- _format_booking_date helper
-- _format_booking_time helper
-- _resolve_service_name helper
+- format_display_name helper
+- format_booking_date helper
+- format_booking_time helper
+- resolve_service_name helper
 - deliver_event task logic paths
 - dispatch_pending task
 
@@ -21,14 +21,17 @@ import pytest
 
 from app.core.ulid_helper import generate_ulid
 from app.models.booking import Booking, BookingStatus
+from app.tasks import notification_tasks
+from app.tasks.booking_reminders import (
+    format_booking_date,
+    format_booking_time,
+    format_display_name,
+    resolve_service_name,
+)
 from app.tasks.notification_tasks import (
     BACKOFF_SECONDS,
     MAX_DELIVERY_ATTEMPTS,
-    _format_booking_date,
-    _format_booking_time,
-    _format_display_name,
     _next_backoff,
-    _resolve_service_name,
 )
 
 
@@ -77,7 +80,7 @@ class TestNextBackoff:
 
 
 class TestFormatDisplayName:
-    """Tests for _format_display_name helper."""
+    """Tests for format_display_name helper."""
 
     def test_full_name(self):
         """Test with both first and last name."""
@@ -85,7 +88,7 @@ class TestFormatDisplayName:
         user.first_name = "John"
         user.last_name = "Doe"
 
-        result = _format_display_name(user)
+        result = format_display_name(user)
 
         assert result == "John D."
 
@@ -95,7 +98,7 @@ class TestFormatDisplayName:
         user.first_name = "Jane"
         user.last_name = ""
 
-        result = _format_display_name(user)
+        result = format_display_name(user)
 
         assert result == "Jane"
 
@@ -105,7 +108,7 @@ class TestFormatDisplayName:
         user.first_name = ""
         user.last_name = "Smith"
 
-        result = _format_display_name(user)
+        result = format_display_name(user)
 
         assert result == "Someone"
 
@@ -115,13 +118,13 @@ class TestFormatDisplayName:
         user.first_name = ""
         user.last_name = ""
 
-        result = _format_display_name(user)
+        result = format_display_name(user)
 
         assert result == "Someone"
 
     def test_none_user(self):
         """Test with None user."""
-        result = _format_display_name(None)
+        result = format_display_name(None)
 
         assert result == "Someone"
 
@@ -131,7 +134,7 @@ class TestFormatDisplayName:
         user.first_name = "  Alice  "
         user.last_name = "  Brown  "
 
-        result = _format_display_name(user)
+        result = format_display_name(user)
 
         assert result == "Alice B."
 
@@ -141,20 +144,20 @@ class TestFormatDisplayName:
         user.first_name = None
         user.last_name = None
 
-        result = _format_display_name(user)
+        result = format_display_name(user)
 
         assert result == "Someone"
 
 
 class TestFormatBookingDate:
-    """Tests for _format_booking_date helper."""
+    """Tests for format_booking_date helper."""
 
     def test_standard_date(self):
         """Test with standard date."""
         booking = MagicMock()
         booking.booking_date = date(2026, 1, 15)
 
-        result = _format_booking_date(booking)
+        result = format_booking_date(booking)
 
         assert result == "January 15"
 
@@ -163,7 +166,7 @@ class TestFormatBookingDate:
         booking = MagicMock()
         booking.booking_date = date(2026, 3, 5)
 
-        result = _format_booking_date(booking)
+        result = format_booking_date(booking)
 
         assert result == "March 5"
 
@@ -171,7 +174,7 @@ class TestFormatBookingDate:
         """Test with missing booking_date."""
         booking = MagicMock(spec=[])  # No booking_date attribute
 
-        result = _format_booking_date(booking)
+        result = format_booking_date(booking)
 
         assert result == ""
 
@@ -180,7 +183,7 @@ class TestFormatBookingDate:
         booking = MagicMock()
         booking.booking_date = None
 
-        result = _format_booking_date(booking)
+        result = format_booking_date(booking)
 
         assert result == ""
 
@@ -189,20 +192,20 @@ class TestFormatBookingDate:
         booking = MagicMock()
         booking.booking_date = "2026-01-20"
 
-        result = _format_booking_date(booking)
+        result = format_booking_date(booking)
 
         assert result == "2026-01-20"
 
 
 class TestFormatBookingTime:
-    """Tests for _format_booking_time helper."""
+    """Tests for format_booking_time helper."""
 
     def test_standard_time(self):
         """Test with standard time."""
         booking = MagicMock()
         booking.start_time = time(14, 30)
 
-        result = _format_booking_time(booking)
+        result = format_booking_time(booking)
 
         assert result == "2:30 PM"
 
@@ -211,7 +214,7 @@ class TestFormatBookingTime:
         booking = MagicMock()
         booking.start_time = time(9, 0)
 
-        result = _format_booking_time(booking)
+        result = format_booking_time(booking)
 
         assert result == "9:00 AM"
 
@@ -220,7 +223,7 @@ class TestFormatBookingTime:
         booking = MagicMock()
         booking.start_time = time(12, 0)
 
-        result = _format_booking_time(booking)
+        result = format_booking_time(booking)
 
         assert result == "12:00 PM"
 
@@ -229,7 +232,7 @@ class TestFormatBookingTime:
         booking = MagicMock()
         booking.start_time = time(0, 0)
 
-        result = _format_booking_time(booking)
+        result = format_booking_time(booking)
 
         # Should strip leading zero
         assert "12:00 AM" in result or result == "12:00 AM"
@@ -238,7 +241,7 @@ class TestFormatBookingTime:
         """Test with missing start_time."""
         booking = MagicMock(spec=[])
 
-        result = _format_booking_time(booking)
+        result = format_booking_time(booking)
 
         assert result == ""
 
@@ -247,7 +250,7 @@ class TestFormatBookingTime:
         booking = MagicMock()
         booking.start_time = None
 
-        result = _format_booking_time(booking)
+        result = format_booking_time(booking)
 
         assert result == ""
 
@@ -256,20 +259,20 @@ class TestFormatBookingTime:
         booking = MagicMock()
         booking.start_time = "10:00:00"
 
-        result = _format_booking_time(booking)
+        result = format_booking_time(booking)
 
         assert result == "10:00:00"
 
 
 class TestResolveServiceName:
-    """Tests for _resolve_service_name helper."""
+    """Tests for resolve_service_name helper."""
 
     def test_service_name_on_booking(self):
         """Test with service_name directly on booking."""
         booking = MagicMock()
         booking.service_name = "Guitar Lessons"
 
-        result = _resolve_service_name(booking)
+        result = resolve_service_name(booking)
 
         assert result == "Guitar Lessons"
 
@@ -280,7 +283,7 @@ class TestResolveServiceName:
         booking.instructor_service = MagicMock()
         booking.instructor_service.name = "Piano Lessons"
 
-        result = _resolve_service_name(booking)
+        result = resolve_service_name(booking)
 
         assert result == "Piano Lessons"
 
@@ -290,7 +293,7 @@ class TestResolveServiceName:
         booking.service_name = ""
         booking.instructor_service = None
 
-        result = _resolve_service_name(booking)
+        result = resolve_service_name(booking)
 
         assert result == "Lesson"
 
@@ -300,7 +303,7 @@ class TestResolveServiceName:
         booking.service_name = "   "
         booking.instructor_service = None
 
-        result = _resolve_service_name(booking)
+        result = resolve_service_name(booking)
 
         assert result == "Lesson"
 
@@ -311,7 +314,7 @@ class TestResolveServiceName:
         booking.instructor_service = MagicMock()
         booking.instructor_service.name = "Drums"
 
-        result = _resolve_service_name(booking)
+        result = resolve_service_name(booking)
 
         assert result == "Drums"
 
@@ -322,7 +325,7 @@ class TestResolveServiceName:
         booking.instructor_service = MagicMock()
         booking.instructor_service.name = "  "
 
-        result = _resolve_service_name(booking)
+        result = resolve_service_name(booking)
 
         assert result == "Lesson"
 
@@ -331,7 +334,7 @@ class TestResolveServiceName:
         booking = MagicMock()
         booking.service_name = "  Violin Lessons  "
 
-        result = _resolve_service_name(booking)
+        result = resolve_service_name(booking)
 
         assert result == "Violin Lessons"
 
@@ -389,11 +392,13 @@ class TestSessionScope:
 class TestSendBookingRemindersRollback:
     """Tests for session rollback isolation in send_booking_reminders."""
 
+    @pytest.fixture(autouse=True)
+    def _legacy_reminder_path(self, monkeypatch):
+        monkeypatch.setattr(notification_tasks.settings, "booking_reminder_batch_enabled", False)
+
     @patch("app.tasks.notification_tasks._send_reminder_notifications")
     @patch("app.tasks.notification_tasks._session_scope")
-    def test_rollback_isolates_24h_reminder_failure(
-        self, mock_scope, mock_send
-    ):
+    def test_rollback_isolates_24h_reminder_failure(self, mock_scope, mock_send):
         """First 24h booking fails; second still processes."""
         from app.tasks.notification_tasks import send_booking_reminders
 
@@ -425,9 +430,7 @@ class TestSendBookingRemindersRollback:
 
     @patch("app.tasks.notification_tasks._send_reminder_notifications")
     @patch("app.tasks.notification_tasks._session_scope")
-    def test_rollback_isolates_1h_reminder_failure(
-        self, mock_scope, mock_send
-    ):
+    def test_rollback_isolates_1h_reminder_failure(self, mock_scope, mock_send):
         """First 1h booking fails; second still processes."""
         from app.tasks.notification_tasks import send_booking_reminders
 
@@ -461,10 +464,12 @@ class TestSendBookingRemindersRollback:
 class TestDispatchPending:
     """Tests for dispatch_pending task."""
 
-    def test_dispatch_pending_schedules_events(self):
+    def test_dispatch_pending_schedules_events(self, monkeypatch):
         """Test dispatch_pending schedules delivery tasks."""
         from app.tasks.notification_tasks import dispatch_pending
 
+        monkeypatch.setattr(notification_tasks.settings, "outbox_batch_delivery_enabled", False)
+
         with patch("app.tasks.notification_tasks._session_scope") as mock_scope:
             with patch("app.tasks.notification_tasks.EventOutboxRepository") as mock_repo_class:
                 with patch("app.tasks.notification_tasks.enqueue_task") as mock_enqueue:
@@ -475,7 +480,11 @@ class TestDispatchPending:
                     mock_repo_class.return_value = mock_repo
 
                     # Simulate 3 pending events
-                    mock_events = [MagicMock(id="event-1"), MagicMock(id="event-2"), MagicMock(id="event-3")]
+                    mock_events = [
+                        MagicMock(id="event-1"),
+                        MagicMock(id="event-2"),
+                        MagicMock(id="event-3"),
+                    ]
                     mock_repo.fetch_pending.return_value = mock_events
 
                     result = dispatch_pending()
@@ -485,10 +494,12 @@ class TestDispatchPending:
                     for call in mock_enqueue.call_args_list:
                         assert call.args[0] == "outbox.deliver_event"
 
-    def test_dispatch_pending_no_events(self):
+    def test_dispatch_pending_no_events(self, monkeypatch):
         """Test dispatch_pending with no pending events."""
         from app.tasks.notification_tasks import dispatch_pending
 
+        monkeypatch.setattr(notification_tasks.settings, "outbox_batch_delivery_enabled", False)
+
         with patch("app.tasks.notification_tasks._session_scope") as mock_scope:
             with patch("app.tasks.notification_tasks.EventOutboxRepository") as mock_repo_class:
                 mock_session = MagicMock()
@@ -503,6 +514,74 @@ class TestDispatchPending:
                 assert result == 0
 
 
+class TestDeliverPendingBatches:
+    """Tests for batch-mode outbox delivery."""
+
+    @staticmethod
+    def _claimed(event_id, attempt_count=0):
+        from app.repositories.event_outbox_repository import ClaimedEvent
+
+        return ClaimedEvent(
+            id=event_id,
+            event_type="booking.created",
+            payload={"booking_id": event_id},
+            idempotency_key=f"booking:{event_id}:created",
+            attempt_count=attempt_count,
+            due_at=datetime.now(timezone.utc) - timedelta(seconds=5),
+        )
+
+    def test_batch_claims_delivers_and_bulk_updates(self, monkeypatch):
+        from app.repositories.event_outbox_repository import DeliveryFailure
+        from app.tasks.notification_tasks import dispatch_pending
+
+        monkeypatch.setattr(notification_tasks.settings, "outbox_batch_delivery_enabled", True)
+        monkeypatch.setattr(notification_tasks.settings, "outbox_batch_size", 3)
+        batch = [
+            self._claimed("ok"),
+            self._claimed("retry"),
+            self._claimed("dead", attempt_count=MAX_DELIVERY_ATTEMPTS - 1),
+        ]
+        repo = MagicMock()
+        repo.claim_pending.side_effect = [batch, []]
+
+        def _send(*, event_type, payload, idempotency_key):
+            if payload["booking_id"] != "ok":
+                raise RuntimeError(f"boom {payload['booking_id']}")
+
+        with patch("app.tasks.notification_tasks._session_scope"):
+            with patch("app.tasks.notification_tasks.EventOutboxRepository", return_value=repo):
+                with patch("app.tasks.notification_tasks.NotificationProvider") as provider_cls:
+                    provider_cls.return_value.send.side_effect = _send
+                    with patch("app.tasks.notification_tasks.PrometheusMetrics") as metrics:
+                        with patch("app.tasks.notification_tasks.enqueue_task") as enqueue:
+                            assert dispatch_pending() == 3
+
+        enqueue.assert_not_called()
+        assert repo.claim_pending.call_count == 2
+        repo.mark_sent_many.assert_called_once_with(["ok"])
+        repo.mark_failed_many.assert_called_once_with(
+            [
+                DeliveryFailure("retry", 1, BACKOFF_SECONDS[0], "boom retry", False),
+                DeliveryFailure(
+                    "dead", MAX_DELIVERY_ATTEMPTS, BACKOFF_SECONDS[-1], "boom dead", True
+                ),
+            ]
+        )
+        size, _duration, lags = metrics.observe_outbox_batch.call_args.args
+        assert size == 3 and len(lags) == 3 and min(lags) >= 5
+
+    def test_batch_stops_when_nothing_claimed(self, monkeypatch):
+        from app.tasks.notification_tasks import deliver_pending_batches
+
+        repo = MagicMock()
+        repo.claim_pending.return_value = []
+        with patch("app.tasks.notification_tasks._session_scope"):
+            with patch("app.tasks.notification_tasks.EventOutboxRepository", return_value=repo):
+                with patch("app.tasks.notification_tasks.NotificationProvider"):
+                    assert deliver_pending_batches() == 0
+        repo.mark_sent_many.assert_not_called()
+
+
 class TestDeliverEvent:
     """Target terminal failure bookkeeping in deliver_event."""
 
@@ -552,11 +631,13 @@ class TestDeliverEvent:
 class TestReminderFalseReturn:
     """False reminder sends should not mark delivery flags."""
 
+    @pytest.fixture(autouse=True)
+    def _legacy_reminder_path(self, monkeypatch):
+        monkeypatch.setattr(notification_tasks.settings, "booking_reminder_batch_enabled", False)
+
     @patch("app.tasks.notification_tasks._send_reminder_notifications")
     @patch("app.tasks.notification_tasks._session_scope")
-    def test_send_booking_reminders_false_1h_result_does_not_mark_sent(
-        self, mock_scope, mock_send
-    ):
+    def test_send_booking_reminders_false_1h_result_does_not_mark_sent(self, mock_scope, mock_send):
         from app.tasks.notification_tasks import send_booking_reminders
 
         mock_session = MagicMock()
@@ -586,6 +667,7 @@ def test_send_booking_reminders_uses_exact_utc_windows_across_dst(
 ):
     from app.tasks.notification_tasks import send_booking_reminders
 
+    monkeypatch.setattr(notification_tasks.settings, "booking_reminder_batch_enabled", False)
     fixed_now = datetime(2026, 11, 1, 5, 0, tzinfo=timezone.utc)
 
     class FrozenDateTime(datetime):
@@ -635,7 +717,9 @@ def test_send_booking_reminders_uses_exact_utc_windows_across_dst(
 
     with (
         patch("app.tasks.notification_tasks._session_scope", _scope),
-        patch("app.tasks.notification_tasks._send_reminder_notifications", return_value=True) as mock_send,
+        patch(
+            "app.tasks.notification_tasks._send_reminder_notifications", return_value=True
+        ) as mock_send,
     ):
         result = send_booking_reminders()
 
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import logging
+import threading
+from types import SimpleNamespace
+
+from app.tasks.payment import authorization
+from app.tasks.payment.concurrent_runner import (
+    StripeRateShaper,
+    pace_stripe_call,
+    run_payment_jobs,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_run_payment_jobs_dedupes_keys_and_keeps_input_order():
+    calls = []
+    lock = threading.Lock()
+
+    def worker(item):
+        with lock:
+            calls.append(item["id"])
+        return item["id"].upper()
+
+    items = [{"id": "a"}, {"id": "b"}, {"id": "a"}, {"id": "c"}]
+    shaper = StripeRateShaper(0, 0)
+
+    inline = run_payment_jobs(items, worker, key=lambda i: i["id"], max_workers=1, shaper=shaper)
+    pooled = run_payment_jobs(items, worker, key=lambda i: i["id"], max_workers=4, shaper=shaper)
+
+    assert inline == pooled == ["A", "B", "C"]
+    assert sorted(calls) == ["a", "a", "b", "b", "c", "c"]
+    assert run_payment_jobs([], worker, key=lambda i: i, shaper=shaper) == []
+
+
+def test_run_payment_jobs_runs_workers_in_parallel():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def worker(item):
+        barrier.wait()
+        return threading.current_thread().name
+
+    names = run_payment_jobs(
+        [1, 2, 3], worker, key=lambda i: i, max_workers=3, shaper=StripeRateShaper(0, 0)
+    )
+    assert all(name.startswith("payment-job") for name in names)
+
+
+class _RecordingShaper(StripeRateShaper):
+    def __init__(self):
+        super().__init__(0, 0)
+        self.keys = []
+        self._keys_lock = threading.Lock()
+
+    def acquire(self, key=None):
+        with self._keys_lock:
+            self.keys.append(key)
+
+
+def test_run_payment_jobs_paces_stripe_calls_only_in_pooled_runs():
+    def worker(item):
+        # Locked or skipped bookings return before their Stripe call and take no token.
+        for _ in range(item["stripe_calls"]):
+            pace_stripe_call()
+        return item["id"]
+
+    items = [
+        {"id": "b1", "account": "acct_a", "stripe_calls": 2},
+        {"id": "b2", "account": "acct_b", "stripe_calls": 0},
+        {"id": "b3", "account": "acct_a", "stripe_calls": 1},
+    ]
+    run = lambda workers, shaper: run_payment_jobs(  # noqa: E731
+        items,
+        worker,
+        key=lambda i: i["id"],
+        rate_key=lambda i: i["account"],
+        max_workers=workers,
+        shaper=shaper,
+    )
+
+    inline = _RecordingShaper()
+    assert run(1, inline) == ["b1", "b2", "b3"]
+    assert inline.keys == []
+
+    pooled = _RecordingShaper()
+    assert run(3, pooled) == ["b1", "b2", "b3"]
+    assert sorted(pooled.keys) == ["acct_a", "acct_a", "acct_a"]
+    # Outside the pool the calling thread is never paced.
+    pace_stripe_call()
+    assert len(pooled.keys) == 3
+
+
+def test_rate_shaper_paces_each_account_and_the_platform():
+    clock = _FakeClock()
+    shaper = StripeRateShaper(4, 1, clock=clock, sleep=clock.sleep)
+
+    shaper.acquire("acct_a")
+    shaper.acquire("acct_b")
+    assert clock.sleeps == []
+
+    # Second call for the same account waits for that account's bucket to refill.
+    shaper.acquire("acct_a")
+    assert clock.now == 1.0
+
+    for _ in range(3):
+        shaper.acquire(None)
+    # The platform bucket (4/s) is now empty: the next call waits a quarter second.
+    shaper.acquire(None)
+    assert clock.now == 1.25
+
+
+def test_process_authorization_batch_aggregates_concurrent_outcomes(monkeypatch):
+    monkeypatch.setattr(authorization, "send_t24_failure_warning_if_needed", lambda *a: None)
+    monkeypatch.setattr("app.tasks.payment.concurrent_runner.settings.payment_jobs_concurrency", 4)
+    locked = {"b3"}
+
+    @contextmanager
+    def booking_lock_sync(booking_id):
+        yield booking_id not in locked
+
+    def process(booking_id, hours_until_lesson):
+        if booking_id == "b4":
+            raise RuntimeError("stripe down")
+        if booking_id == "b5":
+            return {"success": False, "skipped": True}
+        if booking_id == "b2":
+            return {"success": False, "error": "declined", "error_type": "card_declined"}
+        return {"success": True}
+
+    api = SimpleNamespace(
+        booking_lock_sync=booking_lock_sync,
+        _process_authorization_for_booking=process,
+        logger=logging.getLogger(__name__),
+    )
+    candidates = [
+        {"booking_id": f"b{i}", "hours_until_lesson": 24.0, "instructor_id": "i1"}
+        for i in (1, 2, 3, 4, 5, 6, 1)
+    ]
+    results = authorization.process_authorization_batch(
+        api, candidates, {"success": 0, "failed": 0, "failures": [], "processed_at": "t"}
+    )
+
+    assert results["success"] == 2
+    assert results["failed"] == 2
+    assert results["failures"] == [
+        {"booking_id": "b2", "error": "declined", "type": "card_declined"},
+        {"booking_id": "b4", "error": "stripe down", "type": "system_error"},
+    ]
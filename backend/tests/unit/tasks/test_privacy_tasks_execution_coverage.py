@@ -356,6 +356,38 @@ class TestProcessDataExportRequestExecution:
                 "01K2MAY484FQGFEQVN3VKGYZ58"
             )
 
+    def test_data_export_delivered_to_storage(self) -> None:
+        """Storage mode streams the export to R2 and returns the presigned URL."""
+        from app.services.streaming_export import StoredExport
+        from app.tasks.privacy_tasks import process_data_export_request
+
+        mock_db = MagicMock()
+
+        mock_privacy_service = MagicMock()
+        mock_privacy_service.export_user_data_to_storage.return_value = StoredExport(
+            object_key="exports/privacy/u1/req-9.jsonl",
+            download_url="https://r2.example/exports/privacy/u1/req-9.jsonl",
+            expires_at="2026-03-02T13:00:00+00:00",
+            size_bytes=1024,
+        )
+
+        with patch("app.tasks.privacy_tasks.PrivacyService") as mock_privacy_class, \
+             patch("app.tasks.privacy_tasks.get_db_session", return_value=_db_session_ctx(mock_db)):
+            mock_privacy_class.return_value = mock_privacy_service
+
+            result = process_data_export_request.run(
+                user_id="u1",
+                request_id="req-9",
+                deliver_to_storage=True,
+            )
+
+            assert result["download_url"].endswith("req-9.jsonl")
+            assert result["size_bytes"] == 1024
+            mock_privacy_service.export_user_data.assert_not_called()
+            mock_privacy_service.export_user_data_to_storage.assert_called_once_with(
+                "u1", request_id="req-9"
+            )
+
     def test_data_export_without_request_id(self) -> None:
         """Test data export without optional request_id."""
         from app.tasks.privacy_tasks import process_data_export_request
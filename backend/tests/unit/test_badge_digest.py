@@ -24,6 +24,12 @@ class FakeRepo:
     def list_student_badge_progress(self, user_id: str):
         return self._progress.get(user_id, [])
 
+    def list_badge_awards_for_students(self, user_ids):
+        return {user_id: self._awards.get(user_id, []) for user_id in user_ids}
+
+    def list_badge_progress_for_students(self, user_ids):
+        return {user_id: self._progress.get(user_id, []) for user_id in user_ids}
+
 
 class FakeNotificationService:
     def __init__(self):
@@ -185,3 +191,39 @@ def test_send_weekly_digest_handles_adapter_no_items_blocked_and_send_failure(mo
 
     assert summary == {"scanned": 4, "sent": 1}
     assert recorded_keys == [("digest:send_true", 36)]
+
+
+def test_send_weekly_digest_prefetches_awards_and_progress_per_chunk(monkeypatch):
+    defs = [FakeDefinition("badge_a", "Badge A")]
+    users = [FakeUser(f"user-{idx}") for idx in range(5)]
+    progress = {
+        user.id: [{"slug": "badge_a", "current_progress": {"current": 1, "goal": 4}}]
+        for user in users
+    }
+
+    class CountingRepo(FakeRepo):
+        batch_calls = []
+
+        def list_student_badge_awards(self, user_id: str):
+            raise AssertionError("per-user award query")
+
+        def list_student_badge_progress(self, user_id: str):
+            raise AssertionError("per-user progress query")
+
+        def list_badge_progress_for_students(self, user_ids):
+            self.batch_calls.append(list(user_ids))
+            return super().list_badge_progress_for_students(user_ids)
+
+    chunked = badge_digest.chunked
+    monkeypatch.setattr(badge_digest, "chunked", lambda items: chunked(items, 3))
+    monkeypatch.setattr(badge_digest, "can_send_now", lambda *args, **kwargs: (True, "ok", "key"))
+    monkeypatch.setattr(badge_digest, "record_send", lambda *args, **kwargs: None)
+    repo = CountingRepo(defs, {}, progress)
+    notif = FakeNotificationService()
+
+    summary = badge_digest.send_weekly_digest(
+        datetime.now(timezone.utc), iter(users), repo, notif, FakeCache()
+    )
+
+    assert summary == {"scanned": 5, "sent": 5}
+    assert repo.batch_calls == [["user-0", "user-1", "user-2"], ["user-3", "user-4"]]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import random
+from typing import List, Tuple
+
+import pytest
+
+from app.utils.bitset import (
+    MINUTES_PER_SLOT,
+    SLOTS_PER_DAY,
+    and_bits,
+    andnot_bits,
+    bits_to_int,
+    get_range_tag,
+    get_slot_tag,
+    int_to_bits,
+    minute_windows_from_bits,
+    new_empty_bits,
+    new_empty_tags,
+    pack_indexes,
+    popcount,
+    range_mask_bits,
+    set_range,
+    set_range_tag,
+    set_slot_tag,
+    slot_runs_from_bits,
+    unpack_indexes,
+    windows_from_bits,
+)
+
+
+def _reference_runs(indexes: List[int]) -> List[Tuple[int, int]]:
+    runs: List[Tuple[int, int]] = []
+    for idx in indexes:
+        if runs and runs[-1][1] == idx:
+            runs[-1] = (runs[-1][0], idx + 1)
+        else:
+            runs.append((idx, idx + 1))
+    return runs
+
+
+def _random_indexes(rng: random.Random) -> List[int]:
+    return sorted(rng.sample(range(SLOTS_PER_DAY), rng.randint(0, SLOTS_PER_DAY)))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_runs_and_unpack_match_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    indexes = _random_indexes(rng)
+    bits = pack_indexes(indexes)
+
+    assert unpack_indexes(bits) == indexes
+    assert popcount(bits) == len(indexes)
+    assert slot_runs_from_bits(bits) == _reference_runs(indexes)
+    assert minute_windows_from_bits(bits) == [
+        (start * MINUTES_PER_SLOT, end * MINUTES_PER_SLOT)
+        for start, end in _reference_runs(indexes)
+    ]
+
+
+def test_minute_windows_cover_day_edges() -> None:
+    bits = pack_indexes([0, 1, SLOTS_PER_DAY - 1])
+
+    assert minute_windows_from_bits(bits) == [(0, 10), (1435, 1440)]
+    assert windows_from_bits(bits) == [("00:00:00", "00:10:00"), ("23:55:00", "24:00:00")]
+    assert minute_windows_from_bits(new_empty_bits()) == []
+
+
+def test_range_and_mask_operations() -> None:
+    day = set_range(new_empty_bits(), 96, 204)  # 08:00-17:00
+    booking = range_mask_bits(144, 156)  # 12:00-13:00
+
+    assert minute_windows_from_bits(andnot_bits(day, booking)) == [(480, 720), (780, 1020)]
+    assert minute_windows_from_bits(and_bits(day, booking)) == [(720, 780)]
+    assert set_range(day, 96, 204, value=False) == new_empty_bits()
+    assert int_to_bits(bits_to_int(day)) == day
+    with pytest.raises(ValueError, match="range out of bounds"):
+        set_range(day, 10, SLOTS_PER_DAY + 1)
+    with pytest.raises(ValueError, match="bits length must be 36"):
+        popcount(b"\x00")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_set_range_tag_matches_per_slot_writes(seed: int) -> None:
+    rng = random.Random(seed)
+    tags = new_empty_tags()
+    for slot in range(SLOTS_PER_DAY):
+        tags = set_slot_tag(tags, slot, rng.randint(0, 3))
+    start = rng.randrange(SLOTS_PER_DAY)
+    count = rng.randint(1, SLOTS_PER_DAY - start)
+    tag = rng.randint(0, 3)
+
+    expected = tags
+    for slot in range(start, start + count):
+        expected = set_slot_tag(expected, slot, tag)
+
+    updated = set_range_tag(tags, start, count, tag)
+    assert updated == expected
+    assert get_range_tag(updated, start, count) == tag
+
+
+def test_get_range_tag_detects_mixed_tags() -> None:
+    tags = set_range_tag(new_empty_tags(), 10, 5, 2)
+    tags = set_slot_tag(tags, 13, 1)
+
+    assert get_range_tag(tags, 10, 3) == 2
+    assert get_range_tag(tags, 10, 5) is None
+    assert get_slot_tag(tags, 14) == 2
+    with pytest.raises(ValueError, match="slot out of range"):
+        get_range_tag(tags, SLOTS_PER_DAY - 1, 2)
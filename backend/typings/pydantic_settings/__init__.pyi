@@ -15,3 +15,6 @@ class BaseSettings:
     def __init__(self, **data: Any) -> None: ...
 
     def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]: ...
+
+
+class NoDecode: ...